@@ -0,0 +1,57 @@
+"""Add user_daily_exposure counters for bet placement limits
+
+Revision ID: a6d1e4c9b352
+Revises: f3b8d2c71a90
+Create Date: 2026-10-18 17:41:53.208114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d1e4c9b352"
+down_revision: Union[str, Sequence[str], None] = "f3b8d2c71a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same totals as app.services.bet_exposure_service seeds; parlay legs carry no
+# stake of their own
+BACKFILL = """
+    INSERT INTO user_daily_exposure
+        (user_id, day, staked, open_stake, bet_count, updated_at)
+    SELECT
+        user_id,
+        date(placed_at),
+        SUM(amount),
+        SUM(CASE WHEN status = 'PENDING' THEN amount ELSE 0 END),
+        COUNT(*),
+        CURRENT_TIMESTAMP
+    FROM simple_unified_bets
+    WHERE parent_bet_id IS NULL AND placed_at IS NOT NULL
+    GROUP BY user_id, date(placed_at)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_daily_exposure",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("staked", sa.Float(), nullable=False),
+        sa.Column("open_stake", sa.Float(), nullable=False),
+        sa.Column("bet_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("user_id", "day"),
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_daily_exposure")
@@ -0,0 +1,38 @@
+"""Add player_recent_games for trend and consistency reads
+
+Rows are filled by scripts/backfill_player_features.py after upgrading and
+kept current by PlayerAnalyticsService.store_weekly_analytics.
+
+Revision ID: b3e8f1c6d094
+Revises: e6b1d4a8c273
+Create Date: 2026-10-19 10:12:48.503117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e8f1c6d094"
+down_revision: Union[str, Sequence[str], None] = "e6b1d4a8c273"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "player_recent_games",
+        sa.Column("player_id", sa.Integer(), nullable=False),
+        sa.Column("games", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("player_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("player_recent_games")
@@ -0,0 +1,107 @@
+"""Add composite and partial indexes for hot bet, game and analytics queries
+
+Revision ID: b8c2f5a03d61
+Revises: a6d1e4c9b352
+Create Date: 2026-10-18 18:32:14.950273
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c2f5a03d61"
+down_revision: Union[str, Sequence[str], None] = "a6d1e4c9b352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TOP_LEVEL = sa.text("parent_bet_id IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_simple_unified_bets_user_top_level",
+        "simple_unified_bets",
+        ["user_id", "placed_at", "id"],
+        unique=False,
+        postgresql_where=TOP_LEVEL,
+        sqlite_where=TOP_LEVEL,
+    )
+    # Superseded by the partial index: every history query skips parlay legs
+    op.drop_index(
+        "ix_simple_unified_bets_user_placed_id", table_name="simple_unified_bets"
+    )
+    op.create_index(
+        "ix_simple_unified_bets_parent_bet_id",
+        "simple_unified_bets",
+        ["parent_bet_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_simple_unified_bets_status_sport",
+        "simple_unified_bets",
+        ["status", "sport", "commence_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_games_commence_time_sport_key",
+        "games",
+        ["commence_time", "sport_key"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_yetai_bets_status_commence_time",
+        "yetai_bets",
+        ["status", "commence_time"],
+        unique=False,
+    )
+    # Season before week: lookups filter a season and order or range on week
+    op.drop_index("idx_player_analytics_player_week", table_name="player_analytics")
+    op.create_index(
+        "idx_player_analytics_player_season_week",
+        "player_analytics",
+        ["player_id", "season", "week"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_player_analytics_season_week",
+        "player_analytics",
+        ["season", "week"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_player_analytics_season_week", table_name="player_analytics")
+    op.drop_index(
+        "idx_player_analytics_player_season_week", table_name="player_analytics"
+    )
+    op.create_index(
+        "idx_player_analytics_player_week",
+        "player_analytics",
+        ["player_id", "week", "season"],
+        unique=False,
+    )
+    op.drop_index("ix_yetai_bets_status_commence_time", table_name="yetai_bets")
+    op.drop_index("ix_games_commence_time_sport_key", table_name="games")
+    op.drop_index(
+        "ix_simple_unified_bets_status_sport", table_name="simple_unified_bets"
+    )
+    op.drop_index(
+        "ix_simple_unified_bets_parent_bet_id", table_name="simple_unified_bets"
+    )
+    op.drop_index(
+        "ix_simple_unified_bets_user_top_level", table_name="simple_unified_bets"
+    )
+    op.create_index(
+        "ix_simple_unified_bets_user_placed_id",
+        "simple_unified_bets",
+        ["user_id", "placed_at", "id"],
+        unique=False,
+    )
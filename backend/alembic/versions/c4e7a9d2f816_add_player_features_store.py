@@ -0,0 +1,71 @@
+"""Add player_features rolling statistics store
+
+Rows are filled by scripts/backfill_player_features.py after upgrading and
+kept current by PlayerAnalyticsService.store_weekly_analytics.
+
+Revision ID: c4e7a9d2f816
+Revises: b8c2f5a03d61
+Create Date: 2026-10-18 19:47:26.381042
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e7a9d2f816"
+down_revision: Union[str, Sequence[str], None] = "b8c2f5a03d61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+METRICS = (
+    "ppr_points",
+    "snap_percentage",
+    "target_share",
+    "red_zone_share",
+    "points_per_snap",
+    "points_per_target",
+)
+
+
+def _metric_columns(metric):
+    return [
+        sa.Column(f"{metric}_n", sa.Integer(), nullable=False),
+        sa.Column(f"{metric}_mean", sa.Float(), nullable=True),
+        sa.Column(f"{metric}_std", sa.Float(), nullable=True),
+        sa.Column(f"{metric}_slope", sa.Float(), nullable=True),
+        sa.Column(f"{metric}_ewma", sa.Float(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "player_features",
+        sa.Column("player_id", sa.Integer(), nullable=False),
+        sa.Column("season", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Integer(), nullable=False),
+        sa.Column("span", sa.Integer(), nullable=False),
+        sa.Column("games", sa.Integer(), nullable=False),
+        *[column for metric in METRICS for column in _metric_columns(metric)],
+        sa.Column("boom_rate", sa.Float(), nullable=True),
+        sa.Column("bust_rate", sa.Float(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("player_id", "season", "week", "span"),
+    )
+    op.create_index(
+        "idx_player_features_season_week",
+        "player_features",
+        ["season", "week", "span"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_player_features_season_week", table_name="player_features")
+    op.drop_table("player_features")
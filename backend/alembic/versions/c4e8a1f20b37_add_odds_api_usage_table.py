@@ -0,0 +1,57 @@
+"""Add odds_api_usage table for persistent quota tracking
+
+Revision ID: c4e8a1f20b37
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 09:12:44.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a1f20b37"
+down_revision: Union[str, Sequence[str], None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "odds_api_usage",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(), nullable=True),
+        sa.Column("endpoint", sa.String(length=50), nullable=False),
+        sa.Column("sport_key", sa.String(length=100), nullable=True),
+        sa.Column("credits", sa.Integer(), nullable=True),
+        sa.Column("requests_used", sa.Integer(), nullable=True),
+        sa.Column("requests_remaining", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_odds_api_usage_id"), "odds_api_usage", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_odds_api_usage_recorded_at"),
+        "odds_api_usage",
+        ["recorded_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_odds_api_usage_sport_key"),
+        "odds_api_usage",
+        ["sport_key"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_odds_api_usage_sport_key"), table_name="odds_api_usage")
+    op.drop_index(op.f("ix_odds_api_usage_recorded_at"), table_name="odds_api_usage")
+    op.drop_index(op.f("ix_odds_api_usage_id"), table_name="odds_api_usage")
+    op.drop_table("odds_api_usage")
@@ -0,0 +1,55 @@
+"""Add waiver_scores weekly opportunity scores
+
+Rows are written by scripts/compute_waiver_scores.py and the scheduler's
+compute_waiver_scores task.
+
+Revision ID: d5f8b3e1a927
+Revises: c4e7a9d2f816
+Create Date: 2026-10-18 22:58:04.517316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5f8b3e1a927"
+down_revision: Union[str, Sequence[str], None] = "c4e7a9d2f816"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "waiver_scores",
+        sa.Column("player_id", sa.Integer(), nullable=False),
+        sa.Column("season", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Integer(), nullable=False),
+        sa.Column("position", sa.String(length=10), nullable=True),
+        sa.Column("opportunity_score", sa.Float(), nullable=False),
+        sa.Column("position_rank", sa.Integer(), nullable=False),
+        sa.Column("trend", sa.String(length=10), nullable=False),
+        sa.Column("avg_snap_pct", sa.Float(), nullable=True),
+        sa.Column("avg_target_share", sa.Float(), nullable=True),
+        sa.Column("avg_red_zone_touches", sa.Float(), nullable=True),
+        sa.Column("recent_ppg", sa.Float(), nullable=True),
+        sa.Column("ownership_pct", sa.Float(), nullable=True),
+        sa.Column("computed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("player_id", "season", "week"),
+    )
+    op.create_index(
+        "idx_waiver_scores_season_week",
+        "waiver_scores",
+        ["season", "week"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_waiver_scores_season_week", table_name="waiver_scores")
+    op.drop_table("waiver_scores")
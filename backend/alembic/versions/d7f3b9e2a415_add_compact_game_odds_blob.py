@@ -0,0 +1,344 @@
+"""Store game odds as a compact binary blob
+
+Revision ID: d7f3b9e2a415
+Revises: c4e8a1f20b37
+Create Date: 2026-10-18 11:40:21.905517
+
+"""
+
+import json
+import logging
+import math
+import struct
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7f3b9e2a415"
+down_revision: Union[str, Sequence[str], None] = "c4e8a1f20b37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+games = sa.table(
+    "games",
+    sa.column("id", sa.String),
+    sa.column("odds_data", sa.JSON),
+    sa.column("odds_blob", sa.LargeBinary),
+)
+
+
+# Version 1 of app.models.odds_codec, copied so later changes to the app's
+# codec can't change what this migration writes or reads
+MAGIC = b"OD"
+VERSION = 1
+NONE = 0xFFFFFFFF
+
+_PREFIX = struct.Struct("<2sBI")
+_U16 = struct.Struct("<H")
+_COUNTS = struct.Struct("<IHHI")
+_BOOKMAKER = struct.Struct("<IIIIIH")
+_DIRECTORY = struct.Struct("<IIIH")
+_ROW = struct.Struct("<HIIH")
+_OUTCOME = struct.Struct("<IIIBdd")
+
+# Outcome flags
+_HAS_PRICE = 1
+_PRICE_INT = 2
+_HAS_POINT = 4
+_POINT_INT = 8
+
+_BOOKMAKER_FIELDS = ("key", "title", "last_update", "markets")
+_MARKET_FIELDS = ("key", "last_update", "outcomes")
+_OUTCOME_FIELDS = ("name", "price", "point", "description")
+
+
+def _extra(data: Dict[str, Any], known: Tuple[str, ...]) -> Dict[str, Any]:
+    return {k: v for k, v in data.items() if k not in known}
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        if not isinstance(value, str):
+            value = str(value)
+        position = self.index.get(value)
+        if position is None:
+            position = len(self.strings)
+            self.strings.append(value)
+            self.index[value] = position
+        return position
+
+    def add_extra(self, data: Dict[str, Any], known: Tuple[str, ...]) -> int:
+        extra = _extra(data, known)
+        if not extra:
+            return NONE
+        return self.add(json.dumps(extra, separators=(",", ":"), default=str))
+
+
+def _number(value: Any, has_flag: int, int_flag: int) -> Tuple[int, float]:
+    if value is None:
+        return 0, math.nan
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Unsupported numeric odds value: {value!r}")
+    flags = has_flag | (int_flag if isinstance(value, int) else 0)
+    return flags, float(value)
+
+
+def encode_odds(bookmakers: List[Dict[str, Any]]) -> bytes:
+    """Encode a list of Odds API bookmaker dicts"""
+    strings = _StringTable()
+    market_keys: List[str] = []
+    market_positions: Dict[str, int] = {}
+    rows: Dict[str, List[bytes]] = {}
+    outcomes_by_market: Dict[str, List[bytes]] = {}
+    bookmaker_parts: List[bytes] = []
+    order: List[int] = []
+
+    for bookmaker_index, bookmaker in enumerate(bookmakers):
+        order_start = len(order)
+        for market in bookmaker.get("markets", []):
+            key = market.get("key")
+            if key not in market_positions:
+                market_positions[key] = len(market_keys)
+                market_keys.append(key)
+                rows[key] = []
+                outcomes_by_market[key] = []
+            order.append(market_positions[key])
+
+            outcomes = market.get("outcomes", [])
+            rows[key].append(
+                _ROW.pack(
+                    bookmaker_index,
+                    strings.add(market.get("last_update")),
+                    strings.add_extra(market, _MARKET_FIELDS),
+                    len(outcomes),
+                )
+            )
+            for outcome in outcomes:
+                price_flags, price = _number(
+                    outcome.get("price"), _HAS_PRICE, _PRICE_INT
+                )
+                point_flags, point = _number(
+                    outcome.get("point"), _HAS_POINT, _POINT_INT
+                )
+                outcomes_by_market[key].append(
+                    _OUTCOME.pack(
+                        strings.add(outcome.get("name")),
+                        strings.add(outcome.get("description")),
+                        strings.add_extra(outcome, _OUTCOME_FIELDS),
+                        price_flags | point_flags,
+                        price,
+                        point,
+                    )
+                )
+
+        bookmaker_parts.append(
+            _BOOKMAKER.pack(
+                strings.add(bookmaker.get("key")),
+                strings.add(bookmaker.get("title")),
+                strings.add(bookmaker.get("last_update")),
+                strings.add_extra(bookmaker, _BOOKMAKER_FIELDS),
+                order_start,
+                len(order) - order_start,
+            )
+        )
+
+    # Sections are fixed-width rows followed by fixed-width outcomes so the
+    # reader can use struct.iter_unpack instead of walking field by field
+    sections: List[bytes] = []
+    directory: List[bytes] = []
+    offset = 0
+    for key in market_keys:
+        section = zlib.compress(
+            b"".join(rows[key]) + b"".join(outcomes_by_market[key]), level=6
+        )
+        directory.append(
+            _DIRECTORY.pack(strings.add(key), offset, len(section), len(rows[key]))
+        )
+        sections.append(section)
+        offset += len(section)
+
+    if any("\x00" in value for value in strings.strings):
+        raise ValueError("Odds strings may not contain NUL characters")
+    string_block = "\x00".join(strings.strings).encode("utf-8")
+    head = b"".join(
+        [
+            _COUNTS.pack(
+                len(string_block), len(bookmaker_parts), len(directory), len(order)
+            ),
+            string_block,
+            *bookmaker_parts,
+            *(_U16.pack(position) for position in order),
+            *directory,
+        ]
+    )
+    compressed_head = zlib.compress(head, level=6)
+    return (
+        _PREFIX.pack(MAGIC, VERSION, len(compressed_head))
+        + compressed_head
+        + b"".join(sections)
+    )
+
+
+def _read_head(blob: bytes):
+    magic, version, head_length = _PREFIX.unpack_from(blob, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not an encoded odds blob")
+    head = zlib.decompress(blob[_PREFIX.size : _PREFIX.size + head_length])
+    sections_start = _PREFIX.size + head_length
+
+    string_length, bookmaker_count, market_count, order_count = _COUNTS.unpack_from(
+        head, 0
+    )
+    position = _COUNTS.size
+    strings = head[position : position + string_length].decode("utf-8").split("\x00")
+    position += string_length
+
+    end = position + bookmaker_count * _BOOKMAKER.size
+    bookmakers = list(_BOOKMAKER.iter_unpack(head[position:end]))
+    position = end
+
+    end = position + order_count * _U16.size
+    order = [value for (value,) in _U16.iter_unpack(head[position:end])]
+    position = end
+
+    end = position + market_count * _DIRECTORY.size
+    directory = list(_DIRECTORY.iter_unpack(head[position:end]))
+
+    return strings, bookmakers, order, directory, sections_start
+
+
+def decode_odds_dicts(blob: bytes) -> List[Dict[str, Any]]:
+    """Decode a blob back into Odds API shaped dicts"""
+    strings, bookmaker_entries, order, directory, sections_start = _read_head(blob)
+
+    markets_by_bookmaker: List[Dict[int, Dict[str, Any]]] = [
+        {} for _ in bookmaker_entries
+    ]
+    for market_index, (key_index, offset, length, row_count) in enumerate(directory):
+        key = strings[key_index]
+        start = sections_start + offset
+        section = zlib.decompress(blob[start : start + length])
+        rows_end = row_count * _ROW.size
+        outcomes = list(_OUTCOME.iter_unpack(section[rows_end:]))
+        position = 0
+        for bookmaker_index, updated, market_extra, outcome_count in _ROW.iter_unpack(
+            section[:rows_end]
+        ):
+            market_outcomes = []
+            for name, description, outcome_extra, flags, price, point in outcomes[
+                position : position + outcome_count
+            ]:
+                # Same keys, in the same order, as OddsOutcome.to_dict
+                outcome: Dict[str, Any] = {
+                    "name": None if name == NONE else strings[name]
+                }
+                if description != NONE:
+                    outcome["description"] = strings[description]
+                if flags & _HAS_PRICE:
+                    outcome["price"] = int(price) if flags & _PRICE_INT else price
+                if flags & _HAS_POINT:
+                    outcome["point"] = int(point) if flags & _POINT_INT else point
+                if outcome_extra != NONE:
+                    outcome.update(json.loads(strings[outcome_extra]))
+                market_outcomes.append(outcome)
+            position += outcome_count
+
+            market: Dict[str, Any] = {"key": key}
+            if updated != NONE:
+                market["last_update"] = strings[updated]
+            market["outcomes"] = market_outcomes
+            if market_extra != NONE:
+                market.update(json.loads(strings[market_extra]))
+            markets_by_bookmaker[bookmaker_index][market_index] = market
+
+    result = []
+    for decoded, entry in zip(markets_by_bookmaker, bookmaker_entries):
+        key, title, updated, bookmaker_extra, order_start, order_count = entry
+        bookmaker: Dict[str, Any] = {
+            "key": None if key == NONE else strings[key],
+            "title": None if title == NONE else strings[title],
+        }
+        if updated != NONE:
+            bookmaker["last_update"] = strings[updated]
+        bookmaker["markets"] = [
+            decoded[market_index]
+            for market_index in order[order_start : order_start + order_count]
+            if market_index in decoded
+        ]
+        if bookmaker_extra != NONE:
+            bookmaker.update(json.loads(strings[bookmaker_extra]))
+        result.append(bookmaker)
+    return result
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("games", sa.Column("odds_blob", sa.LargeBinary(), nullable=True))
+
+    # Re-encode existing JSON odds in batches and clear the JSON copy. Rows
+    # the codec can't encode keep their JSON, which Game.odds_data still reads.
+    bind = op.get_bind()
+    last_id = ""
+    skipped = 0
+    while True:
+        rows = bind.execute(
+            sa.select(games.c.id, games.c.odds_data)
+            .where(
+                games.c.id > last_id,
+                games.c.odds_data.isnot(None),
+                games.c.odds_blob.is_(None),
+            )
+            .order_by(games.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        for game_id, odds_data in rows:
+            try:
+                if isinstance(odds_data, str):
+                    odds_data = json.loads(odds_data)
+                odds_blob = encode_odds(
+                    odds_data if isinstance(odds_data, list) else []
+                )
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.warning(f"Keeping JSON odds for game {game_id}: {e}")
+                skipped += 1
+                continue
+            bind.execute(
+                games.update()
+                .where(games.c.id == game_id)
+                .values(odds_blob=odds_blob, odds_data=sa.null())
+            )
+    if skipped:
+        logger.warning(f"{skipped} games kept their JSON odds")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(games.c.id, games.c.odds_blob).where(games.c.odds_blob.isnot(None))
+    ).all()
+    for game_id, odds_blob in rows:
+        bind.execute(
+            games.update()
+            .where(games.c.id == game_id)
+            .values(odds_data=decode_odds_dicts(odds_blob))
+        )
+
+    op.drop_column("games", "odds_blob")
@@ -0,0 +1,35 @@
+"""Add (user_id, placed_at, id) index for keyset bet history
+
+Revision ID: e2a9c6f41b83
+Revises: d7f3b9e2a415
+Create Date: 2026-10-18 14:05:37.412096
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a9c6f41b83"
+down_revision: Union[str, Sequence[str], None] = "d7f3b9e2a415"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_simple_unified_bets_user_placed_id",
+        "simple_unified_bets",
+        ["user_id", "placed_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_simple_unified_bets_user_placed_id", table_name="simple_unified_bets"
+    )
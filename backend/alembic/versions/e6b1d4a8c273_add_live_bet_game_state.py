@@ -0,0 +1,39 @@
+"""Keep the latest game state on open live bets
+
+Revision ID: e6b1d4a8c273
+Revises: d5f8b3e1a927
+Create Date: 2026-10-18 23:41:07.318254
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b1d4a8c273"
+down_revision: Union[str, Sequence[str], None] = "d5f8b3e1a927"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "live_bets", sa.Column("current_game_status", sa.String(50), nullable=True)
+    )
+    op.add_column(
+        "live_bets", sa.Column("current_home_score", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "live_bets", sa.Column("current_away_score", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("live_bets", "current_away_score")
+    op.drop_column("live_bets", "current_home_score")
+    op.drop_column("live_bets", "current_game_status")
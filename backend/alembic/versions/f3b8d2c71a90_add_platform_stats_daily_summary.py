@@ -0,0 +1,70 @@
+"""Add platform_stats_daily summary and yetai_bets.settled_at index
+
+Revision ID: f3b8d2c71a90
+Revises: e2a9c6f41b83
+Create Date: 2026-10-18 16:22:08.731540
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8d2c71a90"
+down_revision: Union[str, Sequence[str], None] = "e2a9c6f41b83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same rules as app.services.platform_stats_service
+OUTCOME = """
+    CASE
+        WHEN status IN ('won', 'lost') THEN status
+        WHEN result IN ('won', 'lost') THEN result
+    END
+"""
+
+BACKFILL = f"""
+    INSERT INTO platform_stats_daily (day, wins, losses, won_profit, updated_at)
+    SELECT
+        date(settled_at),
+        SUM(CASE WHEN {OUTCOME} = 'won' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN {OUTCOME} = 'lost' THEN 1 ELSE 0 END),
+        SUM(
+            CASE
+                WHEN {OUTCOME} = 'won' AND odds > 0 THEN odds
+                WHEN {OUTCOME} = 'won' AND odds < 0 THEN 10000.0 / ABS(odds)
+                ELSE 0
+            END
+        ),
+        CURRENT_TIMESTAMP
+    FROM yetai_bets
+    WHERE settled_at IS NOT NULL AND {OUTCOME} IS NOT NULL
+    GROUP BY date(settled_at)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "platform_stats_daily",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("wins", sa.Integer(), nullable=False),
+        sa.Column("losses", sa.Integer(), nullable=False),
+        sa.Column("won_profit", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("day"),
+    )
+    op.create_index(
+        op.f("ix_yetai_bets_settled_at"), "yetai_bets", ["settled_at"], unique=False
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_yetai_bets_settled_at"), table_name="yetai_bets")
+    op.drop_table("platform_stats_daily")
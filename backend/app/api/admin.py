@@ -0,0 +1,2195 @@
+"""
+Admin API endpoints - users, YetAI bets, bet verification, parlay repair,
+game sync and diagnostics
+
+Included on the first request under /api/admin (see app.main).
+"""
+
+import asyncio
+import io
+import logging
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+
+from app.core.config import settings
+from app.core.query_instrumentation import query_stats
+from app.core.service_loader import get_service, is_service_available
+from app.core.deps import require_admin
+from app.models.bet_models import CreateParlayBetRequest, CreateYetAIBetRequest
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.options("/api/admin/yetai-bets/{bet_id}")
+async def options_admin_delete_yetai_bet():
+    """Handle CORS preflight for admin YetAI bet deletion"""
+    return {}
+
+
+@router.delete("/api/admin/yetai-bets/{bet_id}")
+async def delete_yetai_bet(bet_id: str, admin_user: dict = Depends(require_admin)):
+    """Delete YetAI bet (Admin only)"""
+
+    if is_service_available("yetai_bets_service"):
+        try:
+            yetai_service = get_service("yetai_bets_service")
+            result = await yetai_service.delete_bet(bet_id, admin_user["id"])
+
+            return {
+                "status": "success",
+                "message": f"YetAI bet {bet_id} deleted successfully",
+                "result": result,
+            }
+        except Exception as e:
+            logger.error(f"Error deleting YetAI bet {bet_id}: {e}")
+            raise HTTPException(status_code=500, detail="Failed to delete bet")
+
+    # Mock response when service unavailable
+    return {
+        "status": "success",
+        "message": f"Mock deletion of YetAI bet {bet_id} - service unavailable",
+    }
+
+
+@router.post("/api/admin/yetai-bets")
+async def create_yetai_bet(
+    bet_request: CreateYetAIBetRequest, admin_user: dict = Depends(require_admin)
+):
+    """Create a new YetAI Bet (Admin only)"""
+    try:
+        if is_service_available("yetai_bets_service"):
+            yetai_service = get_service("yetai_bets_service")
+            result = await yetai_service.create_bet(bet_request, admin_user["id"])
+
+            if result.get("success"):
+                return {
+                    "status": "success",
+                    "message": result.get("message", "Bet created successfully"),
+                    "bet_id": result.get("bet_id"),
+                }
+            else:
+                raise HTTPException(
+                    status_code=400, detail=result.get("error", "Failed to create bet")
+                )
+        else:
+            # Mock response when service unavailable
+            import uuid
+
+            mock_bet_id = str(uuid.uuid4())
+            return {
+                "status": "success",
+                "message": "Mock YetAI bet created successfully - service unavailable",
+                "bet_id": mock_bet_id,
+                "bet_data": bet_request.dict(),
+            }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating YetAI bet: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create bet")
+
+
+@router.post("/api/admin/yetai-parlays")
+async def create_yetai_parlay(
+    parlay_request: CreateParlayBetRequest, admin_user: dict = Depends(require_admin)
+):
+    """Create a new YetAI Parlay Bet (Admin only)"""
+    try:
+        if is_service_available("yetai_bets_service"):
+            yetai_service = get_service("yetai_bets_service")
+            result = await yetai_service.create_parlay(parlay_request, admin_user["id"])
+
+            if result.get("success"):
+                return {
+                    "status": "success",
+                    "message": result.get("message", "Parlay created successfully"),
+                    "parlay_id": result.get("bet_id"),
+                }
+            else:
+                raise HTTPException(
+                    status_code=400,
+                    detail=result.get("error", "Failed to create parlay"),
+                )
+        else:
+            # Mock response when service unavailable
+            import uuid
+
+            mock_parlay_id = str(uuid.uuid4())
+            return {
+                "status": "success",
+                "message": "Mock YetAI parlay created successfully - service unavailable",
+                "parlay_id": mock_parlay_id,
+                "parlay_data": parlay_request.dict(),
+            }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating YetAI parlay: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create parlay")
+
+
+@router.post("/api/admin/sync-games")
+async def sync_games(admin_user: dict = Depends(require_admin)):
+    """Sync today's games from Odds API and ESPN (Admin only)"""
+    try:
+        import sys
+        import subprocess  # nosec B404 - subprocess used safely with hardcoded paths
+        from pathlib import Path
+
+        script_path = Path(__file__).parents[2] / "scripts" / "fetch_todays_games.py"
+
+        logger.info(f"Admin {admin_user['id']} triggered game sync")
+
+        # Run the sync script with hardcoded script path (no user input)
+        result = subprocess.run(  # nosec B603 - using sys.executable and hardcoded script path
+            [sys.executable, str(script_path)],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        if result.returncode == 0:
+            # Parse output for summary
+            output_lines = result.stdout.split("\n")
+            summary = {
+                "status": "success",
+                "message": "Games synced successfully",
+                "details": [
+                    line
+                    for line in output_lines
+                    if "Total" in line or "Sync Results" in line or "✅" in line
+                ],
+            }
+            logger.info(f"Game sync completed successfully")
+            return summary
+        else:
+            logger.error(f"Game sync failed: {result.stderr}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Sync failed: {result.stderr[:200]}",
+            )
+
+    except subprocess.TimeoutExpired:
+        logger.error("Game sync timed out after 120 seconds")
+        raise HTTPException(status_code=500, detail="Sync timed out")
+    except Exception as e:
+        logger.error(f"Error syncing games: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to sync games: {str(e)}")
+
+
+@router.options("/api/admin/users")
+async def options_admin_get_users():
+    """Handle CORS preflight for admin get users"""
+    return {}
+
+
+@router.get("/api/admin/users")
+async def get_admin_users(admin_user: dict = Depends(require_admin)):
+    """Get all users (Admin only)"""
+    try:
+        if is_service_available("auth_service"):
+            from app.services.auth_service_db import auth_service_db
+
+            users = await auth_service_db.get_all_users()
+
+            return {"status": "success", "users": users}
+        else:
+            # Mock response when service unavailable
+            mock_users = [
+                {
+                    "id": 1,
+                    "email": "admin@example.com",
+                    "first_name": "Admin",
+                    "last_name": "User",
+                    "is_admin": True,
+                    "created_at": "2024-01-01T00:00:00Z",
+                },
+                {
+                    "id": 2,
+                    "email": "user@example.com",
+                    "first_name": "Regular",
+                    "last_name": "User",
+                    "is_admin": False,
+                    "created_at": "2024-01-02T00:00:00Z",
+                },
+            ]
+            return {
+                "status": "success",
+                "users": mock_users,
+                "message": "Mock users - service unavailable",
+            }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching users: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch users")
+
+
+@router.options("/api/admin/users/{user_id}")
+async def options_admin_update_user():
+    """Handle CORS preflight for admin update user"""
+    return {}
+
+
+@router.put("/api/admin/users/{user_id}")
+async def update_admin_user(
+    user_id: int, update_data: dict, admin_user: dict = Depends(require_admin)
+):
+    """Update user information (Admin only)"""
+    try:
+        if is_service_available("auth_service"):
+            from app.services.auth_service_db import auth_service_db
+
+            updated_user = await auth_service_db.update_user(user_id, update_data)
+
+            if updated_user:
+                return {
+                    "status": "success",
+                    "user": updated_user,
+                    "message": f"User {user_id} updated successfully",
+                }
+            else:
+                raise HTTPException(status_code=404, detail=f"User {user_id} not found")
+        else:
+            # Mock response when service unavailable
+            return {
+                "status": "success",
+                "user": {
+                    "id": user_id,
+                    **update_data,
+                    "updated_at": "2024-01-01T00:00:00Z",
+                },
+                "message": f"Mock update of user {user_id} - service unavailable",
+            }
+
+    except ValueError as e:
+        # Validation errors from the service
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error updating user {user_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update user")
+
+
+@router.post("/api/admin/users")
+async def create_admin_user(user_data: dict, admin_user: dict = Depends(require_admin)):
+    """Create a new user (Admin only)"""
+    try:
+        if is_service_available("auth_service"):
+            from app.services.auth_service_db import auth_service_db
+
+            # Extract required fields
+            email = user_data.get("email")
+            password = user_data.get("password")
+            username = user_data.get("username")
+            first_name = user_data.get("first_name")
+            last_name = user_data.get("last_name")
+            subscription_tier = user_data.get("subscription_tier", "free")
+            is_admin = user_data.get("is_admin", False)
+            is_verified = user_data.get("is_verified", False)
+
+            if not email or not password or not username:
+                raise HTTPException(
+                    status_code=400, detail="Email, password, and username are required"
+                )
+
+            result = await auth_service_db.create_user(
+                email=email,
+                password=password,
+                username=username,
+                first_name=first_name,
+                last_name=last_name,
+            )
+
+            if result.get("success"):
+                # Update additional fields if provided
+                user_id = result.get("user_id")
+                if user_id and (subscription_tier != "free" or is_admin or is_verified):
+                    update_data = {}
+                    if subscription_tier != "free":
+                        update_data["subscription_tier"] = subscription_tier
+                    if is_admin:
+                        update_data["is_admin"] = is_admin
+                    if is_verified:
+                        update_data["is_verified"] = is_verified
+
+                    if update_data:
+                        await auth_service_db.update_user(user_id, update_data)
+
+                return {
+                    "status": "success",
+                    "message": "User created successfully",
+                    "user_id": result.get("user_id"),
+                }
+            else:
+                raise HTTPException(
+                    status_code=400, detail=result.get("error", "Failed to create user")
+                )
+        else:
+            # Mock response when service unavailable
+            return {
+                "status": "success",
+                "message": "Mock user creation - service unavailable",
+                "user_id": 999,
+            }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating user: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create user")
+
+
+@router.options("/api/admin/users/{user_id}/reset-password")
+async def options_admin_reset_password():
+    """Handle CORS preflight for admin reset password"""
+    return {}
+
+
+@router.post("/api/admin/users/{user_id}/reset-password")
+async def reset_user_password(user_id: int, admin_user: dict = Depends(require_admin)):
+    """Reset user password (Admin only)"""
+    try:
+        if is_service_available("auth_service"):
+            from app.services.auth_service_db import auth_service_db
+            import secrets
+            import string
+
+            # Generate a new temporary password
+            temp_password = "".join(
+                secrets.choice(string.ascii_letters + string.digits) for _ in range(12)
+            )
+
+            # Update the user's password
+            hashed_password = auth_service_db.hash_password(temp_password)
+            update_data = {"password_hash": hashed_password}
+
+            # We need to directly update the password_hash field since update_user doesn't handle passwords
+            # For now, let's create a simple implementation
+            from app.core.database import SessionLocal
+            from app.models.database_models import User
+
+            db = SessionLocal()
+            try:
+                user = db.query(User).filter(User.id == user_id).first()
+                if not user:
+                    raise HTTPException(
+                        status_code=404, detail=f"User {user_id} not found"
+                    )
+
+                user.password_hash = hashed_password
+                db.commit()
+
+                return {
+                    "status": "success",
+                    "message": f"Password reset for user {user_id}",
+                    "temporary_password": temp_password,
+                    "note": "User should change this password on next login",
+                }
+            finally:
+                db.close()
+        else:
+            # Mock response when service unavailable
+            return {
+                "status": "success",
+                "message": f"Mock password reset for user {user_id} - service unavailable",
+                "temporary_password": "temp123456",
+                "note": "This is a mock response",
+            }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error resetting password for user {user_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to reset password")
+
+
+@router.options("/api/admin/users/{user_id}")
+async def options_admin_delete_user():
+    """Handle CORS preflight for admin delete user"""
+    return {}
+
+
+@router.delete("/api/admin/users/{user_id}")
+async def delete_admin_user(user_id: int, admin_user: dict = Depends(require_admin)):
+    """Delete a user (Admin only)"""
+    try:
+        # Prevent admin from deleting themselves
+        if user_id == admin_user.get("id"):
+            raise HTTPException(
+                status_code=400, detail="Cannot delete your own account"
+            )
+
+        if is_service_available("auth_service"):
+            from app.services.auth_service_db import auth_service_db
+
+            # Delete the user
+            success = await auth_service_db.delete_user(user_id)
+
+            if success:
+                return {
+                    "status": "success",
+                    "message": f"User {user_id} deleted successfully",
+                }
+            else:
+                raise HTTPException(status_code=404, detail=f"User {user_id} not found")
+        else:
+            # Mock response when service unavailable
+            return {
+                "status": "success",
+                "message": f"Mock delete of user {user_id} - service unavailable",
+            }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error deleting user {user_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to delete user")
+
+
+@router.options("/api/admin/users/{user_id}/bets")
+async def options_admin_delete_user_bets():
+    """Handle CORS preflight for admin delete user bets"""
+    return {}
+
+
+@router.delete("/api/admin/users/{user_id}/bets")
+async def delete_user_bets(user_id: int, admin_user: dict = Depends(require_admin)):
+    """Delete all user bets (Admin only)"""
+    try:
+        if is_service_available("bet_service"):
+            # Since there's no specific method to delete all user bets, we'll implement a basic version
+            from app.core.database import SessionLocal
+            from app.models.database_models import User, Bet, ParlayBet
+            from app.models.simple_unified_bet_model import SimpleUnifiedBet
+
+            db = SessionLocal()
+            try:
+                # Verify user exists
+                user = db.query(User).filter(User.id == user_id).first()
+                if not user:
+                    raise HTTPException(
+                        status_code=404, detail=f"User {user_id} not found"
+                    )
+
+                # Delete user's bet history first (to avoid foreign key issues)
+                from app.models.database_models import BetHistory
+
+                history_deleted = (
+                    db.query(BetHistory).filter(BetHistory.user_id == user_id).delete()
+                )
+
+                # Delete user's unified bets (new table)
+                unified_bets_deleted = (
+                    db.query(SimpleUnifiedBet)
+                    .filter(SimpleUnifiedBet.user_id == user_id)
+                    .delete()
+                )
+
+                # Delete user's regular bets (old table)
+                bets_deleted = db.query(Bet).filter(Bet.user_id == user_id).delete()
+
+                # Delete user's parlay bets (old table)
+                parlay_bets_deleted = (
+                    db.query(ParlayBet).filter(ParlayBet.user_id == user_id).delete()
+                )
+
+                db.commit()
+
+                total_deleted = (
+                    unified_bets_deleted + bets_deleted + parlay_bets_deleted
+                )
+
+                return {
+                    "status": "success",
+                    "message": f"Deleted {total_deleted} bets and {history_deleted} history records for user {user_id}",
+                    "bets_deleted": bets_deleted,
+                    "parlay_bets_deleted": parlay_bets_deleted,
+                    "unified_bets_deleted": unified_bets_deleted,
+                    "history_records_deleted": history_deleted,
+                }
+            finally:
+                db.close()
+        else:
+            # Mock response when service unavailable
+            return {
+                "status": "success",
+                "message": f"Mock deletion of bets for user {user_id} - service unavailable",
+                "bets_deleted": 5,
+                "parlay_bets_deleted": 2,
+            }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error deleting bets for user {user_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to delete user bets")
+
+
+@router.options("/api/admin/cleanup/orphaned-history")
+async def options_admin_cleanup_orphaned_history():
+    """Handle CORS preflight for admin cleanup orphaned history"""
+    return {}
+
+
+@router.post("/api/admin/cleanup/orphaned-history")
+async def cleanup_orphaned_bet_history(admin_user: dict = Depends(require_admin)):
+    """Clean up orphaned bet_history records (Admin only)"""
+    try:
+        from app.core.database import SessionLocal
+        from app.models.database_models import BetHistory, Bet, ParlayBet
+        from sqlalchemy import text
+
+        db = SessionLocal()
+        try:
+            # Find bet_history records that don't have corresponding bets
+            orphaned_history = db.execute(
+                text(
+                    """
+                SELECT bh.id, bh.bet_id, bh.user_id
+                FROM bet_history bh
+                LEFT JOIN bets b ON bh.bet_id = b.id
+                LEFT JOIN parlay_bets pb ON bh.bet_id = pb.id
+                WHERE b.id IS NULL AND pb.id IS NULL
+                """
+                )
+            ).fetchall()
+
+            if not orphaned_history:
+                return {
+                    "status": "success",
+                    "message": "No orphaned bet history records found",
+                    "cleaned_up": 0,
+                }
+
+            # Delete orphaned records
+            orphaned_ids = [str(record.id) for record in orphaned_history]
+            deleted_count = (
+                db.query(BetHistory)
+                .filter(BetHistory.id.in_(orphaned_ids))
+                .delete(synchronize_session=False)
+            )
+
+            db.commit()
+
+            logger.info(
+                f"Admin {admin_user['id']} cleaned up {deleted_count} orphaned bet history records"
+            )
+
+            return {
+                "status": "success",
+                "message": f"Successfully cleaned up {deleted_count} orphaned bet history records",
+                "cleaned_up": deleted_count,
+                "orphaned_bet_ids": [record.bet_id for record in orphaned_history],
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Error cleaning up orphaned bet history: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to cleanup orphaned bet history"
+        )
+
+
+# Admin Bet Verification Endpoints
+@router.options("/api/admin/bets/verification/stats")
+async def options_verification_stats():
+    """Handle CORS preflight for verification stats"""
+    return {}
+
+
+@router.get("/api/admin/bets/verification/stats")
+async def get_verification_stats(admin_user: dict = Depends(require_admin)):
+    """Get bet verification statistics (Admin only)"""
+    from app.services.bet_scheduler_service import bet_scheduler
+
+    try:
+        stats = bet_scheduler.get_stats()
+        return {"status": "success", "stats": stats}
+    except Exception as e:
+        logger.error(f"Error getting verification stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get verification stats")
+
+
+@router.options("/api/admin/bets/verify")
+async def options_verify_bets():
+    """Handle CORS preflight for verify bets"""
+    return {}
+
+
+@router.post("/api/admin/bets/debug-verify")
+async def debug_bet_verification(
+    request: dict, admin_user: dict = Depends(require_admin)
+):
+    """Debug why a specific bet isn't being verified (Admin only)"""
+    try:
+        bet_id = request.get("bet_id")
+        if not bet_id:
+            raise HTTPException(status_code=400, detail="bet_id is required")
+
+        from app.core.database import SessionLocal
+        from app.models.simple_unified_bet_model import SimpleUnifiedBet
+        from app.services.optimized_odds_api_service import get_optimized_odds_service
+        from app.core.config import settings
+
+        db = SessionLocal()
+        try:
+            # Get the bet
+            bet = (
+                db.query(SimpleUnifiedBet).filter(SimpleUnifiedBet.id == bet_id).first()
+            )
+            if not bet:
+                return {"status": "error", "message": "Bet not found"}
+
+            logger.info(
+                f"🔍 Debug bet {bet_id[:8]}: odds_api_event_id={bet.odds_api_event_id}, "
+                f"game_id={bet.game_id}, sport={bet.sport}, status={bet.status}"
+            )
+
+            # Get completed games from Odds API
+            odds_service = get_optimized_odds_service(settings.ODDS_API_KEY)
+            completed_games = await odds_service.get_scores_optimized(
+                bet.sport.lower() if bet.sport else "mlb", include_completed=True
+            )
+
+            logger.info(f"Found {len(completed_games)} completed games for {bet.sport}")
+
+            # Check if our game is in the list
+            game_found = False
+            game_data = None
+            for game in completed_games:
+                if game.get("id") == bet.odds_api_event_id:
+                    game_found = True
+                    game_data = game
+                    logger.info(
+                        f"✓ Game found: {game.get('home_team')} vs {game.get('away_team')}"
+                    )
+                    logger.info(f"  Completed: {game.get('completed')}")
+                    logger.info(f"  Scores: {game.get('scores')}")
+                    break
+
+            if not game_found:
+                logger.warning(
+                    f"✗ Game {bet.odds_api_event_id} not found in API results"
+                )
+                # Log first few games for debugging
+                for i, game in enumerate(completed_games[:3]):
+                    logger.info(
+                        f"  Game {i+1}: ID={game.get('id')} - {game.get('home_team')} vs {game.get('away_team')}"
+                    )
+
+            return {
+                "status": "success",
+                "bet": {
+                    "id": bet.id,
+                    "odds_api_event_id": bet.odds_api_event_id,
+                    "game_id": bet.game_id,
+                    "sport": bet.sport,
+                    "status": (
+                        bet.status.value
+                        if hasattr(bet.status, "value")
+                        else str(bet.status)
+                    ),
+                    "selection": bet.selection,
+                    "home_team": bet.home_team,
+                    "away_team": bet.away_team,
+                },
+                "api_check": {
+                    "game_found": game_found,
+                    "total_games": len(completed_games),
+                    "game_data": game_data if game_data else None,
+                },
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Error debugging bet: {e}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+
+@router.post("/api/admin/bets/verify")
+async def run_verification_now(admin_user: dict = Depends(require_admin)):
+    """Run bet verification now using unified verification service (Admin only)"""
+    from app.services.unified_bet_verification_service import (
+        unified_bet_verification_service,
+    )
+
+    try:
+        logger.info("🎯 Manual unified verification triggered via API")
+
+        # Simple database test first
+        from app.core.database import SessionLocal
+        from app.models.simple_unified_bet_model import SimpleUnifiedBet
+        from app.models.database_models import BetStatus
+
+        db = SessionLocal()
+        try:
+            all_bets = db.query(SimpleUnifiedBet).all()
+            logger.info(f"DEBUG: Found {len(all_bets)} total bets in unified table")
+
+            pending_count = (
+                db.query(SimpleUnifiedBet)
+                .filter(SimpleUnifiedBet.status == BetStatus.PENDING)
+                .count()
+            )
+            logger.info(f"DEBUG: Found {pending_count} pending bets")
+
+        except Exception as db_error:
+            logger.error(f"Database error: {db_error}", exc_info=True)
+            return {
+                "status": "error",
+                "result": {"error": f"Database error: {str(db_error)}"},
+            }
+        finally:
+            db.close()
+
+        # Use the new unified verification service
+        result = await unified_bet_verification_service.verify_all_pending_bets()
+
+        logger.info(f"Unified verification result: {result}")
+
+        # Also sync games to ensure we have latest data
+        game_sync_result = {
+            "success": True,
+            "message": "Game sync skipped for unified verification",
+            "games_updated": 0,
+            "games_created": 0,
+            "sports_synced": [],
+        }
+
+        return {
+            "status": "success",
+            "result": {**result, "game_sync": game_sync_result},
+        }
+    except Exception as e:
+        logger.error(f"Error running unified verification: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Failed to run verification: {str(e)}"
+        )
+
+
+@router.post("/api/admin/bets/sync-status")
+async def fix_bet_status_sync(admin_user: dict = Depends(require_admin)):
+    """Fix bet status sync between bets and bet_history tables (Admin only)"""
+    try:
+        logger.info("🔧 Bet status sync fix triggered via admin endpoint")
+
+        from sqlalchemy import text
+        from app.models.database_models import Bet, BetStatus, BetHistory, ParlayBet
+        from app.core.database import SessionLocal
+        from datetime import datetime
+
+        db = SessionLocal()
+        try:
+            # Find all bets that are PENDING in bets table but have settlement
+            # records in bet_history
+            query = """
+            SELECT DISTINCT
+                b.id,
+                b.user_id,
+                b.parlay_id,
+                b.status as current_status,
+                bh.new_status as history_status,
+                bh.amount as result_amount,
+                bh.timestamp as settled_at
+            FROM bets b
+            JOIN bet_history bh ON b.id = bh.bet_id
+            WHERE b.status = 'PENDING'
+            AND bh.action = 'settled'
+            AND bh.new_status IN ('won', 'lost', 'cancelled')
+            ORDER BY bh.timestamp DESC
+            """
+
+            result = db.execute(text(query))
+            mismatched_bets = result.fetchall()
+
+            # Also check for parlay bets that need syncing
+            parlay_query = """
+            SELECT DISTINCT
+                pb.id,
+                pb.user_id,
+                NULL as parlay_id,
+                pb.status as current_status,
+                bh.new_status as history_status,
+                bh.amount as result_amount,
+                bh.timestamp as settled_at
+            FROM parlay_bets pb
+            JOIN bet_history bh ON pb.id = bh.bet_id
+            WHERE pb.status = 'PENDING'
+            AND bh.action = 'settled'
+            AND bh.new_status IN ('won', 'lost', 'cancelled')
+            ORDER BY bh.timestamp DESC
+            """
+
+            parlay_result = db.execute(text(parlay_query))
+            mismatched_parlays = parlay_result.fetchall()
+
+            total_mismatched = len(mismatched_bets) + len(mismatched_parlays)
+
+            if total_mismatched == 0:
+                logger.info("✅ No bet status mismatches found - all good!")
+                return {
+                    "success": True,
+                    "message": "No bet status mismatches found",
+                    "synced_count": 0,
+                    "synced_bets": 0,
+                    "synced_parlays": 0,
+                }
+
+            logger.info(
+                f"🔍 Found {len(mismatched_bets)} bet legs and {len(mismatched_parlays)} parlays with status mismatches"
+            )
+
+            synced_bets = 0
+            synced_parlays = 0
+            parlay_ids_to_check = set()
+
+            # Sync individual bet legs
+            for bet_row in mismatched_bets:
+                bet_id = bet_row[0]
+                user_id = bet_row[1]
+                parlay_id = bet_row[2]
+                current_status = bet_row[3]
+                history_status = bet_row[4]
+                result_amount = bet_row[5]
+                settled_at = bet_row[6]
+
+                logger.info(
+                    f"Syncing bet {bet_id[:8]}... (user {user_id}): "
+                    f"{current_status} → {history_status}"
+                )
+
+                # Update the bet record to match bet_history
+                bet = db.query(Bet).filter(Bet.id == bet_id).first()
+                if bet:
+                    # Map string status to enum
+                    if history_status.lower() == "won":
+                        bet.status = BetStatus.WON
+                    elif history_status.lower() == "lost":
+                        bet.status = BetStatus.LOST
+                    elif history_status.lower() == "cancelled":
+                        bet.status = BetStatus.CANCELLED
+
+                    bet.result_amount = result_amount or 0
+                    bet.settled_at = settled_at
+
+                    synced_bets += 1
+                    logger.info(f"✅ Updated bet {bet_id[:8]}... to {bet.status.value}")
+
+                    # Track parlay IDs that need to be recalculated
+                    if parlay_id:
+                        parlay_ids_to_check.add(parlay_id)
+                else:
+                    logger.error(f"❌ Bet {bet_id[:8]}... not found in bets table")
+
+            # Sync individual parlay bets
+            for parlay_row in mismatched_parlays:
+                parlay_id = parlay_row[0]
+                user_id = parlay_row[1]
+                current_status = parlay_row[3]
+                history_status = parlay_row[4]
+                result_amount = parlay_row[5]
+                settled_at = parlay_row[6]
+
+                logger.info(
+                    f"Syncing parlay {parlay_id[:8]}... (user {user_id}): "
+                    f"{current_status} → {history_status}"
+                )
+
+                # Update the parlay record to match bet_history
+                parlay = db.query(ParlayBet).filter(ParlayBet.id == parlay_id).first()
+                if parlay:
+                    # Map string status to enum
+                    if history_status.lower() == "won":
+                        parlay.status = BetStatus.WON
+                    elif history_status.lower() == "lost":
+                        parlay.status = BetStatus.LOST
+                    elif history_status.lower() == "cancelled":
+                        parlay.status = BetStatus.CANCELLED
+
+                    parlay.result_amount = result_amount or 0
+                    parlay.settled_at = settled_at
+
+                    synced_parlays += 1
+                    logger.info(
+                        f"✅ Updated parlay {parlay_id[:8]}... to {parlay.status.value}"
+                    )
+                else:
+                    logger.error(
+                        f"❌ Parlay {parlay_id[:8]}... not found in parlay_bets table"
+                    )
+
+            # Update parlay statuses based on leg results
+            for parlay_id in parlay_ids_to_check:
+                parlay = db.query(ParlayBet).filter(ParlayBet.id == parlay_id).first()
+                if parlay and parlay.status == BetStatus.PENDING:
+                    # Get all legs for this parlay
+                    legs = db.query(Bet).filter(Bet.parlay_id == parlay_id).all()
+
+                    # Check if all legs are settled
+                    all_settled = all(leg.status != BetStatus.PENDING for leg in legs)
+
+                    if all_settled:
+                        # Check if all legs won
+                        all_won = all(leg.status == BetStatus.WON for leg in legs)
+                        any_lost = any(leg.status == BetStatus.LOST for leg in legs)
+
+                        if all_won:
+                            parlay.status = BetStatus.WON
+                            parlay.result_amount = parlay.amount + parlay.potential_win
+                            logger.info(
+                                f"✅ Parlay {parlay_id[:8]}... WON - all legs won"
+                            )
+                        elif any_lost:
+                            parlay.status = BetStatus.LOST
+                            parlay.result_amount = 0
+                            logger.info(
+                                f"❌ Parlay {parlay_id[:8]}... LOST - at least one leg lost"
+                            )
+                        else:  # Some cancelled
+                            parlay.status = BetStatus.CANCELLED
+                            parlay.result_amount = (
+                                parlay.amount
+                            )  # Return original stake
+                            logger.info(
+                                f"🚫 Parlay {parlay_id[:8]}... CANCELLED - legs cancelled"
+                            )
+
+                        parlay.settled_at = datetime.utcnow()
+                        synced_parlays += 1
+
+            # Commit all changes
+            db.commit()
+            logger.info(
+                f"🎉 Successfully synced {synced_bets} bet legs and {synced_parlays} parlays!"
+            )
+
+            return {
+                "success": True,
+                "message": f"Successfully synced {synced_bets} bet legs and {synced_parlays} parlays",
+                "synced_count": synced_bets + synced_parlays,
+                "synced_bets": synced_bets,
+                "synced_parlays": synced_parlays,
+                "total_found": total_mismatched,
+            }
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ Error fixing bet status sync: {e}")
+            raise
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Bet status sync fix failed: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Bet status sync fix failed: {str(e)}"
+        )
+
+
+@router.get("/api/admin/bets/debug")
+async def debug_bet_status(admin_user: dict = Depends(require_admin)):
+    """Debug bet status in production database (Admin only)"""
+    try:
+        logger.info("🔍 Debug bet status triggered via admin endpoint")
+
+        from sqlalchemy import text
+        from app.models.database_models import Bet, BetStatus, BetHistory, ParlayBet
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            # Get all PENDING bets
+            pending_query = """
+            SELECT b.id, b.user_id, b.home_team, b.away_team, b.status, b.placed_at
+            FROM bets b
+            WHERE b.status = 'PENDING'
+            ORDER BY b.placed_at DESC
+            """
+            result = db.execute(text(pending_query))
+            pending_bets = result.fetchall()
+
+            # Get Cardinals-related bets (both PENDING and settled)
+            cardinals_query = """
+            SELECT b.id, b.user_id, b.home_team, b.away_team, b.status, b.placed_at
+            FROM bets b
+            WHERE (LOWER(b.home_team) LIKE '%cardinal%' OR LOWER(b.away_team) LIKE '%cardinal%')
+            ORDER BY b.placed_at DESC
+            LIMIT 10
+            """
+            result = db.execute(text(cardinals_query))
+            cardinals_bets = result.fetchall()
+
+            # Get recent bet_history records for Cardinals bets
+            cardinals_history = []
+            for bet in cardinals_bets:
+                bet_id = bet[0]
+                history_query = """
+                SELECT bh.action, bh.old_status, bh.new_status, bh.amount, bh.timestamp
+                FROM bet_history bh
+                WHERE bh.bet_id = :bet_id
+                ORDER BY bh.timestamp DESC
+                LIMIT 3
+                """
+                history_result = db.execute(text(history_query), {"bet_id": bet_id})
+                history_records = history_result.fetchall()
+                cardinals_history.append(
+                    {
+                        "bet_id": bet_id[:8] + "...",
+                        "teams": f"{bet[2]} vs {bet[3]}",
+                        "status": bet[4],
+                        "history": [
+                            {
+                                "action": record[0],
+                                "old_status": record[1],
+                                "new_status": record[2],
+                                "amount": record[3],
+                                "timestamp": str(record[4]),
+                            }
+                            for record in history_records
+                        ],
+                    }
+                )
+
+            # Run the exact sync query to see what would be synced
+            sync_query = """
+            SELECT DISTINCT
+                b.id,
+                b.user_id,
+                b.parlay_id,
+                b.status as current_status,
+                bh.new_status as history_status,
+                bh.amount as result_amount,
+                bh.timestamp as settled_at
+            FROM bets b
+            JOIN bet_history bh ON b.id = bh.bet_id
+            WHERE b.status = 'PENDING'
+            AND bh.action = 'settled'
+            AND bh.new_status IN ('won', 'lost', 'cancelled')
+            ORDER BY bh.timestamp DESC
+            """
+            result = db.execute(text(sync_query))
+            sync_candidates = result.fetchall()
+
+            return {
+                "success": True,
+                "pending_bets": [
+                    {
+                        "bet_id": bet[0][:8] + "...",
+                        "teams": f"{bet[2]} vs {bet[3]}",
+                        "status": bet[4],
+                        "placed_at": str(bet[5]),
+                    }
+                    for bet in pending_bets
+                ],
+                "cardinals_bets": cardinals_history,
+                "sync_candidates": [
+                    {
+                        "bet_id": bet[0][:8] + "...",
+                        "current_status": bet[3],
+                        "history_status": bet[4],
+                        "settled_at": str(bet[6]),
+                    }
+                    for bet in sync_candidates
+                ],
+                "counts": {
+                    "pending_bets": len(pending_bets),
+                    "cardinals_bets": len(cardinals_bets),
+                    "sync_candidates": len(sync_candidates),
+                },
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Debug bet status failed: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Debug bet status failed: {str(e)}"
+        )
+
+
+@router.post("/api/admin/bets/manual-verify")
+async def manual_verify_bet(request: dict, admin_user: dict = Depends(require_admin)):
+    """Manually verify and settle a specific bet (Admin only)"""
+    try:
+        bet_id = request.get("bet_id")
+        if not bet_id:
+            raise HTTPException(status_code=400, detail="bet_id is required")
+
+        logger.info(f"🔧 Manual bet verification for bet {bet_id[:8]}...")
+
+        from sqlalchemy import text
+        from app.models.database_models import Bet, BetStatus, BetHistory
+        from app.core.database import SessionLocal
+        from datetime import datetime
+
+        db = SessionLocal()
+        try:
+            # Get the bet
+            bet = db.query(Bet).filter(Bet.id == bet_id).first()
+            if not bet:
+                raise HTTPException(status_code=404, detail="Bet not found")
+
+            if bet.status != BetStatus.PENDING:
+                return {
+                    "success": False,
+                    "message": f"Bet {bet_id[:8]}... is already settled ({bet.status.value})",
+                }
+
+            # Get the game for this bet
+            if not bet.game_id:
+                raise HTTPException(
+                    status_code=400, detail="Bet has no associated game"
+                )
+
+            # Check if game has finished and get the result
+            game_query = """
+            SELECT home_team, away_team, home_score, away_score, status, commence_time
+            FROM games
+            WHERE id = :game_id
+            """
+            result = db.execute(text(game_query), {"game_id": bet.game_id})
+            game = result.fetchone()
+
+            if not game:
+                raise HTTPException(status_code=404, detail="Game not found")
+
+            home_team, away_team, home_score, away_score, game_status, commence_time = (
+                game
+            )
+
+            # Check if game is completed
+            if game_status != "completed" or home_score is None or away_score is None:
+                return {
+                    "success": False,
+                    "message": f"Game {home_team} vs {away_team} is not completed yet (status: {game_status})",
+                    "game_info": {
+                        "home_team": home_team,
+                        "away_team": away_team,
+                        "home_score": home_score,
+                        "away_score": away_score,
+                        "status": game_status,
+                    },
+                }
+
+            # Determine bet result based on bet type and selection
+            bet_won = False
+            if bet.bet_type.value == "moneyline":
+                # For moneyline, check if selected team won
+                if bet.selection == home_team and home_score > away_score:
+                    bet_won = True
+                elif bet.selection == away_team and away_score > home_score:
+                    bet_won = True
+            elif bet.bet_type.value == "spread":
+                # For spread bets, need to check against the line
+                if bet.selection == home_team:
+                    adjusted_home_score = home_score + (bet.line_value or 0)
+                    bet_won = adjusted_home_score > away_score
+                elif bet.selection == away_team:
+                    adjusted_away_score = away_score + (bet.line_value or 0)
+                    bet_won = adjusted_away_score > home_score
+
+            # Determine final status and amount
+            if bet_won:
+                final_status = BetStatus.WON
+                result_amount = bet.amount + bet.potential_win
+            else:
+                final_status = BetStatus.LOST
+                result_amount = 0
+
+            # Update bet status
+            old_status = bet.status.value
+            bet.status = final_status
+            bet.result_amount = result_amount
+            bet.settled_at = datetime.utcnow()
+
+            # Create bet_history record
+            bet_history = BetHistory(
+                bet_id=bet.id,
+                action="settled",
+                old_status=old_status,
+                new_status=final_status.value,
+                amount=result_amount,
+                timestamp=datetime.utcnow(),
+            )
+            db.add(bet_history)
+
+            # Commit changes
+            db.commit()
+
+            logger.info(
+                f"✅ Manually settled bet {bet_id[:8]}... as {final_status.value}"
+            )
+
+            return {
+                "success": True,
+                "message": f"Bet {bet_id[:8]}... manually settled as {final_status.value}",
+                "bet_info": {
+                    "bet_id": bet_id[:8] + "...",
+                    "teams": f"{home_team} vs {away_team}",
+                    "selection": bet.selection,
+                    "bet_type": bet.bet_type.value,
+                    "old_status": old_status,
+                    "new_status": final_status.value,
+                    "result_amount": result_amount,
+                },
+                "game_info": {
+                    "home_team": home_team,
+                    "away_team": away_team,
+                    "home_score": home_score,
+                    "away_score": away_score,
+                    "final_score": f"{home_team} {home_score} - {away_score} {away_team}",
+                },
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Manual bet verification failed: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Manual bet verification failed: {str(e)}"
+        )
+
+
+@router.post("/api/admin/games/manual-update")
+async def manual_update_game(request: dict, admin_user: dict = Depends(require_admin)):
+    """Manually update game result (Admin only)"""
+    try:
+        home_team = request.get("home_team")
+        away_team = request.get("away_team")
+        home_score = request.get("home_score")
+        away_score = request.get("away_score")
+
+        if not all(
+            [home_team, away_team, home_score is not None, away_score is not None]
+        ):
+            raise HTTPException(
+                status_code=400,
+                detail="home_team, away_team, home_score, and away_score are required",
+            )
+
+        logger.info(
+            f"🔧 Manual game update: {home_team} {home_score} - {away_score} {away_team}"
+        )
+
+        from sqlalchemy import text
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            # Find the game
+            game_query = """
+            SELECT id, home_team, away_team, status, home_score, away_score
+            FROM games
+            WHERE home_team = :home_team AND away_team = :away_team
+            ORDER BY commence_time DESC
+            LIMIT 1
+            """
+            result = db.execute(
+                text(game_query), {"home_team": home_team, "away_team": away_team}
+            )
+            game = result.fetchone()
+
+            if not game:
+                raise HTTPException(status_code=404, detail="Game not found")
+
+            game_id = game[0]
+            current_status = game[3]
+            current_home_score = game[4]
+            current_away_score = game[5]
+
+            # Update the game
+            update_query = """
+            UPDATE games
+            SET home_score = :home_score,
+                away_score = :away_score,
+                status = 'completed',
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = :game_id
+            """
+
+            db.execute(
+                text(update_query),
+                {
+                    "game_id": game_id,
+                    "home_score": home_score,
+                    "away_score": away_score,
+                },
+            )
+
+            db.commit()
+
+            logger.info(
+                f"✅ Updated game {game_id[:8]}... to completed with final score"
+            )
+
+            return {
+                "success": True,
+                "message": f"Game updated successfully",
+                "game_info": {
+                    "game_id": game_id[:8] + "...",
+                    "teams": f"{home_team} vs {away_team}",
+                    "old_status": current_status,
+                    "new_status": "completed",
+                    "old_score": f"{current_home_score or 0}-{current_away_score or 0}",
+                    "new_score": f"{home_score}-{away_score}",
+                    "final_result": f"{home_team} {home_score} - {away_score} {away_team}",
+                },
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Manual game update failed: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Manual game update failed: {str(e)}"
+        )
+
+
+@router.post("/api/admin/parlays/fix-game-associations")
+async def fix_parlay_game_associations(admin_user: dict = Depends(require_admin)):
+    """Fix parlay legs missing game associations (Admin only)"""
+    try:
+        logger.info("🔧 Fixing parlay leg game associations...")
+
+        from sqlalchemy import text
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            # Find parlay legs without game associations
+            orphaned_legs_query = """
+            SELECT b.id, b.selection, b.bet_type, b.parlay_id
+            FROM bets b
+            JOIN parlay_bets pb ON b.parlay_id = pb.id
+            WHERE b.game_id IS NULL
+            AND b.status = 'PENDING'
+            AND pb.status = 'PENDING'
+            """
+            result = db.execute(text(orphaned_legs_query))
+            orphaned_legs = result.fetchall()
+
+            if not orphaned_legs:
+                return {
+                    "success": True,
+                    "message": "No orphaned parlay legs found",
+                    "fixed_count": 0,
+                }
+
+            fixed_count = 0
+            fixes = []
+
+            for leg in orphaned_legs:
+                leg_id, selection, bet_type, parlay_id = leg
+
+                # Try to match leg to a game based on selection
+                if bet_type == "moneyline":
+                    # For moneyline, selection is team name
+                    game_query = """
+                    SELECT id, home_team, away_team
+                    FROM games
+                    WHERE (home_team = :team OR away_team = :team)
+                    AND status IN ('SCHEDULED', 'completed')
+                    ORDER BY commence_time DESC
+                    LIMIT 1
+                    """
+                    game_result = db.execute(text(game_query), {"team": selection})
+                    game = game_result.fetchone()
+
+                    if game:
+                        game_id, home_team, away_team = game
+
+                        # Update the bet with game association
+                        update_query = """
+                        UPDATE bets
+                        SET game_id = :game_id,
+                            home_team = :home_team,
+                            away_team = :away_team
+                        WHERE id = :bet_id
+                        """
+                        db.execute(
+                            text(update_query),
+                            {
+                                "bet_id": leg_id,
+                                "game_id": game_id,
+                                "home_team": home_team,
+                                "away_team": away_team,
+                            },
+                        )
+
+                        fixed_count += 1
+                        fixes.append(
+                            {
+                                "leg_id": leg_id[:8] + "...",
+                                "selection": selection,
+                                "bet_type": bet_type,
+                                "matched_game": f"{home_team} vs {away_team}",
+                                "game_id": game_id[:8] + "...",
+                            }
+                        )
+
+            db.commit()
+
+            logger.info(f"✅ Fixed {fixed_count} parlay leg game associations")
+
+            return {
+                "success": True,
+                "message": f"Fixed {fixed_count} parlay leg game associations",
+                "fixed_count": fixed_count,
+                "fixes": fixes,
+                "orphaned_legs_found": len(orphaned_legs),
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Fix parlay game associations failed: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Fix parlay game associations failed: {str(e)}"
+        )
+
+
+@router.post("/api/admin/parlays/manual-fix-specific")
+async def manual_fix_specific_parlay_legs(admin_user: dict = Depends(require_admin)):
+    """Manually fix the specific parlay legs we know about (Admin only)"""
+    try:
+        logger.info("🔧 Manually fixing specific parlay legs...")
+
+        from sqlalchemy import text
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            fixes = []
+
+            # Fix Cincinnati Reds leg - should match Cardinals vs Reds game
+            reds_query = """
+            SELECT b.id
+            FROM bets b
+            JOIN parlay_bets pb ON b.parlay_id = pb.id
+            WHERE b.selection = 'Cincinnati Reds'
+            AND b.bet_type::text = 'moneyline'
+            AND b.game_id IS NULL
+            AND b.status = 'PENDING'
+            """
+            result = db.execute(text(reds_query))
+            reds_leg = result.fetchone()
+
+            if reds_leg:
+                # Find Cardinals vs Reds game
+                game_query = """
+                SELECT id, home_team, away_team
+                FROM games
+                WHERE (home_team LIKE '%Cardinal%' AND away_team LIKE '%Red%')
+                OR (home_team LIKE '%Red%' AND away_team LIKE '%Cardinal%')
+                ORDER BY commence_time DESC
+                LIMIT 1
+                """
+                game_result = db.execute(text(game_query))
+                game = game_result.fetchone()
+
+                if game:
+                    game_id, home_team, away_team = game
+
+                    update_query = """
+                    UPDATE bets
+                    SET game_id = :game_id,
+                        home_team = :home_team,
+                        away_team = :away_team
+                    WHERE id = :bet_id
+                    """
+                    db.execute(
+                        text(update_query),
+                        {
+                            "bet_id": reds_leg[0],
+                            "game_id": game_id,
+                            "home_team": home_team,
+                            "away_team": away_team,
+                        },
+                    )
+
+                    fixes.append(
+                        {
+                            "leg_id": reds_leg[0][:8] + "...",
+                            "selection": "Cincinnati Reds",
+                            "matched_game": f"{home_team} vs {away_team}",
+                            "game_id": game_id[:8] + "...",
+                        }
+                    )
+
+            # Fix Chicago Cubs leg - find Cubs game
+            cubs_query = """
+            SELECT b.id
+            FROM bets b
+            JOIN parlay_bets pb ON b.parlay_id = pb.id
+            WHERE b.selection = 'Chicago Cubs'
+            AND b.bet_type::text = 'moneyline'
+            AND b.game_id IS NULL
+            AND b.status = 'PENDING'
+            """
+            result = db.execute(text(cubs_query))
+            cubs_leg = result.fetchone()
+
+            if cubs_leg:
+                # Find Cubs game
+                cubs_game_query = """
+                SELECT id, home_team, away_team
+                FROM games
+                WHERE home_team LIKE '%Cubs%' OR away_team LIKE '%Cubs%'
+                ORDER BY commence_time DESC
+                LIMIT 1
+                """
+                game_result = db.execute(text(cubs_game_query))
+                game = game_result.fetchone()
+
+                if game:
+                    game_id, home_team, away_team = game
+
+                    update_query = """
+                    UPDATE bets
+                    SET game_id = :game_id,
+                        home_team = :home_team,
+                        away_team = :away_team
+                    WHERE id = :bet_id
+                    """
+                    db.execute(
+                        text(update_query),
+                        {
+                            "bet_id": cubs_leg[0],
+                            "game_id": game_id,
+                            "home_team": home_team,
+                            "away_team": away_team,
+                        },
+                    )
+
+                    fixes.append(
+                        {
+                            "leg_id": cubs_leg[0][:8] + "...",
+                            "selection": "Chicago Cubs",
+                            "matched_game": f"{home_team} vs {away_team}",
+                            "game_id": game_id[:8] + "...",
+                        }
+                    )
+
+            db.commit()
+
+            return {
+                "success": True,
+                "message": f"Manually fixed {len(fixes)} specific parlay legs",
+                "fixed_count": len(fixes),
+                "fixes": fixes,
+                "note": "Total bets (O 7.5) require additional context and weren't fixed automatically",
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Manual fix specific parlay legs failed: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Manual fix specific parlay legs failed: {str(e)}"
+        )
+
+
+@router.post("/api/admin/parlays/force-settle")
+async def force_settle_parlay(request: dict, admin_user: dict = Depends(require_admin)):
+    """Force settlement of a parlay based on current leg statuses (Admin only)"""
+    try:
+        parlay_id = request.get("parlay_id")
+        if not parlay_id:
+            raise HTTPException(status_code=400, detail="parlay_id is required")
+
+        logger.info(f"🔧 Force settling parlay {parlay_id[:8]}...")
+
+        from app.models.simple_unified_bet_model import SimpleUnifiedBet
+        from app.models.database_models import BetStatus
+        from app.core.database import SessionLocal
+        from app.services.bet_exposure_service import bet_exposure_service
+        from datetime import datetime
+
+        db = SessionLocal()
+        try:
+            # First, verify the parlay exists and check its legs
+            parlay = (
+                db.query(SimpleUnifiedBet)
+                .filter(SimpleUnifiedBet.id == parlay_id)
+                .first()
+            )
+
+            if not parlay:
+                raise HTTPException(status_code=404, detail="Parlay not found")
+
+            # Get all legs
+            legs = (
+                db.query(SimpleUnifiedBet)
+                .filter(SimpleUnifiedBet.parent_bet_id == parlay_id)
+                .all()
+            )
+
+            leg_statuses = {
+                "won": sum(1 for leg in legs if leg.status == BetStatus.WON),
+                "lost": sum(1 for leg in legs if leg.status == BetStatus.LOST),
+                "pushed": sum(1 for leg in legs if leg.status == BetStatus.PUSHED),
+                "pending": sum(1 for leg in legs if leg.status == BetStatus.PENDING),
+            }
+
+            logger.info(
+                f"Parlay {parlay_id[:8]} - Current status: {parlay.status.value}, Legs: {leg_statuses}"
+            )
+
+            # If any leg is lost, mark parlay as lost
+            if leg_statuses["lost"] > 0 and parlay.status == BetStatus.PENDING:
+                logger.info(f"Marking parlay {parlay_id[:8]} as LOST")
+                bet_exposure_service.release_bets(db, [parlay])
+                parlay.status = BetStatus.LOST
+                parlay.result_amount = 0
+                parlay.settled_at = datetime.utcnow()
+                db.commit()
+                logger.info(f"✅ Parlay {parlay_id[:8]} marked as LOST")
+
+                return {
+                    "success": True,
+                    "message": f"Parlay {parlay_id[:8]}... marked as LOST",
+                    "parlay_id": parlay_id,
+                    "leg_statuses": leg_statuses,
+                    "action": "settled_as_lost",
+                }
+            elif parlay.status != BetStatus.PENDING:
+                return {
+                    "success": True,
+                    "message": f"Parlay {parlay_id[:8]}... already settled as {parlay.status.value}",
+                    "parlay_id": parlay_id,
+                    "leg_statuses": leg_statuses,
+                    "action": "already_settled",
+                }
+            else:
+                return {
+                    "success": True,
+                    "message": f"Parlay {parlay_id[:8]}... not ready to settle",
+                    "parlay_id": parlay_id,
+                    "leg_statuses": leg_statuses,
+                    "action": "not_ready",
+                }
+
+        finally:
+            db.close()
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Force settle parlay failed: {e}")
+        import traceback
+
+        logger.error(traceback.format_exc())
+        raise HTTPException(
+            status_code=500, detail=f"Force settle parlay failed: {str(e)}"
+        )
+
+
+@router.post("/api/admin/parlays/fix-specific-ids")
+async def fix_specific_parlay_ids(admin_user: dict = Depends(require_admin)):
+    """Fix parlay legs using their specific IDs (Admin only)"""
+    try:
+        logger.info("🔧 Fixing parlay legs by specific IDs...")
+
+        from sqlalchemy import text
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            fixes = []
+
+            # Fix Cincinnati Reds leg by ID - from the parlay data you shared
+            reds_leg_id = "cd675b49-6f0d-4b38-bcd9-89041f0f27b5"
+
+            # Find Cardinals vs Reds game
+            game_query = """
+            SELECT id, home_team, away_team
+            FROM games
+            WHERE (home_team LIKE '%Cardinal%' AND away_team LIKE '%Red%')
+            OR (home_team LIKE '%Red%' AND away_team LIKE '%Cardinal%')
+            ORDER BY commence_time DESC
+            LIMIT 1
+            """
+            game_result = db.execute(text(game_query))
+            game = game_result.fetchone()
+
+            if game:
+                game_id, home_team, away_team = game
+
+                # Update the Reds leg
+                update_query = """
+                UPDATE bets
+                SET game_id = :game_id,
+                    home_team = :home_team,
+                    away_team = :away_team
+                WHERE id = :bet_id
+                """
+                db.execute(
+                    text(update_query),
+                    {
+                        "bet_id": reds_leg_id,
+                        "game_id": game_id,
+                        "home_team": home_team,
+                        "away_team": away_team,
+                    },
+                )
+
+                fixes.append(
+                    {
+                        "leg_id": reds_leg_id[:8] + "...",
+                        "selection": "Cincinnati Reds (by ID)",
+                        "matched_game": f"{home_team} vs {away_team}",
+                        "game_id": game_id[:8] + "...",
+                    }
+                )
+
+            # Fix Chicago Cubs leg by ID
+            cubs_leg_id = "0056b9d7-ae32-445d-91d2-5d6672e55655"
+
+            # Find Cubs game
+            cubs_game_query = """
+            SELECT id, home_team, away_team
+            FROM games
+            WHERE home_team LIKE '%Cubs%' OR away_team LIKE '%Cubs%'
+            ORDER BY commence_time DESC
+            LIMIT 1
+            """
+            game_result = db.execute(text(cubs_game_query))
+            game = game_result.fetchone()
+
+            if game:
+                game_id, home_team, away_team = game
+
+                # Update the Cubs leg
+                update_query = """
+                UPDATE bets
+                SET game_id = :game_id,
+                    home_team = :home_team,
+                    away_team = :away_team
+                WHERE id = :bet_id
+                """
+                db.execute(
+                    text(update_query),
+                    {
+                        "bet_id": cubs_leg_id,
+                        "game_id": game_id,
+                        "home_team": home_team,
+                        "away_team": away_team,
+                    },
+                )
+
+                fixes.append(
+                    {
+                        "leg_id": cubs_leg_id[:8] + "...",
+                        "selection": "Chicago Cubs (by ID)",
+                        "matched_game": f"{home_team} vs {away_team}",
+                        "game_id": game_id[:8] + "...",
+                    }
+                )
+
+            db.commit()
+
+            return {
+                "success": True,
+                "message": f"Fixed {len(fixes)} parlay legs by specific IDs",
+                "fixed_count": len(fixes),
+                "fixes": fixes,
+                "note": f"Used hardcoded bet IDs: Reds={reds_leg_id[:8]}..., Cubs={cubs_leg_id[:8]}...",
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Fix specific parlay IDs failed: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Fix specific parlay IDs failed: {str(e)}"
+        )
+
+
+@router.post("/api/admin/parlays/fix-all-orphaned-legs")
+async def fix_all_orphaned_parlay_legs(admin_user: dict = Depends(require_admin)):
+    """Fix all parlay legs that don't have game associations (Admin only)"""
+    try:
+        logger.info("🔧 Fixing all orphaned parlay legs...")
+
+        from sqlalchemy import text
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            # Find all parlay legs without game associations
+            orphaned_query = """
+            SELECT b.id, b.selection, b.bet_type, b.parlay_id
+            FROM bets b
+            WHERE b.bet_type::text IN ('moneyline', 'spread', 'total')
+            AND b.parlay_id IS NOT NULL
+            AND b.game_id IS NULL
+            ORDER BY b.placed_at DESC
+            """
+            orphaned_result = db.execute(text(orphaned_query))
+            orphaned_legs = orphaned_result.fetchall()
+
+            if not orphaned_legs:
+                return {
+                    "status": "success",
+                    "message": "No orphaned parlay legs found",
+                    "fixed_legs": [],
+                }
+
+            logger.info(f"Found {len(orphaned_legs)} orphaned parlay legs")
+
+            fixed_legs = []
+            unmatched_legs = []
+
+            for leg in orphaned_legs:
+                bet_id, selection, bet_type, parlay_id = leg
+                logger.info(
+                    f"Processing leg {bet_id[:8]}... - {selection} ({bet_type})"
+                )
+
+                # Extract team names from selection
+                team_name = None
+
+                if bet_type == "moneyline":
+                    # For moneyline, selection is just the team name
+                    team_name = selection.strip()
+                elif bet_type == "spread":
+                    # For spread, extract team from "Detroit Tigers +7.5" format
+                    if "+" in selection or "-" in selection:
+                        # Split on + or - and take the first part
+                        import re
+
+                        match = re.match(r"^(.+?)\s*[+-]", selection)
+                        if match:
+                            team_name = match.group(1).strip()
+                elif bet_type == "total":
+                    # For total bets, we need to find the game differently
+                    # Look for "Over X.X" or "Under X.X" in selection
+                    # We'll need to find recent games and match by timing/context
+                    logger.info(f"Total bet detected: {selection} - skipping for now")
+                    continue
+
+                if not team_name:
+                    logger.warning(
+                        f"Could not extract team name from selection: {selection}"
+                    )
+                    unmatched_legs.append(
+                        {
+                            "bet_id": bet_id[:8] + "...",
+                            "selection": selection,
+                            "bet_type": bet_type,
+                            "reason": "Could not extract team name",
+                        }
+                    )
+                    continue
+
+                # Find matching game
+                game_query = """
+                SELECT id, home_team, away_team, commence_time
+                FROM games
+                WHERE (home_team ILIKE %s OR away_team ILIKE %s)
+                AND commence_time >= NOW() - INTERVAL '7 days'
+                ORDER BY commence_time DESC
+                LIMIT 1
+                """
+
+                # Create search pattern
+                search_pattern = f"%{team_name}%"
+
+                game_result = db.execute(
+                    text(game_query), (search_pattern, search_pattern)
+                )
+                game = game_result.fetchone()
+
+                if game:
+                    game_id, home_team, away_team, commence_time = game
+
+                    # Update the bet with game information
+                    update_query = """
+                    UPDATE bets
+                    SET game_id = :game_id,
+                        home_team = :home_team,
+                        away_team = :away_team
+                    WHERE id = :bet_id
+                    """
+                    db.execute(
+                        text(update_query),
+                        {
+                            "bet_id": bet_id,
+                            "game_id": game_id,
+                            "home_team": home_team,
+                            "away_team": away_team,
+                        },
+                    )
+
+                    fixed_legs.append(
+                        {
+                            "bet_id": bet_id[:8] + "...",
+                            "selection": selection,
+                            "bet_type": bet_type,
+                            "matched_team": team_name,
+                            "game": f"{home_team} vs {away_team}",
+                            "game_id": game_id[:8] + "...",
+                            "commence_time": str(commence_time),
+                        }
+                    )
+
+                    logger.info(
+                        f"✅ Fixed leg {bet_id[:8]}... -> {home_team} vs {away_team}"
+                    )
+
+                else:
+                    logger.warning(f"No game found for team: {team_name}")
+                    unmatched_legs.append(
+                        {
+                            "bet_id": bet_id[:8] + "...",
+                            "selection": selection,
+                            "bet_type": bet_type,
+                            "extracted_team": team_name,
+                            "reason": "No matching game found",
+                        }
+                    )
+
+            # Commit all changes
+            db.commit()
+
+            return {
+                "status": "success",
+                "message": f"Fixed {len(fixed_legs)} orphaned parlay legs",
+                "fixed_legs": fixed_legs,
+                "unmatched_legs": unmatched_legs,
+                "total_processed": len(orphaned_legs),
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Error fixing orphaned parlay legs: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Fix orphaned parlay legs failed: {str(e)}"
+        )
+
+
+@router.options("/api/admin/parlays/fix-all-orphaned-legs")
+async def options_fix_all_orphaned_parlay_legs():
+    """Handle CORS preflight for fix all orphaned parlay legs"""
+    return {}
+
+
+@router.options("/api/admin/bets/verification/config")
+async def options_verification_config():
+    """Handle CORS preflight for verification config"""
+    return {}
+
+
+@router.post("/api/admin/bets/verification/config")
+async def update_verification_config(
+    config: dict, admin_user: dict = Depends(require_admin)
+):
+    """Update bet verification configuration (Admin only)"""
+    from app.services.bet_scheduler_service import bet_scheduler
+
+    try:
+        result = bet_scheduler.update_config(config)
+        return {"status": "success", "config": result}
+    except Exception as e:
+        logger.error(f"Error updating verification config: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to update verification config"
+        )
+
+
+@router.options("/api/admin/bets/verification/reset-stats")
+async def options_reset_verification_stats():
+    """Handle CORS preflight for reset verification stats"""
+    return {}
+
+
+@router.post("/api/admin/bets/verification/reset-stats")
+async def reset_verification_stats(admin_user: dict = Depends(require_admin)):
+    """Reset bet verification statistics (Admin only)"""
+    from app.services.bet_scheduler_service import bet_scheduler
+
+    try:
+        result = bet_scheduler.reset_stats()
+        return {"status": "success", "result": result}
+    except Exception as e:
+        logger.error(f"Error resetting verification stats: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to reset verification stats"
+        )
+
+
+@router.options("/api/admin/games/sync")
+async def options_sync_games():
+    """Handle CORS preflight for game sync"""
+    return {}
+
+
+@router.post("/api/admin/games/sync")
+async def sync_games(admin_user: dict = Depends(require_admin)):
+    """Manually sync game data from Odds API (Admin only)"""
+    try:
+        from app.services.game_sync_service import game_sync_service
+
+        result = await game_sync_service.sync_game_scores(days_back=3)
+        return {"status": "success", "result": result}
+    except Exception as e:
+        logger.error(f"Error syncing games: {e}")
+        raise HTTPException(status_code=500, detail="Failed to sync games")
+
+
+@router.post("/api/admin/games/sync-upcoming")
+async def sync_upcoming_games(admin_user: dict = Depends(require_admin)):
+    """Sync upcoming games from Odds API to populate real game data (Admin only)"""
+    try:
+        from app.services.game_sync_service import game_sync_service
+
+        result = await game_sync_service.sync_upcoming_games(days_ahead=7)
+        return {"status": "success", "result": result}
+    except Exception as e:
+        logger.error(f"Error syncing upcoming games: {e}")
+        raise HTTPException(status_code=500, detail="Failed to sync upcoming games")
+
+
+@router.get("/api/admin/games/test-api")
+async def test_odds_api(admin_user: dict = Depends(require_admin)):
+    """Test Odds API connectivity and available games (Admin only)"""
+    try:
+        from app.services.odds_api_service import OddsAPIService
+        from app.core.config import settings
+
+        if not settings.ODDS_API_KEY:
+            return {"status": "error", "message": "No API key configured"}
+
+        # Test with a small sample
+        async with OddsAPIService(settings.ODDS_API_KEY) as odds_service:
+            # Try MLB first (most likely to have games)
+            games = await odds_service.get_odds("baseball_mlb")
+
+            return {
+                "status": "success",
+                "mlb_games_found": len(games),
+                "sample_games": [
+                    {
+                        "id": game.id,
+                        "teams": f"{game.away_team} @ {game.home_team}",
+                        "commence_time": game.commence_time.isoformat(),
+                    }
+                    for game in games[:3]  # First 3 games
+                ],
+            }
+    except Exception as e:
+        logger.error(f"Error testing odds API: {e}")
+        return {"status": "error", "error": str(e)}
+
+
+@router.options("/api/admin/odds-quota/plan")
+async def options_odds_quota_plan():
+    """Handle CORS preflight for the Odds API quota plan"""
+    return {}
+
+
+@router.get("/api/admin/odds-quota/plan")
+async def get_odds_quota_plan(admin_user: dict = Depends(require_admin)):
+    """Current Odds API polling plan and persisted credit usage (Admin only)"""
+    try:
+        from app.services.odds_quota_planner import odds_quota_planner
+
+        # The report queries the usage log and calendar: keep it off the loop
+        report = await asyncio.to_thread(odds_quota_planner.get_plan_report)
+        return {"status": "success", **report}
+    except Exception as e:
+        logger.error(f"Error building odds quota plan: {e}")
+        raise HTTPException(status_code=500, detail="Failed to build odds quota plan")
+
+
+@router.options("/api/admin/analytics/import")
+async def options_import_player_analytics():
+    """Handle CORS preflight for player analytics imports"""
+    return {}
+
+
+@router.post("/api/admin/analytics/import")
+async def import_player_analytics(
+    file: UploadFile = File(...),
+    mode: str = "replace",
+    admin_user: dict = Depends(require_admin),
+):
+    """Bulk load a player_analytics CSV through a staging table (Admin only)
+
+    mode: replace (whole table), seasons (the seasons in the file) or merge
+    (the player weeks in the file).
+    """
+    from app.services.analytics_bulk_loader import LOAD_MODES, analytics_bulk_loader
+
+    if mode not in LOAD_MODES:
+        raise HTTPException(
+            status_code=400, detail=f"mode must be one of {list(LOAD_MODES)}"
+        )
+
+    # Decoded as it is read: the upload is never held in memory whole
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        report = await asyncio.to_thread(analytics_bulk_loader.load_csv, stream, mode)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File is not UTF-8 text")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error importing player analytics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to import analytics")
+    finally:
+        stream.detach()
+
+    return {"status": "success", **report.to_dict()}
+
+
+@router.options("/api/admin/sleeper/stats")
+async def options_sleeper_stats():
+    """Handle CORS preflight for Sleeper client stats"""
+    return {}
+
+
+@router.get("/api/admin/sleeper/stats")
+async def get_sleeper_stats(admin_user: dict = Depends(require_admin)):
+    """Sleeper API cache hit rates and request counters (Admin only)"""
+    from app.services.sleeper_client import sleeper_client
+
+    return {"status": "success", "stats": sleeper_client.stats()}
+
+
+@router.options("/api/admin/sql-stats")
+async def options_sql_stats():
+    """Handle CORS preflight for SQL instrumentation stats"""
+    return {}
+
+
+@router.get("/api/admin/sql-stats")
+async def get_sql_stats(reset: bool = False, admin_user: dict = Depends(require_admin)):
+    """Per-endpoint and per-task query counts, DB time and N+1 suspects (Admin only)"""
+    summary = query_stats.summary()
+    if reset:
+        query_stats.reset()
+    return {
+        "status": "success",
+        "repeat_warn_threshold": settings.SQL_REPEAT_WARN_THRESHOLD,
+        "scopes": summary,
+    }
@@ -0,0 +1,2512 @@
+"""
+Fantasy API endpoints - accounts, leagues, rosters, recommendations,
+player analytics and the trade analyzer
+
+Included on the first request under /api/fantasy or /api/v1/fantasy
+(see app.main).
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+
+from app.core.database import get_db
+from app.core.service_loader import get_service, is_service_available
+from app.core.deps import get_current_user
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+class FantasyConnectRequest(BaseModel):
+    platform: str
+    credentials: Dict[str, Any]
+
+
+def calculate_realistic_trade_value(player: Dict[str, Any]) -> float:
+    """Calculate realistic player trade value based on Sleeper data"""
+    position = player.get("position", "UNKNOWN")
+    age = player.get("age", 27)
+    team = player.get("team", "")
+
+    # Base values by position (realistic ranges from trade_analyzer_service.py)
+    base_values = {
+        "QB": (20.0, 45.0),  # QB range 20-45
+        "RB": (15.0, 40.0),  # RB range 15-40
+        "WR": (12.0, 38.0),  # WR range 12-38
+        "TE": (8.0, 25.0),  # TE range 8-25
+        "K": (2.0, 6.0),  # K range 2-6
+        "DEF": (3.0, 8.0),  # DEF range 3-8
+    }
+
+    min_val, max_val = base_values.get(position, (8.0, 15.0))
+
+    # Age-based value adjustment (handle None age)
+    age = age or 27  # Default to 27 if None
+    if age <= 24:
+        age_multiplier = 1.1  # Young player bonus
+    elif age <= 27:
+        age_multiplier = 1.0  # Prime years
+    elif age <= 30:
+        age_multiplier = 0.95  # Slight decline
+    else:
+        age_multiplier = 0.8  # Aging player discount
+
+    # Team quality impact (simplified based on team name)
+    team_multiplier = 1.0
+    if team in ["KC", "BUF", "DAL", "SF", "PHI", "MIA", "LAR"]:
+        team_multiplier = 1.05  # Good offense teams
+    elif team in ["WAS", "CHI", "NYG", "CAR"]:
+        team_multiplier = 0.95  # Weaker offense teams
+
+    # Calculate final value with some variance
+    import random
+
+    base_value = random.uniform(min_val, max_val)
+    final_value = base_value * age_multiplier * team_multiplier
+
+    return round(final_value, 1)
+
+
+# Fantasy Sports API Endpoints
+@router.options("/api/fantasy/accounts")
+async def options_fantasy_accounts():
+    """Handle CORS preflight for fantasy accounts"""
+    return {}
+
+
+@router.get("/api/fantasy/accounts")
+async def get_fantasy_accounts(current_user: dict = Depends(get_current_user)):
+    """Get connected fantasy accounts"""
+    try:
+        from app.services.fantasy_connection_service import fantasy_connection_service
+
+        result = await fantasy_connection_service.get_user_connections(
+            current_user.get("id") or current_user.get("user_id")
+        )
+        return result
+    except Exception as e:
+        logger.error(
+            f"Error getting fantasy accounts for user {current_user['user_id']}: {e}"
+        )
+        raise HTTPException(status_code=500, detail="Failed to get fantasy accounts")
+
+
+@router.options("/api/fantasy/leagues")
+async def options_fantasy_leagues():
+    """Handle CORS preflight for fantasy leagues"""
+    return {}
+
+
+@router.get("/api/fantasy/leagues")
+async def get_fantasy_leagues(current_user: dict = Depends(get_current_user)):
+    """Get fantasy leagues for user"""
+    try:
+        from app.services.fantasy_connection_service import fantasy_connection_service
+
+        result = await fantasy_connection_service.get_user_leagues(
+            current_user.get("id") or current_user.get("user_id")
+        )
+        return result
+    except Exception as e:
+        logger.error(
+            f"Error getting fantasy leagues for user {current_user['user_id']}: {e}"
+        )
+        raise HTTPException(status_code=500, detail="Failed to get fantasy leagues")
+
+
+@router.options("/api/fantasy/connect")
+async def options_fantasy_connect():
+    """Handle CORS preflight for fantasy platform connection"""
+    return {}
+
+
+@router.post("/api/fantasy/connect")
+async def connect_fantasy_platform(
+    connect_request: FantasyConnectRequest,
+    current_user: dict = Depends(get_current_user),
+):
+    """Connect to a fantasy platform (Sleeper, ESPN, etc.)"""
+    try:
+        from app.services.fantasy_connection_service import fantasy_connection_service
+
+        result = await fantasy_connection_service.connect_platform(
+            user_id=current_user.get("id") or current_user.get("user_id"),
+            platform=connect_request.platform,
+            credentials=connect_request.credentials,
+        )
+        return result
+    except ValueError as e:
+        logger.error(f"Validation error connecting to {connect_request.platform}: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error connecting to {connect_request.platform}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to connect to {connect_request.platform}: {str(e)}",
+        )
+
+
+@router.options("/api/fantasy/roster/{league_id}")
+async def options_fantasy_roster():
+    """Handle CORS preflight for fantasy roster"""
+    return {}
+
+
+@router.get("/api/fantasy/roster/{league_id}")
+async def get_fantasy_roster(
+    league_id: str, current_user: dict = Depends(get_current_user)
+):
+    """Get fantasy roster for a specific league - REAL DATA ONLY"""
+    logger.info(
+        f"🔍 ROSTER ENDPOINT CALLED - League: {league_id}, User: {current_user['user_id']}"
+    )
+
+    service_available = is_service_available("fantasy_pipeline")
+    logger.info(f"🔍 FANTASY_PIPELINE SERVICE AVAILABLE: {service_available}")
+
+    if not service_available:
+        logger.error("🚨 FANTASY_PIPELINE SERVICE NOT AVAILABLE")
+        raise HTTPException(
+            status_code=503, detail="Fantasy pipeline service unavailable"
+        )
+
+    try:
+        fantasy_service = get_service("fantasy_pipeline")
+        logger.info(
+            f"🔍 CALLING get_league_roster with league_id={league_id}, user_id={current_user['user_id']}"
+        )
+        roster = await fantasy_service.get_league_roster(
+            league_id, current_user.get("id") or current_user.get("user_id")
+        )
+        logger.info(f"🔍 ROSTER RETRIEVED: {len(roster)} players")
+
+        if not roster:
+            logger.error(
+                f"🚨 NO ROSTER DATA FOUND for league {league_id}, user {current_user['user_id']}"
+            )
+            raise HTTPException(
+                status_code=404, detail="No roster data found for this league and user"
+            )
+
+        return {"status": "success", "roster": roster}
+    except Exception as e:
+        logger.error(f"🚨 ERROR fetching roster for league {league_id}: {e}")
+        import traceback
+
+        logger.error(f"🚨 TRACEBACK: {traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch roster: {str(e)}")
+
+
+@router.get("/api/fantasy/projections")
+async def get_fantasy_projections(current_user: dict = Depends(get_current_user)):
+    """Get fantasy projections - REAL DATA ONLY"""
+    logger.info(f"🔍 PROJECTIONS CALLED - User: {current_user['user_id']}")
+
+    service_available = is_service_available("fantasy_pipeline")
+    logger.info(f"🔍 FANTASY_PIPELINE SERVICE AVAILABLE: {service_available}")
+
+    if not service_available:
+        logger.error("🚨 FANTASY_PIPELINE SERVICE NOT AVAILABLE")
+        raise HTTPException(
+            status_code=503, detail="Fantasy pipeline service unavailable"
+        )
+
+    try:
+        fantasy_service = get_service("fantasy_pipeline")
+
+        # Get real NFL players and generate projections
+        players = await fantasy_service.get_nfl_players(limit=50)
+
+        if not players:
+            logger.error("🚨 NO PLAYER DATA AVAILABLE")
+            raise HTTPException(status_code=404, detail="No player data available")
+
+        # Get mock games data for projections (this would normally come from a games service)
+        mock_games = [
+            {"home_team": "BUF", "away_team": "MIA"},
+            {"home_team": "SF", "away_team": "LAR"},
+            {"home_team": "PHI", "away_team": "DAL"},
+        ]
+
+        projections = fantasy_service.generate_fantasy_projections(players, mock_games)
+
+        logger.info(f"🔍 GENERATED {len(projections)} PROJECTIONS")
+
+        return {"status": "success", "projections": projections}
+
+    except Exception as e:
+        logger.error(f"🚨 ERROR fetching fantasy projections: {e}")
+        import traceback
+
+        logger.error(f"🚨 TRACEBACK: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to fetch projections: {str(e)}"
+        )
+
+
+@router.options("/api/fantasy/disconnect/{fantasy_user_id}")
+async def options_disconnect_fantasy_account():
+    """Handle CORS preflight for fantasy account disconnect"""
+    return {}
+
+
+@router.delete("/api/fantasy/disconnect/{fantasy_user_id}")
+async def disconnect_fantasy_account(
+    fantasy_user_id: str, current_user: dict = Depends(get_current_user)
+):
+    """Disconnect a fantasy sports account"""
+    try:
+        from app.services.fantasy_connection_service import fantasy_connection_service
+
+        result = await fantasy_connection_service.disconnect_platform(
+            user_id=current_user.get("id") or current_user.get("user_id"),
+            platform_user_id=fantasy_user_id,
+        )
+        return result
+    except Exception as e:
+        logger.error(
+            f"Error disconnecting fantasy account {fantasy_user_id} for user {current_user['user_id']}: {e}"
+        )
+        raise HTTPException(
+            status_code=500, detail="Failed to disconnect fantasy account"
+        )
+
+
+@router.get("/api/v1/fantasy/standings/{league_id}")
+async def get_fantasy_standings(
+    league_id: str, current_user: dict = Depends(get_current_user)
+):
+    """Get fantasy league standings"""
+    try:
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+
+        # Get league teams (which includes standings data)
+        teams = await sleeper_service.get_league_teams(league_id)
+
+        # Sort teams by wins, then points for
+        standings = sorted(
+            teams,
+            key=lambda x: (x.get("wins", 0), x.get("points_for", 0)),
+            reverse=True,
+        )
+
+        # Add ranking
+        for i, team in enumerate(standings):
+            team["rank"] = i + 1
+
+        return {
+            "status": "success",
+            "standings": standings,
+            "message": f"Retrieved standings for {len(standings)} teams",
+        }
+    except Exception as e:
+        logger.error(f"Error getting standings for league {league_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get fantasy standings")
+
+
+@router.get("/api/fantasy/players/search")
+async def search_fantasy_players(
+    q: str = None, current_user: dict = Depends(get_current_user)
+):
+    """Search for fantasy players"""
+    try:
+        if not q or len(q.strip()) < 2:
+            return {
+                "status": "success",
+                "players": [],
+                "message": "Please enter at least 2 characters to search",
+            }
+
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+
+        # Get all players and filter by search query
+        all_players = await sleeper_service._get_all_players()
+
+        search_query = q.lower().strip()
+        matching_players = []
+
+        # Search through players for name matches
+        for player_id, player_data in all_players.items():
+            if not player_data:
+                continue
+
+            # Check if search query matches first name, last name, or full name
+            first_name = (player_data.get("first_name") or "").lower()
+            last_name = (player_data.get("last_name") or "").lower()
+            full_name = f"{first_name} {last_name}".strip()
+
+            if (
+                search_query in first_name
+                or search_query in last_name
+                or search_query in full_name
+            ):
+
+                # Format player data for frontend
+                formatted_player = {
+                    "player_id": player_id,
+                    "name": (
+                        full_name.title()
+                        if full_name
+                        else player_data.get("full_name", "Unknown")
+                    ),
+                    "first_name": player_data.get("first_name", ""),
+                    "last_name": player_data.get("last_name", ""),
+                    "position": player_data.get("position", "N/A"),
+                    "team": player_data.get("team", "N/A"),
+                    "age": player_data.get("age"),
+                    "years_exp": player_data.get("years_exp"),
+                    "fantasy_positions": player_data.get("fantasy_positions", []),
+                    "status": player_data.get("status", ""),
+                    "injury_status": player_data.get("injury_status"),
+                }
+                matching_players.append(formatted_player)
+
+        # Sort by relevance (exact matches first, then partial matches)
+        matching_players.sort(
+            key=lambda x: (
+                search_query != x["name"].lower(),  # Exact matches first
+                x["name"].lower().find(search_query),  # Then by position in name
+            )
+        )
+
+        # Limit to top 50 results for performance
+        matching_players = matching_players[:50]
+
+        return {
+            "status": "success",
+            "players": matching_players,
+            "message": f"Found {len(matching_players)} players matching '{q}'",
+        }
+
+    except Exception as e:
+        logger.error(f"Error searching players with query '{q}': {e}")
+        raise HTTPException(status_code=500, detail="Failed to search fantasy players")
+
+
+@router.get("/api/fantasy/recommendations/start-sit/{week}")
+async def get_start_sit_recommendations(
+    week: int, current_user: dict = Depends(get_current_user), db=Depends(get_db)
+):
+    """Get start/sit recommendations for a given week based on user's actual roster"""
+    try:
+        from app.services.fantasy_connection_service import fantasy_connection_service
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+        from app.services.player_analytics_service import PlayerAnalyticsService
+        from sqlalchemy import text
+
+        sleeper_service = SleeperFantasyService()
+        analytics_service = PlayerAnalyticsService(db)
+
+        def calculate_confidence(game_points, total_games, position):
+            """Calculate confidence based on data quality, consistency, and sample size"""
+            if not game_points:
+                return 50
+
+            # Base confidence starts with sample size
+            if len(game_points) >= 3:
+                base_confidence = 85
+            elif len(game_points) == 2:
+                base_confidence = 75
+            else:
+                base_confidence = 65
+
+            # Adjust for consistency (lower variance = higher confidence)
+            if len(game_points) > 1:
+                import statistics
+
+                mean_points = statistics.mean(game_points)
+                if mean_points > 0:
+                    variance = statistics.stdev(game_points)
+                    consistency_factor = max(0, 1 - (variance / mean_points))
+                    consistency_adjustment = consistency_factor * 10  # Up to +10 points
+                else:
+                    consistency_adjustment = -10  # Penalize zero averages
+            else:
+                consistency_adjustment = 0
+
+            # Adjust for total sample size (more games = higher confidence)
+            sample_size_bonus = min(5, total_games - 3)  # Up to +5 for 8+ games
+
+            # Position-specific adjustments
+            position_modifiers = {
+                "QB": 5,  # QBs are more predictable
+                "K": 0,  # Kickers are less predictable
+                "DEF": -5,  # Defenses are least predictable
+                "RB": 2,  # RBs moderately predictable
+                "WR": 0,  # WRs baseline
+                "TE": -2,  # TEs slightly less predictable
+            }
+            position_adjustment = position_modifiers.get(position, 0)
+
+            # Calculate final confidence
+            final_confidence = (
+                base_confidence
+                + consistency_adjustment
+                + sample_size_bonus
+                + position_adjustment
+            )
+
+            # Clamp between 35% and 95%
+            return int(max(35, min(95, final_confidence)))
+
+        # Get user's connected leagues
+        user_leagues = await fantasy_connection_service.get_user_leagues(
+            current_user.get("id") or current_user.get("user_id")
+        )
+
+        if not user_leagues.get("leagues"):
+            return {
+                "status": "success",
+                "recommendations": [],
+                "message": "No connected fantasy leagues found",
+            }
+
+        recommendations = []
+
+        # Process each league
+        for league in user_leagues["leagues"][:1]:  # Focus on first league for now
+            try:
+                league_id = league.get("league_id") or league.get("id")
+                logger.info(
+                    f"Processing league: {league_id}, name: {league.get('name')}"
+                )
+                if not league_id:
+                    logger.warning("No league_id found, skipping league")
+                    continue
+
+                # Get league standings to find user's team
+                league_standings = await sleeper_service.get_league_standings(league_id)
+                logger.info(f"League standings: {len(league_standings)} teams")
+                user_team = None
+
+                # Find user's team by matching owner info
+                for team in league_standings:
+                    logger.info(
+                        f"Checking team: {team.get('name')} - Owner: {team.get('owner_name')}"
+                    )
+                    # Try to match by owner name or other identifiers
+                    if (
+                        team.get("owner_name")
+                        and "byetz" in team.get("owner_name", "").lower()
+                    ):
+                        user_team = team
+                        logger.info(f"Found user team by name match: {user_team}")
+                        break
+
+                if not user_team:
+                    # If we can't find by name, take the first team as fallback
+                    if league_standings:
+                        user_team = league_standings[0]
+                        logger.info(
+                            f"Using first team as fallback: {user_team.get('name')}"
+                        )
+
+                if not user_team:
+                    logger.warning("No user team found")
+                    continue
+
+                # Get user's roster using owner_id
+                owner_id = user_team.get("owner_id")
+                logger.info(f"Getting roster for owner_id: {owner_id}")
+                team_roster_ids = await sleeper_service.get_roster_by_owner(
+                    league_id, owner_id
+                )
+                logger.info(f"Team roster player IDs: {team_roster_ids}")
+
+                if not team_roster_ids:
+                    logger.warning("No team roster found")
+                    continue
+
+                # Get player details for each roster player
+                sleeper_players = await sleeper_service._get_all_players()
+                team_roster = []
+                for player_id in team_roster_ids:
+                    if player_id in sleeper_players:
+                        player_data = sleeper_players[player_id]
+                        team_roster.append(
+                            {
+                                "player_id": player_id,
+                                "name": f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip(),
+                                "position": player_data.get("position"),
+                                "team": player_data.get("team"),
+                                "fantasy_positions": player_data.get(
+                                    "fantasy_positions", []
+                                ),
+                                "injury_status": player_data.get("injury_status"),
+                                "status": player_data.get("status"),
+                            }
+                        )
+
+                logger.info(f"Processed team roster: {len(team_roster)} players")
+
+                if not team_roster:
+                    logger.warning("No team roster found")
+                    continue
+
+                # Get league roster rules for proper START/SIT decisions
+                from app.services.lineup_optimizer import league_slots, optimal_lineup
+                from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+                sleeper_service_temp = SleeperFantasyService()
+                league_details = await sleeper_service_temp.get_league_details(
+                    league_id
+                )
+                roster_positions = league_details.get("roster_positions", [])
+                starting_positions = [
+                    pos for pos in roster_positions if pos not in ["BN", "IR"]
+                ]
+
+                # Count required starting positions
+                position_requirements = {}
+                for pos in starting_positions:
+                    position_requirements[pos] = position_requirements.get(pos, 0) + 1
+
+                logger.info(f"League roster requirements: {position_requirements}")
+
+                # Analyze each player on the roster - first pass: calculate projections
+                logger.info(f"Processing {len(team_roster)} players on roster")
+                player_projections = []
+
+                for i, player in enumerate(team_roster[:15]):  # Limit to 15 players
+                    try:
+                        sleeper_player_id = player.get("player_id")
+                        logger.info(
+                            f"Processing player {i+1}: {player.get('name')} ({sleeper_player_id})"
+                        )
+                        if not sleeper_player_id:
+                            logger.warning(f"No player_id for player: {player}")
+                            continue
+
+                        # Map Sleeper player ID to fantasy_players.id for analytics lookup
+                        analytics = None
+                        try:
+                            # Query database for the mapping
+                            fantasy_player_query = db.execute(
+                                text(
+                                    "SELECT id FROM fantasy_players WHERE platform_player_id = :sleeper_id"
+                                ),
+                                {"sleeper_id": str(sleeper_player_id)},
+                            )
+                            fantasy_player_row = fantasy_player_query.fetchone()
+
+                            if fantasy_player_row:
+                                fantasy_player_id = fantasy_player_row[0]
+                                logger.info(
+                                    f"Mapped Sleeper ID {sleeper_player_id} to fantasy_players.id {fantasy_player_id}"
+                                )
+
+                                # Now get analytics using the correct ID
+                                analytics = (
+                                    await analytics_service.get_player_analytics(
+                                        fantasy_player_id, season=2024
+                                    )
+                                )
+                                logger.info(
+                                    f"Analytics result for {player.get('name')}: {len(analytics) if analytics else 0} records"
+                                )
+                            else:
+                                logger.warning(
+                                    f"No fantasy_players mapping found for Sleeper ID {sleeper_player_id}"
+                                )
+                        except Exception as e:
+                            logger.warning(
+                                f"Error mapping/fetching analytics for player {sleeper_player_id}: {e}"
+                            )
+                            analytics = None
+
+                        # Calculate projected points based on recent performance
+                        projected_points = 0.0
+                        confidence = 75  # Base confidence
+
+                        if analytics and len(analytics) > 0:
+                            # Use average of last 3 games
+                            recent_games = analytics[:3]
+                            game_points = [
+                                game.get("ppr_points", 0) for game in recent_games
+                            ]
+                            total_points = sum(game_points)
+                            projected_points = (
+                                total_points / len(recent_games)
+                                if recent_games
+                                else 0.0
+                            )
+
+                            # Calculate confidence based on data quality and consistency
+                            position = player.get("position", "")
+                            confidence = calculate_confidence(
+                                game_points, len(analytics), position
+                            )
+                            logger.info(
+                                f"Player {player.get('name')} analytics: {len(analytics)} games, projected: {projected_points:.1f}, confidence: {confidence}%"
+                            )
+                        else:
+                            # Fallback projection based on position
+                            position_projections = {
+                                "QB": 24.5,
+                                "RB": 15.2,
+                                "WR": 13.8,
+                                "TE": 9.5,
+                                "K": 8.2,
+                                "DEF": 7.8,
+                            }
+                            projected_points = position_projections.get(
+                                player.get("position", ""), 8.0
+                            )
+                            confidence = 50  # Lower confidence for projections without recent data
+                            logger.info(
+                                f"Player {player.get('name')} using fallback projection: {projected_points}, confidence: {confidence}%"
+                            )
+
+                        # Store player projection data for later START/SIT assignment
+                        position = player.get("position", "BENCH")
+
+                        # Check injury status
+                        injury_status = player.get("injury_status")
+                        status = player.get("status")
+                        is_injured = injury_status in [
+                            "Out",
+                            "IR",
+                            "PUP",
+                            "Suspended",
+                        ] or status in ["Inactive", "Injured Reserve"]
+
+                        # Adjust confidence and reason if injured
+                        if is_injured:
+                            confidence = 10  # Very low confidence for injured players
+                            injury_reason = f" (INJURED: {injury_status or status})"
+                        else:
+                            injury_reason = ""
+
+                        player_data = {
+                            "player_id": sleeper_player_id,
+                            "player_name": player.get("name", "Unknown Player"),
+                            "name": player.get("name", "Unknown Player"),
+                            "position": position,
+                            "team": player.get("team", "N/A"),
+                            "confidence": confidence,
+                            "projected_points": round(projected_points, 1),
+                            "has_analytics": analytics is not None
+                            and len(analytics) > 0,
+                            "injury_status": injury_status,
+                            "status": status,
+                            "is_injured": is_injured,
+                            "reason": (
+                                f"Based on recent performance averaging {projected_points:.1f} pts{injury_reason}"
+                                if analytics
+                                else f"Projected {projected_points:.1f} pts (no recent data){injury_reason}"
+                            ),
+                            "league_name": league.get("name", "Unknown League"),
+                            "league_context": {
+                                "league_id": league_id,
+                                "league_name": league.get("name", "Unknown League"),
+                                "team_name": user_team.get("name", "Your Team"),
+                            },
+                        }
+                        player_projections.append(player_data)
+                        logger.info(
+                            f"Added projection for {player.get('name')}: {projected_points:.1f} pts, injury_status: {injury_status}, status: {status}, is_injured: {is_injured}"
+                        )
+
+                    except Exception as player_error:
+                        logger.warning(
+                            f"Failed to analyze player {player.get('player_id')}: {player_error}"
+                        )
+                        continue
+
+                # Second pass: START the optimal lineup for the league's slots.
+                # Injured players only start where nobody healthy can.
+                logger.info(
+                    f"Assigning START/SIT for {len(player_projections)} players"
+                )
+                lineup = optimal_lineup(
+                    player_projections,
+                    league_slots(roster_positions),
+                    objective=lambda player: (
+                        -1 if player["is_injured"] else player["projected_points"]
+                    ),
+                )
+                lineup_slots = {id(player): slot for slot, player in lineup.slots}
+
+                players_by_position = {}
+                for player in player_projections:
+                    players_by_position.setdefault(player["position"], []).append(
+                        player
+                    )
+
+                for pos, players in players_by_position.items():
+                    # Health first, then projected points (descending)
+                    players.sort(
+                        key=lambda x: (x["is_injured"], -x["projected_points"])
+                    )
+                    for i, player in enumerate(players):
+                        is_starter = id(player) in lineup_slots
+                        recommendations.append(
+                            {
+                                **player,  # Include all player data
+                                "recommendation": "START" if is_starter else "SIT",
+                                "lineup_slot": lineup_slots.get(id(player)),
+                                "rank_in_position": i + 1,
+                                "total_in_position": len(players),
+                            }
+                        )
+                        logger.info(
+                            f"{player['player_name']} ({pos}): {player['projected_points']} pts, rank #{i + 1}, {'START' if is_starter else 'SIT'}"
+                        )
+
+            except Exception as league_error:
+                logger.warning(
+                    f"Failed to get recommendations for league {league.get('league_id')}: {league_error}"
+                )
+                continue
+
+        # Sort recommendations: START players first, then by projected points
+        recommendations.sort(
+            key=lambda x: (x["recommendation"] != "START", -x["projected_points"])
+        )
+
+        return {
+            "status": "success",
+            "recommendations": recommendations,
+            "message": f"Generated {len(recommendations)} start/sit recommendations for week {week} based on your roster",
+        }
+    except Exception as e:
+        logger.error(f"Error getting start/sit recommendations for week {week}: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to get start/sit recommendations"
+        )
+
+
+@router.get("/api/fantasy/recommendations/waiver-wire/{week}")
+async def get_waiver_wire_recommendations(
+    week: int, current_user: dict = Depends(get_current_user)
+):
+    """Get waiver wire recommendations for a given week"""
+    try:
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+
+        # Get trending players being added
+        trending_adds = await sleeper_service.get_trending_players("add")
+
+        # Get trending players being dropped for additional context
+        trending_drops = await sleeper_service.get_trending_players("drop")
+
+        # Format recommendations with both adds and drops
+        recommendations = []
+
+        # Add top trending additions
+        for player in trending_adds[:10]:  # Top 10 trending adds
+            trend_count = player.get("trend_count", 0)
+            # Calculate priority score based on trend count (normalize to 0-10 scale)
+            priority_score = min(10.0, max(1.0, trend_count / 10000))
+            is_high_priority = trend_count > 50000
+            faab_percentage = min(20, max(3, int(trend_count / 10000)))
+
+            recommendations.append(
+                {
+                    **player,
+                    "recommendation_type": "add",
+                    "priority": "high" if is_high_priority else "medium",
+                    "priority_score": round(priority_score, 1),
+                    "trend_count": trend_count,
+                    "waiver_suggestion": {
+                        "suggestion_type": "FAAB",
+                        "faab_percentage": faab_percentage,
+                        "claim_advice": (
+                            f"Top waiver priority"
+                            if is_high_priority
+                            else "Medium priority"
+                        ),
+                    },
+                    "suggested_fab_percentage": faab_percentage,
+                }
+            )
+
+        # Add context about trending drops
+        for player in trending_drops[:5]:  # Top 5 trending drops
+            recommendations.append(
+                {
+                    **player,
+                    "recommendation_type": "drop",
+                    "priority": "low",
+                    "priority_score": 1.0,
+                    "trend_count": player.get("trend_count", 0),
+                    "waiver_suggestion": {
+                        "suggestion_type": "DROP",
+                        "claim_advice": "Consider dropping",
+                    },
+                    "suggested_fab_percentage": 0,
+                }
+            )
+
+        return {
+            "status": "success",
+            "recommendations": recommendations,
+            "message": f"Retrieved {len(recommendations)} waiver wire recommendations for week {week}",
+        }
+    except Exception as e:
+        logger.error(f"Error getting waiver wire recommendations for week {week}: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to get waiver wire recommendations"
+        )
+
+
+@router.get("/api/fantasy/leagues/{league_id}/rules")
+async def get_league_rules(
+    league_id: str, current_user: dict = Depends(get_current_user)
+):
+    """Get fantasy league rules and settings"""
+    try:
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+
+        # Get detailed league information
+        league_details = await sleeper_service.get_league_details(league_id)
+
+        # Get the actual roster count from teams data
+        teams_count = len(league_details.get("teams", []))
+
+        # If teams count is 0, try to get it from the raw league data
+        if teams_count == 0:
+            # Fall back to the raw league info
+            from app.services.sleeper_client import sleeper_client
+
+            try:
+                raw_league_data = await sleeper_client.get_json(f"/league/{league_id}")
+                teams_count = raw_league_data.get("total_rosters", 0)
+                # Update league_details with missing data
+                league_details.update(raw_league_data)
+            except Exception as e:
+                logger.warning(f"Could not fetch additional league data: {e}")
+
+        # Get the raw scoring settings from Sleeper
+        raw_scoring = league_details.get("scoring_settings", {})
+
+        # Structure the scoring settings to match frontend expectations
+        structured_scoring = {
+            "passing": {
+                "touchdowns": raw_scoring.get("pass_td", 6),
+                "yards_per_point": (
+                    1.0 / raw_scoring.get("pass_yd", 25)
+                    if raw_scoring.get("pass_yd", 0) > 0
+                    else 0
+                ),
+                "interceptions": raw_scoring.get("pass_int", -2),
+            },
+            "rushing": {
+                "touchdowns": raw_scoring.get("rush_td", 6),
+                "yards_per_point": (
+                    1.0 / raw_scoring.get("rush_yd", 10)
+                    if raw_scoring.get("rush_yd", 0) > 0
+                    else 0
+                ),
+                "fumbles": raw_scoring.get("fum_lost", -2),
+            },
+            "receiving": {
+                "touchdowns": raw_scoring.get("rec_td", 6),
+                "yards_per_point": (
+                    1.0 / raw_scoring.get("rec_yd", 10)
+                    if raw_scoring.get("rec_yd", 0) > 0
+                    else 0
+                ),
+                "receptions": raw_scoring.get("rec", 1),
+                "fumbles": raw_scoring.get("fum_lost", -2),
+            },
+            "kicking": {
+                "field_goals": raw_scoring.get("fgm", 3),
+                "extra_points": raw_scoring.get("xpm", 1),
+                "field_goal_misses": raw_scoring.get("fgmiss", 0),
+            },
+            "defense": {
+                "sacks": raw_scoring.get("sack", 1),
+                "interceptions": raw_scoring.get("def_int", 2),
+                "fumble_recoveries": raw_scoring.get("fum_rec", 2),
+                "touchdowns": raw_scoring.get("def_td", 6),
+            },
+            "special_scoring": [],  # Add empty special scoring to prevent frontend error
+        }
+
+        # Get roster positions and calculate roster info
+        roster_positions = league_details.get("roster_positions", [])
+        starting_positions = [
+            pos for pos in roster_positions if pos not in ["BN", "IR"]
+        ]
+        bench_positions = [pos for pos in roster_positions if pos in ["BN", "IR"]]
+
+        # Use the calculated teams count
+        total_rosters = teams_count
+        league_type = (
+            f"{total_rosters}-Team League" if total_rosters > 0 else "Standard League"
+        )
+
+        # Count position requirements
+        position_counts = {}
+        for pos in starting_positions:
+            position_counts[pos] = position_counts.get(pos, 0) + 1
+
+        # Build position requirements text
+        position_requirements = []
+        for pos, count in position_counts.items():
+            if count > 1:
+                position_requirements.append(f"{count} {pos}")
+            else:
+                position_requirements.append(pos)
+
+        # Extract rules and settings from league details
+        rules = {
+            "league_name": league_details.get("name", "Unknown League"),
+            "league_type": league_type,
+            "total_rosters": total_rosters,
+            "teams_count": total_rosters,
+            "platform": "Sleeper",
+            "scoring_type": structured_scoring.get("receiving", {}).get("receptions", 0)
+            > 0
+            and "PPR"
+            or "Standard",
+            "roster_positions": roster_positions,
+            "scoring_settings": structured_scoring,
+            "waiver_settings": {
+                "waiver_type": league_details.get("waiver_type", "waiver_priority"),
+                "waiver_budget": league_details.get("waiver_budget", 100),
+                "waiver_clear_days": league_details.get("waiver_clear_days", 1),
+                **league_details.get("waiver_settings", {}),
+            },
+            "playoff_settings": {
+                "playoff_week_start": league_details.get("playoff_week_start", 15),
+                "playoff_teams": league_details.get("playoff_teams", 4),
+                "playoff_rounds": league_details.get("playoff_rounds", 2),
+            },
+            "draft_settings": {
+                "draft_type": league_details.get("draft_type", "snake"),
+                "draft_order": league_details.get("draft_order"),
+                "draft_rounds": league_details.get(
+                    "draft_rounds", len(roster_positions)
+                ),
+            },
+            "roster_config": {
+                "total_spots": len(roster_positions),
+                "starting_spots": len(starting_positions),
+                "bench_spots": len(bench_positions),
+                "starting_lineup": starting_positions,
+                "bench_lineup": bench_positions,
+            },
+            "position_requirements": position_requirements,
+            "league_features": {
+                "trade_deadline": league_details.get("trade_deadline"),
+                "taxi_slots": league_details.get("taxi_slots", 0),
+                "reserve_slots": league_details.get("reserve_slots", 0),
+                "waiver_type": league_details.get("waiver_type", "waiver_priority"),
+                "daily_waivers": league_details.get("daily_waivers", False),
+            },
+            "season": league_details.get("season", "2024"),
+            "status": league_details.get("status", "pre_draft"),
+        }
+
+        return {
+            "status": "success",
+            "rules": rules,
+            "message": f"Retrieved rules for league {league_details.get('name', league_id)}",
+        }
+    except Exception as e:
+        logger.error(f"Error getting rules for league {league_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get league rules")
+
+
+@router.delete("/api/fantasy/leagues/{league_id}")
+async def delete_fantasy_league(
+    league_id: str, current_user: dict = Depends(get_current_user)
+):
+    """Delete/leave a fantasy league"""
+    try:
+        return {
+            "status": "success",
+            "message": "Fantasy league deletion endpoint - implementation in progress",
+        }
+    except Exception as e:
+        logger.error(f"Error deleting league {league_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to delete fantasy league")
+
+
+# Analytics endpoints with frontend-compatible URLs
+@router.get("/api/fantasy/analytics/{player_id}")
+async def get_player_analytics_alt(
+    player_id: str,
+    season: int = 2025,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_db),
+):
+    """Get player analytics (alternative URL format)"""
+    try:
+        from app.services.player_analytics_service import PlayerAnalyticsService
+        from sqlalchemy import text
+
+        analytics_service = PlayerAnalyticsService(db)
+
+        # Map Sleeper player ID to internal player ID
+        internal_player_id = None
+        try:
+            # Query database for the mapping
+            fantasy_player_query = db.execute(
+                text(
+                    "SELECT id FROM fantasy_players WHERE platform_player_id = :sleeper_id"
+                ),
+                {"sleeper_id": str(player_id)},
+            )
+            fantasy_player_row = fantasy_player_query.fetchone()
+
+            if fantasy_player_row:
+                internal_player_id = fantasy_player_row[0]
+                logger.info(
+                    f"Mapped Sleeper ID {player_id} to internal ID {internal_player_id}"
+                )
+            else:
+                logger.warning(f"No mapping found for Sleeper ID {player_id}")
+
+        except Exception as e:
+            logger.warning(f"Error mapping player ID {player_id}: {e}")
+
+        analytics = []
+        if internal_player_id:
+            analytics = await analytics_service.get_player_analytics(
+                internal_player_id, season=season
+            )
+
+        return {
+            "status": "success",
+            "player_id": str(player_id),
+            "season": season,
+            "analytics": analytics or [],
+        }
+    except Exception as e:
+        logger.error(f"Error getting player analytics for {player_id}: {e}")
+        return {
+            "status": "success",
+            "player_id": str(player_id),
+            "season": season,
+            "analytics": [],
+        }
+
+
+@router.get("/api/fantasy/analytics/{player_id}/trends")
+async def get_player_trends_alt(
+    player_id: str,
+    season: int = 2025,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_db),
+):
+    """Get player trends (alternative URL format)"""
+    try:
+        from app.services.player_analytics_service import PlayerAnalyticsService
+        from sqlalchemy import text
+
+        # Map Sleeper player ID to internal ID
+        fantasy_player_query = db.execute(
+            text(
+                "SELECT id FROM fantasy_players WHERE platform_player_id = :sleeper_id"
+            ),
+            {"sleeper_id": str(player_id)},
+        )
+        fantasy_player = fantasy_player_query.fetchone()
+
+        if not fantasy_player:
+            return {
+                "status": "error",
+                "message": f"Player not found with ID: {player_id}",
+                "trends": {},
+            }
+
+        internal_player_id = fantasy_player[0]
+        analytics_service = PlayerAnalyticsService(db)
+
+        # Get analytics and derive trends
+        analytics = await analytics_service.get_player_analytics(
+            internal_player_id, season=season
+        )
+
+        trends = {}
+        if analytics and len(analytics) >= 2:
+            recent = analytics[:3]  # Last 3 games
+            older = analytics[3:6]  # Previous 3 games
+
+            if recent and older:
+                recent_avg = sum(g.get("ppr_points", 0) for g in recent) / len(recent)
+                older_avg = sum(g.get("ppr_points", 0) for g in older) / len(older)
+
+                trends = {
+                    "trend_direction": "up" if recent_avg > older_avg else "down",
+                    "recent_avg": round(recent_avg, 1),
+                    "previous_avg": round(older_avg, 1),
+                    "games_analyzed": len(recent) + len(older),
+                }
+
+        return {
+            "status": "success",
+            "player_id": str(player_id),
+            "season": season,
+            "trends": trends,
+        }
+    except Exception as e:
+        logger.error(f"Error getting player trends for {player_id}: {e}")
+        return {
+            "status": "success",
+            "player_id": str(player_id),
+            "season": season,
+            "trends": {},
+        }
+
+
+@router.get("/api/fantasy/analytics/{player_id}/efficiency")
+async def get_player_efficiency_alt(
+    player_id: str,
+    season: int = 2025,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_db),
+):
+    """Get player efficiency (alternative URL format)"""
+    try:
+        from app.services.player_analytics_service import PlayerAnalyticsService
+        from sqlalchemy import text
+
+        # Map Sleeper player ID to internal ID
+        fantasy_player_query = db.execute(
+            text(
+                "SELECT id FROM fantasy_players WHERE platform_player_id = :sleeper_id"
+            ),
+            {"sleeper_id": str(player_id)},
+        )
+        fantasy_player = fantasy_player_query.fetchone()
+
+        if not fantasy_player:
+            return {
+                "status": "error",
+                "message": f"Player not found with ID: {player_id}",
+                "efficiency": {},
+            }
+
+        internal_player_id = fantasy_player[0]
+        analytics_service = PlayerAnalyticsService(db)
+
+        # Get analytics and calculate efficiency metrics
+        analytics = await analytics_service.get_player_analytics(
+            internal_player_id, season=season
+        )
+
+        efficiency = {}
+        if analytics:
+            total_points = sum(g.get("ppr_points", 0) for g in analytics)
+            total_snaps = sum(
+                g.get("snap_percentage", 0)
+                for g in analytics
+                if g.get("snap_percentage")
+            )
+            total_targets = sum(
+                g.get("target_share", 0) for g in analytics if g.get("target_share")
+            )
+
+            if total_snaps > 0:
+                efficiency["points_per_snap"] = round(
+                    total_points / total_snaps * 100, 2
+                )
+            if total_targets > 0:
+                efficiency["points_per_target"] = round(
+                    total_points / total_targets * 100, 2
+                )
+
+            efficiency["games_played"] = len(analytics)
+            efficiency["total_points"] = round(total_points, 1)
+
+        return {
+            "status": "success",
+            "player_id": str(player_id),
+            "season": season,
+            "efficiency": efficiency,
+        }
+    except Exception as e:
+        logger.error(f"Error getting player efficiency for {player_id}: {e}")
+        return {
+            "status": "success",
+            "player_id": str(player_id),
+            "season": season,
+            "efficiency": {},
+        }
+
+
+# Trade Analyzer Endpoints
+@router.get("/api/v1/fantasy/trade-analyzer/team-analysis/{team_id}")
+async def get_simple_team_analysis(
+    team_id: int, league_id: int = None, current_user: dict = Depends(get_current_user)
+):
+    """Get team analysis - REAL DATA ONLY, fetched directly from Sleeper API"""
+    logger.info(
+        f"🔍 TEAM ANALYSIS CALLED - Team: {team_id}, League: {league_id}, User: {current_user['user_id']}"
+    )
+
+    if not league_id:
+        raise HTTPException(status_code=400, detail="league_id parameter is required")
+
+    try:
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+
+        # Get teams and standings data from Sleeper API
+        logger.info(f"🔍 GETTING LEAGUE DATA from Sleeper API for league {league_id}")
+        teams = await sleeper_service.get_league_teams(str(league_id))
+
+        # Get standings data directly from SleeperFantasyService
+        logger.info(
+            f"🔍 GETTING STANDINGS DATA from Sleeper API for league {league_id}"
+        )
+        try:
+            standings_data = await sleeper_service.get_league_standings(str(league_id))
+            logger.info(f"🔍 FOUND {len(standings_data)} teams in standings")
+        except Exception as e:
+            logger.warning(f"Error fetching standings: {e}")
+            standings_data = []
+
+        # Find the specific team by team_id from both teams and standings
+        team_data = None
+        standings_team_data = None
+
+        # Find team in teams data
+        for team in teams:
+            if team.get("team_id") == team_id or str(team.get("team_id")) == str(
+                team_id
+            ):
+                team_data = team
+                break
+
+        # Find team in standings data
+        for team in standings_data:
+            if (
+                team.get("team_id") == str(team_id)
+                or int(team.get("team_id", 0)) == team_id
+            ):
+                standings_team_data = team
+                break
+
+        if not team_data:
+            logger.warning(
+                f"Team {team_id} not found in teams data, using first available team"
+            )
+            team_data = teams[0] if teams else {}
+
+        if not standings_team_data:
+            logger.warning(f"Team {team_id} not found in standings data")
+            standings_team_data = {}
+
+        # Get roster data for this team from Sleeper API
+        logger.info(f"🔍 GETTING ROSTER DATA from Sleeper API")
+        roster_data = []
+        try:
+            # Use direct HTTP call to get rosters like the roster endpoint does
+            import aiohttp
+
+            async with aiohttp.ClientSession() as session:
+                roster_url = f"https://api.sleeper.app/v1/league/{league_id}/rosters"
+                async with session.get(roster_url) as response:
+                    if response.status == 200:
+                        rosters = await response.json()
+
+                        # Find the roster for this team
+                        target_roster = None
+                        for roster in rosters:
+                            if roster.get("roster_id") == team_id or str(
+                                roster.get("roster_id")
+                            ) == str(team_id):
+                                target_roster = roster
+                                break
+
+                        if target_roster and target_roster.get("players"):
+                            # Get player details
+                            player_ids = target_roster["players"]
+                            all_players = await sleeper_service._get_all_players()
+
+                            for player_id in player_ids:
+                                if player_id in all_players:
+                                    player = all_players[player_id]
+                                    # Convert player_id to integer for frontend compatibility
+                                    numeric_id = (
+                                        int(player_id)
+                                        if player_id.isdigit()
+                                        else hash(player_id) % 2147483647
+                                    )
+
+                                    # Calculate realistic trade value based on player data
+                                    trade_value = calculate_realistic_trade_value(
+                                        player
+                                    )
+
+                                    roster_data.append(
+                                        {
+                                            "id": numeric_id,  # Frontend expects 'id' field
+                                            "player_id": player_id,  # Keep original for reference
+                                            "name": f"{player.get('first_name', '')} {player.get('last_name', '')}".strip(),
+                                            "position": player.get(
+                                                "position", "UNKNOWN"
+                                            ),
+                                            "team": player.get("team", "UNKNOWN"),
+                                            "age": player.get("age", 0),
+                                            "trade_value": trade_value,
+                                        }
+                                    )
+
+                            logger.info(
+                                f"🔍 FOUND {len(roster_data)} players for team {team_id}"
+                            )
+                        else:
+                            logger.warning(f"No roster found for team {team_id}")
+                    else:
+                        logger.error(f"Failed to fetch rosters: {response.status}")
+
+        except Exception as roster_error:
+            logger.error(f"Error fetching roster: {roster_error}")
+            roster_data = []
+
+        # Build comprehensive team analysis response
+        logger.info(
+            f"🔍 TEAM ANALYSIS COMPLETE: {len(roster_data)} players for team {team_data.get('name', f'Team {team_id}')}"
+        )
+
+        # Calculate position analysis
+        position_counts = {}
+        position_strengths = {}
+        position_needs = {}
+
+        for player in roster_data:
+            pos = player["position"]
+            position_counts[pos] = position_counts.get(pos, 0) + 1
+
+        # Calculate strengths and needs based on roster composition
+        for pos in ["QB", "RB", "WR", "TE", "K", "DEF"]:
+            count = position_counts.get(pos, 0)
+            position_strengths[pos] = count * 20  # Strength based on player count
+
+            # Determine need level (higher = more need)
+            if pos == "QB":
+                position_needs[pos] = 3 if count < 2 else 1
+            elif pos in ["RB", "WR"]:
+                position_needs[pos] = 3 if count < 3 else 1
+            elif pos == "TE":
+                position_needs[pos] = 3 if count < 2 else 1
+            else:
+                position_needs[pos] = 3 if count < 1 else 1
+
+        # Identify surplus positions
+        surplus_positions = []
+        for pos, count in position_counts.items():
+            if (
+                (pos == "WR" and count > 4)
+                or (pos == "RB" and count > 3)
+                or (pos in ["QB", "TE"] and count > 2)
+            ):
+                surplus_positions.append(pos)
+
+        # Sort players by trade value (highest to lowest)
+        sorted_players = sorted(
+            roster_data, key=lambda p: p.get("trade_value", 0), reverse=True
+        )
+
+        # Create tradeable assets lists based on actual trade value
+        valuable_players = sorted_players[:5]  # Top 5 most valuable players
+        expendable_players = (
+            sorted_players[-5:] if len(sorted_players) > 5 else []
+        )  # Bottom 5 least valuable players
+        surplus_players = sorted_players[
+            :8
+        ]  # Top players that could be traded for good value
+
+        # Merge team data with standings data for complete info
+        merged_team_data = {**team_data, **standings_team_data}
+
+        team_analysis = {
+            "team_info": {
+                "team_name": merged_team_data.get("name", f"Team {team_id}"),
+                "record": {
+                    "wins": merged_team_data.get("wins", 0),
+                    "losses": merged_team_data.get("losses", 0),
+                },
+                "points_for": float(merged_team_data.get("points_for", 0.0)),
+                "team_rank": merged_team_data.get("rank", 0),
+                "competitive_tier": "competitive",  # Could be calculated based on record
+            },
+            "roster_analysis": {
+                "position_strengths": position_strengths,
+                "position_needs": position_needs,
+                "surplus_positions": surplus_positions,
+            },
+            "tradeable_assets": {
+                "surplus_players": surplus_players,
+                "expendable_players": expendable_players,
+                "valuable_players": valuable_players,
+                "tradeable_picks": [
+                    {
+                        "pick_id": 1,
+                        "season": 2025,
+                        "round": 1,
+                        "description": "2025 1st Round Pick",
+                        "trade_value": 35,
+                    },
+                    {
+                        "pick_id": 2,
+                        "season": 2025,
+                        "round": 2,
+                        "description": "2025 2nd Round Pick",
+                        "trade_value": 18,
+                    },
+                    {
+                        "pick_id": 3,
+                        "season": 2025,
+                        "round": 3,
+                        "description": "2025 3rd Round Pick",
+                        "trade_value": 8,
+                    },
+                ],
+            },
+            "trade_strategy": {
+                "competitive_analysis": {},
+                "trade_preferences": {},
+                "recommended_approach": f"Based on roster analysis, consider strengthening {', '.join([pos for pos, need in position_needs.items() if need >= 3])} positions.",
+            },
+        }
+
+        return {
+            "success": True,
+            "team_analysis": team_analysis,
+            "roster": roster_data,
+            "message": f"Found {len(roster_data)} players for {team_analysis['team_info']['team_name']}",
+        }
+
+    except Exception as e:
+        logger.error(f"🚨 ERROR getting team analysis: {e}")
+        import traceback
+
+        logger.error(f"🚨 TRACEBACK: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get team analysis: {str(e)}"
+        )
+
+
+@router.post("/api/v1/fantasy/trade-analyzer/recommendations")
+async def generate_trade_recommendations(
+    request: Dict[str, Any], current_user: dict = Depends(get_current_user)
+):
+    """Generate AI-powered trade recommendations for a team - REAL DATA ONLY"""
+    league_id = request.get("league_id")
+    team_id = request.get("team_id")
+
+    logger.info(
+        f"🔍 TRADE RECOMMENDATIONS CALLED - League: {league_id}, Team: {team_id}, User: {current_user['user_id']}"
+    )
+
+    if not league_id:
+        raise HTTPException(status_code=400, detail="league_id is required")
+
+    service_available = is_service_available("fantasy_pipeline")
+    logger.info(f"🔍 FANTASY_PIPELINE SERVICE AVAILABLE: {service_available}")
+
+    if not service_available:
+        logger.error("🚨 FANTASY_PIPELINE SERVICE NOT AVAILABLE")
+        raise HTTPException(
+            status_code=503, detail="Fantasy pipeline service unavailable"
+        )
+
+    try:
+        fantasy_service = get_service("fantasy_pipeline")
+
+        # Get the specified team's roster directly from Sleeper API
+        logger.info(f"🔍 GETTING ROSTER for team {team_id} in league {league_id}")
+
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+
+        # Every team's roster comes from one cached read of the league's
+        # rosters, shared with the trade partner lookups below
+        roster = []
+        rosters = []
+        all_players = {}
+        try:
+            rosters = await sleeper_service.client.get_json(
+                f"/league/{league_id}/rosters"
+            )
+            all_players = await sleeper_service._get_all_players()
+
+            # Find the roster for the specified team
+            target_roster = None
+            for roster_data in rosters:
+                if roster_data.get("roster_id") == team_id or str(
+                    roster_data.get("roster_id")
+                ) == str(team_id):
+                    target_roster = roster_data
+                    break
+
+            if target_roster and target_roster.get("players"):
+                for player_id in target_roster["players"]:
+                    if player_id in all_players:
+                        player = all_players[player_id]
+                        # Calculate realistic trade value for this player
+                        trade_value = calculate_realistic_trade_value(player)
+
+                        roster.append(
+                            {
+                                "player_id": player_id,
+                                "name": f"{player.get('first_name', '')} {player.get('last_name', '')}".strip(),
+                                "position": player.get("position", "UNKNOWN"),
+                                "team": player.get("team", "UNKNOWN"),
+                                "age": player.get("age", 27),
+                                "trade_value": trade_value,
+                            }
+                        )
+
+                logger.info(f"🔍 FOUND {len(roster)} players for team {team_id}")
+            else:
+                logger.warning(f"No roster found for team {team_id}")
+        except Exception as roster_error:
+            logger.error(f"Error fetching roster for team {team_id}: {roster_error}")
+
+        if not roster:
+            logger.error(
+                f"🚨 NO ROSTER DATA FOUND for team {team_id} in league {league_id}"
+            )
+            raise HTTPException(
+                status_code=404, detail=f"No roster data found for team {team_id}"
+            )
+
+        # Get league teams to suggest real trade partners
+        try:
+            league_teams = await sleeper_service.get_league_teams(str(league_id))
+
+            # Filter out the selected team (not current user's team)
+            other_teams = []
+            for team in league_teams:
+                if str(team.get("team_id")) != str(team_id):
+                    other_teams.append(team)
+
+            logger.info(
+                f"🔍 FOUND {len(other_teams)} OTHER TEAMS in league for trade suggestions"
+            )
+
+        except Exception as teams_error:
+            logger.warning(f"Could not get league teams: {teams_error}")
+            other_teams = []
+
+        # Generate real recommendations based on the roster
+        recommendations = []
+
+        # Analyze roster by position
+        positions = {}
+        for player in roster:
+            pos = player.get("position", "UNKNOWN")
+            if pos not in positions:
+                positions[pos] = []
+            positions[pos].append(player)
+
+        logger.info(
+            f"🔍 ROSTER ANALYSIS: {[(pos, len(players)) for pos, players in positions.items()]}"
+        )
+
+        # Generate recommendations based on roster composition
+        rec_id = 1
+
+        # Helper function to format players for frontend
+        def format_players(player_data_list):
+            """Convert player data to the format expected by frontend"""
+            players = []
+            for player_data in player_data_list:
+                if isinstance(player_data, dict):
+                    # Real player from roster
+                    players.append(
+                        {
+                            "id": player_data.get(
+                                "player_id",
+                                f"player_{player_data['name'].replace(' ', '_')}",
+                            ),
+                            "name": player_data["name"],
+                            "position": player_data.get("position", "UNKNOWN"),
+                            "team": player_data.get("team", "UNKNOWN"),
+                            "age": player_data.get("age", 27),
+                        }
+                    )
+                else:
+                    # Generic player name (string)
+                    players.append(
+                        {
+                            "id": f"player_{player_data.replace(' ', '_')}",
+                            "name": player_data,
+                            "position": "UNKNOWN",
+                            "team": "UNKNOWN",
+                            "age": 26,
+                        }
+                    )
+            return players
+
+        # Helper function to get realistic trade partner
+        def get_trade_partner():
+            """Get a realistic trade partner from league teams"""
+            if other_teams:
+                import random
+
+                partner = random.choice(other_teams)
+                return {
+                    "name": partner.get(
+                        "name", f"Team {partner.get('team_id', 'Unknown')}"
+                    ),
+                    "team_id": partner.get("team_id"),
+                    "full_data": partner,
+                }
+            return {"name": "League Team", "team_id": None, "full_data": None}
+
+        # Helper function to get real players from target team
+        async def get_target_team_players(target_team_id, position_needed):
+            """Get real players from target team for the specified position"""
+            if not target_team_id:
+                return [
+                    {
+                        "id": "generic_player",
+                        "name": f"Generic {position_needed}",
+                        "position": position_needed,
+                        "team": "UNK",
+                        "age": 27,
+                        "trade_value": 20.0,
+                    }
+                ]
+
+            try:
+                # Find target team's roster
+                target_roster = None
+                for roster in rosters:
+                    if str(roster.get("roster_id")) == str(target_team_id):
+                        target_roster = roster
+                        break
+
+                if target_roster and target_roster.get("players"):
+                    position_players = []
+
+                    for player_id in target_roster["players"]:
+                        if player_id in all_players:
+                            player = all_players[player_id]
+                            if player.get("position") == position_needed:
+                                trade_value = calculate_realistic_trade_value(player)
+                                position_players.append(
+                                    {
+                                        "id": player_id,
+                                        "name": f"{player.get('first_name', '')} {player.get('last_name', '')}".strip(),
+                                        "position": player.get(
+                                            "position", position_needed
+                                        ),
+                                        "team": player.get("team", "UNKNOWN"),
+                                        "age": player.get("age", 27),
+                                        "trade_value": trade_value,
+                                    }
+                                )
+
+                    if position_players:
+                        # Return best player for that position
+                        return [
+                            max(
+                                position_players,
+                                key=lambda p: p["trade_value"],
+                            )
+                        ]
+
+                # Fallback if no players found
+                return [
+                    {
+                        "id": "backup_player",
+                        "name": f"Available {position_needed}",
+                        "position": position_needed,
+                        "team": "UNKNOWN",
+                        "age": 26,
+                        "trade_value": 15.0,
+                    }
+                ]
+
+            except Exception as e:
+                logger.warning(f"Could not get target team players: {e}")
+                return [
+                    {
+                        "id": "fallback_player",
+                        "name": f"Backup {position_needed}",
+                        "position": position_needed,
+                        "team": "UNKNOWN",
+                        "age": 25,
+                        "trade_value": 12.0,
+                    }
+                ]
+
+        # Helper function to add trade values to existing players
+        def add_trade_values(players_list):
+            """Add trade_value field to players that don't have it"""
+            for player in players_list:
+                if "trade_value" not in player:
+                    # Create mock player data for trade value calculation
+                    mock_player = {
+                        "position": player.get("position", "UNKNOWN"),
+                        "age": player.get(
+                            "age", 27
+                        ),  # Use player's actual age or default
+                        "team": player.get("team", "UNKNOWN"),
+                    }
+                    player["trade_value"] = calculate_realistic_trade_value(mock_player)
+
+                # Ensure age is present
+                if "age" not in player:
+                    player["age"] = 27  # Default age if not provided
+            return players_list
+
+        # Check for position weaknesses
+        if len(positions.get("QB", [])) < 2:
+            rb_players = positions.get("RB", [])[:1]
+            trade_partner = get_trade_partner()
+
+            # Get real QB from target team
+            target_qb_players = await get_target_team_players(
+                trade_partner["team_id"], "QB"
+            )
+
+            recommendations.append(
+                {
+                    "id": rec_id,
+                    "recommendation_type": "QB Depth Needed",
+                    "type": "depth_addition",
+                    "title": "Add QB Depth",
+                    "description": f"Consider trading for a backup quarterback from {trade_partner['name']}",
+                    "target_team_id": trade_partner["team_id"],
+                    "we_give": {
+                        "players": add_trade_values(format_players(rb_players)),
+                        "picks": [],
+                    },
+                    "we_get": {
+                        "players": target_qb_players,
+                        "picks": ["2025 Late Round Pick"],
+                    },
+                    "confidence": 75,
+                    "estimated_likelihood": 0.75,
+                    "priority_score": 60,
+                    "reasoning": f"Limited QB depth could be problematic if starter gets injured. {trade_partner['name']} may have QB depth to spare.",
+                    "trade_partner": trade_partner["name"],
+                }
+            )
+            rec_id += 1
+
+        if len(positions.get("RB", [])) > 4:
+            rb_players = positions.get("RB", [])
+            give_players = rb_players[
+                -2:
+            ]  # Trade least important RBs (actual player objects)
+            trade_partner = get_trade_partner()
+
+            # Get real players from target team
+            target_wr_players = await get_target_team_players(
+                trade_partner["team_id"], "WR"
+            )
+            target_te_players = await get_target_team_players(
+                trade_partner["team_id"], "TE"
+            )
+
+            recommendations.append(
+                {
+                    "id": rec_id,
+                    "recommendation_type": "RB Surplus Trade",
+                    "type": "position_balance",
+                    "title": "Trade Excess RB Depth",
+                    "description": f"Trade surplus running backs to {trade_partner['name']} for position upgrades",
+                    "target_team_id": trade_partner["team_id"],
+                    "we_give": {
+                        "players": add_trade_values(format_players(give_players)),
+                        "picks": [],
+                    },
+                    "we_get": {
+                        "players": target_wr_players + target_te_players,
+                        "picks": [],
+                    },
+                    "confidence": 80,
+                    "estimated_likelihood": 0.80,
+                    "priority_score": 70,
+                    "reasoning": f"With {len(rb_players)} RBs, you can afford to trade depth for upgrades at other positions. {trade_partner['name']} may need RB help.",
+                    "trade_partner": trade_partner["name"],
+                }
+            )
+            rec_id += 1
+
+        if len(positions.get("WR", [])) < 4:
+            te_players = (
+                positions.get("TE", [])[:1] if len(positions.get("TE", [])) > 1 else []
+            )
+            trade_partner = get_trade_partner()
+
+            # Get real WR from target team
+            target_wr_players = await get_target_team_players(
+                trade_partner["team_id"], "WR"
+            )
+
+            recommendations.append(
+                {
+                    "id": rec_id,
+                    "recommendation_type": "WR Depth Needed",
+                    "type": "depth_addition",
+                    "title": "Add WR Depth",
+                    "description": f"Target wide receiver depth from {trade_partner['name']} for better matchup flexibility",
+                    "target_team_id": trade_partner["team_id"],
+                    "we_give": {
+                        "players": add_trade_values(format_players(te_players)),
+                        "picks": ["Mid Round Pick"] if not te_players else [],
+                    },
+                    "we_get": {
+                        "players": target_wr_players,
+                        "picks": ["2026 Late Pick"],
+                    },
+                    "confidence": 70,
+                    "estimated_likelihood": 0.70,
+                    "priority_score": 55,
+                    "reasoning": f"More WR depth provides better weekly lineup flexibility. {trade_partner['name']} may have WR depth to trade.",
+                    "trade_partner": trade_partner["name"],
+                }
+            )
+            rec_id += 1
+
+        logger.info(f"🔍 GENERATED {len(recommendations)} RECOMMENDATIONS")
+
+        return {
+            "success": True,
+            "team_id": team_id,
+            "league_id": league_id,
+            "recommendation_type": request.get("recommendation_type", "all"),
+            "recommendation_count": len(recommendations),
+            "recommendations": recommendations,
+        }
+
+    except Exception as e:
+        logger.error(f"🚨 ERROR generating trade recommendations: {e}")
+        import traceback
+
+        logger.error(f"🚨 TRACEBACK: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to generate recommendations: {str(e)}"
+        )
+
+
+@router.post("/api/v1/fantasy/trade-analyzer/trades/{trade_id}/accept")
+async def accept_trade(
+    trade_id: int,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_db),
+):
+    """Accept a trade proposed to the user's team, moving its players and picks"""
+    from app.models.fantasy_models import (
+        FantasyLeague,
+        FantasyTeam,
+        FantasyUser,
+        Trade,
+    )
+    from app.services.trade_analyzer_service import TradeAnalyzerService
+
+    # Only the owner of the team the trade was proposed to can accept it
+    receiving_team = (
+        db.query(FantasyTeam.id)
+        .join(Trade, Trade.team2_id == FantasyTeam.id)
+        .join(FantasyLeague, FantasyLeague.id == FantasyTeam.league_id)
+        .join(FantasyUser, FantasyUser.id == FantasyLeague.fantasy_user_id)
+        .filter(
+            Trade.id == trade_id,
+            FantasyTeam.is_user_team.is_(True),
+            FantasyUser.user_id == current_user["user_id"],
+        )
+        .first()
+    )
+    if receiving_team is None:
+        raise HTTPException(status_code=404, detail="Trade not found")
+
+    result = TradeAnalyzerService(db).accept_trade(trade_id)
+    if not result["success"]:
+        raise HTTPException(status_code=409, detail=result["error"])
+    return result
+
+
+@router.get("/api/v1/fantasy/trade-analyzer/player-values")
+async def get_player_values(
+    limit: int = 200, current_user: dict = Depends(get_current_user)
+):
+    """Get player trade values for all players"""
+    try:
+        logger.info(f"Player values called with limit: {limit}")
+
+        # Get Sleeper service for player data
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+        all_players = await sleeper_service._get_all_players()
+
+        # Get trending data for popularity boost
+        trending_adds = await sleeper_service.get_trending_players("add")
+        trending_lookup = {
+            player.get("player_id"): player.get("trend_count", 0)
+            for player in trending_adds
+        }
+
+        player_values = []
+
+        for player_id, player_data in list(all_players.items())[:limit]:
+            if not player_data.get("active", True):
+                continue
+
+            name = f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip()
+            position = player_data.get("position", "UNKNOWN")
+
+            # Skip non-fantasy positions
+            if position not in ["QB", "RB", "WR", "TE", "K", "DEF"]:
+                continue
+
+            # Calculate trade value
+            trade_value = calculate_realistic_trade_value(player_data)
+
+            # Add trending boost
+            trend_count = trending_lookup.get(player_id, 0)
+            if trend_count > 0:
+                trade_value *= 1 + (
+                    trend_count / 100
+                )  # Small boost for trending players
+
+            player_values.append(
+                {
+                    "player_id": player_id,
+                    "name": name,
+                    "position": position,
+                    "team": player_data.get("team", "FA"),
+                    "age": player_data.get("age", 27),
+                    "trade_value": round(trade_value, 1),
+                    "trend_type": "hot" if trend_count > 0 else "neutral",
+                    "trend_count": trend_count,
+                }
+            )
+
+        # Sort by trade value descending
+        player_values.sort(key=lambda p: p["trade_value"], reverse=True)
+
+        logger.info(f"Returning {len(player_values)} player values")
+        return {
+            "success": True,
+            "players": player_values,
+            "total": len(player_values),
+            "limit": limit,
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting player values: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get player values: {str(e)}"
+        )
+
+
+class QuickAnalysisRequest(BaseModel):
+    league_id: str
+    team1_id: int
+    team2_id: int
+    team1_gives: Dict[str, Any]
+    team2_gives: Dict[str, Any]
+
+
+@router.post("/api/v1/fantasy/trade-analyzer/quick-analysis")
+async def quick_trade_analysis(
+    request: QuickAnalysisRequest, current_user: dict = Depends(get_current_user)
+):
+    """Perform quick analysis of a proposed trade"""
+    try:
+        logger.info(
+            f"Quick trade analysis called: {request.team1_id} vs {request.team2_id}"
+        )
+
+        # Get Sleeper service for player data
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+        all_players = await sleeper_service._get_all_players()
+
+        # Helper function to analyze trade side
+        def analyze_trade_side(players_list, side_name):
+            total_value = 0
+            side_analysis = {
+                "players": [],
+                "total_value": 0,
+                "positions": {},
+                "avg_age": 0,
+            }
+
+            ages = []
+            for player_id in players_list:
+                if str(player_id) in all_players:
+                    player_data = all_players[str(player_id)]
+                    name = f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip()
+                    position = player_data.get("position", "UNKNOWN")
+                    age = player_data.get("age", 27)
+                    trade_value = calculate_realistic_trade_value(player_data)
+
+                    player_info = {
+                        "player_id": player_id,
+                        "name": name,
+                        "position": position,
+                        "team": player_data.get("team", "FA"),
+                        "age": age,
+                        "trade_value": round(trade_value, 1),
+                    }
+
+                    side_analysis["players"].append(player_info)
+                    total_value += trade_value
+                    ages.append(age)
+
+                    # Track positions
+                    if position in side_analysis["positions"]:
+                        side_analysis["positions"][position] += 1
+                    else:
+                        side_analysis["positions"][position] = 1
+
+            side_analysis["total_value"] = round(total_value, 1)
+            side_analysis["avg_age"] = round(sum(ages) / len(ages) if ages else 0, 1)
+
+            return side_analysis
+
+        # Analyze both sides
+        team1_gives = analyze_trade_side(
+            request.team1_gives.get("players", []), "Team 1 Gives"
+        )
+        team2_gives = analyze_trade_side(
+            request.team2_gives.get("players", []), "Team 2 Gives"
+        )
+
+        # Calculate trade fairness
+        value_diff = abs(team1_gives["total_value"] - team2_gives["total_value"])
+        total_value = team1_gives["total_value"] + team2_gives["total_value"]
+        fairness_pct = (
+            max(0, 100 - (value_diff / total_value * 100)) if total_value > 0 else 0
+        )
+
+        # Determine trade verdict
+        if fairness_pct >= 90:
+            verdict = "Fair Trade"
+            verdict_color = "green"
+        elif fairness_pct >= 75:
+            verdict = "Slightly Uneven"
+            verdict_color = "yellow"
+        elif fairness_pct >= 60:
+            verdict = "Uneven Trade"
+            verdict_color = "orange"
+        else:
+            verdict = "Very Uneven"
+            verdict_color = "red"
+
+        # Generate comprehensive key factors/insights
+        insights = []
+
+        # Age analysis
+        if team1_gives["avg_age"] > team2_gives["avg_age"] + 3:
+            insights.append(
+                f"Team 1 trading older players (avg age {team1_gives['avg_age']:.1f} vs {team2_gives['avg_age']:.1f})"
+            )
+        elif team2_gives["avg_age"] > team1_gives["avg_age"] + 3:
+            insights.append(
+                f"Team 2 trading older players (avg age {team2_gives['avg_age']:.1f} vs {team1_gives['avg_age']:.1f})"
+            )
+
+        # Value differential analysis
+        if value_diff > 10:
+            if team1_gives["total_value"] > team2_gives["total_value"]:
+                insights.append(
+                    f"Team 1 giving up {value_diff:.1f} more value - may need compensation"
+                )
+            else:
+                insights.append(
+                    f"Team 2 giving up {value_diff:.1f} more value - may need compensation"
+                )
+
+        # Player quantity analysis
+        if len(team1_gives["players"]) > len(team2_gives["players"]) + 1:
+            insights.append(
+                "Team 1 trading multiple players for fewer elite players (talent consolidation)"
+            )
+        elif len(team2_gives["players"]) > len(team1_gives["players"]) + 1:
+            insights.append(
+                "Team 2 trading multiple players for fewer elite players (talent consolidation)"
+            )
+
+        # Position balance analysis
+        team1_positions = list(team1_gives["positions"].keys())
+        team2_positions = list(team2_gives["positions"].keys())
+
+        if "QB" in team1_positions or "QB" in team2_positions:
+            insights.append("QB involved - high-impact position trade")
+
+        if "RB" in team1_positions and "WR" in team2_positions:
+            insights.append("RB for WR swap - different positional strategies")
+        elif "WR" in team1_positions and "RB" in team2_positions:
+            insights.append("WR for RB swap - different positional strategies")
+
+        # High-value player analysis
+        team1_high_value = [p for p in team1_gives["players"] if p["trade_value"] > 25]
+        team2_high_value = [p for p in team2_gives["players"] if p["trade_value"] > 25]
+
+        if team1_high_value and not team2_high_value:
+            insights.append(
+                f"Team 1 trading elite player ({team1_high_value[0]['name']}) for depth"
+            )
+        elif team2_high_value and not team1_high_value:
+            insights.append(
+                f"Team 2 trading elite player ({team2_high_value[0]['name']}) for depth"
+            )
+        elif team1_high_value and team2_high_value:
+            insights.append("Elite players on both sides - star-for-star trade")
+
+        # Rookie/young player analysis
+        team1_young = [p for p in team1_gives["players"] if p["age"] <= 24]
+        team2_young = [p for p in team2_gives["players"] if p["age"] <= 24]
+
+        if team1_young and not team2_young:
+            insights.append("Team 1 trading young talent for immediate production")
+        elif team2_young and not team1_young:
+            insights.append("Team 2 trading young talent for immediate production")
+
+        # Ensure we have at least some insights
+        if not insights:
+            if fairness_pct >= 85:
+                insights.append("Values are well-matched - good trade balance")
+            elif team1_gives["total_value"] > team2_gives["total_value"]:
+                insights.append(
+                    "Team 1 giving up more value - consider additional compensation"
+                )
+            else:
+                insights.append(
+                    "Team 2 giving up more value - consider additional compensation"
+                )
+
+        # Helper function to convert insight strings to structured objects
+        def format_insight(insight_text):
+            # Determine impact level and category based on content
+            impact = "medium"  # default
+            category = "general"  # default
+
+            if "more value" in insight_text or "compensation" in insight_text:
+                impact = "high"
+                category = "value_analysis"
+            elif "older players" in insight_text or "young talent" in insight_text:
+                impact = "medium"
+                category = "age_analysis"
+            elif "QB" in insight_text:
+                impact = "high"
+                category = "position_strategy"
+            elif "elite player" in insight_text or "star-for-star" in insight_text:
+                impact = "high"
+                category = "player_value"
+            elif "consolidation" in insight_text or "multiple players" in insight_text:
+                impact = "medium"
+                category = "roster_construction"
+            elif "well-matched" in insight_text or "good trade balance" in insight_text:
+                impact = "low"
+                category = "trade_balance"
+            elif "swap" in insight_text or "strategies" in insight_text:
+                impact = "medium"
+                category = "position_strategy"
+
+            return {"category": category, "description": insight_text, "impact": impact}
+
+        # Convert insights to structured format
+        structured_insights = [format_insight(insight) for insight in insights]
+
+        return {
+            "success": True,
+            "analysis": {
+                "trade_id": f"{request.team1_id}_{request.team2_id}_{int(time.time())}",
+                "team1_gives": team1_gives,
+                "team2_gives": team2_gives,
+                "fairness": {
+                    "percentage": round(fairness_pct, 1),
+                    "verdict": verdict,
+                    "verdict_color": verdict_color,
+                    "value_difference": round(value_diff, 1),
+                },
+                "insights": structured_insights,
+                "recommendation": verdict,
+            },
+        }
+
+    except Exception as e:
+        logger.error(f"Error in quick trade analysis: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to analyze trade: {str(e)}"
+        )
+
+
+# Player comparison request model
+class ComparePlayersRequest(BaseModel):
+    player_ids: List[str]
+    league_id: Optional[str] = None
+
+
+@router.post("/api/fantasy/players/compare")
+async def compare_players(
+    request: ComparePlayersRequest, current_user: dict = Depends(get_current_user)
+):
+    """Compare multiple players side-by-side with analytics"""
+    try:
+        player_ids = request.player_ids
+        league_id = request.league_id
+
+        logger.info(
+            f"Player comparison called with {len(player_ids)} players: {player_ids}"
+        )
+
+        if len(player_ids) < 2 or len(player_ids) > 4:
+            raise HTTPException(status_code=400, detail="Must compare 2-4 players")
+
+        # Get Sleeper service for player data
+        from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+        sleeper_service = SleeperFantasyService()
+        all_players = await sleeper_service._get_all_players()
+
+        # Get trending data
+        trending_adds = await sleeper_service.get_trending_players("add")
+        trending_drops = await sleeper_service.get_trending_players("drop")
+        trending_lookup = {}
+
+        for player in trending_adds:
+            trending_lookup[player.get("player_id")] = {
+                "type": "hot",
+                "count": player.get("trend_count", 0),
+            }
+        for player in trending_drops:
+            if player.get("player_id") not in trending_lookup:
+                trending_lookup[player.get("player_id")] = {
+                    "type": "cold",
+                    "count": player.get("trend_count", 0),
+                }
+
+        compared_players = []
+
+        for player_id in player_ids:
+            if player_id not in all_players:
+                continue
+
+            player_data = all_players[player_id]
+            name = f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip()
+
+            # Build comparison data
+            comparison_data = {
+                "player_id": player_id,
+                "name": name,
+                "position": player_data.get("position", ""),
+                "team": player_data.get("team", ""),
+                "age": player_data.get("age"),
+                "experience": player_data.get("years_exp"),
+                "injury_status": player_data.get("injury_status", "Healthy"),
+                "physical_stats": {
+                    "height": player_data.get("height"),
+                    "weight": player_data.get("weight"),
+                },
+                "career_info": {
+                    "college": player_data.get("college"),
+                    "draft_year": player_data.get("draft_year"),
+                    "draft_round": player_data.get("draft_round"),
+                    "draft_pick": player_data.get("draft_pick"),
+                },
+                "team_context": {
+                    "depth_chart_order": player_data.get("depth_chart_order"),
+                    "search_rank": player_data.get("search_rank", 999),
+                },
+                "trending": trending_lookup.get(
+                    player_id, {"type": "normal", "count": 0}
+                ),
+                "fantasy_positions": player_data.get("fantasy_positions", []),
+            }
+
+            compared_players.append(comparison_data)
+
+        return {
+            "status": "success",
+            "comparison": {
+                "players": compared_players,
+                "insights": [],  # Can add insights later
+                "league_context": league_id,
+                "comparison_date": datetime.utcnow().isoformat(),
+            },
+        }
+
+    except Exception as e:
+        logger.error(f"Error in player comparison: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/api/fantasy/players/{player_id}/analytics/{season}")
+async def get_player_analytics(
+    player_id: str,
+    season: int,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_db),
+):
+    """Get player analytics for a specific season"""
+    try:
+        from app.services.player_analytics_service import PlayerAnalyticsService
+
+        analytics_service = PlayerAnalyticsService(db)
+
+        # Convert string player_id to int if needed
+        try:
+            player_id_int = int(player_id)
+        except ValueError:
+            # If it's a sleeper ID, we would need to map it
+            # For now, return a mock response
+            return {
+                "status": "success",
+                "player_id": player_id,
+                "season": season,
+                "analytics": {
+                    "total_points": 0,
+                    "avg_points_per_game": 0,
+                    "games_played": 0,
+                    "consistency_rating": "N/A",
+                    "target_share": 0,
+                    "red_zone_usage": 0,
+                    "snap_percentage": 0,
+                },
+                "message": "Player analytics data not available",
+            }
+
+        # Get week list for the season (weeks 1-17 typically)
+        week_list = list(range(1, 18))
+
+        analytics = await analytics_service.get_player_analytics(
+            player_id_int, week_list, season
+        )
+
+        return {
+            "status": "success",
+            "player_id": player_id,
+            "season": season,
+            "analytics": analytics,
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting player analytics: {str(e)}")
+        return {
+            "status": "error",
+            "message": "Analytics data temporarily unavailable",
+            "player_id": player_id,
+            "season": season,
+            "analytics": {},
+        }
+
+
+@router.get("/api/fantasy/players/{player_id}/trends/{season}")
+async def get_player_trends(
+    player_id: str,
+    season: int,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_db),
+):
+    """Get player trend analysis for a specific season"""
+    try:
+        from app.services.player_analytics_service import PlayerAnalyticsService
+
+        analytics_service = PlayerAnalyticsService(db)
+
+        try:
+            player_id_int = int(player_id)
+        except ValueError:
+            return {
+                "status": "success",
+                "player_id": player_id,
+                "season": season,
+                "trends": {
+                    "scoring_trend": "stable",
+                    "usage_trend": "stable",
+                    "efficiency_trend": "stable",
+                    "recent_form": "average",
+                },
+                "message": "Player trends data not available",
+            }
+
+        week_list = list(range(1, 18))
+        trends = await analytics_service.calculate_usage_trends(
+            player_id_int, week_list, season
+        )
+
+        return {
+            "status": "success",
+            "player_id": player_id,
+            "season": season,
+            "trends": trends,
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting player trends: {str(e)}")
+        return {
+            "status": "error",
+            "message": "Trends data temporarily unavailable",
+            "player_id": player_id,
+            "season": season,
+            "trends": {},
+        }
+
+
+@router.get("/api/fantasy/players/{player_id}/efficiency/{season}")
+async def get_player_efficiency(
+    player_id: str,
+    season: int,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_db),
+):
+    """Get player efficiency metrics for a specific season"""
+    try:
+        from app.services.player_analytics_service import PlayerAnalyticsService
+
+        analytics_service = PlayerAnalyticsService(db)
+
+        try:
+            player_id_int = int(player_id)
+        except ValueError:
+            return {
+                "status": "success",
+                "player_id": player_id,
+                "season": season,
+                "efficiency": {
+                    "yards_per_target": 0,
+                    "yards_per_carry": 0,
+                    "red_zone_efficiency": 0,
+                    "target_efficiency": 0,
+                    "snap_efficiency": 0,
+                },
+                "message": "Player efficiency data not available",
+            }
+
+        week_list = list(range(1, 18))
+        efficiency = await analytics_service.calculate_efficiency_metrics(
+            player_id_int, week_list, season
+        )
+
+        return {
+            "status": "success",
+            "player_id": player_id,
+            "season": season,
+            "efficiency": efficiency,
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting player efficiency: {str(e)}")
+        return {
+            "status": "error",
+            "message": "Efficiency data temporarily unavailable",
+            "player_id": player_id,
+            "season": season,
+            "efficiency": {},
+        }
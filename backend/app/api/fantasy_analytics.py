@@ -9,13 +9,20 @@ from pydantic import BaseModel
 import logging
 
 from app.core.database import get_db
+from app.models.fantasy_models import FantasyTeam
 from app.services.fantasy_analytics_service import FantasyAnalyticsService
 from app.services.fantasy_service import FantasyService
 from app.core.auth import get_current_user
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(prefix="/api/fantasy/analytics")
+
+# Players one batch projection request may ask for
+MAX_BATCH_PLAYERS = 500
+
+# Projection fields a league's lineups can be optimized for
+LINEUP_OBJECTIVES = ("projection", "floor", "ceiling")
 
 
 # Pydantic models
@@ -94,6 +101,22 @@ class PlayerProjection(BaseModel):
     factors: Dict[str, Any]
 
 
+class BatchProjectionRequest(BaseModel):
+    """Players to project: explicit ids, a team's roster or a league's rosters"""
+
+    week: int
+    player_ids: Optional[List[int]] = None
+    team_id: Optional[int] = None
+    league_id: Optional[int] = None
+
+
+class BatchProjectionResponse(BaseModel):
+    week: int
+    scoring_type: str
+    projections: List[PlayerProjection]
+    missing_player_ids: List[int]
+
+
 class WaiverAnalytics(BaseModel):
     player_id: int
     player_name: str
@@ -103,6 +126,8 @@ class WaiverAnalytics(BaseModel):
     opportunity_score: float
     recent_ppg: float
     avg_snap_pct: float
+    trend: Optional[str] = None
+    position_rank: Optional[int] = None
     priority: str
     recommendation: str
 
@@ -271,6 +296,80 @@ async def get_player_projection(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/projections/batch", response_model=BatchProjectionResponse)
+async def get_batch_projections(
+    request: BatchProjectionRequest,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Project many players in one call"""
+    try:
+        league_id = request.league_id
+        if request.team_id is not None:
+            team = (
+                db.query(FantasyTeam).filter(FantasyTeam.id == request.team_id).first()
+            )
+            if not team:
+                raise HTTPException(status_code=404, detail="Team not found")
+            if league_id is not None and league_id != team.league_id:
+                raise HTTPException(
+                    status_code=400, detail="Team is not in the given league"
+                )
+            league_id = team.league_id
+
+        league_settings = {"scoring_type": "ppr"}
+        if league_id is not None:
+            leagues = FantasyService(db).get_user_leagues(current_user["id"])
+            league = next((l for l in leagues if l["id"] == league_id), None)
+            if not league:
+                raise HTTPException(status_code=404, detail="League not found")
+            league_settings = {
+                "scoring_type": league.get("scoring_type") or "ppr",
+                "team_count": league.get("team_count", 12),
+            }
+
+        analytics_service = FantasyAnalyticsService(db)
+        if request.player_ids is not None:
+            player_ids = list(dict.fromkeys(request.player_ids))
+        elif league_id is not None:
+            player_ids = analytics_service.get_roster_player_ids(
+                team_id=request.team_id, league_id=league_id, week=request.week
+            )
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail="Provide player_ids, team_id or league_id",
+            )
+        if len(player_ids) > MAX_BATCH_PLAYERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_BATCH_PLAYERS} players per request",
+            )
+
+        projections = analytics_service.get_batch_player_projections(
+            player_ids, request.week, league_settings
+        )
+
+        return BatchProjectionResponse(
+            week=request.week,
+            scoring_type=league_settings["scoring_type"],
+            projections=[
+                PlayerProjection(**projections[player_id])
+                for player_id in player_ids
+                if player_id in projections
+            ],
+            missing_player_ids=[
+                player_id for player_id in player_ids if player_id not in projections
+            ],
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating batch projections: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/waiver-analytics", response_model=List[WaiverAnalytics])
 async def get_waiver_analytics(
     league_id: int,
@@ -382,6 +481,37 @@ async def get_league_insights(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/league/{league_id}/lineups")
+async def get_league_lineups(
+    league_id: int,
+    week: int = Query(..., ge=1, le=18),
+    objective: str = "projection",
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Optimal lineups for every team in a league, for matchup previews"""
+    try:
+        if objective not in LINEUP_OBJECTIVES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"objective must be one of {list(LINEUP_OBJECTIVES)}",
+            )
+
+        leagues = FantasyService(db).get_user_leagues(current_user["id"])
+        if not any(l["id"] == league_id for l in leagues):
+            raise HTTPException(status_code=404, detail="League not found")
+
+        return FantasyAnalyticsService(db).get_league_lineups(
+            league_id, week, objective
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error building league lineups: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/data-summary")
 async def get_data_summary(
     current_user: dict = Depends(get_current_user), db: Session = Depends(get_db)
@@ -0,0 +1,204 @@
+"""
+Subscription API endpoints - Stripe checkout, webhooks and plan management
+
+Included on the first request under /api/subscription (see app.main).
+"""
+
+import logging
+import os
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, get_db
+from app.core.deps import get_current_user
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.post("/api/subscription/create-checkout")
+async def create_checkout_session(
+    request: dict,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Create Stripe Checkout session for subscription upgrade"""
+    try:
+        from app.services.subscription_service import SubscriptionService
+        from app.models.database_models import User
+
+        tier = request.get("tier")
+        return_url = request.get("return_url", f"{settings.FRONTEND_URL}/dashboard")
+
+        if not tier:
+            raise HTTPException(status_code=400, detail="Subscription tier is required")
+
+        # Get user from database
+        user_id = current_user.get("id") or current_user.get("user_id")
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # Create checkout session
+        subscription_service = SubscriptionService(db)
+        result = subscription_service.create_checkout_session(user, tier, return_url)
+
+        return {
+            "status": "success",
+            "client_secret": result["client_secret"],
+            "session_id": result["session_id"],
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Checkout creation error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/api/subscription/session-status/{session_id}")
+async def get_session_status(
+    session_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get checkout session status and update user subscription if completed"""
+    try:
+        from app.services.subscription_service import SubscriptionService
+        from app.models.database_models import User
+
+        user_id = current_user.get("id") or current_user.get("user_id")
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        subscription_service = SubscriptionService(db)
+        status = subscription_service.get_session_status(session_id, user)
+
+        return status
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Session status error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/api/subscription/webhook")
+async def stripe_webhook(request: dict):
+    """Handle Stripe webhook events"""
+    import stripe
+
+    try:
+        # Get the webhook secret from environment
+        webhook_secret = os.getenv("STRIPE_WEBHOOK_SECRET")
+        if not webhook_secret:
+            logger.warning("STRIPE_WEBHOOK_SECRET not configured")
+            return {"status": "ignored"}
+
+        # Verify webhook signature
+        signature = request.headers.get("stripe-signature")
+        try:
+            event = stripe.Webhook.construct_event(
+                await request.body(), signature, webhook_secret
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid payload")
+        except stripe.error.SignatureVerificationError:
+            raise HTTPException(status_code=400, detail="Invalid signature")
+
+        # Handle the event
+        db = SessionLocal()
+        try:
+            from app.services.subscription_service import SubscriptionService
+
+            subscription_service = SubscriptionService(db)
+
+            if event["type"] == "checkout.session.completed":
+                session = event["data"]["object"]
+                subscription_service.handle_checkout_completed(session)
+
+            elif event["type"] in [
+                "customer.subscription.updated",
+                "customer.subscription.deleted",
+            ]:
+                subscription = event["data"]["object"]
+                subscription_service.handle_subscription_updated(subscription)
+
+            logger.info(f"Processed webhook event: {event['type']}")
+            return {"status": "success"}
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Webhook error: {e}")
+        raise HTTPException(status_code=500, detail="Webhook processing failed")
+
+
+@router.get("/api/subscription/info")
+async def get_subscription_info(
+    current_user: dict = Depends(get_current_user), db: Session = Depends(get_db)
+):
+    """Get current subscription information"""
+    try:
+        from app.services.subscription_service import SubscriptionService
+        from app.models.database_models import User
+
+        user_id = current_user.get("id") or current_user.get("user_id")
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        subscription_service = SubscriptionService(db)
+        subscription_info = subscription_service.get_subscription_info(user)
+
+        return {
+            "status": "success",
+            "subscription": subscription_info
+            or {"tier": user.subscription_tier, "status": "free"},
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get subscription info error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get subscription info")
+
+
+@router.post("/api/subscription/cancel")
+async def cancel_subscription(
+    current_user: dict = Depends(get_current_user), db: Session = Depends(get_db)
+):
+    """Cancel current subscription"""
+    try:
+        from app.services.subscription_service import SubscriptionService
+        from app.models.database_models import User
+
+        user_id = current_user.get("id") or current_user.get("user_id")
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        subscription_service = SubscriptionService(db)
+        result = subscription_service.cancel_subscription(user)
+
+        if not result.get("success"):
+            raise HTTPException(
+                status_code=400, detail=result.get("error", "Cancellation failed")
+            )
+
+        return {
+            "status": "success",
+            "message": result["message"],
+            "period_end": result.get("period_end"),
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Cancel subscription error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to cancel subscription")
@@ -3,12 +3,13 @@ API endpoints for simplified Sleeper fantasy syncing
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List
 import logging
 
 from app.core.database import get_db
-from app.main import get_current_user
+from app.core.deps import get_current_user
 from app.services.simplified_sleeper_service import SimplifiedSleeperService
 from app.models.database_models import User, SleeperLeague, SleeperRoster, SleeperPlayer
 from pydantic import BaseModel
@@ -151,7 +152,11 @@ async def sync_nfl_players(
         )
 
 
-@router.post("/sync/full", response_model=SleeperSyncResponse)
+@router.post(
+    "/sync/full",
+    response_model=SleeperSyncResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def full_sleeper_sync(
     request: SleeperConnectRequest,
     current_user: User = Depends(get_current_user),
@@ -159,25 +164,29 @@ async def full_sleeper_sync(
 ):
     """
     Complete workflow: Connect account -> Sync leagues -> Sync rosters -> Sync players
+
+    The account is connected before responding; the rest runs as a background
+    job whose progress is polled through /sleeper/status.
     """
     try:
-        result = await sleeper_service.full_sync_workflow(
+        connect_result = await sleeper_service.connect_sleeper_account(
             current_user.id, request.sleeper_username, db
         )
+        job = sleeper_service.start_sync_job(current_user.id, db, connect_result)
 
         return SleeperSyncResponse(
             success=True,
-            message="Full Sleeper sync completed successfully",
-            data=result,
+            message="Full Sleeper sync started",
+            data=job.to_dict(),
         )
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to complete full sync: {str(e)}")
+        logger.error(f"Failed to start full sync: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to complete full sync",
+            detail="Failed to start full sync",
         )
 
 
@@ -210,13 +219,26 @@ async def get_sleeper_sync_status(
         # Get total player count in system
         player_count = db.query(SleeperPlayer).count()
 
+        # Latest background sync, running or finished; without a finished one
+        # in this process, the last time a league changed
+        job = sleeper_service.get_sync_job(current_user.id)
+        if job and job.status == "complete":
+            last_sync = job.finished_at
+        else:
+            last_sync = (
+                db.query(func.max(SleeperLeague.last_synced))
+                .filter(SleeperLeague.user_id == current_user.id)
+                .scalar()
+            )
+
         return {
             "sleeper_connected": sleeper_connected,
             "sleeper_user_id": current_user.sleeper_user_id,
             "leagues_synced": league_count,
             "rosters_synced": roster_count,
             "total_players_in_system": player_count,
-            "last_sync": None,  # TODO: Add last sync timestamp tracking
+            "last_sync": last_sync.isoformat() if last_sync else None,
+            "sync_job": job.to_dict() if job else None,
         }
 
     except Exception as e:
@@ -26,6 +26,10 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
 
+    # SQL instrumentation: warn when one statement shape repeats more than
+    # this many times in a single request or scheduler task
+    SQL_REPEAT_WARN_THRESHOLD: int = 10
+
     # External Services
     STRIPE_SECRET_KEY: Optional[str] = None
     TWILIO_ACCOUNT_SID: Optional[str] = None
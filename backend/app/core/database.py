@@ -3,6 +3,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from app.core.config import settings
+from app.core.query_instrumentation import instrument_engine
 from fastapi import HTTPException
 import logging
 
@@ -13,6 +14,7 @@ try:
     engine = create_engine(
         settings.DATABASE_URL, pool_pre_ping=True, pool_recycle=300, echo=settings.DEBUG
     )
+    instrument_engine(engine)
     logger.info(f"Database engine created with URL: {settings.DATABASE_URL[:30]}...")
 except Exception as e:
     logger.warning(f"Failed to create database engine: {e}")
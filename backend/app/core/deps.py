@@ -0,0 +1,85 @@
+"""
+FastAPI auth dependencies shared by main.py and the routers under app/api
+
+Routers import these from here rather than from app.main, which includes
+the routers and so can't be imported by them.
+"""
+
+import logging
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.service_loader import get_service, is_service_available
+
+logger = logging.getLogger(__name__)
+
+# Security scheme
+security = HTTPBearer()
+
+
+# JWT Helper Functions
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Extract user from JWT token"""
+    try:
+        token = credentials.credentials
+
+        # Basic validation
+        invalid_token_value = (
+            "invalid"  # nosec B105 - this is a test token value, not a real password
+        )
+        if not token or token == invalid_token_value:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        # Decode JWT token (without signature verification for now)
+        import jwt
+
+        try:
+            payload = jwt.decode(token, options={"verify_signature": False})
+            user_id = payload.get("sub")
+
+            if user_id:
+                # Convert user_id to integer if it's a string
+                user_id = int(user_id) if isinstance(user_id, str) else user_id
+                return {
+                    "user_id": user_id,
+                    "email": "user@example.com",
+                    "subscription_tier": "pro",
+                }
+            else:
+                raise HTTPException(status_code=401, detail="Invalid token payload")
+
+        except (jwt.InvalidTokenError, ValueError) as e:
+            # Fallback to mock user for development tokens
+            logger.warning(f"JWT decode failed, using mock user: {e}")
+            return {
+                "user_id": 123,  # Mock user as integer
+                "email": "user@example.com",
+                "subscription_tier": "pro",
+            }
+
+    except Exception as e:
+        logger.error(f"Authentication failed: {e}")
+        raise HTTPException(status_code=401, detail="Authentication failed")
+
+
+async def require_admin(current_user: dict = Depends(get_current_user)):
+    """Require admin privileges"""
+    # Check if user has admin privileges from the database
+    if is_service_available("auth_service"):
+        auth_service = get_service("auth_service")
+        try:
+            user_data = await auth_service.get_user_by_id(
+                current_user.get("id") or current_user.get("user_id")
+            )
+            if not user_data or not user_data.get("is_admin", False):
+                raise HTTPException(status_code=403, detail="Admin privileges required")
+            return user_data
+        except Exception as e:
+            logger.error(f"Error checking admin privileges: {e}")
+            raise HTTPException(status_code=403, detail="Admin privileges required")
+    else:
+        # Fallback: assume user 8 is admin for development
+        if (current_user.get("id") or current_user.get("user_id")) == 8:
+            return current_user
+        raise HTTPException(status_code=403, detail="Admin privileges required")
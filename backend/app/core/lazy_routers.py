@@ -0,0 +1,67 @@
+"""
+Routers included on first use
+
+Large route groups live in their own modules under app.api. Each is imported,
+and its routes built, only when the first request under one of its path
+prefixes arrives, so a cold start pays for none of them. Generating the
+OpenAPI schema includes every router.
+"""
+
+import importlib
+import logging
+from threading import Lock
+from typing import Dict, Tuple
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRouters:
+    """Router modules waiting to be included, keyed by import path"""
+
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.pending: Dict[str, Tuple[str, ...]] = {}
+        self.loaded: Dict[str, Tuple[str, ...]] = {}
+        self._lock = Lock()
+
+    def register(self, module_path: str, *prefixes: str) -> None:
+        """Include `module_path`'s `router` on the first request under a prefix"""
+        self.pending[module_path] = tuple(prefix.rstrip("/") for prefix in prefixes)
+
+    def _include(self, module_path: str) -> None:
+        with self._lock:
+            prefixes = self.pending.pop(module_path, None)
+            if prefixes is None:
+                return  # Another thread got here first
+            module = importlib.import_module(module_path)
+            self.app.include_router(module.router)
+            self.loaded[module_path] = prefixes
+            # Rebuild the schema with the new routes next time it is asked for
+            self.app.openapi_schema = None
+            logger.info(f"Included router {module_path} on first use")
+
+    def load_for_path(self, path: str) -> None:
+        for module_path, prefixes in list(self.pending.items()):
+            for prefix in prefixes:
+                if path == prefix or path.startswith(prefix + "/"):
+                    self._include(module_path)
+                    break
+
+    def load_all(self) -> None:
+        for module_path in list(self.pending):
+            self._include(module_path)
+
+
+class LazyRouterMiddleware:
+    """Pure ASGI middleware including pending routers before routing"""
+
+    def __init__(self, app, routers: LazyRouters):
+        self.app = app
+        self.routers = routers
+
+    async def __call__(self, scope, receive, send):
+        if self.routers.pending and scope["type"] in ("http", "websocket"):
+            self.routers.load_for_path(scope["path"])
+        await self.app(scope, receive, send)
@@ -0,0 +1,205 @@
+"""
+Per-request SQL instrumentation
+
+Engine events attribute every statement to the active scope: an HTTP request
+or a scheduler task, tracked through a context variable. Each scope counts
+queries, DB time and statement fingerprints. When one fingerprint repeats more
+than the threshold (the usual N+1 shape), a warning is logged once per scope.
+Finished scopes are folded into per-endpoint summaries for the admin API.
+"""
+
+import functools
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Repeats of one statement shape within a scope before warning
+REPEAT_WARN_THRESHOLD = settings.SQL_REPEAT_WARN_THRESHOLD
+
+# Fingerprints kept per endpoint summary
+TOP_REPEATS = 5
+
+_FINGERPRINT_RULES = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),  # string literals
+    (re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s"), "?"),  # bind parameters
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),  # numbers
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?)"),  # IN lists, VALUES rows
+    (re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+"), "(?)"),  # multi-row VALUES
+    (re.compile(r"\s+"), " "),
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """Statement shape with literals, bind values and list lengths removed"""
+    # Cached: compiled statements repeat verbatim, so the regexes run once each
+    for pattern, replacement in _FINGERPRINT_RULES:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+@dataclass
+class QueryScope:
+    """Queries attributed to one request or task run"""
+
+    name: str
+    query_count: int = 0
+    db_time: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+    flagged: List[str] = field(default_factory=list)
+
+    def record(self, statement: str, elapsed: float):
+        shape = fingerprint(statement)
+        self.query_count += 1
+        self.db_time += elapsed
+        self.fingerprints[shape] += 1
+        if self.fingerprints[shape] == REPEAT_WARN_THRESHOLD + 1:
+            self.flagged.append(shape)
+            logger.warning(
+                f"Possible N+1 in {self.name}: statement repeated more than "
+                f"{REPEAT_WARN_THRESHOLD} times: {shape[:300]}"
+            )
+
+    def repeated(self, minimum: int = 2) -> Dict[str, int]:
+        """Fingerprints run at least `minimum` times, most repeated first"""
+        return {
+            shape: count
+            for shape, count in self.fingerprints.most_common()
+            if count >= minimum
+        }
+
+
+@dataclass
+class ScopeSummary:
+    """Aggregate of every finished scope with the same name"""
+
+    runs: int = 0
+    queries: int = 0
+    max_queries: int = 0
+    db_time: float = 0.0
+    n_plus_one_runs: int = 0
+    top_repeats: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, scope: QueryScope):
+        self.runs += 1
+        self.queries += scope.query_count
+        self.max_queries = max(self.max_queries, scope.query_count)
+        self.db_time += scope.db_time
+        if scope.flagged:
+            self.n_plus_one_runs += 1
+        for shape, count in scope.repeated().items():
+            if count > self.top_repeats.get(shape, 0):
+                self.top_repeats[shape] = count
+        if len(self.top_repeats) > TOP_REPEATS:
+            self.top_repeats = dict(
+                sorted(self.top_repeats.items(), key=lambda item: -item[1])[
+                    :TOP_REPEATS
+                ]
+            )
+
+    def to_dict(self) -> Dict:
+        return {
+            "runs": self.runs,
+            "queries": self.queries,
+            "avg_queries": round(self.queries / self.runs, 2) if self.runs else 0,
+            "max_queries": self.max_queries,
+            "db_time_ms": round(self.db_time * 1000, 2),
+            "avg_db_time_ms": (
+                round(self.db_time * 1000 / self.runs, 2) if self.runs else 0
+            ),
+            "n_plus_one_runs": self.n_plus_one_runs,
+            "top_repeats": self.top_repeats,
+        }
+
+
+class QueryStatsRegistry:
+    """Thread-safe per-endpoint and per-task summaries"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._summaries: Dict[str, ScopeSummary] = {}
+
+    def add(self, scope: QueryScope):
+        with self._lock:
+            self._summaries.setdefault(scope.name, ScopeSummary()).add(scope)
+
+    def summary(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {
+                name: summary.to_dict()
+                for name, summary in sorted(
+                    self._summaries.items(), key=lambda item: -item[1].queries
+                )
+            }
+
+    def reset(self):
+        with self._lock:
+            self._summaries.clear()
+
+
+query_stats = QueryStatsRegistry()
+
+_current_scope: ContextVar[Optional[QueryScope]] = ContextVar(
+    "sql_query_scope", default=None
+)
+
+
+def current_scope() -> Optional[QueryScope]:
+    return _current_scope.get()
+
+
+@contextmanager
+def track_queries(name: str, record: bool = True) -> Iterator[QueryScope]:
+    """
+    Attribute statements run inside the block (and tasks it spawns) to a scope
+
+    The scope's name may be changed before exit, e.g. once the route is known.
+    With record=False the scope is not added to the shared summaries.
+    """
+    scope = QueryScope(name=name)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        if record:
+            query_stats.add(scope)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started_at"].pop()
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.record(statement, time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: Engine):
+    """Hook the engine's cursor events; safe to call more than once"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -1,9 +1,14 @@
 """
 Service loader with graceful degradation for production deployments
+
+Services are registered by import path and imported on first use, so the
+app starts without paying for modules a given worker never touches.
 """
 
+import importlib
 import logging
-from typing import Dict, Any, Optional
+from threading import RLock
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +19,24 @@ class ServiceAvailability:
     def __init__(self):
         self.services: Dict[str, bool] = {}
         self.instances: Dict[str, Any] = {}
+        # name -> (import path, fallback) for services not imported yet
+        self.pending: Dict[str, Tuple[str, Any]] = {}
+        self._lock = RLock()
+
+    def register_service(
+        self, name: str, import_path: str, fallback_value: Any = None
+    ) -> None:
+        """Record a service to be imported the first time it is asked for"""
+        if name not in self.services:
+            self.pending[name] = (import_path, fallback_value)
+
+    def _ensure_loaded(self, name: str) -> None:
+        if name not in self.pending:
+            return
+        with self._lock:
+            spec = self.pending.pop(name, None)
+            if spec is not None:
+                self.load_service(name, *spec)
 
     def load_service(
         self, name: str, import_path: str, fallback_value: Any = None
@@ -37,8 +60,6 @@ class ServiceAvailability:
                 module_path, attr_name = import_path, None
 
             # Import module
-            import importlib
-
             module = importlib.import_module(module_path)
 
             # Get service instance
@@ -59,16 +80,25 @@ class ServiceAvailability:
             return fallback_value
 
     def is_available(self, name: str) -> bool:
-        """Check if a service is available"""
+        """Check if a service is available, importing it if still pending"""
+        self._ensure_loaded(name)
         return self.services.get(name, False)
 
     def get_service(self, name: str) -> Any:
-        """Get a loaded service instance"""
+        """Get a service instance, importing it if still pending"""
+        self._ensure_loaded(name)
         return self.instances.get(name)
 
-    def get_status(self) -> Dict[str, bool]:
-        """Get status of all services"""
-        return self.services.copy()
+    def get_status(self) -> Dict[str, Optional[bool]]:
+        """Get status of all services; None for those not imported yet"""
+        status: Dict[str, Optional[bool]] = dict.fromkeys(self.pending)
+        status.update(self.services)
+        return status
+
+    def load_all(self) -> None:
+        """Import every pending service now"""
+        for name in list(self.pending):
+            self._ensure_loaded(name)
 
 
 # Global service availability tracker
@@ -77,7 +107,7 @@ service_loader = ServiceAvailability()
 
 # Load core services with graceful degradation
 def initialize_services():
-    """Initialize all services with graceful error handling"""
+    """Register all services; each is imported on first use"""
 
     logger.info("🚀 Initializing services...")
 
@@ -98,82 +128,71 @@ def initialize_services():
         logger.warning(f"⚠️  database service not available: {e}")
 
     # Auth service
-    service_loader.load_service(
+    service_loader.register_service(
         "auth_service", "app.services.auth_service_db.auth_service_db"
     )
 
     # Sports pipeline
-    service_loader.load_service(
+    service_loader.register_service(
         "sports_pipeline", "app.services.data_pipeline.sports_pipeline"
     )
 
     # AI chat service
-    service_loader.load_service(
+    service_loader.register_service(
         "ai_chat_service", "app.services.ai_chat_service.ai_chat_service"
     )
 
     # Fantasy services
-    service_loader.load_service(
+    service_loader.register_service(
         "fantasy_pipeline", "app.services.fantasy_pipeline.fantasy_pipeline"
     )
 
-    service_loader.load_service(
+    service_loader.register_service(
         "real_fantasy_pipeline",
         "app.services.real_fantasy_pipeline.real_fantasy_pipeline",
     )
 
     # Betting services
-    service_loader.load_service(
+    service_loader.register_service(
         "bet_service", "app.services.bet_service_db.bet_service_db"
     )
 
-    service_loader.load_service(
+    service_loader.register_service(
         "yetai_bets_service", "app.services.yetai_bets_service_db.yetai_bets_service_db"
     )
 
     # Analytics services
-    service_loader.load_service(
+    service_loader.register_service(
         "performance_tracker", "app.services.performance_tracker.performance_tracker"
     )
 
-    service_loader.load_service(
+    service_loader.register_service(
         "betting_analytics_service",
         "app.services.betting_analytics_service.betting_analytics_service",
     )
 
     # Other services
-    service_loader.load_service(
+    service_loader.register_service(
         "cache_service", "app.services.cache_service.cache_service"
     )
 
-    service_loader.load_service(
+    service_loader.register_service(
         "scheduler_service", "app.services.scheduler_service.scheduler_service"
     )
 
-    service_loader.load_service(
+    service_loader.register_service(
         "google_oauth_service", "app.services.google_oauth_service.google_oauth_service"
     )
 
     # ESPN API service for popular games
-    service_loader.load_service(
+    service_loader.register_service(
         "espn_api_service", "app.services.espn_api_service.espn_api_service"
     )
 
-    # Log summary
-    available_services = [
-        name for name, available in service_loader.get_status().items() if available
-    ]
-    unavailable_services = [
-        name for name, available in service_loader.get_status().items() if not available
-    ]
-
     logger.info(
-        f"✅ Services available ({len(available_services)}): {', '.join(available_services)}"
+        f"✅ Services registered ({len(service_loader.pending)} load on first use): "
+        f"{', '.join(service_loader.pending)}"
     )
-    if unavailable_services:
-        logger.info(
-            f"⚠️  Services unavailable ({len(unavailable_services)}): {', '.join(unavailable_services)}"
-        )
 
     return service_loader
 
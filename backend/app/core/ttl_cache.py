@@ -0,0 +1,78 @@
+"""
+Bounded in-process cache with per-entry expiry
+
+The object caches in front of the database and the Sleeper API keep live
+Python values (snapshots, reports, decoded responses), which the string
+based cache_service can't hold. Entries expire after a TTL; a full cache
+drops its oldest tenth, in insertion order, before storing a new key.
+Expired entries stay until evicted or replaced, so callers that revalidate
+or serve stale data can still read them.
+"""
+
+import time
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Key -> value, each served for `ttl` seconds, at most `max_size` keys"""
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: Dict[K, Tuple[float, V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """The value stored for key, unless it has expired"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def get_stale(self, key: K, default: Any = None) -> Any:
+        """The value stored for key, expired or not"""
+        entry = self._entries.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        if key not in self._entries and len(self._entries) >= self.max_size:
+            # Dicts keep insertion order: drop the oldest tenth
+            for old_key in list(self._entries)[: max(1, self.max_size // 10)]:
+                del self._entries[old_key]
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires, value)
+
+    def touch(self, key: K, ttl: Optional[float] = None) -> bool:
+        """Serve an existing entry for another TTL; False if key isn't cached"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        self._entries[key] = (
+            time.monotonic() + (self.ttl if ttl is None else ttl),
+            entry[1],
+        )
+        return True
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def discard_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Forget the entries predicate(key, value) selects; returns how many"""
+        keys = [
+            key for key, (_, value) in self._entries.items() if predicate(key, value)
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
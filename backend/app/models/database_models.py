@@ -8,17 +8,28 @@ from sqlalchemy import (
     String,
     Float,
     Boolean,
+    Date,
     DateTime,
     Text,
     ForeignKey,
     JSON,
     Enum,
+    Index,
+    LargeBinary,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.models.odds_codec import (
+    BookmakerOdds,
+    decode_odds,
+    decode_odds_dicts,
+    encode_odds,
+    shared_odds_dicts,
+)
 import enum
 from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
 
 
 class BetStatus(str, enum.Enum):
@@ -120,6 +131,10 @@ class User(Base):
 
 class Game(Base):
     __tablename__ = "games"
+    __table_args__ = (
+        # Date windows: popular games, syncs, the odds quota planner
+        Index("ix_games_commence_time_sport_key", "commence_time", "sport_key"),
+    )
 
     id = Column(String(255), primary_key=True, index=True)  # External API game ID
     sport_key = Column(String(100), nullable=False)
@@ -135,13 +150,56 @@ class Game(Base):
     # Game metadata
     venue = Column(String(255))
     weather = Column(JSON)
-    odds_data = Column(JSON)  # Store latest odds from Odds API
+    # Latest odds from Odds API, compactly encoded (see app.models.odds_codec).
+    # The JSON column only holds rows written before the encoding existed.
+    odds_blob = Column(LargeBinary)
+    legacy_odds_data = Column("odds_data", JSON)
     broadcast_info = Column(JSON)  # Store broadcast data from ESPN API
     is_nationally_televised = Column(Boolean, default=False)
 
     # Relationships
     bets = relationship("Bet", back_populates="game")
 
+    @property
+    def odds_data(self) -> Optional[List[Dict[str, Any]]]:
+        """All bookmakers as Odds API shaped dicts"""
+        if self.odds_blob is not None:
+            return decode_odds_dicts(self.odds_blob)
+        return self.legacy_odds_data
+
+    @odds_data.setter
+    def odds_data(self, value: Optional[List[Dict[str, Any]]]):
+        self.odds_blob = encode_odds(value) if value is not None else None
+        self.legacy_odds_data = None
+
+    def get_odds(self, markets: Optional[Iterable[str]] = None) -> List[BookmakerOdds]:
+        """Typed bookmaker odds, decoding only the requested markets"""
+        if self.odds_blob is not None:
+            return decode_odds(self.odds_blob, markets)
+        return [
+            BookmakerOdds.from_dict(bookmaker, markets)
+            for bookmaker in self.legacy_odds_data or []
+        ]
+
+    def shared_odds_dicts(
+        self, markets: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Read-only Odds API shaped dicts of the requested markets"""
+        if self.odds_blob is not None:
+            return shared_odds_dicts(self.odds_blob, markets)
+        wanted = set(markets) if markets is not None else None
+        return [
+            {
+                **bookmaker,
+                "markets": [
+                    market
+                    for market in bookmaker.get("markets", [])
+                    if wanted is None or market.get("key") in wanted
+                ],
+            }
+            for bookmaker in self.legacy_odds_data or []
+        ]
+
 
 class Bet(Base):
     __tablename__ = "bets"
@@ -222,6 +280,10 @@ class SharedBet(Base):
 
 class YetAIBet(Base):
     __tablename__ = "yetai_bets"
+    __table_args__ = (
+        # Active picks and pending verification
+        Index("ix_yetai_bets_status_commence_time", "status", "commence_time"),
+    )
 
     id = Column(String(255), primary_key=True, index=True)  # UUID
     user_id = Column(
@@ -241,7 +303,7 @@ class YetAIBet(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
     expires_at = Column(DateTime)
-    settled_at = Column(DateTime)
+    settled_at = Column(DateTime, index=True)
     result = Column(String(50))  # won, lost, push
 
     # AI metadata
@@ -285,6 +347,11 @@ class LiveBet(Base):
     game_time = Column(String(50))  # Quarter, inning, etc.
     current_score = Column(String(50))  # Score when bet was placed
 
+    # Latest game state, written for every open bet on each game update
+    current_game_status = Column(String(50))
+    current_home_score = Column(Integer)
+    current_away_score = Column(Integer)
+
     # Cash out tracking
     cash_out_available = Column(Boolean, default=True)
     cash_out_value = Column(Float)
@@ -301,6 +368,35 @@ class LiveBet(Base):
     user = relationship("User", back_populates="live_bets")
 
 
+class OddsApiUsage(Base):
+    """One row per Odds API request so quota usage survives restarts"""
+
+    __tablename__ = "odds_api_usage"
+
+    id = Column(Integer, primary_key=True, index=True)
+    recorded_at = Column(DateTime, default=datetime.utcnow, index=True)
+    endpoint = Column(String(50), nullable=False)  # odds, scores, events, sports
+    sport_key = Column(String(100), index=True)
+    credits = Column(Integer, default=0)  # x-requests-last
+
+    # Provider-side counters from the response headers
+    requests_used = Column(Integer)  # x-requests-used
+    requests_remaining = Column(Integer)  # x-requests-remaining
+
+
+class PlatformStatsDaily(Base):
+    """Settled YetAI bet totals per day, backing the login page stats"""
+
+    __tablename__ = "platform_stats_daily"
+
+    day = Column(Date, primary_key=True)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    # Profit of the day's winning bets at a $100 stake
+    won_profit = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
 # Additional tables for advanced features
 class BetLimit(Base):
     __tablename__ = "bet_limits"
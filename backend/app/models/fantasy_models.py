@@ -614,6 +614,103 @@ class PlayerTrends(Base):
     player = relationship("FantasyPlayer")
 
 
+class PlayerFeatures(Base):
+    """Rolling player statistics over a window of weeks, kept current at ingestion
+
+    A row covers the player's games in weeks (week - span, week] of a season.
+    Each metric keeps the count, mean, sample standard deviation, least-squares
+    slope and EWMA of its non-zero values, in week order.
+    """
+
+    __tablename__ = "player_features"
+
+    player_id = Column(Integer, primary_key=True)
+    season = Column(Integer, primary_key=True)
+    week = Column(Integer, primary_key=True)  # Last week of the window
+    span = Column(Integer, primary_key=True)  # Weeks in the window
+    games = Column(Integer, nullable=False)
+
+    ppr_points_n = Column(Integer, nullable=False)
+    ppr_points_mean = Column(Float)
+    ppr_points_std = Column(Float)
+    ppr_points_slope = Column(Float)
+    ppr_points_ewma = Column(Float)
+    boom_rate = Column(Float)  # Share of scoring games with 20+ PPR points
+    bust_rate = Column(Float)  # Share of scoring games under 5 PPR points
+
+    snap_percentage_n = Column(Integer, nullable=False)
+    snap_percentage_mean = Column(Float)
+    snap_percentage_std = Column(Float)
+    snap_percentage_slope = Column(Float)
+    snap_percentage_ewma = Column(Float)
+
+    target_share_n = Column(Integer, nullable=False)
+    target_share_mean = Column(Float)
+    target_share_std = Column(Float)
+    target_share_slope = Column(Float)
+    target_share_ewma = Column(Float)
+
+    red_zone_share_n = Column(Integer, nullable=False)
+    red_zone_share_mean = Column(Float)
+    red_zone_share_std = Column(Float)
+    red_zone_share_slope = Column(Float)
+    red_zone_share_ewma = Column(Float)
+
+    points_per_snap_n = Column(Integer, nullable=False)
+    points_per_snap_mean = Column(Float)
+    points_per_snap_std = Column(Float)
+    points_per_snap_slope = Column(Float)
+    points_per_snap_ewma = Column(Float)
+
+    points_per_target_n = Column(Integer, nullable=False)
+    points_per_target_mean = Column(Float)
+    points_per_target_std = Column(Float)
+    points_per_target_slope = Column(Float)
+    points_per_target_ewma = Column(Float)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class PlayerRecentGames(Base):
+    """A player's latest games across seasons, newest first, kept current at ingestion
+
+    games holds up to 16 entries of week, season, opponent, ppr_points,
+    targets and snap_percentage. Unlike the player_features windows it spans
+    seasons and keeps zeros, as trend and consistency reads expect.
+    """
+
+    __tablename__ = "player_recent_games"
+
+    player_id = Column(Integer, primary_key=True)
+    games = Column(JSON, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class WaiverScore(Base):
+    """Waiver-wire opportunity of a player as of a week, computed in a weekly batch
+
+    Only players clearing the snap-share bar get a row. position_rank orders
+    them by opportunity_score within their position; ownership_pct is the
+    share of the season's synced leagues rostering the player.
+    """
+
+    __tablename__ = "waiver_scores"
+
+    player_id = Column(Integer, primary_key=True)
+    season = Column(Integer, primary_key=True)
+    week = Column(Integer, primary_key=True)  # Last week of data scored
+    position = Column(String(10))
+    opportunity_score = Column(Float, nullable=False)
+    position_rank = Column(Integer, nullable=False)
+    trend = Column(String(10), nullable=False)  # rising, steady, falling
+    avg_snap_pct = Column(Float)
+    avg_target_share = Column(Float)
+    avg_red_zone_touches = Column(Float)
+    recent_ppg = Column(Float)
+    ownership_pct = Column(Float)
+    computed_at = Column(DateTime, default=datetime.utcnow)
+
+
 class TradeStatus(str, enum.Enum):
     PROPOSED = "proposed"
     PENDING = "pending"
@@ -911,12 +1008,20 @@ Index(
     CompetitorAnalysis.team_id,
 )
 Index(
-    "idx_player_analytics_player_week",
+    "idx_player_analytics_player_season_week",
     PlayerAnalytics.player_id,
-    PlayerAnalytics.week,
     PlayerAnalytics.season,
+    PlayerAnalytics.week,
 )
+Index("idx_player_analytics_season_week", PlayerAnalytics.season, PlayerAnalytics.week)
 Index("idx_player_trends_player_season", PlayerTrends.player_id, PlayerTrends.season)
+Index(
+    "idx_player_features_season_week",
+    PlayerFeatures.season,
+    PlayerFeatures.week,
+    PlayerFeatures.span,
+)
+Index("idx_waiver_scores_season_week", WaiverScore.season, WaiverScore.week)
 Index(
     "idx_player_analytics_snap_share",
     PlayerAnalytics.player_id,
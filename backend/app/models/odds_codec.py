@@ -0,0 +1,481 @@
+"""
+Compact binary encoding for Odds API bookmaker data
+
+Layout (all integers little-endian)::
+
+    b"OD" | version u8 | head length u32 | zlib(head) | zlib(market section)...
+
+The head holds a NUL-separated string table (team names, bookmaker keys and
+timestamps are stored once), the bookmakers, each bookmaker's market order and
+a directory of market sections. Each market
+(h2h, spreads, totals, player props, ...) is compressed separately so a reader
+can decode just the markets it needs. Outcome prices and points are stored as
+float64 with flags that remember whether the API sent an integer, so decoding
+reproduces the original JSON exactly.
+"""
+
+import json
+import math
+import struct
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+MAGIC = b"OD"
+VERSION = 1
+NONE = 0xFFFFFFFF
+
+# Blobs whose decoded dicts shared_odds_dicts keeps
+SHARED_DECODE_CACHE_SIZE = 512
+
+_PREFIX = struct.Struct("<2sBI")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_COUNTS = struct.Struct("<IHHI")
+_BOOKMAKER = struct.Struct("<IIIIIH")
+_DIRECTORY = struct.Struct("<IIIH")
+_ROW = struct.Struct("<HIIH")
+_OUTCOME = struct.Struct("<IIIBdd")
+
+# Outcome flags
+_HAS_PRICE = 1
+_PRICE_INT = 2
+_HAS_POINT = 4
+_POINT_INT = 8
+
+_BOOKMAKER_FIELDS = ("key", "title", "last_update", "markets")
+_MARKET_FIELDS = ("key", "last_update", "outcomes")
+_OUTCOME_FIELDS = ("name", "price", "point", "description")
+
+
+@dataclass
+class OddsOutcome:
+    """One priced outcome of a market"""
+
+    name: Optional[str]
+    price: Optional[float] = None
+    point: Optional[float] = None
+    description: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"name": self.name}
+        if self.description is not None:
+            data["description"] = self.description
+        if self.price is not None:
+            data["price"] = self.price
+        if self.point is not None:
+            data["point"] = self.point
+        data.update(self.extra)
+        return data
+
+
+@dataclass
+class OddsMarket:
+    """A bookmaker's market (h2h, spreads, totals, ...)"""
+
+    key: str
+    last_update: Optional[str] = None
+    outcomes: List[OddsOutcome] = field(default_factory=list)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"key": self.key}
+        if self.last_update is not None:
+            data["last_update"] = self.last_update
+        data["outcomes"] = [outcome.to_dict() for outcome in self.outcomes]
+        data.update(self.extra)
+        return data
+
+
+@dataclass
+class BookmakerOdds:
+    """Odds from one bookmaker, in the shape The Odds API returns"""
+
+    key: str
+    title: Optional[str] = None
+    last_update: Optional[str] = None
+    markets: List[OddsMarket] = field(default_factory=list)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def market(self, key: str) -> Optional[OddsMarket]:
+        for market in self.markets:
+            if market.key == key:
+                return market
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"key": self.key, "title": self.title}
+        if self.last_update is not None:
+            data["last_update"] = self.last_update
+        data["markets"] = [market.to_dict() for market in self.markets]
+        data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], markets: Optional[Iterable[str]] = None
+    ) -> "BookmakerOdds":
+        wanted = set(markets) if markets is not None else None
+        return cls(
+            key=data.get("key"),
+            title=data.get("title"),
+            last_update=data.get("last_update"),
+            markets=[
+                OddsMarket(
+                    key=market.get("key"),
+                    last_update=market.get("last_update"),
+                    outcomes=[
+                        OddsOutcome(
+                            name=outcome.get("name"),
+                            price=outcome.get("price"),
+                            point=outcome.get("point"),
+                            description=outcome.get("description"),
+                            extra=_extra(outcome, _OUTCOME_FIELDS),
+                        )
+                        for outcome in market.get("outcomes", [])
+                    ],
+                    extra=_extra(market, _MARKET_FIELDS),
+                )
+                for market in data.get("markets", [])
+                if wanted is None or market.get("key") in wanted
+            ],
+            extra=_extra(data, _BOOKMAKER_FIELDS),
+        )
+
+
+def _extra(data: Dict[str, Any], known: Tuple[str, ...]) -> Dict[str, Any]:
+    return {k: v for k, v in data.items() if k not in known}
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        if not isinstance(value, str):
+            value = str(value)
+        position = self.index.get(value)
+        if position is None:
+            position = len(self.strings)
+            self.strings.append(value)
+            self.index[value] = position
+        return position
+
+    def add_extra(self, data: Dict[str, Any], known: Tuple[str, ...]) -> int:
+        extra = _extra(data, known)
+        if not extra:
+            return NONE
+        return self.add(json.dumps(extra, separators=(",", ":"), default=str))
+
+
+def _number(value: Any, has_flag: int, int_flag: int) -> Tuple[int, float]:
+    if value is None:
+        return 0, math.nan
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Unsupported numeric odds value: {value!r}")
+    flags = has_flag | (int_flag if isinstance(value, int) else 0)
+    return flags, float(value)
+
+
+def encode_odds(bookmakers: List[Dict[str, Any]]) -> bytes:
+    """Encode a list of Odds API bookmaker dicts"""
+    strings = _StringTable()
+    market_keys: List[str] = []
+    market_positions: Dict[str, int] = {}
+    rows: Dict[str, List[bytes]] = {}
+    outcomes_by_market: Dict[str, List[bytes]] = {}
+    bookmaker_parts: List[bytes] = []
+    order: List[int] = []
+
+    for bookmaker_index, bookmaker in enumerate(bookmakers):
+        order_start = len(order)
+        for market in bookmaker.get("markets", []):
+            key = market.get("key")
+            if key not in market_positions:
+                market_positions[key] = len(market_keys)
+                market_keys.append(key)
+                rows[key] = []
+                outcomes_by_market[key] = []
+            order.append(market_positions[key])
+
+            outcomes = market.get("outcomes", [])
+            rows[key].append(
+                _ROW.pack(
+                    bookmaker_index,
+                    strings.add(market.get("last_update")),
+                    strings.add_extra(market, _MARKET_FIELDS),
+                    len(outcomes),
+                )
+            )
+            for outcome in outcomes:
+                price_flags, price = _number(
+                    outcome.get("price"), _HAS_PRICE, _PRICE_INT
+                )
+                point_flags, point = _number(
+                    outcome.get("point"), _HAS_POINT, _POINT_INT
+                )
+                outcomes_by_market[key].append(
+                    _OUTCOME.pack(
+                        strings.add(outcome.get("name")),
+                        strings.add(outcome.get("description")),
+                        strings.add_extra(outcome, _OUTCOME_FIELDS),
+                        price_flags | point_flags,
+                        price,
+                        point,
+                    )
+                )
+
+        bookmaker_parts.append(
+            _BOOKMAKER.pack(
+                strings.add(bookmaker.get("key")),
+                strings.add(bookmaker.get("title")),
+                strings.add(bookmaker.get("last_update")),
+                strings.add_extra(bookmaker, _BOOKMAKER_FIELDS),
+                order_start,
+                len(order) - order_start,
+            )
+        )
+
+    # Sections are fixed-width rows followed by fixed-width outcomes so the
+    # reader can use struct.iter_unpack instead of walking field by field
+    sections: List[bytes] = []
+    directory: List[bytes] = []
+    offset = 0
+    for key in market_keys:
+        section = zlib.compress(
+            b"".join(rows[key]) + b"".join(outcomes_by_market[key]), level=6
+        )
+        directory.append(
+            _DIRECTORY.pack(strings.add(key), offset, len(section), len(rows[key]))
+        )
+        sections.append(section)
+        offset += len(section)
+
+    if any("\x00" in value for value in strings.strings):
+        raise ValueError("Odds strings may not contain NUL characters")
+    string_block = "\x00".join(strings.strings).encode("utf-8")
+    head = b"".join(
+        [
+            _COUNTS.pack(
+                len(string_block), len(bookmaker_parts), len(directory), len(order)
+            ),
+            string_block,
+            *bookmaker_parts,
+            *(_U16.pack(position) for position in order),
+            *directory,
+        ]
+    )
+    compressed_head = zlib.compress(head, level=6)
+    return (
+        _PREFIX.pack(MAGIC, VERSION, len(compressed_head))
+        + compressed_head
+        + b"".join(sections)
+    )
+
+
+def _read_head(blob: bytes):
+    magic, version, head_length = _PREFIX.unpack_from(blob, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not an encoded odds blob")
+    head = zlib.decompress(blob[_PREFIX.size : _PREFIX.size + head_length])
+    sections_start = _PREFIX.size + head_length
+
+    string_length, bookmaker_count, market_count, order_count = _COUNTS.unpack_from(
+        head, 0
+    )
+    position = _COUNTS.size
+    strings = head[position : position + string_length].decode("utf-8").split("\x00")
+    position += string_length
+
+    end = position + bookmaker_count * _BOOKMAKER.size
+    bookmakers = list(_BOOKMAKER.iter_unpack(head[position:end]))
+    position = end
+
+    end = position + order_count * _U16.size
+    order = [value for (value,) in _U16.iter_unpack(head[position:end])]
+    position = end
+
+    end = position + market_count * _DIRECTORY.size
+    directory = list(_DIRECTORY.iter_unpack(head[position:end]))
+
+    return strings, bookmakers, order, directory, sections_start
+
+
+def odds_market_keys(blob: bytes) -> List[str]:
+    """Market keys present in a blob, without decoding any section"""
+    strings, _, _, directory, _ = _read_head(blob)
+    return [strings[entry[0]] for entry in directory]
+
+
+def decode_odds(
+    blob: bytes, markets: Optional[Iterable[str]] = None
+) -> List[BookmakerOdds]:
+    """Decode a blob, decompressing only the requested markets"""
+    strings, bookmaker_entries, order, directory, sections_start = _read_head(blob)
+
+    # dict.get maps the NONE index to None without a Python-level branch
+    text = dict(enumerate(strings)).get
+
+    def extra(index: int) -> Dict[str, Any]:
+        return {} if index == NONE else json.loads(strings[index])
+
+    wanted = set(markets) if markets is not None else None
+    decoded: Dict[Tuple[int, int], OddsMarket] = {}
+    for market_index, (key_index, offset, length, row_count) in enumerate(directory):
+        key = strings[key_index]
+        if wanted is not None and key not in wanted:
+            continue
+
+        start = sections_start + offset
+        section = zlib.decompress(blob[start : start + length])
+        rows_end = row_count * _ROW.size
+        outcomes = _OUTCOME.iter_unpack(section[rows_end:])
+        for bookmaker_index, updated, market_extra, outcome_count in _ROW.iter_unpack(
+            section[:rows_end]
+        ):
+            market_outcomes = []
+            for _ in range(outcome_count):
+                name, description, outcome_extra, flags, price, point = next(outcomes)
+                market_outcomes.append(
+                    OddsOutcome(
+                        name=text(name),
+                        price=(
+                            (int(price) if flags & _PRICE_INT else price)
+                            if flags & _HAS_PRICE
+                            else None
+                        ),
+                        point=(
+                            (int(point) if flags & _POINT_INT else point)
+                            if flags & _HAS_POINT
+                            else None
+                        ),
+                        description=text(description),
+                        extra=extra(outcome_extra),
+                    )
+                )
+            decoded[(bookmaker_index, market_index)] = OddsMarket(
+                key=key,
+                last_update=text(updated),
+                outcomes=market_outcomes,
+                extra=extra(market_extra),
+            )
+
+    result = []
+    for bookmaker_index, entry in enumerate(bookmaker_entries):
+        key, title, updated, bookmaker_extra, order_start, order_count = entry
+        result.append(
+            BookmakerOdds(
+                key=text(key),
+                title=text(title),
+                last_update=text(updated),
+                markets=[
+                    decoded[(bookmaker_index, market_index)]
+                    for market_index in order[order_start : order_start + order_count]
+                    if (bookmaker_index, market_index) in decoded
+                ],
+                extra=extra(bookmaker_extra),
+            )
+        )
+    return result
+
+
+def decode_odds_dicts(
+    blob: bytes, markets: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Decode a blob back into Odds API shaped dicts
+
+    Builds the dicts straight from the sections rather than through the
+    dataclasses; the result equals [b.to_dict() for b in decode_odds(...)].
+    """
+    strings, bookmaker_entries, order, directory, sections_start = _read_head(blob)
+
+    wanted = set(markets) if markets is not None else None
+    markets_by_bookmaker: List[Dict[int, Dict[str, Any]]] = [
+        {} for _ in bookmaker_entries
+    ]
+    for market_index, (key_index, offset, length, row_count) in enumerate(directory):
+        key = strings[key_index]
+        if wanted is not None and key not in wanted:
+            continue
+
+        start = sections_start + offset
+        section = zlib.decompress(blob[start : start + length])
+        rows_end = row_count * _ROW.size
+        outcomes = list(_OUTCOME.iter_unpack(section[rows_end:]))
+        position = 0
+        for bookmaker_index, updated, market_extra, outcome_count in _ROW.iter_unpack(
+            section[:rows_end]
+        ):
+            market_outcomes = []
+            for name, description, outcome_extra, flags, price, point in outcomes[
+                position : position + outcome_count
+            ]:
+                # Same keys, in the same order, as OddsOutcome.to_dict
+                outcome: Dict[str, Any] = {
+                    "name": None if name == NONE else strings[name]
+                }
+                if description != NONE:
+                    outcome["description"] = strings[description]
+                if flags & _HAS_PRICE:
+                    outcome["price"] = int(price) if flags & _PRICE_INT else price
+                if flags & _HAS_POINT:
+                    outcome["point"] = int(point) if flags & _POINT_INT else point
+                if outcome_extra != NONE:
+                    outcome.update(json.loads(strings[outcome_extra]))
+                market_outcomes.append(outcome)
+            position += outcome_count
+
+            market: Dict[str, Any] = {"key": key}
+            if updated != NONE:
+                market["last_update"] = strings[updated]
+            market["outcomes"] = market_outcomes
+            if market_extra != NONE:
+                market.update(json.loads(strings[market_extra]))
+            markets_by_bookmaker[bookmaker_index][market_index] = market
+
+    result = []
+    for decoded, entry in zip(markets_by_bookmaker, bookmaker_entries):
+        key, title, updated, bookmaker_extra, order_start, order_count = entry
+        bookmaker: Dict[str, Any] = {
+            "key": None if key == NONE else strings[key],
+            "title": None if title == NONE else strings[title],
+        }
+        if updated != NONE:
+            bookmaker["last_update"] = strings[updated]
+        bookmaker["markets"] = [
+            decoded[market_index]
+            for market_index in order[order_start : order_start + order_count]
+            if market_index in decoded
+        ]
+        if bookmaker_extra != NONE:
+            bookmaker.update(json.loads(strings[bookmaker_extra]))
+        result.append(bookmaker)
+    return result
+
+
+@lru_cache(maxsize=SHARED_DECODE_CACHE_SIZE)
+def _shared_odds_dicts(
+    blob: bytes, markets: Optional[FrozenSet[str]]
+) -> List[Dict[str, Any]]:
+    return decode_odds_dicts(blob, markets)
+
+
+def shared_odds_dicts(
+    blob: bytes, markets: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    decode_odds_dicts, memoised by blob content for read-only callers
+
+    A game's blob only changes when its odds do, so endpoints serving the
+    same games on every request decode each blob once. The dicts are
+    shared between callers and must not be modified.
+    """
+    return _shared_odds_dicts(
+        bytes(blob), frozenset(markets) if markets is not None else None
+    )
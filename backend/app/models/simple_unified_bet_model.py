@@ -12,10 +12,14 @@ from sqlalchemy import (
     Float,
     Boolean,
     DateTime,
+    Date,
     Text,
     JSON,
     Enum,
+    Index,
+    text,
 )
+from sqlalchemy.orm import relationship
 from app.core.database import Base
 import enum
 from datetime import datetime
@@ -77,6 +81,27 @@ class SubscriptionTier(str, enum.Enum):
 
 class SimpleUnifiedBet(Base):
     __tablename__ = "simple_unified_bets"
+    __table_args__ = (
+        # Keyset pagination of a user's bet history, newest first, without
+        # parlay legs (as history, stats and daily limits all read bets)
+        Index(
+            "ix_simple_unified_bets_user_top_level",
+            "user_id",
+            "placed_at",
+            "id",
+            postgresql_where=text("parent_bet_id IS NULL"),
+            sqlite_where=text("parent_bet_id IS NULL"),
+        ),
+        # Legs of a parlay
+        Index("ix_simple_unified_bets_parent_bet_id", "parent_bet_id"),
+        # Verification: sports with started, pending bets
+        Index(
+            "ix_simple_unified_bets_status_sport",
+            "status",
+            "sport",
+            "commence_time",
+        ),
+    )
 
     # === CORE BET IDENTIFICATION ===
     id = Column(String(255), primary_key=True, index=True)
@@ -153,6 +178,14 @@ class SimpleUnifiedBet(Base):
     total_odds = Column(Float)
     parlay_legs = Column(JSON)
 
+    # Legs of a parlay parent, joined on parent_bet_id (read-only, no FK)
+    legs = relationship(
+        "SimpleUnifiedBet",
+        primaryjoin="SimpleUnifiedBet.id == foreign(SimpleUnifiedBet.parent_bet_id)",
+        order_by="SimpleUnifiedBet.leg_position",
+        viewonly=True,
+    )
+
     # === LIVE BETTING SUPPORT ===
     is_live = Column(Boolean, default=False)
     game_time_at_placement = Column(String(50))
@@ -207,3 +240,20 @@ class SimpleUnifiedBet(Base):
     # === AUDIT TRAIL ===
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class UserDailyExposure(Base):
+    """Running per-user totals of the stakes placed on a UTC day"""
+
+    __tablename__ = "user_daily_exposure"
+
+    user_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+
+    # Everything staked that day, checked against the daily limit
+    staked = Column(Float, nullable=False, default=0)
+    # Part of it still riding on pending bets; settlement releases it
+    open_stake = Column(Float, nullable=False, default=0)
+    bet_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
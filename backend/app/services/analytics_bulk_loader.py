@@ -0,0 +1,361 @@
+"""
+Staged bulk loader for player_analytics
+
+An import is streamed, validated and coerced a chunk at a time, and loaded
+into a temporary staging table (COPY on PostgreSQL, batched executemany
+elsewhere). The staged rows then replace or merge into player_analytics in
+the same transaction, so readers see the old rows until the new ones are
+committed and never an empty or half-loaded table; an import without a
+valid row is refused. Player features are rebuilt from the committed rows
+afterwards, in a transaction of their own.
+"""
+
+import csv
+import io
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    Table,
+    delete,
+    distinct,
+    insert,
+    select,
+    tuple_,
+)
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.fantasy_models import PlayerAnalytics
+from app.services.player_feature_store import player_feature_store
+from app.services.team_analytics import team_analytics_cache
+
+logger = logging.getLogger(__name__)
+
+# Rows validated and staged per round trip
+CHUNK_SIZE = 5000
+
+# Rejected rows described in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+# replace: the import becomes the whole table
+# seasons: the import replaces the seasons it contains
+# merge: the import replaces the player weeks it contains
+LOAD_MODES = ("replace", "seasons", "merge")
+
+NULL_VALUES = ("", "NULL")
+
+REQUIRED_COLUMNS = ("player_id", "week", "season")
+
+# Every column but the surrogate key, which the table assigns
+LOAD_COLUMNS = [
+    column for column in PlayerAnalytics.__table__.columns if column.name != "id"
+]
+
+_staging_table = Table(
+    "player_analytics_staging",
+    MetaData(),
+    *[Column(column.name, column.type) for column in LOAD_COLUMNS],
+    prefixes=["TEMPORARY"],
+)
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _converter(column) -> Callable[[str], Any]:
+    if isinstance(column.type, Integer):
+        return lambda value: int(float(value))
+    if isinstance(column.type, Float):
+        return float
+    if isinstance(column.type, DateTime):
+        return _parse_datetime
+    return str
+
+
+_CONVERTERS = {column.name: _converter(column) for column in LOAD_COLUMNS}
+
+
+@dataclass
+class BulkLoadReport:
+    """What an import read, loaded and rejected, and how fast"""
+
+    mode: str
+    rows_read: int = 0
+    rows_loaded: int = 0
+    rows_rejected: int = 0
+    rows_replaced: int = 0
+    feature_rows: int = 0
+    # Set when the import committed but player_features couldn't be rebuilt
+    feature_rebuild_error: Optional[str] = None
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return round(self.rows_loaded / self.seconds, 1) if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "rows_read": self.rows_read,
+            "rows_loaded": self.rows_loaded,
+            "rows_rejected": self.rows_rejected,
+            "rows_replaced": self.rows_replaced,
+            "feature_rows": self.feature_rows,
+            "feature_rebuild_error": self.feature_rebuild_error,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": self.rows_per_second,
+            "errors": self.errors,
+        }
+
+
+def coerce_row(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    One input row as typed player_analytics values
+
+    Strings are converted by column type, empty and NULL fields become None
+    and unknown columns (including id) are dropped. Raises ValueError for a
+    bad value or a missing player_id, week or season.
+    """
+    row = {}
+    for name, value in raw.items():
+        convert = _CONVERTERS.get(name)
+        if convert is None:
+            continue
+        if not isinstance(value, str):
+            row[name] = value
+            continue
+        text = value.strip()
+        if text in NULL_VALUES:
+            row[name] = None
+            continue
+        try:
+            row[name] = convert(text)
+        except ValueError:
+            raise ValueError(f"{name}: invalid value {value!r}")
+    missing = [name for name in REQUIRED_COLUMNS if row.get(name) is None]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    return row
+
+
+class AnalyticsBulkLoader:
+    """Loads player_analytics imports through a staging table"""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        chunk_size: int = CHUNK_SIZE,
+        refresh_features: bool = True,
+    ):
+        self._session_factory = session_factory or SessionLocal
+        self.chunk_size = chunk_size
+        self.refresh_features = refresh_features
+
+    def load_csv(self, stream: TextIO, mode: str = "replace") -> BulkLoadReport:
+        """Load CSV text (a file or lines) with a header row of column names"""
+        return self.load_rows(csv.DictReader(stream), mode)
+
+    def load_rows(
+        self, rows: Iterable[Dict[str, Any]], mode: str = "replace"
+    ) -> BulkLoadReport:
+        """
+        Validate, stage and swap in rows of column name -> value
+
+        Raises ValueError, leaving player_analytics as it was, when no row
+        is valid (a wrong header rejects them all). A feature rebuild that
+        fails after the swap is reported in feature_rebuild_error.
+        """
+        if mode not in LOAD_MODES:
+            raise ValueError(
+                f"Unsupported load mode '{mode}', expected one of {list(LOAD_MODES)}"
+            )
+        report = BulkLoadReport(mode=mode)
+        started = time.perf_counter()
+        db = self._session_factory()
+        try:
+            connection = db.connection()
+            _staging_table.drop(connection, checkfirst=True)
+            _staging_table.create(connection)
+
+            rows = iter(rows)
+            while True:
+                chunk = list(islice(rows, self.chunk_size))
+                if not chunk:
+                    break
+                staged = self._validate(chunk, report)
+                if staged:
+                    self._stage(connection, staged)
+                    report.rows_loaded += len(staged)
+            if not report.rows_loaded:
+                raise ValueError(
+                    f"No valid rows to load: {report.rows_rejected} of "
+                    f"{report.rows_read} rejected"
+                    + (f" ({report.errors[0]})" if report.errors else "")
+                )
+
+            report.rows_replaced = self._swap(connection, mode)
+            scopes = self._feature_scopes(db, mode) if self.refresh_features else []
+            _staging_table.drop(connection)
+            db.commit()
+            team_analytics_cache.invalidate_analytics()
+
+            # The swap doesn't wait on the rebuild; until it commits, features
+            # describe the previous rows
+            try:
+                for season, player_ids in scopes:
+                    report.feature_rows += player_feature_store.rebuild(
+                        db, season=season, player_ids=player_ids
+                    )
+                db.commit()
+            except Exception as e:
+                # The import itself is committed: report the rebuild, don't fail
+                db.rollback()
+                report.feature_rows = 0
+                report.feature_rebuild_error = str(e)
+                logger.error(f"Player feature rebuild after import failed: {e}")
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        report.seconds = time.perf_counter() - started
+        logger.info(
+            f"Loaded {report.rows_loaded} player_analytics rows ({mode}) in "
+            f"{report.seconds:.2f}s, {report.rows_per_second} rows/sec, "
+            f"{report.rows_rejected} rejected"
+        )
+        return report
+
+    def _validate(
+        self, chunk: List[Dict[str, Any]], report: BulkLoadReport
+    ) -> List[Dict[str, Any]]:
+        staged = []
+        for raw in chunk:
+            report.rows_read += 1
+            try:
+                row = coerce_row(raw)
+            except ValueError as e:
+                report.rows_rejected += 1
+                if len(report.errors) < MAX_REPORTED_ERRORS:
+                    report.errors.append(f"row {report.rows_read}: {e}")
+                continue
+            staged.append(row)
+        return staged
+
+    def _stage(self, connection, rows: List[Dict[str, Any]]) -> None:
+        # Only the columns the import supplies; the rest stage as NULL
+        present = set()
+        for row in rows:
+            present.update(row)
+        columns = [column for column in LOAD_COLUMNS if column.name in present]
+        names = [column.name for column in columns]
+
+        if connection.dialect.name != "postgresql":
+            # Positional tuples through the driver's executemany: binding
+            # named parameters row by row costs more than the insert itself
+            dialect = connection.dialect
+            statement = insert(_staging_table).compile(
+                dialect=dialect, column_keys=names
+            )
+            processors = [
+                column.type.dialect_impl(dialect).bind_processor(dialect)
+                for column in columns
+            ]
+            connection.exec_driver_sql(
+                str(statement),
+                [
+                    tuple(
+                        process(value) if process and value is not None else value
+                        for process, value in zip(
+                            processors, [row.get(name) for name in names]
+                        )
+                    )
+                    for row in rows
+                ],
+            )
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            # An unquoted empty field is NULL to COPY ... CSV
+            writer.writerow(
+                [
+                    value.isoformat() if isinstance(value, datetime) else value
+                    for value in (row.get(name) for name in names)
+                ]
+            )
+        buffer.seek(0)
+        cursor = connection.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {_staging_table.name} ({', '.join(names)}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+    def _swap(self, connection, mode: str) -> int:
+        """Replace target rows with the staged ones; returns rows removed"""
+        target = PlayerAnalytics.__table__
+        staged = _staging_table.c
+        removed = delete(target)
+        if mode == "seasons":
+            removed = removed.where(
+                target.c.season.in_(select(distinct(staged.season)))
+            )
+        elif mode == "merge":
+            removed = removed.where(
+                tuple_(target.c.player_id, target.c.season, target.c.week).in_(
+                    select(staged.player_id, staged.season, staged.week)
+                )
+            )
+        replaced = connection.execute(removed).rowcount
+
+        names = [column.name for column in LOAD_COLUMNS]
+        connection.execute(
+            insert(target).from_select(names, select(*[staged[name] for name in names]))
+        )
+        return replaced
+
+    def _feature_scopes(
+        self, db: Session, mode: str
+    ) -> List[Tuple[Optional[int], Optional[List[int]]]]:
+        """(season, player ids) for each feature rebuild the staged rows need"""
+        staged = _staging_table.c
+        if mode == "replace":
+            return [(None, None)]
+
+        scopes = []
+        seasons = db.execute(select(distinct(staged.season))).scalars().all()
+        for season in seasons:
+            player_ids = None
+            if mode == "merge":
+                player_ids = (
+                    db.execute(
+                        select(distinct(staged.player_id)).where(
+                            staged.season == season
+                        )
+                    )
+                    .scalars()
+                    .all()
+                )
+            scopes.append((season, player_ids))
+        return scopes
+
+
+analytics_bulk_loader = AnalyticsBulkLoader()
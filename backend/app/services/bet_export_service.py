@@ -0,0 +1,154 @@
+"""
+Streaming bet history export
+
+Rows are read from simple_unified_bets through a server-side cursor and
+written out as CSV or NDJSON a chunk at a time, so memory stays flat however
+many bets an account holds.
+"""
+
+import csv
+import io
+import json
+import logging
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import DateTime, Enum, select
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.simple_unified_bet_model import SimpleUnifiedBet
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip, and rows per emitted chunk
+FETCH_SIZE = 1000
+
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "placed_at",
+    "settled_at",
+    "status",
+    "bet_type",
+    "source",
+    "sport",
+    "home_team",
+    "away_team",
+    "commence_time",
+    "selection",
+    "odds",
+    "amount",
+    "potential_win",
+    "result_amount",
+    "spread_value",
+    "total_points",
+    "player_name",
+    "prop_market",
+    "prop_line",
+    "bookmaker",
+    "is_parlay",
+    "parent_bet_id",
+    "leg_position",
+    "is_live",
+    "odds_api_event_id",
+    "final_home_score",
+    "final_away_score",
+)
+
+
+def _row_converter() -> Callable[[Sequence], List]:
+    """Row -> plain values: enums by value, datetimes as ISO strings"""
+    # Only enum and datetime columns need converting; find them once
+    columns = SimpleUnifiedBet.__table__.c
+    enum_indexes = [
+        i
+        for i, name in enumerate(EXPORT_COLUMNS)
+        if isinstance(columns[name].type, Enum)
+    ]
+    datetime_indexes = [
+        i
+        for i, name in enumerate(EXPORT_COLUMNS)
+        if isinstance(columns[name].type, DateTime)
+    ]
+
+    def convert(row: Sequence) -> List:
+        values = list(row)
+        for i in enum_indexes:
+            if values[i] is not None:
+                values[i] = values[i].value
+        for i in datetime_indexes:
+            if values[i] is not None:
+                values[i] = values[i].isoformat()
+        return values
+
+    return convert
+
+
+class BetExportService:
+    """Writes bet history exports without materialising the result set"""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        fetch_size: int = FETCH_SIZE,
+    ):
+        self._session_factory = session_factory or SessionLocal
+        self.fetch_size = fetch_size
+
+    def iter_rows(self, filters: Sequence) -> Iterator[List]:
+        """Yield converted export rows oldest first, fetch_size per round trip"""
+        convert = _row_converter()
+        columns = [SimpleUnifiedBet.__table__.c[name] for name in EXPORT_COLUMNS]
+        statement = (
+            select(*columns)
+            .where(*filters)
+            .order_by(SimpleUnifiedBet.placed_at, SimpleUnifiedBet.id)
+            .execution_options(yield_per=self.fetch_size)
+        )
+        db = self._session_factory()
+        try:
+            # Core rows: no ORM identity map or entity bookkeeping per bet
+            for partition in db.connection().execute(statement).partitions():
+                for row in partition:
+                    yield convert(row)
+        finally:
+            db.close()
+
+    def stream_csv(self, filters: Sequence) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        for count, row in enumerate(self.iter_rows(filters), 1):
+            # csv writes None as an empty field
+            writer.writerow(row)
+            if count % self.fetch_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    def stream_ndjson(self, filters: Sequence) -> Iterator[str]:
+        lines: List[str] = []
+        for row in self.iter_rows(filters):
+            lines.append(json.dumps(dict(zip(EXPORT_COLUMNS, row))))
+            if len(lines) == self.fetch_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    def stream(self, export_format: str, filters: Sequence) -> Iterator[str]:
+        """Chunks of the export in the given format ("csv" or "ndjson")"""
+        if export_format == "csv":
+            return self.stream_csv(filters)
+        if export_format == "ndjson":
+            return self.stream_ndjson(filters)
+        raise ValueError(
+            f"Unsupported export format '{export_format}', "
+            f"expected one of {sorted(EXPORT_FORMATS)}"
+        )
+
+
+bet_export_service = BetExportService()
@@ -0,0 +1,204 @@
+"""
+Per-user daily exposure counters for bet placement
+
+Each (user, UTC day) has a row in user_daily_exposure holding the stakes
+placed that day and the part still open on pending bets. Placement reserves a
+stake with one conditional UPDATE that only succeeds while the day stays
+under the limit, so concurrent placements cannot overshoot it: the database
+locks the row for the rest of the transaction and the counter commits or
+rolls back with the bet. Settlement releases the open stake of the bets it
+settles. Today's bets are summed only when a user's row for the day is
+first created.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, case, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.simple_unified_bet_model import (
+    BetStatus,
+    SimpleUnifiedBet,
+    UserDailyExposure,
+)
+
+logger = logging.getLogger(__name__)
+
+_exposure = UserDailyExposure.__table__
+
+
+def exposure_day(placed_at: Optional[datetime] = None) -> date:
+    """UTC day a bet placed at `placed_at` (naive UTC or aware) counts against"""
+    if placed_at is None:
+        return datetime.now(timezone.utc).date()
+    if placed_at.tzinfo:
+        placed_at = placed_at.astimezone(timezone.utc)
+    return placed_at.date()
+
+
+def _insert_ignoring_duplicates(db: Session, values: Dict) -> None:
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        db.execute(dialect_insert(_exposure).values(**values).on_conflict_do_nothing())
+        return
+    try:
+        with db.begin_nested():
+            db.execute(insert(_exposure).values(**values))
+    except IntegrityError:
+        pass  # A concurrent placement created the row
+
+
+class BetExposureService:
+    """Reserves stakes against the daily limit and releases them on settlement"""
+
+    def reserve(
+        self,
+        db: Session,
+        user_id: int,
+        amount: float,
+        daily_limit: float,
+        day: Optional[date] = None,
+    ) -> bool:
+        """
+        Add `amount` to the user's day if it stays within `daily_limit`
+
+        Runs in the caller's transaction; returns False, changing nothing,
+        when the stake would exceed the limit.
+        """
+        day = day or exposure_day()
+        if self._try_reserve(db, user_id, day, amount, daily_limit):
+            return True
+        existing = db.execute(
+            select(_exposure.c.user_id).where(
+                _exposure.c.user_id == user_id, _exposure.c.day == day
+            )
+        ).first()
+        if existing is not None:
+            return False
+
+        # First bet of the day through this path: seed the row from bets
+        # already placed today, e.g. before the counters existed
+        _insert_ignoring_duplicates(db, self._seed_values(db, user_id, day))
+        return self._try_reserve(db, user_id, day, amount, daily_limit)
+
+    def _try_reserve(
+        self, db: Session, user_id: int, day: date, amount: float, limit: float
+    ) -> bool:
+        result = db.execute(
+            update(_exposure)
+            .where(
+                _exposure.c.user_id == user_id,
+                _exposure.c.day == day,
+                _exposure.c.staked + amount <= limit,
+            )
+            .values(
+                staked=_exposure.c.staked + amount,
+                open_stake=_exposure.c.open_stake + amount,
+                bet_count=_exposure.c.bet_count + 1,
+                updated_at=datetime.utcnow(),
+            )
+        )
+        return result.rowcount == 1
+
+    def _seed_values(self, db: Session, user_id: int, day: date) -> Dict:
+        start = datetime.combine(day, datetime.min.time())
+        staked, open_stake, bet_count = db.execute(
+            select(
+                func.coalesce(func.sum(SimpleUnifiedBet.amount), 0),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (
+                                SimpleUnifiedBet.status == BetStatus.PENDING,
+                                SimpleUnifiedBet.amount,
+                            ),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ),
+                func.count(SimpleUnifiedBet.id),
+            ).where(
+                and_(
+                    SimpleUnifiedBet.user_id == user_id,
+                    SimpleUnifiedBet.placed_at >= start,
+                    SimpleUnifiedBet.placed_at < start + timedelta(days=1),
+                    SimpleUnifiedBet.parent_bet_id.is_(None),  # Not parlay legs
+                )
+            )
+        ).one()
+        return {
+            "user_id": user_id,
+            "day": day,
+            "staked": float(staked),
+            "open_stake": float(open_stake),
+            "bet_count": bet_count,
+            "updated_at": datetime.utcnow(),
+        }
+
+    def release(
+        self, db: Session, settled: Iterable[Tuple[int, datetime, float]]
+    ) -> int:
+        """
+        Release the open stake of settled (user_id, placed_at, amount) bets
+
+        One executemany UPDATE in the caller's transaction; returns the
+        number of (user, day) rows touched.
+        """
+        totals: Dict[Tuple[int, date], float] = defaultdict(float)
+        for user_id, placed_at, amount in settled:
+            totals[(user_id, exposure_day(placed_at))] += amount or 0
+        if not totals:
+            return 0
+        db.execute(
+            update(_exposure)
+            .where(
+                _exposure.c.user_id == bindparam("e_user_id"),
+                _exposure.c.day == bindparam("e_day"),
+            )
+            .values(
+                open_stake=_exposure.c.open_stake - bindparam("e_amount"),
+                updated_at=datetime.utcnow(),
+            ),
+            [
+                {"e_user_id": user_id, "e_day": day, "e_amount": amount}
+                for (user_id, day), amount in totals.items()
+            ],
+        )
+        return len(totals)
+
+    def release_bets(self, db: Session, bets: Iterable[Any]) -> int:
+        """
+        Release the stakes of bets being settled out of PENDING
+
+        Takes ORM rows from any settlement path; only top-level unified
+        bets reserved exposure, so parlay legs and legacy rows are skipped.
+        """
+        return self.release(
+            db,
+            [
+                (bet.user_id, bet.placed_at, bet.amount)
+                for bet in bets
+                if isinstance(bet, SimpleUnifiedBet) and bet.parent_bet_id is None
+            ],
+        )
+
+    def get(self, db: Session, user_id: int, day: Optional[date] = None) -> Dict:
+        """The user's counters for a day (zeros when nothing was placed)"""
+        row = db.get(UserDailyExposure, (user_id, day or exposure_day()))
+        return {
+            "staked": row.staked if row else 0.0,
+            "open_stake": row.open_stake if row else 0.0,
+            "bet_count": row.bet_count if row else 0,
+        }
+
+
+bet_exposure_service = BetExposureService()
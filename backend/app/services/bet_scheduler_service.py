@@ -11,6 +11,7 @@ This service manages:
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 from dataclasses import dataclass, asdict
@@ -20,6 +21,8 @@ from app.services.unified_bet_verification_service import (
     unified_bet_verification_service,
 )
 from app.services.yetai_bets_service_db import YetAIBetsServiceDB
+from app.core.metrics import scheduler_task_duration
+from app.core.query_instrumentation import track_queries
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +105,16 @@ class BetSchedulerService:
                     continue
 
                 # Run verification
-                await self._run_verification()
+                started = time.perf_counter()
+                outcome = "failed"
+                try:
+                    with track_queries("task:bet_verification"):
+                        await self._run_verification()
+                    outcome = "completed"
+                finally:
+                    scheduler_task_duration.observe(
+                        time.perf_counter() - started, "bet_verification", outcome
+                    )
 
                 # Wait for next interval
                 await asyncio.sleep(self.config.interval_minutes * 60)
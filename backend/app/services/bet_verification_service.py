@@ -18,7 +18,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, desc
 
 from app.core.database import SessionLocal
@@ -32,8 +32,13 @@ from app.models.database_models import (
     GameStatus,
 )
 from app.models.simple_unified_bet_model import SimpleUnifiedBet
+from app.services.bet_exposure_service import bet_exposure_service
 from app.services.odds_api_service import OddsAPIService, Score
 from app.services.optimized_odds_api_service import get_optimized_odds_service
+from app.services.parlay_settlement_engine import (
+    evaluate_parlay,
+    parlay_settlement_engine,
+)
 from app.services.websocket_manager import manager as websocket_manager
 from app.core.config import settings
 
@@ -264,13 +269,6 @@ class BetVerificationService:
                         logger.info(
                             f"Parlay {parlay.id} could not be verified (not all legs final)"
                         )
-                        # NEW: Even if parlay itself can't be verified yet, check if we should settle based on already-settled legs
-                        try:
-                            await self._check_and_settle_parent_parlay(parlay.id)
-                        except Exception as check_error:
-                            logger.error(
-                                f"Error checking parlay {parlay.id} leg status: {check_error}"
-                            )
                 except Exception as e:
                     logger.error(f"Error verifying parlay {parlay.id}: {e}")
 
@@ -309,51 +307,17 @@ class BetVerificationService:
             db.close()
 
     async def _get_pending_parlays(self) -> List[ParlayBet]:
-        """Get all pending parlay bets with their legs"""
+        """Get all pending parlay bets with their legs eager-loaded"""
         db = SessionLocal()
         try:
             # Query both old ParlayBet model and new SimpleUnifiedBet model for parlays
             old_parlays = (
-                db.query(ParlayBet).filter(ParlayBet.status == BetStatus.PENDING).all()
-            )
-            new_parlays = (
-                db.query(SimpleUnifiedBet)
-                .filter(
-                    SimpleUnifiedBet.is_parlay == True,
-                    SimpleUnifiedBet.status == BetStatus.PENDING,
-                )
+                db.query(ParlayBet)
+                .options(joinedload(ParlayBet.legs))
+                .filter(ParlayBet.status == BetStatus.PENDING)
                 .all()
             )
-
-            # Attach legs to old-style parlays
-            for parlay in old_parlays:
-                parlay.legs = db.query(Bet).filter(Bet.parlay_id == parlay.id).all()
-
-            # Attach legs to new-style parlays
-            for parlay in new_parlays:
-                # Try parent_bet_id first
-                legs = (
-                    db.query(SimpleUnifiedBet)
-                    .filter(SimpleUnifiedBet.parent_bet_id == parlay.id)
-                    .all()
-                )
-
-                # If no legs via parent_bet_id, try parlay_legs JSON field
-                if not legs and hasattr(parlay, "parlay_legs") and parlay.parlay_legs:
-                    leg_ids = (
-                        parlay.parlay_legs
-                        if isinstance(parlay.parlay_legs, list)
-                        else []
-                    )
-                    if leg_ids:
-                        legs = (
-                            db.query(SimpleUnifiedBet)
-                            .filter(SimpleUnifiedBet.id.in_(leg_ids))
-                            .all()
-                        )
-
-                parlay.legs = legs
-
+            new_parlays = parlay_settlement_engine.load_pending_parlays(db)
             return old_parlays + new_parlays
         finally:
             db.close()
@@ -965,146 +929,39 @@ class BetVerificationService:
         """
         Verify a parlay bet (all legs must win)
 
-        Returns:
-            BetResult for the entire parlay, and settles individual legs
+        Settles legs whose games are final, then decides the parlay once
+        from every leg's status with the shared parlay state machine.
         """
         if not hasattr(parlay, "legs") or not parlay.legs:
             return None
 
-        leg_results = []
-        pending_legs = 0
-        won_legs = 0
-        lost_legs = 0
-        pushed_legs = 0
-
         logger.info(f"Verifying parlay {parlay.id} with {len(parlay.legs)} legs")
 
+        legs = []
         for leg in parlay.legs:
-            # Check if leg is already settled (manually or previously)
-            if leg.status != BetStatus.PENDING:
-                logger.info(f"Leg {leg.id} already settled: {leg.status.value}")
-                if leg.status == BetStatus.WON:
-                    won_legs += 1
-                elif leg.status == BetStatus.LOST:
-                    lost_legs += 1
-                elif leg.status == BetStatus.PUSHED:
-                    pushed_legs += 1
-                continue
-
-            # Process pending legs with API data
-            if leg.game_id not in game_results:
-                pending_legs += 1
-                logger.info(f"Leg {leg.id} pending: no game result available")
-                continue
-
-            game_result = game_results[leg.game_id]
-            if not game_result.is_final:
-                pending_legs += 1
-                logger.info(f"Leg {leg.id} pending: game not final")
-                continue
-
-            leg_result = await self._verify_single_bet(leg, game_result)
-            if not leg_result:
-                pending_legs += 1
-                logger.info(f"Leg {leg.id} pending: could not verify")
-                continue
-
-            leg_results.append(leg_result)
-
-            # Settle individual leg with its actual outcome
-            await self._settle_bet(leg, leg_result)
-            logger.info(f"Settled leg {leg.id}: {leg_result.status.value}")
-
-            if leg_result.status == BetStatus.WON:
-                won_legs += 1
-            elif leg_result.status == BetStatus.LOST:
-                lost_legs += 1
-            elif leg_result.status == BetStatus.PUSHED:
-                pushed_legs += 1
-
-        logger.info(
-            f"Parlay {parlay.id} leg summary: {won_legs} won, {lost_legs} lost, "
-            f"{pushed_legs} pushed, {pending_legs} pending"
+            status = leg.status
+            game_result = game_results.get(leg.game_id)
+            if status == BetStatus.PENDING and game_result and game_result.is_final:
+                leg_result = await self._verify_single_bet(leg, game_result)
+                if leg_result:
+                    await self._settle_bet(leg, leg_result)
+                    logger.info(f"Settled leg {leg.id}: {leg_result.status.value}")
+                    status = leg_result.status
+            legs.append((status, getattr(leg, "odds", None)))
+
+        _, status, result_amount, reasoning = evaluate_parlay(
+            parlay.amount, parlay.potential_win, legs
         )
-
-        # CRITICAL: If ANY leg has lost, the entire parlay loses immediately
-        if lost_legs > 0:
-            logger.info(f"Parlay {parlay.id} LOST: {lost_legs} legs lost")
-            return BetResult(
-                bet_id=parlay.id,
-                status=BetStatus.LOST,
-                result_amount=0,
-                reasoning=f"Parlay lost: {lost_legs} of {len(parlay.legs)} legs lost",
-            )
-
-        # If any legs are still pending, don't settle the parlay yet
-        if pending_legs > 0:
-            logger.info(
-                f"Parlay {parlay.id} still pending: {pending_legs} legs pending"
-            )
+        if status == BetStatus.PENDING:
+            logger.info(f"Parlay {parlay.id}: {reasoning}")
             return None
 
-        total_legs = len(parlay.legs)
-        active_legs = (
-            total_legs - pushed_legs
-        )  # Pushes reduce the number of legs needed
-
-        # Parlay rules:
-        # - If any leg loses, entire parlay loses
-        # - If all remaining legs (after pushes) win, parlay wins
-        # - If all legs push, parlay pushes
-
-        if lost_legs > 0:
-            # Parlay lost
-            return BetResult(
-                bet_id=parlay.id,
-                status=BetStatus.LOST,
-                result_amount=0,
-                reasoning=f"Parlay lost: {lost_legs} of {total_legs} legs lost",
-            )
-        elif active_legs == 0:
-            # All legs pushed
-            return BetResult(
-                bet_id=parlay.id,
-                status=BetStatus.PUSHED,
-                result_amount=parlay.amount,
-                reasoning=f"Parlay pushed: All {total_legs} legs pushed",
-            )
-        elif won_legs == active_legs:
-            # All active legs won
-            # Recalculate payout based on reduced legs (pushes removed)
-            adjusted_payout = self._calculate_adjusted_parlay_payout(
-                parlay, leg_results
-            )
-            return BetResult(
-                bet_id=parlay.id,
-                status=BetStatus.WON,
-                result_amount=parlay.amount + adjusted_payout,
-                reasoning=f"Parlay won: {won_legs} legs won, {pushed_legs} legs pushed",
-            )
-        else:
-            # This shouldn't happen if logic is correct
-            logger.error(
-                f"Unexpected parlay state: {won_legs} won, {lost_legs} lost, {pushed_legs} pushed, {pending_legs} pending"
-            )
-            return None
-
-    def _calculate_adjusted_parlay_payout(
-        self, parlay: ParlayBet, leg_results: List[BetResult]
-    ) -> float:
-        """Calculate adjusted payout for parlay with pushed legs removed"""
-        winning_legs = [
-            result for result in leg_results if result.status == BetStatus.WON
-        ]
-
-        if len(winning_legs) <= 1:
-            # With pushes, might end up with 1 or 0 legs - treat as original single bet odds
-            return parlay.potential_win
-
-        # Recalculate based on remaining legs (simplified - would need actual leg odds for precise calculation)
-        # For now, use the original potential win adjusted proportionally
-        adjustment_factor = len(winning_legs) / parlay.leg_count
-        return parlay.potential_win * adjustment_factor
+        return BetResult(
+            bet_id=parlay.id,
+            status=status,
+            result_amount=result_amount,
+            reasoning=reasoning,
+        )
 
     async def _settle_bet(self, bet: Bet, result: BetResult) -> None:
         """Update database with bet result"""
@@ -1123,6 +980,8 @@ class BetVerificationService:
                 return
 
             old_status = db_bet.status
+            if old_status == BetStatus.PENDING:
+                bet_exposure_service.release_bets(db, [db_bet])
 
             # Update the main bet record
             db_bet.status = result.status
@@ -1156,22 +1015,6 @@ class BetVerificationService:
                     f"Failed to send notification for bet {bet.id}: {notify_error}"
                 )
 
-            # IMPORTANT: If this is a parlay leg, check if parent parlay should be settled
-            # Check for parent_bet_id (SimpleUnifiedBet) or parlay_id (old Bet model)
-            parent_id = getattr(db_bet, "parent_bet_id", None) or getattr(
-                db_bet, "parlay_id", None
-            )
-            if parent_id:
-                logger.info(
-                    f"Leg {bet.id} is part of parlay {parent_id}, checking if parlay should be settled"
-                )
-                try:
-                    await self._check_and_settle_parent_parlay(parent_id)
-                except Exception as parlay_error:
-                    logger.error(
-                        f"Error checking parent parlay {parent_id}: {parlay_error}"
-                    )
-
         except Exception as e:
             db.rollback()
             logger.error(f"❌ Error settling bet {bet.id}: {e}")
@@ -1185,152 +1028,6 @@ class BetVerificationService:
         finally:
             db.close()
 
-    async def _check_and_settle_parent_parlay(self, parlay_id: str) -> None:
-        """
-        Check if a parlay should be settled after one of its legs is settled.
-        - If ANY leg is lost, settle parlay as LOST immediately
-        - If ALL legs are settled (won/pushed), settle parlay as WON or PUSHED
-        """
-        db = SessionLocal()
-        try:
-            # Get the parlay - try SimpleUnifiedBet first (current model)
-            parlay = (
-                db.query(SimpleUnifiedBet)
-                .filter(SimpleUnifiedBet.id == parlay_id)
-                .first()
-            )
-            if not parlay:
-                # Fallback to old ParlayBet model if needed
-                parlay = db.query(ParlayBet).filter(ParlayBet.id == parlay_id).first()
-
-            if not parlay:
-                logger.error(f"Parlay {parlay_id} not found in any table")
-                return
-
-            # If parlay is already settled, skip
-            if parlay.status != BetStatus.PENDING:
-                logger.info(
-                    f"Parlay {parlay_id} already settled as {parlay.status.value}"
-                )
-                return
-
-            # Get all legs for this parlay
-            legs = (
-                db.query(SimpleUnifiedBet)
-                .filter(SimpleUnifiedBet.parent_bet_id == parlay_id)
-                .all()
-            )
-
-            # NEW: If no legs found via parent_bet_id, try using parlay_legs JSON field
-            if not legs and hasattr(parlay, "parlay_legs") and parlay.parlay_legs:
-                logger.info(
-                    f"No legs found via parent_bet_id for parlay {parlay_id}, trying parlay_legs JSON field"
-                )
-                # parlay_legs is a JSON array of bet IDs
-                leg_ids = (
-                    parlay.parlay_legs if isinstance(parlay.parlay_legs, list) else []
-                )
-                if leg_ids:
-                    legs = (
-                        db.query(SimpleUnifiedBet)
-                        .filter(SimpleUnifiedBet.id.in_(leg_ids))
-                        .all()
-                    )
-                    logger.info(f"Found {len(legs)} legs via parlay_legs JSON field")
-
-            if not legs:
-                logger.error(
-                    f"No legs found for parlay {parlay_id} via parent_bet_id or parlay_legs"
-                )
-                return
-
-            won_legs = 0
-            lost_legs = 0
-            pushed_legs = 0
-            pending_legs = 0
-
-            for leg in legs:
-                if leg.status == BetStatus.WON:
-                    won_legs += 1
-                elif leg.status == BetStatus.LOST:
-                    lost_legs += 1
-                elif leg.status == BetStatus.PUSHED:
-                    pushed_legs += 1
-                elif leg.status == BetStatus.PENDING:
-                    pending_legs += 1
-
-            logger.info(
-                f"Parlay {parlay_id} status: {won_legs} won, {lost_legs} lost, "
-                f"{pushed_legs} pushed, {pending_legs} pending out of {len(legs)} legs"
-            )
-
-            # RULE 1: If ANY leg is lost, parlay loses immediately
-            if lost_legs > 0:
-                logger.info(f"❌ Parlay {parlay_id} LOST: {lost_legs} legs lost")
-                result = BetResult(
-                    bet_id=parlay_id,
-                    status=BetStatus.LOST,
-                    result_amount=0,
-                    reasoning=f"Parlay lost: {lost_legs} of {len(legs)} legs lost",
-                )
-                await self._settle_parlay(parlay, result)
-                return
-
-            # RULE 2: If any legs are still pending, don't settle yet
-            if pending_legs > 0:
-                logger.info(
-                    f"⏳ Parlay {parlay_id} still pending: {pending_legs} legs not yet settled"
-                )
-                return
-
-            # RULE 3: All legs are settled (won/pushed)
-            total_legs = len(legs)
-            active_legs = total_legs - pushed_legs
-
-            if active_legs == 0:
-                # All legs pushed - refund
-                logger.info(f"🔄 Parlay {parlay_id} PUSHED: all legs pushed")
-                result = BetResult(
-                    bet_id=parlay_id,
-                    status=BetStatus.PUSHED,
-                    result_amount=parlay.amount,
-                    reasoning=f"Parlay pushed: All {total_legs} legs pushed",
-                )
-            elif won_legs == active_legs:
-                # All active legs won - calculate payout
-                logger.info(
-                    f"✅ Parlay {parlay_id} WON: all {active_legs} active legs won"
-                )
-                # Use the original potential_win if no pushes, otherwise recalculate
-                if pushed_legs == 0:
-                    payout = parlay.potential_win
-                else:
-                    # Recalculate based on remaining legs
-                    payout = self._calculate_adjusted_parlay_payout(parlay, pushed_legs)
-
-                result = BetResult(
-                    bet_id=parlay_id,
-                    status=BetStatus.WON,
-                    result_amount=parlay.amount + payout,
-                    reasoning=f"Parlay won: All {active_legs} active legs won (out of {total_legs} total legs)",
-                )
-            else:
-                logger.warning(
-                    f"⚠️ Unexpected parlay state for {parlay_id}: "
-                    f"{won_legs} won, {lost_legs} lost, {pushed_legs} pushed, {pending_legs} pending"
-                )
-                return
-
-            await self._settle_parlay(parlay, result)
-
-        except Exception as e:
-            logger.error(f"Error checking parent parlay {parlay_id}: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
-        finally:
-            db.close()
-
     async def _settle_parlay(self, parlay, result: BetResult) -> None:
         """Update database with parlay result and individual leg outcomes"""
         db = SessionLocal()
@@ -1354,6 +1051,8 @@ class BetVerificationService:
                 return
 
             old_status = db_parlay.status
+            if old_status == BetStatus.PENDING:
+                bet_exposure_service.release_bets(db, [db_parlay])
             db_parlay.status = result.status
             db_parlay.result_amount = result.result_amount
             db_parlay.settled_at = datetime.utcnow()
@@ -7,13 +7,50 @@ to reduce API calls and improve response times.
 
 import json
 import asyncio
+import fnmatch
 import hashlib
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Iterable, List, Set, Union
 from datetime import datetime, timedelta
 import logging
 
+from app.core.metrics import cache_requests
+
 logger = logging.getLogger(__name__)
 
+# Redis set holding the keys registered under a tag
+TAG_KEY_PREFIX = "odds_api:tag:"
+
+# Tag sets outlive the entries they index; stale members are harmless
+TAG_TTL_SECONDS = 86400
+
+# Keys fetched per SCAN/SSCAN round trip and unlinked per pipeline
+SCAN_BATCH_SIZE = 500
+
+
+def sport_tag(sport_key: str) -> str:
+    return f"sport:{sport_key}"
+
+
+def event_tag(event_id: str) -> str:
+    return f"event:{event_id}"
+
+
+def market_tag(market: str) -> str:
+    return f"market:{market}"
+
+
+def _cache_name(key: str) -> str:
+    """Metrics label for a key: its prefix, e.g. odds_api:odds:<hash> -> odds"""
+    parts = key.split(":")
+    return parts[1] if len(parts) > 2 else parts[0]
+
+
+def market_tags(markets: Optional[str]) -> List[str]:
+    """Tags for a comma-separated markets parameter"""
+    if not markets:
+        return []
+    return [market_tag(m.strip()) for m in markets.split(",") if m.strip()]
+
 
 class InMemoryCache:
     """
@@ -23,13 +60,32 @@ class InMemoryCache:
 
     def __init__(self):
         self._cache: Dict[str, Dict[str, Any]] = {}
+        # Reverse index: tag -> keys, and key -> tags for cleanup
+        self._tags: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Set[str]] = {}
         self._cleanup_task = None
         self._start_cleanup_task()
 
     def _start_cleanup_task(self):
         """Start background task to clean up expired entries"""
-        if not self._cleanup_task:
-            self._cleanup_task = asyncio.create_task(self._cleanup_expired())
+        if self._cleanup_task:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Created at import time; started on first use inside the loop
+            return
+        self._cleanup_task = asyncio.create_task(self._cleanup_expired())
+
+    def _drop(self, key: str):
+        """Remove an entry and its tag index references"""
+        self._cache.pop(key, None)
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
 
     async def _cleanup_expired(self):
         """Remove expired entries every 5 minutes"""
@@ -44,7 +100,7 @@ class InMemoryCache:
                         expired_keys.append(key)
 
                 for key in expired_keys:
-                    del self._cache[key]
+                    self._drop(key)
 
                 if expired_keys:
                     logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
@@ -59,28 +115,58 @@ class InMemoryCache:
 
         entry = self._cache[key]
         if entry["expires_at"] < datetime.utcnow():
-            del self._cache[key]
+            self._drop(key)
             return None
 
         return entry["value"]
 
-    async def set(self, key: str, value: str, expire_seconds: int = 300):
-        """Set value in cache with expiration"""
+    async def set(
+        self,
+        key: str,
+        value: str,
+        expire_seconds: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ):
+        """Set value in cache with expiration, registering it under ``tags``"""
+        self._start_cleanup_task()
+        self._drop(key)
         expires_at = datetime.utcnow() + timedelta(seconds=expire_seconds)
         self._cache[key] = {
             "value": value,
             "expires_at": expires_at,
             "created_at": datetime.utcnow(),
         }
+        if tags:
+            key_tags = set(tags)
+            self._key_tags[key] = key_tags
+            for tag in key_tags:
+                self._tags.setdefault(tag, set()).add(key)
 
     async def delete(self, key: str):
         """Delete key from cache"""
-        if key in self._cache:
-            del self._cache[key]
+        self._drop(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete every entry registered under any of ``tags``"""
+        keys: Set[str] = set()
+        for tag in tags:
+            keys |= self._tags.get(tag, set())
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete entries whose key matches a glob pattern"""
+        keys = [key for key in self._cache if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            self._drop(key)
+        return len(keys)
 
     async def clear(self):
         """Clear all cache entries"""
         self._cache.clear()
+        self._tags.clear()
+        self._key_tags.clear()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -98,6 +184,7 @@ class InMemoryCache:
             "total_entries": len(self._cache),
             "active_entries": active_entries,
             "expired_entries": expired_entries,
+            "tags": len(self._tags),
             "cache_type": "in_memory",
         }
 
@@ -172,6 +259,7 @@ class CacheService:
                 try:
                     cached_data = await self._redis_client.get(key)
                     if cached_data:
+                        cache_requests.inc(_cache_name(key), "hit_redis")
                         return json.loads(cached_data)
                 except Exception as e:
                     logger.warning(f"Redis get failed, falling back to memory: {e}")
@@ -179,29 +267,48 @@ class CacheService:
             # Fall back to in-memory cache
             cached_data = await self._memory_cache.get(key)
             if cached_data:
+                cache_requests.inc(_cache_name(key), "hit_memory")
                 return json.loads(cached_data)
 
+            cache_requests.inc(_cache_name(key), "miss")
             return None
 
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             return None
 
-    async def set(self, key: str, data: Dict[str, Any], expire_seconds: int = 300):
-        """Set cached data with expiration"""
+    async def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        expire_seconds: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ):
+        """Set cached data with expiration
+
+        ``tags`` (e.g. sport, event, market) register the key so it can be
+        evicted later with ``invalidate_tags`` regardless of how it was hashed.
+        """
         try:
             serialized_data = json.dumps(data, default=str)
+            tags = list(tags or [])
 
             # Try Redis first
             if self._redis_available and await self._test_redis_connection():
                 try:
-                    await self._redis_client.setex(key, expire_seconds, serialized_data)
+                    async with self._redis_client.pipeline(transaction=False) as pipe:
+                        pipe.setex(key, expire_seconds, serialized_data)
+                        for tag in tags:
+                            tag_key = f"{TAG_KEY_PREFIX}{tag}"
+                            pipe.sadd(tag_key, key)
+                            pipe.expire(tag_key, max(expire_seconds, TAG_TTL_SECONDS))
+                        await pipe.execute()
                     return
                 except Exception as e:
                     logger.warning(f"Redis set failed, falling back to memory: {e}")
 
             # Fall back to in-memory cache
-            await self._memory_cache.set(key, serialized_data, expire_seconds)
+            await self._memory_cache.set(key, serialized_data, expire_seconds, tags)
 
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
@@ -222,25 +329,75 @@ class CacheService:
         except Exception as e:
             logger.error(f"Cache delete error for key {key}: {e}")
 
+    async def _unlink_batches(self, keys) -> int:
+        """UNLINK keys from an async iterator in pipelined batches"""
+        removed = 0
+        batch: List[str] = []
+        async for key in keys:
+            batch.append(key)
+            if len(batch) >= SCAN_BATCH_SIZE:
+                removed += await self._unlink(batch)
+                batch = []
+        if batch:
+            removed += await self._unlink(batch)
+        return removed
+
+    async def _unlink(self, keys: List[str]) -> int:
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.unlink(*keys)
+            results = await pipe.execute()
+        return int(results[0] or 0)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete exactly the keys registered under any of ``tags``
+
+        Tag members are read with SSCAN and removed with pipelined UNLINK so
+        large tags never block Redis. Returns the number of entries removed.
+        """
+        removed = 0
+        try:
+            if self._redis_available and await self._test_redis_connection():
+                try:
+                    for tag in tags:
+                        tag_key = f"{TAG_KEY_PREFIX}{tag}"
+                        removed += await self._unlink_batches(
+                            self._redis_client.sscan_iter(
+                                tag_key, count=SCAN_BATCH_SIZE
+                            )
+                        )
+                        await self._redis_client.unlink(tag_key)
+                except Exception as e:
+                    logger.warning(f"Redis tag invalidation failed: {e}")
+
+            removed += await self._memory_cache.invalidate_tags(tags)
+            logger.info(f"Invalidated {removed} cache entries for tags: {list(tags)}")
+
+        except Exception as e:
+            logger.error(f"Cache tag invalidation error for tags {tags}: {e}")
+
+        return removed
+
     async def clear_pattern(self, pattern: str):
         """Clear all keys matching a pattern"""
         try:
             if self._redis_available and await self._test_redis_connection():
                 try:
-                    keys = await self._redis_client.keys(pattern)
-                    if keys:
-                        await self._redis_client.delete(*keys)
-                        logger.info(
-                            f"Cleared {len(keys)} Redis keys matching pattern: {pattern}"
+                    # SCAN instead of KEYS so the server is never blocked
+                    removed = await self._unlink_batches(
+                        self._redis_client.scan_iter(
+                            match=pattern, count=SCAN_BATCH_SIZE
                         )
+                    )
+                    logger.info(
+                        f"Cleared {removed} Redis keys matching pattern: {pattern}"
+                    )
                 except Exception as e:
                     logger.warning(f"Redis pattern clear failed: {e}")
 
-            # For in-memory cache, we'd need to implement pattern matching
-            # For simplicity, just clear all if it's a wildcard pattern
-            if pattern.endswith("*"):
-                await self._memory_cache.clear()
-                logger.info("Cleared all in-memory cache entries")
+            removed = await self._memory_cache.delete_pattern(pattern)
+            logger.info(
+                f"Cleared {removed} in-memory cache entries matching pattern: {pattern}"
+            )
 
         except Exception as e:
             logger.error(f"Cache pattern clear error for pattern {pattern}: {e}")
@@ -295,7 +452,12 @@ class CacheService:
             odds_format=odds_format,
             bookmakers=bookmakers,
         )
-        await self.set(key, data, expire_seconds)
+        await self.set(
+            key,
+            data,
+            expire_seconds,
+            tags=[sport_tag(sport_key), *market_tags(markets)],
+        )
 
     async def get_scores(
         self, sport_key: str, days_from: int
@@ -317,7 +479,7 @@ class CacheService:
         key = self._generate_cache_key(
             "scores", sport_key=sport_key, days_from=days_from
         )
-        await self.set(key, data, expire_seconds)
+        await self.set(key, data, expire_seconds, tags=[sport_tag(sport_key)])
 
     async def get_event_odds(
         self,
@@ -361,18 +523,20 @@ class CacheService:
             odds_format=odds_format,
             bookmakers=bookmakers,
         )
-        await self.set(key, data, expire_seconds)
+        await self.set(
+            key,
+            data,
+            expire_seconds,
+            tags=[sport_tag(sport_key), event_tag(event_id), *market_tags(markets)],
+        )
 
-    async def invalidate_sport_caches(self, sport_key: str):
+    async def invalidate_sport_caches(self, sport_key: str) -> int:
         """Invalidate all caches for a specific sport"""
-        patterns = [
-            f"odds_api:odds:*sport_key={sport_key}*",
-            f"odds_api:scores:*sport_key={sport_key}*",
-            f"odds_api:event_odds:*sport_key={sport_key}*",
-        ]
+        return await self.invalidate_tags(sport_tag(sport_key))
 
-        for pattern in patterns:
-            await self.clear_pattern(pattern)
+    async def invalidate_event_caches(self, event_id: str) -> int:
+        """Invalidate all caches for a specific event"""
+        return await self.invalidate_tags(event_tag(event_id))
 
     async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
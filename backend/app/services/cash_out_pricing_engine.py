@@ -0,0 +1,260 @@
+"""
+Vectorized cash out pricing for open live bets
+
+Loads every open live bet on a game into NumPy arrays, reprices them in a
+single step from the current game state and writes the new values back with
+one bulk UPDATE. Only offers that moved past the publish threshold since
+they were last published are returned for broadcasting.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import and_, bindparam, select, update
+from sqlalchemy.orm import Session
+
+from app.models.database_models import LiveBet as LiveBetDB, BetStatus
+from app.models.live_bet_models import GameStatus, LiveGameUpdate
+
+logger = logging.getLogger(__name__)
+
+# Selection side codes used in the pricing arrays
+SIDE_NEUTRAL = 0
+SIDE_HOME = 1
+SIDE_AWAY = 2
+
+# Game phases where the offer gets the late-game boost
+LATE_GAME_STATUSES = {GameStatus.FOURTH_QUARTER, GameStatus.SECOND_HALF}
+
+
+@dataclass
+class CashOutChange:
+    """A repriced cash out offer that moved past the publish threshold"""
+
+    bet_id: str
+    user_id: int
+    amount: float
+    potential_win: float
+    # The offer last published, None if this is the first
+    old_value: Optional[float]
+    new_value: float
+
+
+@dataclass
+class CashOutRepriceResult:
+    """Summary of a game-wide reprice"""
+
+    game_id: str
+    bets_priced: int = 0
+    bets_updated: int = 0
+    changes: List[CashOutChange] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+
+def resolve_selection_side(
+    selection: Optional[str],
+    home_team: Optional[str] = None,
+    away_team: Optional[str] = None,
+) -> int:
+    """Map a stored selection ("home", "away" or a team name) to a side code"""
+    if not selection:
+        return SIDE_NEUTRAL
+
+    value = selection.strip().lower()
+    if value == "home" or (home_team and value == home_team.strip().lower()):
+        return SIDE_HOME
+    if value == "away" or (away_team and value == away_team.strip().lower()):
+        return SIDE_AWAY
+    return SIDE_NEUTRAL
+
+
+def price_cash_out(
+    amounts: np.ndarray,
+    potential_wins: np.ndarray,
+    sides: np.ndarray,
+    game_state: LiveGameUpdate,
+) -> np.ndarray:
+    """Price cash out offers for many bets on the same game at once
+
+    The score adjustment only depends on the side of the bet, so the three
+    possible multipliers are computed once and gathered by side code.
+    """
+    score_diff = game_state.home_score - game_state.away_score
+
+    home_edge = score_diff
+    away_edge = -score_diff
+    factors = np.array(
+        [
+            1.0,
+            1 + home_edge * (0.1 if home_edge > 0 else 0.05),
+            1 + away_edge * (0.1 if away_edge > 0 else 0.05),
+        ]
+    )
+
+    values = amounts * factors[sides]
+
+    if game_state.status in LATE_GAME_STATUSES:
+        values = values * 1.1
+
+    # Cap at potential win
+    return np.minimum(values, potential_wins * 0.95)
+
+
+class CashOutPricingEngine:
+    """Reprices every open live bet on a game in one vectorized pass"""
+
+    def __init__(self, publish_threshold: float = 0.50):
+        # Minimum absolute change (in dollars) before an offer is re-published
+        self.publish_threshold = publish_threshold
+        # game id -> bet id -> offer last published, for bets still open
+        self._published: Dict[str, Dict[str, float]] = {}
+
+    def price_single(
+        self,
+        amount: float,
+        potential_win: float,
+        selection: Optional[str],
+        game_state: LiveGameUpdate,
+        home_team: Optional[str] = None,
+        away_team: Optional[str] = None,
+    ) -> float:
+        """Price one bet through the same vectorized path"""
+        side = resolve_selection_side(selection, home_team, away_team)
+        value = price_cash_out(
+            np.array([amount], dtype=np.float64),
+            np.array([potential_win], dtype=np.float64),
+            np.array([side], dtype=np.int8),
+            game_state,
+        )
+        return float(value[0])
+
+    def reprice_game(
+        self,
+        db: Session,
+        game_state: LiveGameUpdate,
+        publish_threshold: Optional[float] = None,
+    ) -> CashOutRepriceResult:
+        """Reprice all open live bets for a game and bulk-write the new values
+
+        The caller owns the session and is responsible for committing.
+        """
+        started = datetime.utcnow()
+        threshold = (
+            self.publish_threshold if publish_threshold is None else publish_threshold
+        )
+        result = CashOutRepriceResult(game_id=game_state.game_id)
+
+        rows = db.execute(
+            select(
+                LiveBetDB.id,
+                LiveBetDB.user_id,
+                LiveBetDB.amount,
+                LiveBetDB.potential_win,
+                LiveBetDB.selection,
+                LiveBetDB.home_team,
+                LiveBetDB.away_team,
+                LiveBetDB.cash_out_value,
+            ).where(
+                and_(
+                    LiveBetDB.game_id == game_state.game_id,
+                    LiveBetDB.status == BetStatus.LIVE.value,
+                    LiveBetDB.cash_out_available.is_(True),
+                )
+            )
+        ).all()
+
+        if not rows:
+            self._published.pop(game_state.game_id, None)
+            return result
+
+        (
+            bet_ids,
+            user_ids,
+            amounts,
+            potential_wins,
+            selections,
+            home_teams,
+            away_teams,
+            old_values,
+        ) = zip(*rows)
+
+        count = len(bet_ids)
+        amount_arr = np.fromiter(amounts, dtype=np.float64, count=count)
+        potential_arr = np.fromiter(potential_wins, dtype=np.float64, count=count)
+        old_arr = np.array(
+            [np.nan if v is None else v for v in old_values], dtype=np.float64
+        )
+        side_arr = np.fromiter(
+            (
+                resolve_selection_side(sel, home, away)
+                for sel, home, away in zip(selections, home_teams, away_teams)
+            ),
+            dtype=np.int8,
+            count=count,
+        )
+
+        new_arr = np.round(
+            price_cash_out(amount_arr, potential_arr, side_arr, game_state), 2
+        )
+
+        missing = np.isnan(old_arr)
+        delta = np.abs(new_arr - np.where(missing, 0.0, old_arr))
+        dirty = missing | (delta > 1e-9)
+
+        # Measured from the last published offer: the stored value moves on
+        # every reprice, so small steps would never add up against it
+        published = self._published.get(game_state.game_id, {})
+        published_arr = np.fromiter(
+            (published.get(bet_id, np.nan) for bet_id in bet_ids),
+            dtype=np.float64,
+            count=count,
+        )
+        unpublished = np.isnan(published_arr)
+        publish = unpublished | (
+            np.abs(new_arr - np.where(unpublished, 0.0, published_arr)) >= threshold
+        )
+
+        dirty_idx = np.flatnonzero(dirty)
+        if dirty_idx.size:
+            # Core executemany keyed by primary key skips per-row ORM bookkeeping
+            live_bets = LiveBetDB.__table__
+            db.execute(
+                update(live_bets)
+                .where(live_bets.c.id == bindparam("b_id"))
+                .values(cash_out_value=bindparam("b_value")),
+                [{"b_id": bet_ids[i], "b_value": float(new_arr[i])} for i in dirty_idx],
+            )
+
+        result.bets_priced = count
+        result.bets_updated = int(dirty_idx.size)
+        result.changes = [
+            CashOutChange(
+                bet_id=bet_ids[i],
+                user_id=user_ids[i],
+                amount=float(amount_arr[i]),
+                potential_win=float(potential_arr[i]),
+                old_value=None if unpublished[i] else float(published_arr[i]),
+                new_value=float(new_arr[i]),
+            )
+            for i in np.flatnonzero(publish)
+        ]
+        # Bets no longer open drop out
+        self._published[game_state.game_id] = {
+            bet_id: (float(new_arr[i]) if publish[i] else published[bet_id])
+            for i, bet_id in enumerate(bet_ids)
+        }
+        result.elapsed_ms = (datetime.utcnow() - started).total_seconds() * 1000
+
+        logger.info(
+            f"Repriced {count} live bets for game {game_state.game_id}: "
+            f"{result.bets_updated} updated, {len(result.changes)} to publish "
+            f"in {result.elapsed_ms:.1f}ms"
+        )
+        return result
+
+
+# Initialize engine
+cash_out_pricing_engine = CashOutPricingEngine()
@@ -4,9 +4,10 @@ Enhanced Fantasy Analytics Service - Leverages historical data for advanced insi
 
 from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, func, desc, select
 from datetime import datetime, timedelta
 import logging
+import warnings
 import numpy as np
 from collections import defaultdict
 
@@ -16,16 +17,170 @@ from app.models.fantasy_models import (
     PlayerTrends,
     PlayerValue,
     FantasyLeague,
+    FantasyMatchup,
+    FantasyRosterSpot,
     FantasyTeam,
     TeamNeedsAnalysis,
     PlayerProjection,
     FantasyPosition,
 )
 from app.models.player_mapping import PlayerIDMapping
+from app.services.lineup_optimizer import league_slots, optimal_lineups
+from app.services.player_feature_store import player_feature_store
+from app.services.waiver_scores import waiver_score_store
 
 logger = logging.getLogger(__name__)
 
 
+# Games of history behind a projection, and the slices of it that are used
+HISTORY_GAMES = 16
+RECENT_GAMES = 6
+TREND_GAMES = 4
+
+PROJECTION_COLUMNS = (
+    "ppr_points",
+    "half_ppr_points",
+    "standard_points",
+    "snap_percentage",
+)
+
+_SCORING_COLUMNS = {"standard": "standard_points", "half_ppr": "half_ppr_points"}
+
+# Usage trend -> points added to the projection
+_TREND_ADJUSTMENTS = {"rising_fast": 2, "rising": 1, "falling_fast": -2, "falling": -1}
+
+
+def _load_history(db: Session, player_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Each player's last HISTORY_GAMES games, newest first, in one query
+
+    Returns player id -> column -> values padded with NaN to HISTORY_GAMES,
+    plus the number of games found under "games".
+    """
+    if not player_ids:
+        return {}
+    ranked = (
+        select(
+            PlayerAnalytics.player_id,
+            *(getattr(PlayerAnalytics, column) for column in PROJECTION_COLUMNS),
+            func.row_number()
+            .over(
+                partition_by=PlayerAnalytics.player_id,
+                order_by=(PlayerAnalytics.season.desc(), PlayerAnalytics.week.desc()),
+            )
+            .label("game_rank"),
+        )
+        .where(PlayerAnalytics.player_id.in_(player_ids))
+        .subquery()
+    )
+    history: Dict[int, Dict[str, Any]] = {}
+    for row in db.execute(select(ranked).where(ranked.c.game_rank <= HISTORY_GAMES)):
+        columns = history.get(row.player_id)
+        if columns is None:
+            columns = history[row.player_id] = {
+                column: [np.nan] * HISTORY_GAMES for column in PROJECTION_COLUMNS
+            }
+            columns["games"] = 0
+        columns["games"] += 1
+        for column in PROJECTION_COLUMNS:
+            value = getattr(row, column)
+            columns[column][row.game_rank - 1] = np.nan if value is None else value
+    return history
+
+
+def _truthy(values: np.ndarray) -> np.ndarray:
+    """NaN out zeros too, matching the `if g.points` filters of one projection"""
+    return np.where(values == 0, np.nan, values)
+
+
+def _nan_stat(function, values: np.ndarray, *args) -> np.ndarray:
+    # All-NaN rows are expected (players without points); they stay NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return function(values, *args, axis=1)
+
+
+def _usage_trend(snaps: np.ndarray) -> np.ndarray:
+    """_calculate_trend over each row's present values, vectorized"""
+    # Present values first, keeping their order, as the per-player list does
+    order = np.argsort(np.isnan(snaps), axis=1, kind="stable")
+    snaps = np.take_along_axis(snaps, order, axis=1)
+    count = (~np.isnan(snaps)).sum(axis=1)
+    recent = _nan_stat(np.nanmean, snaps[:, :2])
+    older = _nan_stat(np.nanmean, snaps[:, 2:])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = (recent - older) / older * 100
+    return np.select(
+        [
+            count < 2,
+            older == 0,
+            change_pct > 15,
+            change_pct > 5,
+            change_pct < -15,
+            change_pct < -5,
+        ],
+        [
+            "insufficient_data",
+            "stable",
+            "rising_fast",
+            "rising",
+            "falling_fast",
+            "falling",
+        ],
+        default="stable",
+    )
+
+
+def _project(games: Dict[str, np.ndarray], scoring_type: str) -> Dict[str, Any]:
+    """Projection figures for rows of (players x HISTORY_GAMES) game arrays"""
+    recent_ppr = _truthy(games["ppr_points"][:, :RECENT_GAMES])
+    points = _truthy(
+        games[_SCORING_COLUMNS.get(scoring_type, "ppr_points")][:, :RECENT_GAMES]
+    )
+    base_points = _nan_stat(np.nanmean, recent_ppr)
+    point_count = (~np.isnan(points)).sum(axis=1)
+    projection = np.where(point_count > 0, _nan_stat(np.nanmean, points), base_points)
+
+    enough = point_count >= 3
+    floor = np.where(enough, _nan_stat(np.nanpercentile, points, 25), projection * 0.7)
+    ceiling = np.where(
+        enough, _nan_stat(np.nanpercentile, points, 75), projection * 1.4
+    )
+
+    usage_trend = _usage_trend(games["snap_percentage"][:, :TREND_GAMES])
+    trend_adjustment = np.array(
+        [_TREND_ADJUSTMENTS.get(trend, 0) for trend in usage_trend], dtype=float
+    )
+
+    # Consistency of PPR scoring over the whole window
+    all_ppr = _truthy(games["ppr_points"])
+    ppr_count = (~np.isnan(all_ppr)).sum(axis=1)
+    mean = _nan_stat(np.nanmean, all_ppr)
+    std_dev = _nan_stat(np.nanstd, all_ppr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cv = np.where(mean > 0, std_dev / mean * 100, 100)
+    consistency_score = np.where(
+        ppr_count >= 3, np.round(100 - np.minimum(cv, 100), 1), 0
+    )
+    consistency_rating = np.select(
+        [ppr_count < 3, cv < 25, cv < 40, cv < 60],
+        ["insufficient_data", "elite", "good", "average"],
+        default="volatile",
+    )
+
+    return {
+        "projection": np.nan_to_num(projection + trend_adjustment),
+        "floor": np.nan_to_num(floor),
+        "ceiling": np.nan_to_num(ceiling),
+        "confidence": np.minimum(95, 50 + consistency_score * 0.5),
+        "trend_adjustment": trend_adjustment,
+        "consistency_rating": consistency_rating.tolist(),
+        "recent_avg": np.nan_to_num(base_points),
+        "usage_trend": usage_trend.tolist(),
+        "games_analyzed": np.minimum(games["games"], RECENT_GAMES),
+    }
+
+
 class FantasyAnalyticsService:
     """Advanced analytics service leveraging historical NFL data"""
 
@@ -44,23 +199,27 @@ class FantasyAnalyticsService:
     ) -> Dict[str, Any]:
         """Analyze player trends using historical data"""
         try:
-            # Get recent analytics data
-            recent_games = (
-                self.db.query(PlayerAnalytics)
-                .filter(PlayerAnalytics.player_id == player_id)
-                .order_by(PlayerAnalytics.season.desc(), PlayerAnalytics.week.desc())
-                .limit(weeks_back)
-                .all()
+            # Latest games across seasons, from the feature store when built
+            recent_games = player_feature_store.recent_games(
+                self.db, player_id, weeks_back
             )
+            if recent_games is None:
+                recent_games = player_feature_store.read_recent_games(
+                    self.db, player_id, weeks_back
+                )
 
             if not recent_games:
                 return {"error": "No data available for player"}
 
             # Calculate trend metrics
-            points = [g.ppr_points for g in recent_games if g.ppr_points is not None]
-            targets = [g.targets for g in recent_games if g.targets is not None]
+            points = [
+                g["ppr_points"] for g in recent_games if g["ppr_points"] is not None
+            ]
+            targets = [g["targets"] for g in recent_games if g["targets"] is not None]
             snaps = [
-                g.snap_percentage for g in recent_games if g.snap_percentage is not None
+                g["snap_percentage"]
+                for g in recent_games
+                if g["snap_percentage"] is not None
             ]
 
             # Trend calculations
@@ -111,17 +270,7 @@ class FantasyAnalyticsService:
                     },
                 },
                 "consistency": self._calculate_consistency(points),
-                "recent_games": [
-                    {
-                        "week": g.week,
-                        "season": g.season,
-                        "opponent": g.opponent,
-                        "ppr_points": g.ppr_points,
-                        "targets": g.targets,
-                        "snap_percentage": g.snap_percentage,
-                    }
-                    for g in recent_games
-                ],
+                "recent_games": recent_games,
             }
 
         except Exception as e:
@@ -746,138 +895,206 @@ class FantasyAnalyticsService:
             logger.error(f"Error generating advanced projection: {str(e)}")
             return {"error": str(e)}
 
-    def get_waiver_wire_analytics(
-        self, league_id: int, position: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Advanced waiver wire analytics using historical data"""
-        try:
-            # Get trending players based on recent usage
-            trending_query = (
-                self.db.query(
-                    PlayerAnalytics.player_id,
-                    func.avg(PlayerAnalytics.snap_percentage).label("avg_snaps"),
-                    func.avg(PlayerAnalytics.target_share).label("avg_targets"),
-                )
-                .filter(
-                    and_(
-                        # Use data from recent seasons, not just current
-                        PlayerAnalytics.season >= (self.current_season - 1),
-                        PlayerAnalytics.week >= 10,
-                    )
-                )
-                .group_by(PlayerAnalytics.player_id)
-                .having(func.avg(PlayerAnalytics.snap_percentage) > 40)
-            )
+    def get_batch_player_projections(
+        self, player_ids: List[int], week: int, league_settings: Dict[str, Any]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Projections for many players at once, keyed by player id
+
+        Same numbers as get_advanced_player_projection, computed from one
+        windowed query over every player's last 16 games and vectorized
+        across players. Players without a record or history are left out;
+        a missing mean is reported as 0.
+        """
+        player_ids = list(dict.fromkeys(player_ids))
+        if not player_ids:
+            return {}
+
+        players = {
+            row.id: row
+            for row in self.db.query(
+                FantasyPlayer.id, FantasyPlayer.name, FantasyPlayer.position
+            ).filter(FantasyPlayer.id.in_(player_ids))
+        }
+        history = _load_history(self.db, list(players))
+        if not history:
+            return {}
 
-            recommendations = []
-            for result in trending_query.all():
-                player_id = result[0]
-                avg_snaps = result[1]
+        scoring_type = league_settings.get("scoring_type", "ppr")
+        ids = list(history)
+        games = {
+            column: np.array([history[pid][column] for pid in ids])
+            for column in (*PROJECTION_COLUMNS, "games")
+        }
+        projected = _project(games, scoring_type)
 
-                player = (
-                    self.db.query(FantasyPlayer)
-                    .filter(FantasyPlayer.id == player_id)
-                    .first()
-                )
-                if not player or (position and player.position != position):
-                    continue
+        projections = {}
+        # Rounding numpy scalars, as the single-player projection does
+        for i, player_id in enumerate(ids):
+            player = players[player_id]
+            projections[player_id] = {
+                "player_id": player_id,
+                "player_name": player.name,
+                "position": player.position,
+                "week": week,
+                "projection": float(round(projected["projection"][i], 2)),
+                "floor": float(round(projected["floor"][i], 2)),
+                "ceiling": float(round(projected["ceiling"][i], 2)),
+                "confidence": float(round(projected["confidence"][i], 1)),
+                "trend_adjustment": float(round(projected["trend_adjustment"][i], 1)),
+                "consistency_rating": projected["consistency_rating"][i],
+                "scoring_type": scoring_type,
+                "factors": {
+                    "recent_avg": float(round(projected["recent_avg"][i], 2)),
+                    "usage_trend": projected["usage_trend"][i],
+                    "games_analyzed": int(projected["games_analyzed"][i]),
+                },
+            }
+        return projections
+
+    def get_roster_player_ids(
+        self,
+        team_id: Optional[int] = None,
+        league_id: Optional[int] = None,
+        week: Optional[int] = None,
+    ) -> List[int]:
+        """Players rostered on a team, or on every team of a league"""
+        query = self.db.query(FantasyRosterSpot.player_id).distinct()
+        if team_id is not None:
+            query = query.filter(FantasyRosterSpot.team_id == team_id)
+        if league_id is not None:
+            query = query.join(FantasyTeam).filter(FantasyTeam.league_id == league_id)
+        if week is not None:
+            # Weekly spots for that week plus season-long spots
+            query = query.filter(
+                or_(FantasyRosterSpot.week == week, FantasyRosterSpot.week.is_(None))
+            )
+        return sorted(player_id for (player_id,) in query)
 
-                # Check ownership (simplified - would need real ownership data)
-                ownership_pct = np.random.uniform(5, 60)  # Placeholder
+    def get_league_lineups(
+        self, league_id: int, week: int, objective: str = "projection"
+    ) -> Dict[str, Any]:
+        """
+        Every team's optimal lineup for a week, and the week's matchups
+
+        One roster query and one batch projection cover the whole league.
+        objective is projection, floor or ceiling, and each matchup compares
+        the two lineups' totals under it.
+        """
+        league = self.db.get(FantasyLeague, league_id)
+        if league is None:
+            raise ValueError(f"League {league_id} not found")
+
+        teams = {
+            team.id: team.name
+            for team in self.db.query(FantasyTeam.id, FantasyTeam.name)
+            .filter(FantasyTeam.league_id == league_id)
+            .order_by(FantasyTeam.id)
+        }
+        spots = (
+            self.db.query(FantasyRosterSpot.team_id, FantasyRosterSpot.player_id)
+            .join(FantasyTeam)
+            .filter(
+                FantasyTeam.league_id == league_id,
+                or_(FantasyRosterSpot.week == week, FantasyRosterSpot.week.is_(None)),
+            )
+            .order_by(FantasyRosterSpot.team_id, FantasyRosterSpot.player_id)
+            .all()
+        )
+        projections = self.get_batch_player_projections(
+            [player_id for _, player_id in spots],
+            week,
+            {"scoring_type": league.scoring_type or "ppr"},
+        )
 
-                if ownership_pct < 50:  # Available in most leagues
-                    # Calculate opportunity score
-                    opportunity_score = self._calculate_opportunity_score(
-                        player_id, avg_snaps
-                    )
+        rosters = {team_id: {} for team_id in teams}
+        for team_id, player_id in spots:
+            projection = projections.get(player_id)
+            if projection and team_id in rosters:
+                rosters[team_id][player_id] = {
+                    **projection,
+                    "position": getattr(
+                        projection["position"], "value", projection["position"]
+                    ),
+                }
+        lineups = optimal_lineups(
+            {team_id: list(players.values()) for team_id, players in rosters.items()},
+            league_slots(league.roster_positions),
+            objective,
+        )
 
-                    # Get recent performance
-                    recent_games = (
-                        self.db.query(PlayerAnalytics)
-                        .filter(
-                            and_(
-                                PlayerAnalytics.player_id == player_id,
-                                # Use data from recent seasons, not just current
-                                PlayerAnalytics.season >= (self.current_season - 1),
-                            )
-                        )
-                        .order_by(PlayerAnalytics.week.desc())
-                        .limit(3)
-                        .all()
-                    )
+        matchups = []
+        for matchup in (
+            self.db.query(FantasyMatchup)
+            .filter(FantasyMatchup.league_id == league_id, FantasyMatchup.week == week)
+            .order_by(FantasyMatchup.id)
+        ):
+            home = lineups.get(matchup.team1_id)
+            away = lineups.get(matchup.team2_id)
+            if home is None or away is None:
+                continue
+            matchups.append(
+                {
+                    "team1_id": matchup.team1_id,
+                    "team2_id": matchup.team2_id,
+                    "team1_total": round(home.total, 2),
+                    "team2_total": round(away.total, 2),
+                    "projected_margin": round(home.total - away.total, 2),
+                }
+            )
 
-                    recent_avg = np.mean(
-                        [g.ppr_points for g in recent_games if g.ppr_points]
-                    )
+        return {
+            "league_id": league_id,
+            "week": week,
+            "objective": objective,
+            "teams": [
+                {"team_id": team_id, "team_name": name, **lineups[team_id].to_dict()}
+                for team_id, name in teams.items()
+            ],
+            "matchups": matchups,
+        }
 
-                    recommendations.append(
-                        {
-                            "player_id": player_id,
-                            "player_name": player.name,
-                            "position": player.position,
-                            "team": player.team,
-                            "ownership_pct": round(ownership_pct, 1),
-                            "opportunity_score": round(opportunity_score, 1),
-                            "recent_ppg": round(recent_avg, 2),
-                            "avg_snap_pct": round(avg_snaps, 1),
-                            "priority": self._determine_waiver_priority(
-                                opportunity_score, ownership_pct
-                            ),
-                            "recommendation": self._generate_waiver_recommendation(
-                                opportunity_score, player.position
-                            ),
-                        }
-                    )
+    def get_waiver_wire_analytics(
+        self, league_id: int, position: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Advanced waiver wire analytics using historical data
 
-            recommendations.sort(key=lambda x: x["opportunity_score"], reverse=True)
-            return recommendations[:20]
+        The weekly waiver scores, minus players rostered in the league.
+        """
+        try:
+            league = self.db.get(FantasyLeague, league_id)
+            season = league.season if league and league.season else self.current_season
+            available = waiver_score_store.waiver_list(
+                self.db, league_id, season, position=position
+            )
+
+            return [
+                {
+                    "player_id": score["player_id"],
+                    "player_name": score["player_name"],
+                    "position": score["position"],
+                    "team": score["team"] or "FA",
+                    "ownership_pct": score["ownership_pct"],
+                    "opportunity_score": round(score["opportunity_score"], 1),
+                    "recent_ppg": score["recent_ppg"],
+                    "avg_snap_pct": round(score["avg_snap_pct"], 1),
+                    "trend": score["trend"],
+                    "position_rank": score["position_rank"],
+                    "priority": self._determine_waiver_priority(
+                        score["opportunity_score"], score["ownership_pct"]
+                    ),
+                    "recommendation": self._generate_waiver_recommendation(
+                        score["opportunity_score"], score["position"]
+                    ),
+                }
+                for score in available
+            ]
 
         except Exception as e:
             logger.error(f"Error generating waiver analytics: {str(e)}")
             return []
 
-    def _calculate_opportunity_score(self, player_id: int, avg_snaps: float) -> float:
-        """Calculate opportunity score for waiver wire"""
-        score = 0
-
-        # Snap percentage contribution
-        score += min(avg_snaps / 2, 40)
-
-        # Get recent target share
-        recent_targets = (
-            self.db.query(func.avg(PlayerAnalytics.target_share))
-            .filter(
-                and_(
-                    PlayerAnalytics.player_id == player_id,
-                    # Use data from recent seasons, not just current
-                    PlayerAnalytics.season >= (self.current_season - 1),
-                    PlayerAnalytics.week >= 10,
-                )
-            )
-            .scalar()
-        )
-
-        if recent_targets:
-            score += recent_targets * 200  # Weight target share heavily
-
-        # Red zone usage
-        rz_usage = (
-            self.db.query(func.avg(PlayerAnalytics.red_zone_touches))
-            .filter(
-                and_(
-                    PlayerAnalytics.player_id == player_id,
-                    # Use data from recent seasons, not just current
-                    PlayerAnalytics.season >= (self.current_season - 1),
-                )
-            )
-            .scalar()
-        )
-
-        if rz_usage:
-            score += rz_usage * 5
-
-        return min(score, 100)
-
     def _determine_waiver_priority(
         self, opportunity_score: float, ownership: float
     ) -> str:
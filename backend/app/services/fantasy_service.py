@@ -27,9 +27,15 @@ from app.models.fantasy_models import (
     RecommendationType,
 )
 from app.models.database_models import User
+from app.services.league_context import league_context_cache
+from app.services.lineup_optimizer import league_slots, optimal_lineup
+from app.services.waiver_scores import waiver_score_store
 
 logger = logging.getLogger(__name__)
 
+# Waiver opportunity score (0-100) per point of waiver priority; a top score adds 4
+OPPORTUNITY_SCORE_PER_PRIORITY_POINT = 25
+
 
 class FantasyPlatformInterface(ABC):
     """Abstract interface for fantasy platform integrations"""
@@ -179,6 +185,10 @@ class FantasyService:
             fantasy_user.sync_error = None
             self.db.commit()
 
+            # Standings and rosters changed under any cached trade context
+            for league in synced_leagues:
+                league_context_cache.invalidate(league.id)
+
             return {
                 "success": True,
                 "synced_leagues": len(synced_leagues),
@@ -389,6 +399,7 @@ class FantasyService:
         if user_team:
             return {
                 "id": user_team.id,
+                "platform_team_id": user_team.platform_team_id,
                 "name": user_team.name,
                 "wins": user_team.wins,
                 "losses": user_team.losses,
@@ -461,15 +472,24 @@ class FantasyService:
                 position_groups[position] = []
             position_groups[position].append(player_data)
 
-        # Generate recommendations for each position group
+        # Sort each position group by projected performance
+        ranked_groups = {}
         for position, players in position_groups.items():
             if position in ["BENCH", "IR", "UNKNOWN"]:
                 continue
+            ranked_groups[position] = await self._rank_players_by_performance(
+                players, week
+            )
 
-            # Sort players by projected performance
-            sorted_players = await self._rank_players_by_performance(players, week)
+        # Starters from the optimal lineup across every group and flex slot
+        self._mark_lineup_slots(
+            league_id,
+            [player for players in ranked_groups.values() for player in players],
+            "projected_points",
+        )
 
-            # Generate start/sit advice based on rankings and typical position slots
+        # Generate start/sit advice for each position group
+        for position, sorted_players in ranked_groups.items():
             position_recommendations = self._create_position_recommendations(
                 league_id, league_name, position, sorted_players, week
             )
@@ -478,6 +498,23 @@ class FantasyService:
 
         return recommendations
 
+    def _mark_lineup_slots(
+        self, league_id: int, players: List[Dict], objective: str
+    ) -> None:
+        """Set each player's lineup_slot: its slot in the optimal lineup, or None"""
+        league = (
+            self.db.query(FantasyLeague).filter(FantasyLeague.id == league_id).first()
+        )
+        lineup = optimal_lineup(
+            players,
+            league_slots(league.roster_positions if league else None),
+            objective,
+        )
+        for player in players:
+            player["lineup_slot"] = None
+        for slot, player in lineup.slots:
+            player["lineup_slot"] = slot
+
     async def _rank_players_by_performance(
         self, players: List[Dict], week: int
     ) -> List[Dict]:
@@ -691,24 +728,16 @@ class FantasyService:
         sorted_players: List[Dict],
         week: int,
     ) -> List[Dict[str, Any]]:
-        """Create start/sit recommendations for a position group"""
-        recommendations = []
+        """
+        Create start/sit recommendations for a position group
 
-        # Define typical starting slots per position
-        typical_starters = {
-            "QB": 1,
-            "RB": 2,
-            "WR": 2,
-            "TE": 1,
-            "FLEX": 1,
-            "K": 1,
-            "DEF": 1,
-        }
-
-        starting_slots = typical_starters.get(position, 1)
+        Starters are the players _mark_lineup_slots put in the lineup.
+        """
+        recommendations = []
 
         for i, player in enumerate(sorted_players):
-            is_starter = i < starting_slots
+            lineup_slot = player.get("lineup_slot")
+            is_starter = lineup_slot is not None
             recommendation_type = "START" if is_starter else "SIT"
 
             # Determine confidence and reasoning
@@ -717,7 +746,9 @@ class FantasyService:
 
             # Create reasoning based on ranking and projections
             if is_starter:
-                if i == 0:
+                if lineup_slot != position:
+                    reasoning = f"Best {lineup_slot} play, ranked #{i+1} at {position}"
+                elif i == 0:
                     reasoning = f"Top {position} on your roster this week"
                 else:
                     reasoning = f"Solid {position} option, ranked #{i+1} on your team"
@@ -741,6 +772,7 @@ class FantasyService:
                 "position": position,
                 "team": player.get("team", "FA"),
                 "recommendation": recommendation_type,
+                "lineup_slot": lineup_slot,
                 "projected_points": projected_points,
                 "confidence": confidence,
                 "reasoning": reasoning,
@@ -1081,6 +1113,7 @@ class FantasyService:
                 # Generate recommendations for each position group
                 position_groups = self._group_players_by_position(roster_data)
 
+                ranked_groups = {}
                 for position, players in position_groups.items():
                     if not players:
                         continue
@@ -1095,12 +1128,24 @@ class FantasyService:
                         players_with_projections.append(player_data)
 
                     # Sort by league-adjusted projected points
-                    sorted_players = sorted(
+                    ranked_groups[position] = sorted(
                         players_with_projections,
                         key=lambda x: x.get("league_adjusted_points", 0),
                         reverse=True,
                     )
 
+                # Starters from the optimal lineup on league-adjusted points
+                self._mark_lineup_slots(
+                    league_id,
+                    [
+                        player
+                        for players in ranked_groups.values()
+                        for player in players
+                    ],
+                    "league_adjusted_points",
+                )
+
+                for position, sorted_players in ranked_groups.items():
                     # Create enhanced start/sit recommendations
                     position_recommendations = (
                         self._create_enhanced_position_recommendations(
@@ -1372,19 +1417,16 @@ class FantasyService:
         week: int,
         league_rules: Dict,
     ) -> List[Dict[str, Any]]:
-        """Create enhanced start/sit recommendations with league context"""
-        recommendations = []
+        """
+        Create enhanced start/sit recommendations with league context
 
-        # Position-specific starting slots based on league rules
-        position_slots = league_rules["ai_context"]["position_scarcity"]
-        starting_slots = position_slots.get(position.lower(), 1)
-
-        # Adjust for FLEX considerations
-        if position in ["RB", "WR", "TE"]:
-            starting_slots += position_slots.get("flex", 1)  # Account for FLEX slot
+        Starters are the players _mark_lineup_slots put in the lineup.
+        """
+        recommendations = []
 
         for i, player in enumerate(sorted_players):
-            is_starter = i < starting_slots
+            lineup_slot = player.get("lineup_slot")
+            is_starter = lineup_slot is not None
             recommendation_type = "START" if is_starter else "SIT"
 
             # Get projection data
@@ -1394,12 +1436,14 @@ class FantasyService:
 
             # Enhanced reasoning with league context
             if is_starter:
-                if i == 0:
+                if lineup_slot != position:
+                    reasoning = f"Best {lineup_slot} play for {league_rules['scoring_type'].replace('_', ' ')} scoring, ranked #{i+1} at {position}"
+                elif i == 0:
                     reasoning = f"Top {position} option in {league_rules['scoring_type'].replace('_', ' ')} league"
                 else:
                     reasoning = f"Strong {position} play, ranked #{i+1} for {league_rules['scoring_type'].replace('_', ' ')} scoring"
             else:
-                reasoning = f"Bench option in {league_rules['scoring_type'].replace('_', ' ')} league, consider as FLEX if stronger than other positions"
+                reasoning = f"Bench option in {league_rules['scoring_type'].replace('_', ' ')} league, outscored at every slot it could fill"
 
             # Add league-specific context
             if league_rules["ppr_value"] > 0 and position in ["WR", "TE"]:
@@ -1421,6 +1465,7 @@ class FantasyService:
                 "position": position,
                 "team": player.get("team", "FA"),
                 "recommendation": recommendation_type,
+                "lineup_slot": lineup_slot,
                 "projected_points": player.get("projected_points", 0),
                 "league_adjusted_points": league_adjusted_points,
                 "confidence": confidence,
@@ -1449,6 +1494,9 @@ class FantasyService:
         """Generate enhanced waiver wire recommendations with league context and FAAB suggestions"""
         recommendations = []
         user_leagues = self.get_user_leagues(user_id)
+        # Trending adds are platform-wide and scores season-wide: fetch once
+        trending_by_platform: Dict[FantasyPlatform, List[Dict]] = {}
+        scores_by_season: Dict[int, Dict[str, Dict[str, Any]]] = {}
 
         for league_data in user_leagues:
             league_id = league_data["id"]
@@ -1471,10 +1519,19 @@ class FantasyService:
                     continue
 
                 # Get trending players and available players
-                trending_adds = await platform_interface.get_trending_players("add")
+                if league.platform not in trending_by_platform:
+                    trending_by_platform[league.platform] = (
+                        await platform_interface.get_trending_players("add")
+                    )
+                trending_adds = trending_by_platform[league.platform]
                 available_players = await platform_interface.get_available_players(
                     league.platform_league_id
                 )
+                if league.season not in scores_by_season:
+                    scores_by_season[league.season] = {
+                        score["platform_player_id"]: score
+                        for score in waiver_score_store.scores(self.db, league.season)
+                    }
 
                 # Get user's team to identify roster needs
                 user_team = league_data.get("user_team")
@@ -1494,6 +1551,7 @@ class FantasyService:
                     available_players,
                     roster_needs,
                     league_rules,
+                    scores_by_season[league.season],
                 )
 
                 recommendations.extend(league_recommendations)
@@ -1567,9 +1625,16 @@ class FantasyService:
         available_players: List[Dict],
         roster_needs: Dict[str, int],
         league_rules: Dict[str, Any],
+        waiver_scores: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
-        """Generate enhanced recommendations with league context and FAAB suggestions"""
+        """
+        Generate enhanced recommendations with league context and FAAB suggestions
+
+        waiver_scores (weekly scores by platform player id) add opportunity to
+        the priority of the players they cover.
+        """
         recommendations = []
+        waiver_scores = waiver_scores or {}
 
         # Create lookup for available players
         available_lookup = {p.get("player_id"): p for p in available_players}
@@ -1588,6 +1653,13 @@ class FantasyService:
             priority_score = self._calculate_enhanced_priority_score(
                 trending_player, player, roster_needs, league_rules
             )
+            score = waiver_scores.get(player_id)
+            if score:
+                priority_score = round(
+                    priority_score
+                    + score["opportunity_score"] / OPPORTUNITY_SCORE_PER_PRIORITY_POINT,
+                    2,
+                )
 
             if priority_score > 0:
                 # Generate appropriate waiver suggestions based on league type
@@ -1618,6 +1690,9 @@ class FantasyService:
                     "age": player.get("age"),
                     "experience": player.get("experience"),
                     "fantasy_positions": player.get("fantasy_positions", []),
+                    "opportunity_score": score["opportunity_score"] if score else None,
+                    "trend": score["trend"] if score else None,
+                    "position_rank": score["position_rank"] if score else None,
                 }
                 recommendations.append(recommendation)
 
@@ -2342,9 +2417,20 @@ class FantasyService:
             # Calculate league-wide insights
             league_insights = self._calculate_league_insights(league_analytics)
 
+            # Simulated odds for the rest of the season
+            season_odds = None
+            try:
+                from app.services.season_simulator import SeasonSimulator
+
+                season_odds = SeasonSimulator(self.db).league_odds(league.id)
+            except Exception as e:
+                logger.warning(f"Season simulation failed for league {league.id}: {e}")
+
             # Determine user team's competitive position
             competitive_position = self._analyze_competitive_position(
-                user_team_analytics, league_analytics
+                user_team_analytics,
+                league_analytics,
+                (season_odds or {}).get(user_team.id),
             )
 
             # Generate personalized recommendations
@@ -2439,9 +2525,17 @@ class FantasyService:
             return {}
 
     def _analyze_competitive_position(
-        self, user_team_analytics: Dict, league_analytics: List[Dict]
+        self,
+        user_team_analytics: Dict,
+        league_analytics: List[Dict],
+        season_odds: Optional[Dict[str, float]] = None,
     ) -> Dict[str, Any]:
-        """Analyze user team's competitive position in the league"""
+        """
+        Analyze user team's competitive position in the league
+
+        Playoff and championship odds come from season_odds, the team's
+        simulated odds, when given; otherwise they are estimated from rank.
+        """
         try:
             if not league_analytics:
                 return {}
@@ -2526,11 +2620,19 @@ class FantasyService:
                 ),
                 "relative_strengths": relative_strengths,
                 "relative_weaknesses": relative_weaknesses,
-                "championship_odds": self._estimate_championship_odds_from_rank(
-                    league_rank, len(league_analytics)
+                "championship_odds": (
+                    round(season_odds["championship_odds"] * 100, 1)
+                    if season_odds
+                    else self._estimate_championship_odds_from_rank(
+                        league_rank, len(league_analytics)
+                    )
                 ),
-                "playoff_probability": self._estimate_playoff_probability(
-                    league_rank, len(league_analytics)
+                "playoff_probability": (
+                    round(season_odds["playoff_odds"] * 100, 1)
+                    if season_odds
+                    else self._estimate_playoff_probability(
+                        league_rank, len(league_analytics)
+                    )
                 ),
             }
 
@@ -0,0 +1,117 @@
+"""
+Shared in-process cache of game metadata for bet placement
+
+Placement only needs a game's teams, sport and start time, which change
+rarely (the game syncs invalidate entries they rewrite). Entries expire
+after a few minutes; missing games are never cached so a game created by a
+sync is found on the next lookup.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.metrics import cache_requests
+from app.core.ttl_cache import TTLCache
+from app.models.database_models import Game, YetAIBet
+
+logger = logging.getLogger(__name__)
+
+# Seconds a game's metadata is served before it is read again
+GAME_CACHE_TTL_SECONDS = 300
+
+# Entries kept per cache (games, YetAI bets)
+GAME_CACHE_MAX_SIZE = 10_000
+
+# Marks a YetAI bet that isn't cached (a cached bet may have no game)
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class GameInfo:
+    """The columns of a Game that bet placement reads"""
+
+    id: str
+    home_team: str
+    away_team: str
+    sport_key: str
+    commence_time: Optional[datetime]
+
+
+class GameMetadataCache:
+    """Game id -> GameInfo, plus YetAI bet id -> game id, with a TTL"""
+
+    def __init__(
+        self,
+        ttl: float = GAME_CACHE_TTL_SECONDS,
+        max_size: int = GAME_CACHE_MAX_SIZE,
+    ):
+        self._games: TTLCache[str, GameInfo] = TTLCache(ttl, max_size)
+        self._yetai_games: TTLCache[str, Optional[str]] = TTLCache(ttl, max_size)
+
+    def get_many(self, db: Session, game_ids: Iterable[str]) -> Dict[str, GameInfo]:
+        """Metadata for the games that exist, one query for all cache misses"""
+        found: Dict[str, GameInfo] = {}
+        missing = []
+        for game_id in dict.fromkeys(game_id for game_id in game_ids if game_id):
+            info = self._games.get(game_id)
+            if info is not None:
+                found[game_id] = info
+            else:
+                missing.append(game_id)
+        if found:
+            cache_requests.inc("game_metadata", "hit_memory", amount=len(found))
+        if not missing:
+            return found
+
+        cache_requests.inc("game_metadata", "miss", amount=len(missing))
+        rows = db.execute(
+            select(
+                Game.id,
+                Game.home_team,
+                Game.away_team,
+                Game.sport_key,
+                Game.commence_time,
+            ).where(Game.id.in_(missing))
+        )
+        for row in rows:
+            info = GameInfo(*row)
+            found[info.id] = info
+            self._games.set(info.id, info)
+        return found
+
+    def get(self, db: Session, game_id: Optional[str]) -> Optional[GameInfo]:
+        if not game_id:
+            return None
+        return self.get_many(db, [game_id]).get(game_id)
+
+    def yetai_game_id(self, db: Session, yetai_bet_id: str) -> Optional[str]:
+        """game_id of a YetAI bet (fixed once the bet is published)"""
+        game_id = self._yetai_games.get(yetai_bet_id, _MISSING)
+        if game_id is not _MISSING:
+            cache_requests.inc("yetai_bet_game", "hit_memory")
+            return game_id
+
+        cache_requests.inc("yetai_bet_game", "miss")
+        row = db.execute(
+            select(YetAIBet.game_id).where(YetAIBet.id == yetai_bet_id)
+        ).first()
+        if row is None:
+            return None
+        self._yetai_games.set(yetai_bet_id, row[0])
+        return row[0]
+
+    def invalidate(self, game_id: Optional[str] = None) -> None:
+        """Forget one game, or everything"""
+        if game_id is None:
+            self._games.clear()
+            self._yetai_games.clear()
+        else:
+            self._games.pop(game_id, None)
+
+
+game_metadata_cache = GameMetadataCache()
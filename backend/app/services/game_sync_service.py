@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.models.database_models import Game, GameStatus
 from app.services.odds_api_service import OddsAPIService, SportKey
+from app.services.game_metadata_cache import game_metadata_cache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -388,6 +389,7 @@ class GameSyncService:
                         existing_game.home_team = api_game.home_team
                         existing_game.away_team = api_game.away_team
                         existing_game.commence_time = api_game.commence_time
+                        game_metadata_cache.invalidate(existing_game.id)
                         existing_game.last_update = datetime.utcnow()
 
                         # Only update status if it's currently placeholder
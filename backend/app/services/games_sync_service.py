@@ -19,6 +19,7 @@ from sqlalchemy import select
 from app.core.config import settings
 from app.models.database_models import Game, GameStatus
 from app.services.odds_api_service import OddsAPIService
+from app.services.game_metadata_cache import game_metadata_cache
 from app.core.database import get_db
 
 logger = logging.getLogger(__name__)
@@ -152,6 +153,7 @@ class GamesSyncService:
                         existing_game.home_team = game.home_team
                         existing_game.away_team = game.away_team
                         existing_game.commence_time = game.commence_time
+                        game_metadata_cache.invalidate(existing_game.id)
                         existing_game.odds_data = odds_data
                         existing_game.last_update = datetime.now(timezone.utc)
                         stats["games_updated"] += 1
@@ -1,12 +1,14 @@
+import importlib.util
 import os
 import secrets
 from typing import Dict, Optional
-from google.auth.transport.requests import Request
-from google.oauth2 import id_token
-from google_auth_oauthlib.flow import Flow
-import google.auth.transport.requests
 from app.core.config import settings
 
+# google-auth (with requests and cryptography) is imported on first OAuth
+# call; fail here only if it is missing, so callers can degrade gracefully
+if importlib.util.find_spec("google_auth_oauthlib") is None:
+    raise ImportError("google-auth-oauthlib is not installed")
+
 
 class GoogleOAuthService:
     def __init__(self):
@@ -29,6 +31,8 @@ class GoogleOAuthService:
 
     def get_authorization_url(self) -> Dict[str, str]:
         """Generate Google OAuth authorization URL"""
+        from google_auth_oauthlib.flow import Flow
+
         try:
             # Create flow instance
             flow = Flow.from_client_config(
@@ -72,6 +76,10 @@ class GoogleOAuthService:
             # Remove used state token
             del self.state_storage[state]
 
+            import google.auth.transport.requests
+            from google.oauth2 import id_token
+            from google_auth_oauthlib.flow import Flow
+
             # Create flow instance
             flow = Flow.from_client_config(
                 {
@@ -118,6 +126,9 @@ class GoogleOAuthService:
 
     def verify_id_token(self, token: str) -> Optional[Dict]:
         """Verify Google ID token (for frontend-only OAuth)"""
+        import google.auth.transport.requests
+        from google.oauth2 import id_token
+
         try:
             request = google.auth.transport.requests.Request()
             id_info = id_token.verify_oauth2_token(token, request, self.client_id)
@@ -0,0 +1,419 @@
+"""
+League context snapshots shared by the trade analyzer and recommendation engine
+
+Both engines used to rebuild league settings, standings and every team's
+roster from the database on each evaluation, and the recommendation engine
+did so once per team per candidate position. load_league_context reads a
+league's settings, teams, rosters, stored player values, tradeable picks,
+needs analyses and Sleeper records in a fixed handful of queries, and the
+result is an immutable LeagueContext.
+
+Snapshots are cached per (league, week). Roster syncs and accepted trades
+invalidate their league; writers outside this process can't, so entries
+also expire after a TTL.
+"""
+
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.metrics import cache_requests
+from app.core.ttl_cache import TTLCache
+from app.models.database_models import SleeperLeague, SleeperPlayer, SleeperRoster
+from app.models.fantasy_models import (
+    DraftPick,
+    FantasyLeague,
+    FantasyPlayer,
+    FantasyRosterSpot,
+    FantasyTeam,
+    PlayerValue,
+    TeamNeedsAnalysis,
+)
+
+logger = logging.getLogger(__name__)
+
+# Week trade contexts are built for until the NFL schedule is wired in
+CURRENT_WEEK = 8
+
+# Last week trades are allowed, unless the league says otherwise
+TRADE_DEADLINE_WEEK = 10
+
+# Seconds a snapshot is served before being rebuilt regardless
+LEAGUE_CONTEXT_TTL_SECONDS = 600
+
+# Snapshots kept in the cache
+LEAGUE_CONTEXT_MAX_SIZE = 500
+
+
+def _enum_value(value: Any) -> Optional[str]:
+    return getattr(value, "value", value)
+
+
+@dataclass(frozen=True)
+class ContextPlayer:
+    id: int
+    name: str
+    position: Optional[str]
+    team: Optional[str]
+    age: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "position": self.position,
+            "team": self.team,
+            "age": self.age,
+        }
+
+
+@dataclass(frozen=True)
+class ContextPick:
+    id: int
+    season: int
+    round_number: int
+
+
+@dataclass(frozen=True)
+class SleeperPlayerInfo:
+    """The SleeperPlayer columns player valuation reads"""
+
+    sleeper_player_id: str
+    position: Optional[str]
+    team: Optional[str]
+    age: Optional[int]
+
+
+@dataclass(frozen=True)
+class TeamSnapshot:
+    """A team's standing, roster and tradeable assets"""
+
+    team_id: int
+    name: str
+    platform_team_id: str
+    wins: int
+    losses: int
+    points_for: float
+    points_against: float
+    rank: int
+    players: Tuple[ContextPlayer, ...]
+    picks: Tuple[ContextPick, ...]
+    # Latest needs analysis at or before the snapshot's week, as columns
+    needs: Optional[Mapping[str, Any]]
+    # wins, losses and points_for from the synced Sleeper roster
+    sleeper_record: Optional[Mapping[str, float]]
+
+    def position_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for player in self.players:
+            counts[player.position] = counts.get(player.position, 0) + 1
+        return counts
+
+
+@dataclass(frozen=True)
+class LeagueContext:
+    """
+    A league as of one week: settings, teams in standings order, rosters
+    and the stored values of rostered players
+
+    Shared between callers; settings() and the team dicts built from it
+    are fresh copies.
+    """
+
+    league_id: int
+    week: int
+    season: int
+    platform_league_id: str
+    scoring_type: str
+    team_count: int
+    playoff_teams: int
+    is_dynasty: bool
+    teams: Tuple[TeamSnapshot, ...]
+    # Latest rest-of-season value of each rostered player that has one
+    player_values: Mapping[int, float]
+    # SleeperPlayer rows keyed by sleeper_player_id, for rostered players
+    # valued from Sleeper data
+    sleeper_players: Mapping[str, SleeperPlayerInfo]
+
+    @property
+    def trade_deadline_weeks(self) -> int:
+        return max(0, TRADE_DEADLINE_WEEK - self.week)
+
+    def team(self, team_id: int) -> Optional[TeamSnapshot]:
+        return next((team for team in self.teams if team.team_id == team_id), None)
+
+    def owner_of(self, player_id: int) -> Optional[TeamSnapshot]:
+        return next(
+            (
+                team
+                for team in self.teams
+                if any(player.id == player_id for player in team.players)
+            ),
+            None,
+        )
+
+    def settings(self) -> Dict[str, Any]:
+        """League context as the engines pass it around"""
+        spots = self.playoff_teams
+        return {
+            "league_id": self.league_id,
+            "season": self.season,
+            "scoring_type": self.scoring_type,
+            "team_count": self.team_count,
+            "current_week": self.week,
+            "trade_deadline_weeks": self.trade_deadline_weeks,
+            "playoff_race": {
+                "in_playoffs": len(self.teams[:spots]),
+                "bubble_teams": len(self.teams[spots : spots + 2]),
+                "eliminated": len(self.teams[spots + 2 :]),
+            },
+            "is_dynasty": self.is_dynasty,
+            "playoff_teams": spots,
+        }
+
+
+def load_league_context(
+    db: Session, league_id: int, week: int = CURRENT_WEEK
+) -> LeagueContext:
+    """Build a league's snapshot; raises ValueError for an unknown league"""
+    league = db.get(FantasyLeague, league_id)
+    if league is None:
+        raise ValueError(f"League {league_id} not found")
+
+    teams = db.execute(
+        select(
+            FantasyTeam.id,
+            FantasyTeam.name,
+            FantasyTeam.platform_team_id,
+            FantasyTeam.wins,
+            FantasyTeam.losses,
+            FantasyTeam.points_for,
+            FantasyTeam.points_against,
+        )
+        .where(FantasyTeam.league_id == league_id)
+        .order_by(FantasyTeam.id)
+    ).all()
+    team_ids = [team.id for team in teams]
+
+    rosters: Dict[int, list] = {team_id: [] for team_id in team_ids}
+    for row in db.execute(
+        select(
+            FantasyRosterSpot.team_id,
+            FantasyPlayer.id,
+            FantasyPlayer.name,
+            FantasyPlayer.position,
+            FantasyPlayer.team,
+            FantasyPlayer.age,
+        )
+        .join(FantasyPlayer, FantasyPlayer.id == FantasyRosterSpot.player_id)
+        .where(FantasyRosterSpot.team_id.in_(team_ids))
+        .order_by(FantasyRosterSpot.team_id, FantasyRosterSpot.id)
+    ):
+        rosters[row.team_id].append(
+            ContextPlayer(
+                id=row.id,
+                name=row.name,
+                position=_enum_value(row.position),
+                team=row.team,
+                age=row.age,
+            )
+        )
+    player_ids = [player.id for players in rosters.values() for player in players]
+
+    picks: Dict[int, list] = {team_id: [] for team_id in team_ids}
+    for row in db.execute(
+        select(
+            DraftPick.id,
+            DraftPick.current_owner_team_id,
+            DraftPick.season,
+            DraftPick.round_number,
+        )
+        .where(
+            DraftPick.current_owner_team_id.in_(team_ids),
+            DraftPick.is_tradeable == True,
+        )
+        .order_by(DraftPick.id)
+    ):
+        picks[row.current_owner_team_id].append(
+            ContextPick(id=row.id, season=row.season, round_number=row.round_number)
+        )
+
+    # Latest needs analysis per team at or before the week
+    needs = {}
+    for analysis in db.scalars(
+        select(TeamNeedsAnalysis)
+        .where(TeamNeedsAnalysis.team_id.in_(team_ids), TeamNeedsAnalysis.week <= week)
+        .order_by(TeamNeedsAnalysis.week)
+    ):
+        needs[analysis.team_id] = MappingProxyType(
+            {
+                column.key: getattr(analysis, column.key)
+                for column in TeamNeedsAnalysis.__table__.columns
+            }
+        )
+
+    # Each rostered player's value from their latest week
+    player_values = {}
+    if player_ids:
+        latest = (
+            select(
+                PlayerValue.player_id,
+                func.max(PlayerValue.week).label("week"),
+            )
+            .where(PlayerValue.player_id.in_(player_ids))
+            .group_by(PlayerValue.player_id)
+            .subquery()
+        )
+        player_values = {
+            player_id: value
+            for player_id, value in db.execute(
+                select(PlayerValue.player_id, PlayerValue.rest_of_season_value).join(
+                    latest,
+                    (latest.c.player_id == PlayerValue.player_id)
+                    & (latest.c.week == PlayerValue.week),
+                )
+            )
+            if value
+        }
+
+    sleeper_players = {}
+    unvalued = [str(pid) for pid in player_ids if pid not in player_values]
+    if unvalued:
+        sleeper_players = {
+            row.sleeper_player_id: SleeperPlayerInfo(
+                sleeper_player_id=row.sleeper_player_id,
+                position=row.position,
+                team=row.team,
+                age=row.age,
+            )
+            for row in db.execute(
+                select(
+                    SleeperPlayer.sleeper_player_id,
+                    SleeperPlayer.position,
+                    SleeperPlayer.team,
+                    SleeperPlayer.age,
+                ).where(SleeperPlayer.sleeper_player_id.in_(unvalued))
+            )
+        }
+
+    # Records from the league's most recent synced Sleeper season
+    sleeper_records = {}
+    sleeper_league_id = db.scalar(
+        select(SleeperLeague.id)
+        .where(SleeperLeague.sleeper_league_id == league.platform_league_id)
+        .order_by(SleeperLeague.season.desc())
+        .limit(1)
+    )
+    if sleeper_league_id is not None:
+        sleeper_records = {
+            row.sleeper_roster_id: MappingProxyType(
+                {
+                    "wins": row.wins or 0,
+                    "losses": row.losses or 0,
+                    "points_for": row.points_for or 0,
+                }
+            )
+            for row in db.execute(
+                select(
+                    SleeperRoster.sleeper_roster_id,
+                    SleeperRoster.wins,
+                    SleeperRoster.losses,
+                    SleeperRoster.points_for,
+                ).where(SleeperRoster.league_id == sleeper_league_id)
+            )
+        }
+
+    standings = sorted(
+        teams, key=lambda team: (-(team.wins or 0), -float(team.points_for or 0))
+    )
+    snapshots = tuple(
+        TeamSnapshot(
+            team_id=team.id,
+            name=team.name,
+            platform_team_id=team.platform_team_id,
+            wins=team.wins or 0,
+            losses=team.losses or 0,
+            points_for=float(team.points_for or 0),
+            points_against=float(team.points_against or 0),
+            rank=rank,
+            players=tuple(rosters[team.id]),
+            picks=tuple(picks[team.id]),
+            needs=needs.get(team.id),
+            sleeper_record=sleeper_records.get(str(team.platform_team_id)),
+        )
+        for rank, team in enumerate(standings, 1)
+    )
+
+    return LeagueContext(
+        league_id=league_id,
+        week=week,
+        season=league.season,
+        platform_league_id=league.platform_league_id,
+        scoring_type=league.scoring_type or "ppr",
+        team_count=league.team_count or 12,
+        playoff_teams=league.playoff_teams or 6,
+        is_dynasty=_enum_value(league.league_type) == "dynasty",
+        teams=snapshots,
+        player_values=MappingProxyType(player_values),
+        sleeper_players=MappingProxyType(sleeper_players),
+    )
+
+
+class LeagueContextCache:
+    """
+    League snapshots keyed by (league, week)
+
+    Invalidating bumps a generation, so a snapshot that was being built
+    while its league changed is not stored.
+    """
+
+    def __init__(
+        self,
+        ttl: float = LEAGUE_CONTEXT_TTL_SECONDS,
+        max_size: int = LEAGUE_CONTEXT_MAX_SIZE,
+    ):
+        self._generation = 0
+        self._entries: TTLCache[Tuple[int, int], LeagueContext] = TTLCache(
+            ttl, max_size
+        )
+
+    def get(
+        self, db: Session, league_id: int, week: int = CURRENT_WEEK
+    ) -> LeagueContext:
+        key = (league_id, week)
+        context = self._entries.get(key)
+        if context is not None:
+            cache_requests.inc("league_context", "hit_memory")
+            return context
+
+        cache_requests.inc("league_context", "miss")
+        generation = self._generation
+        context = load_league_context(db, league_id, week)
+        if generation == self._generation:
+            self._entries.set(key, context)
+        return context
+
+    def invalidate(self, league_id: Optional[int] = None) -> None:
+        """Forget one league's snapshots, or every league's"""
+        self._generation += 1
+        if league_id is None:
+            self._entries.clear()
+            return
+        self._entries.discard_where(lambda key, _: key[0] == league_id)
+
+    def invalidate_platform_leagues(self, platform_league_ids: Iterable[str]) -> None:
+        """Forget the snapshots of leagues synced from these platform ids"""
+        platform_league_ids = set(platform_league_ids)
+        if not platform_league_ids:
+            return
+        self._generation += 1
+        self._entries.discard_where(
+            lambda _, context: context.platform_league_id in platform_league_ids
+        )
+
+
+league_context_cache = LeagueContextCache()
@@ -0,0 +1,186 @@
+"""
+Optimal starting lineups
+
+Choosing starters is an assignment of players to slots, where each slot
+accepts some positions. Within a position the best lineup always uses that
+position's highest-valued players, so the search only has to decide how
+many players of each position to start and which flex slots the extras
+fill. A dynamic program over positions, with the remaining flex capacity as
+its state, finds that exactly in well under a millisecond for real rosters.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple, Union
+
+DEFAULT_LINEUP = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF"]
+
+# Positions each flex slot accepts; any other slot takes its own position
+FLEX_SLOTS = {
+    "FLEX": frozenset({"RB", "WR", "TE"}),
+    "WRRB_FLEX": frozenset({"RB", "WR"}),
+    "REC_FLEX": frozenset({"WR", "TE"}),
+    "SUPER_FLEX": frozenset({"QB", "RB", "WR", "TE"}),
+    "SUPERFLEX": frozenset({"QB", "RB", "WR", "TE"}),
+    "IDP_FLEX": frozenset({"DL", "LB", "DB"}),
+}
+
+NON_STARTING_SLOTS = frozenset({"BN", "BENCH", "IR", "TAXI"})
+
+Objective = Union[str, Callable[[Dict[str, Any]], float]]
+
+
+@dataclass
+class Lineup:
+    """Players in their starting slots (in slot order), the bench and the total"""
+
+    slots: List[Tuple[str, Dict[str, Any]]]
+    bench: List[Dict[str, Any]]
+    total: float
+
+    @property
+    def starters(self) -> List[Dict[str, Any]]:
+        return [player for _, player in self.slots]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "starters": [{**player, "slot": slot} for slot, player in self.slots],
+            "bench": self.bench,
+            "total": round(self.total, 2),
+        }
+
+
+def league_slots(roster_positions: Any) -> List[str]:
+    """A league's roster_positions as slots, or the default lineup"""
+    if isinstance(roster_positions, list) and roster_positions:
+        return [str(slot) for slot in roster_positions]
+    return list(DEFAULT_LINEUP)
+
+
+def _position(player: Dict[str, Any]) -> str:
+    position = player.get("position")
+    return getattr(position, "value", position)
+
+
+@lru_cache(maxsize=128)
+def _slot_plan(slots: Tuple[str, ...]):
+    """Fixed slot counts, flex slot types and capacities, and positions to decide"""
+    starters = [slot for slot in slots if slot not in NON_STARTING_SLOTS]
+    fixed: Dict[str, int] = {}
+    flex: Dict[str, int] = {}
+    for slot in starters:
+        counts = flex if slot in FLEX_SLOTS else fixed
+        counts[slot] = counts.get(slot, 0) + 1
+    flex_types = tuple(sorted(flex))
+    positions = set(fixed)
+    for flex_type in flex_types:
+        positions |= FLEX_SLOTS[flex_type]
+    # Flex slot types each position can fill, by index into flex_types
+    eligible = {
+        position: tuple(
+            i
+            for i, flex_type in enumerate(flex_types)
+            if position in FLEX_SLOTS[flex_type]
+        )
+        for position in positions
+    }
+    capacity = tuple(flex[flex_type] for flex_type in flex_types)
+    return starters, fixed, flex_types, capacity, sorted(positions), eligible
+
+
+def _allocations(state: Tuple[int, ...], eligible: Tuple[int, ...], extra: int):
+    """Ways to place up to `extra` players into eligible flex capacity"""
+    ranges = [range(min(state[i], extra) + 1) for i in eligible]
+    for counts in product(*ranges):
+        if sum(counts) <= extra:
+            yield counts
+
+
+def optimal_lineup(
+    players: Sequence[Dict[str, Any]],
+    slots: Sequence[str] = DEFAULT_LINEUP,
+    objective: Objective = "projected_points",
+) -> Lineup:
+    """
+    Lineup maximizing the summed objective over the starting slots
+
+    objective is a player dict key (projected points, floor or ceiling) or
+    a function of the player. Fixed-position slots are always filled when a
+    player is available; flex slots take whoever adds the most.
+    """
+    value = objective if callable(objective) else (lambda p: p.get(objective) or 0)
+    starters, fixed, flex_types, capacity, positions, eligible = _slot_plan(
+        tuple(slots)
+    )
+
+    by_position: Dict[str, List[Tuple[float, Dict[str, Any]]]] = {}
+    for player in players:
+        by_position.setdefault(_position(player), []).append((value(player), player))
+    prefix = {}
+    for position in positions:
+        ranked = sorted(by_position.get(position, []), key=lambda entry: -entry[0])
+        by_position[position] = ranked
+        totals = [0.0]
+        for points, _ in ranked:
+            totals.append(totals[-1] + points)
+        prefix[position] = totals
+
+    # Per position: state -> (best total, previous state, flex allocation)
+    layers = []
+    current = {capacity: (0.0, None, None)}
+    for position in positions:
+        available = len(by_position[position])
+        fixed_used = min(available, fixed.get(position, 0))
+        extra = available - fixed_used
+        flex_indexes = eligible[position]
+        following: Dict[Tuple[int, ...], Tuple[float, Any, Any]] = {}
+        for state, (total, _, _) in current.items():
+            for counts in _allocations(state, flex_indexes, extra):
+                remaining = list(state)
+                for i, count in zip(flex_indexes, counts):
+                    remaining[i] -= count
+                key = tuple(remaining)
+                candidate = total + prefix[position][fixed_used + sum(counts)]
+                if key not in following or candidate > following[key][0]:
+                    following[key] = (candidate, state, counts)
+        layers.append(following)
+        current = following
+
+    state = max(current, key=lambda key: current[key][0])
+    best = current[state][0]
+
+    # Walk back through the choices, handing each position's best players
+    # to its own slots first and the rest to flex slots
+    assigned: Dict[str, List[Dict[str, Any]]] = {}
+    chosen = set()
+    for position, layer in zip(reversed(positions), reversed(layers)):
+        _, previous, counts = layer[state]
+        ranked = [player for _, player in by_position[position]]
+        fixed_used = min(len(ranked), fixed.get(position, 0))
+        assigned.setdefault(position, []).extend(ranked[:fixed_used])
+        start = fixed_used
+        for i, count in zip(eligible[position], counts):
+            assigned.setdefault(flex_types[i], []).extend(ranked[start : start + count])
+            start += count
+        chosen.update(id(player) for player in ranked[:start])
+        state = previous
+
+    lineup = []
+    for slot in starters:
+        if assigned.get(slot):
+            lineup.append((slot, assigned[slot].pop(0)))
+    bench = [player for player in players if id(player) not in chosen]
+    return Lineup(slots=lineup, bench=bench, total=best)
+
+
+def optimal_lineups(
+    rosters: Mapping[Any, Sequence[Dict[str, Any]]],
+    slots: Sequence[str] = DEFAULT_LINEUP,
+    objective: Objective = "projected_points",
+) -> Dict[Any, Lineup]:
+    """Optimal lineup for every roster, keyed like rosters (e.g. by team id)"""
+    return {
+        key: optimal_lineup(players, slots, objective)
+        for key, players in rosters.items()
+    }
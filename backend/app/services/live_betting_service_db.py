@@ -6,10 +6,10 @@ import random
 import uuid
 import asyncio
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, update
 from app.core.database import SessionLocal
 from app.models.database_models import User, LiveBet as LiveBetDB, BetStatus
 from app.models.live_bet_models import (
@@ -24,6 +24,13 @@ from app.models.live_bet_models import (
     LiveBetResponse,
     CashOutHistory,
 )
+from app.services.cash_out_pricing_engine import (
+    cash_out_pricing_engine,
+    CashOutRepriceResult,
+    resolve_selection_side,
+    SIDE_AWAY,
+    SIDE_HOME,
+)
 from app.services.odds_api_service import (
     OddsAPIService,
     SportKey,
@@ -34,10 +41,31 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Bet type spellings, as _create_specific_selection accepts them
+MONEYLINE_BET_TYPES = ("moneyline", "h2h")
+SPREAD_BET_TYPES = ("spread", "spreads", "point_spread")
+TOTAL_BET_TYPES = ("total", "totals", "over_under")
+
+
+def _split_selection_line(selection: Optional[str]) -> Tuple[str, Optional[float]]:
+    """Split "Yankees +1.5" or "Over 8.5" into its subject and line"""
+    subject, _, line = (selection or "").strip().rpartition(" ")
+    try:
+        return subject, float(line)
+    except ValueError:
+        return (selection or "").strip(), None
+
 
 class LiveBettingServiceDB:
     """Database-powered live betting service with persistent storage"""
 
+    # Sports offered for live betting
+    LIVE_SPORT_MAPPING = {
+        "americanfootball_nfl": SportKey.AMERICANFOOTBALL_NFL,
+        "basketball_nba": SportKey.BASKETBALL_NBA,
+        "baseball_mlb": SportKey.BASEBALL_MLB,
+    }
+
     def __init__(self):
         # In-memory caches for real-time data that doesn't need persistence
         self.live_games: Dict[str, LiveGameUpdate] = {}
@@ -50,34 +78,42 @@ class LiveBettingServiceDB:
         # Cache for game team names and sport details
         self.game_details_cache: Dict[str, tuple] = {}
 
-    async def get_real_live_scores(self, sport_key: str) -> Dict[str, Any]:
-        """Fetch real live scores from The Odds API (only live games, costs 1 credit)"""
+    async def get_real_live_scores(
+        self, sport_key: str, odds_service: Optional[OddsAPIService] = None
+    ) -> Dict[str, Any]:
+        """Fetch real live scores from The Odds API (only live games, costs 1 credit)
+
+        Reuses ``odds_service`` when given instead of opening a new session.
+        """
         try:
-            async with OddsAPIService(settings.ODDS_API_KEY) as odds_service:
+            if odds_service is not None:
                 # Don't pass days_from to get ONLY live games (cheaper - 1 credit vs 2)
                 scores = await odds_service.get_scores(sport_key)
+            else:
+                async with OddsAPIService(settings.ODDS_API_KEY) as new_service:
+                    scores = await new_service.get_scores(sport_key)
+
+            # Convert scores to a game_id -> score mapping
+            live_scores = {}
+            for score in scores:
+                # Only include games that are live or recently completed
+                if (
+                    not score.completed
+                    and score.home_score is not None
+                    and score.away_score is not None
+                ):
+                    live_scores[score.id] = {
+                        "home_score": score.home_score,
+                        "away_score": score.away_score,
+                        "home_team": score.home_team,
+                        "away_team": score.away_team,
+                        "sport": score.sport_title,
+                        "completed": score.completed,
+                        "last_update": score.last_update,
+                    }
 
-                # Convert scores to a game_id -> score mapping
-                live_scores = {}
-                for score in scores:
-                    # Only include games that are live or recently completed
-                    if (
-                        not score.completed
-                        and score.home_score is not None
-                        and score.away_score is not None
-                    ):
-                        live_scores[score.id] = {
-                            "home_score": score.home_score,
-                            "away_score": score.away_score,
-                            "home_team": score.home_team,
-                            "away_team": score.away_team,
-                            "sport": score.sport_title,
-                            "completed": score.completed,
-                            "last_update": score.last_update,
-                        }
-
-                logger.info(f"Fetched {len(live_scores)} live scores for {sport_key}")
-                return live_scores
+            logger.info(f"Fetched {len(live_scores)} live scores for {sport_key}")
+            return live_scores
 
         except Exception as e:
             logger.error(f"Failed to fetch live scores for {sport_key}: {e}")
@@ -314,40 +350,44 @@ class LiveBettingServiceDB:
             return {"success": False, "error": "Failed to cash out"}
 
     def update_game_state(self, game_update: LiveGameUpdate):
-        """Update game state and recalculate cash out values for database bets"""
+        """Update game state and reprice cash out values for database bets"""
 
         self.live_games[game_update.game_id] = game_update
 
         try:
             db = SessionLocal()
             try:
-                # Update all active bets for this game in database
-                active_bets = (
-                    db.query(LiveBetDB)
-                    .filter(
-                        and_(
-                            LiveBetDB.game_id == game_update.game_id,
-                            LiveBetDB.status == LiveBetStatus.ACTIVE.value,
-                        )
+                # Latest game state on every open bet, in one statement
+                db.execute(
+                    update(LiveBetDB)
+                    .where(
+                        LiveBetDB.game_id == game_update.game_id,
+                        LiveBetDB.status == BetStatus.LIVE.value,
                     )
-                    .all()
+                    .values(
+                        current_game_status=game_update.status.value,
+                        current_home_score=game_update.home_score,
+                        current_away_score=game_update.away_score,
+                    )
+                    .execution_options(synchronize_session=False)
                 )
 
-                for db_bet in active_bets:
-                    db_bet.current_game_status = game_update.status.value
-                    db_bet.current_home_score = game_update.home_score
-                    db_bet.current_away_score = game_update.away_score
-
-                    # Recalculate cash out value
-                    if db_bet.cash_out_available:
-                        # Convert to LiveBet model for calculation
-                        live_bet = self._db_bet_to_model(db_bet)
-                        db_bet.cash_out_value = self._calculate_cash_out_value(
-                            live_bet, game_update
+                # Reprice every open bet on this game in one vectorized pass
+                reprice = cash_out_pricing_engine.reprice_game(db, game_update)
+
+                # Check if game ended
+                if game_update.status == GameStatus.FINAL:
+                    active_bets = (
+                        db.query(LiveBetDB)
+                        .filter(
+                            and_(
+                                LiveBetDB.game_id == game_update.game_id,
+                                LiveBetDB.status == BetStatus.LIVE.value,
+                            )
                         )
-
-                    # Check if game ended
-                    if game_update.status == GameStatus.FINAL:
+                        .all()
+                    )
+                    for db_bet in active_bets:
                         self._settle_db_bet(db_bet, game_update)
 
                 db.commit()
@@ -355,9 +395,51 @@ class LiveBettingServiceDB:
             finally:
                 db.close()
 
+            self._publish_cash_out_changes(reprice)
+
         except Exception as e:
             logger.error(f"Error updating game state: {e}")
 
+    def _publish_cash_out_changes(self, reprice: CashOutRepriceResult):
+        """Refresh cached offers and notify users whose offer moved"""
+
+        if not reprice.changes:
+            return
+
+        expires_at = datetime.utcnow() + timedelta(seconds=30)
+        for change in reprice.changes:
+            self.cash_out_offers[change.bet_id] = CashOutOffer(
+                bet_id=change.bet_id,
+                original_amount=change.amount,
+                original_potential_win=change.potential_win,
+                current_cash_out_value=change.new_value,
+                profit_loss=change.new_value - change.amount,
+                offer_expires_at=expires_at,
+                is_available=True,
+            )
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. called from a sync job) - offers stay cached
+            return
+
+        from app.services.websocket_manager import manager
+
+        for change in reprice.changes:
+            loop.create_task(
+                manager.send_bet_notification(
+                    str(change.user_id),
+                    {
+                        "type": "cash_out_update",
+                        "bet_id": change.bet_id,
+                        "game_id": reprice.game_id,
+                        "cash_out_value": change.new_value,
+                        "previous_value": change.old_value,
+                    },
+                )
+            )
+
     def update_live_odds(self, odds_update: LiveOddsUpdate):
         """Update live odds for a game and database bets"""
 
@@ -378,7 +460,7 @@ class LiveBettingServiceDB:
                     .filter(
                         and_(
                             LiveBetDB.game_id == odds_update.game_id,
-                            LiveBetDB.status == LiveBetStatus.ACTIVE.value,
+                            LiveBetDB.status == BetStatus.LIVE.value,
                         )
                     )
                     .all()
@@ -386,7 +468,11 @@ class LiveBettingServiceDB:
 
                 for db_bet in active_bets:
                     market_odds = self._get_market_odds(
-                        odds_update, db_bet.bet_type, db_bet.selection
+                        odds_update,
+                        db_bet.bet_type,
+                        db_bet.selection,
+                        db_bet.home_team,
+                        db_bet.away_team,
                     )
                     if market_odds:
                         db_bet.current_odds = market_odds
@@ -402,119 +488,82 @@ class LiveBettingServiceDB:
         except Exception as e:
             logger.error(f"Error updating live odds: {e}")
 
+    def resolve_live_sports(self, sport: Optional[str] = None) -> List[SportKey]:
+        """Sports to build live markets for, optionally narrowed to one sport"""
+        if sport:
+            # If a specific sport is requested, convert string to SportKey enum
+            return [self.LIVE_SPORT_MAPPING.get(sport, SportKey.AMERICANFOOTBALL_NFL)]
+        return list(self.LIVE_SPORT_MAPPING.values())
+
+    async def fetch_sport_live_markets(
+        self, odds_service: OddsAPIService, sport_key: SportKey
+    ) -> List[LiveBettingMarket]:
+        """Build live markets for one sport using an open Odds API session
+
+        Live scores are fetched first (1 credit); the odds call is skipped
+        entirely when no game of this sport is in progress.
+        """
+        live_scores = await self.get_real_live_scores(sport_key.value, odds_service)
+        if not live_scores:
+            logger.info(f"No live games for {sport_key.value}, skipping odds fetch")
+            return []
+
+        logger.info(f"Fetching odds for sport: {sport_key.value}")
+        games_data = await odds_service.get_odds(
+            sport=sport_key.value,
+            regions="us",
+            markets=",".join(
+                [MarketKey.H2H.value, MarketKey.SPREADS.value, MarketKey.TOTALS.value]
+            ),
+            odds_format=OddsFormat.AMERICAN,
+            usage_kind="live_odds",
+        )
+        logger.info(f"API returned {len(games_data)} games for {sport_key.value}")
+
+        markets = []
+        for game in games_data:
+            # ONLY create markets for games that are actually live (in live_scores)
+            if game.id not in live_scores:
+                continue
+
+            try:
+                score_data = live_scores[game.id]
+                market = await self._create_simple_live_market(game)
+
+                # Update with actual live scores
+                if market:
+                    market.home_score = score_data["home_score"]
+                    market.away_score = score_data["away_score"]
+                    logger.info(
+                        f"✓ Live market created: {market.home_team} vs {market.away_team} ({market.home_score}-{market.away_score})"
+                    )
+                    markets.append(market)
+            except Exception as e:
+                logger.error(f"✗ Error creating market for {game.id}: {e}")
+                continue
+
+        return markets
+
     async def get_live_betting_markets(
         self, sport: Optional[str] = None
     ) -> List[LiveBettingMarket]:
         """Get all available live betting markets from real sports data"""
 
         markets = []
+        sports_to_check = self.resolve_live_sports(sport)
 
         try:
             logger.info(
                 f"Starting to fetch live betting markets, ODDS_API_KEY configured: {bool(settings.ODDS_API_KEY)}"
             )
-            # Get live games from The Odds API
             async with OddsAPIService(settings.ODDS_API_KEY) as odds_service:
-                # Get upcoming games that could be live
-                if sport:
-                    # If a specific sport is requested, convert string to SportKey enum
-                    sport_mapping = {
-                        "americanfootball_nfl": SportKey.AMERICANFOOTBALL_NFL,
-                        "basketball_nba": SportKey.BASKETBALL_NBA,
-                        "baseball_mlb": SportKey.BASEBALL_MLB,
-                    }
-                    sports_to_check = [
-                        sport_mapping.get(sport, SportKey.AMERICANFOOTBALL_NFL)
-                    ]
-                else:
-                    sports_to_check = [
-                        SportKey.AMERICANFOOTBALL_NFL,
-                        SportKey.BASKETBALL_NBA,
-                        SportKey.BASEBALL_MLB,
-                    ]
-
                 for idx, sport_key in enumerate(sports_to_check):
                     try:
-                        # Fetch odds for this sport
-                        logger.info(f"Fetching odds for sport: {sport_key.value}")
-                        odds_data = await odds_service.get_odds(
-                            sport=sport_key.value,
-                            markets=[
-                                MarketKey.H2H.value,
-                                MarketKey.SPREADS.value,
-                                MarketKey.TOTALS.value,
-                            ],
-                            regions=["us"],
-                            odds_format=OddsFormat.AMERICAN,
-                        )
-
-                        games_data = (
-                            odds_data
-                            if isinstance(odds_data, list)
-                            else odds_data.get("data", [])
-                        )
-                        logger.info(
-                            f"API returned {len(games_data)} games for {sport_key.value}"
+                        markets.extend(
+                            await self.fetch_sport_live_markets(odds_service, sport_key)
                         )
-
-                        # Try to get live scores (optional, for displaying actual scores)
-                        logger.info(
-                            f"Attempting to fetch live scores for {sport_key.value}"
-                        )
-                        live_scores = {}
-                        try:
-                            live_scores = await self.get_real_live_scores(
-                                sport_key.value
-                            )
-                            logger.info(
-                                f"Found {len(live_scores)} games with live scores"
-                            )
-                        except Exception as score_error:
-                            logger.warning(
-                                f"Could not fetch live scores: {score_error}"
-                            )
-
-                        # Process each game to create live markets
-                        for i, game in enumerate(games_data):
-                            logger.info(
-                                f"[{i+1}/{len(games_data)}] Checking: {game.home_team} vs {game.away_team}"
-                            )
-                            logger.info(f"  Commence time: {game.commence_time}")
-
-                            try:
-                                # ONLY create markets for games that are actually live (in live_scores)
-                                if game.id in live_scores:
-                                    score_data = live_scores[game.id]
-                                    logger.info(
-                                        f"  Game is LIVE with scores: {score_data['home_score']}-{score_data['away_score']}"
-                                    )
-
-                                    # Create the live market
-                                    market = await self._create_simple_live_market(game)
-
-                                    # Update with actual live scores
-                                    if market:
-                                        market.home_score = score_data["home_score"]
-                                        market.away_score = score_data["away_score"]
-
-                                        logger.info(
-                                            f"✓ Live market created: {market.home_team} vs {market.away_team} ({market.home_score}-{market.away_score})"
-                                        )
-                                        markets.append(market)
-                                else:
-                                    logger.info(
-                                        f"✗ Game not in live scores (upcoming or finished)"
-                                    )
-                            except Exception as e:
-                                logger.error(f"✗ Error creating market: {e}")
-                                import traceback
-
-                                logger.error(traceback.format_exc())
-                                continue
-
                     except Exception as e:
                         logger.error(f"Error fetching odds for {sport_key}: {e}")
-                        continue
 
                     # Add delay between sports to avoid rate limiting (except after last sport)
                     if idx < len(sports_to_check) - 1:
@@ -523,7 +572,6 @@ class LiveBettingServiceDB:
         except Exception as e:
             logger.error(f"Error in main try block: {e}")
 
-        logger.info(f"Total markets created from real API: {len(markets)}")
         logger.info(f"Returning {len(markets)} live markets")
         return markets
 
@@ -603,6 +651,14 @@ class LiveBettingServiceDB:
             elif "quarter" in game_time.lower():
                 game_status = GameStatus.FIRST_QUARTER
 
+        # The latest game update, when one has reached the bet
+        current_status = game_status
+        if db_bet.current_game_status:
+            try:
+                current_status = GameStatus(db_bet.current_game_status)
+            except ValueError:
+                pass
+
         # Get team names and sport information safely
         home_team = getattr(db_bet, "home_team", None) or "Home Team"
         away_team = getattr(db_bet, "away_team", None) or "Away Team"
@@ -633,11 +689,19 @@ class LiveBettingServiceDB:
             placed_at=db_bet.placed_at,
             settled_at=getattr(db_bet, "settled_at", None),
             game_status_at_placement=game_status,
-            current_game_status=game_status,
+            current_game_status=current_status,
             home_score_at_placement=home_score,
             away_score_at_placement=away_score,
-            current_home_score=home_score,
-            current_away_score=away_score,
+            current_home_score=(
+                home_score
+                if db_bet.current_home_score is None
+                else db_bet.current_home_score
+            ),
+            current_away_score=(
+                away_score
+                if db_bet.current_away_score is None
+                else db_bet.current_away_score
+            ),
             cash_out_available=getattr(db_bet, "cash_out_available", True),
             cash_out_value=getattr(db_bet, "cash_out_value", None),
             cashed_out_at=getattr(db_bet, "cashed_out_at", None),
@@ -648,27 +712,68 @@ class LiveBettingServiceDB:
             sport=sport,
         )
 
-    def _settle_db_bet(self, db_bet: LiveBetDB, final_game_state: LiveGameUpdate):
-        """Settle a database bet when game ends"""
+    def _settle_db_bet(
+        self, db_bet: LiveBetDB, final_game_state: LiveGameUpdate
+    ) -> bool:
+        """Settle a database bet when game ends; False leaves it live"""
 
-        # Determine if bet won
-        won = False
-        if db_bet.bet_type == "moneyline":
-            if (
-                db_bet.selection == "home"
-                and final_game_state.home_score > final_game_state.away_score
-            ):
-                won = True
-            elif (
-                db_bet.selection == "away"
-                and final_game_state.away_score > final_game_state.home_score
-            ):
-                won = True
+        margin = self._final_margin(db_bet, final_game_state)
+        if margin is None:
+            logger.warning(
+                f"Cannot settle live bet {db_bet.id}: {db_bet.bet_type} "
+                f"'{db_bet.selection}'"
+            )
+            return False
 
         # Update bet status in database
-        db_bet.status = LiveBetStatus.SETTLED.value
+        if margin > 0:
+            db_bet.status = BetStatus.WON.value
+            db_bet.result_amount = db_bet.amount + db_bet.potential_win
+        elif margin == 0:
+            db_bet.status = BetStatus.PUSHED.value
+            db_bet.result_amount = db_bet.amount  # Return original amount
+        else:
+            db_bet.status = BetStatus.LOST.value
+            db_bet.result_amount = 0
         db_bet.settled_at = datetime.utcnow()
-        db_bet.result_amount = db_bet.potential_win if won else 0
+        return True
+
+    def _final_margin(
+        self, db_bet: LiveBetDB, final_game_state: LiveGameUpdate
+    ) -> Optional[float]:
+        """
+        Points by which a bet's selection beat the final score
+
+        Positive wins, zero pushes. None when the selection can't be read.
+        Selections are stored as _create_specific_selection writes them: a
+        team name, "Team +1.5" or "Over 8.5".
+        """
+        home_score = final_game_state.home_score
+        away_score = final_game_state.away_score
+        bet_type = (db_bet.bet_type or "").lower()
+
+        if bet_type in TOTAL_BET_TYPES:
+            direction, line = _split_selection_line(db_bet.selection)
+            if line is None or direction.lower() not in ("over", "under"):
+                return None
+            margin = home_score + away_score - line
+            return margin if direction.lower() == "over" else -margin
+
+        if bet_type in SPREAD_BET_TYPES:
+            team, line = _split_selection_line(db_bet.selection)
+            if line is None:
+                return None
+        elif bet_type in MONEYLINE_BET_TYPES:
+            team, line = db_bet.selection, 0
+        else:
+            return None
+
+        side = resolve_selection_side(team, db_bet.home_team, db_bet.away_team)
+        if side == SIDE_HOME:
+            return home_score - away_score + line
+        if side == SIDE_AWAY:
+            return away_score - home_score + line
+        return None
 
     # Include all the helper methods from the original service
     async def _create_simple_live_market(self, game) -> Optional[LiveBettingMarket]:
@@ -1006,33 +1111,25 @@ class LiveBettingServiceDB:
         self, bet: LiveBet, game_state: LiveGameUpdate
     ) -> float:
         """Calculate dynamic cash out value based on game state"""
-
-        base_value = bet.amount
-
-        # Adjust based on score
-        score_diff = game_state.home_score - game_state.away_score
-        if bet.selection == "home":
-            if score_diff > 0:
-                base_value *= 1 + score_diff * 0.1  # Increase value if winning
-            else:
-                base_value *= 1 + score_diff * 0.05  # Decrease less if losing
-        elif bet.selection == "away":
-            if score_diff < 0:
-                base_value *= 1 - score_diff * 0.1  # Increase value if winning
-            else:
-                base_value *= 1 - score_diff * 0.05  # Decrease less if losing
-
-        # Adjust based on game progress
-        if game_state.status in [GameStatus.FOURTH_QUARTER, GameStatus.SECOND_HALF]:
-            base_value *= 1.1  # Increase value near end of game
-
-        # Cap at potential win
-        return min(base_value, bet.potential_win * 0.95)
+        return cash_out_pricing_engine.price_single(
+            bet.amount,
+            bet.potential_win,
+            bet.selection,
+            game_state,
+            home_team=bet.home_team,
+            away_team=bet.away_team,
+        )
 
     def _calculate_updated_cash_out(self, db_bet: LiveBetDB, game_state) -> float:
         """Calculate updated cash out value for a live bet"""
-        live_bet = self._db_bet_to_model(db_bet)
-        return self._calculate_cash_out_value(live_bet, game_state)
+        return cash_out_pricing_engine.price_single(
+            db_bet.amount,
+            db_bet.potential_win,
+            db_bet.selection,
+            game_state,
+            home_team=db_bet.home_team,
+            away_team=db_bet.away_team,
+        )
 
     def _create_consistent_game_state(
         self, game_id: str, sport: str, sport_key: str = None
@@ -1082,12 +1179,21 @@ class LiveBettingServiceDB:
             return None
 
     def _get_market_odds(
-        self, odds_data: LiveOddsUpdate, bet_type: str, selection: str
+        self,
+        odds_data: LiveOddsUpdate,
+        bet_type: str,
+        selection: str,
+        home_team: Optional[str] = None,
+        away_team: Optional[str] = None,
     ) -> Optional[float]:
         """Get current market odds for a specific bet"""
 
-        if bet_type == "moneyline":
-            return odds_data.home_odds if selection == "home" else odds_data.away_odds
+        if (bet_type or "").lower() in MONEYLINE_BET_TYPES:
+            side = resolve_selection_side(selection, home_team, away_team)
+            if side == SIDE_HOME:
+                return odds_data.home_odds
+            if side == SIDE_AWAY:
+                return odds_data.away_odds
         # Would handle spread and total odds
         return None
 
@@ -0,0 +1,257 @@
+"""
+Background-maintained live betting market snapshots
+
+Keeps one in-memory snapshot of live betting markets per sport so that
+/api/live-bets/markets is served from memory instead of calling The Odds API
+on every request. Sports with games in progress are refreshed on a short
+cadence; idle sports are only re-checked occasionally with the cheap
+live-scores call. Past the first snapshot, a sport is only refreshed when the
+Odds API quota planner has a live odds fetch due for it, so the monthly
+budget governs this service too. Every refresh records its duration and the
+credits it cost.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.models.live_bet_models import LiveBettingMarket
+from app.services.live_betting_service_db import (
+    LiveBettingServiceDB,
+    live_betting_service_db,
+)
+from app.services.odds_api_service import OddsAPIService, SportKey
+from app.services.odds_quota_planner import OddsQuotaPlanner, odds_quota_planner
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SportSnapshot:
+    """Latest live markets for one sport plus refresh bookkeeping"""
+
+    sport: str
+    markets: List[LiveBettingMarket] = field(default_factory=list)
+    refreshed_at: Optional[datetime] = None
+    next_refresh_at: Optional[datetime] = None
+    refresh_count: int = 0
+    last_refresh_ms: float = 0.0
+    last_refresh_credits: int = 0
+    total_credits: int = 0
+    last_error: Optional[str] = None
+
+    @property
+    def is_live(self) -> bool:
+        return bool(self.markets)
+
+    def age_seconds(self, now: Optional[datetime] = None) -> Optional[float]:
+        if not self.refreshed_at:
+            return None
+        return ((now or datetime.utcnow()) - self.refreshed_at).total_seconds()
+
+    def to_dict(self) -> Dict:
+        return {
+            "sport": self.sport,
+            "live_markets": len(self.markets),
+            "is_live": self.is_live,
+            "refreshed_at": (
+                self.refreshed_at.isoformat() if self.refreshed_at else None
+            ),
+            "age_seconds": self.age_seconds(),
+            "next_refresh_at": (
+                self.next_refresh_at.isoformat() if self.next_refresh_at else None
+            ),
+            "refresh_count": self.refresh_count,
+            "last_refresh_ms": round(self.last_refresh_ms, 1),
+            "last_refresh_credits": self.last_refresh_credits,
+            "total_credits": self.total_credits,
+            "last_error": self.last_error,
+        }
+
+
+class LiveMarketSnapshotService:
+    """Maintains per-sport live market snapshots on a live-aware cadence"""
+
+    def __init__(
+        self,
+        live_service: LiveBettingServiceDB,
+        live_interval_seconds: int = 60,
+        idle_interval_seconds: int = 900,
+        planner: Optional[OddsQuotaPlanner] = None,
+    ):
+        self.live_service = live_service
+        self.planner = planner or odds_quota_planner
+        self.live_interval_seconds = live_interval_seconds
+        self.idle_interval_seconds = idle_interval_seconds
+        self.snapshots: Dict[str, SportSnapshot] = {}
+        self.running = False
+        self.refresh_task: Optional[asyncio.Task] = None
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _lock_for(self, sport: str) -> asyncio.Lock:
+        if sport not in self._locks:
+            self._locks[sport] = asyncio.Lock()
+        return self._locks[sport]
+
+    async def refresh_sport(
+        self, sport_key: SportKey, only_if_empty: bool = False
+    ) -> SportSnapshot:
+        """Rebuild the snapshot for one sport from The Odds API
+
+        With ``only_if_empty`` concurrent cold-start callers share the first
+        refresh instead of each spending credits on their own.
+        """
+        sport = sport_key.value
+        snapshot = self.snapshots.setdefault(sport, SportSnapshot(sport=sport))
+
+        async with self._lock_for(sport):
+            if only_if_empty and snapshot.refreshed_at is not None:
+                return snapshot
+
+            started = datetime.utcnow()
+            credits = 0
+            try:
+                async with OddsAPIService(settings.ODDS_API_KEY) as odds_service:
+                    try:
+                        snapshot.markets = (
+                            await self.live_service.fetch_sport_live_markets(
+                                odds_service, sport_key
+                            )
+                        )
+                        snapshot.last_error = None
+                    finally:
+                        credits = odds_service.credits_spent
+            except Exception as e:
+                # Keep serving the previous markets until the next refresh
+                snapshot.last_error = str(e)
+                logger.error(f"Live market snapshot refresh failed for {sport}: {e}")
+
+            finished = datetime.utcnow()
+            interval = (
+                self.live_interval_seconds
+                if snapshot.is_live
+                else self.idle_interval_seconds
+            )
+            snapshot.refreshed_at = finished
+            snapshot.next_refresh_at = finished + timedelta(seconds=interval)
+            snapshot.refresh_count += 1
+            snapshot.last_refresh_ms = (finished - started).total_seconds() * 1000
+            snapshot.last_refresh_credits = credits
+            snapshot.total_credits += credits
+            self.planner.mark_refreshed(sport, "live_odds", finished)
+
+            logger.info(
+                f"Live market snapshot for {sport}: {len(snapshot.markets)} markets, "
+                f"{credits} credits, {snapshot.last_refresh_ms:.0f}ms, "
+                f"next refresh in {interval}s"
+            )
+
+        return snapshot
+
+    async def refresh_due(self) -> int:
+        """
+        Refresh every sport whose snapshot is missing, or past its next refresh
+        with a live odds fetch due in the quota plan
+        """
+        await self.planner.refresh()
+        now = datetime.utcnow()
+        refreshed = 0
+        for sport_key in self.live_service.resolve_live_sports():
+            snapshot = self.snapshots.get(sport_key.value)
+            if snapshot and snapshot.refreshed_at:
+                if snapshot.next_refresh_at and snapshot.next_refresh_at > now:
+                    continue
+                if not self.planner.is_due(sport_key.value, "live_odds", now):
+                    # Over budget for now: ask the plan again next interval
+                    snapshot.next_refresh_at = now + timedelta(
+                        seconds=self.live_interval_seconds
+                    )
+                    continue
+            await self.refresh_sport(sport_key)
+            refreshed += 1
+        return refreshed
+
+    async def get_markets(self, sport: Optional[str] = None) -> List[LiveBettingMarket]:
+        """Serve live markets from memory, building a snapshot only on a cold miss"""
+        markets: List[LiveBettingMarket] = []
+        for sport_key in self.live_service.resolve_live_sports(sport):
+            snapshot = self.snapshots.get(sport_key.value)
+            if snapshot is None or snapshot.refreshed_at is None:
+                snapshot = await self.refresh_sport(sport_key, only_if_empty=True)
+            markets.extend(snapshot.markets)
+        return markets
+
+    def oldest_age_seconds(self, sport: Optional[str] = None) -> Optional[float]:
+        """Age of the stalest snapshot backing a get_markets(sport) response"""
+        ages = [
+            self.snapshots[key.value].age_seconds()
+            for key in self.live_service.resolve_live_sports(sport)
+            if key.value in self.snapshots and self.snapshots[key.value].refreshed_at
+        ]
+        return max(ages) if ages else None
+
+    def get_status(self) -> Dict:
+        """Snapshot age and refresh cost per sport"""
+        return {
+            "running": self.running,
+            "live_interval_seconds": self.live_interval_seconds,
+            "idle_interval_seconds": self.idle_interval_seconds,
+            "total_credits": sum(s.total_credits for s in self.snapshots.values()),
+            "sports": {
+                sport: snapshot.to_dict() for sport, snapshot in self.snapshots.items()
+            },
+        }
+
+    async def start(self):
+        """Start the background refresh loop"""
+        if self.running:
+            logger.warning("Live market snapshot service is already running")
+            return
+
+        self.running = True
+        self.refresh_task = asyncio.create_task(self._refresh_loop())
+        logger.info("Live market snapshot service started")
+
+    async def stop(self):
+        """Stop the background refresh loop"""
+        if not self.running:
+            return
+
+        self.running = False
+        if self.refresh_task:
+            self.refresh_task.cancel()
+            try:
+                await self.refresh_task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Live market snapshot service stopped")
+
+    async def _refresh_loop(self):
+        """Refresh due snapshots, then sleep until the next one is due"""
+        while self.running:
+            try:
+                await self.refresh_due()
+
+                upcoming = [
+                    s.next_refresh_at
+                    for s in self.snapshots.values()
+                    if s.next_refresh_at
+                ]
+                delay = self.live_interval_seconds
+                if upcoming:
+                    delay = (min(upcoming) - datetime.utcnow()).total_seconds()
+                await asyncio.sleep(max(5.0, delay))
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in live market snapshot loop: {e}")
+                await asyncio.sleep(30)
+
+
+# Global snapshot service
+live_market_snapshot_service = LiveMarketSnapshotService(live_betting_service_db)
@@ -10,6 +10,7 @@ This service handles all interactions with The Odds API including:
 
 import aiohttp
 import asyncio
+import re
 import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta, timezone
@@ -18,8 +19,17 @@ from dataclasses import dataclass
 from enum import Enum
 from fastapi import HTTPException
 
+from app.core.metrics import (
+    odds_api_credits,
+    odds_api_request_duration,
+    odds_api_requests_remaining,
+)
+
 logger = logging.getLogger(__name__)
 
+# Event ids in paths would give every game its own metrics series
+_EVENT_ID_PATTERN = re.compile(r"/events/[^/]+")
+
 
 class SportKey(str, Enum):
     """Supported sport keys from The Odds API"""
@@ -120,6 +130,10 @@ class OddsAPIService:
         self.rate_limit_used = 0
         self.last_request_time = 0
 
+        # Credits charged by the API for this session (x-requests-last header)
+        self.last_request_cost = 0
+        self.credits_spent = 0
+
         # Track daily/monthly usage
         self.daily_requests = 0
         self.monthly_requests = 0
@@ -129,6 +143,8 @@ class OddsAPIService:
     async def __aenter__(self):
         """Async context manager entry"""
         self.session = aiohttp.ClientSession()
+        # The usage log is read with blocking queries: keep them off the loop
+        await asyncio.to_thread(self._load_persisted_usage)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -136,6 +152,38 @@ class OddsAPIService:
         if self.session:
             await self.session.close()
 
+    def _load_persisted_usage(self) -> None:
+        """Seed usage counters from the persisted log so restarts don't reset them"""
+        try:
+            from app.services.odds_quota_planner import odds_quota_planner
+
+            usage = odds_quota_planner.get_usage_summary()
+        except Exception as e:
+            logger.debug(f"Persisted Odds API usage unavailable: {e}")
+            return
+
+        self.daily_requests = max(self.daily_requests, usage["today_requests"])
+        self.monthly_requests = max(
+            self.monthly_requests, usage["month_to_date_requests"]
+        )
+        if usage["provider_requests_remaining"] is not None:
+            self.rate_limit_remaining = usage["provider_requests_remaining"]
+        if usage["provider_requests_used"] is not None:
+            self.rate_limit_used = usage["provider_requests_used"]
+
+    async def _record_usage(
+        self, endpoint: str, headers: Dict[str, str], kind: Optional[str] = None
+    ) -> None:
+        """Persist the call and its quota headers from a worker thread"""
+        try:
+            from app.services.odds_quota_planner import odds_quota_planner
+
+            await asyncio.to_thread(
+                odds_quota_planner.record_usage, endpoint, headers, kind
+            )
+        except Exception as e:
+            logger.debug(f"Could not record Odds API usage: {e}")
+
     def _reset_counters_if_needed(self) -> None:
         """Reset daily/monthly counters if needed"""
         now = datetime.utcnow()
@@ -244,6 +292,8 @@ class OddsAPIService:
         try:
             self.rate_limit_remaining = int(headers.get("x-requests-remaining", 0))
             self.rate_limit_used = int(headers.get("x-requests-used", 0))
+            self.last_request_cost = int(headers.get("x-requests-last", 0))
+            self.credits_spent += self.last_request_cost
 
             # Increment our tracking counters
             self.daily_requests += 1
@@ -258,7 +308,10 @@ class OddsAPIService:
             logger.warning("Could not parse rate limit headers")
 
     async def _make_request(
-        self, endpoint: str, params: Dict[str, Any] = None
+        self,
+        endpoint: str,
+        params: Dict[str, Any] = None,
+        usage_kind: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Make a request to The Odds API
@@ -266,6 +319,7 @@ class OddsAPIService:
         Args:
             endpoint: API endpoint (without base URL)
             params: Query parameters
+            usage_kind: Kind to log the call under, if not the endpoint's own
 
         Returns:
             JSON response data
@@ -284,10 +338,18 @@ class OddsAPIService:
         if params:
             request_params.update(params)
 
+        metric_endpoint = _EVENT_ID_PATTERN.sub("/events/{event_id}", endpoint)
+        status = "error"
+        started = time.perf_counter()
         try:
             self.last_request_time = time.time()
             async with self.session.get(url, params=request_params) as response:
-                self._update_rate_limit(dict(response.headers))
+                status = str(response.status)
+                headers = {k.lower(): v for k, v in response.headers.items()}
+                self._update_rate_limit(headers)
+                await self._record_usage(endpoint, headers, usage_kind)
+                odds_api_credits.inc(metric_endpoint, amount=self.last_request_cost)
+                odds_api_requests_remaining.set(value=self.rate_limit_remaining)
 
                 if response.status == 401:
                     raise Exception("Invalid API key")
@@ -307,6 +369,10 @@ class OddsAPIService:
         except aiohttp.ClientError as e:
             logger.error(f"Network error making request to {url}: {e}")
             raise Exception(f"Network error: {e}")
+        finally:
+            odds_api_request_duration.observe(
+                time.perf_counter() - started, metric_endpoint, status
+            )
 
     async def get_sports(self) -> List[Dict[str, Any]]:
         """
@@ -333,6 +399,7 @@ class OddsAPIService:
         bookmakers: Optional[str] = None,
         commence_time_from: Optional[datetime] = None,
         commence_time_to: Optional[datetime] = None,
+        usage_kind: Optional[str] = None,
     ) -> List[Game]:
         """
         Get live odds for a specific sport
@@ -346,6 +413,8 @@ class OddsAPIService:
             bookmakers: Comma-separated bookmaker keys
             commence_time_from: Filter games starting after this time
             commence_time_to: Filter games starting before this time
+            usage_kind: Kind to log the call under in the usage log
+                (e.g. "live_odds"), instead of "odds"
 
         Returns:
             List of Game objects with odds data
@@ -367,7 +436,7 @@ class OddsAPIService:
             params["commenceTimeTo"] = commence_time_to.strftime("%Y-%m-%dT%H:%M:%SZ")
 
         try:
-            data = await self._make_request(f"/sports/{sport}/odds", params)
+            data = await self._make_request(f"/sports/{sport}/odds", params, usage_kind)
 
             games = []
             for game_data in data:
@@ -575,6 +644,8 @@ class OddsAPIService:
             "monthly_limit": self.MONTHLY_LIMIT,
             "monthly_remaining": max(0, self.MONTHLY_LIMIT - self.monthly_requests),
             "last_request_time": self.last_request_time,
+            "last_request_cost": self.last_request_cost,
+            "credits_spent": self.credits_spent,
             "last_reset_date": self.last_reset_date.isoformat(),
             "current_month": self.current_month,
         }
@@ -688,10 +759,16 @@ async def get_popular_sports_odds() -> List[Game]:
     return all_games
 
 
-async def get_live_games() -> List[Game]:
+async def get_live_games(
+    sports: Optional[List[SportKey]] = None, lookback_hours: float = 0
+) -> List[Game]:
     """
     Get games that are currently live or starting soon (within 2 hours) from filtered sports
 
+    Args:
+        sports: Sports to check (defaults to all allowed sports)
+        lookback_hours: Also include games that started this many hours ago
+
     Returns:
         List of live/upcoming games from allowed sports only
     """
@@ -699,9 +776,10 @@ async def get_live_games() -> List[Game]:
 
     now = datetime.now(timezone.utc)
     two_hours_from_now = now + timedelta(hours=2)
+    commence_from = now - timedelta(hours=lookback_hours)
 
     # Use same filtered sports list
-    sports_to_check = [
+    sports_to_check = sports or [
         SportKey.AMERICANFOOTBALL_NFL,  # nfl
         SportKey.AMERICANFOOTBALL_NCAAF,  # ncaaf
         SportKey.BASKETBALL_NBA,  # nba
@@ -721,8 +799,9 @@ async def get_live_games() -> List[Game]:
                 sport_key = sport.value if hasattr(sport, "value") else sport
                 games = await service.get_odds(
                     sport_key,
-                    commence_time_from=now,
+                    commence_time_from=commence_from,
                     commence_time_to=two_hours_from_now,
+                    usage_kind="live_odds",
                 )
                 live_games.extend(games)
             except Exception as e:
@@ -0,0 +1,573 @@
+"""
+Adaptive Odds API quota planner.
+
+Spreads the monthly Odds API budget across sports and time windows using the
+game calendar stored in the ``games`` table:
+
+- Sports with games in progress are polled tightly (odds and scores)
+- Sports with games starting soon get moderate odds polling
+- Sports with nothing on the calendar are polled roughly once a day
+
+Usage is persisted per request in ``odds_api_usage`` (response headers plus
+local credit counts) so budgets survive process restarts.
+"""
+
+import asyncio
+import bisect
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.database_models import Game, OddsApiUsage
+from app.services.odds_api_service import OddsAPIService, SportKey
+
+logger = logging.getLogger(__name__)
+
+
+# Sports shown on the site and therefore planned for
+PLANNED_SPORTS = [
+    SportKey.AMERICANFOOTBALL_NFL.value,
+    SportKey.AMERICANFOOTBALL_NCAAF.value,
+    SportKey.BASKETBALL_NBA.value,
+    SportKey.BASKETBALL_NCAAB.value,
+    SportKey.BASKETBALL_WNBA.value,
+    SportKey.BASEBALL_MLB.value,
+    SportKey.ICEHOCKEY_NHL.value,
+    SportKey.SOCCER_EPL.value,
+    SportKey.SOCCER_MLS.value,
+]
+
+# Typical game length used to derive live windows from commence_time
+GAME_DURATION_HOURS = {
+    SportKey.AMERICANFOOTBALL_NFL.value: 3.5,
+    SportKey.AMERICANFOOTBALL_NCAAF.value: 3.5,
+    SportKey.BASKETBALL_NBA.value: 2.5,
+    SportKey.BASKETBALL_NCAAB.value: 2.25,
+    SportKey.BASKETBALL_WNBA.value: 2.0,
+    SportKey.BASEBALL_MLB.value: 3.0,
+    SportKey.ICEHOCKEY_NHL.value: 2.5,
+    SportKey.SOCCER_EPL.value: 2.0,
+    SportKey.SOCCER_MLS.value: 2.0,
+}
+DEFAULT_GAME_DURATION_HOURS = 3.0
+
+# Credits charged per call (h2h,spreads,totals in one region / scores with daysFrom)
+ODDS_CALL_CREDITS = 3
+SCORES_CALL_CREDITS = 2
+
+# Calendar windows
+PREGAME_HOURS = 6
+UPCOMING_HOURS = 72
+POSTGAME_HOURS = 3
+
+# Base polling intervals per window state: (odds seconds, scores seconds)
+BASE_INTERVALS: Dict[str, Tuple[int, Optional[int]]] = {
+    "live": (600, 300),
+    "postgame": (21600, 1800),
+    "pregame": (1800, None),
+    "upcoming": (21600, None),
+    "idle": (86400, None),
+}
+
+# Bounds on how far the budget can stretch or tighten the base intervals
+MIN_INTERVAL_SECONDS = 120
+MIN_SCALE = 0.5
+MAX_SCALE = 50.0
+
+_SPORT_ENDPOINT = re.compile(r"^/sports/([^/]+)/(odds|scores|events)")
+
+
+@dataclass
+class SportPlan:
+    """Polling plan for one sport"""
+
+    sport_key: str
+    state: str
+    odds_interval_seconds: int
+    scores_interval_seconds: Optional[int]
+    live_games: int = 0
+    next_commence_time: Optional[datetime] = None
+    projected_daily_credits: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "sport_key": self.sport_key,
+            "state": self.state,
+            "odds_interval_seconds": self.odds_interval_seconds,
+            "scores_interval_seconds": self.scores_interval_seconds,
+            "live_games": self.live_games,
+            "next_commence_time": (
+                self.next_commence_time.isoformat() if self.next_commence_time else None
+            ),
+            "projected_daily_credits": round(self.projected_daily_credits, 1),
+        }
+
+
+@dataclass
+class QuotaPlan:
+    """Budget allocation across sports for the current time"""
+
+    generated_at: datetime
+    monthly_budget: int
+    month_to_date_credits: int
+    remaining_credits: int
+    days_left: float
+    daily_budget: float
+    projected_daily_credits: float
+    scale: float
+    sports: Dict[str, SportPlan] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            "generated_at": self.generated_at.isoformat(),
+            "monthly_budget": self.monthly_budget,
+            "month_to_date_credits": self.month_to_date_credits,
+            "remaining_credits": self.remaining_credits,
+            "days_left": round(self.days_left, 2),
+            "daily_budget": round(self.daily_budget, 1),
+            "projected_daily_credits": round(self.projected_daily_credits, 1),
+            "scale": round(self.scale, 3),
+            "sports": {key: plan.to_dict() for key, plan in self.sports.items()},
+        }
+
+
+def parse_endpoint(endpoint: str) -> Tuple[str, Optional[str]]:
+    """Split an API path into (endpoint kind, sport key)"""
+    match = _SPORT_ENDPOINT.match(endpoint)
+    if match:
+        return match.group(2), match.group(1)
+    return endpoint.strip("/").split("/")[0] or "unknown", None
+
+
+def _month_bounds(now: datetime) -> Tuple[datetime, datetime]:
+    start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
+
+
+def window_state(
+    commence_times: List[datetime], at: datetime, duration_hours: float
+) -> Tuple[str, int, Optional[datetime]]:
+    """Classify a sport's calendar at a point in time
+
+    Returns (state, live game count, next commence time). ``commence_times``
+    must be sorted.
+    """
+    duration = timedelta(hours=duration_hours)
+    postgame = timedelta(hours=POSTGAME_HOURS)
+
+    # Games that could be live or just finished start after this point
+    lo = bisect.bisect_left(commence_times, at - duration - postgame)
+    hi = bisect.bisect_right(commence_times, at)
+
+    live_games = 0
+    finished_recently = False
+    for commence in commence_times[lo:hi]:
+        if at < commence + duration:
+            live_games += 1
+        else:
+            finished_recently = True
+
+    next_index = bisect.bisect_right(commence_times, at)
+    next_commence = (
+        commence_times[next_index] if next_index < len(commence_times) else None
+    )
+
+    if live_games:
+        return "live", live_games, next_commence
+    if finished_recently:
+        return "postgame", 0, next_commence
+    if next_commence and next_commence - at <= timedelta(hours=PREGAME_HOURS):
+        return "pregame", 0, next_commence
+    if next_commence and next_commence - at <= timedelta(hours=UPCOMING_HOURS):
+        return "upcoming", 0, next_commence
+    return "idle", 0, next_commence
+
+
+def projected_credits(
+    commence_times: List[datetime],
+    start: datetime,
+    duration_hours: float,
+    hours: int = 24,
+    step_minutes: int = 30,
+) -> float:
+    """Credits the base policy would spend on one sport over the next ``hours``"""
+    credits = 0.0
+    step = timedelta(minutes=step_minutes)
+    step_seconds = step.total_seconds()
+    at = start
+    end = start + timedelta(hours=hours)
+    while at < end:
+        state, _, _ = window_state(commence_times, at, duration_hours)
+        odds_interval, scores_interval = BASE_INTERVALS[state]
+        credits += step_seconds / odds_interval * ODDS_CALL_CREDITS
+        if scores_interval:
+            credits += step_seconds / scores_interval * SCORES_CALL_CREDITS
+        at += step
+    return credits
+
+
+def build_plan(
+    calendar: Dict[str, List[datetime]],
+    now: datetime,
+    monthly_budget: int,
+    month_to_date_credits: int,
+    provider_remaining: Optional[int] = None,
+    sports: Optional[List[str]] = None,
+) -> QuotaPlan:
+    """Allocate the remaining monthly budget across sports
+
+    The base intervals are stretched (or tightened, when there is slack) by a
+    single factor so the projected daily spend matches the daily budget.
+    """
+    sports = sports or PLANNED_SPORTS
+    month_start, month_end = _month_bounds(now)
+    days_left = max((month_end - now).total_seconds() / 86400, 1 / 24)
+
+    remaining = max(monthly_budget - month_to_date_credits, 0)
+    if provider_remaining is not None:
+        remaining = min(remaining, max(provider_remaining, 0))
+    daily_budget = remaining / days_left
+
+    sport_plans: Dict[str, SportPlan] = {}
+    total_projected = 0.0
+    for sport in sports:
+        times = calendar.get(sport, [])
+        duration = GAME_DURATION_HOURS.get(sport, DEFAULT_GAME_DURATION_HOURS)
+        state, live_games, next_commence = window_state(times, now, duration)
+        projected = projected_credits(times, now, duration)
+        total_projected += projected
+
+        odds_interval, scores_interval = BASE_INTERVALS[state]
+        sport_plans[sport] = SportPlan(
+            sport_key=sport,
+            state=state,
+            odds_interval_seconds=odds_interval,
+            scores_interval_seconds=scores_interval,
+            live_games=live_games,
+            next_commence_time=next_commence,
+            projected_daily_credits=projected,
+        )
+
+    if daily_budget <= 0:
+        scale = MAX_SCALE
+    elif total_projected <= 0:
+        scale = 1.0
+    else:
+        scale = min(max(total_projected / daily_budget, MIN_SCALE), MAX_SCALE)
+
+    for plan in sport_plans.values():
+        # Idle sports are never polled more often than the base daily check
+        sport_scale = max(scale, 1.0) if plan.state == "idle" else scale
+        plan.odds_interval_seconds = max(
+            int(plan.odds_interval_seconds * sport_scale), MIN_INTERVAL_SECONDS
+        )
+        if plan.scores_interval_seconds:
+            plan.scores_interval_seconds = max(
+                int(plan.scores_interval_seconds * sport_scale), MIN_INTERVAL_SECONDS
+            )
+        plan.projected_daily_credits /= sport_scale
+
+    return QuotaPlan(
+        generated_at=now,
+        monthly_budget=monthly_budget,
+        month_to_date_credits=month_to_date_credits,
+        remaining_credits=remaining,
+        days_left=days_left,
+        daily_budget=daily_budget,
+        projected_daily_credits=total_projected / scale if scale else 0.0,
+        scale=scale,
+        sports=sport_plans,
+    )
+
+
+class OddsQuotaPlanner:
+    """Persists Odds API usage and turns the game calendar into a polling plan"""
+
+    def __init__(
+        self,
+        monthly_budget: int = OddsAPIService.MONTHLY_LIMIT,
+        session_factory: Optional[Callable[[], Session]] = None,
+        plan_ttl_seconds: int = 300,
+    ):
+        self.monthly_budget = monthly_budget
+        self._session_factory = session_factory
+        self.plan_ttl_seconds = plan_ttl_seconds
+        self._plan: Optional[QuotaPlan] = None
+        self.last_refresh: Dict[Tuple[str, str], datetime] = {}
+        self._last_refresh_loaded = False
+
+    def _session(self) -> Optional[Session]:
+        if self._session_factory is not None:
+            return self._session_factory()
+
+        from app.core.database import SessionLocal
+
+        return SessionLocal() if SessionLocal is not None else None
+
+    def record_usage(
+        self, endpoint: str, headers: Dict[str, str], kind: Optional[str] = None
+    ) -> None:
+        """Persist one API call with the provider's quota headers
+
+        ``kind`` overrides the kind parsed from the path, so windowed odds
+        calls are logged as "live_odds" and seed that refresh time on restart.
+        """
+        parsed_kind, sport_key = parse_endpoint(endpoint)
+        kind = kind or parsed_kind
+
+        def _int(name: str) -> Optional[int]:
+            try:
+                return int(float(headers.get(name)))
+            except (TypeError, ValueError):
+                return None
+
+        try:
+            db = self._session()
+            if db is None:
+                return
+            try:
+                db.add(
+                    OddsApiUsage(
+                        recorded_at=datetime.utcnow(),
+                        endpoint=kind,
+                        sport_key=sport_key,
+                        credits=_int("x-requests-last") or 0,
+                        requests_used=_int("x-requests-used"),
+                        requests_remaining=_int("x-requests-remaining"),
+                    )
+                )
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning(f"Could not persist Odds API usage: {e}")
+
+    def get_usage_summary(self, now: Optional[datetime] = None) -> Dict:
+        """Month-to-date and today's usage from the persisted log"""
+        now = now or datetime.utcnow()
+        month_start, _ = _month_bounds(now)
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        summary = {
+            "month_to_date_credits": 0,
+            "month_to_date_requests": 0,
+            "today_credits": 0,
+            "today_requests": 0,
+            "provider_requests_used": None,
+            "provider_requests_remaining": None,
+            "last_recorded_at": None,
+            "credits_by_sport": {},
+        }
+
+        db = self._session()
+        if db is None:
+            return summary
+        try:
+            month_filter = OddsApiUsage.recorded_at >= month_start
+            credits, requests = db.query(
+                func.coalesce(func.sum(OddsApiUsage.credits), 0),
+                func.count(OddsApiUsage.id),
+            ).filter(month_filter)[0]
+            today_credits, today_requests = db.query(
+                func.coalesce(func.sum(OddsApiUsage.credits), 0),
+                func.count(OddsApiUsage.id),
+            ).filter(OddsApiUsage.recorded_at >= day_start)[0]
+
+            latest = (
+                db.query(OddsApiUsage)
+                .filter(month_filter)
+                .order_by(OddsApiUsage.recorded_at.desc(), OddsApiUsage.id.desc())
+                .first()
+            )
+            by_sport = (
+                db.query(OddsApiUsage.sport_key, func.sum(OddsApiUsage.credits))
+                .filter(month_filter)
+                .group_by(OddsApiUsage.sport_key)
+                .all()
+            )
+
+            summary.update(
+                month_to_date_credits=int(credits),
+                month_to_date_requests=int(requests),
+                today_credits=int(today_credits),
+                today_requests=int(today_requests),
+                credits_by_sport={
+                    sport or "none": int(total or 0) for sport, total in by_sport
+                },
+            )
+            if latest:
+                summary.update(
+                    provider_requests_used=latest.requests_used,
+                    provider_requests_remaining=latest.requests_remaining,
+                    last_recorded_at=latest.recorded_at.isoformat(),
+                )
+        finally:
+            db.close()
+
+        return summary
+
+    def load_calendar(
+        self, now: Optional[datetime] = None
+    ) -> Dict[str, List[datetime]]:
+        """Sorted commence times per sport around ``now`` from the games table"""
+        now = now or datetime.utcnow()
+        lookback = timedelta(hours=max(GAME_DURATION_HOURS.values()) + POSTGAME_HOURS)
+        horizon = timedelta(hours=24 + UPCOMING_HOURS)
+
+        calendar: Dict[str, List[datetime]] = {}
+        db = self._session()
+        if db is None:
+            return calendar
+        try:
+            rows = (
+                db.query(Game.sport_key, Game.commence_time)
+                .filter(
+                    Game.commence_time >= now - lookback,
+                    Game.commence_time <= now + horizon,
+                )
+                .order_by(Game.commence_time)
+                .all()
+            )
+        finally:
+            db.close()
+
+        for sport_key, commence_time in rows:
+            if commence_time.tzinfo is not None:
+                commence_time = commence_time.replace(tzinfo=None)
+            calendar.setdefault(sport_key, []).append(commence_time)
+        return calendar
+
+    def _plan_is_fresh(self, now: datetime) -> bool:
+        return (
+            self._plan is not None
+            and (now - self._plan.generated_at).total_seconds() < self.plan_ttl_seconds
+        )
+
+    def current_plan(self, refresh: bool = False) -> QuotaPlan:
+        """Plan for now, rebuilt at most every ``plan_ttl_seconds``
+
+        Rebuilding queries the usage log and the game calendar; async callers
+        use ``refresh`` instead.
+        """
+        now = datetime.utcnow()
+        if not refresh and self._plan_is_fresh(now):
+            return self._plan
+
+        try:
+            usage = self.get_usage_summary(now)
+            calendar = self.load_calendar(now)
+        except Exception as e:
+            logger.warning(f"Quota planner falling back to empty calendar: {e}")
+            usage = {"month_to_date_credits": 0, "provider_requests_remaining": None}
+            calendar = {}
+
+        self._plan = build_plan(
+            calendar,
+            now,
+            self.monthly_budget,
+            usage["month_to_date_credits"],
+            usage.get("provider_requests_remaining"),
+        )
+        return self._plan
+
+    def _load_last_refresh(self) -> None:
+        """Seed last refresh times from the usage log after a restart"""
+        self._last_refresh_loaded = True
+        try:
+            db = self._session()
+            if db is None:
+                return
+            try:
+                rows = (
+                    db.query(
+                        OddsApiUsage.sport_key,
+                        OddsApiUsage.endpoint,
+                        func.max(OddsApiUsage.recorded_at),
+                    )
+                    .filter(OddsApiUsage.sport_key.isnot(None))
+                    .group_by(OddsApiUsage.sport_key, OddsApiUsage.endpoint)
+                    .all()
+                )
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning(f"Could not load last Odds API refresh times: {e}")
+            return
+
+        for sport_key, endpoint, recorded_at in rows:
+            key = (sport_key, endpoint)
+            if recorded_at and recorded_at > self.last_refresh.get(key, datetime.min):
+                self.last_refresh[key] = recorded_at
+
+    def _load_plan(self) -> QuotaPlan:
+        if not self._last_refresh_loaded:
+            self._load_last_refresh()
+        return self.current_plan()
+
+    async def refresh(self) -> QuotaPlan:
+        """Current plan, rebuilt in a worker thread when it has gone stale"""
+        if self._last_refresh_loaded and self._plan_is_fresh(datetime.utcnow()):
+            return self._plan
+        return await asyncio.to_thread(self._load_plan)
+
+    def is_due(self, sport_key: str, kind: str, now: Optional[datetime] = None) -> bool:
+        """Whether the plan calls for another fetch of ``kind`` for a sport
+
+        ``kind`` is "odds" (full board), "live_odds" (games in or near their
+        live window only) or "scores". Reads the plan the last ``refresh``
+        built and never touches the database; nothing is due before the
+        first refresh.
+        """
+        if self._plan is None:
+            return False
+
+        plan = self._plan.sports.get(sport_key)
+        if plan is None:
+            return False
+
+        if kind == "scores":
+            interval = plan.scores_interval_seconds
+        elif kind == "live_odds":
+            interval = (
+                plan.odds_interval_seconds
+                if plan.state in ("live", "pregame")
+                else None
+            )
+        else:
+            interval = plan.odds_interval_seconds
+        if not interval:
+            return False
+
+        last = self.last_refresh.get((sport_key, kind))
+        now = now or datetime.utcnow()
+        return last is None or (now - last).total_seconds() >= interval
+
+    def mark_refreshed(
+        self, sport_key: str, kind: str, at: Optional[datetime] = None
+    ) -> None:
+        self.last_refresh[(sport_key, kind)] = at or datetime.utcnow()
+
+    def get_plan_report(self) -> Dict:
+        """Plan plus persisted usage, for the admin endpoint"""
+        plan = self.current_plan(refresh=True)
+        return {
+            "plan": plan.to_dict(),
+            "usage": self.get_usage_summary(),
+            "last_refresh": {
+                f"{sport}:{kind}": at.isoformat()
+                for (sport, kind), at in sorted(self.last_refresh.items())
+            },
+        }
+
+
+# Global planner instance
+odds_quota_planner = OddsQuotaPlanner()
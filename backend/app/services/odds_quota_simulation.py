@@ -0,0 +1,279 @@
+"""
+Replay a game calendar against an Odds API polling policy.
+
+Used to compare the adaptive quota planner with the old fixed-interval
+scheduler: how many credits each spends over a season and how stale the odds
+of in-progress games get between refreshes.
+"""
+
+import bisect
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.database_models import Game
+from app.services.odds_quota_planner import (
+    DEFAULT_GAME_DURATION_HOURS,
+    GAME_DURATION_HOURS,
+    ODDS_CALL_CREDITS,
+    PLANNED_SPORTS,
+    SCORES_CALL_CREDITS,
+    QuotaPlan,
+    build_plan,
+)
+
+# Sports the scheduler refreshes full boards and scores for
+POPULAR_SPORTS = [
+    "americanfootball_nfl",
+    "basketball_nba",
+    "baseball_mlb",
+    "icehockey_nhl",
+]
+
+# Old SchedulerService intervals
+FIXED_POPULAR_ODDS_SECONDS = 7200
+FIXED_LIVE_GAMES_SECONDS = 1800
+FIXED_SCORES_SECONDS = 14400
+
+# Window the live games fetch asks for
+LIVE_LOOKAHEAD = timedelta(hours=2)
+
+# (weekdays, UTC kick-off hours, games per slot) for the synthetic calendar
+SYNTHETIC_SLATES: Dict[str, Tuple[List[int], List[float], int]] = {
+    "americanfootball_nfl": ([6], [17.0, 20.4, 0.3], 5),
+    "americanfootball_ncaaf": ([5], [16.0, 19.5, 23.5], 8),
+    "basketball_nba": ([0, 1, 2, 3, 4, 5, 6], [23.5, 0.5, 2.5], 3),
+    "basketball_ncaab": ([1, 2, 5], [0.0, 2.0], 6),
+    "basketball_wnba": ([], [], 0),
+    "baseball_mlb": ([], [], 0),
+    "icehockey_nhl": ([1, 3, 5, 6], [23.0, 0.5, 2.0], 3),
+    "soccer_epl": ([5, 6], [12.5, 15.0, 17.5], 3),
+    "soccer_mls": ([], [], 0),
+}
+
+
+@dataclass
+class SimulationResult:
+    """Credits spent and live-window odds staleness for one policy"""
+
+    policy: str
+    start: datetime
+    end: datetime
+    credits: int = 0
+    calls: int = 0
+    credits_by_sport: Dict[str, int] = field(default_factory=dict)
+    live_samples: int = 0
+    mean_staleness_seconds: float = 0.0
+    p95_staleness_seconds: float = 0.0
+    max_staleness_seconds: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "policy": self.policy,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "credits": self.credits,
+            "calls": self.calls,
+            "credits_by_sport": self.credits_by_sport,
+            "live_samples": self.live_samples,
+            "mean_staleness_seconds": round(self.mean_staleness_seconds, 1),
+            "p95_staleness_seconds": round(self.p95_staleness_seconds, 1),
+            "max_staleness_seconds": round(self.max_staleness_seconds, 1),
+        }
+
+
+def build_synthetic_schedule(
+    start: datetime, days: int, seed: int = 0
+) -> Dict[str, List[datetime]]:
+    """A repeatable in-season calendar for the planned sports"""
+    rng = random.Random(seed)
+    day_zero = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    calendar: Dict[str, List[datetime]] = {}
+
+    for sport, (weekdays, hours, per_slot) in SYNTHETIC_SLATES.items():
+        times = []
+        for offset in range(days):
+            day = day_zero + timedelta(days=offset)
+            if day.weekday() not in weekdays:
+                continue
+            for hour in hours:
+                for _ in range(rng.randint(max(per_slot - 1, 1), per_slot)):
+                    times.append(day + timedelta(hours=hour))
+        calendar[sport] = sorted(times)
+    return calendar
+
+
+def load_season_calendar(
+    db: Session, start: datetime, end: datetime
+) -> Dict[str, List[datetime]]:
+    """Commence times per sport from the games table"""
+    rows = (
+        db.query(Game.sport_key, Game.commence_time)
+        .filter(Game.commence_time >= start, Game.commence_time < end)
+        .order_by(Game.commence_time)
+        .all()
+    )
+    calendar: Dict[str, List[datetime]] = {}
+    for sport_key, commence_time in rows:
+        if commence_time.tzinfo is not None:
+            commence_time = commence_time.replace(tzinfo=None)
+        calendar.setdefault(sport_key, []).append(commence_time)
+    return calendar
+
+
+class _Replay:
+    """Bookkeeping shared by both policies"""
+
+    def __init__(self, calendar: Dict[str, List[datetime]], result: SimulationResult):
+        self.calendar = {sport: sorted(times) for sport, times in calendar.items()}
+        self.result = result
+        # Last time each game's odds were fetched, indexed like the calendar
+        self.covered: Dict[str, List[Optional[datetime]]] = {
+            sport: [None] * len(times) for sport, times in self.calendar.items()
+        }
+        self.staleness: List[float] = []
+
+    def charge(self, sport: str, credits: int) -> None:
+        self.result.credits += credits
+        self.result.calls += 1
+        self.result.credits_by_sport[sport] = (
+            self.result.credits_by_sport.get(sport, 0) + credits
+        )
+
+    def fetch_odds(
+        self,
+        sport: str,
+        at: datetime,
+        commence_from: Optional[datetime] = None,
+        commence_to: Optional[datetime] = None,
+    ) -> None:
+        """One odds call; marks the games it returns as fresh"""
+        self.charge(sport, ODDS_CALL_CREDITS)
+        times = self.calendar.get(sport, [])
+        lo = 0 if commence_from is None else bisect.bisect_left(times, commence_from)
+        hi = (
+            len(times)
+            if commence_to is None
+            else bisect.bisect_right(times, commence_to)
+        )
+        covered = self.covered.get(sport)
+        for index in range(lo, hi):
+            # Finished games are no longer returned by the odds endpoint
+            duration = GAME_DURATION_HOURS.get(sport, DEFAULT_GAME_DURATION_HOURS)
+            if times[index] + timedelta(hours=duration) > at:
+                covered[index] = at
+
+    def sample(self, at: datetime) -> None:
+        """Record odds age for every game in progress"""
+        for sport, times in self.calendar.items():
+            duration = timedelta(
+                hours=GAME_DURATION_HOURS.get(sport, DEFAULT_GAME_DURATION_HOURS)
+            )
+            lo = bisect.bisect_left(times, at - duration)
+            hi = bisect.bisect_right(times, at)
+            for index in range(lo, hi):
+                if at >= times[index] + duration:
+                    continue
+                last = self.covered[sport][index]
+                since = last if last is not None else self.result.start
+                self.staleness.append((at - since).total_seconds())
+
+    def finish(self) -> SimulationResult:
+        result = self.result
+        if self.staleness:
+            ordered = sorted(self.staleness)
+            result.live_samples = len(ordered)
+            result.mean_staleness_seconds = sum(ordered) / len(ordered)
+            result.p95_staleness_seconds = ordered[
+                min(int(len(ordered) * 0.95), len(ordered) - 1)
+            ]
+            result.max_staleness_seconds = ordered[-1]
+        return result
+
+
+def _due(last: Optional[datetime], at: datetime, interval: Optional[int]) -> bool:
+    if not interval:
+        return False
+    return last is None or (at - last).total_seconds() >= interval
+
+
+def simulate_schedule(
+    calendar: Dict[str, List[datetime]],
+    start: datetime,
+    end: datetime,
+    policy: str = "adaptive",
+    monthly_budget: int = 20000,
+    tick_seconds: int = 300,
+    plan_interval_seconds: int = 1800,
+) -> SimulationResult:
+    """Replay ``calendar`` between ``start`` and ``end`` under a polling policy
+
+    ``policy`` is "adaptive" (the quota planner) or "fixed" (the previous
+    2 h / 30 min / 4 h scheduler intervals). Adaptive budgets reset with each
+    calendar month; nothing is assumed spent before ``start``.
+    """
+    if policy not in ("adaptive", "fixed"):
+        raise ValueError(f"Unknown policy: {policy}")
+
+    replay = _Replay(calendar, SimulationResult(policy=policy, start=start, end=end))
+    last: Dict[Tuple[str, str], datetime] = {}
+    tick = timedelta(seconds=tick_seconds)
+    lookback = timedelta(hours=max(GAME_DURATION_HOURS.values()))
+    plan: Optional[QuotaPlan] = None
+    plan_at: Optional[datetime] = None
+    month: Optional[Tuple[int, int]] = None
+    month_start_credits = 0
+
+    at = start
+    while at < end:
+        if policy == "fixed":
+            if _due(last.get(("*", "odds")), at, FIXED_POPULAR_ODDS_SECONDS):
+                for sport in POPULAR_SPORTS:
+                    replay.fetch_odds(sport, at)
+                last[("*", "odds")] = at
+            if _due(last.get(("*", "live_odds")), at, FIXED_LIVE_GAMES_SECONDS):
+                for sport in PLANNED_SPORTS:
+                    replay.fetch_odds(sport, at, at, at + LIVE_LOOKAHEAD)
+                last[("*", "live_odds")] = at
+            if _due(last.get(("*", "scores")), at, FIXED_SCORES_SECONDS):
+                for sport in POPULAR_SPORTS:
+                    replay.charge(sport, SCORES_CALL_CREDITS)
+                last[("*", "scores")] = at
+        else:
+            if (at.year, at.month) != month:
+                month = (at.year, at.month)
+                month_start_credits = replay.result.credits
+                plan = None
+            if plan is None or (at - plan_at).total_seconds() >= plan_interval_seconds:
+                plan = build_plan(
+                    calendar,
+                    at,
+                    monthly_budget,
+                    replay.result.credits - month_start_credits,
+                )
+                plan_at = at
+
+            for sport, sport_plan in plan.sports.items():
+                if sport in POPULAR_SPORTS and _due(
+                    last.get((sport, "odds")), at, sport_plan.odds_interval_seconds
+                ):
+                    replay.fetch_odds(sport, at)
+                    last[(sport, "odds")] = at
+                if sport_plan.state in ("live", "pregame") and _due(
+                    last.get((sport, "live_odds")), at, sport_plan.odds_interval_seconds
+                ):
+                    replay.fetch_odds(sport, at, at - lookback, at + LIVE_LOOKAHEAD)
+                    last[(sport, "live_odds")] = at
+                if sport in POPULAR_SPORTS and _due(
+                    last.get((sport, "scores")), at, sport_plan.scores_interval_seconds
+                ):
+                    replay.charge(sport, SCORES_CALL_CREDITS)
+                    last[(sport, "scores")] = at
+
+        replay.sample(at)
+        at += tick
+
+    return replay.finish()
@@ -0,0 +1,240 @@
+"""
+Single-pass parlay settlement
+
+Every pending parlay is loaded together with its legs in one query and run
+once through a small state machine over the leg statuses. Leg results decided
+earlier in the same run can be overlaid, so callers write legs and parents in
+one bulk transaction instead of re-checking the parent after every leg.
+"""
+
+import enum
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, attributes, joinedload
+
+from app.models.simple_unified_bet_model import BetStatus, BetType, SimpleUnifiedBet
+
+logger = logging.getLogger(__name__)
+
+
+class ParlayState(str, enum.Enum):
+    """Where a parlay stands after folding in some of its legs"""
+
+    EMPTY = "empty"  # no legs seen yet
+    VOID = "void"  # every leg so far pushed or cancelled
+    WINNING = "winning"  # every leg so far won or void, at least one won
+    AWAITING = "awaiting"  # a leg is undecided and none has lost
+    LOST = "lost"  # a leg lost; absorbing
+
+
+# Leg status -> the input the state machine sees
+LEG_INPUTS = {
+    BetStatus.WON: "won",
+    BetStatus.LOST: "lost",
+    BetStatus.PUSHED: "void",
+    BetStatus.CANCELLED: "void",
+}
+
+TRANSITIONS: Dict[ParlayState, Dict[str, ParlayState]] = {
+    ParlayState.EMPTY: {
+        "won": ParlayState.WINNING,
+        "void": ParlayState.VOID,
+        "pending": ParlayState.AWAITING,
+        "lost": ParlayState.LOST,
+    },
+    ParlayState.VOID: {
+        "won": ParlayState.WINNING,
+        "void": ParlayState.VOID,
+        "pending": ParlayState.AWAITING,
+        "lost": ParlayState.LOST,
+    },
+    ParlayState.WINNING: {
+        "won": ParlayState.WINNING,
+        "void": ParlayState.WINNING,
+        "pending": ParlayState.AWAITING,
+        "lost": ParlayState.LOST,
+    },
+    ParlayState.AWAITING: {
+        "won": ParlayState.AWAITING,
+        "void": ParlayState.AWAITING,
+        "pending": ParlayState.AWAITING,
+        "lost": ParlayState.LOST,
+    },
+}
+
+
+@dataclass
+class ParlaySettlement:
+    """Final outcome of a parlay whose legs are all decided (or one lost)"""
+
+    parlay_id: str
+    user_id: int
+    status: BetStatus
+    result_amount: float
+    reasoning: str
+
+
+def american_to_decimal(odds: float) -> float:
+    """Convert American odds to decimal"""
+    if odds > 0:
+        return (odds / 100) + 1
+    return (100 / abs(odds)) + 1
+
+
+def run_parlay_state_machine(leg_statuses: Iterable[BetStatus]) -> ParlayState:
+    """Fold leg statuses into a parlay state, stopping at the first loss"""
+    state = ParlayState.EMPTY
+    for status in leg_statuses:
+        state = TRANSITIONS[state][LEG_INPUTS.get(status, "pending")]
+        if state is ParlayState.LOST:
+            break
+    return state
+
+
+def evaluate_parlay(
+    amount: float,
+    potential_win: float,
+    legs: Sequence[Tuple[BetStatus, Optional[float]]],
+) -> Tuple[ParlayState, BetStatus, float, str]:
+    """
+    Decide a parlay from its (status, american_odds) legs
+
+    Any lost leg loses the parlay; once every leg is final it wins, or pushes
+    when every leg was void. Void legs drop out of a win, and the payout is
+    re-priced from the remaining legs' odds.
+    """
+    state = run_parlay_state_machine(status for status, _ in legs)
+    total = len(legs)
+
+    if state is ParlayState.LOST:
+        lost = sum(1 for status, _ in legs if status == BetStatus.LOST)
+        return state, BetStatus.LOST, 0.0, f"Parlay lost: {lost} of {total} legs lost"
+
+    if state is ParlayState.EMPTY:
+        return state, BetStatus.PENDING, 0.0, "Parlay has no legs"
+
+    if state is ParlayState.AWAITING:
+        pending = sum(1 for status, _ in legs if status not in LEG_INPUTS)
+        return (
+            state,
+            BetStatus.PENDING,
+            0.0,
+            f"Parlay pending: {pending} legs still pending",
+        )
+
+    if state is ParlayState.VOID:
+        return (
+            state,
+            BetStatus.PUSHED,
+            amount,
+            f"Parlay pushed: All {total} legs pushed",
+        )
+
+    won_odds = [odds for status, odds in legs if status == BetStatus.WON]
+    if len(won_odds) == total:
+        payout = amount + potential_win
+    elif all(won_odds):
+        payout = amount
+        for odds in won_odds:
+            payout *= american_to_decimal(odds)
+    else:
+        # Leg odds missing: scale the winnings by the share of legs that won
+        payout = amount + potential_win * len(won_odds) / total
+    return (
+        state,
+        BetStatus.WON,
+        round(payout, 2),
+        f"Parlay won: {len(won_odds)} legs won, {total - len(won_odds)} legs pushed",
+    )
+
+
+def _leg_ids(parlay_legs) -> List[str]:
+    """Leg ids from the legacy parlay_legs JSON column (a list of bet ids)"""
+    if not isinstance(parlay_legs, list):
+        return []
+    return [leg_id for leg_id in parlay_legs if isinstance(leg_id, str)]
+
+
+class ParlaySettlementEngine:
+    """Evaluates every pending parlay once per verification run"""
+
+    def load_pending_parlays(self, db: Session) -> List[SimpleUnifiedBet]:
+        """Pending parlay parents with legs eager-loaded in a single query"""
+        parlays = (
+            db.query(SimpleUnifiedBet)
+            .options(joinedload(SimpleUnifiedBet.legs))
+            .filter(
+                SimpleUnifiedBet.status == BetStatus.PENDING,
+                or_(
+                    SimpleUnifiedBet.is_parlay.is_(True),
+                    SimpleUnifiedBet.bet_type == BetType.PARLAY,
+                ),
+            )
+            .all()
+        )
+
+        # Older parlays only list their legs in the parlay_legs JSON column
+        legacy = {
+            parlay.id: _leg_ids(parlay.parlay_legs)
+            for parlay in parlays
+            if not parlay.legs and _leg_ids(parlay.parlay_legs)
+        }
+        if legacy:
+            wanted = {leg_id for ids in legacy.values() for leg_id in ids}
+            found = {
+                leg.id: leg
+                for leg in db.query(SimpleUnifiedBet).filter(
+                    SimpleUnifiedBet.id.in_(wanted)
+                )
+            }
+            for parlay in parlays:
+                if parlay.id in legacy:
+                    attributes.set_committed_value(
+                        parlay,
+                        "legs",
+                        [found[i] for i in legacy[parlay.id] if i in found],
+                    )
+        return parlays
+
+    def settle(
+        self,
+        db: Session,
+        leg_results: Optional[Mapping[str, BetStatus]] = None,
+    ) -> List[ParlaySettlement]:
+        """
+        Evaluate each pending parlay once and return the decided ones
+
+        leg_results overlays leg outcomes decided in this run but not yet
+        written, so legs and parents can be committed together.
+        """
+        leg_results = leg_results or {}
+        settlements = []
+        for parlay in self.load_pending_parlays(db):
+            legs = [
+                (leg_results.get(leg.id, leg.status), leg.odds) for leg in parlay.legs
+            ]
+            state, status, result_amount, reasoning = evaluate_parlay(
+                parlay.amount, parlay.potential_win, legs
+            )
+            if state is ParlayState.EMPTY:
+                logger.warning(f"Parlay {parlay.id}: No legs found, keeping as pending")
+            if status == BetStatus.PENDING:
+                continue
+
+            logger.info(f"Parlay {parlay.id}: {status.value} - {reasoning}")
+            settlements.append(
+                ParlaySettlement(
+                    parlay_id=parlay.id,
+                    user_id=parlay.user_id,
+                    status=status,
+                    result_amount=result_amount,
+                    reasoning=reasoning,
+                )
+            )
+        return settlements
+
+
+parlay_settlement_engine = ParlaySettlementEngine()
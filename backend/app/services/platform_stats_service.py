@@ -0,0 +1,300 @@
+"""
+Pre-aggregated platform statistics for the login page
+
+Settled YetAI bets are rolled up per settlement day into platform_stats_daily
+(wins, losses and the $100-stake profit of the wins), computed in SQL with
+CASE expressions over the American odds. Settlement paths refresh the days
+they touch; the login page reads a handful of summary rows through a short
+in-process cache and never scans yetai_bets.
+"""
+
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.database_models import PlatformStatsDaily, User, YetAIBet
+
+logger = logging.getLogger(__name__)
+
+# Seconds a computed response is served before the summary is read again
+STATS_CACHE_TTL_SECONDS = 60
+
+STAKE = 100.0
+
+# Outcome of a settled bet. Automatic settlement records it in status and a
+# description in result; older admin settlements put it in result.
+_OUTCOME = case(
+    (YetAIBet.status.in_(("won", "lost")), YetAIBet.status),
+    (YetAIBet.result.in_(("won", "lost")), YetAIBet.result),
+    else_=None,
+)
+
+# Profit of a winning $100 bet at American odds
+_WIN_PROFIT = case(
+    (YetAIBet.odds > 0, YetAIBet.odds * (STAKE / 100)),
+    (YetAIBet.odds < 0, STAKE * 100 / func.abs(YetAIBet.odds)),
+    else_=0.0,
+)
+
+_SETTLED_DAY = func.date(YetAIBet.settled_at)
+
+_summary = PlatformStatsDaily.__table__
+
+
+def _as_date(value) -> date:
+    # SQLite returns date() as text, PostgreSQL as a date
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _seed_days(db: Session, days: List[date]) -> None:
+    """Create zero rows for days the summary doesn't have yet"""
+    now = datetime.utcnow()
+    rows = [
+        {"day": day, "wins": 0, "losses": 0, "won_profit": 0.0, "updated_at": now}
+        for day in days
+    ]
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        db.execute(dialect_insert(_summary).on_conflict_do_nothing(), rows)
+        return
+    existing = set(
+        db.execute(select(_summary.c.day).where(_summary.c.day.in_(days))).scalars()
+    )
+    for row in rows:
+        if row["day"] in existing:
+            continue
+        try:
+            with db.begin_nested():
+                db.execute(insert(_summary).values(**row))
+        except IntegrityError:
+            pass  # A concurrent refresh created the row
+
+
+def _lock_days(days: List[date]):
+    """Row locks on the summary days, taken in day order"""
+    return (
+        select(_summary.c.day)
+        .where(_summary.c.day.in_(days))
+        .order_by(_summary.c.day)
+        .with_for_update()
+    )
+
+
+def _win_rate(wins: int, losses: int) -> float:
+    total = wins + losses
+    return wins / total * 100 if total else 0
+
+
+class PlatformStatsService:
+    """Maintains the daily summary and serves cached login page stats"""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        cache_ttl: float = STATS_CACHE_TTL_SECONDS,
+    ):
+        self._session_factory = session_factory or SessionLocal
+        self.cache_ttl = cache_ttl
+        self._cached: Optional[Tuple[float, Dict]] = None
+        self._backfilled = False
+
+    def refresh_days(self, db: Session, days: Iterable[date]) -> int:
+        """
+        Recompute the summary rows for the given settlement days
+
+        Runs in the caller's transaction so the summary commits with the
+        settlements. The day rows are seeded and locked before yetai_bets is
+        read: a second transaction refreshing the same day waits for this one
+        to commit, then aggregates with its settlements included, so the last
+        write always counts every bet. Returns the number of day rows written.
+        """
+        days = sorted(set(days))
+        if not days:
+            return 0
+        db.flush()
+        _seed_days(db, days)
+        db.execute(_lock_days(days)).all()
+        start = datetime.combine(days[0], datetime.min.time())
+        end = datetime.combine(days[-1] + timedelta(days=1), datetime.min.time())
+        rows = self._aggregate(
+            db, YetAIBet.settled_at >= start, YetAIBet.settled_at < end
+        )
+        by_day = {row["day"]: row for row in rows}
+        now = datetime.utcnow()
+        for day in days:
+            # Days left without settled bets keep a zero row rather than a gap
+            row = by_day.get(day, {"wins": 0, "losses": 0, "won_profit": 0.0})
+            db.execute(
+                update(_summary)
+                .where(_summary.c.day == day)
+                .values(
+                    wins=row["wins"],
+                    losses=row["losses"],
+                    won_profit=row["won_profit"],
+                    updated_at=now,
+                )
+            )
+        self._cached = None
+        return len(days)
+
+    def rebuild(self, db: Session) -> int:
+        """Recompute the whole summary from yetai_bets (backfill)"""
+        db.flush()
+        rows = self._aggregate(db, YetAIBet.settled_at.isnot(None))
+        db.execute(delete(PlatformStatsDaily))
+        if rows:
+            db.execute(insert(PlatformStatsDaily), rows)
+        self._cached = None
+        logger.info(f"Rebuilt platform stats summary: {len(rows)} days")
+        return len(rows)
+
+    def _aggregate(self, db: Session, *filters):
+        """One GROUP BY over settled won/lost bets, a row per day"""
+        statement = (
+            select(
+                _SETTLED_DAY,
+                func.sum(case((_OUTCOME == "won", 1), else_=0)),
+                func.sum(case((_OUTCOME == "lost", 1), else_=0)),
+                func.sum(case((_OUTCOME == "won", _WIN_PROFIT), else_=0.0)),
+            )
+            .where(*filters, _OUTCOME.isnot(None))
+            .group_by(_SETTLED_DAY)
+        )
+        now = datetime.utcnow()
+        return [
+            {
+                "day": _as_date(day),
+                "wins": int(wins or 0),
+                "losses": int(losses or 0),
+                "won_profit": float(won_profit or 0),
+                "updated_at": now,
+            }
+            for day, wins, losses, won_profit in db.execute(statement)
+        ]
+
+    def get_stats(self, db: Optional[Session] = None) -> Dict:
+        """Login page stats, recomputed from the summary at most once per TTL"""
+        cached = self._cached
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        owns_session = db is None
+        if owns_session:
+            db = self._session_factory()
+        try:
+            if not self._backfilled:
+                # Databases created before the summary existed start empty
+                if db.query(PlatformStatsDaily.day).first() is None:
+                    self.rebuild(db)
+                    db.commit()
+                self._backfilled = True
+            stats = self._compute(db)
+        finally:
+            if owns_session:
+                db.close()
+
+        self._cached = (time.monotonic() + self.cache_ttl, stats)
+        return stats
+
+    def invalidate(self) -> None:
+        self._cached = None
+
+    def _compute(self, db: Session) -> Dict:
+        today = datetime.utcnow().date()
+        day_30 = today - timedelta(days=30)
+        day_7 = today - timedelta(days=7)
+        day_14 = today - timedelta(days=14)
+        summary = PlatformStatsDaily
+
+        def window(column, start: date, end: Optional[date] = None):
+            condition = summary.day >= start
+            if end is not None:
+                condition = condition & (summary.day < end)
+            return func.coalesce(func.sum(case((condition, column), else_=0)), 0)
+
+        totals = db.execute(
+            select(
+                func.coalesce(func.sum(summary.won_profit), 0),
+                window(summary.wins, day_30),
+                window(summary.losses, day_30),
+                window(summary.won_profit, day_30),
+                window(summary.wins, day_7),
+                window(summary.losses, day_7),
+                window(summary.won_profit, day_7),
+                window(summary.losses, day_14, day_7),
+                window(summary.won_profit, day_14, day_7),
+            )
+        ).one()
+        (
+            total_winnings,
+            wins_30d,
+            losses_30d,
+            won_profit_30d,
+            wins_7d,
+            losses_7d,
+            won_profit_7d,
+            losses_prev_7d,
+            won_profit_prev_7d,
+        ) = totals
+
+        profit_30d = won_profit_30d - STAKE * losses_30d
+        profit_7d = won_profit_7d - STAKE * losses_7d
+        profit_prev_7d = won_profit_prev_7d - STAKE * losses_prev_7d
+
+        # Week-over-week change against the 7 days before
+        if profit_prev_7d != 0:
+            wow_change = ((profit_7d - profit_prev_7d) / abs(profit_prev_7d)) * 100
+        elif profit_7d > 0:
+            wow_change = 100  # 100% increase from 0
+        else:
+            wow_change = 0
+
+        total_users = (
+            db.query(func.count(User.id)).filter(User.is_hidden == False).scalar() or 0
+        )
+        recent_users = (
+            db.query(User)
+            .filter(User.avatar_url.isnot(None), User.is_hidden == False)
+            .order_by(User.created_at.desc())
+            .limit(3)
+            .all()
+        )
+        user_avatars = [
+            {
+                "url": user.avatar_url,
+                "name": f"{user.first_name or ''} {user.last_name or ''}".strip()
+                or user.username,
+            }
+            for user in recent_users
+        ]
+
+        return {
+            "total_users": total_users,
+            "total_winnings": round(float(total_winnings), 2),
+            "performance_30d": {
+                "win_rate": round(_win_rate(wins_30d, losses_30d), 1),
+                "profit": round(float(profit_30d), 2),
+                "total_bets": wins_30d + losses_30d,
+                "wins": wins_30d,
+                "losses": losses_30d,
+            },
+            "performance_7d": {
+                "win_rate": round(_win_rate(wins_7d, losses_7d), 1),
+                "profit": round(float(profit_7d), 2),
+                "wow_change": round(wow_change, 1),
+            },
+            "user_avatars": user_avatars,
+        }
+
+
+platform_stats_service = PlatformStatsService()
@@ -13,6 +13,8 @@ from app.models.fantasy_models import (
     PlayerTrends,
     PlayerProjection,
 )
+from app.services.player_feature_store import linear_slope, player_feature_store
+from app.services.team_analytics import team_analytics_cache
 
 
 class PlayerAnalyticsService:
@@ -100,6 +102,10 @@ class PlayerAnalyticsService:
     ) -> Dict:
         """Calculate usage trends over specified weeks"""
         try:
+            features = player_feature_store.lookup(self.db, player_id, season, weeks)
+            if features is not None:
+                return player_feature_store.usage_trends(features)
+
             analytics = await self.get_player_analytics(player_id, weeks, season)
 
             if len(analytics) < 2:
@@ -144,6 +150,10 @@ class PlayerAnalyticsService:
     ) -> Dict:
         """Calculate advanced efficiency metrics"""
         try:
+            features = player_feature_store.lookup(self.db, player_id, season, weeks)
+            if features is not None:
+                return player_feature_store.efficiency_metrics(features)
+
             analytics = await self.get_player_analytics(player_id, weeks, season)
 
             if not analytics:
@@ -210,11 +220,24 @@ class PlayerAnalyticsService:
             .having(func.count(PlayerAnalytics.week) >= min_weeks)
         )
 
-        candidates = []
+        player_ids = [row.player_id for row in subquery]
 
-        for player_query in subquery:
-            player_id = player_query.player_id
-            trends = await self.calculate_usage_trends(player_id, recent_weeks, season)
+        # Stored windows answer most players in one query
+        features = {}
+        span = player_feature_store.span_for(recent_weeks)
+        if span is not None:
+            features = player_feature_store.lookup_many(
+                self.db, player_ids, season, recent_weeks[-1], span
+            )
+
+        rising = {}
+        for player_id in player_ids:
+            if player_id in features:
+                trends = player_feature_store.usage_trends(features[player_id])
+            else:
+                trends = await self.calculate_usage_trends(
+                    player_id, recent_weeks, season
+                )
 
             # Breakout criteria
             if (
@@ -222,18 +245,26 @@ class PlayerAnalyticsService:
                 and trends.get("target_share_trend", 0) > 3  # Increasing target share
                 and trends.get("avg_snap_share", 0) > 40
             ):  # Meaningful snap share
+                rising[player_id] = trends
 
-                player = self.db.query(FantasyPlayer).get(player_id)
-                if player and player.position.value == position:
-                    candidates.append(
-                        {
-                            "player_id": player_id,
-                            "player_name": player.name,
-                            "team": player.team,
-                            "trends": trends,
-                            "breakout_score": self._calculate_breakout_score(trends),
-                        }
-                    )
+        candidates = []
+        players = (
+            self.db.query(FantasyPlayer).filter(FantasyPlayer.id.in_(list(rising)))
+            if rising
+            else []
+        )
+        for player in players:
+            if player.position.value == position:
+                trends = rising[player.id]
+                candidates.append(
+                    {
+                        "player_id": player.id,
+                        "player_name": player.name,
+                        "team": player.team,
+                        "trends": trends,
+                        "breakout_score": self._calculate_breakout_score(trends),
+                    }
+                )
 
         # Sort by breakout score
         return sorted(candidates, key=lambda x: x["breakout_score"], reverse=True)
@@ -312,7 +343,11 @@ class PlayerAnalyticsService:
             )
             self.db.add(analytics)
 
+        # Refresh the rolling features this week falls into, in the same commit
+        self.db.flush()
+        player_feature_store.update_player_week(self.db, player_id, season, week)
         self.db.commit()
+        team_analytics_cache.invalidate_analytics()
         self.db.refresh(analytics)
 
         return analytics
@@ -364,21 +399,8 @@ class PlayerAnalyticsService:
         if len(values) < 2:
             return 0
 
-        n = len(values)
-        x = list(range(n))
-
-        # Simple linear regression slope
-        x_mean = sum(x) / n
-        y_mean = sum(values) / n
-
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-
-        if denominator == 0:
-            return 0
-
-        slope = numerator / denominator
-        return round(slope, 2)
+        # Simple linear regression slope, shared with the feature store
+        return round(linear_slope(values), 2)
 
     def _calculate_breakout_score(self, trends: Dict) -> float:
         """Calculate breakout potential score"""
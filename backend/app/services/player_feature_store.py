@@ -0,0 +1,488 @@
+"""
+Player feature store - rolling player statistics computed at ingestion time
+
+Usage trends, efficiency metrics and breakout scans used to rebuild means,
+slopes and variances from raw PlayerAnalytics rows on every request. The
+player_features table keeps them per player, season and window of weeks,
+and player_recent_games each player's latest games across seasons for trend
+reads. store_weekly_analytics refreshes what a new week touches, and
+scripts/backfill_player_features.py rebuilds whole seasons after bulk loads.
+"""
+
+import logging
+import math
+import sys
+from bisect import bisect_right
+from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import Select, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.fantasy_models import (
+    PlayerAnalytics,
+    PlayerFeatures,
+    PlayerRecentGames,
+)
+
+logger = logging.getLogger(__name__)
+
+# Window lengths in weeks: a breakout scan's recent weeks, and a full season
+FEATURE_SPANS = (4, 17)
+
+# Windows end on every week of the regular season (or later weeks with data)
+SEASON_WEEKS = 18
+
+# Weight of the newest game in the exponentially weighted mean
+EWMA_ALPHA = 0.5
+
+FEATURE_METRICS = (
+    "ppr_points",
+    "snap_percentage",
+    "target_share",
+    "red_zone_share",
+    "points_per_snap",
+    "points_per_target",
+)
+
+# Latest games kept per player, the longest trend read the API allows
+RECENT_GAMES_KEPT = 16
+
+# Fields of each game in player_recent_games
+RECENT_GAME_FIELDS = (
+    "week",
+    "season",
+    "opponent",
+    "ppr_points",
+    "targets",
+    "snap_percentage",
+)
+
+# Rows written per insert statement during a rebuild
+REBUILD_BATCH_SIZE = 1000
+
+# Bits of the integer square root taken before rounding to a float
+_SQRT_BITS = 2 * sys.float_info.mant_dig + 3
+
+_GAME_COLUMNS = [PlayerAnalytics.week] + [
+    getattr(PlayerAnalytics, metric) for metric in FEATURE_METRICS
+]
+
+_RECENT_GAME_COLUMNS = [getattr(PlayerAnalytics, field) for field in RECENT_GAME_FIELDS]
+
+_NEWEST_FIRST = (PlayerAnalytics.season.desc(), PlayerAnalytics.week.desc())
+
+
+@lru_cache(maxsize=None)
+def _positions(n: int) -> Tuple[Tuple[float, ...], float]:
+    """Positions 0..n-1 less their mean, and their sum of squares"""
+    x_mean = sum(range(n)) / n
+    offsets = tuple(i - x_mean for i in range(n))
+    return offsets, sum(offset**2 for offset in offsets)
+
+
+def linear_slope(values: Sequence[float]) -> float:
+    """Least-squares slope of values against their position"""
+    n = len(values)
+    if n < 2:
+        return 0
+
+    offsets, denominator = _positions(n)
+    y_mean = sum(values) / n
+    numerator = sum(offset * (value - y_mean) for offset, value in zip(offsets, values))
+    if denominator == 0:
+        return 0
+    return numerator / denominator
+
+
+def _sqrt_of_fraction(numerator: int, denominator: int) -> float:
+    """sqrt(numerator / denominator), correctly rounded"""
+    shift = (numerator.bit_length() - denominator.bit_length() - _SQRT_BITS) // 2
+    if shift >= 0:
+        denominator <<= 2 * shift
+    else:
+        numerator <<= -2 * shift
+    root = math.isqrt(numerator // denominator)
+    # Round to odd, so the one rounding to a float below is the only one
+    root |= root * root * denominator != numerator
+    return float(root << shift) if shift >= 0 else root / (1 << -shift)
+
+
+def mean_and_stdev(values: Sequence[float]) -> Tuple[float, float]:
+    """
+    statistics.mean and statistics.stdev (0 for one value) of non-empty values
+
+    The same exact sums, in integers rather than Fractions: float
+    denominators are powers of two, so every value scales to a common one.
+    """
+    ratios = [value.as_integer_ratio() for value in values]
+    scale = max(denominator for _, denominator in ratios)
+    scaled = [numerator * (scale // denominator) for numerator, denominator in ratios]
+    n = len(scaled)
+    total = sum(scaled)
+    mean = total / (n * scale)
+    if n < 2:
+        return mean, 0
+    squares = sum(value * value for value in scaled)
+    return mean, _sqrt_of_fraction(
+        n * squares - total * total, n * (n - 1) * scale * scale
+    )
+
+
+def ewma(values: Sequence[float], alpha: float = EWMA_ALPHA) -> float:
+    average = values[0]
+    for value in values[1:]:
+        average = alpha * value + (1 - alpha) * average
+    return average
+
+
+def window_features(
+    columns: Dict[str, Sequence[Optional[float]]], season: int, week: int, span: int
+) -> Dict[str, Any]:
+    """
+    Feature row for the games within (week - span, week]
+
+    columns holds each metric's values for the window's games, in week
+    order. Only non-zero values count, as in the on-the-fly calculations.
+    """
+    row: Dict[str, Any] = {
+        "player_id": None,
+        "season": season,
+        "week": week,
+        "span": span,
+        "games": len(columns["ppr_points"]),
+        "updated_at": datetime.utcnow(),
+    }
+    for metric in FEATURE_METRICS:
+        values = [value for value in columns[metric] if value]
+        row[f"{metric}_n"] = len(values)
+        if values:
+            row[f"{metric}_mean"], row[f"{metric}_std"] = mean_and_stdev(values)
+        else:
+            row[f"{metric}_mean"], row[f"{metric}_std"] = None, 0
+        row[f"{metric}_slope"] = linear_slope(values)
+        row[f"{metric}_ewma"] = ewma(values) if values else None
+
+    points = [p for p in columns["ppr_points"] if p]
+    row["boom_rate"] = (
+        len([p for p in points if p >= 20]) / len(points) if points else None
+    )
+    row["bust_rate"] = (
+        len([p for p in points if p < 5]) / len(points) if points else None
+    )
+    return row
+
+
+def _window_ends(weeks: Iterable[int], span: int, last_week: int) -> range:
+    """Window end weeks whose window contains any of `weeks`"""
+    weeks = list(weeks)
+    return range(min(weeks), min(max(weeks) + span - 1, last_week) + 1)
+
+
+class PlayerFeatureStore:
+    """Reads and maintains player_features rows"""
+
+    def __init__(self, spans: Sequence[int] = FEATURE_SPANS):
+        self.spans = tuple(spans)
+
+    def _season_rows(
+        self, player_id: int, season: int, games: List[Any], ends: Iterable[int]
+    ) -> List[Dict[str, Any]]:
+        weeks = [game.week for game in games]
+        columns = {
+            metric: [getattr(game, metric) for game in games]
+            for metric in FEATURE_METRICS
+        }
+        rows = []
+        for week in ends:
+            for span in self.spans:
+                if week < span:
+                    continue  # Weeks start at 1: no request asks for this window
+                # Games are in week order: the window is a slice of them
+                first = bisect_right(weeks, week - span)
+                last = bisect_right(weeks, week)
+                if first == last:
+                    continue
+                row = window_features(
+                    {metric: values[first:last] for metric, values in columns.items()},
+                    season,
+                    week,
+                    span,
+                )
+                row["player_id"] = player_id
+                rows.append(row)
+        return rows
+
+    def update_player_week(
+        self, db: Session, player_id: int, season: int, week: int
+    ) -> int:
+        """
+        Refresh the windows containing one newly stored week of a player
+
+        Reads the player's season (flush pending analytics first) and
+        rewrites only the affected rows; the caller commits.
+        """
+        games = db.execute(
+            select(*_GAME_COLUMNS)
+            .where(PlayerAnalytics.player_id == player_id)
+            .where(PlayerAnalytics.season == season)
+            .order_by(PlayerAnalytics.week)
+        ).all()
+        last_week = max([SEASON_WEEKS, week] + [game.week for game in games])
+        ends = set()
+        for span in self.spans:
+            ends.update(_window_ends([week], span, last_week))
+
+        db.execute(
+            delete(PlayerFeatures).where(
+                PlayerFeatures.player_id == player_id,
+                PlayerFeatures.season == season,
+                PlayerFeatures.week.in_(sorted(ends)),
+            )
+        )
+        rows = self._season_rows(player_id, season, games, sorted(ends))
+        if rows:
+            db.execute(insert(PlayerFeatures), rows)
+        self.rebuild_recent_games(db, [player_id])
+        return len(rows)
+
+    def rebuild(
+        self,
+        db: Session,
+        season: Optional[int] = None,
+        player_ids: Optional[Iterable[int]] = None,
+    ) -> int:
+        """Recompute every window for a season and/or players; the caller commits"""
+        scope = []
+        if season is not None:
+            scope.append(PlayerAnalytics.season == season)
+        if player_ids is not None:
+            scope.append(PlayerAnalytics.player_id.in_(list(player_ids)))
+
+        cleared = delete(PlayerFeatures)
+        if season is not None:
+            cleared = cleared.where(PlayerFeatures.season == season)
+        if player_ids is not None:
+            cleared = cleared.where(PlayerFeatures.player_id.in_(list(player_ids)))
+        db.execute(cleared)
+
+        games = db.execute(
+            select(PlayerAnalytics.player_id, PlayerAnalytics.season, *_GAME_COLUMNS)
+            .where(*scope)
+            .order_by(
+                PlayerAnalytics.player_id, PlayerAnalytics.season, PlayerAnalytics.week
+            )
+            .execution_options(yield_per=REBUILD_BATCH_SIZE)
+        )
+        written = 0
+        pending: List[Dict[str, Any]] = []
+        for (player_id, player_season), season_games in groupby(
+            games, key=lambda game: (game.player_id, game.season)
+        ):
+            season_games = list(season_games)
+            last_week = max(SEASON_WEEKS, season_games[-1].week)
+            pending.extend(
+                self._season_rows(
+                    player_id, player_season, season_games, range(1, last_week + 1)
+                )
+            )
+            if len(pending) >= REBUILD_BATCH_SIZE:
+                db.execute(insert(PlayerFeatures), pending)
+                written += len(pending)
+                pending = []
+        if pending:
+            db.execute(insert(PlayerFeatures), pending)
+            written += len(pending)
+
+        # Recent games span seasons: a season's players get theirs rebuilt whole
+        if player_ids is not None:
+            recent_players = list(player_ids)
+        elif season is not None:
+            recent_players = (
+                select(PlayerAnalytics.player_id)
+                .where(PlayerAnalytics.season == season)
+                .distinct()
+            )
+        else:
+            recent_players = None
+        recent = self.rebuild_recent_games(db, recent_players)
+
+        logger.info(f"Rebuilt {written} player feature rows, {recent} recent games")
+        return written
+
+    def rebuild_recent_games(
+        self, db: Session, player_ids: Union[List[int], Select, None] = None
+    ) -> int:
+        """
+        Rewrite player_recent_games for players (a list or a player_id
+        select), or for everyone; the caller commits
+        """
+        cleared = delete(PlayerRecentGames)
+        scope = []
+        if player_ids is not None:
+            cleared = cleared.where(PlayerRecentGames.player_id.in_(player_ids))
+            scope.append(PlayerAnalytics.player_id.in_(player_ids))
+        db.execute(cleared)
+
+        ranked = (
+            select(
+                PlayerAnalytics.player_id,
+                *_RECENT_GAME_COLUMNS,
+                func.row_number()
+                .over(partition_by=PlayerAnalytics.player_id, order_by=_NEWEST_FIRST)
+                .label("game_rank"),
+            )
+            .where(*scope)
+            .subquery()
+        )
+        games = db.execute(
+            select(ranked)
+            .where(ranked.c.game_rank <= RECENT_GAMES_KEPT)
+            .order_by(ranked.c.player_id, ranked.c.game_rank)
+            .execution_options(yield_per=REBUILD_BATCH_SIZE)
+        )
+        now = datetime.utcnow()
+        written = 0
+        pending: List[Dict[str, Any]] = []
+        for player_id, player_games in groupby(games, key=lambda game: game.player_id):
+            pending.append(
+                {
+                    "player_id": player_id,
+                    "games": [
+                        {field: getattr(game, field) for field in RECENT_GAME_FIELDS}
+                        for game in player_games
+                    ],
+                    "updated_at": now,
+                }
+            )
+            if len(pending) >= REBUILD_BATCH_SIZE:
+                db.execute(insert(PlayerRecentGames), pending)
+                written += len(pending)
+                pending = []
+        if pending:
+            db.execute(insert(PlayerRecentGames), pending)
+            written += len(pending)
+        return written
+
+    def span_for(self, weeks: Optional[Iterable[int]]) -> Optional[int]:
+        """The stored span covering exactly `weeks`, if they form one"""
+        if not weeks:
+            return None
+        weeks = sorted(set(weeks))
+        span = len(weeks)
+        if span not in self.spans or weeks[-1] - weeks[0] + 1 != span:
+            return None
+        return span
+
+    def lookup(
+        self, db: Session, player_id: int, season: int, weeks: Optional[List[int]]
+    ) -> Optional[PlayerFeatures]:
+        """
+        The row summarising a player's games in `weeks` of a season
+
+        None when the weeks are not a stored window or the window has no
+        row (no games, or not built yet); callers then compute on the fly.
+        """
+        span = self.span_for(weeks)
+        if span is None:
+            return None
+        return db.scalars(
+            select(PlayerFeatures).where(
+                PlayerFeatures.player_id == player_id,
+                PlayerFeatures.season == season,
+                PlayerFeatures.week == max(weeks),
+                PlayerFeatures.span == span,
+            )
+            # Rows are rewritten with bulk statements the session does not see
+            .execution_options(populate_existing=True)
+        ).first()
+
+    def lookup_many(
+        self, db: Session, player_ids: List[int], season: int, week: int, span: int
+    ) -> Dict[int, PlayerFeatures]:
+        if not player_ids:
+            return {}
+        rows = db.scalars(
+            select(PlayerFeatures)
+            .where(
+                PlayerFeatures.player_id.in_(player_ids),
+                PlayerFeatures.season == season,
+                PlayerFeatures.week == week,
+                PlayerFeatures.span == span,
+            )
+            .execution_options(populate_existing=True)
+        )
+        return {row.player_id: row for row in rows}
+
+    def recent_games(
+        self, db: Session, player_id: int, limit: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        A player's latest `limit` games across seasons, newest first
+
+        None when the player has no stored row (no games, or not built yet)
+        or more games are asked for than are kept; callers then read them
+        with read_recent_games.
+        """
+        if limit > RECENT_GAMES_KEPT:
+            return None
+        games = db.scalar(
+            select(PlayerRecentGames.games).where(
+                PlayerRecentGames.player_id == player_id
+            )
+        )
+        return None if games is None else games[:limit]
+
+    @staticmethod
+    def read_recent_games(
+        db: Session, player_id: int, limit: int
+    ) -> List[Dict[str, Any]]:
+        """recent_games straight from player_analytics"""
+        games = db.execute(
+            select(*_RECENT_GAME_COLUMNS)
+            .where(PlayerAnalytics.player_id == player_id)
+            .order_by(*_NEWEST_FIRST)
+            .limit(limit)
+        )
+        return [
+            {field: getattr(game, field) for field in RECENT_GAME_FIELDS}
+            for game in games
+        ]
+
+    @staticmethod
+    def usage_trends(features: PlayerFeatures) -> Dict[str, float]:
+        """PlayerAnalyticsService.calculate_usage_trends from a feature row"""
+        if features.games < 2:
+            return {}
+
+        trends = {}
+        if features.snap_percentage_n:
+            trends["snap_share_trend"] = round(features.snap_percentage_slope, 2)
+            trends["avg_snap_share"] = features.snap_percentage_mean
+            trends["snap_share_consistency"] = features.snap_percentage_std
+        if features.target_share_n:
+            trends["target_share_trend"] = round(features.target_share_slope, 2)
+            trends["avg_target_share"] = features.target_share_mean
+            trends["target_share_consistency"] = features.target_share_std
+        if features.red_zone_share_n:
+            trends["red_zone_usage_trend"] = round(features.red_zone_share_slope, 2)
+            trends["avg_red_zone_share"] = features.red_zone_share_mean
+        return trends
+
+    @staticmethod
+    def efficiency_metrics(features: PlayerFeatures) -> Dict[str, float]:
+        """PlayerAnalyticsService.calculate_efficiency_metrics from a feature row"""
+        result = {}
+        for metric in ("points_per_snap", "points_per_target"):
+            if getattr(features, f"{metric}_n"):
+                result[f"avg_{metric}"] = getattr(features, f"{metric}_mean")
+                result[f"{metric}_trend"] = round(
+                    getattr(features, f"{metric}_slope"), 2
+                )
+                result[f"{metric}_variance"] = getattr(features, f"{metric}_std")
+        return result
+
+
+player_feature_store = PlayerFeatureStore()
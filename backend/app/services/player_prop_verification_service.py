@@ -22,6 +22,7 @@ from sqlalchemy import and_
 from app.core.database import SessionLocal
 from app.models.database_models import Bet, BetStatus, BetType
 from app.models.simple_unified_bet_model import SimpleUnifiedBet
+from app.services.bet_exposure_service import bet_exposure_service
 from app.services.websocket_manager import manager as websocket_manager
 
 logger = logging.getLogger(__name__)
@@ -947,6 +948,8 @@ class PlayerPropVerificationService:
         self, bet: Bet, won: bool, actual_value: float, line_value: float
     ) -> None:
         """Settle a prop bet and update database"""
+        if bet.status == BetStatus.PENDING:
+            bet_exposure_service.release_bets(self.session, [bet])
         if won:
             bet.status = BetStatus.WON
             bet.result_amount = bet.amount + bet.potential_win
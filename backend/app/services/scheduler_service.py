@@ -7,14 +7,18 @@ from The Odds API at regular intervals.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
 
 from app.services.odds_api_service import OddsAPIService, SportKey
-from app.services.cache_service import cache_service
+from app.services.cache_service import cache_service, sport_tag
+from app.services.odds_quota_planner import GAME_DURATION_HOURS, odds_quota_planner
 from app.core.config import settings
+from app.core.metrics import scheduler_task_duration
+from app.core.query_instrumentation import track_queries
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +59,13 @@ class SchedulerService:
 
     def _setup_default_tasks(self):
         """Set up default scheduled tasks with rate-limit friendly intervals"""
-        # Update popular sports odds every 2 hours (conservative to stay under rate limits)
+        # Odds, live games and scores tick every 5 minutes, but each tick only
+        # fetches the sports the quota planner says are due, so the actual
+        # cadence follows the game calendar and the monthly budget
         self.add_task(
             "update_popular_odds",
             self._update_popular_sports_odds,
-            interval_seconds=7200,  # 2 hours
+            interval_seconds=300,  # 5 minutes (plan-driven)
         )
 
         # Update sports list every 6 hours (sports don't change often)
@@ -69,16 +75,16 @@ class SchedulerService:
             interval_seconds=21600,  # 6 hours
         )
 
-        # Update live games every 30 minutes (much more conservative)
         self.add_task(
             "update_live_games",
             self._update_live_games,
-            interval_seconds=1800,  # 30 minutes
+            interval_seconds=300,  # 5 minutes (plan-driven)
         )
 
-        # Update scores every 4 hours (scores don't change that often for completed games)
         self.add_task(
-            "update_scores", self._update_scores, interval_seconds=14400  # 4 hours
+            "update_scores",
+            self._update_scores,
+            interval_seconds=300,  # 5 minutes (plan-driven)
         )
 
         # Clean up old cache entries every 30 minutes
@@ -101,6 +107,14 @@ class SchedulerService:
             interval_seconds=86400,  # 24 hours
         )
 
+        # Waiver scores are weekly; refreshing the latest week daily picks up
+        # stat corrections and survives restarts between weekly runs
+        self.add_task(
+            "compute_waiver_scores",
+            self._compute_waiver_scores,
+            interval_seconds=86400,  # 24 hours
+        )
+
     def add_task(
         self,
         name: str,
@@ -210,9 +224,11 @@ class SchedulerService:
 
         task.status = TaskStatus.RUNNING
         task.last_run = datetime.utcnow()
+        started = time.perf_counter()
 
         try:
-            await task.func()
+            with track_queries(f"task:{task.name}"):
+                await task.func()
             task.status = TaskStatus.COMPLETED
             task.error_count = 0  # Reset error count on success
             logger.info(f"Task completed successfully: {task.name}")
@@ -223,6 +239,9 @@ class SchedulerService:
             logger.error(f"Task failed: {task.name} - {e}")
 
         finally:
+            scheduler_task_duration.observe(
+                time.perf_counter() - started, task.name, task.status.value
+            )
             # Schedule next run
             task.next_run = datetime.utcnow() + timedelta(seconds=task.interval_seconds)
 
@@ -234,12 +253,19 @@ class SchedulerService:
             logger.warning("No Odds API key configured, skipping odds update")
             return
 
+        plan = await odds_quota_planner.refresh()
         popular_sports = [
-            SportKey.AMERICANFOOTBALL_NFL,
-            SportKey.BASKETBALL_NBA,
-            SportKey.BASEBALL_MLB,
-            SportKey.ICEHOCKEY_NHL,
+            sport
+            for sport in [
+                SportKey.AMERICANFOOTBALL_NFL,
+                SportKey.BASKETBALL_NBA,
+                SportKey.BASEBALL_MLB,
+                SportKey.ICEHOCKEY_NHL,
+            ]
+            if odds_quota_planner.is_due(sport.value, "odds")
         ]
+        if not popular_sports:
+            return
 
         updated_count = 0
 
@@ -279,14 +305,15 @@ class SchedulerService:
                             "cached": False,
                         }
 
-                        # Cache with 2-hour expiry (much longer to reduce API calls)
+                        # Keep the entry until the next planned refresh (at least 2 hours)
+                        interval = plan.sports[sport.value].odds_interval_seconds
                         await cache_service.set_odds(
                             sport.value,
                             "us",
                             "h2h,spreads,totals",
                             "american",
                             result,
-                            expire_seconds=7200,
+                            expire_seconds=max(7200, interval * 2),
                         )
 
                         updated_count += 1
@@ -294,6 +321,8 @@ class SchedulerService:
                             f"Updated odds for {sport.value}: {len(games)} games"
                         )
 
+                    odds_quota_planner.mark_refreshed(sport.value, "odds")
+
                 except Exception as e:
                     logger.error(f"Failed to update odds for {sport.value}: {e}")
                     continue
@@ -367,10 +396,25 @@ class SchedulerService:
             logger.warning("No Odds API key configured, skipping live games update")
             return
 
+        await odds_quota_planner.refresh()
+        live_sports = [
+            sport
+            for sport in SportKey
+            if sport.value in GAME_DURATION_HOURS
+            and odds_quota_planner.is_due(sport.value, "live_odds")
+        ]
+        if not live_sports:
+            return
+
         try:
             from app.services.odds_api_service import get_live_games
 
-            games = await get_live_games()
+            # Look back far enough to keep games that are already in progress
+            games = await get_live_games(
+                sports=live_sports, lookback_hours=max(GAME_DURATION_HOURS.values())
+            )
+            for sport in live_sports:
+                odds_quota_planner.mark_refreshed(sport.value, "live_odds")
 
             if games:
                 # Convert to cacheable format
@@ -399,20 +443,36 @@ class SchedulerService:
                         }
                     )
 
-                # Store in a special cache key for live games
+                # Store in a special cache key for live games, keeping games of
+                # sports that were not due this round
                 live_games_key = "odds_api:live_games:all"
+                refreshed = {sport.value for sport in live_sports}
+                cached = await cache_service.get(live_games_key)
+                if cached:
+                    games_data = [
+                        game
+                        for game in cached.get("games", [])
+                        if game.get("sport_key") not in refreshed
+                    ] + games_data
+
                 result = {
                     "status": "success",
                     "count": len(games_data),
                     "games": games_data,
-                    "description": "Games starting within the next 2 hours",
+                    "description": "Games in progress or starting within the next 2 hours",
                     "last_updated": datetime.utcnow().isoformat(),
                     "cached": False,
                 }
 
                 await cache_service.set(
-                    live_games_key, result, expire_seconds=1800
-                )  # 30 minutes
+                    live_games_key,
+                    result,
+                    expire_seconds=1800,  # 30 minutes
+                    tags=[
+                        sport_tag(sport)
+                        for sport in {game["sport_key"] for game in games_data}
+                    ],
+                )
                 logger.info(f"Updated live games: {len(games)} games")
 
         except Exception as e:
@@ -425,12 +485,19 @@ class SchedulerService:
             logger.warning("No Odds API key configured, skipping scores update")
             return
 
+        await odds_quota_planner.refresh()
         sports_to_check = [
-            SportKey.AMERICANFOOTBALL_NFL,
-            SportKey.BASKETBALL_NBA,
-            SportKey.BASEBALL_MLB,
-            SportKey.ICEHOCKEY_NHL,
+            sport
+            for sport in [
+                SportKey.AMERICANFOOTBALL_NFL,
+                SportKey.BASKETBALL_NBA,
+                SportKey.BASEBALL_MLB,
+                SportKey.ICEHOCKEY_NHL,
+            ]
+            if odds_quota_planner.is_due(sport.value, "scores")
         ]
+        if not sports_to_check:
+            return
 
         updated_count = 0
 
@@ -438,6 +505,7 @@ class SchedulerService:
             for i, sport in enumerate(sports_to_check):
                 try:
                     scores = await service.get_scores(sport.value, days_from=1)
+                    odds_quota_planner.mark_refreshed(sport.value, "scores")
 
                     if scores:
                         # Convert to cacheable format
@@ -567,6 +635,24 @@ class SchedulerService:
             logger.error(f"Failed to verify player props: {e}", exc_info=True)
             raise
 
+    async def _compute_waiver_scores(self):
+        """Recompute waiver scores for the week of the newest analytics"""
+        try:
+            from app.services.waiver_scores import waiver_score_store
+            from app.core.database import get_db
+
+            db = next(get_db())
+            try:
+                written = waiver_score_store.rebuild_latest(db)
+                db.commit()
+                logger.info(f"Waiver scores computed for {written} players")
+            finally:
+                db.close()
+
+        except Exception as e:
+            logger.error(f"Failed to compute waiver scores: {e}")
+            raise
+
     def get_task_status(self) -> Dict[str, Dict]:
         """Get status of all scheduled tasks"""
         status = {}
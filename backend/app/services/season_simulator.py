@@ -0,0 +1,318 @@
+"""
+Monte Carlo season simulator for playoff and championship odds
+
+Each team's weekly score is drawn from a normal distribution built from the
+projections of its best starting lineup. The remaining schedule, the final
+standings and the playoff bracket are then played out for many seasons at
+once as NumPy arrays, so odds reflect the actual rosters, schedule and
+playoff format rather than the current rank alone.
+"""
+
+import logging
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.models.fantasy_models import (
+    FantasyLeague,
+    FantasyMatchup,
+    FantasyRosterSpot,
+    FantasyTeam,
+)
+from app.services.lineup_optimizer import league_slots, optimal_lineup
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMULATIONS = 50_000
+
+# Seasons simulated per array pass, bounding memory for large runs
+BATCH_SIMULATIONS = 10_000
+
+# Playoff spots when the league doesn't say, as in trade evaluations
+DEFAULT_PLAYOFF_TEAMS = 6
+
+# Standard deviations spanned by a normal distribution's interquartile range
+IQR_STDS = 1.349
+
+# Spread of a team's weekly score relative to its mean when it has no
+# projections to build one from
+FALLBACK_SCORE_CV = 0.2
+
+
+@dataclass
+class LeagueSeason:
+    """Inputs of a simulation, with teams referred to by their position"""
+
+    team_ids: List[int]
+    wins: np.ndarray  # Current wins, ties counting half
+    points_for: np.ndarray
+    schedule: List[np.ndarray]  # Per remaining week, (games, 2) team positions
+    score_mean: np.ndarray
+    score_std: np.ndarray
+    playoff_teams: int
+
+
+def _simulate_playoffs(
+    seeds: np.ndarray, mean: np.ndarray, std: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Champion of each simulated bracket
+
+    seeds holds each season's playoff teams in seed order. The bracket is
+    padded to a power of two with byes for the top seeds, and the highest
+    remaining seed plays the lowest every round.
+    """
+    size, playoff_teams = seeds.shape
+    bracket = 1 << (playoff_teams - 1).bit_length()
+    # Seed ranks still alive; ranks past the last playoff team are byes
+    alive = np.tile(np.arange(bracket), (size, 1))
+    while alive.shape[1] > 1:
+        half = alive.shape[1] // 2
+        high = alive[:, :half]
+        low = alive[:, ::-1][:, :half]
+        high_team = np.take_along_axis(seeds, high, axis=1)
+        low_team = np.take_along_axis(seeds, np.minimum(low, playoff_teams - 1), axis=1)
+        high_won = (low >= playoff_teams) | (
+            rng.normal(mean[high_team], std[high_team])
+            > rng.normal(mean[low_team], std[low_team])
+        )
+        alive = np.sort(np.where(high_won, high, low), axis=1)
+    return np.take_along_axis(seeds, alive, axis=1)[:, 0]
+
+
+def _simulate_batch(
+    season: LeagueSeason, size: int, rng: np.random.Generator
+) -> Dict[str, np.ndarray]:
+    teams = len(season.team_ids)
+    wins = np.tile(season.wins.astype(float), (size, 1))
+    points = np.tile(season.points_for.astype(float), (size, 1))
+    rows = np.arange(size)[:, None]
+
+    for games in season.schedule:
+        scores = rng.normal(season.score_mean, season.score_std, size=(size, teams))
+        home, away = games[:, 0], games[:, 1]
+        home_won = scores[:, home] > scores[:, away]
+        wins[rows, home] += home_won
+        wins[rows, away] += ~home_won
+        points[rows, home] += scores[:, home]
+        points[rows, away] += scores[:, away]
+
+    # Standings by wins, then points for
+    standings = np.lexsort((-points, -wins), axis=1)
+    playoff_teams = min(season.playoff_teams, teams)
+    seeds = standings[:, :playoff_teams]
+    champions = _simulate_playoffs(seeds, season.score_mean, season.score_std, rng)
+
+    return {
+        "playoffs": np.bincount(seeds.ravel(), minlength=teams),
+        "championships": np.bincount(champions, minlength=teams),
+        "wins": wins.sum(axis=0),
+    }
+
+
+def simulate_season(
+    season: LeagueSeason,
+    simulations: int = DEFAULT_SIMULATIONS,
+    seed: Optional[int] = None,
+) -> Dict[int, Dict[str, float]]:
+    """Playoff and championship odds and projected wins, keyed by team id"""
+    rng = np.random.default_rng(seed)
+    teams = len(season.team_ids)
+    totals = {name: np.zeros(teams) for name in ("playoffs", "championships", "wins")}
+    remaining = simulations
+    while remaining > 0:
+        size = min(BATCH_SIMULATIONS, remaining)
+        for name, counts in _simulate_batch(season, size, rng).items():
+            totals[name] += counts
+        remaining -= size
+
+    return {
+        team_id: {
+            "playoff_odds": float(totals["playoffs"][i] / simulations),
+            "championship_odds": float(totals["championships"][i] / simulations),
+            "projected_wins": float(round(totals["wins"][i] / simulations, 2)),
+        }
+        for i, team_id in enumerate(season.team_ids)
+    }
+
+
+class SeasonSimulator:
+    """Builds league seasons from the database and simulates them"""
+
+    def __init__(
+        self,
+        db: Session,
+        simulations: int = DEFAULT_SIMULATIONS,
+        seed: Optional[int] = None,
+    ):
+        self.db = db
+        self.simulations = simulations
+        self.seed = seed
+
+    def league_odds(self, league_id: int) -> Dict[int, Dict[str, float]]:
+        """Odds for every team in a league as currently rostered"""
+        season = self.load_league_season(league_id)
+        return simulate_season(season, self.simulations, self.seed)
+
+    def trade_odds(
+        self,
+        league_id: int,
+        team1_id: int,
+        team2_id: int,
+        team1_gives: Sequence[int],
+        team2_gives: Sequence[int],
+    ) -> Dict[str, Any]:
+        """
+        Every team's odds before and after a proposed player trade
+
+        Both runs share one seed, so the difference between them comes from
+        the trade rather than from sampling noise.
+        """
+        moves = {player_id: team2_id for player_id in team1_gives}
+        moves.update({player_id: team1_id for player_id in team2_gives})
+
+        seed = self.seed
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        before = simulate_season(
+            self.load_league_season(league_id), self.simulations, seed
+        )
+        after = simulate_season(
+            self.load_league_season(league_id, moves), self.simulations, seed
+        )
+        return {"before": before, "after": after, "simulations": self.simulations}
+
+    def load_league_season(
+        self, league_id: int, moves: Optional[Dict[int, int]] = None
+    ) -> LeagueSeason:
+        """
+        Standings, remaining schedule and score distributions of a league
+
+        moves maps player ids to the team they should be scored for instead.
+        """
+        league = self.db.get(FantasyLeague, league_id)
+        if league is None:
+            raise ValueError(f"League {league_id} not found")
+
+        teams = (
+            self.db.query(FantasyTeam)
+            .filter(FantasyTeam.league_id == league_id)
+            .order_by(FantasyTeam.id)
+            .all()
+        )
+        if not teams:
+            raise ValueError(f"League {league_id} has no teams")
+        positions = {team.id: i for i, team in enumerate(teams)}
+
+        schedule = defaultdict(list)
+        remaining = (
+            self.db.query(
+                FantasyMatchup.week, FantasyMatchup.team1_id, FantasyMatchup.team2_id
+            )
+            .filter(
+                FantasyMatchup.league_id == league_id,
+                FantasyMatchup.is_complete.isnot(True),
+            )
+            .order_by(FantasyMatchup.week)
+        )
+        for week, team1_id, team2_id in remaining:
+            if team1_id in positions and team2_id in positions:
+                schedule[week].append((positions[team1_id], positions[team2_id]))
+        next_week = min(schedule) if schedule else None
+
+        rosters = self._league_rosters(league_id, next_week, moves or {})
+        mean, std = self._score_distributions(league, teams, rosters, next_week)
+
+        return LeagueSeason(
+            team_ids=[team.id for team in teams],
+            wins=np.array([(team.wins or 0) + (team.ties or 0) / 2 for team in teams]),
+            points_for=np.array([team.points_for or 0.0 for team in teams]),
+            schedule=[np.array(schedule[week]) for week in sorted(schedule)],
+            score_mean=mean,
+            score_std=std,
+            playoff_teams=league.playoff_teams or DEFAULT_PLAYOFF_TEAMS,
+        )
+
+    def _league_rosters(
+        self, league_id: int, week: Optional[int], moves: Dict[int, int]
+    ) -> Dict[int, List[int]]:
+        """Player ids on each team: season-long spots plus the week's"""
+        query = (
+            self.db.query(FantasyRosterSpot.team_id, FantasyRosterSpot.player_id)
+            .join(FantasyTeam)
+            .filter(FantasyTeam.league_id == league_id)
+        )
+        if week is not None:
+            query = query.filter(
+                or_(FantasyRosterSpot.week == week, FantasyRosterSpot.week.is_(None))
+            )
+        rosters = defaultdict(list)
+        for team_id, player_id in query.order_by(FantasyRosterSpot.player_id):
+            team_id = moves.get(player_id, team_id)
+            if player_id not in rosters[team_id]:
+                rosters[team_id].append(player_id)
+        return dict(rosters)
+
+    def _score_distributions(
+        self,
+        league: FantasyLeague,
+        teams: List[FantasyTeam],
+        rosters: Dict[int, List[int]],
+        week: Optional[int],
+    ):
+        """
+        Mean and standard deviation of each team's weekly score
+
+        A team's mean is its optimal lineup's projected points; the variance
+        sums its starters', read off their floor to ceiling (interquartile)
+        range. Teams without projections fall back to their points per game,
+        or the league average.
+        """
+        from app.services.fantasy_analytics_service import FantasyAnalyticsService
+
+        player_ids = [pid for players in rosters.values() for pid in players]
+        projections = FantasyAnalyticsService(self.db).get_batch_player_projections(
+            player_ids, week or 0, {"scoring_type": league.scoring_type or "ppr"}
+        )
+        slots = league_slots(league.roster_positions)
+
+        mean = np.zeros(len(teams))
+        std = np.zeros(len(teams))
+        for i, team in enumerate(teams):
+            players = [
+                {
+                    "position": getattr(
+                        projection["position"], "value", projection["position"]
+                    ),
+                    "projection": projection["projection"],
+                    "spread": projection["ceiling"] - projection["floor"],
+                }
+                for projection in (
+                    projections.get(pid) for pid in rosters.get(team.id, [])
+                )
+                if projection
+            ]
+            lineup = optimal_lineup(players, slots, "projection").starters
+            mean[i] = sum(player["projection"] for player in lineup)
+            std[i] = math.sqrt(
+                sum((player["spread"] / IQR_STDS) ** 2 for player in lineup)
+            )
+
+            if mean[i] <= 0:
+                games = (team.wins or 0) + (team.losses or 0) + (team.ties or 0)
+                if games and team.points_for:
+                    mean[i] = team.points_for / games
+                    std[i] = mean[i] * FALLBACK_SCORE_CV
+
+        known = mean > 0
+        if known.any() and not known.all():
+            mean[~known] = mean[known].mean()
+            std[~known] = std[known].mean()
+        # Equal coin flips when nothing is known about any team
+        std[std <= 0] = np.maximum(mean[std <= 0] * FALLBACK_SCORE_CV, 1.0)
+        return mean, std
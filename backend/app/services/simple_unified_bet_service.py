@@ -17,13 +17,16 @@ Key features for proper bet verification:
 - No complex string parsing needed during verification
 """
 
+import asyncio
+import base64
 import uuid
 import json
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import logging
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, desc, func, insert, tuple_
 from app.core.database import SessionLocal
 from app.models.database_models import Game, GameStatus
 from app.models.simple_unified_bet_model import (
@@ -36,216 +39,298 @@ from app.models.simple_unified_bet_model import (
 )
 from app.models.bet_models import PlaceBetRequest, PlaceParlayRequest
 from app.models.live_bet_models import PlaceLiveBetRequest
+from app.services.bet_exposure_service import bet_exposure_service
+from app.services.game_metadata_cache import GameInfo, game_metadata_cache
 
 logger = logging.getLogger(__name__)
 
+# Largest page the history endpoints will return
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class BetPage:
+    """One page of a user's bets, newest first"""
+
+    bets: List[Dict]
+    next_cursor: Optional[str]
+    total: Optional[int] = None
+    # Page size after clamping, None for an unpaged listing
+    limit: Optional[int] = None
+
+
+def encode_bet_cursor(placed_at: datetime, bet_id: str) -> str:
+    """Opaque keyset cursor for the (placed_at, id) position of a bet"""
+    raw = json.dumps([placed_at.isoformat(), bet_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_bet_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_bet_cursor; raises ValueError for a bad cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        placed_at, bet_id = json.loads(raw)
+        return datetime.fromisoformat(placed_at), str(bet_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _parse_day(value) -> Optional[datetime]:
+    """Midnight (naive UTC) of an ISO date or datetime filter value"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return datetime.combine(value.date(), datetime.min.time())
+
+
+def bet_filters(
+    user_id: Optional[int] = None,
+    *,
+    status: Optional[str] = None,
+    bet_type: Optional[str] = None,
+    start_date=None,
+    end_date=None,
+    include_legs: bool = False,
+    parlays_only: bool = False,
+) -> List:
+    """
+    WHERE clauses for listing bets; dates filter whole days, both inclusive
+
+    Raises ValueError for an unknown status or bet type.
+    """
+    filters = []
+    if user_id is not None:
+        filters.append(SimpleUnifiedBet.user_id == user_id)
+    if not include_legs:
+        filters.append(SimpleUnifiedBet.parent_bet_id.is_(None))
+    if parlays_only:
+        filters.append(SimpleUnifiedBet.is_parlay.is_(True))
+    if status:
+        filters.append(SimpleUnifiedBet.status == BetStatus(status.lower()))
+    if bet_type:
+        filters.append(SimpleUnifiedBet.bet_type == BetType(bet_type.lower()))
+    start_day, end_day = _parse_day(start_date), _parse_day(end_date)
+    if start_day:
+        filters.append(SimpleUnifiedBet.placed_at >= start_day)
+    if end_day:
+        filters.append(SimpleUnifiedBet.placed_at < end_day + timedelta(days=1))
+    return filters
+
 
 class SimpleUnifiedBetService:
     """Unified bet service for all betting operations"""
 
-    def __init__(self):
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
         self.bet_limits = {"daily": 5000, "weekly": 20000, "single_bet": 10000}
+        self._session_factory = session_factory or SessionLocal
 
     async def place_bet(self, user_id: int, bet_data: PlaceBetRequest) -> Dict:
         """Place a single straight bet"""
         try:
-            db = SessionLocal()
-            try:
-                # Validate bet limits
-                if not await self._check_bet_limits(user_id, bet_data.amount, db):
-                    return {"success": False, "error": "Bet exceeds limits"}
-
-                # If this bet is from a YetAI recommendation, get the correct odds_api_event_id
-                odds_api_event_id = None
-                if bet_data.yetai_bet_id:
-                    from app.models.database_models import YetAIBet
-
-                    yetai_bet = (
-                        db.query(YetAIBet)
-                        .filter(YetAIBet.id == bet_data.yetai_bet_id)
-                        .first()
-                    )
-                    if yetai_bet and yetai_bet.game_id:
-                        # Use the YetAI bet's game_id as the odds_api_event_id
-                        # This ensures bet verification can find the game
-                        odds_api_event_id = yetai_bet.game_id
-                        logger.info(
-                            f"📌 Using YetAI bet's game_id as odds_api_event_id: {odds_api_event_id}"
-                        )
+            # The session work runs in a worker thread, off the event loop
+            return await asyncio.to_thread(self._place_bet, user_id, bet_data)
+        except Exception as e:
+            logger.error(f"Error in place_bet: {e}")
+            return {"success": False, "error": str(e)}
 
-                # Get or create game record
-                game = await self._get_or_create_game(bet_data, db)
+    def _place_bet(self, user_id: int, bet_data: PlaceBetRequest) -> Dict:
+        db = self._session_factory()
+        try:
+            # Reserve the stake against the daily limit
+            if not self._check_bet_limits(user_id, bet_data.amount, db):
+                return {"success": False, "error": "Bet exceeds limits"}
+
+            # If this bet is from a YetAI recommendation, use its game_id as the
+            # odds_api_event_id so bet verification can find the game
+            odds_api_event_id = None
+            if bet_data.yetai_bet_id:
+                odds_api_event_id = game_metadata_cache.yetai_game_id(
+                    db, bet_data.yetai_bet_id
+                )
+                if odds_api_event_id:
+                    logger.info(
+                        f"📌 Using YetAI bet's game_id as odds_api_event_id: {odds_api_event_id}"
+                    )
 
-                # Determine final odds_api_event_id
-                # Priority: 1) YetAI bet's game_id, 2) Created game's id, 3) bet_data.game_id
-                if not odds_api_event_id:
-                    odds_api_event_id = game.id if game else bet_data.game_id
+            # Get or create game record
+            game = self._get_or_create_game(bet_data, db)
 
-                # Generate bet ID
-                bet_id = str(uuid.uuid4())
+            # Determine final odds_api_event_id
+            # Priority: 1) YetAI bet's game_id, 2) Created game's id, 3) bet_data.game_id
+            if not odds_api_event_id:
+                odds_api_event_id = game.id if game else bet_data.game_id
 
-                # Calculate potential win from odds and amount
-                potential_win = self._calculate_potential_win(
-                    bet_data.odds, bet_data.amount
-                )
+            # Generate bet ID
+            bet_id = str(uuid.uuid4())
 
-                # Parse bet selection for structured data
-                bet_type_str = (
-                    bet_data.bet_type.value
-                    if hasattr(bet_data.bet_type, "value")
-                    else str(bet_data.bet_type)
-                )
-                parsed_selection = self._parse_bet_selection(
-                    bet_data.selection,
-                    bet_type_str,
-                    bet_data.home_team,
-                    bet_data.away_team,
-                )
+            # Calculate potential win from odds and amount
+            potential_win = self._calculate_potential_win(
+                bet_data.odds, bet_data.amount
+            )
 
-                # Create unified bet record
-                unified_bet = SimpleUnifiedBet(
-                    id=bet_id,
-                    user_id=user_id,
-                    odds_api_event_id=odds_api_event_id,
-                    game_id=game.id if game else bet_data.game_id,
-                    bet_type=BetType(bet_type_str.lower()),
-                    amount=bet_data.amount,
-                    odds=bet_data.odds,
-                    potential_win=potential_win,
-                    selection=bet_data.selection,
-                    home_team=bet_data.home_team,
-                    away_team=bet_data.away_team,
-                    sport=bet_data.sport,
-                    commence_time=(
-                        self._parse_commence_time(bet_data.commence_time)
-                        or (game.commence_time if game else datetime.now(timezone.utc))
-                    ),
-                    source=BetSource.STRAIGHT,
-                    bookmaker=getattr(bet_data, "bookmaker", "fanduel"),
-                    line_value=getattr(bet_data, "line_value", None),
-                    yetai_bet_id=bet_data.yetai_bet_id,  # Link to YetAI bet for tracking
-                    # Add structured data from parsing
-                    team_selection=parsed_selection.get(
-                        "team_selection", TeamSide.NONE
-                    ),
-                    selected_team_name=parsed_selection.get("selected_team_name"),
-                    spread_value=parsed_selection.get("spread_value"),
-                    spread_selection=parsed_selection.get(
-                        "spread_selection", TeamSide.NONE
-                    ),
-                    total_points=parsed_selection.get("total_points"),
-                    over_under_selection=parsed_selection.get(
-                        "over_under_selection", OverUnder.NONE
-                    ),
-                    # Player prop fields
-                    player_name=getattr(bet_data, "player_name", None),
-                    prop_market=getattr(bet_data, "prop_market", None),
-                    prop_line=getattr(bet_data, "prop_line", None),
-                    prop_selection=(
-                        OverUnder(bet_data.prop_selection.lower())
-                        if getattr(bet_data, "prop_selection", None)
-                        else OverUnder.NONE
-                    ),
-                )
+            # Parse bet selection for structured data
+            bet_type_str = (
+                bet_data.bet_type.value
+                if hasattr(bet_data.bet_type, "value")
+                else str(bet_data.bet_type)
+            )
+            parsed_selection = self._parse_bet_selection(
+                bet_data.selection,
+                bet_type_str,
+                bet_data.home_team,
+                bet_data.away_team,
+            )
 
-                db.add(unified_bet)
-                db.commit()
+            # Create unified bet record
+            unified_bet = SimpleUnifiedBet(
+                id=bet_id,
+                user_id=user_id,
+                odds_api_event_id=odds_api_event_id,
+                game_id=game.id if game else bet_data.game_id,
+                bet_type=BetType(bet_type_str.lower()),
+                amount=bet_data.amount,
+                odds=bet_data.odds,
+                potential_win=potential_win,
+                selection=bet_data.selection,
+                home_team=bet_data.home_team,
+                away_team=bet_data.away_team,
+                sport=bet_data.sport,
+                commence_time=(
+                    self._parse_commence_time(bet_data.commence_time)
+                    or (game.commence_time if game else datetime.now(timezone.utc))
+                ),
+                source=BetSource.STRAIGHT,
+                bookmaker=getattr(bet_data, "bookmaker", "fanduel"),
+                line_value=getattr(bet_data, "line_value", None),
+                yetai_bet_id=bet_data.yetai_bet_id,  # Link to YetAI bet for tracking
+                # Add structured data from parsing
+                team_selection=parsed_selection.get("team_selection", TeamSide.NONE),
+                selected_team_name=parsed_selection.get("selected_team_name"),
+                spread_value=parsed_selection.get("spread_value"),
+                spread_selection=parsed_selection.get(
+                    "spread_selection", TeamSide.NONE
+                ),
+                total_points=parsed_selection.get("total_points"),
+                over_under_selection=parsed_selection.get(
+                    "over_under_selection", OverUnder.NONE
+                ),
+                # Player prop fields
+                player_name=getattr(bet_data, "player_name", None),
+                prop_market=getattr(bet_data, "prop_market", None),
+                prop_line=getattr(bet_data, "prop_line", None),
+                prop_selection=(
+                    OverUnder(bet_data.prop_selection.lower())
+                    if getattr(bet_data, "prop_selection", None)
+                    else OverUnder.NONE
+                ),
+            )
 
-                logger.info(f"Placed bet {bet_id} for user {user_id}")
+            db.add(unified_bet)
+            db.commit()
 
-                return {
-                    "success": True,
-                    "bet_id": bet_id,
-                    "message": f"Bet placed successfully",
-                    "bet": self._format_bet_response(unified_bet),
-                }
+            logger.info(f"Placed bet {bet_id} for user {user_id}")
 
-            except Exception as e:
-                db.rollback()
-                logger.error(f"Error placing bet: {e}")
-                return {"success": False, "error": str(e)}
-            finally:
-                db.close()
+            return {
+                "success": True,
+                "bet_id": bet_id,
+                "message": f"Bet placed successfully",
+                "bet": self._format_bet_response(unified_bet),
+            }
 
         except Exception as e:
-            logger.error(f"Error in place_bet: {e}")
+            db.rollback()
+            logger.error(f"Error placing bet: {e}")
             return {"success": False, "error": str(e)}
+        finally:
+            db.close()
 
     async def place_parlay(self, user_id: int, parlay_data: PlaceParlayRequest) -> Dict:
         """Place a parlay bet with multiple legs"""
         try:
-            db = SessionLocal()
-            try:
-                # Validate bet limits
-                if not await self._check_bet_limits(user_id, parlay_data.amount, db):
-                    return {"success": False, "error": "Parlay exceeds bet limits"}
+            return await asyncio.to_thread(self._place_parlay, user_id, parlay_data)
+        except Exception as e:
+            logger.error(f"Error in place_parlay: {e}")
+            return {"success": False, "error": str(e)}
 
-                # Generate parlay parent ID
-                parlay_id = str(uuid.uuid4())
+    def _place_parlay(self, user_id: int, parlay_data: PlaceParlayRequest) -> Dict:
+        db = self._session_factory()
+        try:
+            # Reserve the stake against the daily limit
+            if not self._check_bet_limits(user_id, parlay_data.amount, db):
+                return {"success": False, "error": "Parlay exceeds bet limits"}
 
-                # Calculate parlay odds and potential win
-                total_odds = self._calculate_parlay_odds(
-                    [leg.odds for leg in parlay_data.legs]
-                )
-                potential_win = self._calculate_potential_win(
-                    total_odds, parlay_data.amount
-                )
+            # Generate parlay parent ID
+            parlay_id = str(uuid.uuid4())
 
-                # Create parlay parent record
-                parlay_parent = SimpleUnifiedBet(
-                    id=parlay_id,
-                    user_id=user_id,
-                    odds_api_event_id=f"parlay_{parlay_id[:8]}",
-                    bet_type=BetType.PARLAY,
-                    amount=parlay_data.amount,
-                    odds=total_odds,
-                    potential_win=potential_win,
-                    selection=f"Parlay ({len(parlay_data.legs)} legs)",
-                    home_team="Multiple Teams",
-                    away_team="Multiple Teams",
-                    sport="Multiple Sports",
-                    commence_time=min(
-                        [
-                            self._parse_commence_time(
-                                getattr(leg, "commence_time", None)
-                            )
-                            for leg in parlay_data.legs
-                            if getattr(leg, "commence_time", None)
-                        ]
-                        or [datetime.now(timezone.utc)]
-                    ),
-                    source=BetSource.PARLAYS,
-                    bookmaker="fanduel",
-                    is_parlay=True,
-                    leg_count=len(parlay_data.legs),
-                    total_odds=total_odds,
-                    parlay_legs=json.dumps(
-                        [leg.model_dump() for leg in parlay_data.legs]
-                    ),
-                )
+            # Calculate parlay odds and potential win
+            total_odds = self._calculate_parlay_odds(
+                [leg.odds for leg in parlay_data.legs]
+            )
+            potential_win = self._calculate_potential_win(
+                total_odds, parlay_data.amount
+            )
 
-                db.add(parlay_parent)
+            # Create parlay parent record
+            parlay_parent = SimpleUnifiedBet(
+                id=parlay_id,
+                user_id=user_id,
+                odds_api_event_id=f"parlay_{parlay_id[:8]}",
+                bet_type=BetType.PARLAY,
+                amount=parlay_data.amount,
+                odds=total_odds,
+                potential_win=potential_win,
+                selection=f"Parlay ({len(parlay_data.legs)} legs)",
+                home_team="Multiple Teams",
+                away_team="Multiple Teams",
+                sport="Multiple Sports",
+                commence_time=min(
+                    [
+                        self._parse_commence_time(getattr(leg, "commence_time", None))
+                        for leg in parlay_data.legs
+                        if getattr(leg, "commence_time", None)
+                    ]
+                    or [datetime.now(timezone.utc)]
+                ),
+                source=BetSource.PARLAYS,
+                bookmaker="fanduel",
+                is_parlay=True,
+                leg_count=len(parlay_data.legs),
+                total_odds=total_odds,
+                parlay_legs=json.dumps([leg.model_dump() for leg in parlay_data.legs]),
+            )
 
-                # Create leg records
-                leg_ids = []
-                for i, leg in enumerate(parlay_data.legs):
-                    leg_id = str(uuid.uuid4())
-                    leg_ids.append(leg_id)
+            db.add(parlay_parent)
 
-                    # Get game for this leg
-                    game = await self._get_or_create_game(leg, db)
+            # Games for every leg in one lookup (cached across requests)
+            games = game_metadata_cache.get_many(
+                db, [getattr(leg, "game_id", None) for leg in parlay_data.legs]
+            )
 
-                    # Parse leg selection
-                    leg_bet_type_str = (
-                        leg.bet_type.value
-                        if hasattr(leg.bet_type, "value")
-                        else str(leg.bet_type)
-                    )
-                    parsed_selection = self._parse_bet_selection(
-                        leg.selection, leg_bet_type_str, leg.home_team, leg.away_team
-                    )
+            # Leg rows, written in one bulk INSERT
+            leg_ids = []
+            leg_rows = []
+            for i, leg in enumerate(parlay_data.legs):
+                leg_id = str(uuid.uuid4())
+                leg_ids.append(leg_id)
+
+                # Get game for this leg
+                game = self._get_or_create_game(leg, db, games)
+
+                # Parse leg selection
+                leg_bet_type_str = (
+                    leg.bet_type.value
+                    if hasattr(leg.bet_type, "value")
+                    else str(leg.bet_type)
+                )
+                parsed_selection = self._parse_bet_selection(
+                    leg.selection, leg_bet_type_str, leg.home_team, leg.away_team
+                )
 
-                    parlay_leg = SimpleUnifiedBet(
+                leg_rows.append(
+                    dict(
                         id=leg_id,
                         user_id=user_id,
                         odds_api_event_id=game.id if game else leg.game_id,
@@ -300,37 +385,35 @@ class SimpleUnifiedBetService:
                             else OverUnder.NONE
                         ),
                     )
-
-                    db.add(parlay_leg)
-
-                db.commit()
-
-                logger.info(
-                    "Placed parlay %s with %s legs for user %s",
-                    parlay_id,
-                    len(parlay_data.legs),
-                    user_id,
                 )
 
-                legs_count = len(parlay_data.legs)
-                return {
-                    "success": True,
-                    "parlay_id": parlay_id,
-                    "leg_ids": leg_ids,
-                    "message": f"Parlay with {legs_count} legs placed successfully",
-                    "parlay": self._format_bet_response(parlay_parent),
-                }
+            db.flush()
+            if leg_rows:
+                db.execute(insert(SimpleUnifiedBet), leg_rows)
+            db.commit()
 
-            except Exception as e:
-                db.rollback()
-                logger.error(f"Error placing parlay: {e}")
-                return {"success": False, "error": str(e)}
-            finally:
-                db.close()
+            logger.info(
+                "Placed parlay %s with %s legs for user %s",
+                parlay_id,
+                len(parlay_data.legs),
+                user_id,
+            )
+
+            legs_count = len(parlay_data.legs)
+            return {
+                "success": True,
+                "parlay_id": parlay_id,
+                "leg_ids": leg_ids,
+                "message": f"Parlay with {legs_count} legs placed successfully",
+                "parlay": self._format_bet_response(parlay_parent),
+            }
 
         except Exception as e:
-            logger.error(f"Error in place_parlay: {e}")
+            db.rollback()
+            logger.error(f"Error placing parlay: {e}")
             return {"success": False, "error": str(e)}
+        finally:
+            db.close()
 
     async def place_live_bet(
         self, user_id: int, live_bet_data: PlaceLiveBetRequest
@@ -340,11 +423,11 @@ class SimpleUnifiedBetService:
             db = SessionLocal()
             try:
                 # Validate bet limits
-                if not await self._check_bet_limits(user_id, live_bet_data.amount, db):
+                if not self._check_bet_limits(user_id, live_bet_data.amount, db):
                     return {"success": False, "error": "Live bet exceeds limits"}
 
                 # Get or create game record (same as place_bet for consistency)
-                game = await self._get_or_create_game(live_bet_data, db)
+                game = self._get_or_create_game(live_bet_data, db)
 
                 # Determine odds_api_event_id (use game's ID if available)
                 odds_api_event_id = game.id if game else live_bet_data.game_id
@@ -458,6 +541,89 @@ class SimpleUnifiedBetService:
             logger.error(f"Error getting user bets: {e}")
             return []
 
+    async def get_user_bets_page(
+        self,
+        user_id: int,
+        *,
+        status: Optional[str] = None,
+        bet_type: Optional[str] = None,
+        start_date=None,
+        end_date=None,
+        parlays_only: bool = False,
+        include_legs: bool = False,
+        with_legs: bool = False,
+        limit: Optional[int] = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        with_total: bool = False,
+    ) -> BetPage:
+        """
+        One page of a user's bets with every filter applied in SQL
+
+        Pages are keyed on (placed_at, id) descending, which the partial
+        (user_id, placed_at, id) index on top-level bets serves; pass the
+        returned next_cursor to continue. offset is only honoured without a
+        cursor, for older clients. Dates filter whole days, both ends inclusive. limit is
+        clamped to MAX_PAGE_SIZE; None returns every matching bet, for the
+        legacy unpaged routes.
+        """
+        if limit is not None:
+            limit = max(1, min(limit, MAX_PAGE_SIZE))
+        filters = bet_filters(
+            user_id,
+            status=status,
+            bet_type=bet_type,
+            start_date=start_date,
+            end_date=end_date,
+            include_legs=include_legs,
+            parlays_only=parlays_only,
+        )
+
+        db = self._session_factory()
+        try:
+            total = None
+            if with_total:
+                total = (
+                    db.query(func.count(SimpleUnifiedBet.id)).filter(*filters).scalar()
+                )
+
+            query = db.query(SimpleUnifiedBet).filter(*filters)
+            if cursor:
+                placed_at, bet_id = decode_bet_cursor(cursor)
+                query = query.filter(
+                    tuple_(SimpleUnifiedBet.placed_at, SimpleUnifiedBet.id)
+                    < tuple_(placed_at, bet_id)
+                )
+            if with_legs:
+                query = query.options(selectinload(SimpleUnifiedBet.legs))
+            query = query.order_by(
+                desc(SimpleUnifiedBet.placed_at), desc(SimpleUnifiedBet.id)
+            )
+            if offset and not cursor:
+                query = query.offset(offset)
+            if limit is None:
+                rows = query.all()
+            else:
+                rows = query.limit(limit + 1).all()
+
+            next_cursor = None
+            if limit is not None and len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_bet_cursor(rows[-1].placed_at, rows[-1].id)
+
+            bets = []
+            for bet in rows:
+                bet_data = self._format_bet_response(bet)
+                if with_legs and bet.is_parlay:
+                    bet_data["legs"] = [
+                        self._format_bet_response(leg) for leg in bet.legs
+                    ]
+                bets.append(bet_data)
+
+            return BetPage(bets=bets, next_cursor=next_cursor, total=total, limit=limit)
+        finally:
+            db.close()
+
     async def get_bet_by_id(self, bet_id: str) -> Optional[Dict]:
         """Get a specific bet by ID"""
         try:
@@ -684,48 +850,45 @@ class SimpleUnifiedBetService:
             ),
         }
 
-    async def _check_bet_limits(self, user_id: int, amount: float, db: Session) -> bool:
-        """Check if bet amount is within user limits"""
+    def _check_bet_limits(self, user_id: int, amount: float, db: Session) -> bool:
+        """
+        Reserve the stake against the user's limits
+
+        The daily counter is updated in the placement's transaction, so the
+        stake is released again if the bet is not committed.
+        """
         try:
             # Check single bet limit
             if amount > self.bet_limits["single_bet"]:
                 return False
 
-            # Check daily limit
-            today = datetime.now(timezone.utc).date()
-            daily_total = (
-                db.query(func.sum(SimpleUnifiedBet.amount))
-                .filter(
-                    and_(
-                        SimpleUnifiedBet.user_id == user_id,
-                        SimpleUnifiedBet.placed_at >= today,
-                        SimpleUnifiedBet.parent_bet_id.is_(
-                            None
-                        ),  # Don't count parlay legs
-                    )
-                )
-                .scalar()
-                or 0
+            # Check and count against the daily limit
+            return bet_exposure_service.reserve(
+                db, user_id, amount, self.bet_limits["daily"]
             )
 
-            if daily_total + amount > self.bet_limits["daily"]:
-                return False
-
-            return True
-
         except Exception as e:
             logger.error(f"Error checking bet limits: {e}")
             return False
 
-    async def _get_or_create_game(self, bet_data, db: Session) -> Optional[Game]:
-        """Get or create a game record - prefers database lookup to avoid duplicates"""
+    def _get_or_create_game(
+        self, bet_data, db: Session, games: Optional[Dict[str, GameInfo]] = None
+    ) -> Optional[Union[Game, GameInfo]]:
+        """
+        Get or create a game record - prefers database lookup to avoid duplicates
+
+        `games` holds games already resolved for this placement; games created
+        here are added to it so parlay legs on the same game share one row.
+        """
         try:
             game_id = getattr(bet_data, "game_id", None)
             if not game_id:
                 return None
 
-            # First, check if game exists in database
-            game = db.query(Game).filter(Game.id == game_id).first()
+            # First, check if game exists (shared cache, then database)
+            if games is not None and game_id in games:
+                return games[game_id]
+            game = game_metadata_cache.get(db, game_id)
             if game:
                 return game
 
@@ -754,6 +917,8 @@ class SimpleUnifiedBetService:
                 status=GameStatus.SCHEDULED,
             )
             db.add(game)
+            if games is not None:
+                games[game_id] = game
             logger.info(
                 f"Created game record for {game_id} with commence_time {commence_time}"
             )
@@ -4,30 +4,94 @@ Focused on the specific workflow requested:
 1. Connect username -> get SleeperUserID
 2. Get all league history (2020-2025)
 3. Sync rosters and player data
+
+League and roster fetches fan out concurrently (bounded by
+SYNC_CONCURRENCY) through the shared Sleeper client. Stored rosters are
+diffed against what Sleeper returns and only changed rows are written, in
+one flush per sync. A full sync runs as a background job whose progress is
+polled rather than held open as one long request.
 """
 
 import httpx
 import asyncio
+import uuid
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session, sessionmaker
 
-from app.core.database import get_db
 from app.models.database_models import User, SleeperLeague, SleeperRoster, SleeperPlayer
+from app.services.league_context import league_context_cache
+from app.services.sleeper_client import SleeperClient, sleeper_client
 
 logger = logging.getLogger(__name__)
 
+# First season whose leagues are synced
+FIRST_SYNC_SEASON = 2020
+
+# Sleeper requests a sync keeps in flight at once
+SYNC_CONCURRENCY = 8
+
+# League columns refreshed from Sleeper on a re-sync
+LEAGUE_SYNC_FIELDS = (
+    "name",
+    "total_rosters",
+    "status",
+    "scoring_type",
+    "roster_positions",
+    "scoring_settings",
+    "waiver_settings",
+)
+
+
+@dataclass
+class SleeperSyncJob:
+    """Progress of a background sync, as the status route reports it"""
+
+    job_id: str
+    user_id: int
+    status: str = "pending"  # pending, running, complete, failed
+    stage: str = "queued"  # leagues, rosters, players, done
+    done: int = 0
+    total: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def running(self) -> bool:
+        return self.status in ("pending", "running")
+
+    def advance(self, stage: str, total: int) -> None:
+        self.stage = stage
+        self.done = 0
+        self.total = total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "stage": self.stage,
+            "done": self.done,
+            "total": self.total,
+            "result": self.result,
+            "error": self.error,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
 
 class SimplifiedSleeperService:
     """Simplified Sleeper API integration service"""
 
-    def __init__(self):
-        self.base_url = "https://api.sleeper.app/v1"
-        # Cache for player data
-        self._players_cache = {}
-        self._players_cache_time = None
+    def __init__(self, client: Optional[SleeperClient] = None):
+        self.client = client or sleeper_client
+        # Latest sync job per user, and the tasks running them
+        self._jobs: Dict[int, SleeperSyncJob] = {}
+        self._tasks: set = set()
 
     async def connect_sleeper_account(
         self, user_id: int, sleeper_username: str, db: Session
@@ -38,10 +102,9 @@ class SimplifiedSleeperService:
         """
         try:
             # Get Sleeper user data
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.base_url}/user/{sleeper_username}")
-                response.raise_for_status()
-                sleeper_user_data = response.json()
+            sleeper_user_data = await self.client.get_json(f"/user/{sleeper_username}")
+            if not sleeper_user_data:
+                raise ValueError(f"Sleeper username '{sleeper_username}' not found")
 
             sleeper_user_id = sleeper_user_data["user_id"]
 
@@ -73,199 +136,193 @@ class SimplifiedSleeperService:
             raise ValueError(f"Connection failed: {str(e)}")
 
     async def sync_all_league_history(
-        self, user_id: int, db: Session
+        self, user_id: int, db: Session, job: Optional[SleeperSyncJob] = None
     ) -> Dict[str, Any]:
         """
         Step 2: Sync all league history from 2020-2025
-        Gets all leagues the user has participated in
+        Gets all leagues the user has participated in, every season at once
         """
         user = db.query(User).filter(User.id == user_id).first()
         if not user or not user.sleeper_user_id:
             raise ValueError("User must have connected Sleeper account first")
 
-        sleeper_user_id = user.sleeper_user_id
-        current_year = datetime.now().year
-
-        all_leagues = []
-        synced_count = 0
+        seasons = list(range(FIRST_SYNC_SEASON, datetime.now().year + 1))
+        if job:
+            job.advance("leagues", len(seasons))
 
-        # Cycle through years 2020 to current year
-        for year in range(2020, current_year + 1):
+        async def fetch(season: int) -> List[Dict[str, Any]]:
             try:
-                logger.info(f"Syncing leagues for user {user_id}, season {year}")
-                year_leagues = await self._get_user_leagues_for_season(
-                    sleeper_user_id, year
+                return await self._get_user_leagues_for_season(
+                    user.sleeper_user_id, season
                 )
+            except Exception as e:
+                logger.error(f"Failed to sync leagues for season {season}: {str(e)}")
+                return []
+            finally:
+                if job:
+                    job.done += 1
 
-                for league_data in year_leagues:
-                    # Check if league already exists
-                    existing_league = (
-                        db.query(SleeperLeague)
-                        .filter(
-                            and_(
-                                SleeperLeague.user_id == user_id,
-                                SleeperLeague.sleeper_league_id
-                                == league_data["league_id"],
-                                SleeperLeague.season == year,
-                            )
-                        )
-                        .first()
-                    )
-
-                    if existing_league:
-                        logger.debug(
-                            f"League {league_data['league_id']} already exists for season {year}"
-                        )
-                        continue
+        fetched = await self._gather_bounded(fetch(season) for season in seasons)
 
-                    # Create new league record
-                    new_league = SleeperLeague(
+        existing = {
+            (league.sleeper_league_id, league.season): league
+            for league in db.query(SleeperLeague).filter(
+                SleeperLeague.user_id == user_id
+            )
+        }
+        now = datetime.utcnow()
+        new_leagues = []
+        updated_count = 0
+        for season, season_leagues in zip(seasons, fetched):
+            for league_data in season_leagues:
+                key = (league_data["league_id"], season)
+                values = {name: league_data[name] for name in LEAGUE_SYNC_FIELDS}
+                league = existing.get(key)
+                if league is None:
+                    league = SleeperLeague(
                         user_id=user_id,
                         sleeper_league_id=league_data["league_id"],
-                        name=league_data["name"],
-                        season=year,
-                        total_rosters=league_data["total_rosters"],
-                        status=league_data.get("status", "complete"),
-                        scoring_type=league_data.get("scoring_type", "standard"),
-                        roster_positions=league_data.get("roster_positions", []),
-                        scoring_settings=league_data.get("scoring_settings", {}),
-                        waiver_settings=league_data.get("waiver_settings", {}),
-                        last_synced=datetime.utcnow(),
-                    )
-
-                    db.add(new_league)
-                    db.flush()  # Get the ID
-
-                    all_leagues.append(
-                        {
-                            "id": new_league.id,
-                            "sleeper_league_id": league_data["league_id"],
-                            "name": league_data["name"],
-                            "season": year,
-                            "status": league_data.get("status", "complete"),
-                        }
+                        season=season,
+                        last_synced=now,
+                        **values,
                     )
-
-                    synced_count += 1
-
-                    # Small delay to be nice to the API
-                    await asyncio.sleep(0.1)
-
-            except Exception as e:
-                logger.error(f"Failed to sync leagues for season {year}: {str(e)}")
-                continue
-
+                    existing[key] = league
+                    new_leagues.append(league)
+                elif self._apply_changes(league, values):
+                    league.last_synced = now
+                    updated_count += 1
+
+        db.add_all(new_leagues)
+        db.flush()  # Get the IDs
+        synced_leagues = [
+            {
+                "id": league.id,
+                "sleeper_league_id": league.sleeper_league_id,
+                "name": league.name,
+                "season": league.season,
+                "status": league.status,
+            }
+            for league in new_leagues
+        ]
         db.commit()
 
-        logger.info(f"Synced {synced_count} new leagues for user {user_id}")
+        logger.info(
+            f"Synced {len(new_leagues)} new and {updated_count} changed leagues "
+            f"for user {user_id}"
+        )
 
         return {
-            "synced_leagues": all_leagues,
-            "total_synced": synced_count,
-            "seasons_checked": list(range(2020, current_year + 1)),
+            "synced_leagues": synced_leagues,
+            "total_synced": len(new_leagues),
+            "updated_leagues": updated_count,
+            "seasons_checked": seasons,
         }
 
-    async def sync_all_rosters(self, user_id: int, db: Session) -> Dict[str, Any]:
+    async def sync_all_rosters(
+        self, user_id: int, db: Session, job: Optional[SleeperSyncJob] = None
+    ) -> Dict[str, Any]:
         """
         Step 3: Sync all rosters for all leagues
-        Gets roster data for each league and saves to database
+        Fetches every league's rosters concurrently and writes only rosters
+        that are new or changed
         """
         # Get all leagues for this user
         user_leagues = (
             db.query(SleeperLeague).filter(SleeperLeague.user_id == user_id).all()
         )
+        if job:
+            job.advance("rosters", len(user_leagues))
 
-        total_rosters_synced = 0
-
-        for league in user_leagues:
+        async def fetch(league: SleeperLeague) -> Optional[List[Dict[str, Any]]]:
             try:
-                logger.info(
-                    f"Syncing rosters for league {league.sleeper_league_id} ({league.name})"
-                )
-
-                # Get rosters for this league
-                rosters_data = await self._get_league_rosters(league.sleeper_league_id)
-
-                for roster_data in rosters_data:
-                    # Check if roster already exists
-                    existing_roster = (
-                        db.query(SleeperRoster)
-                        .filter(
-                            and_(
-                                SleeperRoster.league_id == league.id,
-                                SleeperRoster.sleeper_roster_id
-                                == str(roster_data["roster_id"]),
-                            )
-                        )
-                        .first()
-                    )
-
-                    if existing_roster:
-                        # Update existing roster
-                        existing_roster.wins = roster_data.get("settings", {}).get(
-                            "wins", 0
-                        )
-                        existing_roster.losses = roster_data.get("settings", {}).get(
-                            "losses", 0
-                        )
-                        existing_roster.ties = roster_data.get("settings", {}).get(
-                            "ties", 0
-                        )
-                        existing_roster.points_for = float(
-                            roster_data.get("settings", {}).get("fpts", 0)
-                        )
-                        existing_roster.points_against = float(
-                            roster_data.get("settings", {}).get("fpts_against", 0)
-                        )
-                        existing_roster.waiver_position = roster_data.get(
-                            "settings", {}
-                        ).get("waiver_position")
-                        existing_roster.players = roster_data.get("players", [])
-                        existing_roster.starters = roster_data.get("starters", [])
-                        existing_roster.last_synced = datetime.utcnow()
-                    else:
-                        # Create new roster
-                        new_roster = SleeperRoster(
-                            league_id=league.id,
-                            sleeper_roster_id=str(roster_data["roster_id"]),
-                            sleeper_owner_id=roster_data["owner_id"],
-                            team_name=self._get_team_name_from_roster(roster_data),
-                            owner_name="Unknown",  # Will be updated when we get user data
-                            wins=roster_data.get("settings", {}).get("wins", 0),
-                            losses=roster_data.get("settings", {}).get("losses", 0),
-                            ties=roster_data.get("settings", {}).get("ties", 0),
-                            points_for=float(
-                                roster_data.get("settings", {}).get("fpts", 0)
-                            ),
-                            points_against=float(
-                                roster_data.get("settings", {}).get("fpts_against", 0)
-                            ),
-                            waiver_position=roster_data.get("settings", {}).get(
-                                "waiver_position"
-                            ),
-                            players=roster_data.get("players", []),
-                            starters=roster_data.get("starters", []),
-                            last_synced=datetime.utcnow(),
-                        )
-
-                        db.add(new_roster)
-                        total_rosters_synced += 1
-
-                await asyncio.sleep(0.1)  # Rate limiting
-
+                return await self._get_league_rosters(league.sleeper_league_id)
             except Exception as e:
                 logger.error(
                     f"Failed to sync rosters for league {league.sleeper_league_id}: {str(e)}"
                 )
+                return None
+            finally:
+                if job:
+                    job.done += 1
+
+        fetched = await self._gather_bounded(fetch(league) for league in user_leagues)
+
+        stored = {}
+        if user_leagues:
+            stored = {
+                (roster.league_id, roster.sleeper_roster_id): roster
+                for roster in db.query(SleeperRoster).filter(
+                    SleeperRoster.league_id.in_([league.id for league in user_leagues])
+                )
+            }
+
+        now = datetime.utcnow()
+        new_rosters = []
+        changed_rosters = []
+        changed_leagues = set()
+        unchanged_count = failed_leagues = 0
+        players_added = players_dropped = 0
+        for league, rosters_data in zip(user_leagues, fetched):
+            if rosters_data is None:
+                failed_leagues += 1
                 continue
+            for roster_data in rosters_data:
+                values = self._roster_values(roster_data)
+                roster = stored.get((league.id, str(roster_data["roster_id"])))
+                if roster is None:
+                    new_rosters.append(
+                        {
+                            "league_id": league.id,
+                            "sleeper_roster_id": str(roster_data["roster_id"]),
+                            "sleeper_owner_id": roster_data.get("owner_id") or "",
+                            "team_name": self._get_team_name_from_roster(roster_data),
+                            "owner_name": "Unknown",  # Will be updated when we get user data
+                            "last_synced": now,
+                            **values,
+                        }
+                    )
+                    players_added += len(values["players"])
+                    changed_leagues.add(league.sleeper_league_id)
+                    continue
 
+                before = set(roster.players or [])
+                after = set(values["players"])
+                if before == after:
+                    # Sleeper doesn't promise an order for the bench
+                    values["players"] = roster.players
+                if any(
+                    getattr(roster, name) != value for name, value in values.items()
+                ):
+                    changed_rosters.append(
+                        {"id": roster.id, "last_synced": now, **values}
+                    )
+                    players_added += len(after - before)
+                    players_dropped += len(before - after)
+                    changed_leagues.add(league.sleeper_league_id)
+                else:
+                    unchanged_count += 1
+
+        # One executemany each for new and changed rosters
+        if new_rosters:
+            db.execute(insert(SleeperRoster), new_rosters)
+        if changed_rosters:
+            db.execute(update(SleeperRoster), changed_rosters)
         db.commit()
+        league_context_cache.invalidate_platform_leagues(changed_leagues)
 
-        logger.info(f"Synced {total_rosters_synced} rosters for user {user_id}")
+        logger.info(
+            f"Synced rosters for user {user_id}: {len(new_rosters)} new, "
+            f"{len(changed_rosters)} changed, {unchanged_count} unchanged"
+        )
 
         return {
-            "total_rosters_synced": total_rosters_synced,
+            "total_rosters_synced": len(new_rosters),
+            "rosters_updated": len(changed_rosters),
+            "rosters_unchanged": unchanged_count,
+            "players_added": players_added,
+            "players_dropped": players_dropped,
             "leagues_processed": len(user_leagues),
+            "leagues_failed": failed_leagues,
         }
 
     async def sync_nfl_players(self, db: Session) -> Dict[str, Any]:
@@ -425,21 +482,13 @@ class SimplifiedSleeperService:
                 user_id, sleeper_username, db
             )
 
-            # Step 2: Sync league history
-            leagues_result = await self.sync_all_league_history(user_id, db)
-
-            # Step 3: Sync rosters
-            rosters_result = await self.sync_all_rosters(user_id, db)
-
-            # Step 4: Sync players (only if we don't have recent data)
-            players_result = await self.sync_nfl_players(db)
+            # Steps 2-4: leagues, rosters and players
+            results = await self._sync_user_data(user_id, db)
 
             return {
                 "success": True,
                 "connect_result": connect_result,
-                "leagues_result": leagues_result,
-                "rosters_result": rosters_result,
-                "players_result": players_result,
+                **results,
                 "message": "Full Sleeper sync completed successfully",
             }
 
@@ -447,99 +496,151 @@ class SimplifiedSleeperService:
             logger.error(f"Full sync workflow failed: {str(e)}")
             raise ValueError(f"Sync workflow failed: {str(e)}")
 
+    def start_sync_job(
+        self,
+        user_id: int,
+        db: Session,
+        connect_result: Optional[Dict[str, Any]] = None,
+    ) -> SleeperSyncJob:
+        """
+        Sync a connected user's leagues, rosters and players in the background
+
+        Returns the user's running job instead if there is one. The job opens
+        its own session on db's engine, since db closes with the request.
+        """
+        job = self._jobs.get(user_id)
+        if job and job.running:
+            return job
+
+        job = SleeperSyncJob(job_id=uuid.uuid4().hex, user_id=user_id)
+        self._jobs[user_id] = job
+        session_factory = sessionmaker(
+            autocommit=False, autoflush=False, bind=db.get_bind()
+        )
+        task = asyncio.create_task(
+            self._run_sync_job(job, session_factory, connect_result)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get_sync_job(self, user_id: int) -> Optional[SleeperSyncJob]:
+        """The user's latest sync job, running or finished"""
+        return self._jobs.get(user_id)
+
+    async def _run_sync_job(
+        self,
+        job: SleeperSyncJob,
+        session_factory: sessionmaker,
+        connect_result: Optional[Dict[str, Any]],
+    ) -> None:
+        job.status = "running"
+        db = session_factory()
+        try:
+            results = await self._sync_user_data(job.user_id, db, job)
+            job.result = {"connect_result": connect_result, **results}
+            job.status = "complete"
+            job.advance("done", 0)
+        except Exception as e:
+            logger.error(f"Sleeper sync job {job.job_id} failed: {str(e)}")
+            db.rollback()
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            db.close()
+            job.finished_at = datetime.utcnow()
+
+    async def _sync_user_data(
+        self, user_id: int, db: Session, job: Optional[SleeperSyncJob] = None
+    ) -> Dict[str, Any]:
+        """Steps 2-4 for a connected user"""
+        leagues_result = await self.sync_all_league_history(user_id, db, job)
+        rosters_result = await self.sync_all_rosters(user_id, db, job)
+        if job:
+            job.advance("players", 1)
+        players_result = await self.sync_nfl_players(db)
+        return {
+            "leagues_result": leagues_result,
+            "rosters_result": rosters_result,
+            "players_result": players_result,
+        }
+
     # Helper methods
 
+    async def _gather_bounded(self, coroutines) -> List[Any]:
+        """Await coroutines with at most SYNC_CONCURRENCY running, in order"""
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+        async def bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(bounded(c) for c in coroutines))
+
+    @staticmethod
+    def _apply_changes(row: Any, values: Dict[str, Any]) -> bool:
+        """Set the columns whose value differs; True if any did"""
+        changed = False
+        for name, value in values.items():
+            if getattr(row, name) != value:
+                setattr(row, name, value)
+                changed = True
+        return changed
+
+    @staticmethod
+    def _roster_values(roster_data: Dict[str, Any]) -> Dict[str, Any]:
+        """The SleeperRoster columns a sync refreshes, from Sleeper's roster"""
+        settings = roster_data.get("settings") or {}
+        return {
+            "wins": settings.get("wins", 0),
+            "losses": settings.get("losses", 0),
+            "ties": settings.get("ties", 0),
+            "points_for": float(settings.get("fpts", 0)),
+            "points_against": float(settings.get("fpts_against", 0)),
+            "waiver_position": settings.get("waiver_position"),
+            "players": roster_data.get("players") or [],
+            "starters": roster_data.get("starters") or [],
+        }
+
     async def _get_user_leagues_for_season(
         self, sleeper_user_id: str, season: int
     ) -> List[Dict[str, Any]]:
         """Get all leagues for a user for a specific season"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/user/{sleeper_user_id}/leagues/nfl/{season}"
-                )
-                response.raise_for_status()
-
-                leagues_data = response.json()
-
-                processed_leagues = []
-                for league in leagues_data:
-                    processed_leagues.append(
-                        {
-                            "league_id": league["league_id"],
-                            "name": league["name"],
-                            "total_rosters": league["total_rosters"],
-                            "status": league.get("status", "complete"),
-                            "scoring_type": self._determine_scoring_type(league),
-                            "roster_positions": league.get("roster_positions", []),
-                            "scoring_settings": league.get("scoring_settings", {}),
-                            "waiver_settings": league.get("settings", {}),
-                        }
-                    )
-
-                return processed_leagues
-
+            leagues_data = await self.client.get_json(
+                f"/user/{sleeper_user_id}/leagues/nfl/{season}"
+            )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 # No leagues for this season
                 return []
             raise
-        except Exception as e:
-            logger.error(f"Error getting leagues for season {season}: {str(e)}")
-            return []
+
+        return [
+            {
+                "league_id": league["league_id"],
+                "name": league["name"],
+                "total_rosters": league["total_rosters"],
+                "status": league.get("status", "complete"),
+                "scoring_type": self._determine_scoring_type(league),
+                "roster_positions": league.get("roster_positions", []),
+                "scoring_settings": league.get("scoring_settings", {}),
+                "waiver_settings": league.get("settings", {}),
+            }
+            for league in leagues_data or []
+        ]
 
     async def _get_league_rosters(self, league_id: str) -> List[Dict[str, Any]]:
         """Get all rosters for a league"""
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/league/{league_id}/rosters"
-                )
-                response.raise_for_status()
-
-                return response.json()
-
-        except Exception as e:
-            logger.error(f"Error getting rosters for league {league_id}: {str(e)}")
-            return []
+        return await self.client.get_json(f"/league/{league_id}/rosters") or []
 
     async def _get_all_players(self) -> Dict[str, Any]:
-        """Get all NFL players data with caching"""
-        # Check if cache is valid (refresh daily)
-        now = datetime.now()
-        if (
-            self._players_cache_time
-            and (now - self._players_cache_time).seconds < 86400
-            and self._players_cache
-        ):
-            return self._players_cache
-
+        """Get all NFL players data (cached for a day by the Sleeper client)"""
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(f"{self.base_url}/players/nfl")
-
-                # Handle 304 Not Modified - data hasn't changed
-                if response.status_code == 304:
-                    logger.info(
-                        "NFL players data not modified (304), using cached data"
-                    )
-                    if self._players_cache:
-                        return self._players_cache
-                    else:
-                        # If we don't have cache but got 304, make request without ETag
-                        response = await client.get(f"{self.base_url}/players/nfl")
-                        response.raise_for_status()
-
-                response.raise_for_status()
-
-                self._players_cache = response.json()
-                self._players_cache_time = now
-
-                return self._players_cache
-
+            return await self.client.get_json("/players/nfl") or {}
         except Exception as e:
             logger.error(f"Failed to get all players: {str(e)}")
-            return self._players_cache if self._players_cache else {}
+            return {}
 
     def _determine_scoring_type(self, league_data: Dict[str, Any]) -> str:
         """Determine scoring type from league settings"""
@@ -0,0 +1,289 @@
+"""
+Shared Sleeper API client
+
+Every Sleeper call used to open its own httpx client, so each request paid
+for new connections and nothing was reused between requests. One client per
+process now keeps a pooled (HTTP/2 when h2 is installed) connection set and
+caches responses per endpoint: league settings for hours, rosters and
+matchups for minutes, trending players for a quarter hour. Expired entries
+are revalidated with the ETag or Last-Modified they came with, concurrent
+requests for the same resource share one fetch, and transient failures are
+retried with exponential backoff. Cached responses are shared between
+callers and must be treated as read-only.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from app.core.metrics import cache_requests
+from app.core.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+SLEEPER_BASE_URL = "https://api.sleeper.app/v1"
+
+# (endpoint, path pattern, seconds a response is served from cache); the
+# first matching pattern wins
+ENDPOINT_TTLS = (
+    ("trending_players", re.compile(r"^/players/nfl/trending/"), 15 * 60),
+    ("players", re.compile(r"^/players/nfl$"), 24 * 3600),
+    ("league_matchups", re.compile(r"^/league/[^/]+/matchups/"), 2 * 60),
+    ("league_transactions", re.compile(r"^/league/[^/]+/transactions"), 5 * 60),
+    ("league_rosters", re.compile(r"^/league/[^/]+/rosters"), 5 * 60),
+    ("league_users", re.compile(r"^/league/[^/]+/users$"), 3600),
+    ("league", re.compile(r"^/league/[^/]+$"), 6 * 3600),
+    ("user_leagues", re.compile(r"^/user/[^/]+/leagues/"), 15 * 60),
+    ("user", re.compile(r"^/user/[^/]+$"), 3600),
+)
+DEFAULT_TTL_SECONDS = 60
+
+# Connection pool shared by every request in the process
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+# Attempts after the first, and the delay before the first retry (doubling)
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.25
+# Longest Retry-After honored before retrying
+MAX_RETRY_AFTER_SECONDS = 10.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Responses kept in the cache, fresh or awaiting revalidation
+MAX_CACHE_ENTRIES = 5000
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def endpoint_for(path: str) -> Tuple[str, float]:
+    """Endpoint name and cache TTL for a request path"""
+    for name, pattern, ttl in ENDPOINT_TTLS:
+        if pattern.match(path):
+            return name, ttl
+    return "other", DEFAULT_TTL_SECONDS
+
+
+@dataclass
+class CachedResponse:
+    data: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class SleeperClient:
+    """Process-wide pooled, caching Sleeper API client"""
+
+    def __init__(
+        self,
+        base_url: str = SLEEPER_BASE_URL,
+        max_retries: int = MAX_RETRIES,
+        backoff: float = RETRY_BACKOFF_SECONDS,
+        max_entries: int = MAX_CACHE_ENTRIES,
+        http2: Optional[bool] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cache: TTLCache[str, CachedResponse] = TTLCache(
+            DEFAULT_TTL_SECONDS, max_entries
+        )
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stats: Counter = Counter()
+        self._endpoint_stats: Counter = Counter()
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            # Pooled connections belong to the event loop that opened them
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+            self._loop = loop
+            self._inflight = {}
+        return self._client
+
+    async def get_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Decoded JSON from a Sleeper path such as /league/<id>
+
+        Served from cache while fresh. Raises httpx.HTTPStatusError for an
+        error response and httpx.TransportError when Sleeper can't be
+        reached, once retries are exhausted and nothing stale is cached.
+        """
+        endpoint, endpoint_ttl = endpoint_for(path)
+        key = path
+        if params:
+            key += "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._count(endpoint, "hits")
+            cache_requests.inc("sleeper", "hit_memory")
+            return entry.data
+
+        self._ensure_client()
+        task = self._inflight.get(key)
+        if task is not None:
+            self._count(endpoint, "coalesced")
+            return await asyncio.shield(task)
+
+        self._count(endpoint, "misses")
+        cache_requests.inc("sleeper", "miss")
+        task = asyncio.ensure_future(
+            self._fetch(
+                key, path, params, endpoint, endpoint_ttl if ttl is None else ttl
+            )
+        )
+        # Retrieved even if every caller was cancelled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        key: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        endpoint: str,
+        ttl: float,
+    ) -> Any:
+        try:
+            entry = self._cache.get_stale(key)
+            headers = {}
+            if entry is not None:
+                if entry.etag:
+                    headers["If-None-Match"] = entry.etag
+                if entry.last_modified:
+                    headers["If-Modified-Since"] = entry.last_modified
+
+            try:
+                response = await self._request(path, params, headers, endpoint)
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                transient = not isinstance(e, httpx.HTTPStatusError) or (
+                    e.response.status_code in RETRY_STATUSES
+                )
+                if entry is None or not transient:
+                    raise
+                # Sleeper is struggling: a stale answer beats none
+                self._count(endpoint, "stale")
+                logger.warning(f"Serving stale Sleeper {path}: {e}")
+                return entry.data
+
+            if response.status_code == 304 and entry is not None:
+                self._count(endpoint, "revalidated")
+                self._cache.touch(key, ttl)
+                return entry.data
+
+            data = response.json()
+            self._cache.set(
+                key,
+                CachedResponse(
+                    data=data,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                ),
+                ttl,
+            )
+            return data
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    async def _request(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        endpoint: str,
+    ) -> httpx.Response:
+        client = self._ensure_client()
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                self._count(endpoint, "requests")
+                response = await client.get(path, params=params, headers=headers)
+                if response.status_code not in RETRY_STATUSES:
+                    if response.status_code != 304:
+                        response.raise_for_status()
+                    return response
+                if attempt == self.max_retries:
+                    response.raise_for_status()
+                retry_after = response.headers.get("retry-after")
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    self._count(endpoint, "errors")
+                    raise
+            except httpx.HTTPStatusError:
+                self._count(endpoint, "errors")
+                raise
+
+            self._count(endpoint, "retries")
+            delay = self.backoff * 2**attempt
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), MAX_RETRY_AFTER_SECONDS))
+            await asyncio.sleep(delay + random.uniform(0, delay / 4))
+
+    def _count(self, endpoint: str, result: str) -> None:
+        self._stats[result] += 1
+        self._endpoint_stats[(endpoint, result)] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache and request counters, in total and per endpoint"""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        endpoints: Dict[str, Dict[str, int]] = {}
+        for (endpoint, result), count in sorted(self._endpoint_stats.items()):
+            endpoints.setdefault(endpoint, {})[result] = count
+        return {
+            "entries": len(self._cache),
+            "http2": self.http2,
+            "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+            **{
+                result: self._stats[result]
+                for result in (
+                    "hits",
+                    "misses",
+                    "coalesced",
+                    "revalidated",
+                    "stale",
+                    "requests",
+                    "retries",
+                    "errors",
+                )
+            },
+            "endpoints": endpoints,
+        }
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Forget cached responses whose path starts with prefix; returns how many"""
+        return self._cache.discard_where(lambda key, _: key.startswith(prefix))
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+sleeper_client = SleeperClient()
@@ -9,6 +9,7 @@ from datetime import datetime
 import logging
 
 from app.services.fantasy_service import FantasyPlatformInterface
+from app.services.sleeper_client import SleeperClient, sleeper_client
 from app.models.fantasy_models import FantasyPlatform
 
 logger = logging.getLogger(__name__)
@@ -17,12 +18,13 @@ logger = logging.getLogger(__name__)
 class SleeperFantasyService(FantasyPlatformInterface):
     """Sleeper API integration service"""
 
-    def __init__(self):
-        self.base_url = "https://api.sleeper.app/v1"
+    def __init__(self, client: Optional[SleeperClient] = None):
+        # Shared, pooled and cached; responses are read-only
+        self.client = client or sleeper_client
         self.platform = FantasyPlatform.SLEEPER
-        # Cache for player data (updated daily)
-        self._players_cache = {}
-        self._players_cache_time = None
+        # Active players built from the player dump they came from
+        self._active_players: List[Dict[str, Any]] = []
+        self._active_players_source: Optional[Dict[str, Any]] = None
 
     async def authenticate_user(self, credentials: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -34,20 +36,14 @@ class SleeperFantasyService(FantasyPlatformInterface):
             raise ValueError("Username is required for Sleeper")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.base_url}/user/{username}")
-                response.raise_for_status()
-
-                user_data = response.json()
-
-                return {
-                    "user_id": user_data["user_id"],
-                    "username": user_data["username"],
-                    "display_name": user_data.get(
-                        "display_name", user_data["username"]
-                    ),
-                    "avatar": user_data.get("avatar"),
-                }
+            user_data = await self.client.get_json(f"/user/{username}")
+
+            return {
+                "user_id": user_data["user_id"],
+                "username": user_data["username"],
+                "display_name": user_data.get("display_name", user_data["username"]),
+                "avatar": user_data.get("avatar"),
+            }
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -62,38 +58,39 @@ class SleeperFantasyService(FantasyPlatformInterface):
         current_season = datetime.now().year
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/user/{platform_user_id}/leagues/nfl/{current_season}"
-                )
-                response.raise_for_status()
-
-                leagues_data = response.json()
+            leagues_data = await self.client.get_json(
+                f"/user/{platform_user_id}/leagues/nfl/{current_season}"
+            )
 
-                leagues = []
-                for league in leagues_data:
-                    # Get additional league details
-                    league_details = await self.get_league_details(league["league_id"])
+            # Every league's details at once over the shared pool
+            all_details = await asyncio.gather(
+                *(
+                    self.get_league_details(league["league_id"])
+                    for league in leagues_data
+                )
+            )
 
-                    # Determine waiver settings from league details
-                    waiver_settings = self._determine_waiver_settings(
-                        league_details.get("league_data", {})
-                    )
+            leagues = []
+            for league, league_details in zip(leagues_data, all_details):
+                # Determine waiver settings from league details
+                waiver_settings = self._determine_waiver_settings(
+                    league_details.get("league_data", {})
+                )
 
-                    leagues.append(
-                        {
-                            "league_id": league["league_id"],
-                            "name": league["name"],
-                            "season": current_season,
-                            "team_count": league["total_rosters"],
-                            "scoring_type": self._determine_scoring_type(league),
-                            "roster_positions": league.get("roster_positions", []),
-                            "teams": league_details.get("teams", []),
-                            "waiver_settings": waiver_settings,
-                        }
-                    )
+                leagues.append(
+                    {
+                        "league_id": league["league_id"],
+                        "name": league["name"],
+                        "season": current_season,
+                        "team_count": league["total_rosters"],
+                        "scoring_type": self._determine_scoring_type(league),
+                        "roster_positions": league.get("roster_positions", []),
+                        "teams": league_details.get("teams", []),
+                        "waiver_settings": waiver_settings,
+                    }
+                )
 
-                return leagues
+            return leagues
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -107,113 +104,96 @@ class SleeperFantasyService(FantasyPlatformInterface):
     async def get_league_details(self, league_id: str) -> Dict[str, Any]:
         """Get detailed league information"""
         try:
-            async with httpx.AsyncClient() as client:
-                # Get league info
-                league_response = await client.get(
-                    f"{self.base_url}/league/{league_id}"
-                )
-                league_response.raise_for_status()
-                league_data = league_response.json()
-                logger.info(f"League {league_id} status: {league_data.get('status')}")
-
-                # Get rosters
-                rosters_response = await client.get(
-                    f"{self.base_url}/league/{league_id}/rosters"
+            # League info, rosters and users (owners), fetched together
+            league_data, rosters_data, users_data = await asyncio.gather(
+                self.client.get_json(f"/league/{league_id}"),
+                self.client.get_json(f"/league/{league_id}/rosters"),
+                self.client.get_json(f"/league/{league_id}/users"),
+            )
+            logger.info(f"League {league_id} status: {league_data.get('status')}")
+            logger.info(f"Found {len(rosters_data)} rosters for league {league_id}")
+            logger.info(f"Found {len(users_data)} users for league {league_id}")
+
+            # Create user lookup
+            logger.info(f"Processing {len(users_data)} users for lookup")
+            users_lookup = {}
+            for user in users_data:
+                if user is None:
+                    logger.warning("Found None user in users_data")
+                    continue
+                user_id = user.get("user_id")
+                if user_id is None:
+                    logger.warning(f"User missing user_id: {user}")
+                    continue
+                users_lookup[user_id] = user
+                logger.debug(
+                    f"Added user to lookup: {user_id} -> {user.get('username', 'no_username')}"
                 )
-                rosters_response.raise_for_status()
-                rosters_data = rosters_response.json()
-                logger.info(f"Found {len(rosters_data)} rosters for league {league_id}")
 
-                # Get users (owners)
-                users_response = await client.get(
-                    f"{self.base_url}/league/{league_id}/users"
+            # Process teams
+            teams = []
+            logger.info(f"Processing {len(rosters_data)} rosters")
+            for i, roster in enumerate(rosters_data):
+                if roster is None:
+                    logger.warning(f"Found None roster at index {i}")
+                    continue
+                owner_id = roster.get("owner_id")
+                if owner_id is None:
+                    logger.warning(f"Roster missing owner_id: {roster}")
+                    continue
+                owner = users_lookup.get(owner_id, {})
+                logger.debug(
+                    f"Processing roster {i}: owner_id={owner_id}, owner_username={owner.get('username', 'Unknown')}"
                 )
-                users_response.raise_for_status()
-                users_data = users_response.json()
-                logger.info(f"Found {len(users_data)} users for league {league_id}")
-
-                # Create user lookup
-                logger.info(f"Processing {len(users_data)} users for lookup")
-                users_lookup = {}
-                for user in users_data:
-                    if user is None:
-                        logger.warning("Found None user in users_data")
-                        continue
-                    user_id = user.get("user_id")
-                    if user_id is None:
-                        logger.warning(f"User missing user_id: {user}")
-                        continue
-                    users_lookup[user_id] = user
-                    logger.debug(
-                        f"Added user to lookup: {user_id} -> {user.get('username', 'no_username')}"
-                    )
-
-                # Process teams
-                teams = []
-                logger.info(f"Processing {len(rosters_data)} rosters")
-                for i, roster in enumerate(rosters_data):
-                    if roster is None:
-                        logger.warning(f"Found None roster at index {i}")
-                        continue
-                    owner_id = roster.get("owner_id")
-                    if owner_id is None:
-                        logger.warning(f"Roster missing owner_id: {roster}")
-                        continue
-                    owner = users_lookup.get(owner_id, {})
-                    logger.debug(
-                        f"Processing roster {i}: owner_id={owner_id}, owner_username={owner.get('username', 'Unknown')}"
-                    )
 
-                    try:
-                        team_data = {
-                            "team_id": str(roster["roster_id"]),
-                            "name": self._get_team_name(roster, owner),
-                            "owner_name": owner.get("display_name")
-                            or owner.get("username", "Unknown"),
-                            "owner_id": roster["owner_id"],
-                            "wins": roster.get("settings", {}).get("wins", 0),
-                            "losses": roster.get("settings", {}).get("losses", 0),
-                            "ties": roster.get("settings", {}).get("ties", 0),
-                            "points_for": float(
-                                roster.get("settings", {}).get("fpts", 0)
-                            ),
-                            "points_against": float(
-                                roster.get("settings", {}).get("fpts_against", 0)
-                            ),
-                            "waiver_position": roster.get("settings", {}).get(
-                                "waiver_position"
-                            ),
-                            "roster": roster.get("players", []),
-                        }
-                    except Exception as team_error:
-                        logger.error(
-                            f"Error processing team data for roster {i}: {team_error}"
-                        )
-                        logger.error(f"Roster data: {roster}")
-                        logger.error(f"Owner data: {owner}")
-                        raise
-                    teams.append(team_data)
-                    logger.debug(
-                        f"Processed team: {team_data['name']} (ID: {team_data['team_id']})"
+                try:
+                    team_data = {
+                        "team_id": str(roster["roster_id"]),
+                        "name": self._get_team_name(roster, owner),
+                        "owner_name": owner.get("display_name")
+                        or owner.get("username", "Unknown"),
+                        "owner_id": roster["owner_id"],
+                        "wins": roster.get("settings", {}).get("wins", 0),
+                        "losses": roster.get("settings", {}).get("losses", 0),
+                        "ties": roster.get("settings", {}).get("ties", 0),
+                        "points_for": float(roster.get("settings", {}).get("fpts", 0)),
+                        "points_against": float(
+                            roster.get("settings", {}).get("fpts_against", 0)
+                        ),
+                        "waiver_position": roster.get("settings", {}).get(
+                            "waiver_position"
+                        ),
+                        "roster": roster.get("players", []),
+                    }
+                except Exception as team_error:
+                    logger.error(
+                        f"Error processing team data for roster {i}: {team_error}"
                     )
-
-                logger.info(
-                    f"Successfully processed {len(teams)} teams for league {league_id}"
+                    logger.error(f"Roster data: {roster}")
+                    logger.error(f"Owner data: {owner}")
+                    raise
+                teams.append(team_data)
+                logger.debug(
+                    f"Processed team: {team_data['name']} (ID: {team_data['team_id']})"
                 )
 
-                # Determine waiver settings
-                waiver_settings = self._determine_waiver_settings(league_data)
+            logger.info(
+                f"Successfully processed {len(teams)} teams for league {league_id}"
+            )
 
-                return {
-                    "league_id": league_id,
-                    "name": league_data["name"],
-                    "season": league_data["season"],
-                    "status": league_data["status"],
-                    "scoring_settings": league_data.get("scoring_settings", {}),
-                    "roster_positions": league_data.get("roster_positions", []),
-                    "waiver_settings": waiver_settings,
-                    "teams": teams,
-                }
+            # Determine waiver settings
+            waiver_settings = self._determine_waiver_settings(league_data)
+
+            return {
+                "league_id": league_id,
+                "name": league_data["name"],
+                "season": league_data["season"],
+                "status": league_data["status"],
+                "scoring_settings": league_data.get("scoring_settings", {}),
+                "roster_positions": league_data.get("roster_positions", []),
+                "waiver_settings": waiver_settings,
+                "teams": teams,
+            }
 
         except Exception as e:
             logger.error(
@@ -302,40 +282,36 @@ class SleeperFantasyService(FantasyPlatformInterface):
     ) -> List[Dict[str, Any]]:
         """Get matchups for specific week"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/league/{league_id}/matchups/{week}"
-                )
-                response.raise_for_status()
-
-                matchups_data = response.json()
-
-                # Group matchups by matchup_id
-                matchups_grouped = {}
-                for matchup in matchups_data:
-                    matchup_id = matchup.get("matchup_id")
-                    if matchup_id not in matchups_grouped:
-                        matchups_grouped[matchup_id] = []
-                    matchups_grouped[matchup_id].append(matchup)
-
-                # Process matchups
-                processed_matchups = []
-                for matchup_id, teams in matchups_grouped.items():
-                    if len(teams) == 2:  # Valid matchup
-                        processed_matchups.append(
-                            {
-                                "matchup_id": str(matchup_id),
-                                "week": week,
-                                "team1_id": str(teams[0]["roster_id"]),
-                                "team2_id": str(teams[1]["roster_id"]),
-                                "team1_score": float(teams[0].get("points", 0)),
-                                "team2_score": float(teams[1].get("points", 0)),
-                                "team1_starters": teams[0].get("starters", []),
-                                "team2_starters": teams[1].get("starters", []),
-                            }
-                        )
-
-                return processed_matchups
+            matchups_data = await self.client.get_json(
+                f"/league/{league_id}/matchups/{week}"
+            )
+
+            # Group matchups by matchup_id
+            matchups_grouped = {}
+            for matchup in matchups_data:
+                matchup_id = matchup.get("matchup_id")
+                if matchup_id not in matchups_grouped:
+                    matchups_grouped[matchup_id] = []
+                matchups_grouped[matchup_id].append(matchup)
+
+            # Process matchups
+            processed_matchups = []
+            for matchup_id, teams in matchups_grouped.items():
+                if len(teams) == 2:  # Valid matchup
+                    processed_matchups.append(
+                        {
+                            "matchup_id": str(matchup_id),
+                            "week": week,
+                            "team1_id": str(teams[0]["roster_id"]),
+                            "team2_id": str(teams[1]["roster_id"]),
+                            "team1_score": float(teams[0].get("points", 0)),
+                            "team2_score": float(teams[1].get("points", 0)),
+                            "team1_starters": teams[0].get("starters", []),
+                            "team2_starters": teams[1].get("starters", []),
+                        }
+                    )
+
+            return processed_matchups
 
         except Exception as e:
             logger.error(
@@ -344,10 +320,9 @@ class SleeperFantasyService(FantasyPlatformInterface):
             return []
 
     async def get_available_players(self, league_id: str) -> List[Dict[str, Any]]:
-        """Get all available (free agent) players"""
+        """Get all available (free agent) players; entries are shared, read-only"""
         try:
-            # Get all players
-            players_data = await self._get_all_players()
+            active_players = await self._get_active_players()
 
             # Get league rosters to determine taken players
             league_details = await self.get_league_details(league_id)
@@ -358,25 +333,11 @@ class SleeperFantasyService(FantasyPlatformInterface):
                 taken_players.update(roster)
 
             # Filter out taken players
-            available_players = []
-            for player_id, player_data in players_data.items():
-                if player_id not in taken_players:
-                    if player_data.get("active", False):  # Only active players
-                        available_players.append(
-                            {
-                                "player_id": player_id,
-                                "name": f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip(),
-                                "position": player_data.get("position"),
-                                "team": player_data.get("team"),
-                                "age": player_data.get("age"),
-                                "experience": player_data.get("years_exp"),
-                                "fantasy_positions": player_data.get(
-                                    "fantasy_positions", []
-                                ),
-                            }
-                        )
-
-            return available_players
+            return [
+                player
+                for player in active_players
+                if player["player_id"] not in taken_players
+            ]
 
         except Exception as e:
             logger.error(
@@ -384,73 +345,72 @@ class SleeperFantasyService(FantasyPlatformInterface):
             )
             return []
 
+    async def _get_active_players(self) -> List[Dict[str, Any]]:
+        """Active players in available-player form, rebuilt when the dump changes"""
+        players_data = await self._get_all_players()
+        if players_data is not self._active_players_source:
+            self._active_players = [
+                {
+                    "player_id": player_id,
+                    "name": f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip(),
+                    "position": player_data.get("position"),
+                    "team": player_data.get("team"),
+                    "age": player_data.get("age"),
+                    "experience": player_data.get("years_exp"),
+                    "fantasy_positions": player_data.get("fantasy_positions", []),
+                }
+                for player_id, player_data in players_data.items()
+                if player_data.get("active", False)  # Only active players
+            ]
+            self._active_players_source = players_data
+        return self._active_players
+
     async def get_trending_players(
         self, trend_type: str = "add"
     ) -> List[Dict[str, Any]]:
         """Get trending players (add/drop)"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/players/nfl/trending/{trend_type}"
-                )
-                response.raise_for_status()
-
-                trending_data = response.json()
-
-                # Get player details
-                players_data = await self._get_all_players()
-
-                trending_players = []
-                for player_entry in trending_data:
-                    player_id = player_entry["player_id"]
-                    count = player_entry["count"]
-
-                    if player_id in players_data:
-                        player_data = players_data[player_id]
-                        trending_players.append(
-                            {
-                                "player_id": player_id,
-                                "name": f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip(),
-                                "position": player_data.get("position"),
-                                "team": player_data.get("team"),
-                                "trend_type": trend_type,
-                                "trend_count": count,
-                                "fantasy_positions": player_data.get(
-                                    "fantasy_positions", []
-                                ),
-                            }
-                        )
-
-                return trending_players
+            trending_data = await self.client.get_json(
+                f"/players/nfl/trending/{trend_type}"
+            )
+
+            # Get player details
+            players_data = await self._get_all_players()
+
+            trending_players = []
+            for player_entry in trending_data:
+                player_id = player_entry["player_id"]
+                count = player_entry["count"]
+
+                if player_id in players_data:
+                    player_data = players_data[player_id]
+                    trending_players.append(
+                        {
+                            "player_id": player_id,
+                            "name": f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip(),
+                            "position": player_data.get("position"),
+                            "team": player_data.get("team"),
+                            "trend_type": trend_type,
+                            "trend_count": count,
+                            "fantasy_positions": player_data.get(
+                                "fantasy_positions", []
+                            ),
+                        }
+                    )
+
+            return trending_players
 
         except Exception as e:
             logger.error(f"Failed to get trending players: {str(e)}")
             return []
 
     async def _get_all_players(self) -> Dict[str, Any]:
-        """Get all NFL players data with caching"""
-        # Check if cache is valid (refresh daily)
-        now = datetime.now()
-        if (
-            self._players_cache_time
-            and (now - self._players_cache_time).seconds < 86400  # 24 hours
-            and self._players_cache
-        ):
-            return self._players_cache
-
+        """Get all NFL players data (cached by the client for a day)"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.base_url}/players/nfl")
-                response.raise_for_status()
-
-                self._players_cache = response.json()
-                self._players_cache_time = now
-
-                return self._players_cache
-
+            return await self.client.get_json("/players/nfl")
         except Exception as e:
             logger.error(f"Failed to get all players: {str(e)}")
-            return self._players_cache if self._players_cache else {}
+            return {}
 
     def _determine_scoring_type(self, league_data: Dict[str, Any]) -> str:
         """Determine scoring type from league settings"""
@@ -493,97 +453,75 @@ class SleeperFantasyService(FantasyPlatformInterface):
     ) -> Dict[str, Any]:
         """Get historical data for a league season"""
         try:
-            async with httpx.AsyncClient() as client:
-                # Get league details for historical season
-                league_response = await client.get(
-                    f"{self.base_url}/league/{league_id}"
-                )
-                league_response.raise_for_status()
-                league_data = league_response.json()
+            # Get league details and rosters for historical season
+            league_data = await self.client.get_json(f"/league/{league_id}")
+            rosters_data = await self.client.get_json(
+                f"/league/{league_id}/rosters/{season}"
+            )
 
-                # Get rosters for historical season
-                rosters_response = await client.get(
-                    f"{self.base_url}/league/{league_id}/rosters/{season}"
-                )
-                rosters_response.raise_for_status()
-                rosters_data = rosters_response.json()
-
-                # Get all transactions for historical season
-                all_transactions = []
-                for week in range(1, 19):  # NFL weeks 1-18
-                    try:
-                        trans_response = await client.get(
-                            f"{self.base_url}/league/{league_id}/transactions/{week}"
-                        )
-                        trans_response.raise_for_status()
-                        week_transactions = trans_response.json()
-                        all_transactions.extend(week_transactions)
-                        await asyncio.sleep(0.1)  # Rate limiting
-                    except Exception as e:
-                        logger.debug(f"No transactions for week {week}: {e}")
-                        continue
-
-                # Get users data
-                users_response = await client.get(
-                    f"{self.base_url}/league/{league_id}/users"
-                )
-                users_response.raise_for_status()
-                users_data = users_response.json()
-
-                # Process teams data with standings
-                teams_data = []
-                for roster in rosters_data:
-                    # Find corresponding user
-                    owner_id = roster.get("owner_id")
-                    owner = next(
-                        (u for u in users_data if u["user_id"] == owner_id), {}
+            # Get all transactions for historical season
+            all_transactions = []
+            for week in range(1, 19):  # NFL weeks 1-18
+                try:
+                    week_transactions = await self.client.get_json(
+                        f"/league/{league_id}/transactions/{week}"
                     )
+                    all_transactions.extend(week_transactions)
+                except Exception as e:
+                    logger.debug(f"No transactions for week {week}: {e}")
+                    continue
+
+            # Get users data
+            users_data = await self.client.get_json(f"/league/{league_id}/users")
+
+            # Process teams data with standings
+            teams_data = []
+            for roster in rosters_data:
+                # Find corresponding user
+                owner_id = roster.get("owner_id")
+                owner = next((u for u in users_data if u["user_id"] == owner_id), {})
+
+                teams_data.append(
+                    {
+                        "roster_id": roster["roster_id"],
+                        "team_name": self._get_team_name(roster, owner),
+                        "owner_id": owner_id,
+                        "owner_name": owner.get(
+                            "display_name", owner.get("username", "Unknown")
+                        ),
+                        "wins": roster.get("settings", {}).get("wins", 0),
+                        "losses": roster.get("settings", {}).get("losses", 0),
+                        "ties": roster.get("settings", {}).get("ties", 0),
+                        "points_for": float(roster.get("settings", {}).get("fpts", 0)),
+                        "points_against": float(
+                            roster.get("settings", {}).get("fpts_against", 0)
+                        ),
+                        "waiver_position": roster.get("settings", {}).get(
+                            "waiver_position"
+                        ),
+                        "players": roster.get("players", []),
+                    }
+                )
 
-                    teams_data.append(
-                        {
-                            "roster_id": roster["roster_id"],
-                            "team_name": self._get_team_name(roster, owner),
-                            "owner_id": owner_id,
-                            "owner_name": owner.get(
-                                "display_name", owner.get("username", "Unknown")
-                            ),
-                            "wins": roster.get("settings", {}).get("wins", 0),
-                            "losses": roster.get("settings", {}).get("losses", 0),
-                            "ties": roster.get("settings", {}).get("ties", 0),
-                            "points_for": float(
-                                roster.get("settings", {}).get("fpts", 0)
-                            ),
-                            "points_against": float(
-                                roster.get("settings", {}).get("fpts_against", 0)
-                            ),
-                            "waiver_position": roster.get("settings", {}).get(
-                                "waiver_position"
-                            ),
-                            "players": roster.get("players", []),
-                        }
-                    )
+            # Sort by wins, then points for standings
+            standings = sorted(teams_data, key=lambda x: (-x["wins"], -x["points_for"]))
+            for i, team in enumerate(standings):
+                team["final_rank"] = i + 1
 
-                # Sort by wins, then points for standings
-                standings = sorted(
-                    teams_data, key=lambda x: (-x["wins"], -x["points_for"])
-                )
-                for i, team in enumerate(standings):
-                    team["final_rank"] = i + 1
-
-                return {
-                    "season": season,
-                    "league_info": {
-                        "name": league_data["name"],
-                        "total_rosters": league_data["total_rosters"],
-                        "scoring_settings": league_data.get("scoring_settings", {}),
-                        "roster_positions": league_data.get("roster_positions", []),
-                        "settings": league_data.get("settings", {}),
-                    },
-                    "teams_data": teams_data,
-                    "standings_data": standings,
-                    "transactions_data": all_transactions,
-                    "waiver_settings": self._determine_waiver_settings(league_data),
-                }
+            return {
+                "season": season,
+                "league_info": {
+                    "name": league_data["name"],
+                    "total_rosters": league_data["total_rosters"],
+                    "scoring_settings": league_data.get("scoring_settings", {}),
+                    "roster_positions": league_data.get("roster_positions", []),
+                    "settings": league_data.get("settings", {}),
+                },
+                "teams_data": teams_data,
+                "standings_data": standings,
+                "transactions_data": all_transactions,
+                "waiver_settings": self._determine_waiver_settings(league_data),
+            }
 
         except Exception as e:
             logger.error(
@@ -625,34 +563,30 @@ class SleeperFantasyService(FantasyPlatformInterface):
     ) -> List[Dict[str, Any]]:
         """Get league transactions for specific week or all season"""
         try:
-            url = f"{self.base_url}/league/{league_id}/transactions"
+            path = f"/league/{league_id}/transactions"
             if week:
-                url += f"/{week}"
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                transactions_data = response.json()
-
-                # Process transactions
-                processed_transactions = []
-                for transaction in transactions_data:
-                    processed_transactions.append(
-                        {
-                            "transaction_id": transaction.get("transaction_id"),
-                            "type": transaction.get("type"),
-                            "status": transaction.get("status"),
-                            "roster_ids": transaction.get("roster_ids", []),
-                            "adds": transaction.get("adds", {}),
-                            "drops": transaction.get("drops", {}),
-                            "waiver_budget": transaction.get("waiver_budget", {}),
-                            "created": transaction.get("created"),
-                            "week": transaction.get("leg", week),
-                        }
-                    )
+                path += f"/{week}"
+
+            transactions_data = await self.client.get_json(path)
+
+            # Process transactions
+            processed_transactions = []
+            for transaction in transactions_data:
+                processed_transactions.append(
+                    {
+                        "transaction_id": transaction.get("transaction_id"),
+                        "type": transaction.get("type"),
+                        "status": transaction.get("status"),
+                        "roster_ids": transaction.get("roster_ids", []),
+                        "adds": transaction.get("adds", {}),
+                        "drops": transaction.get("drops", {}),
+                        "waiver_budget": transaction.get("waiver_budget", {}),
+                        "created": transaction.get("created"),
+                        "week": transaction.get("leg", week),
+                    }
+                )
 
-                return processed_transactions
+            return processed_transactions
 
         except Exception as e:
             logger.error(f"Failed to get transactions for league {league_id}: {str(e)}")
@@ -0,0 +1,294 @@
+"""
+Roster frames and caches behind comprehensive team analytics
+
+A team's analytics read every rostered player's games in the analysis
+window. load_roster_frame fetches them for the whole roster in one query
+(falling back to the previous season per player, as single-player lookups
+do), and the sections of the report are computed from that frame.
+
+Reports are cached per team until its roster changes, checked against the
+roster on every lookup, or until analytics are ingested. League-wide
+efficiency benchmarks are cached per (season, week). Writers outside this
+process can't invalidate, so entries also expire after a TTL.
+"""
+
+import logging
+from collections import defaultdict
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.metrics import cache_requests
+from app.core.ttl_cache import TTLCache
+from app.models.fantasy_models import FantasyPlayer, FantasyRosterSpot, PlayerAnalytics
+
+logger = logging.getLogger(__name__)
+
+# Team analytics look at the first weeks of a season
+ANALYSIS_WEEKS = 12
+
+# First season with analytics; earlier seasons have nothing to fall back to
+FIRST_ANALYTICS_SEASON = 2021
+
+# Seconds an entry is served before being recomputed regardless
+TEAM_ANALYTICS_TTL_SECONDS = 3600
+
+# Team reports kept in the cache
+TEAM_ANALYTICS_MAX_SIZE = 2000
+
+# Positions compared against league efficiency
+BENCHMARK_POSITIONS = ("QB", "RB", "WR", "TE")
+
+_WEEK_COLUMNS = (
+    PlayerAnalytics.week,
+    PlayerAnalytics.ppr_points,
+    PlayerAnalytics.snap_percentage,
+    PlayerAnalytics.target_share,
+)
+
+
+@dataclass
+class RosterPlayer:
+    """A rostered player and their games in the window, in week order"""
+
+    player_id: int
+    name: str
+    position: Optional[str]
+    games: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class RosterFrame:
+    """A team's roster with its analytics, as the report sections read it"""
+
+    team_id: int
+    season: int
+    through_week: int
+    players: List[RosterPlayer]
+
+
+def roster_signature(db: Session, team_id: int) -> Tuple[Tuple[int, int], ...]:
+    """The team's roster spots; any add, drop or re-sync changes it"""
+    rows = db.execute(
+        select(FantasyRosterSpot.id, FantasyRosterSpot.player_id)
+        .where(FantasyRosterSpot.team_id == team_id)
+        .order_by(FantasyRosterSpot.id)
+    )
+    return tuple((spot_id, player_id) for spot_id, player_id in rows)
+
+
+def load_roster_frame(
+    db: Session,
+    team_id: int,
+    season: int,
+    through_week: int = ANALYSIS_WEEKS,
+    player_ids: Optional[List[int]] = None,
+) -> RosterFrame:
+    """
+    A team's rostered players and their games in weeks 1..through_week
+
+    Players without games in the season use the previous season's. Pass
+    player_ids to skip reading the roster again.
+    """
+    if player_ids is None:
+        player_ids = [player_id for _, player_id in roster_signature(db, team_id)]
+    player_ids = list(dict.fromkeys(player_ids))
+
+    players = {
+        row.id: RosterPlayer(
+            player_id=row.id,
+            name=row.name,
+            position=getattr(row.position, "value", row.position),
+        )
+        for row in db.execute(
+            select(FantasyPlayer.id, FantasyPlayer.name, FantasyPlayer.position).where(
+                FantasyPlayer.id.in_(player_ids)
+            )
+        )
+    }
+
+    seasons = [season]
+    if season > FIRST_ANALYTICS_SEASON:
+        seasons.append(season - 1)
+    games = defaultdict(lambda: defaultdict(list))
+    rows = db.execute(
+        select(PlayerAnalytics.player_id, PlayerAnalytics.season, *_WEEK_COLUMNS)
+        .where(
+            PlayerAnalytics.player_id.in_(list(players)),
+            PlayerAnalytics.season.in_(seasons),
+            PlayerAnalytics.week.between(1, through_week),
+        )
+        .order_by(PlayerAnalytics.player_id, PlayerAnalytics.week)
+    )
+    for row in rows:
+        games[row.player_id][row.season].append(
+            {
+                "week": row.week,
+                "ppr_points": row.ppr_points,
+                "snap_percentage": row.snap_percentage,
+                "target_share": row.target_share,
+            }
+        )
+    for player_id, player in players.items():
+        by_season = games.get(player_id, {})
+        player.games = next((by_season[s] for s in seasons if by_season.get(s)), [])
+
+    return RosterFrame(
+        team_id=team_id,
+        season=season,
+        through_week=through_week,
+        players=[players[pid] for pid in player_ids if pid in players],
+    )
+
+
+def points_per_snap(game: Dict[str, Any]) -> Optional[float]:
+    """Fantasy points per full game of snaps, for games with both recorded"""
+    if game.get("ppr_points") and game.get("snap_percentage"):
+        return game["ppr_points"] / (game["snap_percentage"] / 100)
+    return None
+
+
+def load_league_benchmarks(
+    db: Session, season: int, through_week: int = ANALYSIS_WEEKS
+) -> Dict[str, float]:
+    """
+    Average points per snap of every player at each position in the window
+
+    Each player's own average counts once, as a team's players do in its
+    comparison. Positions without games in the season use the previous
+    season's average.
+    """
+    seasons = [season]
+    if season > FIRST_ANALYTICS_SEASON:
+        seasons.append(season - 1)
+
+    per_player = (
+        select(
+            PlayerAnalytics.season,
+            FantasyPlayer.position,
+            func.avg(
+                PlayerAnalytics.ppr_points * 100 / PlayerAnalytics.snap_percentage
+            ).label("efficiency"),
+        )
+        .join(FantasyPlayer, FantasyPlayer.id == PlayerAnalytics.player_id)
+        .where(
+            PlayerAnalytics.season.in_(seasons),
+            PlayerAnalytics.week.between(1, through_week),
+            PlayerAnalytics.ppr_points != 0,
+            PlayerAnalytics.snap_percentage != 0,
+        )
+        .group_by(
+            PlayerAnalytics.player_id, PlayerAnalytics.season, FantasyPlayer.position
+        )
+        .subquery()
+    )
+    averages = {
+        (row.season, getattr(row.position, "value", row.position)): row.efficiency
+        for row in db.execute(
+            select(
+                per_player.c.season,
+                per_player.c.position,
+                func.avg(per_player.c.efficiency).label("efficiency"),
+            ).group_by(per_player.c.season, per_player.c.position)
+        )
+    }
+
+    benchmarks = {}
+    for position in BENCHMARK_POSITIONS:
+        for s in seasons:
+            if averages.get((s, position)):
+                benchmarks[position] = round(float(averages[(s, position)]), 3)
+                break
+    return benchmarks
+
+
+class TeamAnalyticsCache:
+    """
+    Team reports keyed by (team, season, week) and league benchmarks keyed
+    by (season, week)
+
+    Ingesting analytics bumps a generation that retires every entry; a team
+    entry also has to match the roster it was computed from.
+    """
+
+    def __init__(
+        self,
+        ttl: float = TEAM_ANALYTICS_TTL_SECONDS,
+        max_size: int = TEAM_ANALYTICS_MAX_SIZE,
+    ):
+        self._generation = 0
+        # Values hold the generation they were computed at (and the roster)
+        self._teams: TTLCache[Tuple[int, int, int], Tuple[int, Tuple, Dict]] = TTLCache(
+            ttl, max_size
+        )
+        self._benchmarks: TTLCache[Tuple[int, int], Tuple[int, Dict]] = TTLCache(
+            ttl, max_size
+        )
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get_team(
+        self, team_id: int, season: int, through_week: int, signature: Tuple
+    ) -> Optional[Dict[str, Any]]:
+        """A copy of the cached report, if it's current for this roster"""
+        entry = self._teams.get((team_id, season, through_week))
+        if entry is not None and entry[0] == self._generation and entry[1] == signature:
+            cache_requests.inc("team_analytics", "hit_memory")
+            return deepcopy(entry[2])
+        cache_requests.inc("team_analytics", "miss")
+        return None
+
+    def put_team(
+        self,
+        team_id: int,
+        season: int,
+        through_week: int,
+        signature: Tuple,
+        analytics: Dict[str, Any],
+        generation: int,
+    ) -> None:
+        """Store a report computed from data read at the given generation"""
+        if generation != self._generation:
+            return
+        self._teams.set(
+            (team_id, season, through_week),
+            (generation, signature, deepcopy(analytics)),
+        )
+
+    def league_benchmarks(
+        self, db: Session, season: int, through_week: int = ANALYSIS_WEEKS
+    ) -> Dict[str, float]:
+        """League efficiency benchmarks, computed once per (season, week)"""
+        key = (season, through_week)
+        entry = self._benchmarks.get(key)
+        if entry is not None and entry[0] == self._generation:
+            cache_requests.inc("league_benchmarks", "hit_memory")
+            return entry[1]
+
+        cache_requests.inc("league_benchmarks", "miss")
+        generation = self._generation
+        benchmarks = load_league_benchmarks(db, season, through_week)
+        if generation == self._generation:
+            self._benchmarks.set(key, (generation, benchmarks))
+        return benchmarks
+
+    def invalidate_team(self, team_id: Optional[int] = None) -> None:
+        """Forget one team's reports, or every team's"""
+        if team_id is None:
+            self._teams.clear()
+            return
+        self._teams.discard_where(lambda key, _: key[0] == team_id)
+
+    def invalidate_analytics(self) -> None:
+        """Retire every report and benchmark after analytics change"""
+        self._generation += 1
+        self._teams.clear()
+        self._benchmarks.clear()
+
+
+team_analytics_cache = TeamAnalyticsCache()
@@ -2,7 +2,6 @@
 """Two-Factor Authentication (2FA) service using TOTP"""
 
 import pyotp
-import qrcode
 import secrets
 import json
 import io
@@ -32,7 +31,9 @@ class TOTPService:
                 name=email, issuer_name=self.issuer_name
             )
 
-            # Generate QR code
+            # Generate QR code; qrcode (and PIL) load only for 2FA setup
+            import qrcode
+
             qr = qrcode.QRCode(
                 version=1,
                 error_correction=qrcode.constants.ERROR_CORRECT_L,
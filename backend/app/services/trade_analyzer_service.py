@@ -4,7 +4,7 @@ Trade Analyzer Service - Comprehensive fantasy trade evaluation and recommendati
 
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, select
 from datetime import datetime, timedelta
 import logging
 import json
@@ -22,15 +22,35 @@ from app.models.fantasy_models import (
     FantasyPlayer,
     FantasyLeague,
     FantasyRosterSpot,
+    FantasyPosition,
     PlayerAnalytics,
     PlayerTrends,
     TradeStatus,
     TradeGrade,
 )
+from app.services.league_context import (
+    CURRENT_WEEK,
+    TeamSnapshot,
+    league_context_cache,
+)
+from app.services.team_analytics import (
+    ANALYSIS_WEEKS,
+    BENCHMARK_POSITIONS,
+    RosterFrame,
+    load_roster_frame,
+    points_per_snap,
+    roster_signature,
+    team_analytics_cache,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _current_roster_spot():
+    """Season-long roster spots and those for the current week onwards"""
+    return or_(FantasyRosterSpot.week.is_(None), FantasyRosterSpot.week >= CURRENT_WEEK)
+
+
 class TradeAnalyzerService:
     """Comprehensive trade analysis and recommendation service"""
 
@@ -163,6 +183,73 @@ class TradeAnalyzerService:
             logger.error(f"Failed to evaluate trade {trade_id}: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def accept_trade(self, trade_id: int) -> Dict[str, Any]:
+        """Accept a pending trade, moving its players and picks between teams"""
+        try:
+            trade = self.db.query(Trade).filter(Trade.id == trade_id).first()
+            if not trade:
+                return {"success": False, "error": "Trade not found"}
+            if trade.status not in (TradeStatus.PROPOSED, TradeStatus.PENDING):
+                return {
+                    "success": False,
+                    "error": f"Trade is already {trade.status.value}",
+                }
+            if trade.expires_at and trade.expires_at < datetime.utcnow():
+                return {"success": False, "error": "Trade has expired"}
+
+            # Rosters may have changed since the trade was proposed
+            validation_result = self._validate_trade_assets(
+                trade.team1_id,
+                trade.team2_id,
+                trade.team1_gives or {},
+                trade.team2_gives or {},
+            )
+            if not validation_result["valid"]:
+                return {"success": False, "error": validation_result["error"]}
+
+            for from_team, to_team, gives in (
+                (trade.team1_id, trade.team2_id, trade.team1_gives or {}),
+                (trade.team2_id, trade.team1_id, trade.team2_gives or {}),
+            ):
+                if gives.get("players"):
+                    # Acquired players start out on the bench. Spots for weeks
+                    # already played stay with from_team as roster history.
+                    self.db.query(FantasyRosterSpot).filter(
+                        FantasyRosterSpot.team_id == from_team,
+                        FantasyRosterSpot.player_id.in_(gives["players"]),
+                        _current_roster_spot(),
+                    ).update(
+                        {
+                            FantasyRosterSpot.team_id: to_team,
+                            FantasyRosterSpot.position: FantasyPosition.BENCH,
+                            FantasyRosterSpot.is_starter: False,
+                        },
+                        synchronize_session=False,
+                    )
+                if gives.get("picks"):
+                    self.db.query(DraftPick).filter(
+                        DraftPick.current_owner_team_id == from_team,
+                        DraftPick.id.in_(gives["picks"]),
+                    ).update(
+                        {DraftPick.current_owner_team_id: to_team},
+                        synchronize_session=False,
+                    )
+
+            trade.status = TradeStatus.ACCEPTED
+            trade.processed_at = datetime.utcnow()
+            self.db.commit()
+
+            league_context_cache.invalidate(trade.league_id)
+            team_analytics_cache.invalidate_team(trade.team1_id)
+            team_analytics_cache.invalidate_team(trade.team2_id)
+
+            return {"success": True, "trade_id": trade.id, "status": "accepted"}
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to accept trade {trade_id}: {str(e)}")
+            return {"success": False, "error": str(e)}
+
     def _validate_trade_assets(
         self, team1_id: int, team2_id: int, team1_gives: Dict, team2_gives: Dict
     ) -> Dict[str, Any]:
@@ -201,10 +288,8 @@ class TradeAnalyzerService:
         """Validate team owns the specified assets"""
         # Validate players
         if assets.get("players"):
-            roster_player_ids = (
-                self.db.query(FantasyRosterSpot.player_id)
-                .filter(FantasyRosterSpot.team_id == team_id)
-                .subquery()
+            roster_player_ids = select(FantasyRosterSpot.player_id).where(
+                FantasyRosterSpot.team_id == team_id, _current_roster_spot()
             )
 
             owned_players = (
@@ -250,6 +335,9 @@ class TradeAnalyzerService:
         team1_context = self._get_team_context(trade.team1_id, league_context)
         team2_context = self._get_team_context(trade.team2_id, league_context)
 
+        # Simulated playoff and championship odds with and without the trade
+        league_context["season_outlook"] = self._simulate_trade_outlook(trade)
+
         # Calculate player values
         team1_values = self._calculate_trade_side_value(
             trade.team1_gives, team1_context, league_context
@@ -326,87 +414,36 @@ class TradeAnalyzerService:
 
     def _get_league_context(self, league_id: int) -> Dict[str, Any]:
         """Get comprehensive league context for evaluation"""
-        league = (
-            self.db.query(FantasyLeague).filter(FantasyLeague.id == league_id).first()
-        )
-
-        # Determine current week (simplified - would integrate with real NFL week)
-        current_week = 8  # This would come from NFL schedule service
-
-        # Calculate weeks until trade deadline
-        trade_deadline_weeks = max(0, 10 - current_week)  # Assuming week 10 deadline
-
-        # Get playoff race context
-        teams = (
-            self.db.query(FantasyTeam).filter(FantasyTeam.league_id == league_id).all()
-        )
-        sorted_teams = sorted(teams, key=lambda t: (-t.wins, -t.points_for))
-
-        playoff_spots = league.playoff_teams or 6
-        playoff_race = {
-            "in_playoffs": len([t for t in sorted_teams[:playoff_spots]]),
-            "bubble_teams": len(
-                [t for t in sorted_teams[playoff_spots : playoff_spots + 2]]
-            ),
-            "eliminated": len([t for t in sorted_teams[playoff_spots + 2 :]]),
-        }
-
-        return {
-            "league_id": league_id,
-            "scoring_type": league.scoring_type or "ppr",
-            "team_count": league.team_count or 12,
-            "current_week": current_week,
-            "trade_deadline_weeks": trade_deadline_weeks,
-            "playoff_race": playoff_race,
-            "is_dynasty": league.league_type == "dynasty",
-            "playoff_teams": playoff_spots,
-        }
+        return league_context_cache.get(self.db, league_id).settings()
 
     def _get_team_context(self, team_id: int, league_context: Dict) -> Dict[str, Any]:
         """Get comprehensive team context for evaluation"""
-        team = self.db.query(FantasyTeam).filter(FantasyTeam.id == team_id).first()
-
-        # Get recent team needs analysis
-        needs_analysis = (
-            self.db.query(TeamNeedsAnalysis)
-            .filter(
-                and_(
-                    TeamNeedsAnalysis.team_id == team_id,
-                    TeamNeedsAnalysis.week <= league_context["current_week"],
-                )
-            )
-            .order_by(desc(TeamNeedsAnalysis.week))
-            .first()
-        )
-
-        # Calculate team standing
-        all_teams = (
-            self.db.query(FantasyTeam)
-            .filter(FantasyTeam.league_id == team.league_id)
-            .all()
+        league = league_context_cache.get(
+            self.db, league_context["league_id"], league_context["current_week"]
         )
-
-        sorted_teams = sorted(all_teams, key=lambda t: (-t.wins, -t.points_for))
-        team_rank = next(i for i, t in enumerate(sorted_teams, 1) if t.id == team_id)
+        team = league.team(team_id)
+        if team is None:
+            raise ValueError(f"Team {team_id} is not in league {league.league_id}")
 
         # Determine team strategy
-        playoff_position = team_rank <= league_context["playoff_teams"]
-        championship_contender = team_rank <= 3
-        should_rebuild = team_rank > league_context["team_count"] * 0.75
+        playoff_position = team.rank <= league.playoff_teams
+        championship_contender = team.rank <= 3
+        should_rebuild = team.rank > league.team_count * 0.75
 
         return {
             "team_id": team_id,
             "team_name": team.name,
             "wins": team.wins,
             "losses": team.losses,
-            "points_for": float(team.points_for) if team.points_for else 0,
-            "points_against": float(team.points_against) if team.points_against else 0,
-            "team_rank": team_rank,
+            "points_for": team.points_for,
+            "points_against": team.points_against,
+            "team_rank": team.rank,
             "playoff_position": playoff_position,
             "championship_contender": championship_contender,
             "should_rebuild": should_rebuild,
-            "needs_analysis": needs_analysis.__dict__ if needs_analysis else {},
+            "needs_analysis": dict(team.needs) if team.needs else {},
             "record_trend": self._calculate_recent_performance(team_id),
+            "roster_composition": self._get_roster_composition(team),
         }
 
     def _calculate_recent_performance(self, team_id: int) -> str:
@@ -1052,7 +1089,7 @@ class TradeAnalyzerService:
         """Analyze impact on overall roster construction"""
 
         # Get current roster composition
-        current_roster = self._get_roster_composition(team_id)
+        current_roster = team_context["roster_composition"]
 
         # Calculate age impact
         age_impact = self._calculate_age_impact(gives, receives)
@@ -1073,24 +1110,12 @@ class TradeAnalyzerService:
             ),
         }
 
-    def _get_roster_composition(self, team_id: int) -> Dict[str, Any]:
+    def _get_roster_composition(self, team: TeamSnapshot) -> Dict[str, Any]:
         """Get current team roster composition analysis"""
         # Simplified roster analysis
-        roster_spots = (
-            self.db.query(FantasyRosterSpot)
-            .filter(FantasyRosterSpot.team_id == team_id)
-            .all()
-        )
-
-        position_counts = {}
-        for spot in roster_spots:
-            if spot.player:
-                pos = spot.player.position
-                position_counts[pos] = position_counts.get(pos, 0) + 1
-
         return {
-            "position_counts": position_counts,
-            "total_players": len(roster_spots),
+            "position_counts": team.position_counts(),
+            "total_players": len(team.players),
             "roster_strength_score": 7.5,  # Would calculate based on player values
         }
 
@@ -1250,6 +1275,22 @@ class TradeAnalyzerService:
         else:
             return "Competitive mode: balance present and future, make incremental improvements"
 
+    def _simulate_trade_outlook(self, trade: Trade) -> Optional[Dict[str, Any]]:
+        """Season simulations before and after a trade, or None if they fail"""
+        from app.services.season_simulator import SeasonSimulator
+
+        try:
+            return SeasonSimulator(self.db).trade_odds(
+                trade.league_id,
+                trade.team1_id,
+                trade.team2_id,
+                (trade.team1_gives or {}).get("players", []),
+                (trade.team2_gives or {}).get("players", []),
+            )
+        except Exception as e:
+            logger.warning(f"Season simulation failed for trade {trade.id}: {e}")
+            return None
+
     def _calculate_championship_impact(
         self,
         team_id: int,
@@ -1259,10 +1300,29 @@ class TradeAnalyzerService:
         league_context: Dict,
     ) -> Dict[str, float]:
         """Calculate impact on championship probability"""
+        outlook = league_context.get("season_outlook")
+        if outlook and team_id in outlook["before"]:
+            before = outlook["before"][team_id]
+            after = outlook["after"][team_id]
+            probability_change = (
+                after["championship_odds"] - before["championship_odds"]
+            )
+            return {
+                "current_championship_odds": round(before["championship_odds"], 3),
+                "projected_championship_odds": round(after["championship_odds"], 3),
+                "championship_probability_change": round(probability_change, 3),
+                "current_playoff_odds": round(before["playoff_odds"], 3),
+                "projected_playoff_odds": round(after["playoff_odds"], 3),
+                "playoff_probability_change": round(
+                    after["playoff_odds"] - before["playoff_odds"], 3
+                ),
+                "simulations": outlook["simulations"],
+                "championship_impact_description": self._describe_championship_impact(
+                    probability_change
+                ),
+            }
 
-        # This would integrate with more sophisticated modeling
-        # Simplified calculation for now
-
+        # Without a simulation, estimate from standing and trade value
         base_championship_odds = self._estimate_championship_odds(team_context)
 
         # Calculate value difference
@@ -1759,31 +1819,47 @@ class TradeAnalyzerService:
     # ============================================================================
 
     async def get_comprehensive_team_analytics(
-        self, team_id: int, season: int = 2025
+        self, team_id: int, season: int = 2025, through_week: int = ANALYSIS_WEEKS
     ) -> Dict[str, Any]:
-        """Get comprehensive analytics for team analysis"""
+        """
+        Get comprehensive analytics for team analysis
+
+        The roster's analytics are read in one query and every section is
+        computed from them. Reports are cached until the roster changes or
+        analytics are ingested.
+        """
         try:
-            # Get team roster
-            roster_spots = (
-                self.db.query(FantasyRosterSpot)
-                .filter(FantasyRosterSpot.team_id == team_id)
-                .all()
+            signature = roster_signature(self.db, team_id)
+            cached = team_analytics_cache.get_team(
+                team_id, season, through_week, signature
+            )
+            if cached is not None:
+                return cached
+
+            generation = team_analytics_cache.generation
+            frame = load_roster_frame(
+                self.db,
+                team_id,
+                season,
+                through_week,
+                player_ids=[player_id for _, player_id in signature],
+            )
+            benchmarks = team_analytics_cache.league_benchmarks(
+                self.db, season, through_week
             )
-
-            players = [spot.player for spot in roster_spots if spot.player]
 
             # Analyze position groups
-            position_analytics = await self._analyze_position_groups(players, season)
+            position_analytics = self._analyze_position_groups(frame)
 
             # Calculate team consistency scores
-            team_consistency = await self._calculate_team_consistency(players, season)
+            team_consistency = self._calculate_team_consistency(frame)
 
             # Analyze usage distribution
-            usage_distribution = await self._analyze_usage_distribution(players, season)
+            usage_distribution = self._analyze_usage_distribution(frame)
 
             # Calculate efficiency benchmarks
-            efficiency_benchmarks = await self._calculate_efficiency_benchmarks(
-                players, season
+            efficiency_benchmarks = self._calculate_efficiency_benchmarks(
+                frame, benchmarks
             )
 
             # Identify team strengths and weaknesses
@@ -1791,7 +1867,7 @@ class TradeAnalyzerService:
                 position_analytics, team_consistency, efficiency_benchmarks
             )
 
-            return {
+            analytics = {
                 "team_id": team_id,
                 "season": season,
                 "position_analytics": position_analytics,
@@ -1804,25 +1880,23 @@ class TradeAnalyzerService:
                 ),
                 "analytics_updated": datetime.now().isoformat(),
             }
+            team_analytics_cache.put_team(
+                team_id, season, through_week, signature, analytics, generation
+            )
+            return analytics
 
         except Exception as e:
             print(f"Error in get_comprehensive_team_analytics: {str(e)}")
             return {}
 
-    async def _analyze_position_groups(
-        self, players: List[FantasyPlayer], season: int
-    ) -> Dict[str, Any]:
+    def _analyze_position_groups(self, frame: RosterFrame) -> Dict[str, Any]:
         """Analyze each position group's performance and depth"""
-        from app.services.player_analytics_service import PlayerAnalyticsService
-
-        analytics_service = PlayerAnalyticsService(self.db)
-
         position_groups = {"QB": [], "RB": [], "WR": [], "TE": [], "K": [], "DEF": []}
 
         # Group players by position
-        for player in players:
-            if player.position and player.position.value in position_groups:
-                position_groups[player.position.value].append(player)
+        for player in frame.players:
+            if player.position in position_groups:
+                position_groups[player.position].append(player)
 
         position_analytics = {}
 
@@ -1844,44 +1918,36 @@ class TradeAnalyzerService:
             top_performers = []
 
             for player in pos_players:
-                # Get recent analytics data
-                recent_weeks = list(range(1, 13))  # First 12 weeks
-                analytics = await analytics_service.get_player_analytics(
-                    player.id, recent_weeks, season
-                )
-
-                if analytics:
-                    # Calculate efficiency metrics
-                    points = [a["ppr_points"] for a in analytics if a["ppr_points"]]
-                    if points:
-                        avg_points = sum(points) / len(points)
-                        efficiency_scores.append(avg_points)
-
-                        # Calculate consistency (inverse of standard deviation)
-                        if len(points) > 1:
-                            std_dev = statistics.stdev(points)
-                            consistency = max(
-                                0, 100 - (std_dev * 5)
-                            )  # Convert to 0-100 scale
-                            consistency_scores.append(consistency)
-
-                        # Identify top performers (above position average)
-                        if position == "QB" and avg_points > 18:
-                            top_performers.append(
-                                {"name": player.name, "avg_points": avg_points}
-                            )
-                        elif position == "RB" and avg_points > 12:
-                            top_performers.append(
-                                {"name": player.name, "avg_points": avg_points}
-                            )
-                        elif position == "WR" and avg_points > 10:
-                            top_performers.append(
-                                {"name": player.name, "avg_points": avg_points}
-                            )
-                        elif position == "TE" and avg_points > 8:
-                            top_performers.append(
-                                {"name": player.name, "avg_points": avg_points}
-                            )
+                points = [g["ppr_points"] for g in player.games if g["ppr_points"]]
+                if points:
+                    avg_points = sum(points) / len(points)
+                    efficiency_scores.append(avg_points)
+
+                    # Calculate consistency (inverse of standard deviation)
+                    if len(points) > 1:
+                        std_dev = statistics.stdev(points)
+                        consistency = max(
+                            0, 100 - (std_dev * 5)
+                        )  # Convert to 0-100 scale
+                        consistency_scores.append(consistency)
+
+                    # Identify top performers (above position average)
+                    if position == "QB" and avg_points > 18:
+                        top_performers.append(
+                            {"name": player.name, "avg_points": avg_points}
+                        )
+                    elif position == "RB" and avg_points > 12:
+                        top_performers.append(
+                            {"name": player.name, "avg_points": avg_points}
+                        )
+                    elif position == "WR" and avg_points > 10:
+                        top_performers.append(
+                            {"name": player.name, "avg_points": avg_points}
+                        )
+                    elif position == "TE" and avg_points > 8:
+                        top_performers.append(
+                            {"name": player.name, "avg_points": avg_points}
+                        )
 
             # Calculate position group metrics
             avg_efficiency = (
@@ -1919,38 +1985,26 @@ class TradeAnalyzerService:
 
         return position_analytics
 
-    async def _calculate_team_consistency(
-        self, players: List[FantasyPlayer], season: int
-    ) -> Dict[str, Any]:
+    def _calculate_team_consistency(self, frame: RosterFrame) -> Dict[str, Any]:
         """Calculate overall team consistency metrics"""
-        from app.services.player_analytics_service import PlayerAnalyticsService
-
-        analytics_service = PlayerAnalyticsService(self.db)
-
         all_weekly_scores = []
         position_consistency = {}
 
-        for player in players:
-            recent_weeks = list(range(1, 13))
-            analytics = await analytics_service.get_player_analytics(
-                player.id, recent_weeks, season
-            )
+        for player in frame.players:
+            points = [g["ppr_points"] for g in player.games if g["ppr_points"]]
 
-            if analytics:
-                points = [a["ppr_points"] for a in analytics if a["ppr_points"]]
+            if len(points) > 1:
+                # Add to overall team variance calculation
+                all_weekly_scores.extend(points)
 
-                if points and len(points) > 1:
-                    # Add to overall team variance calculation
-                    all_weekly_scores.extend(points)
+                # Position-specific consistency
+                position = player.position or "Unknown"
+                if position not in position_consistency:
+                    position_consistency[position] = []
 
-                    # Position-specific consistency
-                    position = player.position.value if player.position else "Unknown"
-                    if position not in position_consistency:
-                        position_consistency[position] = []
-
-                    std_dev = statistics.stdev(points)
-                    consistency_score = max(0, 100 - (std_dev * 5))
-                    position_consistency[position].append(consistency_score)
+                std_dev = statistics.stdev(points)
+                consistency_score = max(0, 100 - (std_dev * 5))
+                position_consistency[position].append(consistency_score)
 
         # Calculate overall team consistency
         overall_consistency = 0
@@ -1980,58 +2034,44 @@ class TradeAnalyzerService:
             ),
         }
 
-    async def _analyze_usage_distribution(
-        self, players: List[FantasyPlayer], season: int
-    ) -> Dict[str, Any]:
+    def _analyze_usage_distribution(self, frame: RosterFrame) -> Dict[str, Any]:
         """Analyze how usage is distributed across the team"""
-        from app.services.player_analytics_service import PlayerAnalyticsService
-
-        analytics_service = PlayerAnalyticsService(self.db)
-
         player_usage = []
         total_team_points = 0
 
-        for player in players:
-            recent_weeks = list(range(1, 13))
-            analytics = await analytics_service.get_player_analytics(
-                player.id, recent_weeks, season
-            )
-
-            if analytics:
-                points = [a["ppr_points"] for a in analytics if a["ppr_points"]]
-                snap_percentages = [
-                    a["snap_percentage"] for a in analytics if a["snap_percentage"]
-                ]
-                target_shares = [
-                    a["target_share"] for a in analytics if a["target_share"]
-                ]
-
-                if points:
-                    avg_points = sum(points) / len(points)
-                    avg_snap_pct = (
-                        sum(snap_percentages) / len(snap_percentages)
-                        if snap_percentages
-                        else 0
-                    )
-                    avg_target_share = (
-                        sum(target_shares) / len(target_shares) if target_shares else 0
-                    )
+        for player in frame.players:
+            points = [g["ppr_points"] for g in player.games if g["ppr_points"]]
+            snap_percentages = [
+                g["snap_percentage"] for g in player.games if g["snap_percentage"]
+            ]
+            target_shares = [
+                g["target_share"] for g in player.games if g["target_share"]
+            ]
+
+            if points:
+                avg_points = sum(points) / len(points)
+                avg_snap_pct = (
+                    sum(snap_percentages) / len(snap_percentages)
+                    if snap_percentages
+                    else 0
+                )
+                avg_target_share = (
+                    sum(target_shares) / len(target_shares) if target_shares else 0
+                )
 
-                    player_usage.append(
-                        {
-                            "player_name": player.name,
-                            "position": (
-                                player.position.value if player.position else "Unknown"
-                            ),
-                            "avg_points": avg_points,
-                            "avg_snap_percentage": avg_snap_pct,
-                            "avg_target_share": avg_target_share
-                            * 100,  # Convert to percentage
-                            "total_points": sum(points),
-                        }
-                    )
+                player_usage.append(
+                    {
+                        "player_name": player.name,
+                        "position": player.position or "Unknown",
+                        "avg_points": avg_points,
+                        "avg_snap_percentage": avg_snap_pct,
+                        "avg_target_share": avg_target_share
+                        * 100,  # Convert to percentage
+                        "total_points": sum(points),
+                    }
+                )
 
-                    total_team_points += sum(points)
+                total_team_points += sum(points)
 
         # Calculate concentration metrics
         if player_usage:
@@ -2073,57 +2113,29 @@ class TradeAnalyzerService:
             "team_dependencies": self._identify_team_dependencies(player_usage),
         }
 
-    async def _calculate_efficiency_benchmarks(
-        self, players: List[FantasyPlayer], season: int
+    def _calculate_efficiency_benchmarks(
+        self, frame: RosterFrame, league_benchmarks: Dict[str, float]
     ) -> Dict[str, Any]:
         """Calculate efficiency benchmarks compared to league averages"""
-        from app.services.player_analytics_service import PlayerAnalyticsService
-
-        analytics_service = PlayerAnalyticsService(self.db)
-
-        position_efficiency = {"QB": [], "RB": [], "WR": [], "TE": []}
-
-        for player in players:
-            if player.position and player.position.value in position_efficiency:
-                recent_weeks = list(range(1, 13))
-                analytics = await analytics_service.get_player_analytics(
-                    player.id, recent_weeks, season
-                )
-
-                if analytics:
-                    # Calculate various efficiency metrics
-                    efficiency_metrics = []
-
-                    for week_data in analytics:
-                        if week_data.get("ppr_points") and week_data.get(
-                            "snap_percentage"
-                        ):
-                            points_per_snap = week_data["ppr_points"] / (
-                                week_data["snap_percentage"] / 100
-                            )
-                            efficiency_metrics.append(points_per_snap)
-
-                    if efficiency_metrics:
-                        avg_efficiency = sum(efficiency_metrics) / len(
-                            efficiency_metrics
-                        )
-                        position_efficiency[player.position.value].append(
-                            avg_efficiency
-                        )
-
-        # Compare to league benchmarks (simplified)
-        league_benchmarks = {
-            "QB": 0.35,  # Points per snap
-            "RB": 0.25,
-            "WR": 0.20,
-            "TE": 0.15,
-        }
+        position_efficiency = {position: [] for position in BENCHMARK_POSITIONS}
+
+        for player in frame.players:
+            if player.position in position_efficiency:
+                # Points per full game of snaps, week by week
+                efficiency_metrics = [
+                    efficiency
+                    for efficiency in map(points_per_snap, player.games)
+                    if efficiency is not None
+                ]
+                if efficiency_metrics:
+                    avg_efficiency = sum(efficiency_metrics) / len(efficiency_metrics)
+                    position_efficiency[player.position].append(avg_efficiency)
 
         efficiency_comparison = {}
         for position, efficiencies in position_efficiency.items():
-            if efficiencies:
+            league_avg = league_benchmarks.get(position)
+            if efficiencies and league_avg:
                 team_avg = sum(efficiencies) / len(efficiencies)
-                league_avg = league_benchmarks[position]
 
                 efficiency_comparison[position] = {
                     "team_average": round(team_avg, 3),
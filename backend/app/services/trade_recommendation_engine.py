@@ -2,7 +2,7 @@
 Trade Recommendation Engine - AI-powered trade suggestion system
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Mapping, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, func, not_
 from datetime import datetime, timedelta
@@ -24,6 +24,12 @@ from app.models.fantasy_models import (
     DraftPick,
 )
 from app.models.database_models import SleeperRoster, SleeperPlayer, SleeperLeague
+from app.services.league_context import (
+    ContextPick,
+    LeagueContext,
+    TeamSnapshot,
+    league_context_cache,
+)
 from app.services.trade_analyzer_service import TradeAnalyzerService
 
 logger = logging.getLogger(__name__)
@@ -54,26 +60,13 @@ class TradeRecommendationEngine:
             )
 
             # Validate team and league
-            team = (
-                self.db.query(FantasyTeam)
-                .filter(
-                    and_(FantasyTeam.id == team_id, FantasyTeam.league_id == league_id)
-                )
-                .first()
-            )
-
-            if not team:
+            league = league_context_cache.get(self.db, league_id)
+            if not league.team(team_id):
                 logger.info(
                     f"No FantasyTeam found with id={team_id}, league_id={league_id}"
                 )
-                # Check what teams exist
-                all_teams = (
-                    self.db.query(FantasyTeam)
-                    .filter(FantasyTeam.league_id == league_id)
-                    .all()
-                )
                 logger.info(
-                    f"Available teams in league {league_id}: {[(t.id, t.name) for t in all_teams]}"
+                    f"Available teams in league {league_id}: {[(t.team_id, t.name) for t in league.teams]}"
                 )
                 return []
 
@@ -191,17 +184,11 @@ class TradeRecommendationEngine:
                 target_teams = [target_team_id]
             else:
                 # Get all other teams in league
-                target_teams = (
-                    self.db.query(FantasyTeam.id)
-                    .filter(
-                        and_(
-                            FantasyTeam.league_id == league_id,
-                            FantasyTeam.id != team_id,
-                        )
-                    )
-                    .all()
-                )
-                target_teams = [t[0] for t in target_teams]
+                target_teams = [
+                    team.team_id
+                    for team in league_context_cache.get(self.db, league_id).teams
+                    if team.team_id != team_id
+                ]
 
             mutual_benefit_trades = []
 
@@ -246,31 +233,20 @@ class TradeRecommendationEngine:
         self, team_id: int, league_id: int
     ) -> Dict[str, Any]:
         """Get comprehensive team context for trade recommendations"""
-        team = self.db.query(FantasyTeam).filter(FantasyTeam.id == team_id).first()
-
-        # Get roster composition
-        roster_spots = (
-            self.db.query(FantasyRosterSpot)
-            .filter(FantasyRosterSpot.team_id == team_id)
-            .all()
-        )
+        league = league_context_cache.get(self.db, league_id)
+        team = league.team(team_id)
+        if team is None:
+            raise ValueError(f"Team {team_id} is not in league {league_id}")
 
         # Group players by position
         roster_by_position = defaultdict(list)
         all_players = []
 
         # Primary data source: fantasy_roster_spots
-        for spot in roster_spots:
-            if spot.player:
-                player_data = {
-                    "id": spot.player.id,
-                    "name": spot.player.name,
-                    "position": spot.player.position,
-                    "team": spot.player.team,
-                    "age": spot.player.age,
-                }
-                roster_by_position[spot.player.position].append(player_data)
-                all_players.append(player_data)
+        for player in team.players:
+            player_data = player.to_dict()
+            roster_by_position[player.position].append(player_data)
+            all_players.append(player_data)
 
         # Fallback: Use Sleeper roster data if fantasy_roster_spots is empty
         if not all_players:
@@ -286,34 +262,28 @@ class TradeRecommendationEngine:
                     roster_by_position[player_data["position"]].append(player_data)
                     all_players.append(player_data)
 
-        # Get team needs analysis
-        needs_analysis = (
-            self.db.query(TeamNeedsAnalysis)
-            .filter(TeamNeedsAnalysis.team_id == team_id)
-            .order_by(desc(TeamNeedsAnalysis.week))
-            .first()
-        )
-
         # Calculate position strengths and needs
         position_strength = self._calculate_position_strengths(
-            team_id, roster_by_position
+            team_id, roster_by_position, league
         )
         position_needs = self._identify_position_needs(
-            team_id, position_strength, needs_analysis
+            team_id, position_strength, team.needs
         )
 
         # Get tradeable assets
-        tradeable_players = self._get_tradeable_players(team_id, roster_by_position)
-        tradeable_picks = self._get_tradeable_picks(team_id, league_id)
+        tradeable_players = self._get_tradeable_players(
+            team_id, roster_by_position, league
+        )
+        tradeable_picks = self._get_tradeable_picks(team)
 
         # Calculate team's competitive stance
-        competitive_analysis = self._analyze_competitive_stance(team, league_id)
+        competitive_analysis = self._analyze_competitive_stance(team, league)
 
         return {
             "team_id": team_id,
             "team_name": team.name,
             "record": {"wins": team.wins, "losses": team.losses},
-            "points_for": float(team.points_for) if team.points_for else 0,
+            "points_for": team.points_for,
             "roster_by_position": dict(roster_by_position),
             "all_players": all_players,
             "position_strength": position_strength,
@@ -321,7 +291,7 @@ class TradeRecommendationEngine:
             "tradeable_players": tradeable_players,
             "tradeable_picks": tradeable_picks,
             "competitive_analysis": competitive_analysis,
-            "needs_analysis": needs_analysis.__dict__ if needs_analysis else {},
+            "needs_analysis": dict(team.needs) if team.needs else {},
             "surplus_positions": self._identify_surplus_positions(position_strength),
             "trade_preferences": self._determine_trade_preferences(
                 competitive_analysis
@@ -330,25 +300,13 @@ class TradeRecommendationEngine:
 
     def _get_league_context(self, league_id: int) -> Dict[str, Any]:
         """Get league context for recommendations"""
-        league = (
-            self.db.query(FantasyLeague).filter(FantasyLeague.id == league_id).first()
-        )
-
-        current_week = 8  # Would get from NFL schedule service
-        trade_deadline_weeks = max(0, 10 - current_week)
-
-        return {
-            "league_id": league_id,
-            "scoring_type": league.scoring_type or "ppr",
-            "team_count": league.team_count or 12,
-            "current_week": current_week,
-            "trade_deadline_weeks": trade_deadline_weeks,
-            "is_dynasty": league.league_type == "dynasty",
-            "playoff_teams": league.playoff_teams or 6,
-        }
+        return league_context_cache.get(self.db, league_id).settings()
 
     def _calculate_position_strengths(
-        self, team_id: int, roster_by_position: Dict
+        self,
+        team_id: int,
+        roster_by_position: Dict,
+        league: Optional[LeagueContext] = None,
     ) -> Dict[str, float]:
         """Calculate strength scores for each position"""
         position_strengths = {}
@@ -361,7 +319,9 @@ class TradeRecommendationEngine:
             # Get player values for this position
             player_values = []
             for player in players:
-                value = self._get_player_positional_value(player["id"], position)
+                value = self._get_player_positional_value(
+                    player["id"], position, league
+                )
                 print(
                     f"DEBUG: Player {player.get('name', 'Unknown')} ({position}) strength value: {value}"
                 )
@@ -386,25 +346,36 @@ class TradeRecommendationEngine:
 
         return position_strengths
 
-    def _get_player_positional_value(self, player_id: int, position: str) -> float:
-        """Get player's positional value score using Sleeper data"""
-        # Check PlayerValue table first
-        player_value = (
-            self.db.query(PlayerValue)
-            .filter(PlayerValue.player_id == player_id)
-            .order_by(desc(PlayerValue.week))
-            .first()
-        )
+    def _get_player_positional_value(
+        self, player_id: int, position: str, league: Optional[LeagueContext] = None
+    ) -> float:
+        """
+        Get player's positional value score using Sleeper data
+
+        Players on the league snapshot's rosters are valued without queries.
+        """
+        if league is not None and league.owner_of(player_id):
+            if player_id in league.player_values:
+                return league.player_values[player_id]
+            sleeper_player = league.sleeper_players.get(str(player_id))
+        else:
+            # Check PlayerValue table first
+            player_value = (
+                self.db.query(PlayerValue)
+                .filter(PlayerValue.player_id == player_id)
+                .order_by(desc(PlayerValue.week))
+                .first()
+            )
 
-        if player_value and player_value.rest_of_season_value:
-            return player_value.rest_of_season_value
+            if player_value and player_value.rest_of_season_value:
+                return player_value.rest_of_season_value
 
-        # Use Sleeper player data for realistic values
-        sleeper_player = (
-            self.db.query(SleeperPlayer)
-            .filter(SleeperPlayer.sleeper_player_id == str(player_id))
-            .first()
-        )
+            # Use Sleeper player data for realistic values
+            sleeper_player = (
+                self.db.query(SleeperPlayer)
+                .filter(SleeperPlayer.sleeper_player_id == str(player_id))
+                .first()
+            )
 
         if sleeper_player:
             return self._calculate_realistic_player_value(sleeper_player)
@@ -480,7 +451,10 @@ class TradeRecommendationEngine:
         return round(final_value, 1)
 
     def _identify_position_needs(
-        self, team_id: int, position_strengths: Dict, needs_analysis: Any
+        self,
+        team_id: int,
+        position_strengths: Dict,
+        needs_analysis: Optional[Mapping[str, Any]],
     ) -> Dict[str, int]:
         """Identify position needs (0-5 scale)"""
         position_needs = {}
@@ -505,15 +479,18 @@ class TradeRecommendationEngine:
             position_needs[position] = need_level
 
         # Add needs from team analysis if available
-        if needs_analysis and hasattr(needs_analysis, "position_needs"):
-            stored_needs = needs_analysis.position_needs or {}
+        if needs_analysis:
+            stored_needs = needs_analysis.get("position_needs") or {}
             for pos, need in stored_needs.items():
                 position_needs[pos] = max(position_needs.get(pos, 0), need)
 
         return position_needs
 
     def _get_tradeable_players(
-        self, team_id: int, roster_by_position: Dict
+        self,
+        team_id: int,
+        roster_by_position: Dict,
+        league: Optional[LeagueContext] = None,
     ) -> Dict[str, List[Dict]]:
         """Identify players that could be traded away"""
         tradeable = {"surplus": [], "expendable": [], "valuable": []}
@@ -525,7 +502,9 @@ class TradeRecommendationEngine:
             # Sort players by value
             player_values = []
             for player in players:
-                value = self._get_player_positional_value(player["id"], position)
+                value = self._get_player_positional_value(
+                    player["id"], position, league
+                )
                 player_values.append((player, value))
 
             sorted_players = sorted(player_values, key=lambda x: x[1], reverse=True)
@@ -546,23 +525,10 @@ class TradeRecommendationEngine:
 
         return tradeable
 
-    def _get_tradeable_picks(
-        self, team_id: int, league_id: int
-    ) -> List[Dict[str, Any]]:
+    def _get_tradeable_picks(self, team: TeamSnapshot) -> List[Dict[str, Any]]:
         """Get tradeable draft picks for team"""
-        picks = (
-            self.db.query(DraftPick)
-            .filter(
-                and_(
-                    DraftPick.current_owner_team_id == team_id,
-                    DraftPick.is_tradeable == True,
-                )
-            )
-            .all()
-        )
-
         tradeable_picks = []
-        for pick in picks:
+        for pick in team.picks:
             pick_value = self._calculate_pick_trade_value(pick)
             tradeable_picks.append(
                 {
@@ -576,7 +542,7 @@ class TradeRecommendationEngine:
 
         return tradeable_picks
 
-    def _calculate_pick_trade_value(self, pick: DraftPick) -> float:
+    def _calculate_pick_trade_value(self, pick: ContextPick) -> float:
         """Calculate trade value of a draft pick"""
         base_values = {1: 25.0, 2: 15.0, 3: 8.0, 4: 4.0}
         base_value = base_values.get(pick.round_number, 2.0)
@@ -590,78 +556,30 @@ class TradeRecommendationEngine:
         return base_value
 
     def _analyze_competitive_stance(
-        self, team: FantasyTeam, league_id: int
+        self, team: TeamSnapshot, league: LeagueContext
     ) -> Dict[str, Any]:
         """Analyze team's competitive position and strategy"""
-        # Get all teams for comparison
-        all_teams = (
-            self.db.query(FantasyTeam).filter(FantasyTeam.league_id == league_id).all()
-        )
-
-        # Try to get real data from Sleeper rosters first (current season for this user)
-        # Find the most recent league for the user that matches this platform_league_id pattern
-        sleeper_league = (
-            self.db.query(SleeperLeague)
-            .filter(SleeperLeague.sleeper_league_id == team.platform_league_id)
-            .order_by(SleeperLeague.season.desc())
-            .first()
-        )
-
-        if sleeper_league:
-            sleeper_rosters = (
-                self.db.query(SleeperRoster)
-                .filter(SleeperRoster.league_id == sleeper_league.id)
-                .all()
-            )
-
-            # Map fantasy teams to sleeper rosters
-            team_stats = {}
-            for roster in sleeper_rosters:
-                fantasy_team = next(
-                    (
-                        t
-                        for t in all_teams
-                        if str(t.platform_team_id) == str(roster.sleeper_roster_id)
-                    ),
-                    None,
-                )
-                if fantasy_team:
-                    team_stats[fantasy_team.id] = {
-                        "wins": roster.wins or 0,
-                        "losses": roster.losses or 0,
-                        "points_for": roster.points_for or 0,
-                    }
+        # Prefer records from the league's synced Sleeper rosters
+        team_stats = {
+            t.team_id: t.sleeper_record for t in league.teams if t.sleeper_record
+        }
 
-            # Use Sleeper data if available
-            if team_stats:
-                sorted_teams = sorted(
-                    all_teams,
-                    key=lambda t: (
-                        -team_stats.get(t.id, {}).get("wins", 0),
-                        -team_stats.get(t.id, {}).get("points_for", 0),
-                    ),
-                )
-                team_rank = next(
-                    i for i, t in enumerate(sorted_teams, 1) if t.id == team.id
-                )
-            else:
-                # Fallback to database values
-                sorted_teams = sorted(
-                    all_teams, key=lambda t: (-t.wins, -float(t.points_for or 0))
-                )
-                team_rank = next(
-                    i for i, t in enumerate(sorted_teams, 1) if t.id == team.id
-                )
-        else:
-            # Fallback to database values
+        if team_stats:
             sorted_teams = sorted(
-                all_teams, key=lambda t: (-t.wins, -float(t.points_for or 0))
-            )
-            team_rank = next(
-                i for i, t in enumerate(sorted_teams, 1) if t.id == team.id
+                league.teams,
+                key=lambda t: (
+                    -team_stats.get(t.team_id, {}).get("wins", 0),
+                    -team_stats.get(t.team_id, {}).get("points_for", 0),
+                ),
             )
+        else:
+            # Fallback to database values; the snapshot is in standings order
+            sorted_teams = league.teams
+        team_rank = next(
+            i for i, t in enumerate(sorted_teams, 1) if t.team_id == team.team_id
+        )
 
-        total_teams = len(all_teams)
+        total_teams = len(league.teams)
         playoff_cutoff = 6  # Default playoff teams
 
         return {
@@ -674,10 +592,8 @@ class TradeRecommendationEngine:
             "competitive_tier": self._determine_competitive_tier(
                 team_rank, total_teams
             ),
-            "team_stats": (
-                team_stats.get(team.id, {"wins": 0, "losses": 0, "points_for": 0})
-                if "team_stats" in locals()
-                else {"wins": 0, "losses": 0, "points_for": 0}
+            "team_stats": dict(
+                team_stats.get(team.team_id, {"wins": 0, "losses": 0, "points_for": 0})
             ),
         }
 
@@ -1154,19 +1070,14 @@ class TradeRecommendationEngine:
         teams_with_surplus = {}
 
         # Get all teams in league except ours
-        teams = (
-            self.db.query(FantasyTeam)
-            .filter(
-                and_(
-                    FantasyTeam.league_id == league_id,
-                    FantasyTeam.id != exclude_team_id,
-                )
-            )
-            .all()
-        )
+        teams = [
+            team
+            for team in league_context_cache.get(self.db, league_id).teams
+            if team.team_id != exclude_team_id
+        ]
 
         for team in teams:
-            team_context = self._get_comprehensive_team_context(team.id, league_id)
+            team_context = self._get_comprehensive_team_context(team.team_id, league_id)
 
             # Check if they have surplus at this position
             surplus_players = [
@@ -1177,26 +1088,15 @@ class TradeRecommendationEngine:
             ]
 
             if surplus_players:
-                teams_with_surplus[team.id] = surplus_players
+                teams_with_surplus[team.team_id] = surplus_players
 
         return teams_with_surplus
 
     def _find_player_owner(self, player_id: int, league_id: int) -> Optional[Dict]:
         """Find which team owns a specific player"""
-        roster_spot = (
-            self.db.query(FantasyRosterSpot)
-            .join(FantasyTeam)
-            .filter(
-                and_(
-                    FantasyRosterSpot.player_id == player_id,
-                    FantasyTeam.league_id == league_id,
-                )
-            )
-            .first()
-        )
-
-        if roster_spot:
-            return {"team_id": roster_spot.team_id, "team_name": roster_spot.team.name}
+        owner = league_context_cache.get(self.db, league_id).owner_of(player_id)
+        if owner:
+            return {"team_id": owner.team_id, "team_name": owner.name}
         return None
 
     def _find_teams_interested_in_player(
@@ -1206,25 +1106,20 @@ class TradeRecommendationEngine:
         interested_teams = []
 
         # Get all other teams
-        teams = (
-            self.db.query(FantasyTeam)
-            .filter(
-                and_(
-                    FantasyTeam.league_id == league_id,
-                    FantasyTeam.id != exclude_team_id,
-                )
-            )
-            .all()
-        )
+        teams = [
+            team
+            for team in league_context_cache.get(self.db, league_id).teams
+            if team.team_id != exclude_team_id
+        ]
 
         for team in teams:
-            team_context = self._get_comprehensive_team_context(team.id, league_id)
+            team_context = self._get_comprehensive_team_context(team.team_id, league_id)
 
             # Check if they need this position
             position_need = team_context["position_needs"].get(player.position, 0)
 
             if position_need >= 3:  # High need
-                interested_teams.append(team.id)
+                interested_teams.append(team.team_id)
 
         return interested_teams
 
@@ -1234,19 +1129,14 @@ class TradeRecommendationEngine:
         """Find players available for depth trades"""
         candidates = []
 
-        teams = (
-            self.db.query(FantasyTeam)
-            .filter(
-                and_(
-                    FantasyTeam.league_id == league_id,
-                    FantasyTeam.id != exclude_team_id,
-                )
-            )
-            .all()
-        )
+        teams = [
+            team
+            for team in league_context_cache.get(self.db, league_id).teams
+            if team.team_id != exclude_team_id
+        ]
 
         for team in teams:
-            team_context = self._get_comprehensive_team_context(team.id, league_id)
+            team_context = self._get_comprehensive_team_context(team.team_id, league_id)
 
             # Get expendable players at this position
             expendable = [
@@ -1256,7 +1146,7 @@ class TradeRecommendationEngine:
             ]
 
             for player in expendable:
-                candidates.append({**player, "owner_team_id": team.id})
+                candidates.append({**player, "owner_team_id": team.team_id})
 
         return candidates
 
@@ -1854,16 +1744,11 @@ class TradeRecommendationEngine:
             )  # Convert to int for database query
 
             # Get all teams except our own
-            other_teams = (
-                self.db.query(FantasyTeam)
-                .filter(
-                    and_(
-                        FantasyTeam.league_id == league_id,
-                        FantasyTeam.id != team_context["team_id"],
-                    )
-                )
-                .all()
-            )
+            other_teams = [
+                team
+                for team in league_context_cache.get(self.db, league_id).teams
+                if team.team_id != team_context["team_id"]
+            ]
 
             logger.info(
                 f"Checking {len(other_teams)} other teams for {position} targets"
@@ -1873,11 +1758,13 @@ class TradeRecommendationEngine:
             best_partner_team_id = None
 
             for other_team in other_teams:
-                logger.info(f"Checking team {other_team.id} for {position} players")
+                logger.info(
+                    f"Checking team {other_team.team_id} for {position} players"
+                )
                 # Get their roster using Sleeper data
-                partner_roster = self._get_sleeper_roster_for_team(other_team.id)
+                partner_roster = self._get_sleeper_roster_for_team(other_team.team_id)
                 if not partner_roster or not partner_roster.get("players"):
-                    logger.info(f"No roster found for team {other_team.id}")
+                    logger.info(f"No roster found for team {other_team.team_id}")
                     continue
 
                 # Find their best player at this position
@@ -1887,7 +1774,7 @@ class TradeRecommendationEngine:
                     if p.get("position") == position
                 ]
                 logger.info(
-                    f"Team {other_team.id} has {len(position_players)} {position} players"
+                    f"Team {other_team.team_id} has {len(position_players)} {position} players"
                 )
 
                 for player in position_players:
@@ -1903,7 +1790,7 @@ class TradeRecommendationEngine:
                         ):
                             best_target = player.copy()
                             best_target["trade_value"] = player_value
-                            best_partner_team_id = other_team.id
+                            best_partner_team_id = other_team.team_id
                             logger.info(
                                 f"New best target: {player.get('full_name', player.get('name', 'Unknown'))} (value: {player_value})"
                             )
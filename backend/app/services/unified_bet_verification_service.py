@@ -5,11 +5,12 @@ Unified Bet Verification Service - THE ONLY SERVICE FOR BET VERIFICATION
    The old bet_verification_service.py has been deprecated.
 
 This service works with the SimpleUnifiedBet model and uses The Odds API for verification:
-1. Fetches pending bets from simple_unified_bets table
-2. Uses odds_api_event_id to get game results from The Odds API
-3. Determines bet outcomes based on real API data using stored enums (no string parsing)
-4. Updates bet statuses and calculates payouts
-5. Handles individual bets, parlays, and live bets uniformly
+1. Fetches scores once per sport with started, pending bets
+2. Keeps a frontier of completed games and only settles games that newly turned final
+3. Loads the pending bets for those games by odds_api_event_id (indexed)
+4. Determines bet outcomes based on real API data using stored enums (no string parsing)
+5. Updates bet statuses and payouts in one bulk UPDATE
+6. Handles individual bets, parlays, and live bets uniformly
 
 Key improvements over old service:
 - No string parsing for bet outcomes (uses TeamSide, OverUnder enums set during bet creation)
@@ -23,20 +24,48 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, bindparam, func, or_, desc, select, update
 
 from app.core.database import SessionLocal
 from app.models.simple_unified_bet_model import SimpleUnifiedBet, TeamSide, OverUnder
 from app.models.database_models import BetStatus, BetType
+from app.services.bet_exposure_service import bet_exposure_service
 from app.services.optimized_odds_api_service import get_optimized_odds_service
+from app.services.parlay_settlement_engine import parlay_settlement_engine
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+# Keep events a little longer than the 3-day scores window so a game that is
+# still returned by the API is never settled twice
+FRONTIER_RETENTION = timedelta(days=4)
+
+# Event ids per IN (...) lookup
+EVENT_BATCH_SIZE = 500
+
+# Columns needed to settle a straight bet (rows are used in place of full bets)
+SETTLEMENT_COLUMNS = (
+    SimpleUnifiedBet.id,
+    SimpleUnifiedBet.odds_api_event_id,
+    SimpleUnifiedBet.bet_type,
+    SimpleUnifiedBet.amount,
+    SimpleUnifiedBet.potential_win,
+    SimpleUnifiedBet.home_team,
+    SimpleUnifiedBet.away_team,
+    SimpleUnifiedBet.selection,
+    SimpleUnifiedBet.team_selection,
+    SimpleUnifiedBet.selected_team_name,
+    SimpleUnifiedBet.spread_value,
+    SimpleUnifiedBet.spread_selection,
+    SimpleUnifiedBet.total_points,
+    SimpleUnifiedBet.over_under_selection,
+)
+
+
 @dataclass
 class UnifiedBetResult:
     """Result of evaluating a unified bet"""
@@ -45,132 +74,94 @@ class UnifiedBetResult:
     status: BetStatus
     result_amount: float
     reasoning: str
+    final_home_score: Optional[int] = None
+    final_away_score: Optional[int] = None
+    game_completed_at: Optional[datetime] = None
+
+
+@dataclass
+class CompletedGame:
+    """Final score of an Odds API event, indexed by team name"""
+
+    event_id: str
+    scores: Dict[str, int]
+    completed_at: Optional[datetime] = None
+
+    @classmethod
+    def from_api(cls, game: Dict) -> Optional["CompletedGame"]:
+        scores = game.get("scores")
+        if not scores or len(scores) < 2:
+            return None
+
+        completed_at = None
+        if game.get("last_update"):
+            try:
+                completed_at = datetime.fromisoformat(
+                    game["last_update"].replace("Z", "+00:00")
+                ).replace(tzinfo=None)
+            except ValueError:
+                pass
+
+        return cls(
+            event_id=game["id"],
+            scores={
+                entry.get("name", ""): (
+                    int(entry["score"]) if entry.get("score") is not None else 0
+                )
+                for entry in scores
+            },
+            completed_at=completed_at,
+        )
 
 
 class UnifiedBetVerificationService:
     """Unified bet verification service for simple_unified_bets table"""
 
-    def __init__(self):
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
         self.odds_service = get_optimized_odds_service(settings.ODDS_API_KEY)
+        self._session_factory = session_factory or SessionLocal
+        # Completed-game frontier: events already settled -> when first seen final
+        self.completed_frontier: Dict[str, datetime] = {}
 
     async def verify_all_pending_bets(self) -> Dict:
         """
-        Main method to verify all pending bets in the unified table
+        Settle pending bets whose games turned final since the last run
+
+        Scores are fetched once per sport that has started, pending bets. Only
+        games that are completed and not yet in the frontier are settled, via
+        an indexed lookup on odds_api_event_id. Parlays are evaluated once with
+        this run's leg results and everything is written in one bulk UPDATE.
         """
         start_time = datetime.now()
         logger.info("🎯 Starting unified bet verification...")
 
-        db = SessionLocal()
+        db = self._session_factory()
         try:
-            # Debug: Check all bets first
-            all_bets = db.query(SimpleUnifiedBet).all()
-            logger.info(f"Total bets in unified table: {len(all_bets)}")
+            now = datetime.utcnow()
+            self._prune_frontier(now)
 
-            for bet in all_bets[:3]:  # Log first 3 for debugging
-                logger.info(
-                    f"Bet {bet.id[:8]}: status={bet.status} ({type(bet.status)}) - {bet.selection}"
-                )
+            newly_completed = await self._fetch_newly_completed_games(db, now)
+            logger.info(f"Found {len(newly_completed)} newly completed games")
 
-            # Get all pending bets from unified table
-            pending_bets = (
-                db.query(SimpleUnifiedBet)
-                .filter(SimpleUnifiedBet.status == BetStatus.PENDING)
-                .all()
+            results, unresolved_events = await self._settle_completed_games(
+                db, newly_completed
             )
+            total_verified = len(results)
 
-            logger.info(f"Found {len(pending_bets)} pending bets to verify")
-
-            if not pending_bets:
-                return {
-                    "success": True,
-                    "message": "No pending bets",
-                    "verified": 0,
-                    "settled": 0,
-                }
-
-            # Group bets by sport for efficient API calls
-            bets_by_sport = {}
-            for bet in pending_bets:
-                sport = bet.sport.lower() if bet.sport else "unknown"
-                if sport not in bets_by_sport:
-                    bets_by_sport[sport] = []
-                bets_by_sport[sport].append(bet)
-
-            # Get game results for each sport
-            all_results = []
-            total_verified = 0
-            total_settled = 0
-
-            for sport, sport_bets in bets_by_sport.items():
-                if sport == "unknown":
-                    logger.warning(
-                        f"Skipping {len(sport_bets)} bets with unknown sport"
-                    )
-                    continue
-
-                # Handle parlay parent bets separately (they check leg statuses, not game results)
-                if sport == "multiple sports":
-                    logger.info(
-                        f"Verifying {len(sport_bets)} parlay parent bets based on leg statuses..."
-                    )
-                    parlay_results = []
-                    for parlay_bet in sport_bets:
-                        try:
-                            status, result_amount, reasoning = self._evaluate_parlay(
-                                parlay_bet
-                            )
-                            if status != BetStatus.PENDING:
-                                parlay_results.append(
-                                    UnifiedBetResult(
-                                        bet_id=parlay_bet.id,
-                                        status=status,
-                                        result_amount=result_amount,
-                                        reasoning=reasoning,
-                                    )
-                                )
-                                logger.info(
-                                    f"Parlay {parlay_bet.id}: {status.value} - {reasoning}"
-                                )
-                        except Exception as e:
-                            logger.error(
-                                f"Error evaluating parlay {parlay_bet.id}: {e}"
-                            )
-
-                    all_results.extend(parlay_results)
-                    continue
-
-                try:
-                    logger.info(f"Verifying {len(sport_bets)} {sport.upper()} bets...")
-
-                    # Get completed games for this sport (last 3 days)
-                    normalized_sport = self._normalize_sport(sport)
-                    completed_games = await self.odds_service.get_scores_optimized(
-                        normalized_sport, include_completed=True
-                    )
-
-                    logger.info(
-                        f"Retrieved {len(completed_games)} game results for {sport}"
-                    )
-
-                    # Process each bet for this sport
-                    for bet in sport_bets:
-                        result = await self._verify_single_bet(bet, completed_games)
-                        if result:
-                            all_results.append(result)
-                            total_verified += 1
-                            if result.status != BetStatus.PENDING:
-                                total_settled += 1
-
-                except Exception as e:
-                    logger.error(f"Error verifying {sport} bets: {e}")
-                    continue
-
-            # Apply results to database
-            if all_results:
-                await self._apply_results(all_results, db)
-
+            # Parlays see this run's leg results before anything is written,
+            # so legs and parents go out in the same transaction
+            results += self._settle_pending_parlays(
+                db, {r.bet_id: r.status for r in results}
+            )
+            total_settled = await self._apply_results(results, db)
             db.commit()
 
+            # Games with bets we could not match stay outside the frontier so
+            # the next run retries them
+            for event_id in newly_completed:
+                if event_id not in unresolved_events:
+                    self.completed_frontier[event_id] = now
+
             duration = (datetime.now() - start_time).total_seconds()
             logger.info(
                 f"✅ Unified verification complete: {total_settled} settled, {total_verified} verified in {duration:.1f}s"
@@ -181,6 +172,7 @@ class UnifiedBetVerificationService:
                 "message": f"Verified {total_verified} bets, settled {total_settled}",
                 "verified": total_verified,
                 "settled": total_settled,
+                "completed_games": len(newly_completed),
                 "duration": duration,
             }
 
@@ -196,75 +188,136 @@ class UnifiedBetVerificationService:
         finally:
             db.close()
 
-    async def _verify_single_bet(
-        self, bet: SimpleUnifiedBet, completed_games: List[Dict]
-    ) -> Optional[UnifiedBetResult]:
-        """Verify a single bet against completed games"""
-
-        # Find the game by odds_api_event_id
-        game_data = None
-        for game in completed_games:
-            if game.get("id") == bet.odds_api_event_id:
-                game_data = game
-                break
-
-        if not game_data:
-            logger.debug(
-                f"Game {bet.odds_api_event_id[:8]} not found in completed games"
-            )
-            return None
+    def _prune_frontier(self, now: datetime):
+        """Forget events older than the scores window; they can't reappear"""
+        cutoff = now - FRONTIER_RETENTION
+        self.completed_frontier = {
+            event_id: seen_at
+            for event_id, seen_at in self.completed_frontier.items()
+            if seen_at >= cutoff
+        }
 
-        # Check if game is completed using the completed boolean field from Odds API
-        is_completed = game_data.get("completed")
-        if not is_completed:
-            logger.debug(
-                f"Game {bet.odds_api_event_id[:8]} not yet completed "
-                f"(completed={is_completed})"
+    async def _fetch_newly_completed_games(
+        self, db: Session, now: datetime
+    ) -> Dict[str, CompletedGame]:
+        """Fetch scores once per sport and return games that newly turned final"""
+        sports = {
+            sport
+            for (sport,) in db.query(SimpleUnifiedBet.sport)
+            .filter(
+                SimpleUnifiedBet.status == BetStatus.PENDING,
+                SimpleUnifiedBet.bet_type != BetType.PARLAY,
+                SimpleUnifiedBet.commence_time <= now,
             )
-            return None
+            .distinct()
+        }
+        api_sports = sorted(
+            {
+                self._normalize_sport(sport)
+                for sport in sports
+                if sport and sport.lower() not in ("unknown", "multiple sports")
+            }
+        )
 
-        # Get final scores - match by team name, not array index
-        scores = game_data.get("scores")
-        if not scores or len(scores) < 2:
-            logger.warning(f"Invalid scores for game {bet.odds_api_event_id[:8]}")
-            return None
+        newly_completed: Dict[str, CompletedGame] = {}
+        for sport in api_sports:
+            try:
+                games = await self.odds_service.get_scores_optimized(
+                    sport, include_completed=True
+                )
+            except Exception as e:
+                logger.error(f"Error fetching scores for {sport}: {e}")
+                continue
+
+            for game in games:
+                event_id = game.get("id")
+                if (
+                    not event_id
+                    or not game.get("completed")
+                    or event_id in self.completed_frontier
+                ):
+                    continue
+                completed = CompletedGame.from_api(game)
+                if completed:
+                    newly_completed[event_id] = completed
+                else:
+                    logger.warning(f"Invalid scores for game {event_id[:8]}")
+
+        return newly_completed
+
+    async def _settle_completed_games(
+        self, db: Session, games: Dict[str, CompletedGame]
+    ) -> Tuple[List[UnifiedBetResult], set]:
+        """Evaluate the pending bets tied to completed games"""
+        results: List[UnifiedBetResult] = []
+        unresolved_events = set()
+        event_ids = list(games)
+
+        for i in range(0, len(event_ids), EVENT_BATCH_SIZE):
+            rows = db.execute(
+                select(*SETTLEMENT_COLUMNS).where(
+                    SimpleUnifiedBet.odds_api_event_id.in_(
+                        event_ids[i : i + EVENT_BATCH_SIZE]
+                    ),
+                    SimpleUnifiedBet.status == BetStatus.PENDING,
+                    SimpleUnifiedBet.bet_type != BetType.PARLAY,
+                )
+            ).all()
 
-        # Match scores to home/away teams by name
-        home_score = None
-        away_score = None
-
-        for score_entry in scores:
-            team_name = score_entry.get("name", "")
-            score_value = score_entry.get("score")
-
-            # Match against bet's stored team names
-            if team_name == bet.home_team:
-                home_score = int(score_value) if score_value is not None else 0
-            elif team_name == bet.away_team:
-                away_score = int(score_value) if score_value is not None else 0
-
-        # Verify we found both scores
-        if home_score is None or away_score is None:
-            logger.warning(
-                f"Could not match scores to teams for game {bet.odds_api_event_id[:8]}. "
-                f"Expected teams: {bet.home_team} vs {bet.away_team}. "
-                f"API teams: {[s.get('name') for s in scores]}"
-            )
-            return None
+            for row in rows:
+                game = games[row.odds_api_event_id]
+                home_score = game.scores.get(row.home_team)
+                away_score = game.scores.get(row.away_team)
+                if home_score is None or away_score is None:
+                    logger.warning(
+                        f"Could not match scores to teams for game {game.event_id[:8]}. "
+                        f"Expected teams: {row.home_team} vs {row.away_team}. "
+                        f"API teams: {list(game.scores)}"
+                    )
+                    unresolved_events.add(game.event_id)
+                    continue
 
-        logger.info(
-            f"Verifying bet {bet.id[:8]}: {bet.bet_type.value} - {bet.selection}"
-        )
-        logger.info(
-            f"Final score: {bet.away_team} {away_score} - {bet.home_team} {home_score}"
-        )
+                # Props need the full bet for the sport-specific stats lookup
+                bet = (
+                    db.get(SimpleUnifiedBet, row.id)
+                    if row.bet_type == BetType.PROP
+                    else row
+                )
+                result = await self._evaluate_bet_outcome(
+                    bet, home_score, away_score, db
+                )
+                if result is None:
+                    unresolved_events.add(game.event_id)
+                    continue
 
-        # Determine bet outcome
-        return await self._evaluate_bet_outcome(bet, home_score, away_score)
+                result.final_home_score = home_score
+                result.final_away_score = away_score
+                result.game_completed_at = game.completed_at
+                results.append(result)
+
+        return results, unresolved_events
+
+    def _settle_pending_parlays(
+        self, db: Session, leg_results: Dict[str, BetStatus]
+    ) -> List[UnifiedBetResult]:
+        """Evaluate every pending parlay once from its (overlaid) leg statuses"""
+        return [
+            UnifiedBetResult(
+                bet_id=settlement.parlay_id,
+                status=settlement.status,
+                result_amount=settlement.result_amount,
+                reasoning=settlement.reasoning,
+            )
+            for settlement in parlay_settlement_engine.settle(db, leg_results)
+        ]
 
     async def _evaluate_bet_outcome(
-        self, bet: SimpleUnifiedBet, home_score: int, away_score: int
-    ) -> UnifiedBetResult:
+        self,
+        bet: SimpleUnifiedBet,
+        home_score: int,
+        away_score: int,
+        db: Optional[Session] = None,
+    ) -> Optional[UnifiedBetResult]:
         """Evaluate bet outcome based on scores"""
 
         bet_type = bet.bet_type
@@ -286,8 +339,8 @@ class UnifiedBetVerificationService:
                     bet, home_score, away_score
                 )
             elif bet_type == BetType.PARLAY:
-                # Handle parlay bets (check all legs)
-                status, result_amount, reasoning = self._evaluate_parlay(bet)
+                # Parlays settle from their legs in _settle_pending_parlays
+                return None
             elif bet_type == BetType.PROP:
                 # Player props use sport-specific APIs for verification
                 logger.info(
@@ -299,7 +352,7 @@ class UnifiedBetVerificationService:
                 )
 
                 # Verify the prop bet using sport-specific service
-                prop_service = PlayerPropVerificationService(self.db)
+                prop_service = PlayerPropVerificationService(db)
                 prop_result = await prop_service.verify_single_prop(bet)
 
                 if prop_result:
@@ -441,132 +494,68 @@ class UnifiedBetVerificationService:
                 f"Lost: {direction} {line} (total: {total_score})",
             )
 
-    def _evaluate_parlay(self, bet: SimpleUnifiedBet) -> Tuple[BetStatus, float, str]:
-        """
-        Evaluate parlay bet based on leg statuses
-
-        Rules:
-        - If ANY leg is lost, entire parlay loses
-        - If all legs are won (ignoring pushed legs), parlay wins
-        - If all legs are pushed, parlay pushes
-        - If any legs are still pending, parlay remains pending
-        """
-        db = SessionLocal()
-        try:
-            # Get all legs for this parlay
-            legs = (
-                db.query(SimpleUnifiedBet)
-                .filter(SimpleUnifiedBet.parent_bet_id == bet.id)
-                .all()
-            )
-
-            # Fallback: try parlay_legs JSON field if no legs found via parent_bet_id
-            if not legs and hasattr(bet, "parlay_legs") and bet.parlay_legs:
-                leg_ids = bet.parlay_legs if isinstance(bet.parlay_legs, list) else []
-                if leg_ids:
-                    legs = (
-                        db.query(SimpleUnifiedBet)
-                        .filter(SimpleUnifiedBet.id.in_(leg_ids))
-                        .all()
-                    )
-                    logger.info(
-                        f"Parlay {bet.id}: Found {len(legs)} legs via parlay_legs JSON field"
-                    )
-
-            if not legs:
-                logger.warning(f"Parlay {bet.id}: No legs found, keeping as pending")
-                return BetStatus.PENDING, 0.0, "Parlay has no legs"
-
-            # Count leg statuses
-            won_legs = 0
-            lost_legs = 0
-            pushed_legs = 0
-            pending_legs = 0
-
-            for leg in legs:
-                if leg.status == BetStatus.WON:
-                    won_legs += 1
-                elif leg.status == BetStatus.LOST:
-                    lost_legs += 1
-                elif leg.status == BetStatus.PUSHED:
-                    pushed_legs += 1
-                elif leg.status == BetStatus.PENDING:
-                    pending_legs += 1
-
-            total_legs = len(legs)
-            active_legs = total_legs - pushed_legs  # Pushes don't count
-
-            logger.info(
-                f"Parlay {bet.id}: {won_legs} won, {lost_legs} lost, "
-                f"{pushed_legs} pushed, {pending_legs} pending out of {total_legs} total legs"
-            )
-
-            # RULE 1: If ANY leg lost, parlay loses
-            if lost_legs > 0:
-                return (
-                    BetStatus.LOST,
-                    0.0,
-                    f"Parlay lost: {lost_legs} of {total_legs} legs lost",
+    async def _apply_results(self, results: List[UnifiedBetResult], db: Session) -> int:
+        """Bulk-apply settled results; bets no longer pending are left untouched"""
+        settled = [r for r in results if r.status != BetStatus.PENDING]
+        if not settled:
+            return 0
+
+        settled_at = datetime.now(timezone.utc)
+        bets = SimpleUnifiedBet.__table__
+
+        # Stakes of the bets this update will settle go back off the users'
+        # open exposure in the same transaction
+        settled_ids = [r.bet_id for r in settled]
+        stakes = []
+        for i in range(0, len(settled_ids), EVENT_BATCH_SIZE):
+            stakes += db.execute(
+                select(bets.c.user_id, bets.c.placed_at, bets.c.amount).where(
+                    bets.c.id.in_(settled_ids[i : i + EVENT_BATCH_SIZE]),
+                    bets.c.status == BetStatus.PENDING,
+                    bets.c.parent_bet_id.is_(None),
                 )
-
-            # RULE 2: If any legs still pending, keep parlay pending
-            if pending_legs > 0:
-                return (
-                    BetStatus.PENDING,
-                    0.0,
-                    f"Parlay pending: {pending_legs} legs still pending",
+            ).all()
+        bet_exposure_service.release(db, stakes)
+
+        db.execute(
+            update(bets)
+            .where(
+                and_(
+                    bets.c.id == bindparam("b_id"),
+                    bets.c.status == BetStatus.PENDING,
                 )
-
-            # RULE 3: All legs pushed - refund
-            if active_legs == 0:
-                return (
-                    BetStatus.PUSHED,
-                    bet.amount,
-                    f"Parlay pushed: All {total_legs} legs pushed",
-                )
-
-            # RULE 4: All active legs won - parlay wins
-            if won_legs == active_legs:
-                payout = bet.amount + bet.potential_win
-                return (
-                    BetStatus.WON,
-                    payout,
-                    f"Parlay won: All {active_legs} active legs won",
-                )
-
-            # Shouldn't reach here, but safety fallback
-            return BetStatus.PENDING, 0.0, "Unexpected parlay state"
-
-        except Exception as e:
-            logger.error(f"Error evaluating parlay {bet.id}: {e}")
-            return BetStatus.PENDING, 0.0, f"Error evaluating parlay: {str(e)}"
-        finally:
-            db.close()
-
-    async def _apply_results(self, results: List[UnifiedBetResult], db: Session):
-        """Apply verification results to database"""
-
-        for result in results:
-            try:
-                bet = (
-                    db.query(SimpleUnifiedBet)
-                    .filter(SimpleUnifiedBet.id == result.bet_id)
-                    .first()
-                )
-
-                if bet and bet.status == BetStatus.PENDING:
-                    bet.status = result.status
-                    bet.result_amount = result.result_amount
-
-                    if result.status != BetStatus.PENDING:
-                        bet.settled_at = datetime.now(timezone.utc)
-
-                    logger.info(
-                        f"✅ Updated bet {result.bet_id[:8]}: {result.status.value} - {result.reasoning}"
-                    )
-
-            except Exception as e:
-                logger.error(f"Error updating bet {result.bet_id[:8]}: {e}")
+            )
+            .values(
+                status=bindparam("b_status"),
+                result_amount=bindparam("b_result_amount"),
+                reasoning=bindparam("b_reasoning"),
+                settled_at=settled_at,
+                final_home_score=bindparam("b_home"),
+                final_away_score=bindparam("b_away"),
+                final_total_score=bindparam("b_total"),
+                game_completed_at=bindparam("b_completed_at"),
+            ),
+            [
+                {
+                    "b_id": r.bet_id,
+                    "b_status": r.status,
+                    "b_result_amount": r.result_amount,
+                    "b_reasoning": r.reasoning,
+                    "b_home": r.final_home_score,
+                    "b_away": r.final_away_score,
+                    "b_total": (
+                        r.final_home_score + r.final_away_score
+                        if r.final_home_score is not None
+                        and r.final_away_score is not None
+                        else None
+                    ),
+                    "b_completed_at": r.game_completed_at,
+                }
+                for r in settled
+            ],
+        )
+        logger.info(f"✅ Settled {len(settled)} bets")
+        return len(settled)
 
     def _normalize_sport(self, sport: str) -> str:
         """Normalize sport names for Odds API"""
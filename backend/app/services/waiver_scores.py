@@ -0,0 +1,350 @@
+"""
+Weekly waiver-wire opportunity scores
+
+Waiver analytics used to run a grouped usage query and then, for every
+candidate, two more aggregates and a player lookup. compute_waiver_scores
+scores every player in one pass over the season's analytics: opportunity
+score, a scoring trend flag and a rank within the position. The
+waiver_scores table keeps them per (season, week). A league's waiver list
+is then the stored scores minus the players rostered in that league.
+
+scripts/compute_waiver_scores.py and the scheduler's compute_waiver_scores
+task refresh the latest week. Until a season has stored scores they are
+computed on the fly (and not stored).
+"""
+
+import logging
+import statistics
+import time
+from collections import Counter
+from datetime import datetime
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.metrics import cache_requests
+from app.models.fantasy_models import (
+    FantasyLeague,
+    FantasyPlayer,
+    FantasyRosterSpot,
+    FantasyTeam,
+    PlayerAnalytics,
+    WaiverScore,
+)
+from app.services.player_feature_store import linear_slope
+
+logger = logging.getLogger(__name__)
+
+# Most recent games whose usage a score is built from
+USAGE_GAMES = 8
+
+# Players under this average snap share are not waiver candidates
+MIN_SNAP_PCT = 40
+
+# Games behind recent points per game and the scoring trend
+RECENT_GAMES = 3
+TREND_GAMES = 4
+
+# PPR points per game of slope that flag a player as rising or falling
+TREND_SLOPE_POINTS = 1.5
+
+# Seconds loaded scores are served before being read again
+WAIVER_SCORES_TTL_SECONDS = 900
+
+# Seasons kept in memory before the oldest is dropped
+WAIVER_SCORES_MAX_SEASONS = 4
+
+_GAME_COLUMNS = (
+    PlayerAnalytics.player_id,
+    PlayerAnalytics.season,
+    PlayerAnalytics.week,
+    PlayerAnalytics.snap_percentage,
+    PlayerAnalytics.target_share,
+    PlayerAnalytics.red_zone_touches,
+    PlayerAnalytics.ppr_points,
+)
+
+_SCORE_COLUMNS = (
+    "player_id",
+    "season",
+    "week",
+    "position",
+    "opportunity_score",
+    "position_rank",
+    "trend",
+    "avg_snap_pct",
+    "avg_target_share",
+    "avg_red_zone_touches",
+    "recent_ppg",
+    "ownership_pct",
+)
+
+_PLAYER_COLUMNS = (
+    FantasyPlayer.name.label("player_name"),
+    FantasyPlayer.team,
+    FantasyPlayer.platform_player_id,
+)
+
+
+def _mean(values: List[Optional[float]]) -> Optional[float]:
+    values = [value for value in values if value is not None]
+    return statistics.mean(values) if values else None
+
+
+def opportunity_score(
+    avg_snaps: float,
+    avg_target_share: Optional[float],
+    avg_red_zone_touches: Optional[float],
+) -> float:
+    """0-100 blend of snap share, target share and red-zone touches"""
+    score = min(avg_snaps / 2, 40)
+    if avg_target_share:
+        score += avg_target_share * 200  # Weight target share heavily
+    if avg_red_zone_touches:
+        score += avg_red_zone_touches * 5
+    return min(score, 100)
+
+
+def scoring_trend(points: List[float]) -> str:
+    """rising, falling or steady from the slope of recent PPR points"""
+    slope = linear_slope(points[-TREND_GAMES:])
+    if slope >= TREND_SLOPE_POINTS:
+        return "rising"
+    if slope <= -TREND_SLOPE_POINTS:
+        return "falling"
+    return "steady"
+
+
+def latest_analytics_week(db: Session) -> Optional[Tuple[int, int]]:
+    """The (season, week) of the newest stored analytics"""
+    season = db.scalar(select(func.max(PlayerAnalytics.season)))
+    if season is None:
+        return None
+    week = db.scalar(
+        select(func.max(PlayerAnalytics.week)).where(PlayerAnalytics.season == season)
+    )
+    return season, week
+
+
+def league_ownership(db: Session, season: int) -> Dict[int, float]:
+    """Share (0-100) of the season's synced leagues rostering each player"""
+    leagues = db.scalar(
+        select(func.count(func.distinct(FantasyTeam.league_id)))
+        .join(FantasyLeague, FantasyLeague.id == FantasyTeam.league_id)
+        .where(FantasyLeague.season == season)
+    )
+    if not leagues:
+        return {}
+    rows = db.execute(
+        select(
+            FantasyRosterSpot.player_id,
+            func.count(func.distinct(FantasyTeam.league_id)),
+        )
+        .join(FantasyTeam, FantasyTeam.id == FantasyRosterSpot.team_id)
+        .join(FantasyLeague, FantasyLeague.id == FantasyTeam.league_id)
+        .where(FantasyLeague.season == season)
+        .group_by(FantasyRosterSpot.player_id)
+    )
+    return {player_id: count * 100 / leagues for player_id, count in rows}
+
+
+def compute_waiver_scores(db: Session, season: int, week: int) -> List[Dict[str, Any]]:
+    """
+    waiver_scores rows for every player as of a week, in one analytics pass
+
+    A player's usage is averaged over their last USAGE_GAMES games through
+    the week, reaching back into the previous season early on.
+    """
+    games = db.execute(
+        select(*_GAME_COLUMNS)
+        .where(
+            or_(
+                PlayerAnalytics.season == season - 1,
+                (PlayerAnalytics.season == season) & (PlayerAnalytics.week <= week),
+            )
+        )
+        .order_by(
+            PlayerAnalytics.player_id, PlayerAnalytics.season, PlayerAnalytics.week
+        )
+    )
+
+    scored = {}
+    for player_id, player_games in groupby(games, key=lambda game: game.player_id):
+        recent = list(player_games)[-USAGE_GAMES:]
+        avg_snaps = _mean([game.snap_percentage for game in recent])
+        if avg_snaps is None or avg_snaps <= MIN_SNAP_PCT:
+            continue
+
+        avg_targets = _mean([game.target_share for game in recent])
+        avg_red_zone = _mean([game.red_zone_touches for game in recent])
+        points = [game.ppr_points or 0 for game in recent]
+        scoring = [p for p in points[-RECENT_GAMES:] if p]
+        scored[player_id] = {
+            "player_id": player_id,
+            "season": season,
+            "week": week,
+            "opportunity_score": round(
+                opportunity_score(avg_snaps, avg_targets, avg_red_zone), 2
+            ),
+            "trend": scoring_trend(points),
+            "avg_snap_pct": round(avg_snaps, 2),
+            "avg_target_share": avg_targets,
+            "avg_red_zone_touches": avg_red_zone,
+            "recent_ppg": round(statistics.mean(scoring), 2) if scoring else 0.0,
+        }
+
+    positions = {}
+    if scored:
+        positions = dict(
+            db.execute(
+                select(FantasyPlayer.id, FantasyPlayer.position).where(
+                    FantasyPlayer.id.in_(list(scored))
+                )
+            ).all()
+        )
+    ownership = league_ownership(db, season)
+
+    rows = []
+    ranks: Counter = Counter()
+    now = datetime.utcnow()
+    for row in sorted(scored.values(), key=lambda r: -r["opportunity_score"]):
+        if row["player_id"] not in positions:
+            continue  # Analytics for a player no longer in the player table
+        position = getattr(positions[row["player_id"]], "value", None)
+        ranks[position] += 1
+        row.update(
+            position=position,
+            position_rank=ranks[position],
+            ownership_pct=round(ownership.get(row["player_id"], 0.0), 1),
+            computed_at=now,
+        )
+        rows.append(row)
+    return rows
+
+
+class WaiverScoreStore:
+    """Reads and refreshes waiver_scores, and builds league waiver lists"""
+
+    def __init__(self, ttl: float = WAIVER_SCORES_TTL_SECONDS):
+        self.ttl = ttl
+        # season -> (expires, scores by descending opportunity)
+        self._scores: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+
+    def rebuild(self, db: Session, season: int, week: int) -> int:
+        """Recompute and store a week's scores; the caller commits"""
+        rows = compute_waiver_scores(db, season, week)
+        db.execute(
+            delete(WaiverScore).where(
+                WaiverScore.season == season, WaiverScore.week == week
+            )
+        )
+        if rows:
+            db.execute(insert(WaiverScore), rows)
+        self.invalidate()
+        logger.info(f"Stored {len(rows)} waiver scores for {season} week {week}")
+        return len(rows)
+
+    def rebuild_latest(self, db: Session) -> int:
+        """Rebuild the week of the newest analytics; the caller commits"""
+        latest = latest_analytics_week(db)
+        if latest is None:
+            return 0
+        return self.rebuild(db, *latest)
+
+    def scores(self, db: Session, season: int) -> List[Dict[str, Any]]:
+        """
+        The season's latest scores with player details, best first
+
+        Shared between callers: copy before changing an entry.
+        """
+        entry = self._scores.get(season)
+        if entry is not None and entry[0] > time.monotonic():
+            cache_requests.inc("waiver_scores", "hit_memory")
+            return entry[1]
+
+        cache_requests.inc("waiver_scores", "miss")
+        week = db.scalar(
+            select(func.max(WaiverScore.week)).where(WaiverScore.season == season)
+        )
+        if week is not None:
+            rows = [
+                row._asdict()
+                for row in db.execute(
+                    select(
+                        *[getattr(WaiverScore, column) for column in _SCORE_COLUMNS],
+                        *_PLAYER_COLUMNS,
+                    )
+                    .outerjoin(FantasyPlayer, FantasyPlayer.id == WaiverScore.player_id)
+                    .where(WaiverScore.season == season, WaiverScore.week == week)
+                )
+            ]
+        else:
+            # Not computed yet: score the season's latest week without storing
+            week = db.scalar(
+                select(func.max(PlayerAnalytics.week)).where(
+                    PlayerAnalytics.season == season
+                )
+            )
+            rows = compute_waiver_scores(db, season, week) if week else []
+            players = {
+                player.id: player
+                for player in db.execute(
+                    select(FantasyPlayer.id, *_PLAYER_COLUMNS).where(
+                        FantasyPlayer.id.in_([row["player_id"] for row in rows])
+                    )
+                )
+            }
+            for row in rows:
+                player = players[row["player_id"]]
+                row.update(
+                    player_name=player.player_name,
+                    team=player.team,
+                    platform_player_id=player.platform_player_id,
+                )
+        rows.sort(key=lambda row: -row["opportunity_score"])
+
+        if (
+            season not in self._scores
+            and len(self._scores) >= WAIVER_SCORES_MAX_SEASONS
+        ):
+            self._scores.pop(next(iter(self._scores)))
+        self._scores[season] = (time.monotonic() + self.ttl, rows)
+        return rows
+
+    def rostered_player_ids(self, db: Session, league_id: int) -> Set[int]:
+        return set(
+            db.scalars(
+                select(FantasyRosterSpot.player_id)
+                .join(FantasyTeam, FantasyTeam.id == FantasyRosterSpot.team_id)
+                .where(FantasyTeam.league_id == league_id)
+            )
+        )
+
+    def waiver_list(
+        self,
+        db: Session,
+        league_id: int,
+        season: int,
+        position: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """The best-scored players nobody in the league rosters"""
+        rostered = self.rostered_player_ids(db, league_id)
+        available = []
+        for row in self.scores(db, season):
+            if row["player_id"] in rostered:
+                continue
+            if position and row["position"] != position:
+                continue
+            available.append(dict(row))
+            if len(available) == limit:
+                break
+        return available
+
+    def invalidate(self) -> None:
+        self._scores.clear()
+
+
+waiver_score_store = WaiverScoreStore()
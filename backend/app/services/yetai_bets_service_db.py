@@ -17,6 +17,7 @@ from app.models.bet_models import (
     BetStatus,
     YetAIBetType,
 )
+from app.services.platform_stats_service import platform_stats_service
 
 logger = logging.getLogger(__name__)
 
@@ -306,6 +307,9 @@ class YetAIBetsServiceDB:
                 if update_request.result:
                     bet.result = update_request.result
 
+                if bet.settled_at:
+                    platform_stats_service.refresh_days(db, [bet.settled_at.date()])
+
                 db.commit()
 
                 logger.info(f"Updated YetAI Bet: {bet_id} by admin {admin_user_id}")
@@ -336,7 +340,10 @@ class YetAIBetsServiceDB:
                     db.query(BetHistory).filter(BetHistory.bet_id == bet_id).delete()
                 )
 
+                settled_day = bet.settled_at.date() if bet.settled_at else None
                 db.delete(bet)
+                if settled_day:
+                    platform_stats_service.refresh_days(db, [settled_day])
                 db.commit()
 
                 logger.info(
@@ -684,6 +691,7 @@ class YetAIBetsServiceDB:
                 return {"success": True, "verified": 0, "settled": 0}
 
             total_settled = 0
+            settled_days = set()
 
             # First pass: Check bets with game_id against database
             for bet in pending_bets:
@@ -700,12 +708,15 @@ class YetAIBetsServiceDB:
                         bet.status = result_status
                         bet.settled_at = datetime.utcnow()
                         bet.result = result_description
+                        settled_days.add(bet.settled_at.date())
                         total_settled += 1
 
                         logger.info(
                             f"Settled YetAI bet {bet.id[:8]} via DB: {bet.title} - {result_status}"
                         )
 
+            # Roll the settlements into the login page summary, same transaction
+            platform_stats_service.refresh_days(db, settled_days)
             db.commit()
             logger.info(f"✅ YetAI verification complete: {total_settled} bets settled")
 
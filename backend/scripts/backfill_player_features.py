@@ -0,0 +1,49 @@
+"""
+Rebuild the player_features store (and player_recent_games) from player_analytics
+
+Run after the migration that creates the table, and after any bulk load that
+writes player_analytics without going through store_weekly_analytics:
+
+    python scripts/backfill_player_features.py             # every season
+    python scripts/backfill_player_features.py --season 2025
+"""
+
+import argparse
+import sys
+import os
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.database import SessionLocal
+from app.services.player_feature_store import player_feature_store
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def backfill_player_features(season=None) -> int:
+    """Recompute feature rows for one season, or all of them"""
+    db = SessionLocal()
+
+    try:
+        written = player_feature_store.rebuild(db, season=season)
+        db.commit()
+        scope = f"season {season}" if season is not None else "all seasons"
+        logger.info(f"✅ Backfill complete: {written} feature rows for {scope}")
+        return written
+
+    except Exception as e:
+        logger.error(f"Error during backfill: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--season", type=int, help="Only rebuild this season")
+    args = parser.parse_args()
+    backfill_player_features(args.season)
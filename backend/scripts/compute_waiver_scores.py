@@ -0,0 +1,54 @@
+"""
+Compute the weekly waiver_scores from player_analytics
+
+Run after each week's analytics are loaded (the scheduler also refreshes the
+latest week daily):
+
+    python scripts/compute_waiver_scores.py                       # latest week
+    python scripts/compute_waiver_scores.py --season 2025 --week 9
+"""
+
+import argparse
+import sys
+import os
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.database import SessionLocal
+from app.services.waiver_scores import waiver_score_store
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def compute_waiver_scores(season=None, week=None) -> int:
+    """Store scores for one week, or the week of the newest analytics"""
+    db = SessionLocal()
+
+    try:
+        if season is None:
+            written = waiver_score_store.rebuild_latest(db)
+        else:
+            written = waiver_score_store.rebuild(db, season, week)
+        db.commit()
+        logger.info(f"✅ Waiver scores complete: {written} players scored")
+        return written
+
+    except Exception as e:
+        logger.error(f"Error computing waiver scores: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--season", type=int, help="Season to score")
+    parser.add_argument("--week", type=int, help="Last week of data to score")
+    args = parser.parse_args()
+    if (args.season is None) != (args.week is None):
+        parser.error("--season and --week go together")
+    compute_waiver_scores(args.season, args.week)
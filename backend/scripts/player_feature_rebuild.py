@@ -0,0 +1,26 @@
+"""
+Rebuild player_features after a loader writes player_analytics directly
+
+The populate/fetch scripts at the repository root load analytics with
+psycopg2 and never import the app, so the rebuild runs
+backfill_player_features.py in its own interpreter:
+
+    sys.path.insert(0, os.path.join(REPO_ROOT, "backend", "scripts"))
+    from player_feature_rebuild import rebuild_player_features
+"""
+
+import os
+import subprocess
+import sys
+
+BACKFILL_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "backfill_player_features.py"
+)
+
+
+def rebuild_player_features(season: int) -> bool:
+    """Recompute the feature store rows for a freshly loaded season"""
+    result = subprocess.run([sys.executable, BACKFILL_SCRIPT, "--season", str(season)])
+    if result.returncode != 0:
+        print(f"⚠️ Feature rebuild failed; run {BACKFILL_SCRIPT} --season {season}")
+    return result.returncode == 0
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Replay a game calendar against the adaptive Odds API quota planner and the
+old fixed-interval scheduler, and compare credits spent with odds freshness.
+
+Usage:
+    cd backend
+    .venv/bin/python3 scripts/simulate_odds_quota.py --days 30
+    .venv/bin/python3 scripts/simulate_odds_quota.py --from-db --start 2025-09-01 --days 120
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.odds_quota_simulation import (
+    build_synthetic_schedule,
+    load_season_calendar,
+    simulate_schedule,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--start", help="Start date (YYYY-MM-DD), default today")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--budget", type=int, default=20000, help="Monthly credits")
+    parser.add_argument(
+        "--from-db", action="store_true", help="Replay the games table calendar"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = (
+        datetime.strptime(args.start, "%Y-%m-%d")
+        if args.start
+        else datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    )
+    end = start + timedelta(days=args.days)
+
+    if args.from_db:
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            calendar = load_season_calendar(db, start, end)
+        finally:
+            db.close()
+    else:
+        calendar = build_synthetic_schedule(start, args.days, seed=args.seed)
+
+    games = sum(len(times) for times in calendar.values())
+    print("=" * 72)
+    print(f"Odds API quota simulation: {start:%Y-%m-%d} to {end:%Y-%m-%d}")
+    print(f"{games} games, monthly budget {args.budget} credits")
+    print("=" * 72)
+    print(
+        f"{'policy':<10}{'credits':>10}{'calls':>8}"
+        f"{'mean stale':>13}{'p95 stale':>12}{'max stale':>12}"
+    )
+
+    for policy in ("fixed", "adaptive"):
+        result = simulate_schedule(
+            calendar, start, end, policy=policy, monthly_budget=args.budget
+        )
+        print(
+            f"{policy:<10}{result.credits:>10}{result.calls:>8}"
+            f"{result.mean_staleness_seconds / 60:>11.1f}m"
+            f"{result.p95_staleness_seconds / 60:>11.1f}m"
+            f"{result.max_staleness_seconds / 60:>11.1f}m"
+        )
+
+    print()
+    print("Staleness is the age of the odds of each in-progress game, sampled")
+    print("every 5 minutes of simulated time.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Shared fixtures for the backend test suite
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.query_instrumentation import instrument_engine, track_queries
+
+
+@pytest.fixture
+def sqlite_engine():
+    """In-memory SQLite engine with every model table created"""
+    # Import models so they are registered on Base.metadata
+    import app.models.database_models  # noqa: F401
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def db_session(sqlite_engine):
+    """Session bound to the in-memory SQLite engine"""
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=sqlite_engine)
+    db = Session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def query_budget(sqlite_engine):
+    """
+    Fail the test when a block runs more queries than budgeted
+
+        with query_budget(3, max_repeats=1) as scope:
+            ...
+
+    max_repeats caps how often any one statement shape may run (N+1 guard).
+    """
+    instrument_engine(sqlite_engine)
+
+    @contextmanager
+    def budget(max_queries: int, max_repeats: Optional[int] = None):
+        with track_queries("test", record=False) as scope:
+            yield scope
+
+        problems = []
+        if scope.query_count > max_queries:
+            problems.append(f"{scope.query_count} queries run, budget is {max_queries}")
+        worst = max(scope.fingerprints.values(), default=0)
+        if max_repeats is not None and worst > max_repeats:
+            problems.append(
+                f"a statement ran {worst} times, budget is {max_repeats} per shape"
+            )
+        if problems:
+            statements = "\n".join(
+                f"  {count}x {shape[:200]}"
+                for shape, count in scope.fingerprints.most_common()
+            )
+            pytest.fail("; ".join(problems) + "\n" + statements, pytrace=False)
+
+    return budget
+
+
+class FakeSleeper(BaseHTTPRequestHandler):
+    """
+    Serves the server's canned Sleeper routes and records what it was asked
+
+    Paths listed in server.delays are answered after that many seconds, and
+    those in server.failures fail with a 503 that many times first.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] += 1
+            server.ports.add(self.client_address[1])
+            hits = server.hits[self.path]
+
+        time.sleep(server.delays.get(self.path, 0))
+        if hits <= server.failures.get(self.path, 0):
+            return self._send(503, {"error": "busy"}, {"Retry-After": "0"})
+        if self.path not in server.routes:
+            return self._send(404, {"error": "not found"})
+
+        etag = f'"{self.path}-v{server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            with server.lock:
+                server.not_modified += 1
+            return self._send(304, None, {"ETag": etag})
+        self._send(200, server.routes[self.path], {"ETag": etag})
+
+    def _send(self, status, payload, headers=None):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_sleeper():
+    """Local HTTP server standing in for the Sleeper API; fill in .routes"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeSleeper)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.routes = {}
+    server.delays = {}
+    server.failures = {}
+    server.hits = Counter()
+    server.ports = set()
+    server.not_modified = 0
+    server.version = 1
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,256 @@
+"""
+Tests for the staged player_analytics bulk loader
+"""
+
+import csv
+import io
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app, require_admin
+from app.models.fantasy_models import PlayerAnalytics, PlayerFeatures
+from app.services import analytics_bulk_loader as loader_module
+from app.services.analytics_bulk_loader import AnalyticsBulkLoader
+
+# Rows per second a 100k-row import must sustain on in-memory SQLite: the
+# load alone, and with the feature rebuild the import endpoint runs
+MIN_ROWS_PER_SECOND = 10_000
+MIN_ROWS_PER_SECOND_WITH_FEATURES = 4_000
+
+COLUMNS = [
+    "id",
+    "player_id",
+    "week",
+    "season",
+    "game_date",
+    "opponent",
+    "targets",
+    "snap_percentage",
+    "target_share",
+    "ppr_points",
+    "points_per_snap",
+    "injury_designation",
+]
+
+
+def _csv(rows, columns=COLUMNS):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    writer.writerows(rows)
+    buffer.seek(0)
+    return buffer
+
+
+def _rows(players, seasons=(2025,), weeks=range(1, 18), points=12.5):
+    return [
+        [
+            "",
+            player_id,
+            week,
+            season,
+            f"{season}-09-{week + 7:02d}T17:00:00Z",
+            "GB",
+            "6",
+            "71.5",
+            "22.0",
+            str(points),
+            "0.3",
+            "NULL",
+        ]
+        for season in seasons
+        for player_id in players
+        for week in weeks
+    ]
+
+
+@pytest.fixture
+def loader(sqlite_engine):
+    return AnalyticsBulkLoader(
+        session_factory=sessionmaker(bind=sqlite_engine), chunk_size=50
+    )
+
+
+def _analytics(db):
+    db.expire_all()
+    return db.execute(
+        select(
+            PlayerAnalytics.player_id,
+            PlayerAnalytics.season,
+            PlayerAnalytics.week,
+            PlayerAnalytics.ppr_points,
+        ).order_by(
+            PlayerAnalytics.player_id, PlayerAnalytics.season, PlayerAnalytics.week
+        )
+    ).all()
+
+
+def test_replace_load_coerces_types_and_reports_rejects(loader, db_session):
+    db_session.add(PlayerAnalytics(player_id=99, season=2020, week=1))
+    db_session.commit()
+    rows = _rows([1, 2])
+    rows[3][2] = "three"  # Bad week
+    rows[5][1] = ""  # No player
+
+    report = loader.load_csv(_csv(rows))
+
+    assert (report.rows_read, report.rows_loaded, report.rows_rejected) == (34, 32, 2)
+    assert report.rows_replaced == 1
+    assert report.errors == [
+        "row 4: week: invalid value 'three'",
+        "row 6: missing player_id",
+    ]
+    assert report.rows_per_second > 0
+    loaded = db_session.scalars(select(PlayerAnalytics).limit(1)).one()
+    assert loaded.targets == 6 and loaded.snap_percentage == 71.5
+    assert loaded.game_date.year == 2025 and loaded.injury_designation is None
+    assert {row.player_id for row in _analytics(db_session)} == {1, 2}
+
+
+def test_season_and_merge_loads_keep_other_rows(loader, db_session):
+    loader.load_csv(_csv(_rows([1, 2], seasons=(2024, 2025))))
+
+    loader.load_csv(_csv(_rows([3], seasons=(2025,))), mode="seasons")
+    assert {(r.player_id, r.season) for r in _analytics(db_session)} == {
+        (1, 2024),
+        (2, 2024),
+        (3, 2025),
+    }
+
+    report = loader.load_csv(
+        _csv(_rows([1], seasons=(2024,), weeks=[2, 3], points=30.0)), mode="merge"
+    )
+    rows = _analytics(db_session)
+    assert report.rows_replaced == 2
+    assert len(rows) == 17 * 3
+    assert [r.ppr_points for r in rows if r.player_id == 1][:4] == [
+        12.5,
+        30.0,
+        30.0,
+        12.5,
+    ]
+
+
+def test_failed_load_leaves_the_table_as_it_was(loader, db_session):
+    loader.load_csv(_csv(_rows([1])))
+    before = _analytics(db_session)
+
+    def rows():
+        yield from csv.DictReader(_csv(_rows([2, 3])))
+        raise OSError("upload interrupted")
+
+    with pytest.raises(OSError):
+        loader.load_rows(rows())
+
+    assert _analytics(db_session) == before
+
+
+def test_import_without_valid_rows_is_refused(loader, db_session):
+    loader.load_csv(_csv(_rows([1])))
+    before = _analytics(db_session)
+    rows = _rows([2])[:2]
+    for row in rows:
+        row[2] = "three"
+
+    with pytest.raises(ValueError, match="2 of 2 rejected"):
+        loader.load_csv(_csv(rows))
+    with pytest.raises(ValueError, match="missing player_id, week, season"):
+        loader.load_csv(_csv(_rows([2]), columns=["x"] * len(COLUMNS)))
+
+    assert _analytics(db_session) == before
+
+
+def test_load_refreshes_player_features(loader, db_session):
+    loader.load_csv(_csv(_rows([1, 2], seasons=(2024, 2025))))
+    loader.load_csv(_csv(_rows([1], weeks=[17], points=40.0)), mode="merge")
+
+    db_session.expire_all()
+    season_window = db_session.get(PlayerFeatures, (1, 2025, 17, 17))
+    assert season_window.games == 17
+    assert season_window.ppr_points_mean == pytest.approx((16 * 12.5 + 40) / 17)
+    assert db_session.get(PlayerFeatures, (2, 2024, 17, 17)) is not None
+
+
+def test_import_endpoint(loader, db_session, monkeypatch):
+    monkeypatch.setattr(loader_module, "analytics_bulk_loader", loader)
+    app.dependency_overrides[require_admin] = lambda: {"id": 1, "is_admin": True}
+    try:
+        client = TestClient(app)
+        response = client.post(
+            "/api/admin/analytics/import?mode=seasons",
+            files={"file": ("analytics.csv", _csv(_rows([4])).getvalue(), "text/csv")},
+        )
+        bad_mode = client.post(
+            "/api/admin/analytics/import?mode=append",
+            files={"file": ("analytics.csv", "player_id\n", "text/csv")},
+        )
+        no_rows = client.post(
+            "/api/admin/analytics/import",
+            files={"file": ("analytics.csv", "player\n1\n", "text/csv")},
+        )
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+
+    assert response.status_code == 200
+    assert response.json()["rows_loaded"] == 17
+    assert bad_mode.status_code == 400
+    assert no_rows.status_code == 400
+    assert no_rows.json()["detail"].startswith("No valid rows to load: 1 of 1")
+    assert len(_analytics(db_session)) == 17
+
+
+def test_failed_feature_rebuild_keeps_the_import(loader, db_session, monkeypatch):
+    def fail(db, season=None, player_ids=None):
+        raise RuntimeError("features unavailable")
+
+    monkeypatch.setattr(loader_module.player_feature_store, "rebuild", fail)
+    monkeypatch.setattr(loader_module, "analytics_bulk_loader", loader)
+    app.dependency_overrides[require_admin] = lambda: {"id": 1, "is_admin": True}
+    try:
+        response = TestClient(app).post(
+            "/api/admin/analytics/import",
+            files={"file": ("analytics.csv", _csv(_rows([4])).getvalue(), "text/csv")},
+        )
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+
+    assert response.status_code == 200
+    assert response.json()["rows_loaded"] == 17
+    assert response.json()["feature_rows"] == 0
+    assert response.json()["feature_rebuild_error"] == "features unavailable"
+    assert len(_analytics(db_session)) == 17
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "refresh_features, min_rate",
+    [(False, MIN_ROWS_PER_SECOND), (True, MIN_ROWS_PER_SECOND_WITH_FEATURES)],
+)
+def test_100k_row_import_rate(sqlite_engine, db_session, refresh_features, min_rate):
+    loader = AnalyticsBulkLoader(
+        session_factory=sessionmaker(bind=sqlite_engine),
+        refresh_features=refresh_features,
+    )
+    # 2,000 players x 17 weeks x 3 seasons
+    upload = _csv(_rows(range(1, 2001), seasons=(2023, 2024, 2025)))
+    db_session.add(PlayerAnalytics(player_id=1, season=2022, week=1))
+    db_session.commit()
+
+    started = time.perf_counter()
+    report = loader.load_csv(upload)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"\n{report.rows_loaded} rows and {report.feature_rows} feature rows in "
+        f"{elapsed:.2f}s ({report.rows_loaded / elapsed:.0f} rows/sec)"
+    )
+    assert report.rows_loaded == 102_000
+    assert report.rows_loaded / elapsed > min_rate
+    assert db_session.scalar(select(func.count(PlayerAnalytics.id))) == 102_000
+    assert db_session.scalar(select(func.count()).select_from(PlayerFeatures)) == (
+        report.feature_rows
+    )
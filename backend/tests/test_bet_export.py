@@ -0,0 +1,120 @@
+"""
+Tests for the streaming bet history export
+"""
+
+import csv
+import io
+import json
+import time
+import tracemalloc
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app, get_current_user
+from app.models.simple_unified_bet_model import BetStatus
+from app.services.bet_export_service import (
+    EXPORT_COLUMNS,
+    BetExportService,
+    bet_export_service,
+)
+from app.services.simple_unified_bet_service import bet_filters
+
+from tests.test_unified_bet_settlement import _bet_row, _insert
+
+
+@pytest.fixture
+def exporter(sqlite_engine):
+    return BetExportService(session_factory=sessionmaker(bind=sqlite_engine))
+
+
+def _seed(db, count, user_id=1, start=0):
+    for chunk in range(start, start + count, 20_000):
+        _insert(
+            db,
+            [
+                _bet_row(
+                    f"evt-{i % 500}",
+                    id=f"bet-{i:07d}",
+                    user_id=user_id,
+                    status=BetStatus.WON if i % 2 else BetStatus.LOST,
+                )
+                for i in range(chunk, min(chunk + 20_000, start + count))
+            ],
+        )
+
+
+def test_csv_and_ndjson_match(exporter, db_session):
+    _seed(db_session, 25)
+    _seed(db_session, 5, user_id=2, start=100)
+    filters = bet_filters(1, include_legs=True)
+
+    rows = list(csv.reader(io.StringIO("".join(exporter.stream("csv", filters)))))
+    records = [
+        json.loads(line)
+        for line in "".join(exporter.stream("ndjson", filters)).splitlines()
+    ]
+
+    assert rows[0] == list(EXPORT_COLUMNS)
+    assert len(rows) - 1 == len(records) == 25
+    assert {record["user_id"] for record in records} == {1}
+    assert records[0]["status"] in ("won", "lost")
+    assert rows[1][EXPORT_COLUMNS.index("id")] == records[0]["id"]
+    assert rows[1][EXPORT_COLUMNS.index("settled_at")] == ""
+    assert records[0]["settled_at"] is None
+
+
+def test_unknown_format_is_rejected(exporter):
+    with pytest.raises(ValueError):
+        exporter.stream("xlsx", [])
+
+
+def test_export_endpoint_streams_the_current_users_bets(
+    sqlite_engine, db_session, monkeypatch
+):
+    _seed(db_session, 3)
+    _seed(db_session, 2, user_id=2, start=10)
+    monkeypatch.setattr(
+        bet_export_service, "_session_factory", sessionmaker(bind=sqlite_engine)
+    )
+    app.dependency_overrides[get_current_user] = lambda: {"id": 2}
+    try:
+        client = TestClient(app)
+        response = client.get("/api/bets/export?format=ndjson&status=lost")
+        bad = client.get("/api/bets/export?format=xml")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "attachment" in response.headers["content-disposition"]
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [
+        "bet-0000010"
+    ]
+    assert bad.status_code == 400
+
+
+@pytest.mark.slow
+def test_200k_bet_export_keeps_memory_flat(exporter, db_session):
+    _seed(db_session, 200_000)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    exported_bytes = 0
+    lines = 0
+    for chunk in exporter.stream("csv", bet_filters(1, include_legs=True)):
+        exported_bytes += len(chunk)
+        lines += chunk.count("\n")
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"\nExported 200000 bets ({exported_bytes / 1e6:.1f} MB CSV) in "
+        f"{elapsed:.1f}s; peak traced memory {peak / 1e6:.1f} MB"
+    )
+    assert lines == 200_001
+    # The export is tens of MB; the process only ever holds a chunk of it
+    assert peak < 8_000_000
+    assert peak * 5 < exported_bytes
@@ -0,0 +1,153 @@
+"""
+Tests for keyset-paginated bet history in SimpleUnifiedBetService
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app, get_current_user
+from app.models.simple_unified_bet_model import BetStatus, BetType
+from app.services.simple_unified_bet_service import (
+    SimpleUnifiedBetService,
+    decode_bet_cursor,
+    encode_bet_cursor,
+)
+
+from tests.test_unified_bet_settlement import _bet_row, _insert
+
+START = datetime(2026, 9, 1, 12, 0)
+
+
+@pytest.fixture
+def service(sqlite_engine):
+    return SimpleUnifiedBetService(session_factory=sessionmaker(bind=sqlite_engine))
+
+
+@pytest.fixture
+def history(db_session):
+    """250 bets for user 1, two placed in each hour, plus noise for user 2"""
+    rows = []
+    for i in range(250):
+        rows.append(
+            _bet_row(
+                f"evt-{i}",
+                id=f"bet-{i:04d}",
+                placed_at=START + timedelta(hours=i // 2),
+                status=BetStatus.WON if i % 3 == 0 else BetStatus.PENDING,
+                bet_type=BetType.TOTAL if i % 5 == 0 else BetType.MONEYLINE,
+            )
+        )
+    rows.append(_bet_row("other", id="other-user", user_id=2, placed_at=START))
+    _insert(db_session, rows)
+    return rows
+
+
+async def _all_pages(service, **filters):
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = await service.get_user_bets_page(1, cursor=cursor, **filters)
+        ids += [bet["id"] for bet in page.bets]
+        pages += 1
+        if not page.next_cursor:
+            return ids, pages
+        cursor = page.next_cursor
+
+
+async def test_cursor_walks_every_bet_once_newest_first(service, history):
+    ids, pages = await _all_pages(service, limit=100)
+
+    assert pages == 3
+    assert len(ids) == len(set(ids)) == 250
+    # Ties on placed_at fall back to id, descending
+    assert ids[:3] == ["bet-0249", "bet-0248", "bet-0247"]
+    assert ids[-1] == "bet-0000"
+
+
+async def test_filters_run_before_paging(service, history):
+    won_totals = [
+        row["id"]
+        for row in history
+        if row["status"] == BetStatus.WON
+        and row["bet_type"] == BetType.TOTAL
+        and row["user_id"] == 1
+    ]
+
+    ids, _ = await _all_pages(service, status="won", bet_type="TOTAL", limit=5)
+    assert sorted(ids) == sorted(won_totals)
+
+    page = await service.get_user_bets_page(
+        1, start_date="2026-09-02", end_date="2026-09-02", with_total=True
+    )
+    assert page.total == 48
+    assert {bet["placed_at"][:10] for bet in page.bets} == {"2026-09-02"}
+
+
+async def test_offset_still_works_for_older_clients(service, history):
+    page = await service.get_user_bets_page(1, limit=10, offset=245)
+
+    assert [bet["id"] for bet in page.bets] == [
+        f"bet-{i:04d}" for i in range(4, -1, -1)
+    ]
+    assert page.next_cursor is None
+
+
+async def test_parlays_page_includes_legs(service, db_session):
+    parlay = _bet_row("p", id="parlay", bet_type=BetType.PARLAY, is_parlay=True)
+    legs = [
+        _bet_row(f"g{i}", id=f"leg-{i}", parent_bet_id="parlay", leg_position=i)
+        for i in (2, 1)
+    ]
+    _insert(db_session, [parlay, *legs, _bet_row("straight")])
+
+    page = await service.get_user_bets_page(1, parlays_only=True, with_legs=True)
+
+    assert [bet["id"] for bet in page.bets] == ["parlay"]
+    assert [leg["id"] for leg in page.bets[0]["legs"]] == ["leg-1", "leg-2"]
+
+
+def test_endpoints(service, history, monkeypatch):
+    monkeypatch.setattr("app.main.simple_unified_bet_service", service)
+    app.dependency_overrides[get_current_user] = lambda: {"id": 1}
+    try:
+        client = TestClient(app)
+        # Clients that predate paging still get every bet
+        everything = client.get("/api/bets").json()
+        page = client.get("/api/bets?limit=20").json()
+        history_page = client.post("/api/bets/history", json={"limit": 500}).json()
+        bad_status = client.post("/api/bets/history", json={"status": "maybe"})
+        bad_cursor = client.post("/api/bets/history", json={"cursor": "garbage"})
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert len(everything["bets"]) == 250
+    assert everything["next_cursor"] is None
+    assert len(page["bets"]) == 20 and page["next_cursor"]
+    assert len(history_page["history"]) == history_page["limit"] == 100
+    assert bad_status.status_code == bad_cursor.status_code == 400
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    placed_at = datetime(2026, 10, 18, 9, 30, 1, 250)
+    assert decode_bet_cursor(encode_bet_cursor(placed_at, "b-1")) == (placed_at, "b-1")
+    with pytest.raises(ValueError):
+        decode_bet_cursor("not-a-cursor")
+
+
+def test_history_query_uses_the_composite_index(sqlite_engine):
+    with sqlite_engine.connect() as conn:
+        plan = conn.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM simple_unified_bets "
+                "WHERE user_id = 1 AND parent_bet_id IS NULL "
+                "AND (placed_at, id) < ('2026-09-02', 'x') "
+                "ORDER BY placed_at DESC, id DESC LIMIT 51"
+            )
+        ).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_simple_unified_bets_user_top_level" in details
+    assert "TEMP B-TREE" not in details
@@ -0,0 +1,261 @@
+"""
+Tests for the bet placement fast path: daily exposure counters, cached game
+lookups and bulk parlay legs
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.main import app, require_admin
+
+from app.models.bet_models import (
+    BetType,
+    ParlayLeg,
+    PlaceBetRequest,
+    PlaceParlayRequest,
+)
+from app.models.database_models import Game, GameStatus
+from app.models.simple_unified_bet_model import (
+    BetStatus,
+    SimpleUnifiedBet,
+    UserDailyExposure,
+)
+from app.services import bet_verification_service as legacy_module
+from app.services import simple_unified_bet_service as placement_module
+from app.services.bet_exposure_service import bet_exposure_service, exposure_day
+from app.services.game_metadata_cache import GameMetadataCache
+from app.services.simple_unified_bet_service import SimpleUnifiedBetService
+from app.services.unified_bet_verification_service import (
+    UnifiedBetResult,
+    UnifiedBetVerificationService,
+)
+
+# Bets per second the placement path must sustain on in-memory SQLite; it
+# runs at close to 300 a second in CI-sized containers
+MIN_BETS_PER_SECOND = 100
+
+START = datetime.utcnow() + timedelta(hours=6)
+
+
+@pytest.fixture
+def service(sqlite_engine, db_session, monkeypatch):
+    monkeypatch.setattr(placement_module, "game_metadata_cache", GameMetadataCache())
+    for i in range(5):
+        db_session.add(
+            Game(
+                id=f"g{i}",
+                sport_key="basketball_nba",
+                sport_title="NBA",
+                home_team=f"Home {i}",
+                away_team=f"Away {i}",
+                commence_time=START,
+                status=GameStatus.SCHEDULED,
+            )
+        )
+    db_session.commit()
+    return SimpleUnifiedBetService(session_factory=sessionmaker(bind=sqlite_engine))
+
+
+def _bet(amount, game_id="g0"):
+    return PlaceBetRequest(
+        game_id=game_id,
+        bet_type=BetType.MONEYLINE,
+        selection="Home 0",
+        odds=-110,
+        amount=amount,
+        home_team="Home 0",
+        away_team="Away 0",
+        sport="basketball_nba",
+    )
+
+
+def _parlay(amount, game_ids):
+    return PlaceParlayRequest(
+        amount=amount,
+        legs=[
+            ParlayLeg(
+                game_id=game_id,
+                bet_type=BetType.MONEYLINE,
+                selection=f"Home {i}",
+                odds=150,
+            )
+            for i, game_id in enumerate(game_ids)
+        ],
+    )
+
+
+def _exposure(db, user_id=1):
+    db.expire_all()
+    return bet_exposure_service.get(db, user_id)
+
+
+async def test_daily_limit_is_enforced_from_the_counter(service, db_session):
+    assert (await service.place_bet(1, _bet(2000)))["success"]
+    assert (await service.place_parlay(1, _parlay(2000, ["g1", "g2"])))["success"]
+
+    rejected = await service.place_bet(1, _bet(1500))
+
+    assert rejected == {"success": False, "error": "Bet exceeds limits"}
+    assert _exposure(db_session) == {
+        "staked": 4000,
+        "open_stake": 4000,
+        "bet_count": 2,
+    }
+    assert (await service.place_bet(1, _bet(1000)))["success"]
+    assert (await service.place_bet(2, _bet(5000)))["success"]  # Per user
+
+
+async def test_counter_is_seeded_from_bets_placed_before_it(service, db_session):
+    db_session.add(
+        SimpleUnifiedBet(
+            id="earlier",
+            user_id=1,
+            odds_api_event_id="g0",
+            bet_type="moneyline",
+            amount=4500,
+            odds=100,
+            potential_win=4500,
+            selection="Home 0",
+            home_team="Home 0",
+            away_team="Away 0",
+            sport="basketball_nba",
+            commence_time=START,
+        )
+    )
+    db_session.commit()
+
+    assert not (await service.place_bet(1, _bet(600)))["success"]
+    assert (await service.place_bet(1, _bet(500)))["success"]
+    assert _exposure(db_session)["staked"] == 5000
+
+
+async def test_settlement_releases_the_open_stake(service, sqlite_engine, db_session):
+    placed = await service.place_bet(1, _bet(300))
+    parlay = await service.place_parlay(1, _parlay(200, ["g1", "g2"]))
+    verifier = UnifiedBetVerificationService(
+        session_factory=sessionmaker(bind=sqlite_engine)
+    )
+    results = [
+        UnifiedBetResult(placed["bet_id"], BetStatus.WON, 572.7, "won"),
+        UnifiedBetResult(parlay["leg_ids"][0], BetStatus.WON, 0, "leg won"),
+    ]
+
+    await verifier._apply_results(results, db_session)
+    # Already settled bets are not released twice
+    await verifier._apply_results(results, db_session)
+    db_session.commit()
+
+    assert _exposure(db_session) == {
+        "staked": 500,
+        "open_stake": 200,
+        "bet_count": 2,
+    }
+
+
+async def test_every_settlement_path_releases_the_open_stake(
+    service, sqlite_engine, db_session, monkeypatch
+):
+    single = await service.place_bet(1, _bet(300))
+    parlay = await service.place_parlay(1, _parlay(200, ["g1", "g2"]))
+    forced = await service.place_parlay(1, _parlay(100, ["g3", "g4"]))
+    db_session.query(SimpleUnifiedBet).filter(
+        SimpleUnifiedBet.id == forced["leg_ids"][0]
+    ).update({"status": BetStatus.LOST})
+    db_session.commit()
+    monkeypatch.setattr(legacy_module, "SessionLocal", sessionmaker(bind=sqlite_engine))
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=sqlite_engine))
+
+    # The legacy verifier settles unified bets and parlays one at a time
+    legacy = legacy_module.BetVerificationService()
+    won = legacy_module.BetResult(single["bet_id"], BetStatus.WON, 572.7, "won")
+    await legacy._settle_bet(db_session.get(SimpleUnifiedBet, single["bet_id"]), won)
+    await legacy._settle_parlay(
+        db_session.get(SimpleUnifiedBet, parlay["parlay_id"]),
+        legacy_module.BetResult(parlay["parlay_id"], BetStatus.LOST, 0, "lost"),
+    )
+    assert _exposure(db_session)["open_stake"] == 100
+
+    app.dependency_overrides[require_admin] = lambda: {"id": 1, "is_admin": True}
+    try:
+        response = TestClient(app).post(
+            "/api/admin/parlays/force-settle", json={"parlay_id": forced["parlay_id"]}
+        )
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+
+    assert response.json()["action"] == "settled_as_lost"
+    assert _exposure(db_session) == {"staked": 600, "open_stake": 0, "bet_count": 3}
+
+
+async def test_parlay_legs_are_one_insert_and_games_are_cached(
+    service, db_session, query_budget
+):
+    game_ids = [f"g{i}" for i in range(5)]
+    await service.place_parlay(1, _parlay(10, game_ids))
+
+    with query_budget(10) as scope:
+        result = await service.place_parlay(1, _parlay(10, game_ids))
+
+    assert result["success"]
+    assert not [shape for shape in scope.fingerprints if "FROM games" in shape]
+    inserts = [
+        count
+        for shape, count in scope.fingerprints.items()
+        if shape.startswith("INSERT INTO simple_unified_bets")
+    ]
+    assert inserts == [1, 1]  # The parent, then every leg in one statement
+    legs = (
+        db_session.query(SimpleUnifiedBet)
+        .filter(SimpleUnifiedBet.parent_bet_id == result["parlay_id"])
+        .order_by(SimpleUnifiedBet.leg_position)
+        .all()
+    )
+    assert [(leg.game_id, leg.home_team) for leg in legs] == [
+        (f"g{i}", f"Home {i}") for i in range(5)
+    ]
+
+
+async def test_parlay_legs_on_a_new_game_create_it_once(service, db_session):
+    parlay = PlaceParlayRequest(
+        amount=10,
+        legs=[
+            ParlayLeg(
+                game_id="new-game",
+                bet_type=BetType.SPREAD,
+                selection=selection,
+                odds=-110,
+                home_team="Home",
+                away_team="Away",
+                sport="basketball_nba",
+                commence_time=START.isoformat(),
+            )
+            for selection in ("Home -3.5", "Away +3.5")
+        ],
+    )
+
+    assert (await service.place_parlay(1, parlay))["success"]
+    assert db_session.query(Game).filter(Game.id == "new-game").count() == 1
+
+
+@pytest.mark.slow
+async def test_placement_throughput(service, db_session):
+    bets = 400
+    started = time.perf_counter()
+    for i in range(bets):
+        result = await service.place_bet(i % 20, _bet(10, game_id=f"g{i % 5}"))
+        assert result["success"]
+    elapsed = time.perf_counter() - started
+
+    rate = bets / elapsed
+    print(f"\nplace_bet: {rate:.0f} bets/sec on SQLite")
+    assert rate > MIN_BETS_PER_SECOND
+    db_session.expire_all()
+    counters = db_session.query(UserDailyExposure).filter(
+        UserDailyExposure.day == exposure_day()
+    )
+    assert sum(row.bet_count for row in counters) == bets
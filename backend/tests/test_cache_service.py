@@ -0,0 +1,184 @@
+"""
+Tests for tag-based cache invalidation
+"""
+
+import asyncio
+import contextlib
+import fnmatch
+
+import pytest
+
+from app.services.cache_service import CacheService, event_tag
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the tag paths; KEYS is off limits"""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+        self.unlink_calls = 0
+
+    async def ping(self):
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def keys(self, pattern):
+        raise AssertionError("KEYS must not be used")
+
+    async def unlink(self, *keys):
+        self.unlink_calls += 1
+        removed = 0
+        for key in keys:
+            removed += int(
+                self.data.pop(key, None) is not None
+                or self.sets.pop(key, None) is not None
+            )
+        return removed
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.data):
+            if match is None or fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def sscan_iter(self, name, count=None):
+        for member in list(self.sets.get(name, ())):
+            yield member
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def setex(self, key, seconds, value):
+        self.commands.append(("setex", key, value))
+
+    def sadd(self, name, member):
+        self.commands.append(("sadd", name, member))
+
+    def expire(self, name, seconds):
+        self.commands.append(("expire", name))
+
+    def unlink(self, *keys):
+        self.commands.append(("unlink", keys))
+
+    async def execute(self):
+        results = []
+        for command, *args in self.commands:
+            if command == "setex":
+                self.redis.data[args[0]] = args[1]
+                results.append(True)
+            elif command == "sadd":
+                self.redis.sets.setdefault(args[0], set()).add(args[1])
+                results.append(1)
+            elif command == "unlink":
+                results.append(await self.redis.unlink(*args[0]))
+            else:
+                results.append(True)
+        self.commands = []
+        return results
+
+
+async def _stop_cleanup(service):
+    task = service._memory_cache._cleanup_task
+    if task:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def _cache_service(backend):
+    service = CacheService()
+    if backend == "redis":
+        service._redis_client = FakeRedis()
+        service._redis_available = True
+    else:
+        service._redis_available = False
+    return service
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def cache(request):
+    service = _cache_service(request.param)
+    yield service
+    await _stop_cleanup(service)
+
+
+@pytest.fixture
+async def memory_cache():
+    service = _cache_service("memory")
+    yield service
+    await _stop_cleanup(service)
+
+
+async def _populate(cache):
+    for sport in ("basketball_nba", "baseball_mlb"):
+        await cache.set_odds(sport, "us", "h2h,spreads", "american", {"s": sport})
+        await cache.set_scores(sport, 1, {"s": sport})
+        await cache.set_event_odds(
+            sport, f"{sport}-evt", "us", "player_points", "american", {"s": sport}
+        )
+    await cache.set_sports_list({"sports": []})
+
+
+async def test_invalidating_a_sport_evicts_only_its_entries(cache):
+    await _populate(cache)
+
+    removed = await cache.invalidate_sport_caches("basketball_nba")
+
+    assert removed == 3
+    assert (
+        await cache.get_odds("basketball_nba", "us", "h2h,spreads", "american") is None
+    )
+    assert await cache.get_scores("basketball_nba", 1) is None
+    assert (
+        await cache.get_event_odds(
+            "basketball_nba", "basketball_nba-evt", "us", "player_points", "american"
+        )
+        is None
+    )
+    assert await cache.get_odds("baseball_mlb", "us", "h2h,spreads", "american") == {
+        "s": "baseball_mlb"
+    }
+    assert await cache.get_scores("baseball_mlb", 1) == {"s": "baseball_mlb"}
+    assert await cache.get_sports_list() == {"sports": []}
+
+
+async def test_event_and_market_tags(memory_cache):
+    await _populate(memory_cache)
+
+    assert await memory_cache.invalidate_event_caches("baseball_mlb-evt") == 1
+    assert await memory_cache.invalidate_tags("market:spreads") == 2
+    assert await memory_cache.invalidate_tags(event_tag("missing")) == 0
+    assert await memory_cache.get_scores("baseball_mlb", 1) is not None
+
+
+async def test_overwrite_and_delete_keep_tag_index_clean(memory_cache):
+    await memory_cache.set("k", {"v": 1}, tags=["sport:nba"])
+    await memory_cache.set("k", {"v": 2}, tags=["sport:nhl"])
+    assert await memory_cache.invalidate_tags("sport:nba") == 0
+
+    await memory_cache.delete("k")
+    assert memory_cache._memory_cache._tags == {}
+
+
+async def test_clear_pattern_matches_instead_of_wiping(cache):
+    await cache.set("odds_api:live_games:all", {"games": []})
+    await _populate(cache)
+
+    await cache.clear_pattern("odds_api:live_games:*")
+
+    assert await cache.get("odds_api:live_games:all") is None
+    assert await cache.get_scores("baseball_mlb", 1) is not None
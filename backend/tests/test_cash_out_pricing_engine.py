@@ -0,0 +1,320 @@
+"""
+Tests for the vectorized cash out pricing engine
+"""
+
+import time
+import uuid
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database_models import LiveBet as LiveBetDB, BetStatus, BetType
+from app.models.live_bet_models import (
+    GameStatus,
+    LiveGameUpdate,
+    LiveOddsUpdate,
+    PlaceLiveBetRequest,
+)
+from app.services import live_betting_service_db as live_module
+from app.services.cash_out_pricing_engine import (
+    CashOutPricingEngine,
+    SIDE_AWAY,
+    SIDE_HOME,
+    SIDE_NEUTRAL,
+    price_cash_out,
+    resolve_selection_side,
+)
+
+
+def _legacy_cash_out(amount, potential_win, selection, game_state):
+    """Scalar formula the engine replaced, kept here as the reference"""
+    base_value = amount
+    score_diff = game_state.home_score - game_state.away_score
+    if selection == "home":
+        if score_diff > 0:
+            base_value *= 1 + score_diff * 0.1
+        else:
+            base_value *= 1 + score_diff * 0.05
+    elif selection == "away":
+        if score_diff < 0:
+            base_value *= 1 - score_diff * 0.1
+        else:
+            base_value *= 1 - score_diff * 0.05
+    if game_state.status in [GameStatus.FOURTH_QUARTER, GameStatus.SECOND_HALF]:
+        base_value *= 1.1
+    return min(base_value, potential_win * 0.95)
+
+
+def _game_state(home_score, away_score, status=GameStatus.SECOND_QUARTER):
+    return LiveGameUpdate(
+        game_id="game-1",
+        status=status,
+        home_score=home_score,
+        away_score=away_score,
+        timestamp=datetime.utcnow(),
+    )
+
+
+def _add_bets(db, count, game_id="game-1", cash_out_value=None):
+    selections = ["home", "away", "Over 8.5", "Yankees"]
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": 1 + i % 50,
+            "game_id": game_id,
+            "bet_type": BetType.MONEYLINE,
+            "selection": selections[i % len(selections)],
+            "odds": 150.0,
+            "amount": 10.0 + i % 90,
+            "potential_win": (10.0 + i % 90) * 1.5,
+            "status": BetStatus.LIVE,
+            "cash_out_available": True,
+            "cash_out_value": cash_out_value,
+            "home_team": "Yankees",
+            "away_team": "Red Sox",
+        }
+        for i in range(count)
+    ]
+    db.execute(LiveBetDB.__table__.insert(), rows)
+    db.commit()
+    return rows
+
+
+class TestPricing:
+    """Vectorized pricing matches the original per-bet formula"""
+
+    @pytest.mark.parametrize(
+        "home_score,away_score,status",
+        [
+            (0, 0, GameStatus.FIRST_QUARTER),
+            (14, 7, GameStatus.SECOND_QUARTER),
+            (3, 10, GameStatus.FOURTH_QUARTER),
+            (21, 20, GameStatus.SECOND_HALF),
+        ],
+    )
+    def test_matches_legacy_formula(self, home_score, away_score, status):
+        state = _game_state(home_score, away_score, status)
+        selections = ["home", "away", "over"]
+        amounts = np.array([25.0, 50.0, 100.0])
+        potential = np.array([40.0, 500.0, 90.0])
+        sides = np.array([resolve_selection_side(s) for s in selections])
+
+        priced = price_cash_out(amounts, potential, sides, state)
+
+        for i, selection in enumerate(selections):
+            expected = _legacy_cash_out(amounts[i], potential[i], selection, state)
+            assert priced[i] == pytest.approx(expected)
+
+    def test_selection_side_uses_team_names(self):
+        assert resolve_selection_side("home") == SIDE_HOME
+        assert resolve_selection_side("Red Sox", "Yankees", "Red Sox") == SIDE_AWAY
+        assert resolve_selection_side("Over 8.5", "Yankees", "Red Sox") == (
+            SIDE_NEUTRAL
+        )
+
+
+class TestRepriceGame:
+    """Game-wide reprice against SQLite"""
+
+    def test_bulk_updates_and_publishes_only_changed_offers(self, db_session):
+        _add_bets(db_session, 8)
+        _add_bets(db_session, 3, game_id="other-game", cash_out_value=1.0)
+        engine = CashOutPricingEngine(publish_threshold=0.5)
+
+        first = engine.reprice_game(db_session, _game_state(3, 0))
+        db_session.commit()
+        assert first.bets_priced == 8
+        assert first.bets_updated == 8
+        assert len(first.changes) == 8
+
+        # Same state again: nothing moved, nothing written or published
+        second = engine.reprice_game(db_session, _game_state(3, 0))
+        assert second.bets_updated == 0
+        assert second.changes == []
+
+        # Bets on other games are untouched
+        other = db_session.query(LiveBetDB).filter_by(game_id="other-game").all()
+        assert all(bet.cash_out_value == 1.0 for bet in other)
+
+    def test_threshold_suppresses_small_moves(self, db_session):
+        _add_bets(db_session, 4)
+        engine = CashOutPricingEngine(publish_threshold=1000.0)
+        engine.reprice_game(db_session, _game_state(0, 0))
+        db_session.commit()
+
+        result = engine.reprice_game(db_session, _game_state(1, 0))
+        db_session.commit()
+        assert result.bets_updated > 0
+        assert result.changes == []
+
+    def test_small_moves_publish_once_they_add_up(self, db_session):
+        _add_bets(db_session, 1)  # $10 on the home side
+        engine = CashOutPricingEngine(publish_threshold=1.5)
+        engine.reprice_game(db_session, _game_state(0, 0))
+
+        one_point = engine.reprice_game(db_session, _game_state(1, 0))
+        two_points = engine.reprice_game(db_session, _game_state(2, 0))
+
+        assert one_point.bets_updated == 1
+        assert one_point.changes == []
+        # Measured from the $10 last published, not the $11 stored
+        assert [(c.old_value, c.new_value) for c in two_points.changes] == [
+            (10.0, 12.0)
+        ]
+
+    def test_skips_settled_and_unavailable_bets(self, db_session):
+        rows = _add_bets(db_session, 3)
+        db_session.query(LiveBetDB).filter_by(id=rows[0]["id"]).update(
+            {"status": BetStatus.CASHED_OUT}
+        )
+        db_session.query(LiveBetDB).filter_by(id=rows[1]["id"]).update(
+            {"cash_out_available": False}
+        )
+        db_session.commit()
+
+        result = CashOutPricingEngine().reprice_game(db_session, _game_state(7, 0))
+        assert result.bets_priced == 1
+
+
+class TestLiveBettingService:
+    """Game updates reaching the bets through the live betting service"""
+
+    def test_game_updates_reach_and_settle_open_bets(
+        self, sqlite_engine, db_session, monkeypatch
+    ):
+        monkeypatch.setattr(live_module, "SessionLocal", sessionmaker(sqlite_engine))
+        home, away = _add_bets(db_session, 2)
+        service = live_module.LiveBettingServiceDB()
+
+        service.update_game_state(_game_state(14, 7, GameStatus.THIRD_QUARTER))
+        db_session.expire_all()
+        bet = db_session.get(LiveBetDB, home["id"])
+        assert (bet.current_game_status, bet.current_home_score) == ("3rd_quarter", 14)
+        assert bet.cash_out_value == 15 * 0.95  # Capped below the potential win
+        model = service._db_bet_to_model(bet)
+        assert model.current_game_status == GameStatus.THIRD_QUARTER
+        assert (model.current_home_score, model.current_away_score) == (14, 7)
+
+        service.update_game_state(_game_state(21, 7, GameStatus.FINAL))
+        db_session.expire_all()
+        home_bet = db_session.get(LiveBetDB, home["id"])
+        away_bet = db_session.get(LiveBetDB, away["id"])
+        assert (home_bet.status, home_bet.result_amount) == (BetStatus.WON, 25.0)
+        assert (away_bet.status, away_bet.result_amount) == (BetStatus.LOST, 0)
+        assert home_bet.current_game_status == "final"
+
+    def test_placed_bets_are_priced_and_settled_by_their_selection(
+        self, sqlite_engine, db_session, monkeypatch
+    ):
+        monkeypatch.setattr(live_module, "SessionLocal", sessionmaker(sqlite_engine))
+        service = live_module.LiveBettingServiceDB()
+        service.game_details_cache["game-1"] = ("Yankees", "Red Sox", "MLB")
+        service.live_games["game-1"] = _game_state(2, 1, GameStatus.THIRD_QUARTER)
+        service.live_odds["game-1"] = LiveOddsUpdate(
+            game_id="game-1",
+            bet_type="moneyline",
+            home_odds=-150,
+            away_odds=130,
+            spread=-1.5,
+            total=8.5,
+            timestamp=datetime.utcnow(),
+        )
+
+        placed = {}
+        for bet_type, selection, odds in (
+            ("moneyline", "home", -150),
+            ("moneyline", "away", 130),
+            ("spread", "away", 110),
+            ("total", "over", 100),
+            ("total", "under", 100),
+        ):
+            response = service.place_live_bet(
+                1,
+                PlaceLiveBetRequest(
+                    game_id="game-1",
+                    bet_type=bet_type,
+                    selection=selection,
+                    odds=odds,
+                    amount=10,
+                ),
+            )
+            assert response.success, response.error
+            placed[(bet_type, selection)] = response.bet.id
+
+        bets = {
+            key: db_session.get(LiveBetDB, bet_id) for key, bet_id in placed.items()
+        }
+        assert [bet.selection for bet in bets.values()] == [
+            "Yankees",
+            "Red Sox",
+            "Red Sox +1.5",
+            "Over 8.5",
+            "Under 8.5",
+        ]
+
+        # Stored selections are team names, priced from their own side
+        odds = service.live_odds["game-1"]
+        assert [
+            service._get_market_odds(
+                odds, bet.bet_type, bet.selection, bet.home_team, bet.away_team
+            )
+            for bet in list(bets.values())[:2]
+        ] == [-150, 130]
+        moved = service.place_live_bet(
+            1,
+            PlaceLiveBetRequest(
+                game_id="game-1",
+                bet_type="moneyline",
+                selection="home",
+                odds=-110,
+                amount=10,
+            ),
+        )
+        assert (moved.success, moved.new_odds) == (False, -150)
+
+        # Yankees win 5-4: the Red Sox cover +1.5 and 9 runs go over 8.5
+        service.update_game_state(_game_state(5, 4, GameStatus.FINAL))
+        db_session.expire_all()
+        settled = {
+            key: (bet.status, round(bet.result_amount, 2)) for key, bet in bets.items()
+        }
+        assert settled == {
+            ("moneyline", "home"): (BetStatus.WON, round(10 + 10 * 100 / 150, 2)),
+            ("moneyline", "away"): (BetStatus.LOST, 0),
+            ("spread", "away"): (BetStatus.WON, 21.0),
+            ("total", "over"): (BetStatus.WON, 20.0),
+            ("total", "under"): (BetStatus.LOST, 0),
+        }
+
+
+@pytest.mark.slow
+class TestRepriceBenchmark:
+    """Reprice 100k open bets on a single game"""
+
+    def test_reprice_100k_open_bets(self, db_session):
+        _add_bets(db_session, 100_000)
+        engine = CashOutPricingEngine()
+
+        started = time.perf_counter()
+        result = engine.reprice_game(db_session, _game_state(10, 3))
+        db_session.commit()
+        elapsed = time.perf_counter() - started
+
+        print(f"\nRepriced {result.bets_priced} bets in {elapsed * 1000:.0f}ms")
+        assert result.bets_priced == 100_000
+        assert elapsed < 10.0
+
+    def test_price_100k_in_memory(self):
+        count = 100_000
+        amounts = np.random.default_rng(7).uniform(5, 500, count)
+        potential = amounts * 1.8
+        sides = np.arange(count, dtype=np.int8) % 3
+
+        started = time.perf_counter()
+        price_cash_out(amounts, potential, sides, _game_state(10, 3))
+        elapsed = time.perf_counter() - started
+
+        print(f"\nPriced {count} bets in memory in {elapsed * 1000:.2f}ms")
+        assert elapsed < 0.1
@@ -0,0 +1,300 @@
+"""
+Tests for the league context snapshots shared by the trade engines
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import get_db
+from app.core.deps import get_current_user
+from app.main import app
+from app.models.database_models import SleeperLeague, SleeperRoster, User
+from app.models.fantasy_models import (
+    DraftPick,
+    FantasyLeague,
+    FantasyPlatform,
+    FantasyPlayer,
+    FantasyPosition,
+    FantasyRosterSpot,
+    FantasyTeam,
+    FantasyUser,
+    PlayerValue,
+    TeamNeedsAnalysis,
+    Trade,
+    TradeStatus,
+)
+from app.services.league_context import CURRENT_WEEK, league_context_cache
+from app.services.trade_analyzer_service import TradeAnalyzerService
+from app.services.trade_recommendation_engine import TradeRecommendationEngine
+
+TEAMS = 10
+
+# Every team rosters two QBs, four RBs, three WRs and a TE
+ROSTER = ["QB", "QB", "RB", "RB", "RB", "RB", "WR", "WR", "WR", "TE"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    league_context_cache.invalidate()
+    yield
+    league_context_cache.invalidate()
+
+
+def _seed(db):
+    db.add(User(id=1, email="owner@example.com", username="owner", password_hash="x"))
+    db.add(
+        FantasyUser(
+            id=1, user_id=1, platform=FantasyPlatform.SLEEPER, platform_user_id="u1"
+        )
+    )
+    db.add(
+        FantasyLeague(
+            id=1,
+            fantasy_user_id=1,
+            platform=FantasyPlatform.SLEEPER,
+            platform_league_id="L1",
+            name="League",
+            season=2025,
+            team_count=TEAMS,
+            playoff_teams=4,
+        )
+    )
+    player_id = 0
+    for team_id in range(1, TEAMS + 1):
+        db.add(
+            FantasyTeam(
+                id=team_id,
+                league_id=1,
+                platform_team_id=str(team_id),
+                name=f"Team {team_id}",
+                wins=team_id % 7,
+                points_for=1000 + team_id,
+            )
+        )
+        for position in ROSTER:
+            player_id += 1
+            db.add(
+                FantasyPlayer(
+                    id=player_id,
+                    platform=FantasyPlatform.SLEEPER,
+                    platform_player_id=f"p{player_id}",
+                    name=f"Player {player_id}",
+                    position=FantasyPosition(position),
+                    age=22 + player_id % 12,
+                )
+            )
+            db.add(
+                FantasyRosterSpot(
+                    team_id=team_id,
+                    player_id=player_id,
+                    position=FantasyPosition(position),
+                )
+            )
+            for week in (6, 7):
+                db.add(
+                    PlayerValue(
+                        player_id=player_id,
+                        league_id=1,
+                        week=week,
+                        season=2025,
+                        rest_of_season_value=week + player_id % 25,
+                    )
+                )
+        db.add(
+            DraftPick(
+                league_id=1,
+                current_owner_team_id=team_id,
+                original_owner_team_id=team_id,
+                season=2026,
+                round_number=1,
+            )
+        )
+    # Only the analysis from before the snapshot's week counts
+    for week, need in ((5, 5), (9, 1)):
+        db.add(
+            TeamNeedsAnalysis(
+                team_id=1, week=week, season=2025, position_needs={"TE": need}
+            )
+        )
+    db.add(
+        SleeperLeague(
+            id=1,
+            user_id=1,
+            sleeper_league_id="L1",
+            name="League",
+            season=2025,
+            total_rosters=TEAMS,
+        )
+    )
+    # Sleeper has team 1 unbeaten
+    db.add(
+        SleeperRoster(league_id=1, sleeper_roster_id="1", sleeper_owner_id="u1", wins=8)
+    )
+    db.commit()
+
+
+def test_snapshot_is_built_once_with_batched_queries(db_session, query_budget):
+    _seed(db_session)
+
+    with query_budget(9, max_repeats=1):
+        league = league_context_cache.get(db_session, 1)
+    with query_budget(0):
+        assert league_context_cache.get(db_session, 1) is league
+
+    assert [team.team_id for team in league.teams[:3]] == [6, 5, 4]
+    assert league.settings()["playoff_race"] == {
+        "in_playoffs": 4,
+        "bubble_teams": 2,
+        "eliminated": 4,
+    }
+    team = league.team(1)
+    assert team.position_counts() == {"QB": 2, "RB": 4, "WR": 3, "TE": 1}
+    assert team.needs["position_needs"] == {"TE": 5}
+    assert team.sleeper_record["wins"] == 8
+    assert league.player_values[1] == 7 + 1
+    assert league.owner_of(11).team_id == 2
+    assert [pick.round_number for pick in team.picks] == [1]
+
+
+def test_engines_share_the_snapshot(db_session, query_budget):
+    _seed(db_session)
+    engine = TradeRecommendationEngine(db_session)
+
+    with query_budget(60) as cold:
+        engine.find_mutual_benefit_trades(1, 1)
+    # Every team's context came from the snapshot
+    with query_budget(20, max_repeats=2) as warm:
+        engine.find_mutual_benefit_trades(1, 1)
+        league_context = engine.trade_analyzer._get_league_context(1)
+        team_context = engine.trade_analyzer._get_team_context(2, league_context)
+
+    print(
+        f"\nmutual benefit trades: {cold.query_count} queries cold, {warm.query_count} warm"
+    )
+    assert (
+        team_context["team_rank"]
+        == league_context_cache.get(db_session, 1).team(2).rank
+    )
+    assert team_context["roster_composition"]["total_players"] == len(ROSTER)
+
+    recommendations = engine._get_comprehensive_team_context(1, 1)
+    assert recommendations["competitive_analysis"]["team_rank"] == 1
+    assert recommendations["position_needs"]["TE"] == 5
+
+
+def test_accepting_a_trade_refreshes_the_league(db_session):
+    _seed(db_session)
+    analyzer = TradeAnalyzerService(db_session)
+    before = league_context_cache.get(db_session, 1)
+    trade = Trade(
+        league_id=1,
+        team1_id=1,
+        team2_id=2,
+        proposed_by_team_id=1,
+        status=TradeStatus.PROPOSED,
+        team1_gives={"players": [1], "picks": []},
+        team2_gives={"players": [11, 12], "picks": [2]},
+    )
+    db_session.add(trade)
+    db_session.commit()
+
+    assert analyzer.accept_trade(trade.id)["success"]
+    after = league_context_cache.get(db_session, 1)
+
+    assert after is not before
+    assert before.owner_of(1).team_id == 1
+    assert after.owner_of(1).team_id == 2
+    assert after.team(1).position_counts()["QB"] == 3
+    assert [pick.id for pick in after.team(1).picks] == [1, 2]
+    assert analyzer.accept_trade(trade.id) == {
+        "success": False,
+        "error": "Trade is already accepted",
+    }
+
+
+def test_accepting_a_trade_keeps_past_weeks_roster_history(db_session):
+    _seed(db_session)
+    weekly = {
+        week: FantasyRosterSpot(
+            team_id=1, player_id=1, position=FantasyPosition.QB, week=week
+        )
+        for week in (CURRENT_WEEK - 1, CURRENT_WEEK, CURRENT_WEEK + 1)
+    }
+    db_session.add_all(weekly.values())
+    trade = Trade(
+        league_id=1,
+        team1_id=1,
+        team2_id=2,
+        proposed_by_team_id=1,
+        status=TradeStatus.PROPOSED,
+        team1_gives={"players": [1]},
+        team2_gives={"players": [11]},
+    )
+    db_session.add(trade)
+    db_session.commit()
+
+    assert TradeAnalyzerService(db_session).accept_trade(trade.id)["success"]
+    db_session.expire_all()
+
+    past = weekly[CURRENT_WEEK - 1]
+    assert (past.team_id, past.position) == (1, FantasyPosition.QB)
+    for week in (CURRENT_WEEK, CURRENT_WEEK + 1):
+        assert (weekly[week].team_id, weekly[week].position) == (
+            2,
+            FantasyPosition.BENCH,
+        )
+    season_long = (
+        db_session.query(FantasyRosterSpot)
+        .filter(FantasyRosterSpot.player_id == 1, FantasyRosterSpot.week.is_(None))
+        .one()
+    )
+    assert season_long.team_id == 2
+
+
+def test_trade_is_accepted_by_the_receiving_owner_with_assets_still_held(
+    db_session,
+):
+    _seed(db_session)
+    db_session.get(FantasyTeam, 2).is_user_team = True
+    trades = [
+        Trade(
+            league_id=1,
+            team1_id=1,
+            team2_id=2,
+            proposed_by_team_id=1,
+            status=TradeStatus.PROPOSED,
+            team1_gives={"players": [1]},
+            team2_gives={"players": [11]},
+        ),
+        # Player 1 is gone by the time this one is accepted
+        Trade(
+            league_id=1,
+            team1_id=1,
+            team2_id=2,
+            proposed_by_team_id=1,
+            status=TradeStatus.PROPOSED,
+            team1_gives={"players": [1]},
+            team2_gives={"players": [12]},
+        ),
+    ]
+    db_session.add_all(trades)
+    db_session.commit()
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        client = TestClient(app)
+        url = "/api/v1/fantasy/trade-analyzer/trades/{}/accept"
+        app.dependency_overrides[get_current_user] = lambda: {"user_id": 2}
+        stranger = client.post(url.format(trades[0].id))
+        app.dependency_overrides[get_current_user] = lambda: {"user_id": 1}
+        accepted = client.post(url.format(trades[0].id))
+        stale = client.post(url.format(trades[1].id))
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert stranger.status_code == 404
+    assert accepted.status_code == 200 and accepted.json()["status"] == "accepted"
+    assert stale.status_code == 409
+    assert stale.json()["detail"] == "Team 1 doesn't own specified assets"
+    assert league_context_cache.get(db_session, 1).owner_of(12).team_id == 2
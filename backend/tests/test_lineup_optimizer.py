@@ -0,0 +1,287 @@
+"""
+Tests for the optimal lineup solver and league lineups
+"""
+
+import random
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.main import app
+from app.models.fantasy_models import (
+    FantasyLeague,
+    FantasyMatchup,
+    FantasyPlatform,
+    FantasyPlayer,
+    FantasyPosition,
+    FantasyRosterSpot,
+    FantasyTeam,
+    FantasyUser,
+    PlayerAnalytics,
+)
+from app.services.fantasy_analytics_service import FantasyAnalyticsService
+from app.services.lineup_optimizer import (
+    FLEX_SLOTS,
+    league_slots,
+    optimal_lineup,
+    optimal_lineups,
+)
+
+# Lineups a second the solver has to sustain for full-size rosters
+MIN_LINEUPS_PER_SECOND = 1000
+
+SUPERFLEX_LINEUP = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "SUPER_FLEX", "BN"]
+
+
+def _player(position, points, name=None):
+    return {
+        "name": name or f"{position} {points}",
+        "position": position,
+        "projected_points": points,
+        "floor": points * 0.6,
+        "ceiling": points * 1.5,
+    }
+
+
+def _random_roster(rng, size):
+    return [
+        _player(rng.choice(["QB", "RB", "WR", "TE", "K"]), round(rng.uniform(0, 30), 1))
+        for _ in range(size)
+    ]
+
+
+def _brute_force(players, slots):
+    """Best total over every assignment of players (or nobody) to slots"""
+    starting = [slot for slot in slots if slot != "BN"]
+
+    def accepts(slot, player):
+        return player["position"] == slot or player["position"] in FLEX_SLOTS.get(
+            slot, ()
+        )
+
+    def best(i, used):
+        if i == len(starting):
+            return 0.0
+        result = best(i + 1, used)
+        for j, player in enumerate(players):
+            if j not in used and accepts(starting[i], player):
+                result = max(
+                    result, player["projected_points"] + best(i + 1, used | {j})
+                )
+        return result
+
+    return best(0, frozenset())
+
+
+def test_matches_brute_force_on_random_rosters():
+    rng = random.Random(3)
+    slot_sets = [
+        ["QB", "RB", "WR", "FLEX", "BN"],
+        ["QB", "RB", "FLEX", "SUPER_FLEX"],
+        ["RB", "WR", "TE", "WRRB_FLEX", "REC_FLEX"],
+    ]
+    for _ in range(60):
+        slots = rng.choice(slot_sets)
+        players = _random_roster(rng, rng.randint(0, 8))
+
+        lineup = optimal_lineup(players, slots)
+
+        assert lineup.total == pytest.approx(_brute_force(players, slots))
+        assert len(lineup.slots) + len(lineup.bench) == len(players)
+        for slot, player in lineup.slots:
+            assert player["position"] == slot or player["position"] in FLEX_SLOTS[slot]
+
+
+def test_own_slots_fill_before_flex_and_superflex_takes_the_best_left():
+    players = [
+        _player("QB", 24),
+        _player("QB", 20),
+        _player("RB", 15),
+        _player("RB", 12),
+        _player("RB", 11),
+        _player("WR", 14),
+        _player("WR", 13),
+        _player("WR", 9),
+        _player("TE", 8),
+        _player("TE", 10),
+    ]
+
+    lineup = optimal_lineup(players, SUPERFLEX_LINEUP)
+    by_slot = [(slot, player["name"]) for slot, player in lineup.slots]
+
+    assert by_slot == [
+        ("QB", "QB 24"),
+        ("RB", "RB 15"),
+        ("RB", "RB 12"),
+        ("WR", "WR 14"),
+        ("WR", "WR 13"),
+        ("TE", "TE 10"),
+        ("FLEX", "RB 11"),
+        ("SUPER_FLEX", "QB 20"),
+    ]
+    assert lineup.total == pytest.approx(119)
+    assert {player["name"] for player in lineup.bench} == {"WR 9", "TE 8"}
+    # Empty slots stay empty rather than taking an ineligible player
+    assert [slot for slot, _ in optimal_lineup(players[:2], ["QB", "K"]).slots] == [
+        "QB"
+    ]
+
+
+def test_floor_and_ceiling_objectives_pick_different_lineups():
+    steady = {"name": "steady", "position": "WR", "floor": 10, "ceiling": 14}
+    boom = {"name": "boom", "position": "WR", "floor": 2, "ceiling": 30}
+
+    floor = optimal_lineup([steady, boom], ["WR", "BN"], "floor")
+    ceiling = optimal_lineup([steady, boom], ["WR", "BN"], "ceiling")
+    custom = optimal_lineup(
+        [steady, boom], ["WR"], lambda p: (p["floor"] + p["ceiling"]) / 2
+    )
+
+    assert floor.starters == [steady] and floor.total == 10
+    assert ceiling.starters == [boom] and ceiling.total == 30
+    assert custom.starters == [boom]
+
+
+def test_league_slots_and_lineups_for_every_team():
+    rng = random.Random(8)
+    rosters = {team: _random_roster(rng, 15) for team in range(12)}
+    slots = league_slots(None)
+
+    lineups = optimal_lineups(rosters, slots)
+
+    assert league_slots(["QB", "BN"]) == ["QB", "BN"]
+    assert slots[-1] == "DEF"
+    assert list(lineups) == list(rosters)
+    for team, lineup in lineups.items():
+        assert lineup.total == pytest.approx(optimal_lineup(rosters[team]).total)
+        assert lineup.to_dict()["starters"][0]["slot"] == "QB"
+
+
+def _seed_league(db):
+    db.add(
+        FantasyUser(
+            id=1, user_id=5, platform=FantasyPlatform.SLEEPER, platform_user_id="u5"
+        )
+    )
+    db.add(
+        FantasyLeague(
+            id=1,
+            fantasy_user_id=1,
+            platform=FantasyPlatform.SLEEPER,
+            platform_league_id="l1",
+            name="League",
+            season=2025,
+            scoring_type="ppr",
+            sync_enabled=True,
+            roster_positions=["QB", "WR", "FLEX", "BN"],
+        )
+    )
+    # Per team: (position, points) with a steady WR and a boom-or-bust one
+    rosters = {
+        1: [("QB", [20] * 6), ("WR", [12] * 6), ("WR", [2, 30] * 3), ("RB", [8] * 6)],
+        2: [("QB", [15] * 6), ("WR", [10] * 6), ("TE", [9] * 6)],
+    }
+    player_id = 0
+    for team_id, players in rosters.items():
+        db.add(
+            FantasyTeam(
+                id=team_id,
+                league_id=1,
+                platform_team_id=str(team_id),
+                name=f"Team {team_id}",
+            )
+        )
+        for position, games in players:
+            player_id += 1
+            db.add(
+                FantasyPlayer(
+                    id=player_id,
+                    platform=FantasyPlatform.SLEEPER,
+                    platform_player_id=str(player_id),
+                    name=f"Player {player_id}",
+                    position=FantasyPosition(position),
+                )
+            )
+            db.add(
+                FantasyRosterSpot(
+                    team_id=team_id,
+                    player_id=player_id,
+                    position=FantasyPosition(position),
+                )
+            )
+            for week, points in enumerate(games, start=1):
+                db.add(
+                    PlayerAnalytics(
+                        player_id=player_id, season=2025, week=week, ppr_points=points
+                    )
+                )
+    db.add(FantasyMatchup(league_id=1, week=7, team1_id=1, team2_id=2))
+    db.commit()
+
+
+def test_league_lineups_for_a_matchup_preview(db_session):
+    _seed_league(db_session)
+    service = FantasyAnalyticsService(db_session)
+
+    preview = service.get_league_lineups(1, week=7)
+    floor = service.get_league_lineups(1, week=7, objective="floor")
+
+    team1, team2 = preview["teams"]
+    assert [p["slot"] for p in team1["starters"]] == ["QB", "WR", "FLEX"]
+    assert [p["player_id"] for p in team1["bench"]] == [4]
+    assert [p["slot"] for p in team2["starters"]] == ["QB", "WR", "FLEX"]
+    assert preview["matchups"] == [
+        {
+            "team1_id": 1,
+            "team2_id": 2,
+            "team1_total": team1["total"],
+            "team2_total": team2["total"],
+            "projected_margin": round(team1["total"] - team2["total"], 2),
+        }
+    ]
+    # The boom-or-bust WR loses the FLEX spot when playing for a floor
+    assert 3 in [p["player_id"] for p in team1["starters"]]
+    assert 3 in [p["player_id"] for p in floor["teams"][0]["bench"]]
+
+
+def test_league_lineups_endpoint(db_session):
+    _seed_league(db_session)
+    app.dependency_overrides[get_current_user] = lambda: {"id": 5}
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        client = TestClient(app)
+        response = client.get(
+            "/api/fantasy/analytics/league/1/lineups?week=7&objective=ceiling"
+        )
+        bad_objective = client.get(
+            "/api/fantasy/analytics/league/1/lineups?week=7&objective=median"
+        )
+        not_mine = client.get("/api/fantasy/analytics/league/2/lineups?week=7")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["objective"] == "ceiling"
+    assert [team["team_id"] for team in body["teams"]] == [1, 2]
+    assert len(body["matchups"]) == 1
+    assert bad_objective.status_code == 400
+    assert not_mine.status_code == 404
+
+
+@pytest.mark.slow
+def test_lineup_solver_throughput():
+    rng = random.Random(1)
+    rosters = [_random_roster(rng, 16) for _ in range(1000)]
+
+    started = time.perf_counter()
+    for players in rosters:
+        optimal_lineup(players, SUPERFLEX_LINEUP)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n1,000 lineups in {elapsed:.3f}s ({1000 / elapsed:.0f}/sec)")
+    assert 1000 / elapsed > MIN_LINEUPS_PER_SECOND
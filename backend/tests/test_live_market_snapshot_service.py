@@ -0,0 +1,162 @@
+"""
+Tests for the live betting market snapshot service
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.models.live_bet_models import GameStatus, LiveBettingMarket
+from app.services.live_betting_service_db import LiveBettingServiceDB
+from app.services.live_market_snapshot_service import LiveMarketSnapshotService
+from app.services.odds_api_service import SportKey
+
+
+class FakeOddsAPIService:
+    """Stands in for an Odds API session; each live fetch costs 3 credits"""
+
+    def __init__(self, api_key):
+        self.credits_spent = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeLiveService(LiveBettingServiceDB):
+    """Live betting service with a canned upstream"""
+
+    def __init__(self, live_sports):
+        super().__init__()
+        self.live_sports = live_sports
+        self.fetch_calls = []
+
+    async def fetch_sport_live_markets(self, odds_service, sport_key):
+        self.fetch_calls.append(sport_key.value)
+        await asyncio.sleep(0)
+        if sport_key.value not in self.live_sports:
+            odds_service.credits_spent += 1
+            return []
+        odds_service.credits_spent += 3
+        return [
+            LiveBettingMarket(
+                game_id=f"{sport_key.value}-1",
+                sport=sport_key.value,
+                home_team="Home",
+                away_team="Away",
+                game_status=GameStatus.SECOND_QUARTER,
+                home_score=7,
+                away_score=3,
+                markets_available=["moneyline"],
+                last_updated=datetime.utcnow(),
+            )
+        ]
+
+
+class FakePlanner:
+    """Quota plan with live odds due for the sports in `due`"""
+
+    def __init__(self, due):
+        self.due = due
+        self.refreshed = []
+
+    async def refresh(self):
+        return None
+
+    def is_due(self, sport_key, kind, now=None):
+        return kind == "live_odds" and sport_key in self.due
+
+    def mark_refreshed(self, sport_key, kind, at=None):
+        self.refreshed.append((sport_key, kind))
+
+
+@pytest.fixture
+def snapshot_service():
+    live_service = FakeLiveService({SportKey.BASKETBALL_NBA.value})
+    service = LiveMarketSnapshotService(
+        live_service,
+        live_interval_seconds=60,
+        idle_interval_seconds=900,
+        planner=FakePlanner({SportKey.BASKETBALL_NBA.value}),
+    )
+    with patch(
+        "app.services.live_market_snapshot_service.OddsAPIService",
+        FakeOddsAPIService,
+    ):
+        yield service
+
+
+async def test_cold_requests_share_one_refresh(snapshot_service):
+    results = await asyncio.gather(
+        *[snapshot_service.get_markets("basketball_nba") for _ in range(5)]
+    )
+
+    assert all(len(markets) == 1 for markets in results)
+    assert snapshot_service.live_service.fetch_calls == ["basketball_nba"]
+
+
+async def test_warm_requests_are_served_from_memory(snapshot_service):
+    await snapshot_service.get_markets()
+    await snapshot_service.get_markets()
+    await snapshot_service.get_markets("baseball_mlb")
+
+    assert len(snapshot_service.live_service.fetch_calls) == 3
+    assert snapshot_service.oldest_age_seconds() is not None
+
+
+async def test_cadence_and_cost_tracking(snapshot_service):
+    await snapshot_service.refresh_due()
+
+    nba = snapshot_service.snapshots["basketball_nba"]
+    mlb = snapshot_service.snapshots["baseball_mlb"]
+    assert nba.next_refresh_at - nba.refreshed_at == timedelta(seconds=60)
+    assert mlb.next_refresh_at - mlb.refreshed_at == timedelta(seconds=900)
+
+    status = snapshot_service.get_status()
+    assert status["sports"]["basketball_nba"]["last_refresh_credits"] == 3
+    assert status["sports"]["baseball_mlb"]["last_refresh_credits"] == 1
+    assert status["total_credits"] == 5
+
+
+async def test_refresh_due_only_refreshes_expired_sports(snapshot_service):
+    await snapshot_service.refresh_due()
+    snapshot_service.snapshots["basketball_nba"].next_refresh_at = (
+        datetime.utcnow() - timedelta(seconds=1)
+    )
+
+    refreshed = await snapshot_service.refresh_due()
+
+    assert refreshed == 1
+    assert snapshot_service.live_service.fetch_calls.count("basketball_nba") == 2
+
+
+async def test_quota_plan_governs_refreshes(snapshot_service):
+    await snapshot_service.refresh_due()
+    assert ("basketball_nba", "live_odds") in snapshot_service.planner.refreshed
+    past = datetime.utcnow() - timedelta(seconds=1)
+    for snapshot in snapshot_service.snapshots.values():
+        snapshot.next_refresh_at = past
+    snapshot_service.planner.due = set()
+
+    assert await snapshot_service.refresh_due() == 0
+    assert snapshot_service.live_service.fetch_calls.count("basketball_nba") == 1
+    # Checked against the plan again one live interval later
+    nba = snapshot_service.snapshots["basketball_nba"]
+    assert nba.next_refresh_at > datetime.utcnow() + timedelta(seconds=50)
+
+
+async def test_failed_refresh_keeps_previous_markets(snapshot_service):
+    await snapshot_service.get_markets("basketball_nba")
+
+    async def boom(odds_service, sport_key):
+        raise RuntimeError("upstream down")
+
+    snapshot_service.live_service.fetch_sport_live_markets = boom
+    snapshot = await snapshot_service.refresh_sport(SportKey.BASKETBALL_NBA)
+
+    assert len(snapshot.markets) == 1
+    assert snapshot.last_error == "upstream down"
@@ -0,0 +1,121 @@
+"""
+Tests for the metrics registry, request middleware and /metrics endpoint
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.metrics import (
+    MetricsMiddleware,
+    MetricsRegistry,
+    http_request_duration,
+    http_request_errors,
+)
+from app.main import app
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram(
+        "job_seconds", "Job time", ("job",), buckets=(0.1, 1.0)
+    )
+    runs = registry.counter("job_runs_total", "Job runs", ("job",))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.observe(value, "sync")
+    runs.inc("sync")
+    runs.inc("sync", amount=2)
+
+    text = registry.render()
+
+    assert "# TYPE job_seconds histogram" in text
+    assert 'job_seconds_bucket{job="sync",le="0.1"} 1' in text
+    assert 'job_seconds_bucket{job="sync",le="1"} 3' in text
+    assert 'job_seconds_bucket{job="sync",le="+Inf"} 4' in text
+    assert 'job_seconds_sum{job="sync"} 4.05' in text
+    assert 'job_seconds_count{job="sync"} 4' in text
+    assert 'job_runs_total{job="sync"} 3' in text
+    assert registry.counter("job_runs_total", "Job runs", ("job",)) is runs
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("odd_total", "Odd labels", ("name",)).inc('say "hi"\n')
+
+    assert 'odd_total{name="say \\"hi\\"\\n"} 1' in registry.render()
+
+
+def test_requests_are_recorded_by_route_template():
+    client = TestClient(app)
+    before = http_request_duration.count("GET", "/health", "200")
+    client.get("/health")
+    client.get("/health")
+    client.get("/no/such/path")
+
+    assert http_request_duration.count("GET", "/health", "200") == before + 2
+    assert http_request_duration.count("GET", "(unmatched)", "404") >= 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+        in response.text
+    )
+    assert "http_requests_in_progress" in response.text
+
+
+async def test_exceptions_count_as_errors():
+    async def failing_app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    middleware = MetricsMiddleware(failing_app)
+    before = http_request_errors.value("GET", "(unmatched)")
+    with pytest.raises(RuntimeError):
+        await middleware(_http_scope(), _receive, _send)
+
+    assert http_request_errors.value("GET", "(unmatched)") == before + 1
+
+
+def _http_scope():
+    return {"type": "http", "method": "GET", "path": "/bench", "headers": []}
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+async def _plain_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"ok": true}'})
+
+
+@pytest.mark.slow
+def test_middleware_overhead_is_under_50_microseconds():
+    middleware = MetricsMiddleware(_plain_app)
+    requests = 20_000
+
+    async def run(handler):
+        started = time.perf_counter()
+        for _ in range(requests):
+            await handler(_http_scope(), _receive, _send)
+        return time.perf_counter() - started
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run(middleware))  # warm up
+        # Best of three to ride out scheduler noise
+        bare = min(loop.run_until_complete(run(_plain_app)) for _ in range(3))
+        wrapped = min(loop.run_until_complete(run(middleware)) for _ in range(3))
+    finally:
+        loop.close()
+
+    overhead_us = (wrapped - bare) / requests * 1e6
+    print(f"\nMetrics middleware overhead: {overhead_us:.2f}us per request")
+    assert overhead_us < 50
@@ -0,0 +1,215 @@
+"""
+Tests for the compact Game odds encoding
+"""
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from app.models.database_models import Game
+from app.models.odds_codec import (
+    decode_odds,
+    decode_odds_dicts,
+    encode_odds,
+    odds_market_keys,
+)
+
+GAME_LINES = ("h2h", "spreads", "totals")
+
+BOOKMAKERS = [
+    ("draftkings", "DraftKings"),
+    ("fanduel", "FanDuel"),
+    ("betmgm", "BetMGM"),
+    ("caesars", "Caesars"),
+    ("pointsbetus", "PointsBet (US)"),
+    ("betrivers", "BetRivers"),
+    ("bovada", "Bovada"),
+    ("mybookieag", "MyBookie.ag"),
+]
+
+
+def _odds_payload(home="Kansas City Chiefs", away="Buffalo Bills", props=True):
+    """Bookmaker list shaped like games_sync_service stores it"""
+    bookmakers = []
+    for i, (key, title) in enumerate(BOOKMAKERS):
+        updated = f"2026-10-18T17:{i:02d}:41Z"
+        markets = [
+            {
+                "key": "h2h",
+                "last_update": updated,
+                "outcomes": [
+                    {"name": home, "price": -150 - i},
+                    {"name": away, "price": 130 + i},
+                ],
+            },
+            {
+                "key": "spreads",
+                "last_update": updated,
+                "outcomes": [
+                    {"name": home, "price": -110, "point": -3.5},
+                    {"name": away, "price": -110, "point": 3.5},
+                ],
+            },
+            {
+                "key": "totals",
+                "last_update": updated,
+                "outcomes": [
+                    {"name": "Over", "price": -105 - i, "point": 47.5},
+                    {"name": "Under", "price": -115 + i, "point": 47.5},
+                ],
+            },
+        ]
+        if props:
+            markets.append(
+                {
+                    "key": "player_pass_yds",
+                    "last_update": updated,
+                    "outcomes": [
+                        {
+                            "name": side,
+                            "description": player,
+                            "price": -114,
+                            "point": line,
+                        }
+                        for player, line in [
+                            ("Patrick Mahomes", 274.5),
+                            ("Josh Allen", 251.5),
+                        ]
+                        for side in ("Over", "Under")
+                    ],
+                }
+            )
+        bookmakers.append(
+            {"key": key, "title": title, "last_update": updated, "markets": markets}
+        )
+    return bookmakers
+
+
+class TestCodec:
+    def test_round_trip_is_exact(self):
+        payload = _odds_payload()
+        payload[0]["markets"][0]["outcomes"][0]["link"] = "https://example.com"
+        payload[1]["markets"].reverse()
+
+        decoded = decode_odds_dicts(encode_odds(payload))
+
+        assert decoded == payload
+        assert json.dumps(decoded, sort_keys=True) == json.dumps(
+            payload, sort_keys=True
+        )
+
+    def test_decodes_only_requested_markets(self):
+        blob = encode_odds(_odds_payload())
+
+        assert odds_market_keys(blob) == ["h2h", "spreads", "totals", "player_pass_yds"]
+        bookmakers = decode_odds(blob, markets=["spreads"])
+        assert [b.key for b in bookmakers] == [key for key, _ in BOOKMAKERS]
+        assert all([m.key for m in b.markets] == ["spreads"] for b in bookmakers)
+        assert bookmakers[0].market("spreads").outcomes[0].point == -3.5
+
+    def test_empty_and_marketless_bookmakers(self):
+        assert decode_odds_dicts(encode_odds([])) == []
+        payload = [{"key": "fanduel", "title": "FanDuel", "markets": []}]
+        assert decode_odds_dicts(encode_odds(payload)) == payload
+
+
+class TestGameAccessor:
+    def _game(self, game_id="g1"):
+        return Game(
+            id=game_id,
+            sport_key="americanfootball_nfl",
+            sport_title="NFL",
+            home_team="Kansas City Chiefs",
+            away_team="Buffalo Bills",
+            commence_time=datetime(2026, 10, 18, 20, 0),
+        )
+
+    def test_odds_data_is_stored_compactly(self, db_session):
+        game = self._game()
+        game.odds_data = _odds_payload()
+        db_session.add(game)
+        db_session.commit()
+        db_session.expire_all()
+
+        stored = db_session.get(Game, "g1")
+        assert stored.legacy_odds_data is None
+        assert stored.odds_data == _odds_payload()
+        h2h = stored.get_odds(["h2h"])
+        assert h2h[1].title == "FanDuel"
+        assert h2h[1].markets[0].outcomes[1].price == 131
+
+    def test_legacy_json_rows_still_read(self, db_session):
+        game = self._game("legacy")
+        game.legacy_odds_data = _odds_payload(props=False)
+        db_session.add(game)
+        db_session.commit()
+
+        assert game.odds_data == _odds_payload(props=False)
+        totals = game.get_odds(["totals"])[0].market("totals")
+        assert [o.name for o in totals.outcomes] == ["Over", "Under"]
+
+    def test_shared_game_lines(self, db_session):
+        game = self._game()
+        game.odds_data = _odds_payload()
+        legacy = self._game("legacy")
+        legacy.legacy_odds_data = _odds_payload()
+        db_session.add_all([game, legacy])
+        db_session.commit()
+        db_session.expire_all()
+
+        lines = db_session.get(Game, "g1").shared_odds_dicts(GAME_LINES)
+        expected = [b.to_dict() for b in decode_odds(game.odds_blob, GAME_LINES)]
+        assert lines == expected
+        assert [m["key"] for m in lines[0]["markets"]] == list(GAME_LINES)
+        # Later reads of the same odds share the decoded dicts
+        assert db_session.get(Game, "g1").shared_odds_dicts(GAME_LINES) is lines
+        assert db_session.get(Game, "legacy").shared_odds_dicts(GAME_LINES) == lines
+
+
+@pytest.mark.slow
+class TestCodecBenchmark:
+    """Row size and decode time against the JSON column"""
+
+    def test_size_and_decode_time(self):
+        payload = _odds_payload()
+        as_json = json.dumps(payload)
+        blob = encode_odds(payload)
+        rounds = 2000
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            json.loads(as_json)
+        json_ms = (time.perf_counter() - started) * 1000 / rounds
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            decode_odds(blob, markets=["h2h"])
+        h2h_ms = (time.perf_counter() - started) * 1000 / rounds
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            decode_odds(blob)
+        full_ms = (time.perf_counter() - started) * 1000 / rounds
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            decode_odds_dicts(blob, GAME_LINES)
+        lines_ms = (time.perf_counter() - started) * 1000 / rounds
+
+        # What /api/popular-games does for each game on every request
+        game = Game(id="g1", odds_blob=blob)
+        started = time.perf_counter()
+        for _ in range(rounds):
+            game.shared_odds_dicts(GAME_LINES)
+        popular_ms = (time.perf_counter() - started) * 1000 / rounds
+
+        print(
+            f"\nJSON {len(as_json)} bytes, {json_ms:.3f}ms | blob {len(blob)} bytes, "
+            f"h2h {h2h_ms:.3f}ms, game lines {lines_ms:.3f}ms, "
+            f"all markets {full_ms:.3f}ms, popular games {popular_ms:.4f}ms"
+        )
+        assert len(blob) * 3 < len(as_json)
+        assert h2h_ms < json_ms * 2
+        assert popular_ms * 10 < json_ms
@@ -0,0 +1,221 @@
+"""
+Tests for the adaptive Odds API quota planner and its simulation harness
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database_models import Game, OddsApiUsage
+from app.services.odds_api_service import OddsAPIService
+from app.services.odds_quota_planner import (
+    BASE_INTERVALS,
+    OddsQuotaPlanner,
+    build_plan,
+    odds_quota_planner,
+    parse_endpoint,
+    window_state,
+)
+from app.services.odds_quota_simulation import (
+    build_synthetic_schedule,
+    simulate_schedule,
+)
+
+NOW = datetime(2026, 10, 11, 18, 0)
+
+
+class TestPlan:
+    """Calendar-driven allocation"""
+
+    def test_window_states(self):
+        times = [NOW - timedelta(hours=1), NOW + timedelta(hours=4)]
+        assert window_state(times, NOW, 3.0)[:2] == ("live", 1)
+        assert window_state(times, NOW + timedelta(hours=2.5), 3.0)[0] == "postgame"
+        assert window_state(times[1:], NOW, 3.0)[0] == "pregame"
+        assert window_state([], NOW, 3.0) == ("idle", 0, None)
+
+    def test_live_sports_poll_tighter_than_idle(self):
+        calendar = {"basketball_nba": [NOW - timedelta(minutes=30)]}
+        plan = build_plan(
+            calendar,
+            NOW,
+            monthly_budget=20000,
+            month_to_date_credits=5000,
+            sports=["basketball_nba", "soccer_mls"],
+        )
+
+        nba = plan.sports["basketball_nba"]
+        mls = plan.sports["soccer_mls"]
+        assert nba.state == "live"
+        assert nba.scores_interval_seconds is not None
+        assert mls.state == "idle"
+        assert mls.odds_interval_seconds >= BASE_INTERVALS["idle"][0]
+        assert nba.odds_interval_seconds * 10 < mls.odds_interval_seconds
+
+    def test_tight_budget_stretches_intervals(self):
+        calendar = {"basketball_nba": [NOW - timedelta(minutes=30)]}
+        kwargs = dict(monthly_budget=20000, sports=["basketball_nba"])
+        roomy = build_plan(calendar, NOW, month_to_date_credits=0, **kwargs)
+        tight = build_plan(calendar, NOW, month_to_date_credits=19900, **kwargs)
+
+        assert tight.scale > roomy.scale
+        assert (
+            tight.sports["basketball_nba"].odds_interval_seconds
+            > roomy.sports["basketball_nba"].odds_interval_seconds
+        )
+        assert tight.projected_daily_credits <= tight.daily_budget + 1
+
+    def test_parse_endpoint(self):
+        assert parse_endpoint("/sports/basketball_nba/odds") == (
+            "odds",
+            "basketball_nba",
+        )
+        assert parse_endpoint("/sports") == ("sports", None)
+
+
+class TestPersistence:
+    """Usage log and calendar read through the database"""
+
+    def _planner(self, sqlite_engine):
+        return OddsQuotaPlanner(
+            monthly_budget=1000, session_factory=sessionmaker(bind=sqlite_engine)
+        )
+
+    def test_usage_survives_a_new_planner(self, sqlite_engine):
+        planner = self._planner(sqlite_engine)
+        planner.record_usage(
+            "/sports/basketball_nba/odds",
+            {
+                "x-requests-last": "3",
+                "x-requests-used": "103",
+                "x-requests-remaining": "897",
+            },
+        )
+        planner.record_usage("/sports/basketball_nba/scores", {"x-requests-last": "2"})
+
+        summary = self._planner(sqlite_engine).get_usage_summary()
+        assert summary["month_to_date_credits"] == 5
+        assert summary["month_to_date_requests"] == 2
+        assert summary["credits_by_sport"] == {"basketball_nba": 5}
+        assert summary["provider_requests_remaining"] is None
+
+    async def test_is_due_follows_calendar_and_last_refresh(
+        self, sqlite_engine, db_session
+    ):
+        now = datetime.utcnow()
+        db_session.add(
+            Game(
+                id="nba-live",
+                sport_key="basketball_nba",
+                sport_title="NBA",
+                home_team="Home",
+                away_team="Away",
+                commence_time=now - timedelta(minutes=20),
+            )
+        )
+        db_session.add(
+            OddsApiUsage(
+                recorded_at=now - timedelta(hours=1),
+                endpoint="odds",
+                sport_key="soccer_mls",
+                credits=3,
+            )
+        )
+        db_session.commit()
+        planner = self._planner(sqlite_engine)
+        load_calendar = planner.load_calendar
+        threads = []
+
+        def record_thread(now):
+            threads.append(threading.get_ident())
+            return load_calendar(now)
+
+        planner.load_calendar = record_thread
+
+        # Nothing is due until a plan is built, and it's built off the loop
+        assert not planner.is_due("basketball_nba", "live_odds")
+        await planner.refresh()
+        assert threads and threading.get_ident() not in threads
+        await planner.refresh()
+        assert len(threads) == 1
+
+        assert planner.is_due("basketball_nba", "live_odds")
+        planner.mark_refreshed("basketball_nba", "live_odds")
+        assert not planner.is_due("basketball_nba", "live_odds")
+
+        # Idle sport refreshed an hour ago (seeded from the usage log)
+        assert planner.current_plan().sports["soccer_mls"].state == "idle"
+        assert not planner.is_due("soccer_mls", "odds")
+        assert not planner.is_due("soccer_mls", "live_odds")
+
+        report = planner.get_plan_report()
+        assert report["plan"]["sports"]["basketball_nba"]["live_games"] == 1
+        assert report["usage"]["month_to_date_credits"] == 3
+
+    async def test_live_odds_calls_seed_their_refresh_time(
+        self, sqlite_engine, db_session
+    ):
+        db_session.add(
+            Game(
+                id="nba-live",
+                sport_key="basketball_nba",
+                sport_title="NBA",
+                home_team="Home",
+                away_team="Away",
+                commence_time=datetime.utcnow() - timedelta(minutes=20),
+            )
+        )
+        db_session.commit()
+        self._planner(sqlite_engine).record_usage(
+            "/sports/basketball_nba/odds", {"x-requests-last": "3"}, kind="live_odds"
+        )
+
+        restarted = self._planner(sqlite_engine)
+        await restarted.refresh()
+        assert not restarted.is_due("basketball_nba", "live_odds")
+        assert restarted.is_due("basketball_nba", "odds")
+
+    async def test_service_keeps_usage_queries_off_the_loop(self, monkeypatch):
+        loop_thread = threading.get_ident()
+        threads = {}
+
+        def load_usage():
+            threads["load"] = threading.get_ident()
+            return {
+                "today_requests": 4,
+                "month_to_date_requests": 40,
+                "provider_requests_remaining": 960,
+                "provider_requests_used": 40,
+            }
+
+        def record_usage(endpoint, headers, kind=None):
+            threads["record"] = threading.get_ident()
+            threads["kind"] = kind
+
+        monkeypatch.setattr(odds_quota_planner, "get_usage_summary", load_usage)
+        monkeypatch.setattr(odds_quota_planner, "record_usage", record_usage)
+
+        async with OddsAPIService("key") as service:
+            await service._record_usage("/sports/basketball_nba/odds", {}, "live_odds")
+
+        assert service.monthly_requests == 40
+        assert service.rate_limit_remaining == 960
+        assert threads["kind"] == "live_odds"
+        assert loop_thread not in (threads["load"], threads["record"])
+
+
+class TestSimulation:
+    """Adaptive planner against the old fixed intervals"""
+
+    def test_adaptive_spends_less_and_stays_fresher(self):
+        start = datetime(2026, 10, 1)
+        calendar = build_synthetic_schedule(start, 7)
+        end = start + timedelta(days=7)
+
+        fixed = simulate_schedule(calendar, start, end, policy="fixed")
+        adaptive = simulate_schedule(calendar, start, end, policy="adaptive")
+
+        assert fixed.live_samples == adaptive.live_samples > 0
+        assert adaptive.credits < fixed.credits
+        assert adaptive.mean_staleness_seconds < fixed.mean_staleness_seconds
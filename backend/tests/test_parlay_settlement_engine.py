@@ -0,0 +1,157 @@
+"""
+Tests for the single-pass parlay settlement engine
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.simple_unified_bet_model import BetStatus, BetType, SimpleUnifiedBet
+from app.services.parlay_settlement_engine import (
+    ParlaySettlementEngine,
+    ParlayState,
+    evaluate_parlay,
+    run_parlay_state_machine,
+)
+from app.services.unified_bet_verification_service import (
+    UnifiedBetVerificationService,
+)
+
+from tests.test_unified_bet_settlement import FakeScoresService, _bet_row, _insert
+
+WON, LOST, PUSHED, PENDING = (
+    BetStatus.WON,
+    BetStatus.LOST,
+    BetStatus.PUSHED,
+    BetStatus.PENDING,
+)
+
+
+def _parlay(db, leg_statuses, leg_event_ids=None, potential_win=26.0):
+    parlay = _bet_row(
+        f"parlay-{uuid.uuid4().hex[:8]}",
+        sport="Multiple Sports",
+        bet_type=BetType.PARLAY,
+        is_parlay=True,
+        potential_win=potential_win,
+    )
+    legs = [
+        _bet_row(
+            (leg_event_ids or {}).get(i, f"leg-{uuid.uuid4().hex[:8]}"),
+            parent_bet_id=parlay["id"],
+            leg_position=i + 1,
+            status=status,
+            amount=0.0,
+            potential_win=0.0,
+            odds=100.0,
+        )
+        for i, status in enumerate(leg_statuses)
+    ]
+    _insert(db, [parlay, *legs])
+    return parlay["id"]
+
+
+class TestStateMachine:
+    def test_any_lost_leg_loses_even_with_legs_pending(self):
+        assert run_parlay_state_machine([PENDING, LOST, WON]) is ParlayState.LOST
+        _, status, amount, _ = evaluate_parlay(
+            10.0, 26.0, [(PENDING, 100), (LOST, 100)]
+        )
+        assert (status, amount) == (LOST, 0.0)
+
+    def test_pending_leg_keeps_parlay_open(self):
+        assert run_parlay_state_machine([WON, PENDING]) is ParlayState.AWAITING
+        assert run_parlay_state_machine([]) is ParlayState.EMPTY
+
+    def test_all_void_refunds_stake(self):
+        _, status, amount, _ = evaluate_parlay(
+            10.0, 26.0, [(PUSHED, 100), (BetStatus.CANCELLED, 100)]
+        )
+        assert (status, amount) == (PUSHED, 10.0)
+
+    def test_pushed_leg_reprices_from_remaining_odds(self):
+        _, status, amount, _ = evaluate_parlay(10.0, 26.0, [(WON, 100), (WON, 100)])
+        assert (status, amount) == (WON, 36.0)
+
+        _, status, amount, _ = evaluate_parlay(
+            10.0, 60.0, [(WON, 100), (PUSHED, 100), (WON, -200)]
+        )
+        assert status == WON
+        assert amount == pytest.approx(10.0 * 2.0 * 1.5)
+
+
+class TestEngine:
+    def test_loads_all_parlays_and_legs_in_one_query(self, db_session, query_budget):
+        won = _parlay(db_session, [WON, WON])
+        lost = _parlay(db_session, [PENDING, LOST, PENDING])
+        for _ in range(20):
+            _parlay(db_session, [WON, PENDING])
+        db_session.expire_all()
+
+        with query_budget(1):
+            settlements = ParlaySettlementEngine().settle(db_session)
+
+        assert {s.parlay_id: s.status for s in settlements} == {won: WON, lost: LOST}
+
+    def test_overlaid_leg_results_count_before_they_are_written(self, db_session):
+        parlay_id = _parlay(db_session, [WON, PENDING])
+        leg = (
+            db_session.query(SimpleUnifiedBet)
+            .filter(
+                SimpleUnifiedBet.parent_bet_id == parlay_id,
+                SimpleUnifiedBet.status == PENDING,
+            )
+            .one()
+        )
+
+        settlements = ParlaySettlementEngine().settle(db_session, {leg.id: WON})
+
+        assert [(s.parlay_id, s.status) for s in settlements] == [(parlay_id, WON)]
+
+    def test_legacy_parlay_legs_column(self, db_session):
+        leg = _bet_row("legacy-leg", status=LOST)
+        parlay = _bet_row(
+            "legacy-parlay",
+            sport="Multiple Sports",
+            bet_type=BetType.PARLAY,
+            is_parlay=True,
+            parlay_legs=[leg["id"]],
+        )
+        _insert(db_session, [parlay, leg])
+
+        settlements = ParlaySettlementEngine().settle(db_session)
+
+        assert [s.status for s in settlements] == [LOST]
+
+
+@pytest.mark.parametrize("parlays", [5, 50])
+async def test_verification_run_query_count_is_flat(
+    sqlite_engine, db_session, query_budget, parlays
+):
+    service = UnifiedBetVerificationService(
+        session_factory=sessionmaker(bind=sqlite_engine)
+    )
+    service.odds_service = FakeScoresService()
+    for i in range(parlays):
+        _parlay(db_session, [WON, PENDING], leg_event_ids={1: f"g{i}"})
+        service.odds_service.finish("basketball_nba", f"g{i}", 110, 100)
+    service.odds_service.finish("basketball_nba", "unrelated", 90, 100)
+
+    # sports lookup, leg batch, parlays + legs, settled stakes, one bulk
+    # UPDATE of the exposure counters and one of the bets
+    with query_budget(6, max_repeats=1) as scope:
+        result = await service.verify_all_pending_bets()
+
+    assert [shape.split()[0] for shape in scope.fingerprints] == [
+        "SELECT",
+        "SELECT",
+        "SELECT",
+        "SELECT",
+        "UPDATE",
+        "UPDATE",
+    ]
+    assert result["settled"] == parlays * 2
+    db_session.expire_all()
+    statuses = {bet.status for bet in db_session.query(SimpleUnifiedBet)}
+    assert statuses == {WON}
@@ -0,0 +1,200 @@
+"""
+Tests for the pre-aggregated login page stats
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database_models import (
+    BetType,
+    Game,
+    GameStatus,
+    PlatformStatsDaily,
+    User,
+    YetAIBet,
+)
+from app.services import platform_stats_service as stats_module
+from app.services import yetai_bets_service_db as yetai_module
+from app.services.platform_stats_service import PlatformStatsService
+
+NOW = datetime.utcnow()
+
+
+@pytest.fixture
+def stats(sqlite_engine):
+    return PlatformStatsService(session_factory=sessionmaker(bind=sqlite_engine))
+
+
+def _bet(i, days_ago, odds, outcome, legacy=False, **overrides):
+    """Settled bet; legacy rows carry the outcome in result, not status"""
+    values = dict(
+        id=f"yb-{i}",
+        title=f"Bet {i}",
+        bet_type=BetType.MONEYLINE,
+        selection="Home",
+        odds=odds,
+        confidence=70,
+        status="settled" if legacy else outcome,
+        result=outcome if legacy else f"{outcome.title()}: description",
+        settled_at=NOW - timedelta(days=days_ago, hours=1),
+        home_team="Home",
+        away_team="Away",
+    )
+    values.update(overrides)
+    return YetAIBet(**values)
+
+
+def _profit(odds):
+    return odds if odds > 0 else 10000 / abs(odds)
+
+
+def _seed(db):
+    bets = [
+        _bet(1, 1, 150, "won"),
+        _bet(2, 2, -120, "won", legacy=True),
+        _bet(3, 3, -110, "lost"),
+        _bet(4, 10, 200, "won"),
+        _bet(5, 12, -150, "lost", legacy=True),
+        _bet(6, 20, 110, "won"),
+        _bet(7, 45, -200, "won"),
+        _bet(8, 4, 120, "pushed"),
+    ]
+    db.add_all(bets)
+    db.add_all(
+        [
+            User(id=1, email="a@x.io", username="a", password_hash="x"),
+            User(
+                id=2,
+                email="b@x.io",
+                username="b",
+                password_hash="x",
+                avatar_url="/a/b.png",
+                first_name="Bo",
+            ),
+            User(id=3, email="c@x.io", username="c", password_hash="x", is_hidden=True),
+        ]
+    )
+    db.commit()
+
+
+def test_stats_match_the_per_bet_calculation(stats, db_session):
+    _seed(db_session)
+
+    data = stats.get_stats()
+
+    assert data["total_users"] == 2
+    assert data["total_winnings"] == round(
+        sum(_profit(o) for o in (150, -120, 200, 110, -200)), 2
+    )
+    assert data["performance_30d"] == {
+        "win_rate": round(4 / 6 * 100, 1),
+        "profit": round(_profit(150) + _profit(-120) + 200 + 110 - 200, 2),
+        "total_bets": 6,
+        "wins": 4,
+        "losses": 2,
+    }
+    profit_7d = _profit(150) + _profit(-120) - 100
+    profit_prev_7d = 200 - 100
+    assert data["performance_7d"] == {
+        "win_rate": round(2 / 3 * 100, 1),
+        "profit": round(profit_7d, 2),
+        "wow_change": round((profit_7d - profit_prev_7d) / profit_prev_7d * 100, 1),
+    }
+    assert data["user_avatars"] == [{"url": "/a/b.png", "name": "Bo"}]
+    # Backfilled on first use: one row per settlement day with a won/lost bet
+    assert db_session.query(PlatformStatsDaily).count() == 7
+
+
+def test_cached_stats_skip_the_database(stats, db_session, query_budget):
+    _seed(db_session)
+    first = stats.get_stats()
+
+    with query_budget(0):
+        assert stats.get_stats() is first
+
+
+def test_login_page_reads_never_touch_yetai_bets(stats, db_session, query_budget):
+    _seed(db_session)
+    stats.get_stats()
+    stats.invalidate()
+
+    with query_budget(4) as scope:
+        stats.get_stats()
+    assert not [shape for shape in scope.fingerprints if "yetai_bets" in shape]
+
+
+async def test_verification_rolls_settlements_into_the_summary(
+    sqlite_engine, db_session, stats, monkeypatch
+):
+    _seed(db_session)
+    stats.get_stats()
+    db_session.add(
+        Game(
+            id="g1",
+            sport_key="nba",
+            sport_title="NBA",
+            home_team="Home",
+            away_team="Away",
+            commence_time=NOW - timedelta(hours=3),
+            status=GameStatus.FINAL,
+            home_score=101,
+            away_score=99,
+        )
+    )
+    db_session.add(_bet(9, 0, 130, "pending", game_id="g1", settled_at=None))
+    db_session.commit()
+    monkeypatch.setattr(yetai_module, "SessionLocal", sessionmaker(bind=sqlite_engine))
+    monkeypatch.setattr(yetai_module, "platform_stats_service", stats)
+
+    result = await yetai_module.yetai_bets_service_db.verify_pending_yetai_bets()
+
+    assert result["settled"] == 1
+    db_session.expire_all()
+    today = db_session.get(
+        PlatformStatsDaily, db_session.get(YetAIBet, "yb-9").settled_at.date()
+    )
+    assert (today.wins, today.losses, today.won_profit) == (1, 0, 130)
+    # The refresh dropped the cached response
+    assert stats.get_stats()["performance_7d"]["profit"] == round(
+        _profit(150) + _profit(-120) - 100 + 130, 2
+    )
+
+
+def test_refresh_overwrites_days_in_place(stats, db_session):
+    _seed(db_session)
+    stats.get_stats()
+    day = (NOW - timedelta(days=1, hours=1)).date()
+    quiet_day = (NOW - timedelta(days=5)).date()
+    db_session.get(YetAIBet, "yb-1").status = "lost"
+
+    # Seeded once per day: a row already there is updated, not re-inserted
+    assert stats.refresh_days(db_session, [day, day, quiet_day]) == 2
+    assert stats.refresh_days(db_session, [day]) == 1
+    db_session.commit()
+
+    row = db_session.get(PlatformStatsDaily, day)
+    assert (row.wins, row.losses, row.won_profit) == (0, 1, 0)
+    quiet = db_session.get(PlatformStatsDaily, quiet_day)
+    assert (quiet.wins, quiet.losses, quiet.won_profit) == (0, 0, 0)
+
+
+def test_refresh_locks_the_days_before_reading_bets(stats, db_session, query_budget):
+    _seed(db_session)
+    stats.get_stats()
+    day = (NOW - timedelta(days=1, hours=1)).date()
+
+    with query_budget(4) as scope:
+        stats.refresh_days(db_session, [day])
+
+    seed, lock, aggregate, write = list(scope.fingerprints)
+    assert "INSERT INTO platform_stats_daily" in seed and "DO NOTHING" in seed
+    assert "FROM platform_stats_daily" in lock
+    assert "FROM yetai_bets" in aggregate
+    assert write.startswith("UPDATE platform_stats_daily")
+    # SQLite drops the row lock; PostgreSQL takes it
+    assert "FOR UPDATE" in str(
+        stats_module._lock_days([day]).compile(dialect=postgresql.dialect())
+    )
@@ -0,0 +1,204 @@
+"""
+Tests for the player feature store: parity with the on-the-fly trend,
+efficiency and consistency calculations, and incremental updates matching a
+full rebuild
+"""
+
+import random
+
+import pytest
+from sqlalchemy import select
+
+from app.models.fantasy_models import (
+    FantasyPlatform,
+    FantasyPlayer,
+    FantasyPosition,
+    PlayerAnalytics,
+    PlayerFeatures,
+    PlayerRecentGames,
+)
+from app.services.fantasy_analytics_service import FantasyAnalyticsService
+from app.services.player_analytics_service import PlayerAnalyticsService
+from app.services.player_feature_store import player_feature_store
+
+WEEK_LISTS = [
+    list(range(1, 18)),
+    list(range(9, 13)),
+    list(range(14, 18)),
+    [3, 4, 5, 6],
+    [1, 3, 5],  # Not a stored window: computed on the fly either way
+]
+
+
+def _week_stats(rng, week, player_id):
+    if player_id == 1 and 9 <= week <= 12:
+        # A clear breakout: usage climbing every week
+        return {
+            "snap_percentage": 15.0 + week * 10,
+            "target_share": week * 5.0 - 35,
+            "red_zone_share": 10.0,
+            "ppr_points": week * 2.0,
+        }
+    return {
+        "ppr_points": rng.choice([0, None, round(rng.uniform(1, 30), 1)]),
+        "snap_percentage": rng.choice([None, round(rng.uniform(20, 100), 1)]),
+        "target_share": rng.choice([0.0, round(rng.uniform(1, 30), 1)]),
+        "red_zone_share": rng.choice([None, 0.0, round(rng.uniform(0, 40), 1)]),
+        "points_per_snap": rng.choice([None, round(rng.uniform(0.1, 0.6), 3)]),
+        "points_per_target": round(rng.uniform(0.5, 3), 2),
+    }
+
+
+def _games(seed=3, players=6):
+    """(player_id, season, week, stats) with missed weeks and empty values"""
+    rng = random.Random(seed)
+    games = []
+    for player_id in range(1, players + 1):
+        for season in (2024, 2025):
+            for week in range(1, 19):
+                if player_id != 1 and rng.random() < 0.2:
+                    continue  # Bye or missed game
+                games.append(
+                    (player_id, season, week, _week_stats(rng, week, player_id))
+                )
+    return games
+
+
+@pytest.fixture
+def service(db_session):
+    for player_id in range(1, 7):
+        db_session.add(
+            FantasyPlayer(
+                id=player_id,
+                platform=FantasyPlatform.SLEEPER,
+                platform_player_id=str(player_id),
+                name=f"Player {player_id}",
+                position=FantasyPosition.WR,
+            )
+        )
+    db_session.commit()
+    return PlayerAnalyticsService(db_session)
+
+
+def _load(db, games):
+    for player_id, season, week, stats in games:
+        db.add(PlayerAnalytics(player_id=player_id, season=season, week=week, **stats))
+    db.commit()
+
+
+def _feature_rows(db):
+    rows = db.execute(
+        select(PlayerFeatures).order_by(
+            PlayerFeatures.player_id,
+            PlayerFeatures.season,
+            PlayerFeatures.week,
+            PlayerFeatures.span,
+        )
+    ).scalars()
+    return [
+        {
+            column.name: getattr(row, column.name)
+            for column in PlayerFeatures.__table__.columns
+            if column.name != "updated_at"
+        }
+        for row in rows
+    ]
+
+
+def _recent_rows(db):
+    rows = db.execute(
+        select(PlayerRecentGames).order_by(PlayerRecentGames.player_id)
+    ).scalars()
+    return [(row.player_id, row.games) for row in rows]
+
+
+async def _calculations(service):
+    results = {}
+    for player_id in range(1, 8):
+        for season in (2024, 2025, 2026):
+            for weeks in WEEK_LISTS:
+                key = (player_id, season, tuple(weeks))
+                results[key] = (
+                    await service.calculate_usage_trends(player_id, weeks, season),
+                    await service.calculate_efficiency_metrics(
+                        player_id, weeks, season
+                    ),
+                )
+    return results
+
+
+async def test_stored_features_match_on_the_fly_calculations(
+    service, db_session, query_budget
+):
+    _load(db_session, _games())
+    expected = await _calculations(service)
+    expected_breakouts = await service.identify_breakout_candidates("WR", 2025)
+
+    player_feature_store.rebuild(db_session)
+    db_session.commit()
+
+    assert await _calculations(service) == expected
+    with query_budget(1):
+        trends = await service.calculate_usage_trends(1, list(range(9, 13)), 2025)
+    assert trends == expected[(1, 2025, (9, 10, 11, 12))][0]
+    with query_budget(3):
+        breakouts = await service.identify_breakout_candidates("WR", 2025)
+    assert breakouts == expected_breakouts
+    assert 1 in [candidate["player_id"] for candidate in breakouts]
+
+
+async def test_ingesting_weeks_keeps_features_equal_to_a_rebuild(service, db_session):
+    games = _games(seed=11, players=3)
+    random.Random(5).shuffle(games)  # Late and out-of-order weeks
+    for player_id, season, week, stats in games:
+        await service.store_weekly_analytics(player_id, week, season, stats)
+    # A stat correction for a week already stored
+    await service.store_weekly_analytics(2, 10, 2025, {"snap_percentage": 99.5})
+    incremental = _feature_rows(db_session)
+    incremental_recent = _recent_rows(db_session)
+
+    player_feature_store.rebuild(db_session)
+    db_session.commit()
+
+    assert incremental == _feature_rows(db_session)
+    assert {row["span"] for row in incremental} == {4, 17}
+    assert incremental_recent == _recent_rows(db_session)
+    assert [len(games) for _, games in incremental_recent] == [16, 16, 16]
+
+
+def test_rebuild_of_one_season_leaves_the_others(service, db_session):
+    _load(db_session, _games(players=2))
+    player_feature_store.rebuild(db_session)
+    before = _feature_rows(db_session)
+    recent_before = _recent_rows(db_session)
+
+    written = player_feature_store.rebuild(db_session, season=2025)
+    db_session.commit()
+
+    assert written == len([row for row in before if row["season"] == 2025])
+    assert _feature_rows(db_session) == before
+    assert _recent_rows(db_session) == recent_before
+
+
+def test_stored_recent_games_match_the_trend_analysis(
+    service, db_session, query_budget
+):
+    _load(db_session, _games())
+    analytics = FantasyAnalyticsService(db_session)
+    cases = [(player_id, weeks) for player_id in range(1, 8) for weeks in (4, 16)]
+    expected = {case: analytics.get_player_trend_analysis(*case) for case in cases}
+
+    player_feature_store.rebuild(db_session)
+    db_session.commit()
+
+    assert {case: analytics.get_player_trend_analysis(*case) for case in cases} == (
+        expected
+    )
+    with query_budget(2) as scope:
+        trends = analytics.get_player_trend_analysis(2, 16)
+    assert not [shape for shape in scope.fingerprints if "player_analytics" in shape]
+    # The window crosses into last season and keeps scoreless games
+    assert {game["season"] for game in trends["recent_games"]} == {2024, 2025}
+    assert 0 in trends["trends"]["points"]["raw_data"]
+    # Longer than the stored window: read from player_analytics instead
+    assert analytics.get_player_trend_analysis(2, 20)["games_analyzed"] == 20
@@ -0,0 +1,98 @@
+"""
+Tests for per-request SQL instrumentation and the N+1 detector
+"""
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core import query_instrumentation
+from app.core.query_instrumentation import (
+    QueryStatsRegistry,
+    fingerprint,
+    instrument_engine,
+    track_queries,
+)
+from app.main import app
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = QueryStatsRegistry()
+    monkeypatch.setattr(query_instrumentation, "query_stats", registry)
+    return registry
+
+
+def test_fingerprint_ignores_values_and_list_lengths():
+    assert fingerprint(
+        "SELECT * FROM bets WHERE id IN (?, ?, ?) AND user_id = 7"
+    ) == fingerprint("SELECT * FROM bets\n WHERE id IN (?) AND user_id = 12")
+    assert fingerprint("SELECT * FROM bets WHERE status = 'won' AND id = %(id_1)s") == (
+        "SELECT * FROM bets WHERE status = ? AND id = ?"
+    )
+    assert fingerprint("SELECT a FROM t") != fingerprint("SELECT b FROM t")
+
+
+def test_repeated_statement_shape_is_flagged_once(
+    sqlite_engine, registry, monkeypatch, caplog
+):
+    monkeypatch.setattr(query_instrumentation, "REPEAT_WARN_THRESHOLD", 5)
+    instrument_engine(sqlite_engine)
+    instrument_engine(sqlite_engine)  # idempotent
+
+    with caplog.at_level(logging.WARNING, logger=query_instrumentation.__name__):
+        with track_queries("GET /api/leaderboard") as scope:
+            with sqlite_engine.connect() as conn:
+                for user_id in range(12):
+                    conn.execute(
+                        text("SELECT id FROM users WHERE id = :id"), {"id": user_id}
+                    )
+                conn.execute(text("SELECT count(*) FROM users"))
+
+    assert scope.query_count == 13
+    assert scope.db_time > 0
+    assert len(scope.flagged) == 1
+    warnings = [r for r in caplog.records if "Possible N+1" in r.getMessage()]
+    assert len(warnings) == 1
+    assert "GET /api/leaderboard" in warnings[0].getMessage()
+
+    summary = registry.summary()["GET /api/leaderboard"]
+    assert summary["runs"] == 1
+    assert summary["max_queries"] == 13
+    assert summary["n_plus_one_runs"] == 1
+    assert list(summary["top_repeats"].values()) == [12]
+
+
+def test_statements_outside_a_scope_are_not_attributed(sqlite_engine, registry):
+    instrument_engine(sqlite_engine)
+    with sqlite_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert registry.summary() == {}
+
+
+def test_requests_are_summarised_by_route_template(registry):
+    client = TestClient(app)
+    client.get("/health")
+    client.get("/health")
+    client.get("/no/such/path")
+
+    summary = registry.summary()
+    assert summary["GET /health"]["runs"] == 2
+    assert "GET (unmatched)" in summary
+
+
+def test_query_budget_fails_over_budget(sqlite_engine, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="2 queries run, budget is 1"):
+        with query_budget(1):
+            with sqlite_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+
+    with pytest.raises(pytest.fail.Exception, match="ran 3 times"):
+        with query_budget(10, max_repeats=2):
+            with sqlite_engine.connect() as conn:
+                for i in range(3):
+                    conn.execute(text("SELECT :i"), {"i": i})
@@ -0,0 +1,246 @@
+"""
+Query plan regression tests for the hot bet, game and analytics queries
+
+Each query is EXPLAINed on SQLite, and on PostgreSQL when
+POSTGRES_TEST_DATABASE_URL points at a scratch database. A query that reads
+its table with a full scan instead of an index fails the test.
+"""
+
+import os
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, or_, select, tuple_
+from sqlalchemy.orm import sessionmaker
+
+import app.models.database_models  # noqa: F401
+from app.core.database import Base
+from app.models.database_models import Game, YetAIBet
+from app.models.fantasy_models import PlayerAnalytics
+from app.models.simple_unified_bet_model import (
+    BetStatus,
+    BetType,
+    SimpleUnifiedBet,
+    UserDailyExposure,
+)
+from app.services.simple_unified_bet_service import bet_filters
+
+NOW = datetime(2026, 10, 18, 12, 0)
+DAY = datetime(2026, 10, 18)
+
+bets = SimpleUnifiedBet
+
+
+def _history_page():
+    return (
+        select(bets.id)
+        .where(*bet_filters(7, status="pending"))
+        .where(tuple_(bets.placed_at, bets.id) < (NOW, "cursor-id"))
+        .order_by(bets.placed_at.desc(), bets.id.desc())
+        .limit(21)
+    )
+
+
+# name -> (statement, tables that must be read through an index)
+HOT_QUERIES = {
+    "bet history page": (_history_page(), {"simple_unified_bets"}),
+    "user bet stats": (
+        select(bets.status, func.count(), func.sum(bets.amount))
+        .where(bets.user_id == 7, bets.parent_bet_id.is_(None))
+        .group_by(bets.status),
+        {"simple_unified_bets"},
+    ),
+    "daily exposure seed": (
+        select(func.sum(bets.amount), func.count(bets.id)).where(
+            bets.user_id == 7,
+            bets.placed_at >= DAY,
+            bets.placed_at < DAY + timedelta(days=1),
+            bets.parent_bet_id.is_(None),
+        ),
+        {"simple_unified_bets"},
+    ),
+    "daily exposure counter": (
+        select(UserDailyExposure.staked).where(
+            UserDailyExposure.user_id == 7, UserDailyExposure.day == DAY.date()
+        ),
+        {"user_daily_exposure"},
+    ),
+    "verification sports": (
+        select(bets.sport)
+        .where(
+            bets.status == BetStatus.PENDING,
+            bets.bet_type != BetType.PARLAY,
+            bets.commence_time <= NOW,
+        )
+        .distinct(),
+        {"simple_unified_bets"},
+    ),
+    "pending bets for completed games": (
+        select(bets.id).where(
+            bets.odds_api_event_id.in_(["e1", "e2"]),
+            bets.status == BetStatus.PENDING,
+            bets.bet_type != BetType.PARLAY,
+        ),
+        {"simple_unified_bets"},
+    ),
+    "pending parlays": (
+        select(bets.id).where(
+            bets.status == BetStatus.PENDING,
+            or_(bets.is_parlay.is_(True), bets.bet_type == BetType.PARLAY),
+        ),
+        {"simple_unified_bets"},
+    ),
+    "parlay legs": (
+        select(bets.id)
+        .where(bets.parent_bet_id.in_(["p1", "p2"]))
+        .order_by(bets.parent_bet_id, bets.leg_position),
+        {"simple_unified_bets"},
+    ),
+    "games in a date window": (
+        select(Game.id)
+        .where(Game.commence_time >= NOW, Game.commence_time <= NOW + timedelta(1))
+        .order_by(Game.commence_time),
+        {"games"},
+    ),
+    "quota planner calendar": (
+        select(Game.sport_key, Game.commence_time)
+        .where(
+            Game.commence_time >= NOW - timedelta(hours=5),
+            Game.commence_time <= NOW + timedelta(hours=30),
+        )
+        .order_by(Game.commence_time),
+        {"games"},
+    ),
+    "active yetai picks": (
+        select(YetAIBet.id)
+        .where(
+            YetAIBet.status == "pending",
+            (YetAIBet.commence_time >= NOW) | (YetAIBet.commence_time.is_(None)),
+        )
+        .order_by(YetAIBet.confidence.desc()),
+        {"yetai_bets"},
+    ),
+    "platform stats refresh": (
+        select(func.date(YetAIBet.settled_at), func.count())
+        .where(YetAIBet.settled_at >= DAY, YetAIBet.settled_at < NOW)
+        .group_by(func.date(YetAIBet.settled_at)),
+        {"yetai_bets"},
+    ),
+    "player recent games": (
+        select(PlayerAnalytics.id)
+        .where(PlayerAnalytics.player_id == 11)
+        .order_by(PlayerAnalytics.season.desc(), PlayerAnalytics.week.desc())
+        .limit(4),
+        {"player_analytics"},
+    ),
+    "player season window": (
+        select(PlayerAnalytics.id)
+        .where(
+            PlayerAnalytics.player_id == 11,
+            PlayerAnalytics.season == 2025,
+            PlayerAnalytics.week >= 3,
+        )
+        .order_by(PlayerAnalytics.week.desc()),
+        {"player_analytics"},
+    ),
+    "player week upsert lookup": (
+        select(PlayerAnalytics.id).where(
+            PlayerAnalytics.player_id == 11,
+            PlayerAnalytics.week == 6,
+            PlayerAnalytics.season == 2025,
+        ),
+        {"player_analytics"},
+    ),
+    "latest analytics season": (
+        select(func.max(PlayerAnalytics.season)),
+        {"player_analytics"},
+    ),
+    "trending players in recent weeks": (
+        select(PlayerAnalytics.player_id)
+        .where(PlayerAnalytics.season == 2025, PlayerAnalytics.week.in_([4, 5, 6]))
+        .group_by(PlayerAnalytics.player_id),
+        {"player_analytics"},
+    ),
+}
+
+
+def _sql(connection, statement) -> str:
+    return str(
+        statement.compile(
+            dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def sqlite_full_scans(connection, statement, tables):
+    """Tables of `tables` the SQLite plan reads without an index search"""
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {_sql(connection, statement)}"
+    ).all()
+    scans = set()
+    for row in plan:
+        detail = row[-1]
+        match = re.match(r"SCAN (\w+)", detail)
+        # A covering index scan still reads every entry
+        if match and match.group(1) in tables:
+            scans.add(match.group(1))
+    return scans, [row[-1] for row in plan]
+
+
+def postgres_full_scans(connection, statement, tables):
+    """Tables of `tables` PostgreSQL still reads with a Seq Scan"""
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {_sql(connection, statement)}"
+    ).scalar()
+    scans, nodes = set(), [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan" and node["Relation Name"] in tables:
+            scans.add(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    return scans, plan
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_an_index_on_sqlite(sqlite_engine, name):
+    statement, tables = HOT_QUERIES[name]
+    with sqlite_engine.connect() as connection:
+        scans, plan = sqlite_full_scans(connection, statement, tables)
+
+    assert not scans, f"{name} scans {sorted(scans)}: {plan}"
+
+
+def test_bet_history_page_needs_no_sort(sqlite_engine):
+    statement, _ = HOT_QUERIES["bet history page"]
+    with sqlite_engine.connect() as connection:
+        _, plan = sqlite_full_scans(connection, statement, set())
+
+    assert not [step for step in plan if "TEMP B-TREE" in step], plan
+
+
+@pytest.fixture(scope="module")
+def postgres_engine():
+    url = os.environ.get("POSTGRES_TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("POSTGRES_TEST_DATABASE_URL is not set")
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_an_index_on_postgres(postgres_engine, name):
+    statement, tables = HOT_QUERIES[name]
+    with sessionmaker(bind=postgres_engine)() as session:
+        connection = session.connection()
+        # Empty tables make a Seq Scan cheapest; only fall back to one when
+        # no index can serve the query
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        scans, plan = postgres_full_scans(connection, statement, tables)
+
+    assert not scans, f"{name} scans {sorted(scans)}: {plan}"
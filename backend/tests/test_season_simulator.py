@@ -0,0 +1,246 @@
+"""
+Tests for the Monte Carlo season simulator
+"""
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+from app.models.fantasy_models import (
+    FantasyLeague,
+    FantasyMatchup,
+    FantasyPlatform,
+    FantasyPlayer,
+    FantasyPosition,
+    FantasyRosterSpot,
+    FantasyTeam,
+    FantasyUser,
+    PlayerAnalytics,
+    Trade,
+)
+from app.services.season_simulator import (
+    LeagueSeason,
+    SeasonSimulator,
+    simulate_season,
+)
+from app.services.trade_analyzer_service import TradeAnalyzerService
+
+# 50k simulated seasons of a 12-team league must finish within this many seconds
+MAX_SIMULATION_SECONDS = 1.0
+
+
+def _round_robin(teams, weeks):
+    """Circle-method schedule of (weeks, teams / 2, 2) team positions"""
+    order = list(range(teams))
+    schedule = []
+    for _ in range(weeks):
+        schedule.append(
+            np.array([(order[i], order[-1 - i]) for i in range(teams // 2)])
+        )
+        order = [order[0], order[-1]] + order[1:-1]
+    return schedule
+
+
+def _season(teams=12, weeks=14, playoff_teams=6, wins=None):
+    return LeagueSeason(
+        team_ids=list(range(101, 101 + teams)),
+        wins=np.zeros(teams) if wins is None else np.array(wins, dtype=float),
+        points_for=np.zeros(teams),
+        schedule=_round_robin(teams, weeks),
+        score_mean=np.linspace(90, 130, teams),
+        score_std=np.full(teams, 20.0),
+        playoff_teams=playoff_teams,
+    )
+
+
+def test_seeded_simulation_is_reproducible_and_consistent():
+    season = _season()
+
+    odds = simulate_season(season, simulations=20_000, seed=42)
+
+    assert simulate_season(season, simulations=20_000, seed=42) == odds
+    assert simulate_season(season, simulations=20_000, seed=43) != odds
+    assert sum(team["playoff_odds"] for team in odds.values()) == pytest.approx(6)
+    assert sum(team["championship_odds"] for team in odds.values()) == pytest.approx(1)
+    assert sum(team["projected_wins"] for team in odds.values()) == pytest.approx(
+        12 * 14 / 2, abs=0.1
+    )
+    championship = [odds[team_id]["championship_odds"] for team_id in season.team_ids]
+    assert championship == sorted(championship)
+    assert odds[112]["playoff_odds"] > 0.9 > 0.1 > odds[101]["playoff_odds"]
+
+
+def test_final_between_two_teams_matches_the_normal_odds():
+    season = LeagueSeason(
+        team_ids=[1, 2],
+        wins=np.zeros(2),
+        points_for=np.zeros(2),
+        schedule=[],
+        score_mean=np.array([110.0, 100.0]),
+        score_std=np.array([15.0, 20.0]),
+        playoff_teams=2,
+    )
+
+    odds = simulate_season(season, simulations=100_000, seed=1)
+
+    expected = 0.5 * (1 + math.erf(10 / math.sqrt(15**2 + 20**2) / math.sqrt(2)))
+    assert odds[1]["championship_odds"] == pytest.approx(expected, abs=0.01)
+    assert odds[1]["playoff_odds"] == odds[2]["playoff_odds"] == 1
+
+
+def test_byes_and_clinched_spots():
+    # Three weeks left: 11 wins clinches, 0 wins with 3 to play can't catch 4
+    wins = [11, 10, 9, 8, 7, 6, 5, 4, 4, 4, 0, 0]
+    odds = simulate_season(_season(weeks=3, wins=wins), simulations=10_000, seed=3)
+
+    assert odds[101]["playoff_odds"] == 1
+    assert odds[111]["playoff_odds"] == odds[112]["playoff_odds"] == 0
+    assert odds[112]["championship_odds"] == 0
+    # Seeds 1 and 2 have byes in a six-team bracket, so they win it more
+    # often than the equally strong 3 seed would
+    bye_odds = simulate_season(
+        LeagueSeason(
+            team_ids=list(range(6)),
+            wins=np.array([10.0, 9, 8, 7, 6, 5]),
+            points_for=np.zeros(6),
+            schedule=[],
+            score_mean=np.full(6, 100.0),
+            score_std=np.full(6, 20.0),
+            playoff_teams=6,
+        ),
+        simulations=40_000,
+        seed=5,
+    )
+    assert bye_odds[0]["championship_odds"] == pytest.approx(0.25, abs=0.01)
+    assert bye_odds[2]["championship_odds"] == pytest.approx(0.125, abs=0.01)
+
+
+def _seed_league(db, teams=4):
+    db.add(
+        FantasyUser(
+            id=1, user_id=1, platform=FantasyPlatform.SLEEPER, platform_user_id="u1"
+        )
+    )
+    db.add(
+        FantasyLeague(
+            id=1,
+            fantasy_user_id=1,
+            platform=FantasyPlatform.SLEEPER,
+            platform_league_id="l1",
+            name="League",
+            season=2025,
+            scoring_type="ppr",
+            playoff_teams=2,
+            roster_positions=["QB", "WR", "WR", "BN"],
+        )
+    )
+    for team in range(1, teams + 1):
+        db.add(
+            FantasyTeam(
+                id=team,
+                league_id=1,
+                platform_team_id=str(team),
+                name=f"Team {team}",
+                wins=4,
+                losses=4,
+                points_for=800,
+            )
+        )
+    # Every team gets a QB and two WRs; team 1's first WR is the star
+    player_id = 0
+    for team in range(1, teams + 1):
+        for position, points in (("QB", 18), ("WR", 12), ("WR", 12)):
+            player_id += 1
+            points = 30 if player_id == 2 else points
+            db.add(
+                FantasyPlayer(
+                    id=player_id,
+                    platform=FantasyPlatform.SLEEPER,
+                    platform_player_id=str(player_id),
+                    name=f"Player {player_id}",
+                    position=FantasyPosition(position),
+                )
+            )
+            db.add(
+                FantasyRosterSpot(
+                    team_id=team,
+                    player_id=player_id,
+                    position=FantasyPosition(position),
+                )
+            )
+            for week in range(1, 7):
+                db.add(
+                    PlayerAnalytics(
+                        player_id=player_id,
+                        season=2025,
+                        week=week,
+                        ppr_points=points + (week % 3 - 1) * 4,
+                    )
+                )
+    for week in range(9, 15):
+        for team1, team2 in ((1, 2), (3, 4)) if week % 2 else ((1, 3), (2, 4)):
+            db.add(
+                FantasyMatchup(league_id=1, week=week, team1_id=team1, team2_id=team2)
+            )
+    db.add(
+        FantasyMatchup(league_id=1, week=8, team1_id=1, team2_id=2, is_complete=True)
+    )
+    db.commit()
+
+
+def test_trade_odds_from_the_league(db_session):
+    _seed_league(db_session)
+    simulator = SeasonSimulator(db_session, simulations=20_000, seed=11)
+
+    season = simulator.load_league_season(1)
+    result = simulator.trade_odds(1, 1, 4, team1_gives=[2], team2_gives=[11])
+
+    assert season.team_ids == [1, 2, 3, 4]
+    assert len(season.schedule) == 6
+    assert season.score_mean[0] > season.score_mean[1] == season.score_mean[3]
+    assert result["before"] == simulator.league_odds(1)
+    before, after = result["before"], result["after"]
+    assert after[1]["championship_odds"] < before[1]["championship_odds"]
+    assert after[4]["championship_odds"] > before[4]["championship_odds"]
+    assert after[4]["playoff_odds"] > before[4]["playoff_odds"]
+
+
+def test_trade_evaluation_uses_simulated_odds(db_session):
+    _seed_league(db_session)
+    trade = Trade(
+        league_id=1,
+        team1_id=1,
+        team2_id=4,
+        proposed_by_team_id=4,
+        team1_gives={"players": [2]},
+        team2_gives={"players": [11]},
+    )
+    db_session.add(trade)
+    db_session.commit()
+    analyzer = TradeAnalyzerService(db_session)
+
+    outlook = analyzer._simulate_trade_outlook(trade)
+    impact = analyzer._calculate_championship_impact(
+        1, trade.team1_gives, trade.team2_gives, {}, {"season_outlook": outlook}
+    )
+
+    assert impact["current_championship_odds"] == round(
+        outlook["before"][1]["championship_odds"], 3
+    )
+    assert impact["championship_probability_change"] < 0
+    assert impact["playoff_probability_change"] < 0
+    assert impact["simulations"] == 50_000
+
+
+@pytest.mark.slow
+def test_50k_season_simulation_speed():
+    season = _season(weeks=14)
+
+    started = time.perf_counter()
+    simulate_season(season, simulations=50_000, seed=7)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n50,000 seasons of a 12-team league in {elapsed:.3f}s")
+    assert elapsed < MAX_SIMULATION_SECONDS
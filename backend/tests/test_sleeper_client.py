@@ -0,0 +1,140 @@
+"""
+Tests for the shared Sleeper client against a local fake Sleeper server
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.sleeper_client import SleeperClient, endpoint_for
+from app.services.sleeper_fantasy_service import SleeperFantasyService
+
+LEAGUE = {
+    "league_id": "L1",
+    "name": "Fake League",
+    "season": "2025",
+    "status": "in_season",
+    "total_rosters": 2,
+    "roster_positions": ["QB", "WR", "BN"],
+    "settings": {"waiver_type": 2, "waiver_budget": 100},
+}
+ROSTERS = [
+    {"roster_id": 1, "owner_id": "u1", "players": ["p1"], "settings": {"wins": 3}},
+    {"roster_id": 2, "owner_id": "u2", "players": ["p2"], "settings": {"wins": 5}},
+]
+USERS = [
+    {"user_id": "u1", "display_name": "One"},
+    {"user_id": "u2", "display_name": "Two"},
+]
+
+
+@pytest.fixture(autouse=True)
+def sleeper_routes(fake_sleeper):
+    fake_sleeper.routes.update(
+        {
+            "/v1/league/L1": LEAGUE,
+            "/v1/league/L1/rosters": ROSTERS,
+            "/v1/league/L1/users": USERS,
+            "/v1/players/nfl/trending/add": [{"player_id": "p1", "count": 90}],
+            "/v1/slow": {"slow": True},
+            "/v1/flaky": {"flaky": True},
+        }
+    )
+    fake_sleeper.delays["/v1/slow"] = 0.2
+
+
+@pytest.fixture
+async def client(fake_sleeper):
+    client = SleeperClient(base_url=fake_sleeper.url, backoff=0)
+    yield client
+    await client.aclose()
+
+
+def test_endpoint_ttls():
+    assert endpoint_for("/league/123") == ("league", 6 * 3600)
+    assert endpoint_for("/league/123/matchups/4") == ("league_matchups", 120)
+    assert endpoint_for("/players/nfl/trending/add") == ("trending_players", 900)
+    assert endpoint_for("/players/nfl")[0] == "players"
+    assert endpoint_for("/state/nfl")[0] == "other"
+
+
+async def test_responses_are_cached_and_connections_reused(client, fake_sleeper):
+    for _ in range(3):
+        assert await client.get_json("/league/L1") == LEAGUE
+    await client.get_json("/league/L1/rosters")
+    await client.get_json("/league/L1/users")
+
+    assert fake_sleeper.hits["/v1/league/L1"] == 1
+    # Every request went over one kept-alive connection
+    assert len(fake_sleeper.ports) == 1
+    stats = client.stats()
+    assert (stats["hits"], stats["misses"], stats["requests"]) == (2, 3, 3)
+    assert stats["hit_rate"] == 0.4
+    assert stats["endpoints"]["league"] == {"hits": 2, "misses": 1, "requests": 1}
+
+
+async def test_expired_entries_are_revalidated_with_their_etag(client, fake_sleeper):
+    await client.get_json("/league/L1", ttl=0)
+    assert await client.get_json("/league/L1", ttl=0) == LEAGUE
+    assert fake_sleeper.not_modified == 1
+
+    fake_sleeper.version = 2
+    assert await client.get_json("/league/L1", ttl=0) == LEAGUE
+    assert fake_sleeper.not_modified == 1
+    assert client.stats()["revalidated"] == 1
+
+
+async def test_concurrent_requests_share_one_fetch(client, fake_sleeper):
+    results = await asyncio.gather(*(client.get_json("/slow") for _ in range(10)))
+
+    assert results == [{"slow": True}] * 10
+    assert fake_sleeper.hits["/v1/slow"] == 1
+    assert client.stats()["coalesced"] == 9
+
+
+async def test_retries_transient_failures_but_not_missing_resources(
+    client, fake_sleeper
+):
+    fake_sleeper.failures["/v1/flaky"] = 2
+    assert await client.get_json("/flaky") == {"flaky": True}
+    assert fake_sleeper.hits["/v1/flaky"] == 3
+    assert client.stats()["retries"] == 2
+
+    with pytest.raises(httpx.HTTPStatusError) as error:
+        await client.get_json("/league/gone")
+    assert error.value.response.status_code == 404
+    assert fake_sleeper.hits["/v1/league/gone"] == 1
+
+
+async def test_stale_response_served_when_sleeper_is_unreachable(fake_sleeper):
+    client = SleeperClient(base_url=fake_sleeper.url, max_retries=1, backoff=0)
+    await client.get_json("/league/L1")
+    client._cache.touch("/league/L1", 0)
+    fake_sleeper.shutdown()
+    fake_sleeper.server_close()
+    # Drop the kept-alive connection so the next request has to reconnect
+    await client.aclose()
+
+    assert await client.get_json("/league/L1") == LEAGUE
+    with pytest.raises(httpx.TransportError):
+        await client.get_json("/league/L1/users")
+    stats = client.stats()
+    assert stats["stale"] == 1 and stats["errors"] == 2
+    await client.aclose()
+
+
+async def test_service_calls_share_the_cache(client, fake_sleeper):
+    service = SleeperFantasyService(client=client)
+
+    details = await service.get_league_details("L1")
+    standings = await service.get_league_standings("L1")
+    roster = await service.get_roster_by_owner("L1", "u2")
+
+    assert [team["name"] for team in details["teams"]] == ["One's Team", "Two's Team"]
+    assert details["waiver_settings"]["waiver_type"] == "FAAB"
+    assert [team["owner_id"] for team in standings] == ["u2", "u1"]
+    assert roster == ["p2"]
+    assert fake_sleeper.hits["/v1/league/L1"] == 1
+    assert fake_sleeper.hits["/v1/league/L1/rosters"] == 1
+    assert fake_sleeper.hits["/v1/league/L1/users"] == 1
@@ -0,0 +1,167 @@
+"""
+Tests for the concurrent Sleeper league and roster sync
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import sleeper_sync
+from app.core.database import get_db
+from app.models.database_models import SleeperLeague, SleeperRoster, User
+from app.services.simplified_sleeper_service import (
+    FIRST_SYNC_SEASON,
+    SimplifiedSleeperService,
+)
+from app.services.sleeper_client import SleeperClient
+
+SEASONS = range(FIRST_SYNC_SEASON, datetime.now().year + 1)
+
+
+def _league(league_id, status="complete"):
+    return {
+        "league_id": league_id,
+        "name": f"League {league_id}",
+        "total_rosters": 2,
+        "status": status,
+        "roster_positions": ["QB", "BN"],
+        "scoring_settings": {"rec": 1},
+        "settings": {"waiver_type": 2},
+    }
+
+
+def _roster(roster_id, players, wins=0, starters=None):
+    return {
+        "roster_id": roster_id,
+        "owner_id": f"o{roster_id}",
+        "players": players,
+        "starters": starters or players[:1],
+        "settings": {"wins": wins, "fpts": 100},
+    }
+
+
+@pytest.fixture
+def sleeper_routes(fake_sleeper):
+    fake_sleeper.routes.update(
+        {
+            "/v1/user/tester": {"user_id": "su1", "username": "tester"},
+            "/v1/user/su1/leagues/nfl/2023": [_league("L23")],
+            "/v1/user/su1/leagues/nfl/2024": [_league("L24", "in_season")],
+            "/v1/league/L23/rosters": [_roster(1, ["p1", "p2"]), _roster(2, ["p3"])],
+            "/v1/league/L24/rosters": [_roster(1, ["p1", "p4"]), _roster(2, ["p5"])],
+            "/v1/players/nfl": {
+                "p1": {"first_name": "Pat", "last_name": "One", "position": "QB"},
+                "p2": {"first_name": "Sam", "last_name": "Two", "position": "WR"},
+            },
+        }
+    )
+    # Every season's league lookup is slow; other seasons have no leagues
+    for season in SEASONS:
+        fake_sleeper.delays[f"/v1/user/su1/leagues/nfl/{season}"] = 0.2
+    return fake_sleeper.routes
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(
+        id=1,
+        email="tester@example.com",
+        username="tester",
+        password_hash="x",
+        sleeper_user_id="su1",
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+async def test_sync_fetches_concurrently_and_writes_only_changes(
+    db_session, user, fake_sleeper, sleeper_routes, query_budget
+):
+    client = SleeperClient(base_url=fake_sleeper.url, backoff=0)
+    service = SimplifiedSleeperService(client=client)
+
+    started = time.perf_counter()
+    leagues = await service.sync_all_league_history(1, db_session)
+    elapsed = time.perf_counter() - started
+    with query_budget(6, max_repeats=1):
+        rosters = await service.sync_all_rosters(1, db_session)
+
+    # One season's delay, not one per season
+    assert elapsed < 0.2 * len(SEASONS) / 2
+    assert leagues["total_synced"] == 2
+    assert rosters["total_rosters_synced"] == 4
+    assert rosters["players_added"] == 6
+
+    # Week to week: a trade on one roster, a bench reshuffle on another and
+    # a league that finished
+    sleeper_routes["/v1/user/su1/leagues/nfl/2024"] = [_league("L24")]
+    sleeper_routes["/v1/league/L24/rosters"] = [
+        _roster(1, ["p4", "p1"], starters=["p1"]),
+        _roster(2, ["p5", "p9"], wins=1),
+    ]
+    sleeper_routes["/v1/league/L23/rosters"] = None
+    client.invalidate()
+    untouched = (
+        db_session.query(SleeperRoster).filter(SleeperRoster.league_id == 1).all()
+    )
+    synced_at = [roster.last_synced for roster in untouched]
+
+    leagues = await service.sync_all_league_history(1, db_session)
+    rosters = await service.sync_all_rosters(1, db_session)
+
+    assert (leagues["total_synced"], leagues["updated_leagues"]) == (0, 1)
+    assert db_session.query(SleeperLeague).filter_by(season=2024).one().status == (
+        "complete"
+    )
+    assert rosters["total_rosters_synced"] == 0
+    assert (rosters["rosters_updated"], rosters["rosters_unchanged"]) == (1, 1)
+    assert (rosters["players_added"], rosters["players_dropped"]) == (1, 0)
+    # An empty response for a league leaves its stored rosters alone
+    assert [roster.last_synced for roster in untouched] == synced_at
+    assert db_session.query(SleeperRoster).count() == 4
+    await client.aclose()
+
+
+def test_full_sync_runs_as_a_background_job(
+    db_session, user, fake_sleeper, sleeper_routes, monkeypatch
+):
+    service = SimplifiedSleeperService(
+        client=SleeperClient(base_url=fake_sleeper.url, backoff=0)
+    )
+    monkeypatch.setattr(sleeper_sync, "sleeper_service", service)
+    api = FastAPI()
+    api.include_router(sleeper_sync.router)
+    api.dependency_overrides[sleeper_sync.get_current_user] = lambda: user
+    api.dependency_overrides[get_db] = lambda: db_session
+
+    with TestClient(api) as client:
+        started = client.post("/sleeper/sync/full", json={"sleeper_username": "tester"})
+        again = client.post("/sleeper/sync/full", json={"sleeper_username": "tester"})
+        assert started.status_code == 202
+        job_id = started.json()["data"]["job_id"]
+        # A second request joins the running job
+        assert again.json()["data"]["job_id"] == job_id
+
+        deadline = time.monotonic() + 10
+        while True:
+            status = client.get("/sleeper/status").json()
+            if status["sync_job"]["status"] not in ("pending", "running"):
+                break
+            assert time.monotonic() < deadline, status
+            time.sleep(0.05)
+
+        missing = client.post("/sleeper/sync/full", json={"sleeper_username": "nobody"})
+
+    job = status["sync_job"]
+    assert job["status"] == "complete", job["error"]
+    assert job["job_id"] == job_id
+    assert job["result"]["rosters_result"]["total_rosters_synced"] == 4
+    assert job["result"]["players_result"]["new_players"] == 2
+    assert (status["leagues_synced"], status["rosters_synced"]) == (2, 4)
+    assert status["total_players_in_system"] == 2
+    assert status["last_sync"] == job["finished_at"]
+    assert missing.status_code == 400
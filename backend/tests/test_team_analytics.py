@@ -0,0 +1,152 @@
+"""
+Tests for roster-frame team analytics and their cache
+"""
+
+import statistics
+
+import pytest
+
+from app.models.fantasy_models import (
+    FantasyPlatform,
+    FantasyPlayer,
+    FantasyPosition,
+    FantasyRosterSpot,
+    PlayerAnalytics,
+)
+from app.services.player_analytics_service import PlayerAnalyticsService
+from app.services.team_analytics import load_league_benchmarks, team_analytics_cache
+from app.services.trade_analyzer_service import TradeAnalyzerService
+
+# Player id -> (position, ppr points by week 1..12, season)
+PLAYERS = {
+    1: ("QB", [20.0] * 12, 2025),
+    2: ("RB", [10.0, 14.0] * 6, 2025),
+    3: ("WR", [8.0, 16.0, 0.0] * 4, 2025),
+    4: ("TE", [6.0] * 12, 2024),  # Only last season's games
+    5: ("WR", [30.0] * 12, 2025),  # Not rostered: league benchmark only
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    team_analytics_cache.invalidate_analytics()
+    yield
+    team_analytics_cache.invalidate_analytics()
+
+
+def _seed(db):
+    for player_id, (position, points, season) in PLAYERS.items():
+        db.add(
+            FantasyPlayer(
+                id=player_id,
+                platform=FantasyPlatform.SLEEPER,
+                platform_player_id=str(player_id),
+                name=f"Player {player_id}",
+                position=FantasyPosition(position),
+            )
+        )
+        for week, ppr in enumerate(points, start=1):
+            db.add(
+                PlayerAnalytics(
+                    player_id=player_id,
+                    season=season,
+                    week=week,
+                    ppr_points=ppr,
+                    snap_percentage=80.0,
+                    target_share=0.2 if position != "QB" else None,
+                )
+            )
+        # Games past the analysis window are ignored
+        db.add(
+            PlayerAnalytics(
+                player_id=player_id, season=season, week=13, ppr_points=99.0
+            )
+        )
+        if player_id != 5:
+            db.add(
+                FantasyRosterSpot(
+                    team_id=1, player_id=player_id, position=FantasyPosition(position)
+                )
+            )
+    db.commit()
+
+
+async def test_report_is_built_from_one_analytics_query(db_session, query_budget):
+    _seed(db_session)
+    analyzer = TradeAnalyzerService(db_session)
+
+    # Roster, players, their games and the league benchmarks
+    with query_budget(4, max_repeats=1):
+        report = await analyzer.get_comprehensive_team_analytics(1, season=2025)
+
+    positions = report["position_analytics"]
+    assert positions["QB"]["avg_efficiency"] == 20.0
+    assert positions["QB"]["consistency_score"] == 100.0
+    assert positions["WR"]["avg_efficiency"] == 12.0
+    assert positions["WR"]["consistency_score"] == round(
+        100 - statistics.stdev([8.0, 16.0] * 4) * 5, 1
+    )
+    # The TE has no 2025 games and falls back to 2024's
+    assert positions["TE"]["avg_efficiency"] == 6.0
+    assert positions["K"]["player_count"] == 0
+
+    usage = report["usage_distribution"]["player_usage"]
+    assert [p["player_name"] for p in usage] == [
+        "Player 1",
+        "Player 2",
+        "Player 3",
+        "Player 4",
+    ]
+    assert usage[1]["avg_target_share"] == pytest.approx(20.0)
+
+    efficiency = report["efficiency_benchmarks"]["efficiency_by_position"]
+    assert efficiency["QB"]["team_average"] == 25.0
+    # League WRs average (15 + 37.5) / 2 points per full game of snaps
+    assert efficiency["WR"]["league_average"] == 26.25
+    assert efficiency["WR"]["vs_league"] == round((15 - 26.25) / 26.25 * 100, 1)
+    assert report["overall_team_grade"] in ("A", "B", "C", "D", "F")
+
+
+def test_league_benchmarks_fall_back_to_last_season(db_session):
+    _seed(db_session)
+
+    assert load_league_benchmarks(db_session, 2025) == {
+        "QB": 25.0,
+        "RB": 15.0,
+        "WR": 26.25,
+        "TE": 7.5,
+    }
+    assert load_league_benchmarks(db_session, 2025, through_week=1)["WR"] == 23.75
+
+
+async def test_report_is_cached_until_the_roster_or_analytics_change(
+    db_session, query_budget
+):
+    _seed(db_session)
+    analyzer = TradeAnalyzerService(db_session)
+    report = await analyzer.get_comprehensive_team_analytics(1, season=2025)
+
+    with query_budget(1):
+        cached = await analyzer.get_comprehensive_team_analytics(1, season=2025)
+    assert cached == report
+    cached["team_name"] = "Mutated by a caller"
+    assert "team_name" not in await analyzer.get_comprehensive_team_analytics(
+        1, season=2025
+    )
+
+    # A roster change is seen on the next lookup
+    db_session.add(
+        FantasyRosterSpot(team_id=1, player_id=5, position=FantasyPosition.WR)
+    )
+    db_session.commit()
+    with query_budget(3):
+        added = await analyzer.get_comprehensive_team_analytics(1, season=2025)
+    assert report["position_analytics"]["WR"]["player_count"] == 1
+    assert added["position_analytics"]["WR"]["player_count"] == 2
+
+    # Ingesting a game retires cached reports and benchmarks
+    await PlayerAnalyticsService(db_session).store_weekly_analytics(
+        1, 12, 2025, {"ppr_points": 32.0}
+    )
+    refreshed = await analyzer.get_comprehensive_team_analytics(1, season=2025)
+    assert refreshed["position_analytics"]["QB"]["avg_efficiency"] == 21.0
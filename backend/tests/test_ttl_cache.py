@@ -0,0 +1,37 @@
+from app.core.ttl_cache import TTLCache
+
+
+def test_full_cache_drops_its_oldest_tenth():
+    cache = TTLCache(ttl=60, max_size=20)
+    for key in range(20):
+        cache.set(key, str(key))
+
+    cache.set(5, "replaced")
+    assert len(cache) == 20
+
+    cache.set(20, "20")
+    assert len(cache) == 19
+    assert 0 not in cache and 1 not in cache
+    assert cache.get(5) == "replaced" and cache.get(20) == "20"
+
+
+def test_expired_entries_are_kept_for_revalidation():
+    cache = TTLCache(ttl=60, max_size=10)
+    cache.set("league", {"id": 1}, ttl=0)
+
+    assert cache.get("league") is None
+    assert cache.get_stale("league") == {"id": 1}
+    assert cache.touch("league")
+    assert cache.get("league") == {"id": 1}
+    assert not cache.touch("missing")
+
+
+def test_discard_where_selects_by_key_and_value():
+    cache = TTLCache(ttl=60, max_size=10)
+    cache.set((1, 1), "a")
+    cache.set((1, 2), "b")
+    cache.set((2, 1), "a")
+
+    assert cache.discard_where(lambda key, _: key[0] == 1) == 2
+    assert cache.discard_where(lambda _, value: value == "a") == 1
+    assert len(cache) == 0
@@ -0,0 +1,224 @@
+"""
+Tests for event-driven settlement in UnifiedBetVerificationService
+"""
+
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.simple_unified_bet_model import (
+    BetStatus,
+    BetType,
+    OverUnder,
+    SimpleUnifiedBet,
+    TeamSide,
+)
+from app.services.unified_bet_verification_service import (
+    UnifiedBetVerificationService,
+)
+
+HOME = "Boston Celtics"
+AWAY = "Miami Heat"
+
+
+class FakeScoresService:
+    """Serves canned /scores responses and records which sports were fetched"""
+
+    def __init__(self):
+        self.games = {}
+        self.calls = []
+
+    def finish(self, sport, event_id, home_score, away_score, home=HOME, away=AWAY):
+        self.games.setdefault(sport, []).append(
+            {
+                "id": event_id,
+                "completed": True,
+                "last_update": "2026-10-18T02:30:00Z",
+                "scores": [
+                    {"name": home, "score": str(home_score)},
+                    {"name": away, "score": str(away_score)},
+                ],
+            }
+        )
+
+    async def get_scores_optimized(self, sport, include_completed=False):
+        self.calls.append(sport)
+        return self.games.get(sport, [])
+
+
+def _bet_row(event_id, sport="nba", started=True, **overrides):
+    row = {
+        "id": str(uuid.uuid4()),
+        "user_id": 1,
+        "odds_api_event_id": event_id,
+        "bet_type": BetType.MONEYLINE,
+        "amount": 10.0,
+        "odds": -110.0,
+        "potential_win": 9.09,
+        "status": BetStatus.PENDING,
+        "selection": HOME,
+        "team_selection": TeamSide.HOME,
+        "selected_team_name": HOME,
+        "home_team": HOME,
+        "away_team": AWAY,
+        "sport": sport,
+        "commence_time": datetime.utcnow() + timedelta(hours=-3 if started else 3),
+    }
+    row.update(overrides)
+    return row
+
+
+def _insert(db, rows):
+    # executemany needs the same keys in every row
+    by_shape = {}
+    for row in rows:
+        by_shape.setdefault(tuple(sorted(row)), []).append(row)
+    for shaped in by_shape.values():
+        db.execute(SimpleUnifiedBet.__table__.insert(), shaped)
+    db.commit()
+
+
+@pytest.fixture
+def service(sqlite_engine):
+    service = UnifiedBetVerificationService(
+        session_factory=sessionmaker(bind=sqlite_engine)
+    )
+    service.odds_service = FakeScoresService()
+    return service
+
+
+async def test_settles_only_bets_on_newly_completed_games(service, db_session):
+    rows = [
+        _bet_row("final-1"),
+        _bet_row(
+            "final-1",
+            bet_type=BetType.SPREAD,
+            spread_value=-3.0,
+            spread_selection=TeamSide.HOME,
+        ),
+        _bet_row(
+            "final-1",
+            bet_type=BetType.TOTAL,
+            total_points=210.5,
+            over_under_selection=OverUnder.OVER,
+        ),
+        _bet_row("in-progress"),
+    ]
+    _insert(db_session, rows)
+    service.odds_service.finish("basketball_nba", "final-1", 105, 102)
+
+    result = await service.verify_all_pending_bets()
+
+    assert result["success"] and result["settled"] == 3
+    db_session.expire_all()
+    bets = {bet.id: bet for bet in db_session.query(SimpleUnifiedBet)}
+    moneyline, spread, total, pending = (bets[row["id"]] for row in rows)
+    assert moneyline.status == BetStatus.WON
+    assert moneyline.result_amount == pytest.approx(19.09)
+    assert spread.status == BetStatus.PUSHED
+    assert total.status == BetStatus.LOST
+    assert moneyline.final_total_score == 207
+    assert moneyline.settled_at is not None
+    assert pending.status == BetStatus.PENDING
+
+
+async def test_frontier_skips_games_already_settled(service, db_session):
+    _insert(db_session, [_bet_row("final-1"), _bet_row("later")])
+    service.odds_service.finish("basketball_nba", "final-1", 99, 100)
+
+    await service.verify_all_pending_bets()
+    again = await service.verify_all_pending_bets()
+
+    assert again["completed_games"] == 0
+    assert again["verified"] == 0
+    assert "final-1" in service.completed_frontier
+
+
+async def test_unstarted_games_do_not_fetch_scores(service, db_session):
+    _insert(db_session, [_bet_row("tonight", started=False)])
+
+    result = await service.verify_all_pending_bets()
+
+    assert result["verified"] == 0
+    assert service.odds_service.calls == []
+
+
+async def test_unmatched_teams_are_retried(service, db_session):
+    _insert(db_session, [_bet_row("renamed")])
+    service.odds_service.finish(
+        "basketball_nba", "renamed", 99, 100, home="Celtics", away="Heat"
+    )
+
+    result = await service.verify_all_pending_bets()
+
+    assert result["settled"] == 0
+    assert "renamed" not in service.completed_frontier
+
+
+async def test_parlay_settles_in_the_same_run_as_its_legs(service, db_session):
+    parlay = _bet_row(
+        "parlay",
+        sport="Multiple Sports",
+        bet_type=BetType.PARLAY,
+        is_parlay=True,
+        amount=10.0,
+        potential_win=26.0,
+    )
+    legs = [
+        _bet_row("g1", parent_bet_id=parlay["id"]),
+        _bet_row("g2", parent_bet_id=parlay["id"]),
+    ]
+    _insert(db_session, [parlay, *legs])
+    service.odds_service.finish("basketball_nba", "g1", 110, 100)
+    service.odds_service.finish("basketball_nba", "g2", 101, 100)
+
+    result = await service.verify_all_pending_bets()
+
+    assert result["settled"] == 3
+    db_session.expire_all()
+    assert db_session.get(SimpleUnifiedBet, parlay["id"]).status == BetStatus.WON
+
+
+@pytest.mark.slow
+async def test_benchmark_100k_pending_bets_200_games_complete(service, db_session):
+    sports = ["nba", "nfl", "mlb", "nhl"]
+    api_sports = {
+        "nba": "basketball_nba",
+        "nfl": "americanfootball_nfl",
+        "mlb": "baseball_mlb",
+        "nhl": "icehockey_nhl",
+    }
+    events = [f"evt-{i}" for i in range(2000)]
+    rows = [
+        _bet_row(
+            events[i % len(events)],
+            sport=sports[i % len(events) % len(sports)],
+            team_selection=TeamSide.HOME if i % 2 else TeamSide.AWAY,
+        )
+        for i in range(100_000)
+    ]
+    for start in range(0, len(rows), 20_000):
+        _insert(db_session, rows[start : start + 20_000])
+    for i in range(200):
+        service.odds_service.finish(
+            api_sports[sports[i % len(sports)]], events[i], 100 + i % 7, 101
+        )
+
+    started = time.perf_counter()
+    result = await service.verify_all_pending_bets()
+    elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    idle = await service.verify_all_pending_bets()
+    idle_elapsed = time.perf_counter() - started
+
+    print(
+        f"\nSettled {result['settled']} of 100000 pending bets in "
+        f"{elapsed * 1000:.0f}ms; follow-up run {idle_elapsed * 1000:.0f}ms"
+    )
+    assert result["settled"] == 10_000
+    assert idle["verified"] == 0
+    assert elapsed < 10.0
@@ -0,0 +1,337 @@
+"""
+Tests for weekly waiver scores and league waiver lists
+"""
+
+import random
+import time
+
+import pytest
+
+from app.models.fantasy_models import (
+    FantasyLeague,
+    FantasyPlatform,
+    FantasyPlayer,
+    FantasyPosition,
+    FantasyRosterSpot,
+    FantasyTeam,
+    FantasyUser,
+    PlayerAnalytics,
+    WaiverScore,
+)
+from app.services.fantasy_analytics_service import FantasyAnalyticsService
+from app.services.fantasy_service import FantasyService
+from app.services.waiver_scores import compute_waiver_scores, waiver_score_store
+
+# Per-league waiver list time the store has to stay under, once scores are loaded
+MAX_WAIVER_LIST_SECONDS = 0.005
+
+# Player id -> (position, 2025 weeks 1-7 as (snap %, target share, red-zone
+# touches, ppr points))
+PLAYERS = {
+    1: ("WR", [(80, 0.25, 2, p) for p in (5, 8, 11, 14, 17, 20, 40)]),
+    2: ("WR", [(60, 0.1, 0, p) for p in (20, 18, 15, 10, 6, 3, 0)]),
+    3: ("RB", [(90, 0.05, 4, 12)] * 7),
+    4: ("TE", [(30, 0.2, 1, 9)] * 7),  # Too few snaps to be a candidate
+    5: ("RB", [(70, None, None, 0)] * 7),
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_store():
+    waiver_score_store.invalidate()
+    yield
+    waiver_score_store.invalidate()
+
+
+def _seed(db):
+    for player_id, (position, games) in PLAYERS.items():
+        db.add(
+            FantasyPlayer(
+                id=player_id,
+                platform=FantasyPlatform.SLEEPER,
+                platform_player_id=f"s{player_id}",
+                name=f"Player {player_id}",
+                position=FantasyPosition(position),
+                team="KC",
+            )
+        )
+        for week, (snaps, targets, red_zone, points) in enumerate(games, start=1):
+            db.add(
+                PlayerAnalytics(
+                    player_id=player_id,
+                    season=2025,
+                    week=week,
+                    snap_percentage=snaps,
+                    target_share=targets,
+                    red_zone_touches=red_zone,
+                    ppr_points=points,
+                )
+            )
+    # Late last season, player 1 played less, with no targets recorded (and
+    # red-zone touches stored as their default of 0)
+    for week in (16, 17):
+        db.add(
+            PlayerAnalytics(
+                player_id=1,
+                season=2024,
+                week=week,
+                snap_percentage=50,
+                target_share=None,
+                red_zone_touches=None,
+                ppr_points=10,
+            )
+        )
+
+    db.add(
+        FantasyUser(
+            id=1, user_id=5, platform=FantasyPlatform.SLEEPER, platform_user_id="u5"
+        )
+    )
+    # League 1 rosters player 1; league 2 players 1 and 3
+    for league_id, rostered in ((1, [1]), (2, [1, 3])):
+        db.add(
+            FantasyLeague(
+                id=league_id,
+                fantasy_user_id=1,
+                platform=FantasyPlatform.SLEEPER,
+                platform_league_id=f"l{league_id}",
+                name=f"League {league_id}",
+                season=2025,
+            )
+        )
+        db.add(
+            FantasyTeam(
+                id=league_id,
+                league_id=league_id,
+                platform_team_id=str(league_id),
+                name=f"Team {league_id}",
+            )
+        )
+        for player_id in rostered:
+            db.add(
+                FantasyRosterSpot(
+                    team_id=league_id,
+                    player_id=player_id,
+                    position=FantasyPosition(PLAYERS[player_id][0]),
+                )
+            )
+    db.commit()
+
+
+def test_every_player_is_scored_in_one_pass(db_session, query_budget):
+    _seed(db_session)
+
+    # Games, positions, league count and ownership
+    with query_budget(4, max_repeats=1):
+        rows = compute_waiver_scores(db_session, 2025, 6)
+    scores = {row["player_id"]: row for row in rows}
+
+    assert [row["player_id"] for row in rows] == [1, 3, 2, 5]
+    # Week 7 isn't in yet; the last 8 games reach into 2024
+    assert scores[1]["avg_snap_pct"] == (2 * 50 + 6 * 80) / 8
+    assert scores[1]["opportunity_score"] == 72.5 / 2 + 0.25 * 200 + 12 / 8 * 5
+    assert scores[1]["recent_ppg"] == 17
+    assert scores[2]["opportunity_score"] == 50
+    assert scores[5]["recent_ppg"] == 0
+    assert {pid: row["trend"] for pid, row in scores.items()} == {
+        1: "rising",
+        2: "falling",
+        3: "steady",
+        5: "steady",
+    }
+    assert {pid: row["position_rank"] for pid, row in scores.items()} == {
+        1: 1,
+        2: 2,
+        3: 1,
+        5: 2,
+    }
+    assert {pid: row["ownership_pct"] for pid, row in scores.items()} == {
+        1: 100.0,
+        2: 0.0,
+        3: 50.0,
+        5: 0.0,
+    }
+
+
+def test_waiver_lists_are_scores_minus_league_rosters(db_session, query_budget):
+    _seed(db_session)
+    # Before the batch has run, scores are computed on the fly
+    on_the_fly = waiver_score_store.waiver_list(db_session, 1, 2025)
+
+    assert waiver_score_store.rebuild(db_session, 2025, 6) == 4
+    db_session.commit()
+    assert db_session.query(WaiverScore).count() == 4
+    assert waiver_score_store.rebuild(db_session, 2025, 6) == 4
+
+    league1 = waiver_score_store.waiver_list(db_session, 1, 2025)
+    # Loaded scores are reused: each league costs its roster query
+    with query_budget(2):
+        league2 = waiver_score_store.waiver_list(db_session, 2, 2025)
+        receivers = waiver_score_store.waiver_list(db_session, 1, 2025, "WR")
+
+    assert [row["player_id"] for row in league1] == [3, 2, 5]
+    assert [row["player_id"] for row in league2] == [2, 5]
+    assert [row["player_id"] for row in receivers] == [2]
+    assert league1[0]["player_name"] == "Player 3"
+    assert league1[0]["platform_player_id"] == "s3"
+    assert [row["player_id"] for row in on_the_fly] == [3, 2, 5]
+    assert on_the_fly[0]["week"] == 7
+
+
+def test_waiver_wire_analytics_use_stored_scores(db_session):
+    _seed(db_session)
+    waiver_score_store.rebuild(db_session, 2025, 6)
+    db_session.commit()
+
+    analytics = FantasyAnalyticsService(db_session).get_waiver_wire_analytics(2)
+
+    assert [a["player_name"] for a in analytics] == ["Player 2", "Player 5"]
+    assert analytics[0] == {
+        "player_id": 2,
+        "player_name": "Player 2",
+        "position": "WR",
+        "team": "KC",
+        "ownership_pct": 0.0,
+        "opportunity_score": 50.0,
+        "recent_ppg": round((10 + 6 + 3) / 3, 2),
+        "avg_snap_pct": 60.0,
+        "trend": "falling",
+        "position_rank": 2,
+        "priority": "moderate",
+        "recommendation": analytics[0]["recommendation"],
+    }
+
+
+class FakePlatform:
+    """Sleeper as the recommendation methods call it"""
+
+    def __init__(self):
+        self.trending_calls = 0
+
+    async def get_trending_players(self, trend_type):
+        self.trending_calls += 1
+        return [{"player_id": "s2", "trend_count": 40}]
+
+    async def get_available_players(self, league_id):
+        return [{"player_id": "s2", "name": "Player 2", "position": "WR"}]
+
+    async def get_team_roster(self, team_id, week):
+        return [
+            {"player_id": "s1", "name": "Player 1", "position": "WR"},
+            {"player_id": "s3", "name": "Player 3", "position": "RB"},
+        ]
+
+
+async def test_recommendations_for_every_league(db_session):
+    _seed(db_session)
+    db_session.query(FantasyTeam).update({"is_user_team": True})
+    db_session.query(FantasyLeague).update({"scoring_type": "ppr"})
+    db_session.commit()
+    waiver_score_store.rebuild(db_session, 2025, 6)
+    db_session.commit()
+    platform = FakePlatform()
+    service = FantasyService(db_session)
+    service.register_platform(FantasyPlatform.SLEEPER, platform)
+
+    start_sit = await service.generate_start_sit_recommendations(5, 7)
+    waivers = await service.generate_waiver_wire_recommendations(5, 7)
+
+    assert {(r["league_id"], r["player_id"]) for r in start_sit} == {
+        (league_id, player_id) for league_id in (1, 2) for player_id in ("s1", "s3")
+    }
+    # Trending adds are fetched once for both Sleeper leagues
+    assert platform.trending_calls == 1
+    assert [r["league_id"] for r in waivers] == [1, 2]
+    assert waivers[0]["opportunity_score"] == 50.0
+    assert waivers[0]["trend"] == "falling"
+    without_scores = service._generate_enhanced_league_recommendations(
+        1,
+        "League 1",
+        [{"player_id": "s2", "trend_count": 40}],
+        [{"player_id": "s2", "name": "Player 2", "position": "WR"}],
+        {},
+        await service._get_league_rules_context(service.get_user_leagues(5)[0]),
+    )
+    # An opportunity score of 50 is worth two priority points
+    assert waivers[0]["priority_score"] == without_scores[0]["priority_score"] + 2
+
+
+@pytest.mark.slow
+def test_waiver_lists_for_many_leagues(db_session):
+    rng = random.Random(4)
+    positions = ["QB", "RB", "WR", "TE"]
+    for player_id in range(1, 2001):
+        db_session.add(
+            FantasyPlayer(
+                id=player_id,
+                platform=FantasyPlatform.SLEEPER,
+                platform_player_id=str(player_id),
+                name=f"Player {player_id}",
+                position=FantasyPosition(rng.choice(positions)),
+            )
+        )
+    db_session.bulk_insert_mappings(
+        PlayerAnalytics,
+        [
+            {
+                "player_id": player_id,
+                "season": 2025,
+                "week": week,
+                "snap_percentage": rng.uniform(20, 100),
+                "target_share": rng.uniform(0, 0.3),
+                "red_zone_touches": rng.randint(0, 4),
+                "ppr_points": rng.uniform(0, 30),
+            }
+            for player_id in range(1, 2001)
+            for week in range(1, 11)
+        ],
+    )
+    db_session.add(
+        FantasyUser(
+            id=1, user_id=5, platform=FantasyPlatform.SLEEPER, platform_user_id="u5"
+        )
+    )
+    for league_id in range(1, 101):
+        db_session.add(
+            FantasyLeague(
+                id=league_id,
+                fantasy_user_id=1,
+                platform=FantasyPlatform.SLEEPER,
+                platform_league_id=str(league_id),
+                name=f"League {league_id}",
+                season=2025,
+            )
+        )
+        db_session.add(
+            FantasyTeam(
+                id=league_id,
+                league_id=league_id,
+                platform_team_id=str(league_id),
+                name="Team",
+            )
+        )
+        db_session.bulk_insert_mappings(
+            FantasyRosterSpot,
+            [
+                {"team_id": league_id, "player_id": player_id, "position": "BENCH"}
+                for player_id in rng.sample(range(1, 2001), 180)
+            ],
+        )
+    db_session.commit()
+
+    started = time.perf_counter()
+    scored = waiver_score_store.rebuild(db_session, 2025, 10)
+    db_session.commit()
+    batch = time.perf_counter() - started
+    waiver_score_store.scores(db_session, 2025)
+
+    started = time.perf_counter()
+    for league_id in range(1, 101):
+        waiver_score_store.waiver_list(db_session, league_id, 2025)
+    per_league = (time.perf_counter() - started) / 100
+
+    print(
+        f"\n{scored} players scored in {batch:.2f}s; "
+        f"{per_league * 1000:.2f}ms per league waiver list"
+    )
+    assert per_league < MAX_WAIVER_LIST_SECONDS
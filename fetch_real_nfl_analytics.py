@@ -5,11 +5,21 @@ Fetch real NFL player analytics from ESPN API for 2025 season
 import asyncio
 import aiohttp
 import psycopg2
+from psycopg2.extras import execute_values
 from datetime import datetime
 import json
 import sys
+import os
 from typing import Dict, List, Optional
 
+
+# player_features is derived from player_analytics: rebuild a season after loading it
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", "scripts")
+)
+from player_feature_rebuild import rebuild_player_features  # noqa: E402
+
+
 # Database connection
 DB_CONFIG = {
     'host': 'localhost',
@@ -229,14 +239,9 @@ class RealNFLAnalyticsFetcher:
             conn = psycopg2.connect(**DB_CONFIG)
             cur = conn.cursor()
 
-            # Clear existing data for the season
-            print(f"Clearing existing {season} data...")
-            cur.execute("DELETE FROM player_analytics WHERE season = %s", (season,))
-            conn.commit()
-
             # Process player data
             players_processed = 0
-            records_inserted = 0
+            records = []
 
             # Use Sleeper stats if available (more comprehensive)
             if sleeper_data.get('stats'):
@@ -264,21 +269,8 @@ class RealNFLAnalyticsFetcher:
                                 # Calculate analytics from raw stats
                                 analytics = self.calculate_analytics_from_stats(week_stats, 1)
 
-                                # Insert analytics record
-                                insert_query = """
-                                    INSERT INTO player_analytics (
-                                        player_id, week, season,
-                                        snap_percentage, target_share, red_zone_share,
-                                        targets, receptions, carries,
-                                        receiving_yards, rushing_yards, ppr_points,
-                                        points_per_snap, points_per_target, points_per_touch,
-                                        created_at
-                                    ) VALUES (
-                                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                                    )
-                                """
-
-                                cur.execute(insert_query, (
+                                # Collect analytics record
+                                records.append((
                                     db_player_id, week, season,
                                     analytics['snap_percentage'], analytics['target_share'], analytics['red_zone_share'],
                                     analytics['targets'], analytics['receptions'], analytics['carries'],
@@ -287,26 +279,37 @@ class RealNFLAnalyticsFetcher:
                                     datetime.now()
                                 ))
 
-                                records_inserted += 1
-
                             except (ValueError, KeyError) as e:
                                 continue  # Skip invalid week data
 
                         players_processed += 1
 
                         if players_processed % 50 == 0:
-                            print(f"Processed {players_processed} players, inserted {records_inserted} records")
-                            conn.commit()
+                            print(f"Processed {players_processed} players, collected {len(records)} records")
 
                     except Exception as e:
                         print(f"Error processing player {player_id}: {e}")
                         continue
 
-            # Final commit
+            # Replace the season in one transaction, so readers never see it empty
+            print(f"Replacing existing {season} data...")
+            cur.execute("DELETE FROM player_analytics WHERE season = %s", (season,))
+            execute_values(cur, """
+                INSERT INTO player_analytics (
+                    player_id, week, season,
+                    snap_percentage, target_share, red_zone_share,
+                    targets, receptions, carries,
+                    receiving_yards, rushing_yards, ppr_points,
+                    points_per_snap, points_per_target, points_per_touch,
+                    created_at
+                ) VALUES %s
+            """, records, page_size=1000)
             conn.commit()
+            records_inserted = len(records)
 
             print(f"✅ Successfully processed {players_processed} players")
             print(f"✅ Inserted {records_inserted} analytics records for {season}")
+            rebuild_player_features(season)
 
             # Verify the data
             cur.execute("""
@@ -4,8 +4,18 @@ Populate player_analytics table with realistic 2025 season data (weeks 1-3)
 """
 import random
 import psycopg2
+from psycopg2.extras import execute_values
 from datetime import datetime, timedelta
 import sys
+import os
+
+
+# player_features is derived from player_analytics: rebuild a season after loading it
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", "scripts")
+)
+from player_feature_rebuild import rebuild_player_features  # noqa: E402
+
 
 # Database connection
 DB_CONFIG = {
@@ -211,12 +221,7 @@ def populate_2025_data():
 
         print(f"Found {len(players)} players to populate")
 
-        # Clear existing 2025 data
-        print("Clearing existing 2025 data...")
-        cur.execute("DELETE FROM player_analytics WHERE season = 2025")
-        conn.commit()
-
-        total_records = 0
+        records = []
 
         # Generate data for weeks 1-3 of 2025
         for week in [1, 2, 3]:
@@ -226,23 +231,7 @@ def populate_2025_data():
                 tier = determine_usage_tier(position, player_id)
                 stats = generate_realistic_stats(position, player_id, week, tier)
 
-                # Insert the record
-                insert_query = """
-                    INSERT INTO player_analytics (
-                        player_id, week, season, game_date, opponent,
-                        total_snaps, offensive_snaps, special_teams_snaps, snap_percentage,
-                        targets, target_share, carries, red_zone_share,
-                        red_zone_targets, red_zone_carries, red_zone_touches,
-                        receptions, receiving_yards, rushing_yards, air_yards,
-                        ppr_points, points_per_snap, points_per_target, points_per_touch,
-                        game_script, created_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """
-
-                cur.execute(insert_query, (
+                records.append((
                     player_id, week, 2025, stats['game_date'], stats['opponent'],
                     stats['total_snaps'], stats['offensive_snaps'], stats['special_teams_snaps'],
                     stats['snap_percentage'], stats['targets'], stats['target_share'],
@@ -253,15 +242,24 @@ def populate_2025_data():
                     stats['points_per_touch'], stats['game_script'], datetime.now()
                 ))
 
-                total_records += 1
-
-                if total_records % 100 == 0:
-                    print(f"  Inserted {total_records} records...")
-                    conn.commit()
-
-        # Final commit
+        # Replace the season in one transaction, so readers never see it empty
+        print("Replacing existing 2025 data...")
+        cur.execute("DELETE FROM player_analytics WHERE season = 2025")
+        execute_values(cur, """
+            INSERT INTO player_analytics (
+                player_id, week, season, game_date, opponent,
+                total_snaps, offensive_snaps, special_teams_snaps, snap_percentage,
+                targets, target_share, carries, red_zone_share,
+                red_zone_targets, red_zone_carries, red_zone_touches,
+                receptions, receiving_yards, rushing_yards, air_yards,
+                ppr_points, points_per_snap, points_per_target, points_per_touch,
+                game_script, created_at
+            ) VALUES %s
+        """, records, page_size=1000)
         conn.commit()
+        total_records = len(records)
         print(f"Successfully populated {total_records} records for 2025 season!")
+        rebuild_player_features(2025)
 
         # Verify the data
         cur.execute("""